@@ -0,0 +1,83 @@
+import argparse
+import ctypes
+import os
+import random
+import time
+
+os.environ.setdefault('FFXIV_GAME_VERSION', '7.0.0')  # message structs are chosen by version on import
+
+from ff_draw.sniffer.message_structs import zone_server
+from ff_draw.sniffer.utils.action_effect import ActionEffectArrays
+
+effect_types = 0, 1, 3, 3, 3, 4, 4, 5, 6, 14
+
+
+def make_packet(rnd: random.Random, message_type, fill: float):
+    # an ipc header and the message with a share of the targets used, each with a few effects
+    buf = bytearray(0x10 + ctypes.sizeof(message_type))
+    msg = message_type.from_buffer(buf, 0x10)
+    for i in range(int(len(msg.target_ids) * fill) or 1):
+        msg.target_ids[i] = rnd.choice((0x40000001, 0x10000002, 0x10000003))
+        for j in range(rnd.randrange(1, 8)):
+            e = msg.effects[i][j]
+            e.type = rnd.choice(effect_types[1:])
+            e.arg0, e.arg1, e.arg3, e.flag = (rnd.randrange(256) for _ in range(4))
+            e.value = rnd.randrange(1 << 16)
+    return buf, msg
+
+
+def legacy_decode(msg):
+    # the walk of the dps plugin over the ctypes fields
+    res = []
+    for target_id, effects in zip(msg.target_ids, msg.effects):
+        if target_id == 0 or target_id == 0xe0000000: break
+        for effect in effects:
+            if not effect.type: break
+            if effect.type == 3 or effect.type == 5 or effect.type == 6:
+                value = effect.value
+                if effect.flag & (1 << 6): value += effect.arg3 * 65536
+                res.append((target_id, value, True, bool(effect.arg0 & (1 << 5)), bool(effect.arg0 & (1 << 6)), effect.arg1 & 0xf == 8))
+            elif effect.type == 4:
+                value = effect.value
+                if effect.flag & (1 << 6): value += effect.arg3 * 65536
+                res.append((target_id, value, False, bool(effect.arg1 & (1 << 5)), False, False))
+    return res
+
+
+def arrays_read(a: ActionEffectArrays):
+    # what a subscriber like the dps plugin reads from the arrays cached on the message
+    counted = a.damage | a.heal
+    return list(zip(
+        a.targets[counted].tolist(), a.values[counted].tolist(), a.damage[counted].tolist(),
+        a.critical[counted].tolist(), a.direct_hit[counted].tolist(), a.limit_break[counted].tolist(),
+    ))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=5000)
+    parser.add_argument('--fill', type=float, default=.75, help='share of the target slots used')
+    parser.add_argument('--subscribers', type=int, nargs='+', default=[1, 3], help='handlers reading every packet')
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    for message_type in zone_server.ActionEffect, zone_server.ActionEffect8, zone_server.ActionEffect16, zone_server.ActionEffect24:
+        packets = [make_packet(rnd, message_type, args.fill) for _ in range(args.count)]
+        line = f'{message_type.__name__:14}'
+        for subscribers in args.subscribers:
+            start = time.perf_counter()
+            for _, msg in packets:
+                for _ in range(subscribers): legacy_decode(msg)
+            legacy_cost = time.perf_counter() - start
+            start = time.perf_counter()
+            for buf, _ in packets:
+                arrays = ActionEffectArrays(buf, message_type, 0x10)
+                for _ in range(subscribers): arrays_read(arrays)
+            cost = time.perf_counter() - start
+            line += f' | {subscribers} subscribers: ctypes walk {legacy_cost / args.count * 1e6:6.2f}us, arrays {cost / args.count * 1e6:6.2f}us'
+        same = all(arrays_read(ActionEffectArrays(buf, message_type, 0x10)) == legacy_decode(msg) for buf, msg in packets)
+        print(f'{line} per packet, {"ok" if same else "MISMATCH"}')
+
+
+if __name__ == '__main__':
+    main()
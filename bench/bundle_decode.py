@@ -0,0 +1,78 @@
+import argparse
+import random
+import time
+
+from ff_draw.sniffer.utils import bundle
+from ff_draw.sniffer.utils.structs import BundleHeader, ElementHeader, CompressType
+
+
+def make_bundle(rnd: random.Random, compress_type: CompressType, element_count: int):
+    elements = []
+    for _ in range(element_count):
+        payload = rnd.randbytes(rnd.randint(0x10, 0x200))
+        elements.append(bytearray(ElementHeader(size=bundle.el_header_size + len(payload), source_id=rnd.getrandbits(32), type=3)) + payload)
+    header = BundleHeader(timestamp_ms=int(time.time() * 1000), compress_type=compress_type.value)
+    header.magic = bundle.MAGIC_PREFIX
+    return bundle.pack_message(header, elements)
+
+
+def make_stream(bundle_count: int, compress_type: CompressType, seed=0):
+    rnd = random.Random(seed)
+    stream = bytearray()
+    for _ in range(bundle_count):
+        stream += make_bundle(rnd, compress_type, rnd.randint(1, 16))
+    return stream
+
+
+def chunked(stream: bytearray, chunk_size: int):
+    for i in range(0, len(stream), chunk_size):
+        yield bytes(stream[i:i + chunk_size])
+
+
+def run_legacy(chunks):
+    buffer = bytearray()
+    cnt = 0
+    for chunk in chunks:
+        buffer.extend(chunk)
+        for msg in bundle.decode(buffer):
+            cnt += 1
+    return cnt
+
+
+def run_decoder(chunks):
+    decoder = bundle.BundleDecoder()
+    cnt = 0
+    for chunk in chunks:
+        for msg in decoder.feed(chunk):
+            cnt += 1
+    return cnt
+
+
+def bench(name, func, chunks, bundle_count, repeat):
+    best = float('inf')
+    cnt = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        cnt = func(chunks)
+        best = min(best, time.perf_counter() - start)
+    print(f'{name:>8}: {cnt} messages, {best * 1000:.2f}ms, {bundle_count / best:,.0f} bundles/s')
+    return cnt
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--bundles', type=int, default=20000)
+    parser.add_argument('--chunk', type=int, default=0x10000, help='size of each fed chunk, bigger chunk means more bundles in buffer')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    for compress_type in (CompressType.none, CompressType.zip):
+        stream = make_stream(args.bundles, compress_type)
+        chunks = list(chunked(stream, args.chunk))
+        print(f'[{compress_type.name}] {args.bundles} bundles, {len(stream)} bytes, {len(chunks)} chunks')
+        legacy_cnt = bench('legacy', run_legacy, chunks, args.bundles, args.repeat)
+        decoder_cnt = bench('decoder', run_decoder, chunks, args.bundles, args.repeat)
+        assert legacy_cnt == decoder_cnt, (legacy_cnt, decoder_cnt)
+
+
+if __name__ == '__main__':
+    main()
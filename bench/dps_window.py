@@ -0,0 +1,323 @@
+import argparse
+import pathlib
+import random
+import sys
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / 'plugins'))  # plugins are imported by name like the plugin loader does
+
+import dps
+
+
+class LegacyData:
+    def __init__(self):
+        self.taken_damage = 0
+        self.cause_damage = 0
+        self.cause_damage_count = 0
+        self.cause_damage_critical = 0
+        self.cause_damage_direct = 0
+        self.taken_heal = 0
+        self.cause_heal = 0
+        self.cause_heal_count = 0
+        self.cause_heal_critical = 0
+
+
+class LegacyActor:
+    def __init__(self, actor_id):
+        self.actor_id = actor_id
+        self.data = LegacyData()
+        self.data_in_window = LegacyData()
+        self.death_count = 0
+
+
+class LegacyMonitor:
+    # the monitor of before, a list of event tuples and two Data objects per actor
+    window_sec = 60
+    damage_event = 1
+    heal_event = 2
+    actors: dict[int, LegacyActor]
+
+    def __init__(self, territory_id=0):
+        self.territory_id = territory_id
+        self.actors = {}
+        self.events = []
+        self.start_at = 0
+        self.pet_cache = {}
+
+    @property
+    def last_event_at(self):
+        if not self.events: return 0
+        return self.events[-1][0]
+
+    def get_actor(self, actor_id):
+        if not dps.is_valid_id(actor_id): return None
+        if actor_id not in self.actors:
+            self.actors[actor_id] = LegacyActor(actor_id)
+        return self.actors[actor_id]
+
+    def on_damage(self, time_stamp, source, target, value, is_status=False, is_critical=False, is_direct=False, owner_id=0):
+        if dps.is_valid_id(source):
+            if dps.is_valid_id(owner_id):
+                self.pet_cache.setdefault(owner_id, set()).add(source)
+            source_actor = self.get_actor(source)
+            source_actor.data.cause_damage += value
+            source_actor.data_in_window.cause_damage += value
+            if not is_status:
+                source_actor.data.cause_damage_count += 1
+                source_actor.data_in_window.cause_damage_count += 1
+                if is_critical:
+                    source_actor.data.cause_damage_critical += 1
+                    source_actor.data_in_window.cause_damage_critical += 1
+                if is_direct:
+                    source_actor.data.cause_damage_direct += 1
+                    source_actor.data_in_window.cause_damage_direct += 1
+        if dps.is_valid_id(target):
+            target_actor = self.get_actor(target)
+            target_actor.data.taken_damage += value
+            target_actor.data_in_window.taken_damage += value
+        self.events.append((time_stamp, self.damage_event, (source, target, value, is_status, is_critical, is_direct)))
+        if not self.start_at: self.start_at = time_stamp
+        self.dequeue_events(time_stamp - self.window_sec)
+
+    def on_heal(self, time_stamp, source, target, value, is_status=False, is_critical=False, owner_id=0):
+        if dps.is_valid_id(source):
+            if dps.is_valid_id(owner_id):
+                self.pet_cache.setdefault(owner_id, set()).add(source)
+            source_actor = self.get_actor(source)
+            source_actor.data.cause_heal += value
+            source_actor.data_in_window.cause_heal += value
+            if not is_status:
+                source_actor.data.cause_heal_count += 1
+                source_actor.data_in_window.cause_heal_count += 1
+                if is_critical:
+                    source_actor.data.cause_heal_critical += 1
+                    source_actor.data_in_window.cause_heal_critical += 1
+        if dps.is_valid_id(target):
+            target_actor = self.get_actor(target)
+            target_actor.data.taken_heal += value
+            target_actor.data_in_window.taken_heal += value
+        self.events.append((time_stamp, self.heal_event, (source, target, value, is_status, is_critical)))
+        if not self.start_at: self.start_at = time_stamp
+        self.dequeue_events(time_stamp - self.window_sec)
+
+    def on_death(self, actor_id):
+        if dps.is_valid_id(actor_id):
+            self.get_actor(actor_id).death_count += 1
+
+    def dequeue_events(self, before):
+        while self.events:
+            if self.events[0][0] >= before: break
+            _, event_type, event_args = self.events.pop(0)
+            if event_type == self.damage_event:
+                self.dequeue_on_damage(*event_args)
+            elif event_type == self.heal_event:
+                self.dequeue_on_heal(*event_args)
+
+    def dequeue_on_damage(self, source, target, value, is_status, is_critical, is_direct):
+        if source and source in self.actors:
+            source_actor = self.actors[source]
+            source_actor.data_in_window.cause_damage -= value
+            if not is_status:
+                source_actor.data_in_window.cause_damage_count -= 1
+                if is_critical:
+                    source_actor.data_in_window.cause_damage_critical -= 1
+                if is_direct:
+                    source_actor.data_in_window.cause_damage_direct -= 1
+        if target and target in self.actors:
+            target_actor = self.actors[target]
+            target_actor.data_in_window.taken_damage -= value
+
+    def dequeue_on_heal(self, source, target, value, is_status, is_critical):
+        if source and source in self.actors:
+            source_actor = self.actors[source]
+            source_actor.data_in_window.cause_heal -= value
+            if not is_status:
+                source_actor.data_in_window.cause_heal_count -= 1
+                if is_critical:
+                    source_actor.data_in_window.cause_heal_critical -= 1
+        if target and target in self.actors:
+            target_actor = self.actors[target]
+            target_actor.data_in_window.taken_heal -= value
+
+    def actor_dps(self, actor_id, in_window, calc_pet=False):
+        if not (dur := self.last_event_at - self.start_at):
+            dur = 1
+        if in_window:
+            get_data = lambda actor: actor.data_in_window
+            dur = min(self.window_sec, dur)
+        else:
+            get_data = lambda actor: actor.data
+        total_damage = get_data(self.actors[actor_id]).cause_damage if actor_id in self.actors else 0
+        if calc_pet:
+            total_damage = sum((
+                get_data(self.actors[pet_id]).cause_damage
+                for pet_id in self.pet_cache.get(actor_id, ())
+                if pet_id in self.actors
+            ), total_damage)
+        return total_damage / dur
+
+    def actor_hps(self, actor_id, in_window, calc_pet=False):
+        if not (dur := self.last_event_at - self.start_at):
+            dur = 1
+        if in_window:
+            get_data = lambda actor: actor.data_in_window
+            dur = min(self.window_sec, dur)
+        else:
+            get_data = lambda actor: actor.data
+        total_heal = get_data(self.actors[actor_id]).cause_heal if actor_id in self.actors else 0
+        if calc_pet:
+            total_heal = sum((
+                get_data(self.actors[pet_id]).cause_heal
+                for pet_id in self.pet_cache.get(actor_id, ())
+                if pet_id in self.actors
+            ), total_heal)
+        return total_heal / dur
+
+    def actor_dtps(self, actor_id, in_window):
+        if actor_id not in self.actors: return 0
+        if not (dur := self.last_event_at - self.start_at): dur = 1
+        if in_window:
+            data = self.actors[actor_id].data_in_window
+            dur = min(self.window_sec, dur)
+        else:
+            data = self.actors[actor_id].data
+        return data.taken_damage / dur
+
+    def actor_htps(self, actor_id, in_window):
+        if actor_id not in self.actors: return 0
+        if not (dur := self.last_event_at - self.start_at): dur = 1
+        if in_window:
+            data = self.actors[actor_id].data_in_window
+            dur = min(self.window_sec, dur)
+        else:
+            data = self.actors[actor_id].data
+        return data.taken_heal / dur
+
+    def actor_critical_rate(self, actor_id, in_window, include_heal=False, calc_pet=False):
+        get_data = (lambda actor: actor.data_in_window) if in_window else (lambda actor: actor.data)
+        total = 0
+        c_total = 0
+        if actor_id in self.actors:
+            data = get_data(self.actors[actor_id])
+            total = data.cause_damage_count
+            if include_heal: total += data.cause_heal_count
+            c_total = data.cause_damage_critical
+            if include_heal: c_total += data.cause_heal_critical
+        if calc_pet:
+            for pet_id in self.pet_cache.get(actor_id, ()):
+                if pet_id not in self.actors: continue
+                data = get_data(self.actors[pet_id])
+                total += data.cause_damage_count
+                if include_heal: total += data.cause_heal_count
+                c_total += data.cause_damage_critical
+                if include_heal: c_total += data.cause_heal_critical
+        return c_total / total if total else 0
+
+    def actor_direct_rate(self, actor_id, in_window, calc_pet=False):
+        get_data = (lambda actor: actor.data_in_window) if in_window else (lambda actor: actor.data)
+        total = 0
+        d_total = 0
+        if actor_id in self.actors:
+            data = get_data(self.actors[actor_id])
+            total = data.cause_damage_count
+            d_total = data.cause_damage_direct
+        if calc_pet:
+            for pet_id in self.pet_cache.get(actor_id, ()):
+                if pet_id not in self.actors: continue
+                data = get_data(self.actors[pet_id])
+                total += data.cause_damage_count
+                d_total += data.cause_damage_direct
+        return d_total / total if total else 0
+
+    def death_count(self, actor_id):
+        if actor_id not in self.actors: return 0
+        return self.actors[actor_id].death_count
+
+
+def read_row(monitor, actor_id, in_window, calc_pet=False):
+    return [
+        monitor.actor_dps(actor_id, in_window, calc_pet),
+        monitor.actor_hps(actor_id, in_window, calc_pet),
+        monitor.actor_dtps(actor_id, in_window),
+        monitor.actor_htps(actor_id, in_window),
+        monitor.actor_critical_rate(actor_id, in_window, calc_pet=calc_pet),
+        monitor.actor_direct_rate(actor_id, in_window, calc_pet),
+        monitor.actor_critical_rate(actor_id, in_window, True, calc_pet),
+        monitor.death_count(actor_id),
+    ]
+
+
+def make_events(rnd: random.Random, count: int, players: int):
+    # a fight of players with a pet each against a few enemies, about 100 events per second
+    player_ids = [0x10000001 + i for i in range(players)]
+    pets = {0x40001000 + i: p for i, p in enumerate(player_ids)}
+    enemies = [0x40000010 + i for i in range(4)]
+    res = []
+    ts = 1700000000.
+    for _ in range(count):
+        ts += rnd.expovariate(100)
+        match rnd.random():
+            case r if r < .8:
+                source, owner = rnd.choice(list(pets.items())) if r < .15 else (rnd.choice(player_ids), 0)
+                res.append(('on_damage', (ts, source, rnd.choice(enemies), rnd.randrange(100000), rnd.random() < .3, rnd.random() < .25, rnd.random() < .2, owner)))
+            case r if r < .999:
+                res.append(('on_heal', (ts, rnd.choice(player_ids), rnd.choice(player_ids), rnd.randrange(30000), rnd.random() < .3, rnd.random() < .2, 0)))
+            case _:
+                res.append(('on_death', (rnd.choice(player_ids),)))
+    return player_ids + enemies, res
+
+
+def run(monitor, actor_ids: list[int], events: list, frame: int):
+    # the table is read for the whole fight and in the window, not read at all without frame
+    def read_table():
+        for actor_id in actor_ids:
+            for in_window in (False, True):
+                read_row(monitor, actor_id, in_window, True)
+
+    start = time.perf_counter()
+    for i, (method, args) in enumerate(events):
+        getattr(monitor, method)(*args)
+        if frame and i % frame == 0: read_table()
+    read_table()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=200000)
+    parser.add_argument('--players', type=int, default=24)
+    parser.add_argument('--frame', type=int, default=10, help='events between two reads of the table, 10 is the fold interval at 100 events/s')
+    parser.add_argument('--window', type=int, default=60)
+    args = parser.parse_args()
+
+    actor_ids, events = make_events(random.Random(0), args.count, args.players)
+    print(f'{args.count} events of {args.players} players, window {args.window}s')
+
+    def new_ring():
+        monitor = dps.Monitor()
+        monitor.update_interval = 0  # events come faster than real time, so every read of a frame folds
+        return monitor
+
+    res = {}
+    for name, new in ('legacy monitor', LegacyMonitor), ('ring buffer', new_ring):
+        line = f'  {name:16}'
+        for frame in 0, args.frame:
+            monitor = new()
+            monitor.window_sec = args.window
+            cost = run(monitor, actor_ids, events, frame)
+            line += f' {"no reads" if not frame else f"read every {frame} events"}: {cost / args.count * 1e6:6.2f}us per event,'
+        print(line.rstrip(','))
+        res[name] = monitor
+
+    mismatch = 0
+    for actor_id in actor_ids:
+        for calc_pet in (False, True):
+            for in_window in (False, True):
+                old = read_row(res['legacy monitor'], actor_id, in_window, calc_pet)
+                new = read_row(res['ring buffer'], actor_id, in_window, calc_pet)
+                mismatch += any(abs(n - o) > 1e-9 * max(abs(o), 1) for n, o in zip(new, old))
+    print(f'  {len(res["ring buffer"].events)} event slots, {"ok" if not mismatch else f"MISMATCH {mismatch}"}')
+
+
+if __name__ == '__main__':
+    main()
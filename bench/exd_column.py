@@ -0,0 +1,151 @@
+import argparse
+import pathlib
+import random
+import struct
+import tempfile
+import time
+
+import numpy as np
+
+from fpt4.utils.sqpack.exd import ExdManager
+from fpt4.utils.sqpack.pack import PackManager
+from fpt4.utils.sqpack.utils import Language
+from .sqpack_data import make_exd, make_exh, pack_compressed_file, write_pack
+
+# type, offset, struct format of the bench sheet columns
+columns = [
+    (0x0, 0x0, '>i'),  # string
+    (0x1, 0x4, '>?'),
+    (0x2, 0x5, '>b'),
+    (0x3, 0x6, '>B'),
+    (0x4, 0x8, '>h'),
+    (0x5, 0xA, '>H'),
+    (0x6, 0xC, '>l'),
+    (0x7, 0x10, '>L'),
+    (0x9, 0x14, '>f'),
+    (0xB, 0x18, '>q'),
+    (0x19, 0x20, '>B'),
+    (0x1C, 0x20, '>B'),
+]
+DATA_LENGTH = 0x24
+BLOCK_SIZE = 500
+
+
+def make_sheet(rnd: random.Random, row_count: int, rsv_every: int = 0):
+    blocks = {}
+    for row_id in range(row_count):
+        fixed = bytearray(DATA_LENGTH)
+        string = b''
+        for t, o, fmt in columns[1:]:
+            if fmt == '>f':
+                v = rnd.uniform(-100, 100)
+            elif fmt == '>?':
+                v = rnd.random() < .5
+            else:
+                size = struct.calcsize(fmt) * 8
+                v = rnd.getrandbits(size) - (1 << size - 1 if fmt[1].islower() else 0)
+            struct.pack_into(fmt, fixed, o, v)
+        if rsv_every and row_id % rsv_every == 0:
+            string = b'_rsv_%d\0' % row_id
+            struct.pack_into('>i', fixed, 0, 0)
+        elif rnd.random() < .8:
+            string = b'name of row %d\0' % row_id
+            struct.pack_into('>i', fixed, 0, 0)
+        else:
+            struct.pack_into('>i', fixed, 0, -1)
+        blocks.setdefault(row_id // BLOCK_SIZE * BLOCK_SIZE, {})[row_id] = (bytes(fixed) + string, 1)
+    files = {
+        b'exd/root.exl': pack_compressed_file(b'EXLT,2\nBench,1\n'),
+        b'exd/bench.exh': pack_compressed_file(make_exh(
+            [(t, o) for t, o, _ in columns], DATA_LENGTH,
+            [(start, BLOCK_SIZE) for start in blocks], [Language.en.value], row_count=row_count
+        )),
+    }
+    for start, rows in blocks.items():
+        files[b'exd/bench_%d_en.exd' % start] = pack_compressed_file(make_exd(rows))
+    return files
+
+
+def make_nested_sheet(rnd: random.Random, row_count: int, subkey_count: int):
+    # rows of nested sub rows with fixed columns only, a sub row holding sub rows is sized from its sub key on
+    def sub_rows(depth):
+        count = rnd.randrange(1, 4)
+        body = b''
+        for sub_key in rnd.sample(range(100), count):
+            if depth + 2 == subkey_count:
+                child = struct.pack('>h', sub_key) + struct.pack('>2l', rnd.getrandbits(31), rnd.getrandbits(31))
+            else:
+                nested, nested_count = sub_rows(depth + 1)
+                child = struct.pack('>h', sub_key)
+                child += struct.pack('>lh', len(child) + 6 + len(nested), nested_count) + nested
+            body += child
+        return body, count
+
+    files = {
+        b'exd/root.exl': pack_compressed_file(b'EXLT,2\nNested,1\n'),
+        b'exd/nested.exh': pack_compressed_file(make_exh(
+            [(0x6, 0), (0x6, 4)], 8, [(0, row_count)], [Language.none.value], variant=subkey_count, row_count=row_count
+        )),
+        b'exd/nested_0.exd': pack_compressed_file(make_exd({row_id: sub_rows(0) for row_id in range(row_count)})),
+    }
+    return files
+
+
+def walk_sub_rows(row, key=()):
+    # (key, sub keys, column 1) of the data rows under a row, through the row objects
+    if not hasattr(row, 'count'):
+        yield row.key[0], row.key[1:], row[1]
+        return
+    for sub_row in row:
+        yield from walk_sub_rows(sub_row)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='compare iter_rows and Sheet.column on a synthetic sheet')
+    parser.add_argument('--rows', type=int, default=30000)
+    args = parser.parse_args()
+
+    data_directory = pathlib.Path(tempfile.mkdtemp(prefix='sqpack_bench_'))
+    write_pack(data_directory, b'exd', make_sheet(random.Random(0), args.rows))
+
+    def fresh_sheet():
+        return ExdManager(PackManager(data_directory)).get_sheet_raw('Bench')
+
+    sheet = fresh_sheet()
+    start = time.perf_counter()
+    rows = [[row[i] for i in range(len(columns))] for row in sheet.iter_rows()]
+    iter_used = time.perf_counter() - start
+    print(f'iter_rows: {len(rows)} rows x {len(columns)} columns in {iter_used * 1000:.2f}ms')
+
+    sheet = fresh_sheet()
+    start = time.perf_counter()
+    records = sheet.to_records()
+    records_used = time.perf_counter() - start
+    ok = np.array_equal(records['key'], sheet.row_keys()) and len(records) == len(rows)
+    print(f'to_records: {records_used * 1000:.2f}ms ({iter_used / records_used:.0f}x), {"ok" if ok else "MISMATCH"}')
+
+    sheet = fresh_sheet()
+    for col_id in range(len(columns)):
+        start = time.perf_counter()
+        values = sheet.column(col_id)
+        used = time.perf_counter() - start
+        if columns[col_id][0] == 0:
+            decoded = [None if (s := values[i]) is None else str(s) for i in range(len(values))]
+            ok = decoded == [None if r[col_id] is None else str(r[col_id]) for r in rows]
+        else:
+            ok = np.array_equal(values, np.array([r[col_id] for r in rows], values.dtype))
+        print(f'  column {col_id:>2} type {columns[col_id][0]:#04x}: {used * 1000:6.2f}ms, {"ok" if ok else "MISMATCH"}')
+    ok = np.array_equal(sheet.row_keys(), [r.key for r in fresh_sheet().iter_rows()])
+    print(f'row_keys: {"ok" if ok else "MISMATCH"}')
+
+    nested_directory = pathlib.Path(tempfile.mkdtemp(prefix='sqpack_bench_'))
+    write_pack(nested_directory, b'exd', make_nested_sheet(random.Random(0), 1000, 3))
+    nested = ExdManager(PackManager(nested_directory)).get_sheet_raw('Nested')
+    expected = [row for top in nested.iter_rows() for row in walk_sub_rows(top)]
+    records = nested.to_records()
+    ok = [(k, tuple(sk), v) for k, sk, v in zip(records['key'].tolist(), records['sub_key'].tolist(), nested.column(1).tolist())] == expected
+    print(f'3 key sub rows: {len(records)} rows, {"ok" if ok else "MISMATCH"}')
+
+
+if __name__ == '__main__':
+    main()
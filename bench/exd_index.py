@@ -0,0 +1,61 @@
+import argparse
+import pathlib
+import random
+import tempfile
+import time
+
+from fpt4.utils.sqpack.exd import ExdManager
+from fpt4.utils.sqpack.pack import PackManager
+from .exd_column import make_sheet
+from .sqpack_data import write_pack
+
+
+def main():
+    parser = argparse.ArgumentParser(description='compare Sheet.first scans and Sheet.index_by lookups on a synthetic sheet')
+    parser.add_argument('--rows', type=int, default=30000)
+    parser.add_argument('--lookups', type=int, default=20)
+    args = parser.parse_args()
+
+    data_directory = pathlib.Path(tempfile.mkdtemp(prefix='sqpack_bench_'))
+    cache_directory = data_directory / 'index_cache'
+    write_pack(data_directory, b'exd', make_sheet(random.Random(0), args.rows, rsv_every=1000))
+    rnd = random.Random(1)
+    names = [f'name of row {rnd.randrange(1, args.rows) | 1}' for _ in range(args.lookups)]
+
+    def fresh_sheet():
+        return ExdManager(PackManager(data_directory, cache_directory), game_version='bench').get_sheet_raw('Bench')
+
+    sheet = fresh_sheet()
+    start = time.perf_counter()
+    scanned = [sheet.first(lambda r: str(r[0]) == name) for name in names]
+    scan_used = time.perf_counter() - start
+    print(f'first() scan: {args.lookups} lookups in {scan_used * 1000:.2f}ms')
+
+    sheet = fresh_sheet()
+    start = time.perf_counter()
+    index = sheet.index_by(0)
+    build_used = time.perf_counter() - start
+    start = time.perf_counter()
+    found = [index.first(name) for name in names]
+    lookup_used = time.perf_counter() - start
+    ok = [r and r.key for r in scanned] == [r and r.key for r in found]
+    print(f'index_by build: {build_used * 1000:.2f}ms, {args.lookups} lookups in {lookup_used * 1000:.3f}ms, {"ok" if ok else "MISMATCH"}')
+
+    start = time.perf_counter()
+    by_value = fresh_sheet().index_by(3)
+    used = time.perf_counter() - start
+    ok = all(sorted(by_value.keys_of(v)) == sorted(r.key for r in sheet.iter_rows() if r[3] == v) for v in (0, 1, 255))
+    print(f'index_by u8 column: {used * 1000:.2f}ms, {len(by_value)} values, {"ok" if ok else "MISMATCH"}')
+
+    # the string index has reserved strings and is rebuilt instead of loaded, the u8 index is loaded from the cache
+    start = time.perf_counter()
+    fresh_sheet().index_by(3)
+    print(f'index_by u8 column from cache: {(time.perf_counter() - start) * 1000:.2f}ms')
+
+    sheet.mgr.rsv_string['_rsv_1000'] = b'renamed'
+    ok = index.first('renamed') is None and sheet.index_by(0).first('renamed').key == 1000 and sheet.index_by(0) is sheet.index_by(0)
+    print(f'rsv_string update invalidates the index: {"ok" if ok else "MISMATCH"}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+import argparse
+import math
+import random
+import time
+
+import glm
+
+from ff_draw.omen.hit_check import hit_check, hit_check_many, hit_count, as_points
+
+shapes = {
+    'circle': 0x10000,
+    'donut': 0x10000 | int(0xffff * .4),
+    'rect': 0x20000,
+    'back_rect': 0x20001,
+    'cross': 0x20002,
+    'fan': 0x50000 | 90,
+}
+
+
+def make_points(rnd: random.Random, count: int):
+    return [glm.vec3(rnd.uniform(-20, 20), rnd.uniform(-1, 1), rnd.uniform(-20, 20)) for _ in range(count)]
+
+
+def make_grid_points():
+    # points on a half unit grid, many of them exactly on an edge of a shape from a grid aligned source
+    return [glm.vec3(x / 2, y, z / 2) for x in range(-30, 31) for y in (-1, 0, 1) for z in range(-30, 31)]
+
+
+def best_of(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--counts', type=int, nargs='+', default=[8, 24, 200])
+    parser.add_argument('--loop', type=int, default=1000, help='checks per timing')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--verify', type=int, default=100000, help='random points compared between scalar and vectorized')
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    src = glm.vec3(1.5, 0, -2.5)
+    facing = .7
+    for name, shape in shapes.items():
+        scale = glm.vec3(10, 1, 10) if shape >> 16 != 2 else glm.vec3(6, 1, 15)
+        points = make_points(rnd, args.verify)
+        mask = hit_check_many(shape, scale, src, facing, points)
+        mismatch = sum(bool(m) != hit_check(shape, scale, src, facing, p) for m, p in zip(mask, points))
+        grid = make_grid_points()
+        edge_mismatch = 0
+        for edge_src in glm.vec3(1.5, .25, -2.5), glm.vec3(0, 0, 0):
+            for edge_facing in 0, facing, math.pi / 4, math.pi / 2, math.pi:
+                edge_mask = hit_check_many(shape, scale, edge_src, edge_facing, grid)
+                edge_mismatch += sum(bool(m) != hit_check(shape, scale, edge_src, edge_facing, p) for m, p in zip(edge_mask, grid))
+        print(f'{name}: {mask.sum()}/{len(points)} hit, {mismatch} mismatch, {edge_mismatch} mismatch on grid points')
+        for count in args.counts:
+            points = make_points(rnd, count)
+            arr = as_points(points)
+            scalar = best_of(lambda: [[hit_check(shape, scale, src, facing, p) for p in points] for _ in range(args.loop)], args.repeat)
+            vector = best_of(lambda: [hit_check_many(shape, scale, src, facing, points) for _ in range(args.loop)], args.repeat)
+            vector_arr = best_of(lambda: [hit_check_many(shape, scale, src, facing, arr) for _ in range(args.loop)], args.repeat)
+            count_cost = best_of(lambda: [hit_count(shape, scale, src, facing, points) for _ in range(args.loop)], args.repeat)
+            print(
+                f'  {count:>4} actors: scalar {scalar / args.loop * 1e6:8.2f}us, '
+                f'many(vec3 list) {vector / args.loop * 1e6:8.2f}us, many(ndarray) {vector_arr / args.loop * 1e6:8.2f}us, '
+                f'hit_count {count_cost / args.loop * 1e6:8.2f}us'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+import argparse
+import itertools
+import os
+import pathlib
+import threading
+import time
+
+empty_ipc = bytearray(16)
+
+
+def load_records(dump_path: pathlib.Path, limit: int):
+    from ff_draw.sniffer.message_dump import DumpReader
+    with DumpReader(dump_path) as reader:
+        os.environ.setdefault('FFXIV_GAME_VERSION', reader.header['game_version'])
+        return reader.header, list(itertools.islice(reader.iter_records(), limit))
+
+
+class ReplaySniffer:
+    def __init__(self, game_build_date, pno_dir: pathlib.Path, subscribe: str):
+        # game version must be set from dump header before importing message structs
+        from ff_draw.sniffer import enums, dispatch
+        from ff_draw.sniffer.sniffer_main import KeyRouteWithMap
+        from ff_draw.sniffer.message_structs import zone_server, zone_client, chat_server, chat_client
+        from ff_draw.sniffer.utils import simple, message
+        self.message = message
+        self.dispatch = dispatch
+        self.type_maps = chat_server.type_map, chat_client.type_map, zone_server.type_map, zone_client.type_map
+        self.ipc_lock = threading.Lock()
+        self.print_packets = False
+        self.fix_value = 0
+        self.handled = 0
+        self._chat_server_pno_map, _ = simple.load_pno_map(pno_dir / 'ChatServerIpc.csv', game_build_date, enums.ChatServer)
+        self._chat_client_pno_map, _ = simple.load_pno_map(pno_dir / 'ChatClientIpc.csv', game_build_date, enums.ChatClient)
+        self._zone_server_pno_map, _ = simple.load_pno_map(pno_dir / 'ZoneServerIpc.csv', game_build_date, enums.ZoneServer)
+        self._zone_client_pno_map, _ = simple.load_pno_map(pno_dir / 'ZoneClientIpc.csv', game_build_date, enums.ZoneClient)
+        self.on_chat_server_message = KeyRouteWithMap(lambda m: m.proto_no, lambda k: self._chat_server_pno_map.get(k, k))
+        self.on_chat_client_message = KeyRouteWithMap(lambda m: m.proto_no, lambda k: self._chat_client_pno_map.get(k, k))
+        self.on_zone_server_message = KeyRouteWithMap(lambda m: m.proto_no, lambda k: self._zone_server_pno_map.get(k, k))
+        self.on_zone_client_message = KeyRouteWithMap(lambda m: m.proto_no, lambda k: self._zone_client_pno_map.get(k, k))
+        self.dispatcher = dispatch.IpcDispatcher(
+            (self._chat_server_pno_map, self._chat_client_pno_map, self._zone_server_pno_map, self._zone_client_pno_map),
+            (self.on_chat_server_message, self.on_chat_client_message, self.on_zone_server_message, self.on_zone_client_message),
+        )
+        match subscribe:
+            case 'all':
+                self.on_zone_server_message.any_call.append(self.on_message)
+            case 'common':
+                for k in (
+                        'ActorControl', 'ActorControlSelf', 'ActorControlTarget', 'Effect', 'AoeEffect8', 'AoeEffect16', 'AoeEffect24', 'AoeEffect32',
+                        'ActorCast', 'NpcSpawn', 'NpcSpawn2', 'ObjectSpawn', 'ActorDelete', 'EffectResult', 'MapEffect', 'RsvString',
+                ):
+                    self.on_zone_server_message[enums.ZoneServer[k]].append(self.on_message)
+
+    def on_message(self, evt):
+        self.handled += 1
+
+    def legacy_on_ipc_message(self, is_zone, is_up, msg):
+        # the per packet logic of Sniffer._on_ipc_message before the dispatch table
+        chat_server_type_map, chat_client_type_map, zone_server_type_map, zone_client_type_map = self.type_maps
+        with self.ipc_lock:
+            if is_zone:
+                if is_up:
+                    pno_map = self._zone_client_pno_map
+                    call = self.on_zone_client_message
+                    type_map = zone_client_type_map
+                else:
+                    pno_map = self._zone_server_pno_map
+                    call = self.on_zone_server_message
+                    type_map = zone_server_type_map
+            else:
+                if is_up:
+                    pno_map = self._chat_client_pno_map
+                    call = self.on_chat_client_message
+                    type_map = chat_client_type_map
+                else:
+                    pno_map = self._chat_server_pno_map
+                    call = self.on_chat_server_message
+                    type_map = chat_server_type_map
+            data = msg.raw_data
+            if (pno := msg.element.proto_no) in pno_map:
+                pno = pno_map[pno]
+                if t := type_map.get(pno):
+                    msg = msg.to_ipc(t)
+                    data = msg.message
+                    if hasattr(t, '_pkt_fix'):
+                        data._pkt_fix(self.fix_value)
+            evt = self.message.NetworkMessage(proto_no=pno, raw_message=msg, header=msg.el_header, message=data)
+            call(evt)
+
+    def on_ipc_message(self, is_zone, is_up, msg):
+        # same as Sniffer._on_ipc_message without dump
+        message = self.message
+        scope = self.dispatch.get_scope(is_zone, is_up)
+        with self.ipc_lock:
+            pno, t, from_buffer, pkt_fix, handlers = self.dispatcher.get(scope, msg.element.proto_no)
+            any_call = self.dispatcher.routes[scope].any_call
+            if not (self.print_packets or any_call or handlers): return
+            data = msg.raw_data
+            if t is not None:
+                data = from_buffer(data, message._header_size)
+                msg = message.IpcMessage(msg.bundle_header, msg.el_header, msg.element, data, msg.raw_data)
+                if pkt_fix:
+                    data._pkt_fix(self.fix_value)
+            evt = message.NetworkMessage(proto_no=pno, raw_message=msg, header=msg.el_header, message=data)
+            for c in any_call: c(evt)
+            for c in handlers: c(evt)
+
+
+def make_messages(records):
+    from ff_draw.sniffer.utils import message
+    res = []
+    for _, scope, proto_no, fix_value, source_id, timestamp_ms, data in records:
+        res.append((scope & 0b10 > 0, scope & 0b1 > 0, message.ElementMessage(
+            bundle_header=message.BundleHeader(timestamp_ms=timestamp_ms),
+            el_header=message.ElementHeader(source_id=source_id),
+            element=message.IpcHeader(proto_no=proto_no),
+            raw_data=empty_ipc + data,
+        )))
+    return res
+
+
+def bench(name, sniffer: ReplaySniffer, func, messages, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        sniffer.handled = 0
+        start = time.perf_counter()
+        for is_zone, is_up, msg in messages:
+            func(is_zone, is_up, msg)
+        best = min(best, time.perf_counter() - start)
+    print(f'{name:>8}: {len(messages)} messages, {sniffer.handled} handled, {best * 1000:.2f}ms, {len(messages) / best:,.0f} msg/s')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('dump', type=pathlib.Path, help='a dump file written by MessageDumper')
+    parser.add_argument('--pno-dir', type=pathlib.Path, default=pathlib.Path(__file__).parent.parent / 'res' / 'proto_no')
+    parser.add_argument('--subscribe', choices=('none', 'common', 'all'), default='common')
+    parser.add_argument('--limit', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    header, records = load_records(args.dump, args.limit)
+    sniffer = ReplaySniffer(header['game_build_date'], args.pno_dir, args.subscribe)
+    messages = make_messages(records)
+    print(f'replay {len(messages)} messages from {args.dump}, subscribe={args.subscribe}')
+    bench('legacy', sniffer, sniffer.legacy_on_ipc_message, messages, args.repeat)
+    bench('dispatch', sniffer, sniffer.on_ipc_message, messages, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
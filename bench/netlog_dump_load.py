@@ -0,0 +1,93 @@
+import argparse
+import os
+import pathlib
+import random
+import struct
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / 'plugins'))  # plugins are imported by name like the plugin loader does
+os.environ.setdefault('FFXIV_GAME_VERSION', '7.0.0')  # message structs are chosen by version on import
+
+from ff_draw.sniffer.message_dump import MessageDumper
+from NetLog import net_log_imgui
+from NetLog.dump_loader import DumpLoader
+
+game_build_date = '2024.07.01.0000.0000'
+zone_server_protos = {'ActorMove': 0x101, 'ActorControl': 0x102, 'ActorControlTarget': 0x103, 'PlayerSpawn': 0x104}
+actor_control_ids = 0x6, 0x36, 0x37, 0x1234  # Death, SetTargetable, SetModelAttr (if defined) and one not in ActorControlId
+
+
+def write_dump(path: pathlib.Path, pno_dir: pathlib.Path, rnd: random.Random, count: int):
+    pno_dir.mkdir(parents=True, exist_ok=True)
+    (pno_dir / 'ZoneServerIpc.csv').write_text(f'key,{game_build_date}\n' + ''.join(f'{k},{v}\n' for k, v in zone_server_protos.items()))
+    dumper = MessageDumper(path, game_build_date, max_buffer_size=1 << 30)
+    ts = 1700000000000
+    players = [0x10000001 + i for i in range(16)]
+    for i, player in enumerate(players):
+        data = bytearray(0x278)
+        data[0x10 + 0x220:0x10 + 0x220 + 10] = f'player {i:03d}'.encode()
+        dumper.write(ts, True, False, zone_server_protos['PlayerSpawn'], player, bytes(data))
+    for _ in range(count):
+        ts += rnd.randrange(20)
+        source = rnd.choice(players)
+        match rnd.random():
+            case r if r < .45:
+                dumper.write(ts, True, False, zone_server_protos['ActorMove'], source, rnd.randbytes(0xC))
+            case r if r < .75:
+                data = struct.pack('<HHIIII', rnd.choice(actor_control_ids), 0, *(rnd.randrange(4) for _ in range(4))) + bytes(8)
+                dumper.write(ts, True, False, zone_server_protos['ActorControl'], source, data)
+            case r if r < .85:
+                data = struct.pack('<HHIIIII', rnd.choice(actor_control_ids), 0, *(rnd.randrange(4) for _ in range(4)), rnd.choice(players)) + bytes(8)
+                dumper.write(ts, True, False, zone_server_protos['ActorControlTarget'], source, data)
+            case _:
+                dumper.write(ts, True, rnd.random() < .3, 0x200 + rnd.randrange(64), source, rnd.randbytes(rnd.randrange(16, 256)))
+    dumper.close()
+
+
+def load(dump_path, pno_dir, workers):
+    actors = net_log_imgui.ActorDefs()
+    nl = net_log_imgui.NetLogger(None, actors.get)
+    loader = DumpLoader(nl, actors, None, None, pno_dir, dump_path, workers=workers)
+    start = time.perf_counter()
+    loader.run()
+    loaded = time.perf_counter() - start
+    nl.filter = 'status'  # rows are indexed once a filter is set
+    nl.apply_filter()
+    while nl.is_filtering: time.sleep(.001)
+    return nl, loader, loaded, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=200000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[0, 2, 4])
+    parser.add_argument('--verify', type=int, default=2000, help='random rows compared with the single thread load')
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = pathlib.Path(tmp)
+        write_dump(dump_path := tmp / 'bench.dmp', pno_dir := tmp / 'proto_no', rnd, args.count)
+        print(f'{args.count} records, {dump_path.stat().st_size / (1 << 20):.1f}MiB dump, {os.cpu_count()} cpus')
+        base = None
+        for workers in args.workers:
+            nl, loader, loaded, indexed = load(dump_path, pno_dir, workers)
+            res = f'  {workers} workers: loaded {loaded * 1e3:8.1f}ms ({loader.rate:8.0f} records/s), indexed {indexed * 1e3:8.1f}ms'
+            if base is None:
+                base = nl
+            else:
+                rows = rnd.sample(range(len(base.store)), min(args.verify, len(base.store)))
+                same = len(nl.store) == len(base.store) and all(
+                    (a := base.message(i)).key == (b := nl.message(i)).key and a.data_str == b.data_str and a.source_str == b.source_str
+                    for i in rows
+                ) and sorted(base.index.postings) == sorted(nl.index.postings)
+                res += ', ok' if same else ', MISMATCH'
+                nl.close()
+            print(res)
+        base.close()
+
+
+if __name__ == '__main__':
+    main()
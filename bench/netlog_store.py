@@ -0,0 +1,174 @@
+import argparse
+import ctypes
+import dataclasses
+import datetime
+import pathlib
+import random
+import re
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / 'plugins'))  # plugins are imported by name like the plugin loader does
+
+from NetLog import net_log_imgui
+from NetLog.net_log_imgui.format import fmt_simple
+from nylib.utils import serialize_data
+
+
+queries = [
+    ('boss', False),
+    ('<40000011>', False),
+    ('status_id', False),
+    (':13:', False),
+    (r'StatusParam\].*status_id=12\b', True),
+    (r'\d{4}9\b', True),
+]
+
+
+class _Struct(ctypes.Structure):
+    def __str__(self):
+        return str({k: getattr(self, k) for k, *_ in self._fields_ if k != 'pad'})
+
+
+class Move(_Struct):
+    _fields_ = [('x', ctypes.c_float), ('y', ctypes.c_float), ('z', ctypes.c_float), ('facing', ctypes.c_uint16), ('flag', ctypes.c_uint16)]
+
+
+class Cast(_Struct):
+    _fields_ = [('action_id', ctypes.c_uint32), ('target_id', ctypes.c_uint32), ('cast_time', ctypes.c_float), ('pad', ctypes.c_uint8 * 52)]
+
+
+@dataclasses.dataclass
+class Param:
+    status_id: int
+    stack: int
+
+
+class LegacyMessage:
+    # the eager message of before, formatted when appended
+    def __init__(self, key_fmt, actor_getter, timestamp_ms, source_id, key, data):
+        self.timestamp_ms = timestamp_ms
+        self.source_id = source_id
+        self.data = data
+        self.timestamp_str = datetime.datetime.fromtimestamp(timestamp_ms / 1000).strftime('%Y-%m-%d %H:%M:%S:%f')[:-3]
+        self.data_serialized = data if isinstance(data, (bytes, bytearray)) else serialize_data(data)
+        self.source_str = str(actor_getter(source_id))
+        self.data_str = f'<bytes:{len(data)}>' if isinstance(data, (bytes, bytearray)) else fmt_simple(self.data_serialized)
+        self.key = key_fmt.format(key)
+
+    def match(self, key):
+        return not key or key in '\t'.join((self.timestamp_str, self.source_str.lower(), self.key.lower(), self.data_str.lower()))
+
+    def re_match(self, pattern: re.Pattern):
+        return pattern.search('\t'.join((self.timestamp_str, self.source_str, self.key, self.data_str))) is not None
+
+
+def make_messages(rnd: random.Random, count: int):
+    res = []
+    ts = 1700000000000
+    for _ in range(count):
+        ts += rnd.randrange(50)
+        source = rnd.choice((0x10000001, 0x40000010, 0x40000011, 0x40000012))
+        match rnd.random():
+            case r if r < .5:
+                res.append((net_log_imgui.ZoneServerIpc, ts, source, 'Move', Move(rnd.random() * 100, 0, rnd.random() * 100, rnd.randrange(0xffff), 0), 0))
+            case r if r < .7:
+                res.append((net_log_imgui.ZoneServerIpc, ts, source, 'Cast', Cast(rnd.randrange(40000), source, rnd.random() * 5), 0))
+            case r if r < .85:
+                res.append((net_log_imgui.ZoneServerIpc, ts, source, rnd.randrange(0x400), rnd.randbytes(rnd.randrange(32, 512)), 0))
+            case r if r < .95:
+                res.append((net_log_imgui.ActorControlIpc, ts, source, 'StatusParam', Param(rnd.randrange(4000), rnd.randrange(16)), 0x40000010))
+            case _:
+                res.append((net_log_imgui.ActorControlIpc, ts, source, 0x1234, tuple(rnd.randrange(1 << 32) for _ in range(4)), 0x40000010))
+    return res
+
+
+def timed(func):
+    # timed without tracing, tracemalloc slows down every allocation
+    start = time.perf_counter()
+    func()
+    cost = time.perf_counter() - start
+    tracemalloc.start()
+    res = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return res, cost, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=100000)
+    parser.add_argument('--memory', type=int, default=4, help='memory cap of the store in MiB')
+    parser.add_argument('--verify', type=int, default=2000, help='random rows compared with the eager messages')
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    messages = make_messages(rnd, args.count)
+    actors = net_log_imgui.ActorDefs()
+    actors.update(0x40000010, 1234, 'boss')
+
+    def run_legacy():
+        return [LegacyMessage(t.key_fmt, actors.get, ts, source, key, data) for t, ts, source, key, data, _ in messages]
+
+    def run_store():
+        nl = net_log_imgui.NetLogger(None, actors.get, args.memory << 20)
+        for t, ts, source, key, data, target in messages: nl.append(t, ts, source, key, data, target)
+        return nl
+
+    legacy, legacy_cost, legacy_peak = timed(run_legacy)
+    nl, store_cost, store_peak = timed(run_store)
+    print(f'{args.count} messages')
+    print(f'  eager list: {legacy_cost * 1e3:8.1f}ms, peak {legacy_peak / (1 << 20):8.1f}MiB')
+    print(f'  store:      {store_cost * 1e3:8.1f}ms, peak {store_peak / (1 << 20):8.1f}MiB, '
+          f'{nl.store.memory_size / (1 << 20):.1f}MiB in memory, {nl.store.spill_size / (1 << 20):.1f}MiB spilled')
+
+    rows = rnd.sample(range(args.count), min(args.verify, args.count))
+    start = time.perf_counter()
+    mismatch = 0
+    for row in rows:
+        msg, old = nl.message(row), legacy[row]
+        mismatch += (msg.timestamp_str, msg.source_str, msg.key, msg.data_str) != (old.timestamp_str, old.source_str, old.key, old.data_str)
+    print(f'  format {len(rows)} random rows: {(time.perf_counter() - start) * 1e3:.1f}ms, {"ok" if not mismatch else f"MISMATCH {mismatch}"}')
+
+    start = time.perf_counter()
+    data = [nl.store.data(row) for row in rows]
+    cost = time.perf_counter() - start
+    same = all(serialize_data(d) == serialize_data(legacy[row].data) for row, d in zip(rows, data))
+    print(f'  data of {len(rows)} random rows: {cost * 1e3:.1f}ms, {"ok" if same else "MISMATCH"}')
+
+    # rows are formatted and indexed by the worker once a filter is set
+    memory_size = nl.store.memory_size
+    nl.filter = queries[0][0]
+    start = time.perf_counter()
+    nl.apply_filter()
+    while nl.is_filtering: time.sleep(.001)
+    print(
+        f'  first filter, index built by the worker in {(time.perf_counter() - start) * 1e3:.1f}ms, {len(nl.index.postings)} tokens, '
+        f'{(nl.store.memory_size - memory_size) / (1 << 20):+.1f}MiB in memory, {nl.store.spill_size / (1 << 20):.1f}MiB spilled'
+    )
+    nl.filter = ''
+    nl.apply_filter()
+
+    for text, use_regex in queries:
+        pattern = re.compile(text) if use_regex else None
+        start = time.perf_counter()
+        expected = [i for i, m in enumerate(legacy) if (m.re_match(pattern) if use_regex else m.match(text.lower()))]
+        legacy_cost = time.perf_counter() - start
+        nl.filter, nl.filter_use_regex = text, use_regex
+        start = time.perf_counter()
+        nl.apply_filter()
+        apply_cost = time.perf_counter() - start
+        while nl.is_filtering: time.sleep(.001)
+        cost = time.perf_counter() - start
+        selected = [i for i in range(args.count) if nl.selected[i]]
+        print(
+            f'  filter {text!r}{" (regex)" if use_regex else ""}: full scan {legacy_cost * 1e3:7.1f}ms, '
+            f'apply_filter {apply_cost * 1e3:5.2f}ms, results {cost * 1e3:7.1f}ms, {len(selected)} selected, '
+            f'{"ok" if selected == expected else "MISMATCH"}'
+        )
+    nl.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+import argparse
+import pathlib
+import random
+import struct
+import tempfile
+import time
+import types
+
+import numpy as np
+from glm import vec3
+
+from fpt4.utils.parse.terrain.terrain_mesh import TerrainMesh, TerrainHeader
+from fpt4.utils.parse.terrain.terrain_mesh.mesh import Mesh, PcbHeader
+from fpt4.utils.parse.terrain.terrain_mesh.mesh.node import HeaderV1, Polygon, CompVertex3Struct
+from fpt4.utils.parse.terrain.utils import vec3_from_buffer
+from fpt4.utils.sqpack.pack import PackManager
+from .sqpack_data import pack_compressed_file, write_pack
+
+TERRAIN_PATH = b'bg/ffxiv/bench/collision'
+
+
+# the per vertex and per polygon decoding used before
+class LegacyNodeV1:
+    def __init__(self, view):
+        self.header = HeaderV1._make(HeaderV1.struct_.unpack_from(view))
+        self.child0 = LegacyNodeV1(view[self.header.child0:]) if self.header.child0 > 0 else None
+        self.child1 = LegacyNodeV1(view[self.header.child1:]) if self.header.child1 > 0 else None
+        float_vertex_offset = HeaderV1.struct_.size
+        comp_vertex_offset = float_vertex_offset + 12 * self.header.float_vertex_num
+        polygon_offset = comp_vertex_offset + CompVertex3Struct.size * self.header.vertex_num
+        self.vertex = [vec3_from_buffer(view, float_vertex_offset + i * 12) for i in range(self.header.float_vertex_num)]
+        self.polygons = [Polygon._make(t) for t in Polygon.struct_.iter_unpack(view[polygon_offset:polygon_offset + Polygon.struct_.size * self.header.polygon_num])]
+        min_x, min_y, min_z = self.header.aabb_min_x, self.header.aabb_min_y, self.header.aabb_min_z
+        scale_x = (self.header.aabb_max_x - min_x) / 65535
+        scale_y = (self.header.aabb_max_y - min_y) / 65535
+        scale_z = (self.header.aabb_max_z - min_z) / 65535
+        for x, y, z in CompVertex3Struct.iter_unpack(view[comp_vertex_offset:polygon_offset]):
+            self.vertex.append(vec3(x * scale_x + min_x, y * scale_y + min_y, z * scale_z + min_z))
+
+
+def legacy_nodes(buffer):
+    res = []
+
+    def add(node):
+        if node.vertex or node.polygons: res.append(node)
+        if node.child0: add(node.child0)
+        if node.child1: add(node.child1)
+
+    add(LegacyNodeV1(memoryview(buffer)[PcbHeader.struct_.size:]))
+    return res
+
+
+def make_node(rnd: random.Random, depth: int, low, high, float_vertex_num: int, vertex_num: int, polygon_num: int):
+    """
+    a v1 node subtree, internal nodes are empty and split their box in half on x, leaves hold the geometry
+    """
+    if depth:
+        mid = (low[0] + high[0]) / 2
+        child0 = make_node(rnd, depth - 1, low, (mid, *high[1:]), float_vertex_num, vertex_num, polygon_num)
+        child1 = make_node(rnd, depth - 1, (mid, *low[1:]), high, float_vertex_num, vertex_num, polygon_num)
+        size = HeaderV1.struct_.size
+        return HeaderV1.struct_.pack(0, 1, size, size + len(child0), *low, *high, 0, 0, 0, 0) + child0 + child1
+    body = b''.join(struct.pack('<3f', *(rnd.uniform(l, h) for l, h in zip(low, high))) for _ in range(float_vertex_num))
+    body += b''.join(CompVertex3Struct.pack(*(rnd.randrange(65536) for _ in range(3))) for _ in range(vertex_num))
+    n = float_vertex_num + vertex_num
+    body += b''.join(Polygon.struct_.pack(*rnd.sample(range(n), 3), 0, rnd.getrandbits(64)) for _ in range(polygon_num))
+    return HeaderV1.struct_.pack(0, 1, 0, 0, *low, *high, vertex_num, polygon_num, float_vertex_num, 0) + body
+
+
+def make_terrain(rnd: random.Random, mesh_num: int, depth: int):
+    files = {}
+    table = b''
+    for mesh_id in range(mesh_num):
+        low, high = (mesh_id * 100., -10., 0.), (mesh_id * 100. + 100, 10., 100.)
+        root = make_node(rnd, depth, low, high, 8, 120, 100)
+        leaves = 1 << depth
+        files[b'%s/tr%04d.pcb' % (TERRAIN_PATH, mesh_id)] = pack_compressed_file(PcbHeader.struct_.pack(0, 1, leaves * 2 - 1, leaves * 100) + root)
+        table += struct.pack('I6fI', mesh_id, *low, *high, 0)
+    files[TERRAIN_PATH + b'/list.pcb'] = pack_compressed_file(TerrainHeader.struct_.pack(mesh_num, 0, -10, 0, mesh_num * 100, 10, 100, 0) + table)
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description='compare per vertex and numpy decoding of pcb collision meshes')
+    parser.add_argument('--meshes', type=int, default=16)
+    parser.add_argument('--depth', type=int, default=6, help='node tree depth of every mesh, 2**depth leaves')
+    args = parser.parse_args()
+
+    data_directory = pathlib.Path(tempfile.mkdtemp(prefix='sqpack_bench_'))
+    files = make_terrain(random.Random(0), args.meshes, args.depth)
+    write_pack(data_directory, b'bg', files)
+    sq_pack = types.SimpleNamespace(pack=PackManager(data_directory))
+    buffers = {p: sq_pack.pack.get_file(p).data_buffer for p in files if p.endswith(b'.pcb') and not p.endswith(b'list.pcb')}
+    print(f'{len(buffers)} meshes, {1 << args.depth} leaves x 128 vertices x 100 polygons each, {sum(map(len, buffers.values())) / 2 ** 20:.1f}MB')
+
+    start = time.perf_counter()
+    legacy = {p: legacy_nodes(b) for p, b in buffers.items()}
+    legacy_used = time.perf_counter() - start
+
+    # the decompressed files are still in the pack cache, so both only parse
+    start = time.perf_counter()
+    terrain = TerrainMesh(sq_pack, TERRAIN_PATH)
+    used = time.perf_counter() - start
+
+    ok = True
+    for m in terrain.state_table:
+        mesh: Mesh = m.mesh
+        nodes = legacy[mesh.path]
+        ok &= np.array_equal(mesh.vertices, np.array([v for n in nodes for v in n.vertex], np.float32))
+        ok &= mesh.polygons['attr'].tolist() == [p.attr for n in nodes for p in n.polygons]
+        ok &= [len(n.vertex) for n in mesh.nodes] == [len(n.vertex) for n in nodes]
+        ok &= len(mesh.node_table) == (2 << args.depth) - 1
+    print(f'legacy nodes: {legacy_used * 1000:.2f}ms, numpy TerrainMesh: {used * 1000:.2f}ms ({legacy_used / used:.0f}x), {"ok" if ok else "MISMATCH"}')
+
+    start = time.perf_counter()
+    bvh = terrain.bvh
+    print(f'bvh over {len(bvh.triangles)} triangles: {(time.perf_counter() - start) * 1000:.2f}ms')
+
+
+if __name__ == '__main__':
+    main()
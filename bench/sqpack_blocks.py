@@ -0,0 +1,92 @@
+import argparse
+import io
+import pathlib
+import random
+import struct
+import tempfile
+import time
+
+from fpt4.utils.sqpack.pack import PackManager
+from fpt4.utils.sqpack.pack.file import utils as file_utils
+from fpt4.utils.sqpack.pack.file.model_file import MODEL_HEADER
+from .sqpack_data import make_payload, pack_compressed_file, pack_texture_file, pack_model_file, texture_header, write_pack
+
+
+def legacy_read(file):
+    # the sequential BytesIO decoding used before, for compressed and texture files
+    stream = file.data_stream
+    if hasattr(file, 'texture_header'):
+        stream.seek(0x50, 1)
+        sizes = struct.unpack_from(f'<{file.header.number_of_block}H', file.header_buffer, 0x18 + 0x14 * file.header.output_lod_num)
+        offsets = [stream.tell() + sum(sizes[:i]) for i in range(len(sizes))]
+    else:
+        pos = stream.tell()
+        offsets = [pos + struct.unpack_from('<I', file.header_buffer, 0x18 + 8 * i)[0] for i in range(file.header.number_of_compressed_data_block_info)]
+    with io.BytesIO() as dst:
+        for offset in offsets:
+            stream.seek(offset)
+            data, uncompressed_size, is_compressed = file_utils.read_block(stream)
+            dst.write(file_utils.inflate_block(data, uncompressed_size) if is_compressed else data)
+        return bytearray(dst.getvalue())
+
+
+def make_data(data_directory: pathlib.Path, size: int):
+    rnd = random.Random(0)
+    mips = []
+    side = 1
+    while side * side * 4 * 4 < size: side *= 2
+    while side >= 4:
+        mips.append(make_payload(rnd, side * side * 4))
+        side //= 2
+    model_sections = [make_payload(rnd, n) for n in (0x400, 0x800)] + [make_payload(rnd, size // (4 << (i // 3)) if i % 3 != 1 else 0) for i in range(9)]
+    files = {
+        b'bg/bench/collision.pcb': pack_compressed_file(make_payload(rnd, size)),
+        b'bg/bench/texture.tex': pack_texture_file(texture_header(0x1450, side, side, len(mips)), mips),
+        b'bg/bench/model.mdl': pack_model_file(model_sections),
+    }
+    write_pack(data_directory, b'bg', files)
+    return model_sections
+
+
+def best_of(func, repeat):
+    best = float('inf')
+    res = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        res = func()
+        best = min(best, time.perf_counter() - start)
+    return best, res
+
+
+def main():
+    parser = argparse.ArgumentParser(description='compare sequential and thread pool block decompression')
+    parser.add_argument('--size', type=int, default=0x1000000, help='uncompressed size of each test file')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    data_directory = pathlib.Path(tempfile.mkdtemp(prefix='sqpack_bench_'))
+    model_sections = make_data(data_directory, args.size)
+    pack = PackManager(data_directory).get_pack(b'bg/bench')
+    for name in (b'collision.pcb', b'texture.tex', b'model.mdl'):
+        path = b'bg/bench/' + name
+        file = pack.get_file(path)
+        print(f'{name.decode()}: {type(file).__name__}, {file.header.number_of_block} blocks')
+        expected = None
+        if name != b'model.mdl':
+            used, expected = best_of(lambda: legacy_read(pack.get_file(path)), args.repeat)
+            print(f'  {"legacy":>10}: {used * 1000:8.2f}ms, {len(expected) / used / 2 ** 20:8.1f}MB/s')
+        for workers in args.workers:
+            file_utils.block_workers = workers
+            file_utils._block_pool = None
+            used, res = best_of(lambda: pack.get_file(path).get_data_buffer(pack.get_file(path).data_stream), args.repeat)
+            if expected is None: expected = res
+            if name == b'model.mdl':
+                ok = res[MODEL_HEADER.size:] == b''.join(model_sections)
+            else:
+                ok = res == expected
+            print(f'  {f"{workers} workers":>10}: {used * 1000:8.2f}ms, {len(res) / used / 2 ** 20:8.1f}MB/s, {"ok" if ok else "MISMATCH"}')
+
+
+if __name__ == '__main__':
+    main()
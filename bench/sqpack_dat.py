@@ -0,0 +1,90 @@
+import argparse
+import json
+import os
+import pathlib
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fpt4.utils.sqpack.pack import PackManager
+from .sqpack_data import make_payload, pack_compressed_file, write_pack
+
+modes = ('open', 'read', 'mmap')
+
+
+def rss_mb():
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 2 ** 20
+    except ImportError:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+
+
+def make_data(data_directory: pathlib.Path, count: int, size: int):
+    rnd = random.Random(0)
+    files = {b'exd/root.exl': pack_compressed_file(b'EXLT,2\n')}
+    for i in range(count):
+        files[b'exd/sheet_%d.exd' % i] = pack_compressed_file(make_payload(rnd, rnd.randint(size // 2, size * 3 // 2)))
+    write_pack(data_directory, b'exd', files)
+    return len(files)
+
+
+def run_child(data_directory: pathlib.Path, mode: str, count: int, reads: int, threads: int):
+    base_rss = rss_mb()
+    start = time.perf_counter()
+    pack = PackManager(data_directory, use_mmap=mode == 'mmap').get_pack(b'exd/root.exl')
+    pack.keep_in_memory = mode == 'read'  # like ExdManager._build
+    pack.get_file(b'exd/root.exl').data_buffer
+    startup = time.perf_counter() - start
+    rss_startup = rss_mb()
+
+    rnd = random.Random(1)
+    paths = [b'exd/sheet_%d.exd' % rnd.randrange(count) for _ in range(reads)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        read_size = sum(pool.map(lambda p: len(pack.get_file(p).data_buffer), paths, chunksize=64))
+    used = time.perf_counter() - start
+    print(json.dumps({
+        'startup': startup, 'read': used, 'read_size': read_size,
+        'rss_startup': rss_startup - base_rss, 'rss_end': rss_mb() - base_rss,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='compare dat access modes of Pack: per-thread handles, full read and mmap')
+    parser.add_argument('--count', type=int, default=4000, help='files in the synthetic pack')
+    parser.add_argument('--size', type=int, default=0x20000, help='average uncompressed file size')
+    parser.add_argument('--reads', type=int, default=2000, help='random file reads after startup')
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--data', type=pathlib.Path, default=None, help='reuse a generated sqpack directory')
+    parser.add_argument('--child', choices=modes, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return run_child(args.data, args.child, args.count, args.reads, args.threads)
+
+    data_directory = args.data or pathlib.Path(tempfile.mkdtemp(prefix='sqpack_bench_'))
+    if not any(data_directory.rglob('*.dat0')):
+        make_data(data_directory, args.count, args.size)
+    dat_size = sum(p.stat().st_size for p in data_directory.rglob('*.dat0'))
+    print(f'dat size {dat_size / 2 ** 20:.1f}MB, {args.reads} reads on {args.threads} threads')
+    for mode in modes:
+        # a fresh process per mode so page cache is the only thing shared and rss is comparable
+        out = subprocess.run(
+            [sys.executable, '-m', 'bench.sqpack_dat', '--child', mode, '--data', str(data_directory),
+             '--count', str(args.count), '--reads', str(args.reads), '--threads', str(args.threads)],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        res = json.loads(out.strip().splitlines()[-1])
+        print(
+            f'{mode:>5}: startup {res["startup"] * 1000:8.2f}ms, rss +{res["rss_startup"]:7.1f}MB | '
+            f'reads {res["read"] * 1000:8.2f}ms ({res["read_size"] / res["read"] / 2 ** 20:7.1f}MB/s), rss +{res["rss_end"]:7.1f}MB'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+import pathlib
+import random
+import struct
+import zlib
+
+from fpt4.utils.sqpack.pack import PackIdentifier, PACK_TYPE_TO_KEY_MAP
+from fpt4.utils.sqpack.pack.indexfile import compute_hash_32
+
+BLOCK_SIZE = 0x3E80  # uncompressed size of a full block in game files
+ALIGN = 0x80
+
+
+def _align(size, align=ALIGN):
+    return (size + align - 1) & ~(align - 1)
+
+
+def make_payload(rnd: random.Random, size: int):
+    # half random and half repeated words, compresses about like game data
+    words = [rnd.randbytes(8) for _ in range(64)]
+    res = bytearray()
+    while len(res) < size:
+        res += rnd.randbytes(32) if rnd.random() < .5 else rnd.choice(words) * 4
+    return bytes(res[:size])
+
+
+def pack_block(data: bytes):
+    compressed = zlib.compress(data, 6, -15)
+    block = struct.pack('<IIII', 0x10, 0, len(compressed), len(data)) + compressed
+    return block + bytes(_align(len(block)) - len(block))
+
+
+def pack_compressed_file(data: bytes):
+    blocks = [pack_block(data[i:i + BLOCK_SIZE]) for i in range(0, len(data), BLOCK_SIZE)] or [pack_block(b'')]
+    header_size = _align(0x18 + 8 * len(blocks))
+    header = bytearray(header_size)
+    struct.pack_into('<IIIIII', header, 0, header_size, 2, len(data), len(blocks), len(blocks), len(blocks))
+    offset = 0
+    for i, (block, start) in enumerate(zip(blocks, range(0, max(len(data), 1), BLOCK_SIZE))):
+        struct.pack_into('<IHH', header, 0x18 + 8 * i, offset, len(block), min(BLOCK_SIZE, len(data) - start))
+        offset += len(block)
+    return bytes(header) + b''.join(blocks)
+
+
+def pack_texture_file(texture_header: bytes, mips: list[bytes]):
+    # one lod per mip, every lod split in BLOCK_SIZE blocks
+    lods = [[pack_block(mip[i:i + BLOCK_SIZE]) for i in range(0, len(mip), BLOCK_SIZE)] for mip in mips]
+    block_sizes = [len(b) for lod in lods for b in lod]
+    header_size = _align(0x18 + 0x14 * len(lods) + 2 * len(block_sizes) + 2)
+    header = bytearray(header_size)
+    raw_size = len(texture_header) + sum(len(m) for m in mips)
+    struct.pack_into('<IIIIII', header, 0, header_size, 4, raw_size, len(block_sizes), len(block_sizes), len(lods))
+    comp_offset = len(texture_header)
+    block_index = 0
+    for i, (lod, mip) in enumerate(zip(lods, mips)):
+        comp_size = sum(len(b) for b in lod)
+        struct.pack_into('<IIIII', header, 0x18 + 0x14 * i, comp_offset, comp_size, len(mip), block_index, len(lod))
+        comp_offset += comp_size
+        block_index += len(lod)
+    struct.pack_into(f'<{len(block_sizes)}H', header, 0x18 + 0x14 * len(lods), *block_sizes)
+    return bytes(header) + texture_header + b''.join(b for lod in lods for b in lod)
+
+
+def pack_model_file(sections: list[bytes], lod_num=3):
+    """
+    sections are stack, runtime, then vertex, edge geometry and index buffer of 3 lods
+    """
+    blocks = [[pack_block(data[i:i + BLOCK_SIZE]) for i in range(0, len(data), BLOCK_SIZE)] for data in sections]
+    block_sizes = [len(b) for section in blocks for b in section]
+    header_size = _align(0xD0 + 2 * len(block_sizes))
+    header = bytearray(header_size)
+    struct.pack_into('<IIIIII', header, 0, header_size, 3, sum(map(len, sections)), len(block_sizes), len(block_sizes), 5)
+    offsets, indexes, nums = [], [], []
+    offset = index = 0
+    for section in blocks:
+        offsets.append(offset)
+        indexes.append(index)
+        nums.append(len(section))
+        offset += sum(len(b) for b in section)
+        index += len(section)
+    by_type = lambda values: [values[0], values[1], *values[2::3], *values[3::3], *values[4::3]]  # stack, runtime, vertex[3], edge[3], index[3]
+    struct.pack_into('<11I', header, 0x18, *by_type([len(d) for d in sections]))
+    struct.pack_into('<11I', header, 0x70, *by_type(offsets))
+    struct.pack_into('<11H', header, 0x9C, *by_type(indexes))
+    struct.pack_into('<11H', header, 0xB2, *by_type(nums))
+    struct.pack_into('<HHB', header, 0xC8, 2, 1, lod_num)
+    struct.pack_into(f'<{len(block_sizes)}H', header, 0xD0, *block_sizes)
+    return bytes(header) + b''.join(b for section in blocks for b in section)
+
+
+def texture_header(fmt: int, width: int, height: int, mip_levels: int = 1):
+    # lod i starts at mip i, like pack_texture_file writes them
+    lod_offset = [min(i, mip_levels - 1) for i in range(3)]
+    return struct.pack('<IIHHHBB3I', 0x800000, fmt, width, height, 1, mip_levels, 1, *lod_offset) + bytes(0x50 - 0x1C)
+
+
+def write_pack(data_directory: pathlib.Path, pack_type: bytes, files: dict[bytes, bytes]):
+    """
+    write a single dat sqpack with packed file entries, returns the pack identifier
+    """
+    pack_id = PackIdentifier(PACK_TYPE_TO_KEY_MAP[pack_type], 0, 0)
+    index_path = pack_id.index_file_path(data_directory)
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    dat = bytearray(0x800)  # sqpack header placeholder
+    dirs: dict[int, list[tuple[int, int]]] = {}
+    for path, packed in files.items():
+        offset = len(dat)
+        dat += packed + bytes(_align(len(packed)) - len(packed))
+        dir_path, base_name = path.rsplit(b'/', 1)
+        dir_hash = compute_hash_32(dir_path)
+        dirs.setdefault(dir_hash, []).append((dir_hash << 32 | compute_hash_32(base_name), (offset >> 7) << 4))
+    pack_id.dat_file_path(data_directory).write_bytes(dat)
+
+    header = bytearray(0x800)
+    header[0:6] = b'SqPack'
+    struct.pack_into('<I', header, 0xC, 0x400)
+    hash_table = bytearray()
+    dir_table = bytearray()
+    for dir_hash, entries in sorted(dirs.items()):
+        dir_table += struct.pack('<IIII', dir_hash, 0x800 + len(hash_table), len(entries) * 0x10, 0)
+        for key, packed in sorted(entries):
+            hash_table += struct.pack('<QII', key, packed, 0)
+    struct.pack_into('<IIII', header, 0x400, 0x400, 1, 0x800, len(hash_table))
+    struct.pack_into('<II', header, 0x400 + 0xE4, 0x800 + len(hash_table), len(dir_table))
+    struct.pack_into('<I', header, 0x400 + 0x12C, 1)
+    index_path.write_bytes(header + hash_table + dir_table)
+    return pack_id
+
+
+def make_exh(columns: list[tuple[int, int]], data_length: int, blocks: list[tuple[int, int]], langs: list[int], variant=1, row_count=0):
+    res = struct.pack('>4s8H3I', b'EXHF', 3, data_length, len(columns), len(blocks), len(langs), 0, variant, 0, row_count, 0, 0)
+    res += b''.join(struct.pack('>2H', t, o) for t, o in columns)
+    res += b''.join(struct.pack('>2l', start, size) for start, size in blocks)
+    res += b''.join(struct.pack('>BB', lang, 0) for lang in langs)
+    return res
+
+
+def make_exd(rows: dict[int, bytes]):
+    """
+    rows are the packed row bodies (fixed data then strings, or sub rows), the row header is added here
+    """
+    index = bytearray()
+    data = bytearray()
+    base = 0x20 + 8 * len(rows)
+    for row_id, (body, count) in rows.items():
+        index += struct.pack('>II', row_id, base + len(data))
+        data += struct.pack('>lh', len(body), count) + body
+    return struct.pack('>I2H6I', 0x45584446, 2, 0, len(index), len(data), 0, 0, 0, 0) + index + data
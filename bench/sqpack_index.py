@@ -0,0 +1,101 @@
+import argparse
+import pathlib
+import random
+import struct
+import tempfile
+import time
+
+from fpt4.utils.sqpack.pack.indexfile import Index, compute_hash_32
+from fpt4.utils.sqpack.pack.indexfile.structure import VersionInfo, IndexFileInfo, DirectoryIndexInfo, HashTableElem_Hash32, HashTableElem_Hash64
+
+
+def write_index(path: pathlib.Path, index_type: int, dirs: dict[int, list[tuple[int, int]]]):
+    # an index file of (key, packed offset) entries per directory, keys are sorted inside a directory like the game files
+    entry = struct.Struct('<QII' if index_type == 1 else '<II')
+    header = bytearray(0x800)
+    header[0:6] = b'SqPack'
+    struct.pack_into('<I', header, 0xC, 0x400)
+    hash_table = bytearray()
+    dir_table = bytearray()
+    for dir_hash, entries in sorted(dirs.items()):
+        dir_table += struct.pack('<IIII', dir_hash, 0x800 + len(hash_table), len(entries) * entry.size, 0)
+        for key, packed in sorted(entries):
+            hash_table += entry.pack(key, packed, 0) if index_type == 1 else entry.pack(key, packed)
+    struct.pack_into('<IIII', header, 0x400, 0x400, 1, 0x800, len(hash_table))
+    struct.pack_into('<II', header, 0x400 + 0xE4, 0x800 + len(hash_table), len(dir_table))
+    struct.pack_into('<I', header, 0x400 + 0x12C, index_type)
+    path.write_bytes(header + hash_table + dir_table)
+
+
+def make_paths(rnd: random.Random, count: int):
+    dir_paths = [b'bg/ffxiv/dir_%d/level' % i for i in range(max(count // 100, 1))]
+    return list({b'%s/file_%d.sgb' % (rnd.choice(dir_paths), rnd.getrandbits(32)): None for _ in range(count)})
+
+
+def legacy_load(path: pathlib.Path):
+    # the per entry ctypes read of Index before the numpy tables, returns key => block_offset like its files dict
+    files = {}
+    with open(path, 'rb') as stream:
+        VersionInfo.from_buffer_copy(stream.read(VersionInfo._size_))
+        info = IndexFileInfo.from_buffer_copy(stream.read(IndexFileInfo._size_))
+        is_index1 = info.index_type != 2
+        data_type = HashTableElem_Hash64 if is_index1 else HashTableElem_Hash32
+        stream.seek(info.dir_index_data_offset)
+        dirs = [DirectoryIndexInfo.from_buffer_copy(stream.read(DirectoryIndexInfo._size_)) for _ in range(info.dir_index_data_size // DirectoryIndexInfo._size_)]
+        for _dir in dirs:
+            stream.seek(_dir.offset)
+            dir_path = b'dir_hash_%d' % _dir.dir_hash
+            for _ in range(_dir.size // data_type._size_):
+                elem = data_type.from_buffer_copy(stream.read(data_type._size_))
+                key = elem.hash_hoge64 if is_index1 else elem.hash_hoge32
+                file_hash = key & 0xFFFFFFFF
+                b'%s/file_hash_%d' % (dir_path, file_hash)
+                files[key] = elem.block_offset
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description='compare index loading and get_file_fast on synthetic index and index2 files')
+    parser.add_argument('--files', type=int, default=200000)
+    parser.add_argument('--lookups', type=int, default=10000)
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    directory = pathlib.Path(tempfile.mkdtemp(prefix='sqpack_index_bench_'))
+    paths = make_paths(rnd, args.files)
+    index1, index2 = {}, {}
+    for i, path in enumerate(paths):
+        dir_path, base_name = path.rsplit(b'/', 1)
+        dir_hash = compute_hash_32(dir_path)
+        index1.setdefault(dir_hash, []).append((dir_hash << 32 | compute_hash_32(base_name), i << 4))
+        index2.setdefault(i & 0xff, []).append((compute_hash_32(path), i << 4))
+    write_index(directory / 'bench.index', 1, index1)
+    write_index(directory / 'bench.index2', 2, index2)
+    lookups = rnd.sample(paths, min(args.lookups, len(paths))) + [b'bg/ffxiv/missing/file.sgb']
+
+    for name, index_type in ('bench.index', 1), ('bench.index2', 2):
+        path = directory / name
+        start = time.perf_counter()
+        legacy = legacy_load(path)
+        legacy_used = time.perf_counter() - start
+        start = time.perf_counter()
+        index = Index(None, path, directory / 'cache')
+        used = time.perf_counter() - start
+        start = time.perf_counter()
+        Index(None, path, directory / 'cache')
+        cached_used = time.perf_counter() - start
+        print(f'{name:12}: {len(legacy)} files, legacy load {legacy_used * 1000:.1f}ms, numpy load {used * 1000:.1f}ms, from cache {cached_used * 1000:.1f}ms')
+
+        if index_type == 1:
+            keys = [compute_hash_32(p.rsplit(b'/', 1)[0]) << 32 | compute_hash_32(p.rsplit(b'/', 1)[1]) for p in lookups]
+        else:
+            keys = [compute_hash_32(p) for p in lookups]
+        start = time.perf_counter()
+        found = [index.get_file_fast(p) for p in lookups]
+        used = time.perf_counter() - start
+        same = [f and f.info.block_offset for f in found] == [legacy.get(k) for k in keys]
+        print(f'{name:12}: {len(lookups)} get_file_fast in {used * 1000:.2f}ms, {len(index._files or ())} entries built, {"ok" if same else "MISMATCH"}')
+
+
+if __name__ == '__main__':
+    main()
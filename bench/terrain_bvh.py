@@ -0,0 +1,81 @@
+import argparse
+import time
+
+import numpy as np
+
+from fpt4.utils.parse.terrain.terrain_mesh.bvh import MeshBVH
+
+
+def make_ground(rnd: np.random.Generator, size: int, extent=200.):
+    # wavy height field with scattered rocks, about like a zone collision mesh
+    xs, zs = np.meshgrid(np.linspace(-extent / 2, extent / 2, size), np.linspace(-extent / 2, extent / 2, size))
+    ys = np.sin(xs / 10) * 3 + np.cos(zs / 7) * 2
+    vertices = np.stack([xs, ys, zs], -1).reshape(-1, 3)
+    idx = np.arange(size * size).reshape(size, size)
+    a, b, c, d = idx[:-1, :-1].ravel(), idx[:-1, 1:].ravel(), idx[1:, :-1].ravel(), idx[1:, 1:].ravel()
+    triangles = [np.stack([a, b, c], 1), np.stack([b, d, c], 1)]
+    rocks = rnd.uniform(-extent / 2, extent / 2, (size * 4, 1, 3)) * (1, 0, 1) + rnd.uniform(-2, 2, (size * 4, 3, 3))
+    triangles.append(len(vertices) + np.arange(rocks.size // 3).reshape(-1, 3))
+    return np.concatenate([vertices, rocks.reshape(-1, 3)]), np.concatenate(triangles)
+
+
+def brute_cast(corners: np.ndarray, origins: np.ndarray, directions: np.ndarray):
+    # every triangle for every ray, one ray at a time
+    e1, e2 = corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]
+    res = np.full(len(origins), np.inf)
+    for i, (o, d) in enumerate(zip(origins, directions / np.linalg.norm(directions, axis=1, keepdims=True))):
+        p = np.cross(d, e2)
+        det = (e1 * p).sum(1)
+        with np.errstate(all='ignore'):
+            inv = 1 / det
+            s = o - corners[:, 0]
+            u = (s * p).sum(1) * inv
+            q = np.cross(s, e1)
+            v = (d * q).sum(1) * inv
+            t = (e2 * q).sum(1) * inv
+        ok = (np.abs(det) > 1e-7) & (u >= 0) & (v >= 0) & (u + v <= 1) & (t >= 0)
+        if ok.any(): res[i] = t[ok].min()
+    return res
+
+
+def main():
+    parser = argparse.ArgumentParser(description='batched ray cast and height queries of MeshBVH against brute force')
+    parser.add_argument('--size', type=int, default=150)
+    parser.add_argument('--points', type=int, default=1000)
+    args = parser.parse_args()
+    rnd = np.random.default_rng(0)
+
+    vertices, triangles = make_ground(rnd, args.size)
+    start = time.perf_counter()
+    bvh = MeshBVH(vertices, triangles)
+    print(f'build: {len(triangles)} triangles, {len(bvh.levels)} levels in {(time.perf_counter() - start) * 1000:.2f}ms')
+
+    xz = rnd.uniform(-99, 99, (args.points, 2))
+    start = time.perf_counter()
+    heights = bvh.height_at(xz)
+    used = time.perf_counter() - start
+    check = min(args.points, 200)
+    origins = np.stack([xz[:check, 0], np.full(check, 100.), xz[:check, 1]], 1)
+    expected = 100. - brute_cast(bvh.corners, origins, np.tile((0., -1., 0.), (check, 1)))
+    ok = np.allclose(heights[:check], expected, equal_nan=True)
+    print(f'height_at: {args.points} points in {used * 1000:.2f}ms ({used / args.points * 1e6:.1f}us/point), {"ok" if ok else "MISMATCH"}')
+
+    origins = rnd.uniform(-120, 120, (args.points, 3)) * (1, .1, 1)
+    directions = rnd.normal(size=(args.points, 3))
+    start = time.perf_counter()
+    distances, _ = bvh.ray_cast(origins, directions)
+    used = time.perf_counter() - start
+    start = time.perf_counter()
+    expected = brute_cast(bvh.corners, origins[:check], directions[:check])
+    brute_used = (time.perf_counter() - start) / check * args.points
+    ok = np.allclose(distances[:check], expected)
+    print(f'ray_cast: {args.points} rays in {used * 1000:.2f}ms, brute force about {brute_used * 1000:.0f}ms, {"ok" if ok else "MISMATCH"}')
+
+    starts = np.stack([xz[:, 0], heights + 1.8, xz[:, 1]], 1)
+    start = time.perf_counter()
+    blocked = bvh.segment_hit(starts, starts[::-1])
+    print(f'segment_hit: {args.points} segments in {(time.perf_counter() - start) * 1000:.2f}ms, {blocked.mean() * 100:.0f}% blocked')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+import argparse
+import io
+import pathlib
+import random
+import struct
+import tempfile
+import time
+
+from fpt4.utils.sqpack.pack import PackManager
+from fpt4.utils.sqpack.pack.file.texture_file import processors
+from .sqpack_data import pack_texture_file, texture_header, write_pack
+
+
+# the per pixel loops used before, returning raw bytes instead of a pil image
+def legacy_R5G5B5A1_UNorm(src: bytes, width: int, height: int):
+    with io.BytesIO() as dst:
+        for v, in struct.iter_unpack('H', src[:width * height * 2]):
+            a = v & 0x8000
+            r = v & 0x7C00
+            g = v & 0x03E0
+            b = v & 0x001F
+            rgb = ((r << 9) | (g << 6) | (b << 3))
+            argb_value = (a * 0x1FE00 | rgb | ((rgb >> 5) & 0x070707))
+            dst.write(bytes(((argb_value >> 16) & 0xFF, (argb_value >> 8) & 0xFF, argb_value & 0xFF, (argb_value >> 24) & 0xFF)))
+        return dst.getvalue()
+
+
+def legacy_R4G4B4A4_UNorm(src: bytes, width: int, height: int):
+    with io.BytesIO() as dst:
+        for v, in struct.iter_unpack('H', src[:width * height * 2]):
+            dst.write(bytes((((v >> 8) & 0x0F) << 4, ((v >> 4) & 0x0F) << 4, (v & 0x0F) << 4, ((v >> 12) & 0x0F) << 4)))
+        return dst.getvalue()
+
+
+def legacy_R8G8B8A8_UNorm(src: bytes, width: int, height: int):
+    with io.BytesIO() as dst:
+        for v, in struct.iter_unpack('<I', src[:width * height * 4]):
+            dst.write(bytes(((v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF, (v >> 24) & 0xFF)))
+        return dst.getvalue()
+
+
+def legacy_L8_UNorm(src: bytes, width: int, height: int):
+    with io.BytesIO() as dst:
+        for v in src[:width * height]:
+            r = v & 0xE0
+            g = v & 0x1C
+            b = v & 0x03
+            dst.write(bytes(((r | (r << 3) | (r << 6)) & 0xFF, (g | (g << 3) | (g << 6)) & 0xFF, (b | (b << 2) | (b << 4) | (b << 6)) & 0xFF)))
+        return dst.getvalue()
+
+
+formats = {
+    'R5G5B5A1_UNorm': (0x1441, 2, legacy_R5G5B5A1_UNorm, processors.decode_R5G5B5A1_UNorm),
+    'R4G4B4A4_UNorm': (0x1440, 2, legacy_R4G4B4A4_UNorm, processors.decode_R4G4B4A4_UNorm),
+    'R8G8B8A8_UNorm': (0x1450, 4, legacy_R8G8B8A8_UNorm, processors.decode_R8G8B8A8_UNorm),
+    'L8_UNorm': (0x1130, 1, legacy_L8_UNorm, processors.decode_L8_UNorm),
+}
+
+
+def best_of(func, repeat):
+    best = float('inf')
+    res = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        res = func()
+        best = min(best, time.perf_counter() - start)
+    return best, res
+
+
+def main():
+    parser = argparse.ArgumentParser(description='compare per pixel and numpy texture decoding, and full vs top lod reads')
+    parser.add_argument('--size', type=int, default=1024, help='texture width and height')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--skip-legacy', action='store_true')
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    size = args.size
+    mip_count = size.bit_length() - 2
+    files = {}
+    mip_files = {}  # a lod block for every mip
+    for name, (fmt, bpp, legacy, decoder) in formats.items():
+        src = rnd.randbytes(size * size * bpp)
+        if not args.skip_legacy:
+            legacy_used, expected = best_of(lambda: legacy(src, size, size), 1)
+        vector_used, res = best_of(lambda: decoder(src, size, size), args.repeat)
+        line = f'{name:>15} {size}x{size}: numpy {vector_used * 1000:8.2f}ms'
+        if not args.skip_legacy:
+            line += f', legacy {legacy_used * 1000:9.2f}ms ({legacy_used / vector_used:6.0f}x), {"ok" if res.tobytes() == expected else "MISMATCH"}'
+        print(line)
+        mips = [rnd.randbytes(max(size >> i, 1) ** 2 * bpp) for i in range(mip_count)]
+        files[b'ui/bench/%s.tex' % name.lower().replace('_', '').encode()] = pack_texture_file(texture_header(fmt, size, size, mip_count), [mips[0], mips[1], b''.join(mips[2:])])
+        mip_files[path := b'ui/bench/%s_mips.tex' % name.lower().replace('_', '').encode()] = mips
+        files[path] = pack_texture_file(texture_header(fmt, size, size, mip_count), mips)
+
+    data_directory = pathlib.Path(tempfile.mkdtemp(prefix='sqpack_bench_'))
+    write_pack(data_directory, b'ui', files)
+    pack_mgr = PackManager(data_directory, cache_size=0)  # nothing is kept, every read decodes again
+    for path in files:
+        full_used, full = best_of(lambda: pack_mgr.get_texture_file(path).data_buffer, args.repeat)
+        top_used, top = best_of(lambda: pack_mgr.get_texture_file(path).get_lod_buffer(0), args.repeat)
+        arr_used, arr = best_of(lambda: pack_mgr.get_texture_file(path).get_array(), args.repeat)
+        ok = full[:len(top)] == top and arr.shape[:2] == (size, size)
+        print(
+            f'{path.decode():>30}: all lods {full_used * 1000:7.2f}ms ({len(full)} bytes), '
+            f'top lod {top_used * 1000:7.2f}ms ({len(top)} bytes), top lod to array {arr_used * 1000:7.2f}ms, {"ok" if ok else "MISMATCH"}'
+        )
+    for path, mips in mip_files.items():
+        file = pack_mgr.get_texture_file(path)
+        ok = all(
+            file.get_lod_buffer(lod) == mip and file.get_array(lod).shape[:2] == (max(size >> lod, 1),) * 2
+            for lod, mip in enumerate(mips)
+        )
+        print(f'{path.decode():>30}: {len(mips)} lods, every lod buffer and array size {"ok" if ok else "MISMATCH"}')
+
+
+if __name__ == '__main__':
+    main()
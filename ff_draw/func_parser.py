@@ -1,5 +1,8 @@
+import ast
+import collections
 import logging
 import math
+import types
 import typing
 from functools import cache
 
@@ -18,6 +21,7 @@ class ResMap:
         self.counter = 0
         self.res_list = {}
         self.enable_eval = enable_eval
+        self.cacheable = True
 
     def add_res(self, data):
         k = f'res_{self.counter}'
@@ -56,6 +60,7 @@ def make_value(parser: 'FuncParser', value, res: ResMap, args: dict[str, typing.
             else:
                 return '(0)'
         case 'now':
+            res.cacheable = False
             return "(" + res.add_res(parser.parse_value(value.get('value'), args)) + ")"
         case 'arg':
             return args[value.get('name', 'v')]
@@ -64,7 +69,7 @@ def make_value(parser: 'FuncParser', value, res: ResMap, args: dict[str, typing.
         case 'is_hit':
             return f'(int(omen.is_hit({make_value(parser, value.get("pos"), res, args)})))'
         case 'count_hit_actor':
-            return f'(sum(int(omen.is_hit(_a.pos)) for _a in (main.mem.actor_table.get_actor_by_id(_i) for _i in ({make_value(parser, value.get("ids"), res, args)})) if _a))'
+            return f'(omen.hit_count([_a.pos for _a in (main.mem.actor_table.get_actor_by_id(_i) for _i in ({make_value(parser, value.get("ids"), res, args)})) if _a]))'
         case 'progress':
             return "(omen.progress)"
         case 'destroy_omen':
@@ -159,6 +164,182 @@ def optimize_code(code: str):
     return code
 
 
+_not_const = object()
+pure_funcs = {
+    'int', 'float', 'abs', 'min', 'max', 'round',
+    'math.radians', 'math.degrees', 'math.sin', 'math.cos', 'math.tan', 'math.atan2', 'math.sqrt',
+    'glm.vec1', 'glm.vec2', 'glm.vec3', 'glm.vec4',
+}
+glm_vec_funcs = {'glm.vec1', 'glm.vec2', 'glm.vec3', 'glm.vec4'}
+
+
+def dotted_name(node: ast.AST):
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name): return None
+    parts.append(node.id)
+    return '.'.join(reversed(parts))
+
+
+def is_literal(value):
+    if value is None or isinstance(value, (bool, int, float, str)): return True
+    return isinstance(value, tuple) and all(map(is_literal, value))
+
+
+def structural_key(value):
+    # hashable and type strict (1 / 1.0 / True are different) key of a json like value, TypeError if not supported
+    if value is None or isinstance(value, (bool, int, float, str)): return type(value).__name__, value
+    if isinstance(value, (list, tuple)): return type(value).__name__, tuple(map(structural_key, value))
+    if isinstance(value, dict): return 'dict', tuple(sorted((k, structural_key(v)) for k, v in value.items()))
+    raise TypeError(f'unsupported type {type(value)}')
+
+
+class ConstantFolder(ast.NodeTransformer):
+    def __init__(self, res: ResMap, name_space: dict):
+        self.res = res
+        self.name_space = name_space
+
+    def const(self, node):
+        if isinstance(node, ast.Constant): return node.value
+        if isinstance(node, ast.Name) and node.id in self.res.res_list:
+            if not isinstance(v := self.res.res_list[node.id], types.CodeType): return v
+        return _not_const
+
+    def all_const(self, nodes):
+        return all(self.const(n) is not _not_const for n in nodes)
+
+    def try_eval(self, node):
+        try:
+            return eval(compile(ast.fix_missing_locations(ast.Expression(node)), '<fold>', 'eval'), self.res.res_list | self.name_space)
+        except Exception:  # keep it to raise at runtime
+            return _not_const
+
+    def fold(self, node):
+        value = self.try_eval(node)
+        return ast.copy_location(ast.Constant(value), node) if value is not _not_const and is_literal(value) else node
+
+    def visit_Attribute(self, node):
+        if dotted_name(node) == 'math.pi': return ast.copy_location(ast.Constant(math.pi), node)
+        return self.generic_visit(node)
+
+    def visit_Tuple(self, node):
+        self.generic_visit(node)
+        if isinstance(node.ctx, ast.Load) and self.all_const(node.elts): return self.fold(node)
+        return node
+
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        return self.fold(node) if self.all_const((node.left, node.right)) else node
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        return self.fold(node) if self.all_const((node.operand,)) else node
+
+    def visit_Compare(self, node):
+        self.generic_visit(node)
+        return self.fold(node) if self.all_const((node.left, *node.comparators)) else node
+
+    def visit_IfExp(self, node):
+        self.generic_visit(node)
+        if (cond := self.const(node.test)) is not _not_const:
+            return node.body if cond else node.orelse
+        return node
+
+    def visit_Call(self, node):
+        self.generic_visit(node)
+        if any(isinstance(a, ast.Starred) for a in node.args): return node
+        func_name = dotted_name(node.func)
+        if func_name in pure_funcs:
+            if self.all_const(node.args) and self.all_const(k.value for k in node.keywords):
+                return self.fold(node)
+        elif func_name == 'safe_lazy' and node.args and dotted_name(node.args[0]) in glm_vec_funcs and self.all_const(node.args[1:]):
+            # safe_lazy(glm.vecN, *const) => glm.vecN(*const) if it does not raise, still a new vector for every call
+            vec_call = ast.copy_location(ast.Call(func=node.args[0], args=node.args[1:], keywords=[]), node)
+            if self.try_eval(vec_call) is not _not_const: return vec_call
+        elif isinstance(node.func, ast.Attribute) and node.func.attr == 'format' and isinstance(self.const(node.func.value), str):
+            if self.all_const(node.args) and not node.keywords:
+                return self.fold(node)
+        return node
+
+
+class ActorLookupSlots:
+    # actor lookups shared by all the values of a command, evaluated at most once per omen per frame,
+    # the per omen cache is split by slots since slot indexes of different commands overlap
+    def __init__(self, get_frame):
+        self.get_frame = get_frame
+        self.keys = {}
+        self.funcs = []
+
+    def add(self, key, func):
+        if (i := self.keys.get(key)) is None:
+            self.keys[key] = i = len(self.funcs)
+            self.funcs.append(func)
+        return i
+
+    def get(self, omen, i):
+        frame = self.get_frame()
+        cache = getattr(omen, '_actor_lookup_cache', None)
+        if cache is None or cache[0] != frame:
+            omen._actor_lookup_cache = cache = frame, {}
+        if (values := cache[1].get(self)) is None:
+            cache[1][self] = values = {}
+        try:
+            return values[i]
+        except KeyError:
+            values[i] = v = self.funcs[i](omen)
+            return v
+
+
+def make_lambda(body: ast.expr):
+    return ast.fix_missing_locations(ast.Expression(ast.Lambda(
+        args=ast.arguments(posonlyargs=[], args=[ast.arg(arg='omen')], kwonlyargs=[], kw_defaults=[], defaults=[]),
+        body=body,
+    )))
+
+
+class ActorLookupCse(ast.NodeTransformer):
+    def __init__(self, slots: ActorLookupSlots, name_space: dict):
+        self.slots = slots
+        self.name_space = name_space
+        self.free_names = set(name_space) | {'omen', '_cse'}
+
+    def is_free(self, node):
+        return all(n.id in self.free_names for n in ast.walk(node) if isinstance(n, ast.Name))
+
+    def to_slot(self, node):
+        func = eval(compile(make_lambda(node), '<actor_lookup>', 'eval'), self.name_space)
+        i = self.slots.add(ast.dump(node), func)
+        return ast.copy_location(ast.Call(
+            func=ast.Name(id='_cse', ctx=ast.Load()),
+            args=[ast.Name(id='omen', ctx=ast.Load()), ast.Constant(i)],
+            keywords=[],
+        ), node)
+
+    def visit_Call(self, node):
+        self.generic_visit(node)
+        if dotted_name(node.func) == 'main.mem.actor_table.get_actor_by_id' and len(node.args) == 1 and not node.keywords and self.is_free(node.args[0]):
+            return self.to_slot(node)
+        return node
+
+    def visit_Attribute(self, node):
+        if dotted_name(node) == 'main.mem.actor_table.me': return self.to_slot(node)
+        return self.generic_visit(node)
+
+
+class CompileContext:
+    # shared by all values of one command so that res names are unique and actor lookups can be shared
+    def __init__(self, parser: 'FuncParser', with_cse=True):
+        self.res = ResMap(enable_eval=parser.enable_eval)
+        self.slots = ActorLookupSlots(parser.get_frame) if with_cse else None
+
+    def name_space(self, parser: 'FuncParser'):
+        name_space = self.res.res_list | parser.parse_name_space
+        if self.slots: name_space['_cse'] = self.slots.get
+        return name_space
+
+
 action_type_to_shape_default = {
     2: 0x10000,  # circle
     3: 0x50000 | 90,  # fan
@@ -174,6 +355,14 @@ action_type_to_shape_default = {
 }
 
 
+label_fields = (
+    ('label', 'label', ''),
+    ('label_color', 'label_color', [0, 0, 0]),
+    ('label_scale', 'label_scale', 1),
+    ('label_at', 'label_at', 1),
+)
+
+
 class FuncParser:
     logger = logging.getLogger('FuncParser')
 
@@ -184,6 +373,8 @@ class FuncParser:
             'glm': glm, 'main': self.main, 'safe_lazy': safe_lazy,
             'player_by_distance_idx': player_by_distance_idx, 'action_shape_scale': self.action_shape_scale, 'math': math
         }
+        self.program_cache = collections.OrderedDict()
+        self.program_cache_size = 1024
         self.compile_config = self.main.config.setdefault('compile', {})
         self.print_compile = self.compile_config.setdefault('print_debug', {}).setdefault('enable', False)
         self.enable_eval = self.compile_config.setdefault('enable_eval', False)
@@ -201,15 +392,61 @@ class FuncParser:
             scale = glm.vec3(action.effect_range, 1, action.effect_range)
         return shape, scale
 
-    def parse_value_lambda(self, value, args):
-        code = optimize_code(make_value(self, value, res := ResMap(enable_eval=self.enable_eval), args))
-        if self.print_compile: self.logger.debug(f'compile_debug:{value}=>{code}')
-        return eval(f'lambda omen:({code})', res.res_list | self.parse_name_space)
+    def get_frame(self):
+        return self.main.gui.timer.this_frame
+
+    def get_program(self, key):
+        if key is not None and (program := self.program_cache.get(key)) is not None:
+            self.program_cache.move_to_end(key)
+            return program
+
+    def cache_program(self, key, program):
+        if key is None: return
+        if len(self.program_cache) >= self.program_cache_size:
+            self.program_cache.popitem(last=False)
+        self.program_cache[key] = program
+
+    def compile_value(self, value, args, ctx: CompileContext):
+        code = optimize_code(make_value(self, value, ctx.res, args))
+        tree = ast.parse(code, mode='eval')
+        tree = ConstantFolder(ctx.res, self.parse_name_space).visit(tree)
+        if ctx.slots is not None:
+            tree = ActorLookupCse(ctx.slots, ctx.name_space(self)).visit(tree)
+        ast.fix_missing_locations(tree)
+        if self.print_compile: self.logger.debug(f'compile_debug:{value}=>{code}=>{ast.unparse(tree)}')
+        return tree
+
+    def parse_value_lambda(self, value, args, ctx: CompileContext = None):
+        if ctx is None: ctx = CompileContext(self)
+        tree = self.compile_value(value, args, ctx)
+        return eval(compile(make_lambda(tree.body), '<func_parser>', 'eval'), ctx.name_space(self))
 
     def parse_value(self, value, args):
-        code = optimize_code(make_value(self, value, res := ResMap(enable_eval=self.enable_eval), args))
-        if self.print_compile: self.logger.debug(f'compile_debug:{value}=>{code}')
-        return eval(code, res.res_list | self.parse_name_space)
+        try:
+            key = 'value', structural_key((value, args))
+        except TypeError:
+            key = None
+        if program := self.get_program(key):
+            code, name_space = program
+        else:
+            ctx = CompileContext(self, with_cse=False)
+            code = compile(self.compile_value(value, args, ctx), '<func_parser>', 'eval')
+            name_space = ctx.name_space(self)
+            if ctx.res.cacheable: self.cache_program(key, (code, name_space))
+        return eval(code, name_space)
+
+    def parse_fields(self, command, args, fields: typing.Iterable[tuple[str, str, typing.Any]]) -> dict:
+        # compile (param_name, command_key, default) of a command, identical command and args reuse the compiled lambdas
+        try:
+            key = 'fields', structural_key((command, args))
+        except TypeError:
+            key = None
+        if program := self.get_program(key):
+            return program
+        ctx = CompileContext(self)
+        program = {name: self.parse_value_lambda(command.get(k, default), args, ctx) for name, k, default in fields}
+        if ctx.res.cacheable: self.cache_program(key, program)
+        return program
 
     def parse_func(self, command, args=None):
         assert isinstance(command, dict)
@@ -220,50 +457,36 @@ class FuncParser:
             case 'foreach':
                 return [self.parse_func(command.get('func'), args | {command.get('name', 'v'): v}) for v in self.parse_value(command.get('values'), args)]
             case 'add_line':
-                width = self.parse_value_lambda(command.get('width', 3), args)
-                color = self.parse_value_lambda(command.get('color'), args)
-                src = self.parse_value_lambda(command.get('src'), args)
-                dst = self.parse_value_lambda(command.get('dst'), args)
                 return omen_module.Line(
                     main=self.main,
-                    src=src, dst=dst,
-                    line_color=color,
-                    line_width=width,
-                    label=self.parse_value_lambda(command.get('label', ''), args),
-                    label_color=self.parse_value_lambda(command.get('label_color', [0, 0, 0]), args),
-                    label_scale=self.parse_value_lambda(command.get('label_scale', 1), args),
-                    label_at=self.parse_value_lambda(command.get('label_at', 1), args),
+                    **self.parse_fields(command, args, (
+                        ('src', 'src', None),
+                        ('dst', 'dst', None),
+                        ('line_color', 'color', None),
+                        ('line_width', 'width', 3),
+                        *label_fields,
+                    )),
                     duration=command.get('duration', 0),
                 ).oid
             case 'add_omen':
+                fields = [('pos', 'pos', None), ('facing', 'facing', None), ('line_width', 'line_width', 3), *label_fields]
+                kwargs = {}
                 if 'shape_scale' in command:
-                    shape = scale = None
-                    shape_scale = self.parse_value_lambda(command.get('shape_scale'), args)
+                    kwargs['shape'] = kwargs['scale'] = None
+                    fields.append(('shape_scale', 'shape_scale', None))
                 else:
-                    shape = self.parse_value_lambda(command.get('shape'), args)
-                    scale = self.parse_value_lambda(command.get('scale'), args)
-                    shape_scale = None
+                    kwargs['shape_scale'] = None
+                    fields += (('shape', 'shape', None), ('scale', 'scale', None))
                 if 'color' in command:
-                    surface_color = line_color = None
-                    surface_line = self.parse_value_lambda(command.get('color'), args)
+                    kwargs['surface_color'] = kwargs['line_color'] = None
+                    fields.append(('surface_line_color', 'color', None))
                 else:
-                    surface_color = self.parse_value_lambda(command.get('surface'), args)
-                    line_color = self.parse_value_lambda(command.get('line'), args)
-                    surface_line = None
-
+                    kwargs['surface_line_color'] = None
+                    fields += (('surface_color', 'surface', None), ('line_color', 'line', None))
                 return omen_module.BaseOmen(
                     main=self.main,
-                    pos=self.parse_value_lambda(command.get('pos'), args),
-                    scale=scale, shape=shape, shape_scale=shape_scale,
-                    facing=self.parse_value_lambda(command.get('facing'), args),
-                    surface_color=surface_color,
-                    line_color=line_color,
-                    line_width=self.parse_value_lambda(command.get('line_width', 3), args),
-                    surface_line_color=surface_line,
-                    label=self.parse_value_lambda(command.get('label', ''), args),
-                    label_color=self.parse_value_lambda(command.get('label_color', [0, 0, 0]), args),
-                    label_scale=self.parse_value_lambda(command.get('label_scale', 1), args),
-                    label_at=self.parse_value_lambda(command.get('label_at', 1), args),
+                    **self.parse_fields(command, args, fields),
+                    **kwargs,
                     duration=command.get('duration', 0),
                 ).oid
             case 'destroy_omen':
@@ -16,7 +16,7 @@ import glm
 import glfw
 import imgui
 from . import window, view, text, panel as m_panel, default_style, game_image, game_window_manager
-from .utils import common_shader, models
+from .utils import common_shader, models, shape_batch
 
 if typing.TYPE_CHECKING:
     from ff_draw.main import FFDraw
@@ -80,6 +80,7 @@ class Drawing:
         self.main = main
         self.program = None
         self.models: models.Models | None = None
+        self.shape_batch: shape_batch.ShapeBatch | None = None
 
         self.work_thread = None
         self._view = None
@@ -91,6 +92,7 @@ class Drawing:
         self.font_size = self.cfg.setdefault('font_size', default_style.stlye_font_size)
         self.gl_src_alpha = self.cfg.setdefault('gl_src_alpha', 'GL_ONE_MINUS_SRC_ALPHA')
         self.omen_animated_in_out = self.cfg.setdefault('omen_animated_in_out', True)
+        self.batch_render = self.cfg.setdefault('batch_render', True)
         self._label_counter = 0
         self._game_image = {}  # game_image.GameImage(self)
         self.draw_update_call = set()
@@ -125,12 +127,14 @@ class Drawing:
         self.window_manager.draw_window = game_window_manager.DrawWindow(self.window_manager, self.game_hwnd)
         self.program = common_shader.get_common_shader()
         self.models = models.Models()
+        self.shape_batch = shape_batch.ShapeBatch(common_shader.get_instanced_shader())
 
     def _update(self):
         self._frame_cache.clear()
         self._label_counter = 0
         self._view = view.View()
         self._view.projection_view, self._view.screen_size = self.main.mem.load_screen()
+        self.main.mem.actor_table.begin_frame()
         self.timer.update()
         for k, i in tuple(self._game_image.items()):
             if not isinstance(k, int) and k not in self.window_manager.windows:
@@ -199,6 +203,9 @@ class Drawing:
                 _shape = self.models.arrow
             case s:
                 raise Exception(f"unknown shape {shape:#X} - {s}")
+        if self.batch_render:
+            self.shape_batch.add(_shape, transform, surface_color, line_color, line_width, point_color, point_size)
+            return
         _shape.render(
             program=self.program,
             mvp=self.get_view().projection_view,
@@ -210,6 +217,9 @@ class Drawing:
             point_size=point_size
         )
 
+    def flush_3d_shapes(self):
+        self.shape_batch.flush(self.get_view().projection_view)
+
     def render_text(self, string, text_pos: glm.vec2, scale=1, color=(1, 1, 1), at=text.TextPosition.left_bottom):
         width, height = imgui.calc_text_size(string)
         text_size = glm.vec2(width + 18, height + 16)
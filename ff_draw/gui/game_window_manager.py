@@ -70,13 +70,16 @@ class DrawWindow:
         self.is_front = win32gui.GetForegroundWindow() in (0, self.game_hwnd, self.hwnd)
         if gui.always_draw or self.is_front:
             window.set_window_cover(self.window, self.game_hwnd)
-            for draw_func in gui.draw_update_call.copy():
-                try:
-                    draw_func(gui.main)
-                except Exception as e:
-                    gui.logger.error(f"draw_func error, func will be remove:", exc_info=e)
-                    gui.draw_update_call.remove(draw_func)
-                    raise
+            try:
+                for draw_func in gui.draw_update_call.copy():
+                    try:
+                        draw_func(gui.main)
+                    except Exception as e:
+                        gui.logger.error(f"draw_func error, func will be remove:", exc_info=e)
+                        gui.draw_update_call.remove(draw_func)
+                        raise
+            finally:  # shapes added before a failing draw func must not leak into the next frame
+                gui.flush_3d_shapes()
         else:
             gl.glClearColor(0, 0, 0, 0)
             gl.glClear(gl.GL_COLOR_BUFFER_BIT)
@@ -52,6 +52,7 @@ Proxy_port = i18n.reg(en='port', zh='端口')
 Test = i18n.reg(en='test', zh='测试')
 Omen_animated_in_out = i18n.reg(en='Animated in/out', zh='动画进出')
 Always_drawing = i18n.reg(en='Always drawing', zh='始终绘制')
+Batch_render = i18n.reg(en='Batch render', zh='批量绘制')
 Window_Float = i18n.reg(en='Window Float', zh='窗口锁定')
 Sniffer = i18n.reg(en='Sniffer', zh='日志输出')
 Func_parser = i18n.reg(en='Func parser', zh='函数解析')
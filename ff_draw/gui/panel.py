@@ -366,6 +366,12 @@ class FFDPanel:
             if clicked:
                 gui.cfg['always_draw'] = gui.always_draw
                 self.main.save_config()
+            clicked, gui.batch_render = imgui.checkbox(i18n(Batch_render), gui.batch_render)
+            if clicked:
+                gui.cfg['batch_render'] = gui.batch_render
+                self.main.save_config()
+            if gui.batch_render and gui.shape_batch:
+                imgui.text(f'{gui.shape_batch.last_instances} shapes in {gui.shape_batch.last_draw_calls} draw calls')
             if gui.window_manager.draw_window:
                 w = gui.window_manager.draw_window.window
                 clicked, new_val = imgui.checkbox(i18n(Window_Float), glfw.get_window_attrib(w, glfw.FLOATING))
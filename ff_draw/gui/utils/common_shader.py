@@ -31,3 +31,35 @@ void main(){
 
 def get_common_shader():
     return loadShaders(strVS, strFS)
+
+
+strInstancedVS = """
+#version 330 core
+layout (location = 0) in vec3 aPos;
+layout (location = 1) in mat4 iTransform;
+layout (location = 5) in vec4 iColor;
+
+out vec4 vColor;
+uniform mat4 mvp;
+
+void main()
+{
+    gl_Position = mvp * iTransform * vec4(aPos, 1.0);
+    vColor = iColor;
+}
+"""
+
+strInstancedFS = """
+#version 330 core
+
+in vec4 vColor;
+out vec4 outColor;
+
+void main(){
+    outColor = vColor;
+}
+"""
+
+
+def get_instanced_shader():
+    return loadShaders(strInstancedVS, strInstancedFS)
@@ -4,6 +4,32 @@ import glm
 import OpenGL.GL as gl
 import math
 
+PART_SURFACE = 0
+PART_EDGE = 1
+PART_POINT = 2
+
+_uniform_locations = {}
+
+
+def get_uniform_locations(program, *names):
+    key = program, names
+    if (res := _uniform_locations.get(key)) is None:
+        _uniform_locations[key] = res = tuple(gl.glGetUniformLocation(program, name) for name in names)
+    return res
+
+
+def bind_instance_attributes(transform_vbo, color_vbo):
+    # per instance mat4 at location 1-4 and vec4 color at location 5, for the instanced shader
+    gl.glBindBuffer(gl.GL_ARRAY_BUFFER, transform_vbo)
+    for i in range(4):
+        gl.glEnableVertexAttribArray(1 + i)
+        gl.glVertexAttribPointer(1 + i, 4, gl.GL_FLOAT, gl.GL_FALSE, 64, c_void_p(16 * i))
+        gl.glVertexAttribDivisor(1 + i, 1)
+    gl.glBindBuffer(gl.GL_ARRAY_BUFFER, color_vbo)
+    gl.glEnableVertexAttribArray(5)
+    gl.glVertexAttribPointer(5, 4, gl.GL_FLOAT, gl.GL_FALSE, 0, None)
+    gl.glVertexAttribDivisor(5, 1)
+
 
 class BaseModel3d:
     _surface_vertices = []
@@ -30,6 +56,8 @@ class BaseModel3d:
         gl.glBufferData(gl.GL_ARRAY_BUFFER, sizeof(data), data, gl.GL_STATIC_DRAW)
         gl.glEnableVertexAttribArray(0)
         gl.glVertexAttribPointer(0, 3, gl.GL_FLOAT, gl.GL_FALSE, 0, None)
+        self.instance_transform_vbo, self.instance_color_vbo = gl.glGenBuffers(2)
+        bind_instance_attributes(self.instance_transform_vbo, self.instance_color_vbo)
 
         gl.glBindVertexArray(0)
 
@@ -45,18 +73,12 @@ class BaseModel3d:
         gl.glPushMatrix()
         gl.glUseProgram(program)
 
-        gl.glUniformMatrix4fv(
-            gl.glGetUniformLocation(program, "transform"),
-            1, gl.GL_FALSE, glm.value_ptr(transform)
-        )
-        gl.glUniformMatrix4fv(
-            gl.glGetUniformLocation(program, "mvp"),
-            1, gl.GL_FALSE, glm.value_ptr(mvp)
-        )
+        transform_location, mvp_location, color_location = get_uniform_locations(program, "transform", "mvp", "inColor")
+        gl.glUniformMatrix4fv(transform_location, 1, gl.GL_FALSE, glm.value_ptr(transform))
+        gl.glUniformMatrix4fv(mvp_location, 1, gl.GL_FALSE, glm.value_ptr(mvp))
 
         gl.glBindVertexArray(self.vao)
         gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.vbo)
-        color_location = gl.glGetUniformLocation(program, "inColor")
 
         if surface is not None:
             gl.glUniform4fv(color_location, 1, glm.value_ptr(surface))
@@ -85,6 +107,24 @@ class BaseModel3d:
                   point: glm.vec4, point_size: float, color_location):
         pass
 
+    def render_instanced(self, part: int, transforms: glm.array, colors: glm.array):
+        # program and mvp should be set by the caller, line width / point size too, returns the draw calls made
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.instance_transform_vbo)
+        gl.glBufferData(gl.GL_ARRAY_BUFFER, transforms.nbytes, transforms.ptr, gl.GL_STREAM_DRAW)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self.instance_color_vbo)
+        gl.glBufferData(gl.GL_ARRAY_BUFFER, colors.nbytes, colors.ptr, gl.GL_STREAM_DRAW)
+        gl.glBindVertexArray(self.vao)
+        if part == PART_SURFACE:
+            gl.glDrawArraysInstanced(self._surface_mode, *self.surface_range, len(transforms))
+        elif part == PART_EDGE:
+            gl.glDrawArraysInstanced(self._edge_mode, *self.edge_range, len(transforms))
+        elif part == PART_POINT:
+            gl.glDrawArraysInstanced(self._point_mode, *self.point_range, len(transforms))
+        return 1 + self.ex_render_instanced(part, len(transforms))
+
+    def ex_render_instanced(self, part: int, count: int) -> int:
+        return 0
+
 
 class Line(BaseModel3d):
     _edge_vertices = [
@@ -149,6 +189,7 @@ class Donut(BaseModel3d):
         gl.glBufferData(gl.GL_ARRAY_BUFFER, sizeof(data), data, gl.GL_STATIC_DRAW)
         gl.glEnableVertexAttribArray(0)
         gl.glVertexAttribPointer(0, 3, gl.GL_FLOAT, gl.GL_FALSE, 0, None)
+        bind_instance_attributes(self.instance_transform_vbo, self.instance_color_vbo)
         gl.glBindVertexArray(0)
 
     def ex_render(self,
@@ -163,6 +204,12 @@ class Donut(BaseModel3d):
             gl.glLineWidth(line_width)
             gl.glDrawArrays(self._edge_mode, *self.inner_edge_range)
 
+    def ex_render_instanced(self, part: int, count: int) -> int:
+        if part != PART_EDGE: return 0
+        gl.glBindVertexArray(self.inner_vao)
+        gl.glDrawArraysInstanced(self._edge_mode, *self.inner_edge_range, count)
+        return 1
+
 
 class Arrow(BaseModel3d):
     _surface_vertices = [
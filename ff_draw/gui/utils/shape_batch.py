@@ -0,0 +1,57 @@
+import glm
+import OpenGL.GL as gl
+
+from .models import BaseModel3d, PART_SURFACE, PART_EDGE, PART_POINT, get_uniform_locations
+
+
+class ShapeBatch:
+    # collect shapes of a frame in submission order, consecutive shapes with the same (model, parts, sizes) are drawn
+    # as one run with one instanced call per part, so only the parts inside a run are drawn part by part
+    def __init__(self, program):
+        self.program = program
+        self.runs: list[tuple[tuple, list, tuple[list, list, list]]] = []
+        self.last_draw_calls = 0
+        self.last_instances = 0
+
+    def add(
+            self,
+            model: BaseModel3d,
+            transform: glm.mat4,
+            surface: glm.vec4 = None,
+            edge: glm.vec4 = None, line_width: float = 3.0,
+            point: glm.vec4 = None, point_size: float = 5.0
+    ):
+        key = model, surface is not None, line_width if edge is not None else None, point_size if point is not None else None
+        if self.runs and self.runs[-1][0] == key:
+            _, transforms, colors = self.runs[-1]
+        else:
+            self.runs.append((key, transforms := [], colors := ([], [], [])))
+        transforms.append(transform)
+        for color, part_colors in zip((surface, edge, point), colors):
+            if color is not None: part_colors.append(color if type(color) is glm.vec4 else glm.vec4(*color))
+
+    def clear(self):
+        self.runs.clear()
+
+    def flush(self, mvp: glm.mat4):
+        self.last_draw_calls = 0
+        self.last_instances = 0
+        if not self.runs: return
+        try:
+            gl.glUseProgram(self.program)
+            mvp_location, = get_uniform_locations(self.program, "mvp")
+            gl.glUniformMatrix4fv(mvp_location, 1, gl.GL_FALSE, glm.value_ptr(mvp))
+            for (model, _, line_width, point_size), transforms, colors in self.runs:
+                transforms = glm.array(transforms)
+                for part, part_colors in zip((PART_SURFACE, PART_EDGE, PART_POINT), colors):
+                    if not part_colors: continue
+                    if part == PART_EDGE:
+                        gl.glLineWidth(line_width)
+                    elif part == PART_POINT:
+                        gl.glPointSize(point_size)
+                    self.last_draw_calls += model.render_instanced(part, transforms, glm.array(part_colors))
+                self.last_instances += len(transforms)
+            gl.glBindVertexArray(0)
+            gl.glUseProgram(0)
+        finally:
+            self.runs.clear()
@@ -68,7 +68,11 @@ class FFDraw:
         )).start()
 
         self.mem = mem.XivMem(self, pid)
-        self.sq_pack = SqPack.get(pathlib.Path(self.mem.base_module.filename.decode(self.path_encoding)).parent)
+        self.sq_pack = SqPack.get(
+            pathlib.Path(self.mem.base_module.filename.decode(self.path_encoding)).parent,
+            index_cache_directory=self.app_data_path / 'sqpack_index' if self.config.setdefault('sqpack_index_cache', True) else None,
+        )
+        self.sq_pack.pack.cache.max_size = self.config.setdefault('sqpack_cache_mb', 512) << 20
 
         self.gui = gui.Drawing(self)
         self.gui.always_draw = self.config.setdefault('gui', {}).setdefault('always_draw', False)
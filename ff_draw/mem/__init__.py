@@ -53,6 +53,11 @@ class XivMemPanel:
         if imgui.button('open'):
             os.system(f'start "" /B explorer "{mem.user_path}"')
 
+        actor_table = mem.actor_table
+        _, actor_table.use_snapshot = imgui.checkbox('actor snapshot', actor_table.use_snapshot)
+        if actor_table.use_snapshot:
+            imgui.same_line()
+            imgui.text(f'reads/frame: {actor_table.last_snapshot_reads} saved/frame: {actor_table.last_snapshot_saved_reads}')
         if me := mem.actor_table.me:
             imgui.text(f'me: {me.name}#{me.id:#x}')
             tinfo = mem.territory_info
@@ -1,5 +1,6 @@
 import ctypes
 import struct
+import threading
 import typing
 import glm
 from fpt4.utils.se_string import SeString
@@ -290,6 +291,104 @@ class Actor:
     name_id = direct_mem_property(ctypes.c_uint32)
 
 
+class snapshot_mem_property:
+    # direct_mem_property served from the snapshot bytes, read from memory if the offset is out of the snapshot
+    def __init__(self, prop: direct_mem_property):
+        self.prop = prop
+        self.size = ctypes.sizeof(prop.type)
+
+    def __get__(self, instance, owner):
+        if instance is None: return self
+        if (off := getattr(instance.offsets, self.prop.offset_key)) + self.size <= len(data := instance.snapshot_data):
+            instance.snapshot.saved_reads += 1
+            return self.prop.type.from_buffer_copy(data, off).value
+        return self.prop.__get__(instance, owner)
+
+    def __set__(self, instance, value):
+        self.prop.__set__(instance, value)
+
+
+class SnapshotActor(Actor):
+    # same interface as Actor, hot fields are read from bytes loaded once per frame
+    def __init__(self, handle, address, snapshot: 'ActorSnapshot', data: bytes):
+        super().__init__(handle, address)
+        self.snapshot = snapshot
+        self.snapshot_data = data
+
+    @property
+    def name(self):
+        off = self.offsets.name
+        data = self.snapshot_data[off:off + 68]
+        self.snapshot.saved_reads += 1
+        try:
+            data = data[:data.index(0)]
+        except ValueError:
+            pass
+        if 2 in data:
+            return str(SeString.from_buffer(bytearray(data)))
+        return data.decode('utf-8', 'ignore')
+
+    @property
+    def pos(self):
+        off = self.offsets.pos
+        self.snapshot.saved_reads += 1
+        return glm.vec3.from_bytes(self.snapshot_data[off:off + 0xc])
+
+    @property
+    def can_select(self):
+        data = self.snapshot_data
+        self.snapshot.saved_reads += 1
+        if data[self.offsets.status_flag] & 0b110 != 0b110: return False
+        return int.from_bytes(data[(off := self.offsets.hide_flag):off + 4], 'little') >> 11 == 0
+
+
+for _k, _v in direct_mem_property.obj_properties(Actor):
+    setattr(SnapshotActor, _k, snapshot_mem_property(_v))
+
+
+class ActorSnapshot:
+    # the sorted actor table and hot fields of each actor, loaded in bulk on first use
+    hot_size = 0x1F0
+
+    def __init__(self, table: 'ActorTable'):
+        self.table = table
+        self.reads = 0
+        self.saved_reads = 0
+        handle = table.handle
+        self.sorted_length = length = ny_mem.read_int(handle, table.sorted_count_address)
+        ptrs = struct.unpack(f'{length}Q', ny_mem.read_bytes(handle, table.sorted_table_address, 8 * length)) if length > 0 else ()
+        self.reads += 2
+        self.actors: list[SnapshotActor | None] = []
+        self.by_address: dict[int, SnapshotActor] = {}
+        self.by_id: dict[int, SnapshotActor] = {}
+        for ptr in ptrs:
+            if not ptr:
+                self.actors.append(None)
+                continue
+            try:
+                data = bytes(ny_mem.read_bytes(handle, ptr, self.hot_size))
+            except WinAPIError:
+                self.actors.append(None)
+                continue
+            finally:
+                self.reads += 1
+            self.actors.append(a := SnapshotActor(handle, ptr, self, data))
+            self.by_address[ptr] = a
+            if aid := int.from_bytes(data[(off := Actor.offsets.id):off + 4], 'little'):
+                self.by_id.setdefault(aid, a)
+        self.bisect_cost = max(length.bit_length(), 1) * 2  # pointer and id read per bisect step
+
+    def get_actor_by_id(self, actor_id):
+        self.saved_reads += self.bisect_cost
+        return self.by_id.get(actor_id)
+
+    @property
+    def me(self):
+        self.reads += 1
+        if a_ptr := ny_mem.read_uint64(self.table.handle, self.table.me_ptr):
+            return self.by_address.get(a_ptr) or Actor(self.table.handle, a_ptr)
+
+
 class ActorTable:
     cache: dict[int, Actor]
 
@@ -308,17 +407,51 @@ class ActorTable:
 
         self.table_size = main.scanner.find_val('81 bf ? ? ? ? * * * * 72 ? 44 89 b7')[0]
         self.use_brute_search = False
+        self.use_snapshot = True
+        self._snapshot: ActorSnapshot | None = None
+        self._snapshot_dirty = True
+        self.snapshot_thread = None
+        self.last_snapshot_reads = 0
+        self.last_snapshot_saved_reads = 0
+
+    def begin_frame(self):
+        # called once per frame by gui, the snapshot is only used in the thread that called it
+        snapshot = self._snapshot
+        self.last_snapshot_reads = snapshot.reads if snapshot else 0
+        self.last_snapshot_saved_reads = snapshot.saved_reads if snapshot else 0
+        self._snapshot = None
+        self._snapshot_dirty = True
+        self.snapshot_thread = threading.get_ident()
+
+    @property
+    def snapshot(self) -> ActorSnapshot | None:
+        if not self.use_snapshot or threading.get_ident() != self.snapshot_thread: return None
+        if self._snapshot_dirty:
+            self._snapshot_dirty = False
+            try:
+                self._snapshot = ActorSnapshot(self)
+            except WinAPIError:
+                self._snapshot = None
+        return self._snapshot
 
     def __getitem__(self, item):  # by sorted idx
+        if snapshot := self.snapshot:
+            if item < snapshot.sorted_length:
+                return snapshot.actors[item]
+            return None
         if item < self.sorted_length:
             return self.get_actor_by_sorted_idx(item)
 
     def __iter__(self):  # by sorted idx
+        if snapshot := self.snapshot:
+            yield from (a for a in snapshot.actors if a)
+            return
         for i in range(self.sorted_length):
             if a := self.get_actor_by_sorted_idx(i):
                 yield a
 
     def __len__(self):
+        if snapshot := self.snapshot: return snapshot.sorted_length
         return self.sorted_length
 
     def get_actor_by_sorted_idx(self, idx):
@@ -364,6 +497,8 @@ class ActorTable:
                 return a
 
     def get_actor_by_id(self, actor_id) -> Actor | None:
+        if not self.use_brute_search and (snapshot := self.snapshot):
+            return None if is_invalid_id(actor_id) else snapshot.get_actor_by_id(actor_id)
         return (self._get_actor_by_id_brute if self.use_brute_search else self._get_actor_by_id_bisect)(actor_id)
 
     @property
@@ -372,6 +507,7 @@ class ActorTable:
 
     @property
     def me(self):
+        if snapshot := self.snapshot: return snapshot.me
         if a_ptr := ny_mem.read_uint64(self.handle, self.me_ptr):
             return Actor(self.handle, a_ptr)
 
@@ -21,10 +21,11 @@ def _setdefault(obj, key, default):
 
 def _iter_obj_properties(owner, k):
     yield_names = set()
-    for k, v in (cls_.__dict__[k].items() for cls_ in owner.__mro__ if k in cls_.__dict__):
-        if k in yield_names: continue
-        yield_names.add(k)
-        yield k, v
+    for props in (cls_.__dict__[k] for cls_ in owner.__mro__ if k in cls_.__dict__):
+        for name, v in props.items():
+            if name in yield_names: continue
+            yield_names.add(name)
+            yield name, v
 
 
 class bit_field_property:
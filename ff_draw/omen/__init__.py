@@ -6,7 +6,7 @@ import typing
 import time
 
 from nylib.utils import Counter
-from .hit_check import hit_check
+from .hit_check import hit_check, hit_check_many, hit_count
 from . import effector
 
 if typing.TYPE_CHECKING:
@@ -138,6 +138,12 @@ class BaseOmen:
     def is_hit(self, dst: glm.vec3):
         return hit_check(self.shape, self.scale, self.pos, self.facing, dst)
 
+    def hit_mask(self, positions):
+        return hit_check_many(self.shape, self.scale, self.pos, self.facing, positions)
+
+    def hit_count(self, positions):
+        return hit_count(self.shape, self.scale, self.pos, self.facing, positions)
+
     def draw(self):
         if not self.working: return self.destroy()
         self.effectors = [eff for eff in self.effectors if eff.update()]
@@ -1,9 +1,13 @@
 import math
 
 import glm
+import numpy as np
 
 pi2 = math.pi * 2
 pi_2 = math.pi / 2
+FAN_EDGE_MARGIN = 1e-5  # radians, far more than the error of atan2 in float32
+MANY_MIN_POINTS = 16  # the numpy versions are slower than a loop of scalar checks below
+FAN_MANY_MIN_POINTS = 32
 
 
 def is_circle_hit(scale: glm.vec3, ignore_percent: float, src: glm.vec3, dst: glm.vec3, height=math.inf):
@@ -18,13 +22,11 @@ def is_fan_hit(scale: glm.vec3, angle_rad: float, facing_rad: float, src: glm.ve
     return glm.distance(src.xz, dst.xz) <= scale.x and (glm.polar(dst - src).y - (facing_rad - angle_rad / 2)) % pi2 <= angle_rad
 
 
-def is_rect_hit(scale: glm.vec3, src: glm.vec3, facing: float, dst: glm.vec3, height=math.inf, back=False):
-    if abs(src.y - dst.y) > height: return False
+def _rect_points(scale: glm.vec3, src: glm.vec3, facing: float, back=False):
     cos_f = math.cos(facing)
     sin_f = math.sin(facing)
     rw = glm.vec2(cos_f, -sin_f) * scale.x
     rh = glm.vec2(sin_f, cos_f) * scale.z
-    dst_2 = dst.xz
     if back:
         p1 = src.xz + (rw / 2) - rh
         rh *= 2
@@ -36,6 +38,13 @@ def is_rect_hit(scale: glm.vec3, src: glm.vec3, facing: float, dst: glm.vec3, he
         p2 = p1 + rh
         p3 = p2 - rw
         p4 = p3 - rh
+    return p1, p2, p3, p4
+
+
+def is_rect_hit(scale: glm.vec3, src: glm.vec3, facing: float, dst: glm.vec3, height=math.inf, back=False):
+    if abs(src.y - dst.y) > height: return False
+    p1, p2, p3, p4 = _rect_points(scale, src, facing, back)
+    dst_2 = dst.xz
     return (
             glm.dot(dst_2 - p1, p1 - p2) <= 0 and
             glm.dot(dst_2 - p2, p2 - p3) <= 0 and
@@ -55,3 +64,82 @@ def hit_check(shape: int, scale: glm.vec3, src: glm.vec3, facing: float, dst: gl
         case 5:  # fan
             return is_fan_hit(scale, math.radians(shape_value), facing, src, dst, height)
     return False
+
+
+# vectorized versions below work on points of shape [N, 3] and return a bool mask of shape [N],
+# the math is done in float32 in the same order as glm so that results match the functions above
+
+
+def as_points(points) -> np.ndarray:
+    if isinstance(points, np.ndarray):
+        return points.astype(np.float32, copy=False).reshape(-1, 3)
+    if not isinstance(points, (list, tuple)): points = list(points)
+    if points and isinstance(points[0], glm.vec3):
+        return np.asarray(glm.array(points))  # much faster than converting vec3 one by one
+    return np.asarray(points, dtype=np.float32).reshape(-1, 3)
+
+
+def is_circle_hit_many(scale: glm.vec3, ignore_percent: float, src: glm.vec3, points: np.ndarray, height=math.inf):
+    assert scale.x == scale.z, "not support oval"
+    effect_range = scale.x
+    dx = points[:, 0] - np.float32(src.x)
+    dz = points[:, 2] - np.float32(src.z)
+    dis = np.sqrt(dx * dx + dz * dz).astype(np.float64)
+    mask = (effect_range * ignore_percent <= dis) & (dis <= effect_range)
+    if height != math.inf:
+        mask &= np.abs(np.float32(src.y) - points[:, 1]).astype(np.float64) < height
+    return mask
+
+
+def is_fan_hit_many(scale: glm.vec3, angle_rad: float, facing_rad: float, src: glm.vec3, points: np.ndarray, height=math.inf):
+    assert scale.x == scale.z, "not support oval"
+    d = points - np.asarray(src, dtype=np.float32)
+    dx = d[:, 0]
+    dy = d[:, 1]
+    dz = d[:, 2]
+    mask = np.sqrt(dx * dx + dz * dz).astype(np.float64) <= scale.x
+    if height != math.inf:
+        mask &= ~(np.abs(dy).astype(np.float64) > height)
+    start = facing_rad - angle_rad / 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        length = np.sqrt(dx * dx + dy * dy + dz * dz)
+        offset = np.mod(np.arctan2((dx / length).astype(np.float64), (dz / length).astype(np.float64)) - start, pi2)
+    # the float32 atan2 of glm can round differently, points close to an edge of the fan are checked like is_fan_hit
+    edge = mask & ((np.abs(offset - angle_rad) < FAN_EDGE_MARGIN) | (offset < FAN_EDGE_MARGIN) | (offset > pi2 - FAN_EDGE_MARGIN))
+    mask &= offset <= angle_rad
+    for i in np.flatnonzero(edge).tolist():
+        mask[i] = (glm.polar(glm.vec3(*d[i].tolist())).y - start) % pi2 <= angle_rad
+    return mask
+
+
+def is_rect_hit_many(scale: glm.vec3, src: glm.vec3, facing: float, points: np.ndarray, height=math.inf, back=False):
+    p1, p2, p3, p4 = _rect_points(scale, src, facing, back)
+    p = np.array(glm.array(p1, p2, p3, p4))[:, :, None]
+    e = np.array(glm.array(p1 - p2, p2 - p3, p3 - p4, p4 - p1))[:, :, None]
+    mask = ((points[:, 0] - p[:, 0]) * e[:, 0] + (points[:, 2] - p[:, 1]) * e[:, 1] <= 0).all(axis=0)
+    if height != math.inf:
+        mask &= ~(np.abs(np.float32(src.y) - points[:, 1]).astype(np.float64) > height)
+    return mask
+
+
+def hit_check_many(shape: int, scale: glm.vec3, src: glm.vec3, facing: float, points, height=math.inf) -> np.ndarray:
+    points = as_points(points)
+    shape_type = shape >> 16
+    shape_value = shape & 0xFFFF
+    match shape_type:
+        case 1:  # circle/donut
+            return is_circle_hit_many(scale, shape_value / 0xffff, src, points, height)
+        case 2:  # rect
+            mask = is_rect_hit_many(scale, src, facing, points, height, bool(shape_value))
+            if shape_value == 2:
+                mask |= is_rect_hit_many(scale, src, facing + pi_2, points, height, True)
+            return mask
+        case 5:  # fan
+            return is_fan_hit_many(scale, math.radians(shape_value), facing, src, points, height)
+    return np.zeros(len(points), dtype=bool)
+
+
+def hit_count(shape: int, scale: glm.vec3, src: glm.vec3, facing: float, points, height=math.inf) -> int:
+    if not isinstance(points, np.ndarray) and len(points) < (FAN_MANY_MIN_POINTS if shape >> 16 == 5 else MANY_MIN_POINTS):
+        return sum(hit_check(shape, scale, src, facing, p, height) for p in points)
+    return int(hit_check_many(shape, scale, src, facing, points, height).sum())
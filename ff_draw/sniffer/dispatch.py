@@ -0,0 +1,52 @@
+import enum
+import typing
+
+from nylib.utils import KeyRoute
+from .message_structs import zone_server, zone_client, chat_server, chat_client
+
+# scope is the same as the one stored in dump: is_zone << 1 | is_up
+SCOPE_CHAT_SERVER = 0b00
+SCOPE_CHAT_CLIENT = 0b01
+SCOPE_ZONE_SERVER = 0b10
+SCOPE_ZONE_CLIENT = 0b11
+scope_type_maps = (chat_server.type_map, chat_client.type_map, zone_server.type_map, zone_client.type_map)
+
+
+def get_scope(is_zone, is_up) -> int:
+    return int(is_zone) << 1 | int(is_up)
+
+
+class DispatchEntry(typing.NamedTuple):
+    proto_no: enum.Enum | int
+    type: typing.Type | None
+    from_buffer: typing.Callable | None
+    pkt_fix: bool
+    handlers: list  # the route list of proto_no, handlers subscribed later are appended to the same list
+
+
+class IpcDispatcher:
+    # compiled (scope, raw proto_no) => decoder and handlers, rebuild it after any pno map changes
+    def __init__(self, pno_maps: typing.Sequence[dict[int, enum.Enum]], routes: typing.Sequence[KeyRoute]):
+        assert len(pno_maps) == len(routes) == len(scope_type_maps)
+        self.pno_maps = pno_maps
+        self.routes = routes
+        self.tables = self.build()
+
+    def build(self) -> tuple[dict[int, DispatchEntry], ...]:
+        tables = []
+        for pno_map, type_map, route in zip(self.pno_maps, scope_type_maps, self.routes):
+            table = {}
+            for raw_pno, pno in pno_map.items():
+                handlers = route.route.setdefault(pno, [])
+                if t := type_map.get(pno):
+                    table[raw_pno] = DispatchEntry(pno, t, t.from_buffer, hasattr(t, '_pkt_fix'), handlers)
+                else:
+                    table[raw_pno] = DispatchEntry(pno, None, None, False, handlers)
+            tables.append(table)
+        return tuple(tables)
+
+    def rebuild(self):
+        self.tables = self.build()
+
+    def get(self, scope: int, raw_pno: int) -> DispatchEntry:
+        return self.tables[scope].get(raw_pno) or DispatchEntry(raw_pno, None, None, False, self.routes[scope].route.get(raw_pno, ()))
@@ -44,6 +44,7 @@ class PingResFinder:
         self.logger.debug(f'found ping res {pno}')
         self.sniffer._zone_server_pno_map[pno] = enums.ZoneServer.PingRes
         self.sniffer.zone_server_pno['PingRes'] = [pno]
+        self.sniffer.dispatcher.rebuild()
         self.uninstall()
 
     def on_ping_req(self, msg: message.NetworkMessage):
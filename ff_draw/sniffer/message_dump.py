@@ -1,28 +1,75 @@
+import bisect
+import dataclasses
 import json
+import logging
+import mmap
 import os
 import pathlib
 import struct
 import threading
 import time
+import typing
 
 from . import enums
 from .utils import simple
 
 empty_ipc = bytearray(16)
 
+record_header = struct.Struct(b'BHiIIQ')  # scope, proto_no, fix_value, source_id, size, timestamp_ms
+index_header = struct.Struct(b'<QQQQII')  # prev_index_offset, segment_offset, first_ts, last_ts, record_count, proto_count
+index_proto_count = struct.Struct(b'<BHI')  # scope, proto_no, count
+footer_data = struct.Struct(b'<Q')  # last_index_offset
+SCOPE_FOOTER = 0xfe
+SCOPE_INDEX = 0xff
+footer_size = record_header.size + footer_data.size
+
 
 class MessageDumper:
-    _ver_ = 1
+    logger = logging.getLogger('MessageDumper')
+    _ver_ = 2
+    index_interval = 4096
 
-    def __init__(self, file_name: pathlib.Path | str, game_build_date: str):
+    def __init__(
+            self, file_name: pathlib.Path | str, game_build_date: str,
+            flush_interval=1., batch_size=1 << 20, max_buffer_size=16 << 20, max_block_time=.05,
+    ):
+        # records are packed on the caller thread and written in batches by a background writer,
+        # when max_buffer_size is reached the caller waits at most max_block_time, then the record is dropped,
+        # once the writer failed every record is dropped without waiting
         if isinstance(file_name, str): file_name = pathlib.Path(file_name)
         assert not file_name.exists()
         file_name.parent.mkdir(exist_ok=True, parents=True)
         self.file_name = file_name
         self.game_build_date = game_build_date
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_buffer_size = max_buffer_size
+        self.max_block_time = max_block_time
         self.handle = open(file_name, 'wb', buffering=0)
-        self.handle.write(json.dumps(self.get_header(), ensure_ascii=False).encode('utf-8') + b'\n')
+        header = json.dumps(self.get_header(), ensure_ascii=False).encode('utf-8') + b'\n'
+        self.handle.write(header)
         self.write_lock = threading.Lock()
+        self.write_cond = threading.Condition(self.write_lock)
+
+        self.offset = len(header)
+        self.last_index_offset = 0
+        self.segment_offset = self.offset
+        self.segment_first_ts = 0
+        self.segment_last_ts = 0
+        self.segment_count = 0
+        self.segment_proto_counts = {}
+
+        self.pending = []
+        self.pending_size = 0  # include the batch being written
+        self.closed = False
+        self.writer_error: Exception | None = None
+        self.record_count = 0
+        self.written_size = len(header)
+        self.flush_count = 0
+        self.backpressured_count = 0
+        self.dropped_count = 0
+        self.writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self.writer_thread.start()
 
     def get_header(self):
         return {
@@ -30,60 +77,337 @@ class MessageDumper:
             'game_build_date': self.game_build_date,
             'game_version': os.environ.get('FFXIV_GAME_VERSION', '0.0.0'),
             'start_log_time': int(time.time() * 1000),
+            'index_interval': self.index_interval,
         }
 
     def write(self, timestamp_ms: int, is_zone: bool, is_up: bool, proto_no: int, source_id: int, data: bytes, fix_value=0):
-        to_write = struct.pack(b'BHiIIQ', ((int(is_zone) << 1) | int(is_up)), proto_no, fix_value, source_id, len(data), timestamp_ms) + data
-        with self.write_lock: self.handle.write(to_write)
+        scope = (int(is_zone) << 1) | int(is_up)
+        to_write = record_header.pack(scope, proto_no, fix_value, source_id, len(data), timestamp_ms) + data
+        size = len(to_write)
+        with self.write_cond:
+            if self.closed: return
+            if self.writer_error is not None:
+                self.dropped_count += 1
+                return
+            if self.pending_size + size > self.max_buffer_size:
+                self.backpressured_count += 1
+                self.write_cond.notify_all()
+                if not self.write_cond.wait_for(
+                        lambda: self.closed or self.writer_error is not None or self.pending_size + size <= self.max_buffer_size, self.max_block_time
+                ) or self.closed or self.writer_error is not None:
+                    self.dropped_count += 1
+                    return
+            self._append(to_write)
+            self.record_count += 1
+            self._on_record_written(scope, proto_no, timestamp_ms, size)
+            if self.pending_size >= self.batch_size:
+                self.write_cond.notify_all()
+
+    def _append(self, data: bytes):
+        self.pending.append(data)
+        self.pending_size += len(data)
+
+    def _writer_loop(self):
+        try:
+            self._write_batches()
+        except Exception as e:
+            self.logger.error(f'dump writer of {self.file_name} stopped, records are dropped from now on', exc_info=e)
+            with self.write_cond:
+                self.writer_error = e
+                self.pending = []
+                self.write_cond.notify_all()
+
+    def _write_batches(self):
+        while True:
+            with self.write_cond:
+                self.write_cond.wait_for(lambda: self.closed or self.pending_size >= self.batch_size, self.flush_interval)
+                pending, self.pending = self.pending, []
+                closed = self.closed
+            if pending:
+                data = b''.join(pending)
+                self.handle.write(data)
+                with self.write_cond:
+                    self.pending_size -= len(data)
+                    self.written_size += len(data)
+                    self.flush_count += 1
+                    self.write_cond.notify_all()
+            if closed: return
+
+    def _on_record_written(self, scope, proto_no, timestamp_ms, size):
+        if not self.segment_count:
+            self.segment_first_ts = timestamp_ms
+        self.segment_last_ts = timestamp_ms
+        self.segment_count += 1
+        key = scope, proto_no
+        self.segment_proto_counts[key] = self.segment_proto_counts.get(key, 0) + 1
+        self.offset += size
+        if self.segment_count >= self.index_interval:
+            self._write_index()
+
+    def _write_index(self):
+        payload = index_header.pack(
+            self.last_index_offset, self.segment_offset, self.segment_first_ts, self.segment_last_ts,
+            self.segment_count, len(self.segment_proto_counts)
+        ) + b''.join(index_proto_count.pack(scope, proto_no, cnt) for (scope, proto_no), cnt in self.segment_proto_counts.items())
+        self._append(record_header.pack(SCOPE_INDEX, 0, 0, 0, len(payload), self.segment_last_ts) + payload)
+        self.last_index_offset = self.offset
+        self.offset += record_header.size + len(payload)
+        self.segment_offset = self.offset
+        self.segment_count = 0
+        self.segment_proto_counts = {}
 
     def close(self):
+        with self.write_cond:
+            if self.closed: return
+            if self.segment_count:
+                self._write_index()
+            self._append(record_header.pack(SCOPE_FOOTER, 0, 0, 0, footer_data.size, 0) + footer_data.pack(self.last_index_offset))
+            self.closed = True
+            self.write_cond.notify_all()
+        self.writer_thread.join()
         self.handle.close()
         self.handle = None
 
     @classmethod
     def parse(cls, file_name: pathlib.Path | str, pno_dir: pathlib.Path | str):
+        with DumpReader(file_name) as reader:
+            yield from reader.parse(pno_dir)
+
+
+@dataclasses.dataclass
+class DumpSegment:
+    offset: int
+    end: int
+    first_ts: int
+    last_ts: int
+    count: int
+    proto_counts: dict[tuple[int, int], int]
+
+    def has_proto(self, proto_nos: typing.Container[int], scope: int = None):
+        if scope is None:
+            return any(proto_no in proto_nos for _, proto_no in self.proto_counts)
+        return any(s == scope and proto_no in proto_nos for s, proto_no in self.proto_counts)
+
+    def has_key(self, keys: typing.Container[tuple[int, int]]):
+        return any(key in keys for key in self.proto_counts)
+
+
+class DumpRecord(typing.NamedTuple):
+    offset: int
+    scope: int
+    proto_no: int
+    fix_value: int
+    source_id: int
+    timestamp_ms: int
+    data: bytes
+
+    @property
+    def is_zone(self):
+        return self.scope & 0b10 > 0
+
+    @property
+    def is_up(self):
+        return self.scope & 0b1 > 0
+
+
+class DumpReader:
+    # v2 files are located by their index blocks,
+    # v1 files (and v2 files not closed properly) are indexed by scanning the record headers once
+    scan_interval = 4096
+
+    def __init__(self, file_name: pathlib.Path | str):
         if isinstance(file_name, str): file_name = pathlib.Path(file_name)
+        assert file_name.exists()
+        self.file_name = file_name
+        self.handle = open(file_name, 'rb')
+        self.header = json.loads(self.handle.readline().decode('utf-8'))
+        assert isinstance(self.header, dict) and self.header['dumper_version'] in (1, 2)
+        self.version = self.header['dumper_version']
+        self.data_offset = self.handle.tell()
+        self.size = os.fstat(self.handle.fileno()).st_size
+        self.buf = mmap.mmap(self.handle.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b''
+        self.segments = self._load_index() if self.version >= 2 else None
+        if self.segments is None:
+            self.segments = self._scan_index()
+        self._segment_last_ts = [seg.last_ts for seg in self.segments]
+        self.position = self.data_offset
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        if self.buf:
+            self.buf.close()
+            self.buf = b''
+        self.handle.close()
+
+    @property
+    def record_count(self):
+        return sum(seg.count for seg in self.segments)
+
+    @property
+    def first_timestamp(self):
+        return self.segments[0].first_ts if self.segments else 0
+
+    @property
+    def last_timestamp(self):
+        return self.segments[-1].last_ts if self.segments else 0
+
+    def proto_counts(self) -> dict[tuple[int, int], int]:
+        res = {}
+        for seg in self.segments:
+            for key, cnt in seg.proto_counts.items():
+                res[key] = res.get(key, 0) + cnt
+        return res
+
+    def _load_index(self):
+        if self.size - self.data_offset < footer_size: return None
+        scope, *_, size, _ = record_header.unpack_from(self.buf, self.size - footer_size)
+        if scope != SCOPE_FOOTER or size != footer_data.size: return None
+        index_offset, = footer_data.unpack_from(self.buf, self.size - footer_data.size)
+        segments = []
+        while index_offset:
+            scope, *_ = record_header.unpack_from(self.buf, index_offset)
+            if scope != SCOPE_INDEX: return None
+            off = index_offset + record_header.size
+            prev_index_offset, segment_offset, first_ts, last_ts, count, proto_count = index_header.unpack_from(self.buf, off)
+            off += index_header.size
+            proto_counts = {}
+            for _ in range(proto_count):
+                scope, proto_no, cnt = index_proto_count.unpack_from(self.buf, off)
+                proto_counts[(scope, proto_no)] = cnt
+                off += index_proto_count.size
+            segments.append(DumpSegment(segment_offset, index_offset, first_ts, last_ts, count, proto_counts))
+            index_offset = prev_index_offset
+        segments.reverse()
+        return segments
+
+    def _scan_index(self):
+        segments = []
+        buf = self.buf
+        unpack_from = record_header.unpack_from
+        end = self.size
+        off = self.data_offset
+        segment = None
+        while off + record_header.size <= end:
+            scope, proto_no, _, _, size, timestamp_ms = unpack_from(buf, off)
+            next_off = off + record_header.size + size
+            if next_off > end: break  # record not completely written
+            if scope < SCOPE_FOOTER:
+                if segment is None:
+                    segment = DumpSegment(off, off, timestamp_ms, timestamp_ms, 0, {})
+                    segments.append(segment)
+                segment.last_ts = timestamp_ms
+                segment.count += 1
+                key = scope, proto_no
+                segment.proto_counts[key] = segment.proto_counts.get(key, 0) + 1
+                segment.end = next_off
+                if segment.count >= self.scan_interval:
+                    segment = None
+            off = next_off
+        return segments
+
+    def seek(self, timestamp_ms: int) -> int:
+        # move to the first record at or after timestamp_ms, records are assumed to be in time order
+        i = bisect.bisect_left(self._segment_last_ts, timestamp_ms)
+        if i >= len(self.segments):
+            self.position = self.segments[-1].end if self.segments else self.data_offset
+            return self.position
+        segment = self.segments[i]
+        self.position = segment.offset
+        for record in self._iter_segment(segment, segment.offset):
+            if record[5] >= timestamp_ms:
+                self.position = record[0]
+                break
+        return self.position
+
+    def _iter_segment(self, segment: DumpSegment, start: int):
+        buf = self.buf
+        unpack_from = record_header.unpack_from
+        off = start
+        end = segment.end
+        while off < end:
+            scope, proto_no, fix_value, source_id, size, timestamp_ms = unpack_from(buf, off)
+            yield off, scope, proto_no, fix_value, source_id, timestamp_ms, size
+            off += record_header.size + size
+
+    def iter_records(
+            self,
+            start: int = None,
+            end: int = None,
+            end_timestamp_ms: int = None,
+            proto_no: int | typing.Iterable[int] = None,
+            source_id: int | typing.Iterable[int] = None,
+            scope: int = None,
+            keys: typing.Iterable[tuple[int, int]] = None,
+    ) -> typing.Iterator[DumpRecord]:
+        # filters are checked on the record header only, data of skipped records is never read,
+        # keys selects (scope, proto_no) pairs
+        if start is None: start = self.position
+        if keys is not None: keys = set(keys)
+        if isinstance(proto_no, int): proto_no = {proto_no}
+        elif proto_no is not None: proto_no = set(proto_no)
+        if isinstance(source_id, int): source_id = {source_id}
+        elif source_id is not None: source_id = set(source_id)
+        buf = self.buf
+        i = bisect.bisect_right([seg.end for seg in self.segments], start)
+        for segment in self.segments[i:]:
+            if end is not None and segment.offset >= end: return
+            if proto_no is not None and not segment.has_proto(proto_no, scope): continue
+            if keys is not None and not segment.has_key(keys): continue
+            if end_timestamp_ms is not None and segment.first_ts > end_timestamp_ms: return
+            for off, _scope, _proto_no, fix_value, _source_id, timestamp_ms, size in self._iter_segment(segment, max(start, segment.offset)):
+                if end is not None and off >= end: return
+                if _scope >= SCOPE_FOOTER: continue
+                if end_timestamp_ms is not None and timestamp_ms > end_timestamp_ms: return
+                if proto_no is not None and _proto_no not in proto_no: continue
+                if source_id is not None and _source_id not in source_id: continue
+                if scope is not None and _scope != scope: continue
+                if keys is not None and (_scope, _proto_no) not in keys: continue
+                data_offset = off + record_header.size
+                yield DumpRecord(off, _scope, _proto_no, fix_value, _source_id, timestamp_ms, buf[data_offset:data_offset + size])
+
+    def load_pno_maps(self, pno_dir: pathlib.Path | str):
         if isinstance(pno_dir, str): pno_dir = pathlib.Path(pno_dir)
+        game_build_date = self.header['game_build_date']
+        # same order as scope: chat server, chat client, zone server, zone client
+        return (
+            simple.load_pno_map(pno_dir / 'ChatServerIpc.csv', game_build_date, enums.ChatServer),
+            simple.load_pno_map(pno_dir / 'ChatClientIpc.csv', game_build_date, enums.ChatClient),
+            simple.load_pno_map(pno_dir / 'ZoneServerIpc.csv', game_build_date, enums.ZoneServer),
+            simple.load_pno_map(pno_dir / 'ZoneClientIpc.csv', game_build_date, enums.ZoneClient),
+        )
 
-        assert file_name.exists()
-        with open(file_name, 'rb') as buf:
-            header = json.loads(buf.readline().decode('utf-8'))
-            assert isinstance(header, dict) and header['dumper_version'] == cls._ver_
-            game_build_date = header['game_build_date']
-            assert os.environ.setdefault('FFXIV_GAME_VERSION', header['game_version']) == header['game_version']
-            from .message_structs import zone_server, zone_client, chat_server, chat_client
-            chat_server_pno_map, _ = simple.load_pno_map(pno_dir / 'ChatServerIpc.csv', game_build_date, enums.ChatServer)
-            chat_client_pno_map, _ = simple.load_pno_map(pno_dir / 'ChatClientIpc.csv', game_build_date, enums.ChatClient)
-            zone_server_pno_map, _ = simple.load_pno_map(pno_dir / 'ZoneServerIpc.csv', game_build_date, enums.ZoneServer)
-            zone_client_pno_map, _ = simple.load_pno_map(pno_dir / 'ZoneClientIpc.csv', game_build_date, enums.ZoneClient)
-            while True:
-                if not (header_bytes := buf.read(24)): break
-
-                scope, proto_no, fix_value, source_id, size, timestamp_ms = struct.unpack(b'BHiIIQ', header_bytes)
-                data = buf.read(size)
-
-                is_zone = scope & 0b10 > 0
-                is_up = scope & 0b1 > 0
-                if is_zone:
-                    if is_up:
-                        pno_map = zone_client_pno_map
-                        type_map = zone_client.type_map
-                    else:
-                        pno_map = zone_server_pno_map
-                        type_map = zone_server.type_map
-                else:
-                    if is_up:
-                        pno_map = chat_client_pno_map
-                        type_map = chat_client.type_map
+    def parse(self, pno_dir: pathlib.Path | str, proto_no: int | str | typing.Iterable[int | str] = None, **filters):
+        # yield decoded (is_zone, is_up, proto_no, source_id, timestamp_ms, data),
+        # proto_no filter also accepts proto names, a name only matches the raw proto_no it has in its own scope
+        game_version = self.header['game_version']
+        assert os.environ.setdefault('FFXIV_GAME_VERSION', game_version) == game_version
+        from .message_structs import zone_server, zone_client, chat_server, chat_client
+        pno_maps = self.load_pno_maps(pno_dir)
+        type_maps = chat_server.type_map, chat_client.type_map, zone_server.type_map, zone_client.type_map
+        if proto_no is not None:
+            if isinstance(proto_no, (int, str)): proto_no = proto_no,
+            keys = set()
+            for p in proto_no:
+                for scope, (_, k2pno) in enumerate(pno_maps):
+                    if isinstance(p, str):
+                        keys.update((scope, raw_pno) for raw_pno in k2pno.get(p, ()))
                     else:
-                        pno_map = chat_server_pno_map
-                        type_map = chat_server.type_map
-                if proto_no in pno_map:
-                    proto_no = pno_map[proto_no]
-                    if t := type_map.get(proto_no):
-                        data = t.from_buffer_copy(data)
-                        if hasattr(t, '_pkt_fix'):
-                            data._pkt_fix(fix_value)
-                    proto_no = proto_no.name
-
-                yield is_zone, is_up, proto_no, source_id, timestamp_ms, data
+                        keys.add((scope, p))
+            filters['keys'] = keys
+        for record in self.iter_records(**filters):
+            data = record.data
+            proto_no = record.proto_no
+            pno_map, _ = pno_maps[record.scope]
+            if proto_no in pno_map:
+                proto_no = pno_map[proto_no]
+                if t := type_maps[record.scope].get(proto_no):
+                    data = t.from_buffer_copy(data)
+                    if hasattr(t, '_pkt_fix'):
+                        data._pkt_fix(record.fix_value)
+                proto_no = proto_no.name
+            yield record.is_zone, record.is_up, proto_no, record.source_id, record.timestamp_ms, data
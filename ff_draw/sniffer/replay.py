@@ -0,0 +1,307 @@
+import argparse
+import logging
+import os
+import pathlib
+import tempfile
+import time
+import typing
+
+from nylib.utils import KeyRoute
+from .message_dump import DumpReader
+
+if typing.TYPE_CHECKING:
+    from .sniffer_main import Sniffer
+
+
+class ReplayPacketFix:
+    value = 0
+
+
+class ReplayActorTable:
+    me = None
+
+    def get_actor_by_id(self, actor_id):
+        return None
+
+    def __iter__(self):
+        return iter(())
+
+
+class ReplayTerritoryInfo:
+    territory_id = 0
+
+
+class ReplayPartyList:
+    party_size = 0
+
+    def __iter__(self):
+        return iter(())
+
+
+class ReplayParty:
+    party_list = ReplayPartyList()
+
+
+class ReplayMem:
+    # the parts of XivMem used by packet handlers, actors are never found since there is no game process
+    def __init__(self, game_build_date: str):
+        self.game_build_date = game_build_date
+        self.packet_fix = ReplayPacketFix()
+        self.actor_table = ReplayActorTable()
+        self.territory_info = ReplayTerritoryInfo()
+        self.party = ReplayParty()
+        self.is_in_replay = False
+
+
+class ReplayExd:
+    def __init__(self):
+        self.rsv_string = {}
+
+
+class ReplaySqPack:
+    def __init__(self):
+        self.exd = ReplayExd()
+
+
+class ReplayGui:
+    def __init__(self):
+        self.draw_update_call = set()
+
+
+class ReplayMain:
+    # stand-in of FFDraw for running Sniffer and plugins without the game
+    def __init__(self, game_build_date: str, game_path: str | None = None, app_data_path: pathlib.Path | None = None):
+        self.app_data_path = app_data_path or pathlib.Path(tempfile.mkdtemp(prefix='ffd_replay_'))
+        self.config = {'sniffer': {'dump_pkt': False}}
+        self.mem = ReplayMem(game_build_date)
+        if game_path:
+            from fpt4.utils.sqpack import SqPack
+            self.sq_pack = SqPack.get(pathlib.Path(game_path))
+        else:
+            self.sq_pack = ReplaySqPack()
+        self.gui = ReplayGui()
+        self.plugins = {}
+        self.omens = {}
+
+    def save_config(self):
+        pass
+
+    def touch_plugin(self, plugin_cls):
+        return self.plugins.get(plugin_cls.plugin_name) or plugin_cls(self)
+
+
+class HandlerStat:
+    def __init__(self, name: str, func):
+        self.name = name
+        self.func = func
+        self.count = 0
+        self.total = 0.
+        self.max = 0.
+        self.errors = 0
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.func(*args, **kwargs)
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            used = time.perf_counter() - start
+            self.count += 1
+            self.total += used
+            if used > self.max: self.max = used
+
+    # keep remove() from plugins working on the wrapped handler
+    def __eq__(self, other):
+        return self.func == (other.func if isinstance(other, HandlerStat) else other)
+
+    def __hash__(self):
+        return hash(self.func)
+
+
+def _handler_name(func):
+    if isinstance(func, HandlerStat): return func.name
+    if owner := getattr(func, '__self__', None):
+        return f'{type(owner).__name__}.{func.__name__}'
+    return getattr(func, '__qualname__', None) or repr(func)
+
+
+class TimedHook(list):
+    # handler list wrapping every handler added to it, so handlers subscribed during the replay are timed too
+    timer: 'HandlerTimer'
+    prefix: str
+
+    def _wrap(self, func):
+        return self.timer.wrap(func, self.prefix)
+
+    def append(self, func):
+        super().append(self._wrap(func))
+
+    def insert(self, index, func):
+        super().insert(index, self._wrap(func))
+
+    def extend(self, funcs):
+        super().extend(map(self._wrap, funcs))
+
+    def __iadd__(self, funcs):
+        self.extend(funcs)
+        return self
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, list(map(self._wrap, value)) if isinstance(index, slice) else self._wrap(value))
+
+
+class TimedRoute(dict):
+    # KeyRoute.route whose handler lists are TimedHook, including lists created by later subscriptions
+    def __init__(self, timer: 'HandlerTimer', prefix: str, route: dict):
+        super().__init__()
+        self.timer = timer
+        self.prefix = prefix
+        for key, hook in route.items():
+            self[key] = hook
+
+    def __setitem__(self, key, hook):
+        super().__setitem__(key, self.timer.hook(hook, f'{self.prefix}[{getattr(key, "name", key)}]'))
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = [] if default is None else default
+        return self[key]
+
+
+class HandlerTimer:
+    def __init__(self, sniffer: 'Sniffer'):
+        self.stats: list[HandlerStat] = []
+        self._hook_types = {}
+        for name in (
+                'on_chat_server_message', 'on_chat_client_message', 'on_zone_server_message', 'on_zone_client_message',
+                'on_actor_control', 'on_action_effect', 'on_add_status_by_action', 'on_play_action_timeline', 'on_reset',
+        ):
+            hook = getattr(sniffer, name)
+            if isinstance(hook, KeyRoute):
+                hook.any_call = self.hook(hook.any_call, f'{name}.any')
+                hook.route = TimedRoute(self, name, hook.route)
+            else:
+                setattr(sniffer, name, self.hook(hook, name))
+        sniffer.dispatcher.rebuild()  # the dispatch table holds the route lists, bind it to the timed ones
+
+    def wrap(self, func, prefix):
+        if isinstance(func, HandlerStat): return func
+        if isinstance(func, list): return func  # nested broadcast hooks like on_action_effect are timed by their own entries
+        stat = HandlerStat(f'{prefix} {_handler_name(func)}', func)
+        self.stats.append(stat)
+        return stat
+
+    def hook(self, hook, prefix):
+        # a TimedHook with the handlers of hook, list subclasses like BroadcastHook are converted in place
+        if isinstance(hook, TimedHook) or not isinstance(hook, list): return hook
+        if type(hook) is list:
+            res = TimedHook()
+        else:
+            if (t := self._hook_types.get(type(hook))) is None:
+                t = self._hook_types[type(hook)] = type(f'Timed{type(hook).__name__}', (TimedHook, type(hook)), {})
+            res, hook.__class__ = hook, t
+        res.timer = self
+        res.prefix = prefix
+        res[:] = list(hook)
+        return res
+
+    def report(self, top=30):
+        stats = sorted(self.stats, key=lambda s: s.total, reverse=True)
+        lines = [f'{"handler":<80} {"calls":>9} {"total(ms)":>10} {"avg(us)":>9} {"max(ms)":>9} {"errors":>7}']
+        for s in stats[:top]:
+            if not s.count: continue
+            lines.append(f'{s.name[:80]:<80} {s.count:>9} {s.total * 1000:>10.2f} {s.total / s.count * 1e6:>9.2f} {s.max * 1000:>9.3f} {s.errors:>7}')
+        return '\n'.join(lines)
+
+
+class Replayer:
+    logger = logging.getLogger('Replayer')
+
+    def __init__(self, dump_path: pathlib.Path | str, game_path: str | None = None, plugins: typing.Iterable[str] = ()):
+        os.environ.setdefault('ExcPath', str(pathlib.Path(__file__).parent.parent.parent))
+        self.reader = DumpReader(dump_path)
+        game_version = self.reader.header['game_version']
+        assert os.environ.setdefault('FFXIV_GAME_VERSION', game_version) == game_version
+        self.main = ReplayMain(self.reader.header['game_build_date'], game_path)
+
+        from .sniffer_main import Sniffer
+        from .utils import message
+        self.message = message
+        Sniffer.instance = None
+        self.sniffer = self.main.sniffer = Sniffer(self.main)
+        if plugins := list(plugins):
+            self.load_plugins(plugins)
+        self.timer = HandlerTimer(self.sniffer)
+
+    def load_plugins(self, names: list[str]):
+        from ff_draw.main import FFDraw
+        from ff_draw import plugins
+        import importlib
+        import sys
+        FFDraw.instance = self.main
+        plugin_path = os.path.join(os.environ['ExcPath'], 'plugins')
+        if plugin_path not in sys.path: sys.path.insert(0, plugin_path)
+        for name in names:
+            importlib.import_module(name.split('/', 1)[0])
+        for k, p in plugins.plugins.items():
+            if k in names or k.split('/', 1)[0] in names:
+                self.logger.info(f'load plugin {k}')
+                self.main.touch_plugin(p)
+
+    def run(self, speed: float = 0, **filters):
+        # speed is the multiple of real time, 0 means as fast as possible
+        empty_ipc = bytearray(16)
+        message = self.message
+        on_ipc_message = self.sniffer._on_ipc_message
+        packet_fix = self.main.mem.packet_fix
+        first_ts = None
+        count = 0
+        start = time.perf_counter()
+        for record in self.reader.iter_records(**filters):
+            if speed > 0:
+                if first_ts is None: first_ts = record.timestamp_ms
+                if (wait := (record.timestamp_ms - first_ts) / 1000 / speed - (time.perf_counter() - start)) > 0:
+                    time.sleep(wait)
+            packet_fix.value = record.fix_value
+            try:
+                on_ipc_message(record.is_zone, record.is_up, message.ElementMessage(
+                    bundle_header=message.BundleHeader(timestamp_ms=record.timestamp_ms),
+                    el_header=message.ElementHeader(source_id=record.source_id),
+                    element=message.IpcHeader(proto_no=record.proto_no),
+                    raw_data=empty_ipc + record.data,
+                ))
+            except Exception as e:
+                self.logger.error(f'error in replay record at {record.offset:#x}', exc_info=e)
+            count += 1
+        return count, time.perf_counter() - start
+
+    def close(self):
+        for plugin in list(self.main.plugins.values()):
+            plugin.unload()
+        self.reader.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='replay a packet dump through Sniffer and plugins without the game')
+    parser.add_argument('dump', type=pathlib.Path)
+    parser.add_argument('--speed', type=float, default=0, help='multiple of real time, 0 to replay as fast as possible')
+    parser.add_argument('--game-path', default=None, help='game directory, required by plugins using sqpack')
+    parser.add_argument('--plugin', action='append', default=[], help='plugin name to load, like dps or raid_helper')
+    parser.add_argument('--start', type=int, default=None, help='start timestamp_ms')
+    parser.add_argument('--end', type=int, default=None, help='end timestamp_ms')
+    parser.add_argument('--top', type=int, default=30)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    replayer = Replayer(args.dump, args.game_path, args.plugin)
+    if args.start is not None: replayer.reader.seek(args.start)
+    count, used = replayer.run(args.speed, end_timestamp_ms=args.end)
+    print(f'replayed {count} messages in {used:.3f}s, {count / used if used else 0:,.0f} msg/s')
+    print(replayer.timer.report(args.top))
+    replayer.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -13,9 +13,8 @@ import imgui
 
 from nylib.utils import serialize_data, KeyRoute, BroadcastHook
 from nylib.utils.win32.network import find_process_tcp_connections
-from ff_draw.utils import EvtQueue
-from . import enums, extra, message_dump, hook_sniff
-from .message_structs import zone_server, zone_client, chat_server, chat_client
+from ff_draw.utils import EvtQueue, BatchEvtQueue
+from . import enums, extra, message_dump, hook_sniff, dispatch
 from .utils import message, structs, simple, bundle, oodle
 
 if typing.TYPE_CHECKING:
@@ -25,11 +24,10 @@ if typing.TYPE_CHECKING:
 class GameMessageBuffer:
     def __init__(self, oodle_type: typing.Type[oodle.Oodle]):
         self.oodle = oodle_type()
-        self.buffer = bytearray()
+        self.decoder = bundle.BundleDecoder(self.oodle)
 
     def feed(self, data: bytes):
-        self.buffer.extend(data)
-        yield from bundle.decode(self.buffer, self.oodle)
+        yield from self.decoder.feed(data)
 
 
 class KeyRouteWithMap(KeyRoute):
@@ -59,6 +57,7 @@ class Sniffer:
         self.sniff_promisc = self.config.setdefault('sniff_promisc', True)
         self.dump_pkt = self.config.setdefault('dump_pkt', False)
         self.dump_zone_down_only = self.config.setdefault('dump_zone_down_only', True)
+        self.evt_queue_mode = self.config.setdefault('evt_queue_mode', 'default')  # default / batch
 
         pno_dir = pathlib.Path(os.environ['ExcPath']) / 'res' / 'proto_no'
 
@@ -75,6 +74,17 @@ class Sniffer:
         self.on_chat_client_message = KeyRouteWithMap(lambda m: m.proto_no, lambda k: self._chat_client_pno_map.get(k, k))
         self.on_zone_server_message = KeyRouteWithMap(lambda m: m.proto_no, lambda k: self._zone_server_pno_map.get(k, k))
         self.on_zone_client_message = KeyRouteWithMap(lambda m: m.proto_no, lambda k: self._zone_client_pno_map.get(k, k))
+        self.dispatcher = dispatch.IpcDispatcher((
+            self._chat_server_pno_map,
+            self._chat_client_pno_map,
+            self._zone_server_pno_map,
+            self._zone_client_pno_map,
+        ), (
+            self.on_chat_server_message,
+            self.on_chat_client_message,
+            self.on_zone_server_message,
+            self.on_zone_client_message,
+        ))
         self.on_actor_control = KeyRoute(lambda m: m.id)
         self.on_action_effect = BroadcastHook()
         self.on_add_status_by_action = BroadcastHook()
@@ -88,7 +98,10 @@ class Sniffer:
         self.extra = extra.SnifferExtra(self)
 
         self.update_dump()
-        self.evt_queue = EvtQueue(self._on_ipc_message)
+        if self.evt_queue_mode == 'batch':
+            self.evt_queue = BatchEvtQueue(self._on_ipc_message, timeout_cb=self._on_evt_queue_timeout, get_key=self._evt_queue_key)
+        else:
+            self.evt_queue = EvtQueue(self._on_ipc_message)
 
     def update_dump(self):
         if self.dump:
@@ -108,45 +121,42 @@ class Sniffer:
         except Exception as e:
             self.logger.warning(f'exception when get overtime stack', exc_info=e)
 
+    @staticmethod
+    def _evt_queue_key(is_zone, is_up, msg):
+        return is_zone, is_up, msg.element.proto_no
+
+    def _evt_queue_key_name(self, key):
+        is_zone, is_up, pno = key
+        if is_zone:
+            pno_map = self._zone_client_pno_map if is_up else self._zone_server_pno_map
+        else:
+            pno_map = self._chat_client_pno_map if is_up else self._chat_server_pno_map
+        name = getattr(pno_map.get(pno), 'name', pno)
+        return f'{"Zone" if is_zone else "Chat"}{"Client" if is_up else "Server"}[{name}]'
+
     def _on_ipc_message(self, is_zone, is_up, msg):
         fix_value = None
         if self.dump and ((not self.dump_zone_down_only) or (is_zone and not is_up)):
             self.dump.write(msg.bundle_header.timestamp_ms, is_zone, is_up, msg.element.proto_no, msg.el_header.source_id, msg.raw_data[16:], fix_value := self.packet_fix.value)
+        scope = dispatch.get_scope(is_zone, is_up)
         with self.ipc_lock:
-            if is_zone:
-                if is_up:
-                    pno_map = self._zone_client_pno_map
-                    call = self.on_zone_client_message
-                    type_map = zone_client.type_map
-                else:
-                    pno_map = self._zone_server_pno_map
-                    call = self.on_zone_server_message
-                    type_map = zone_server.type_map
-            else:
-                if is_up:
-                    pno_map = self._chat_client_pno_map
-                    call = self.on_chat_client_message
-                    type_map = chat_client.type_map
-                else:
-                    pno_map = self._chat_server_pno_map
-                    call = self.on_chat_server_message
-                    type_map = chat_server.type_map
-
+            pno, t, from_buffer, pkt_fix, handlers = self.dispatcher.get(scope, msg.element.proto_no)
+            any_call = self.dispatcher.routes[scope].any_call
+            if not (self.print_packets or any_call or handlers): return
             data = msg.raw_data
-            if (pno := msg.element.proto_no) in pno_map:
-                pno = pno_map[pno]
-                if t := type_map.get(pno):
-                    msg = msg.to_ipc(t)
-                    data = msg.message
-                    if hasattr(t, '_pkt_fix'):
-                        data._pkt_fix(self.packet_fix.value if fix_value is None else fix_value)
+            if t is not None:
+                data = from_buffer(data, message._header_size)
+                msg = message.IpcMessage(msg.bundle_header, msg.el_header, msg.element, data, msg.raw_data)
+                if pkt_fix:
+                    data._pkt_fix(self.packet_fix.value if fix_value is None else fix_value)
             try:
                 evt = message.NetworkMessage(proto_no=pno, raw_message=msg, header=msg.el_header, message=data)
                 if self.print_packets:
                     source_name = getattr(self.main.mem.actor_table.get_actor_by_id(evt.header.source_id), 'name', None)
                     self.logger.debug(f'{"Zone" if is_zone else "Chat"}{"Client" if is_up else "Server"}[{pno}] {source_name}#{evt.header.source_id:x} {serialize_data(data)}')
-                # self.logger.debug(f'{is_zone} {is_up} {evt.proto_no} {call.route.get(evt.proto_no)}')
-                call(evt)
+                # self.logger.debug(f'{is_zone} {is_up} {evt.proto_no} {handlers}')
+                for c in any_call: c(evt)
+                for c in handlers: c(evt)
             except Exception as e:
                 self.logger.error(f'error in processing network message {pno}', exc_info=e)
 
@@ -177,3 +187,42 @@ class Sniffer:
             if clicked:
                 self.config['dump_zone_down_only'] = self.dump_zone_down_only
                 self.main.save_config()
+            if dump := self.dump:
+                imgui.text(f'dump: {dump.record_count} records, written {dump.written_size / 1024:.1f}KB, pending {dump.pending_size / 1024:.1f}KB')
+                imgui.text(f'dump: backpressured {dump.backpressured_count}, dropped {dump.dropped_count}')
+                if dump.writer_error is not None:
+                    imgui.text_colored(f'dump writer stopped: {dump.writer_error}', 1, 0, 0)
+        evt_queue_modes = ['default', 'batch']
+        imgui.text('evt_queue_mode (restart to apply)')
+        changed, new_idx = imgui.combo('##evt_queue_mode', evt_queue_modes.index(self.evt_queue_mode) if self.evt_queue_mode in evt_queue_modes else 0, evt_queue_modes)
+        if changed:
+            self.evt_queue_mode = self.config['evt_queue_mode'] = evt_queue_modes[new_idx]
+            self.main.save_config()
+        if isinstance(self.evt_queue, BatchEvtQueue):
+            self.render_evt_queue_stat()
+
+    def render_evt_queue_stat(self):
+        q = self.evt_queue
+        imgui.text(f'msg:{q.msg_count} batch:{q.batch_count} avg_batch:{q.msg_count / q.batch_count if q.batch_count else 0:.2f} max_batch:{q.max_batch}')
+        imgui.same_line()
+        if imgui.button('clear##evt_queue_stat'):
+            q.clear_stat()
+        if not imgui.tree_node('handler latency##evt_queue_stat'): return
+        hists = sorted(list(q.latency.items()), key=lambda i: i[1].total, reverse=True)
+        imgui.columns(5)
+        for title in ('route', 'count', 'avg', 'max', 'histogram'):
+            imgui.text(title)
+            imgui.next_column()
+        for key, hist in hists:
+            imgui.text(self._evt_queue_key_name(key))
+            imgui.next_column()
+            imgui.text(str(hist.count))
+            imgui.next_column()
+            imgui.text(f'{hist.avg * 1000:.3f}ms')
+            imgui.next_column()
+            imgui.text(f'{hist.max * 1000:.3f}ms')
+            imgui.next_column()
+            imgui.text(' '.join(f'{label}:{cnt}' for label, cnt in zip(hist.labels, hist.buckets) if cnt))
+            imgui.next_column()
+        imgui.columns(1)
+        imgui.tree_pop()
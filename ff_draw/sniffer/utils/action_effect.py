@@ -0,0 +1,97 @@
+import functools
+import typing
+
+import numpy as np
+
+from ff_draw.enums.action import ActionEffectType
+
+if typing.TYPE_CHECKING:
+    from ..message_structs import zone_server
+
+EFFECT_DTYPE = np.dtype([('type', 'u1'), ('arg0', 'u1'), ('arg1', 'u1'), ('arg2', 'u1'), ('arg3', 'u1'), ('flag', 'u1'), ('value', '<u2')])
+EFFECTS_PER_TARGET = 8
+DAMAGE_TYPES = ActionEffectType.damage.value, ActionEffectType.blocked_damage.value, ActionEffectType.parry_damage.value
+HEAL_TYPE = ActionEffectType.healing.value
+_is_damage_type = np.zeros(256, bool)
+_is_damage_type[list(DAMAGE_TYPES)] = True
+_TYPE = np.uint64(0xff)  # of an effect read as a little endian u64
+
+
+@functools.cache
+def _layout(message_type: 'type[zone_server.ActionEffectBase]'):
+    # offsets of effects and target ids in the message and the number of targets, from the fields of the struct
+    return message_type.effects.offset, message_type.target_ids.offset, message_type.target_ids.size // 8
+
+
+class ActionEffectArrays:
+    """
+    effects of an ActionEffect message as arrays over the packet buffer,
+    targets end at the first invalid id and the effects of a target at the first one without type, like the game reads them,
+    the flat arrays have an item per effect of the targets in order, they and the masks are computed on first use
+    """
+
+    def __init__(self, buffer, message_type: 'type[zone_server.ActionEffectBase]', offset: int = 0):
+        effects_offset, target_ids_offset, count = _layout(message_type)
+        count = min(count, (len(buffer) - offset - target_ids_offset) // 8)  # a short packet has less targets than the struct
+        if count > 0:
+            target_ids = np.frombuffer(buffer, '<u8', count, offset + target_ids_offset)
+            invalid = (target_ids == 0) | (target_ids == 0xe0000000)
+            if invalid.any(): count = int(invalid.argmax())
+        if count > 0:
+            self.target_ids = target_ids[:count]
+            self.words = np.frombuffer(buffer, '<u8', count * EFFECTS_PER_TARGET, offset + effects_offset).reshape(count, EFFECTS_PER_TARGET)
+        else:
+            self.target_ids = np.zeros(0, np.uint64)
+            self.words = np.zeros((0, EFFECTS_PER_TARGET), np.uint64)
+        self.valid = np.logical_and.accumulate((self.words & _TYPE) != 0, axis=1)
+        self.flat = self.words[self.valid].view(EFFECT_DTYPE)  # effects of the targets in order
+
+    def __len__(self):
+        return len(self.flat)
+
+    @functools.cached_property
+    def effects(self) -> np.ndarray:
+        """
+        fields of the effect slots of every target, zero copy
+        """
+        return self.words.view(EFFECT_DTYPE)
+
+    @functools.cached_property
+    def targets(self) -> np.ndarray:
+        return np.repeat(self.target_ids, self.valid.sum(1))
+
+    @functools.cached_property
+    def types(self) -> np.ndarray:
+        return self.flat['type']
+
+    @functools.cached_property
+    def values(self) -> np.ndarray:
+        # values over 0xffff carry the high part in arg3
+        return self.flat['value'] + (self.flat['flag'] & 0x40 != 0) * (self.flat['arg3'].astype(np.int64) << 16)
+
+    @functools.cached_property
+    def damage(self) -> np.ndarray:
+        return _is_damage_type[self.types]
+
+    @functools.cached_property
+    def heal(self) -> np.ndarray:
+        return self.types == HEAL_TYPE
+
+    @functools.cached_property
+    def critical(self) -> np.ndarray:
+        return self.damage & (self.flat['arg0'] & 0x20 != 0) | self.heal & (self.flat['arg1'] & 0x20 != 0)
+
+    @functools.cached_property
+    def direct_hit(self) -> np.ndarray:
+        return self.damage & (self.flat['arg0'] & 0x40 != 0)
+
+    @functools.cached_property
+    def limit_break(self) -> np.ndarray:
+        return self.damage & (self.flat['arg1'] & 0xf == 8)
+
+    @classmethod
+    def of(cls, message: 'zone_server.ActionEffectBase'):
+        """
+        arrays of a message struct on its own, the struct must cover the target ids
+        """
+        return cls(memoryview(message).cast('B'), type(message))
@@ -1,5 +1,6 @@
 import ctypes
 import logging
+import struct
 import zlib
 from typing import Iterable
 
@@ -14,6 +15,9 @@ header_size = ctypes.sizeof(BundleHeader)
 packet_header_offset = BundleHeader.size.offset
 el_header_size = ctypes.sizeof(ElementHeader)
 logger = logging.getLogger('Bundle')
+_u32_unpack_from = struct.Struct('<I').unpack_from
+_compress_type_offset = BundleHeader.compress_type.offset
+_compress_none = CompressType.none.value
 
 
 def unpack_message(data: bytearray, oodle: Oodle = None):
@@ -36,6 +40,26 @@ def unpack_message(data: bytearray, oodle: Oodle = None):
         msg_offset += el_header.size
 
 
+def unpack_message_view(view: memoryview, offset: int = 0, oodle: Oodle = None):
+    header = BundleHeader.from_buffer_copy(view, offset)
+    if header.compress_type == CompressType.none.value:
+        raw_messages = view
+        msg_offset = offset + header_size
+    elif header.compress_type == CompressType.zip.value:
+        raw_messages = memoryview(bytearray(zlib.decompress(view[offset + header_size + 2:offset + header.size], wbits=-zlib.MAX_WBITS)))
+        msg_offset = 0
+    elif header.compress_type == CompressType.oodle.value:
+        if oodle is None: raise ValueError('Oodle is not provided')
+        raw_messages = memoryview(oodle.decompress(view[offset + header_size:offset + header.size], header.size_before_compress))
+        msg_offset = 0
+    else:
+        raise TypeError(f'Unknown packet compression type: {header.compress_type}')
+    for i in range(header.element_count):
+        el_header = ElementHeader.from_buffer_copy(raw_messages, msg_offset)
+        yield header, el_header, raw_messages[msg_offset + el_header_size:msg_offset + el_header.size]
+        msg_offset += el_header.size
+
+
 def pack_message(header: BundleHeader, messages: Iterable[bytearray], oodle: Oodle = None):
     raw_message = bytearray()
     cnt = 0
@@ -89,3 +113,85 @@ def reset_buffer(buffer: bytearray):
         del buffer[:buffer.index(MAGIC_PREFIX, 1)]
     except ValueError:
         buffer.clear()
+
+
+class BundleDecoder:
+    # offset-advancing decode, yielded raw_data are memoryview slices of the receive buffer,
+    # if a yielded view is still alive when compacting, the unconsumed tail is moved to a new buffer instead
+
+    def __init__(self, oodle: Oodle = None, compact_threshold=0x10000):
+        self.oodle = oodle
+        self.buffer = bytearray()
+        self.offset = 0
+        self.compact_threshold = compact_threshold
+
+    def __len__(self):
+        return len(self.buffer) - self.offset
+
+    def clear(self):
+        self.buffer = bytearray()
+        self.offset = 0
+
+    def extend(self, data):
+        offset = self.offset
+        try:
+            if offset == len(self.buffer):
+                self.buffer.clear()
+                self.offset = 0
+            elif offset >= self.compact_threshold or offset * 2 > len(self.buffer):
+                del self.buffer[:offset]
+                self.offset = 0
+            self.buffer.extend(data)
+        except BufferError:  # still referenced by yielded messages
+            self.buffer = self.buffer[offset:] + data
+            self.offset = 0
+
+    def feed(self, data):
+        self.extend(data)
+        return self.decode()
+
+    def decode(self):
+        buffer = self.buffer
+        view = memoryview(buffer)
+        try:
+            end = len(buffer)
+            while (remain := end - (offset := self.offset)) > 0:
+                if not buffer.startswith(MAGIC_PREFIX, offset):
+                    if remain < packet_header_offset + 4:
+                        if any(view[offset:end]) and not MAGIC_PREFIX.startswith(view[offset:offset + prefix_len]):
+                            self.offset = end
+                        return
+                    if any(view[offset:offset + prefix_len]):
+                        self._reset(buffer, offset, end)
+                        continue
+                elif remain < packet_header_offset + 4:
+                    return
+                packet_size, = _u32_unpack_from(buffer, offset + packet_header_offset)
+                if packet_size <= header_size:
+                    self._reset(buffer, offset, end)
+                    continue
+                if packet_size > remain:
+                    return
+                self.offset = offset + packet_size
+                try:
+                    if buffer[offset + _compress_type_offset] == _compress_none:
+                        header = BundleHeader.from_buffer_copy(buffer, offset)
+                        msg_offset = offset + header_size
+                        for i in range(header.element_count):
+                            el_header = ElementHeader.from_buffer_copy(buffer, msg_offset)
+                            el_end = msg_offset + el_header.size
+                            yield BaseMessage(header, el_header, view[msg_offset + el_header_size:el_end])
+                            msg_offset = el_end
+                    else:
+                        for header, el_header, data in unpack_message_view(view[:offset + packet_size], offset, self.oodle):
+                            yield BaseMessage(header, el_header, data)
+                except Exception as e:
+                    logger.warning(f'error in unpacking message', exc_info=e)
+        finally:
+            view.release()
+
+    def _reset(self, buffer: bytearray, offset: int, end: int):
+        if (i := buffer.find(MAGIC_PREFIX, offset + 1, end)) < 0:
+            self.offset = end
+        else:
+            self.offset = i
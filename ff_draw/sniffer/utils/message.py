@@ -1,9 +1,11 @@
 import ctypes
 import dataclasses
 import enum
+import functools
 import typing
 from typing import TypeVar, Generic
 
+from .action_effect import ActionEffectArrays
 from .structs import IpcHeader, BundleHeader, ElementHeader
 
 T = TypeVar('T')
@@ -17,7 +19,7 @@ class IpcMessage(Generic[T]):
     el_header: ElementHeader
     element: IpcHeader
     message: T
-    raw_data: bytearray
+    raw_data: bytearray | memoryview
 
 
 @dataclasses.dataclass
@@ -25,7 +27,7 @@ class ElementMessage(Generic[T]):
     bundle_header: BundleHeader
     el_header: ElementHeader
     element: T
-    raw_data: bytearray
+    raw_data: bytearray | memoryview
 
     def to_ipc(self, other: typing.Type[T2] = None) -> IpcMessage[T2]:
         assert isinstance(self.element, IpcHeader)
@@ -40,7 +42,7 @@ class ElementMessage(Generic[T]):
 class BaseMessage:
     bundle_header: BundleHeader
     el_header: ElementHeader
-    raw_data: bytearray
+    raw_data: bytearray | memoryview
 
     def to_el(self, other: typing.Type[T] = None) -> ElementMessage[T]:
         raw = self.raw_data
@@ -61,6 +63,13 @@ class NetworkMessage(Generic[T]):
     header: ElementHeader
     message: T
 
+    @functools.cached_property
+    def action_effects(self) -> ActionEffectArrays:
+        """
+        effects of an ActionEffect message as arrays, decoded once for every subscriber
+        """
+        return ActionEffectArrays(self.raw_message.raw_data, type(self.message), _header_size)
+
 
 @dataclasses.dataclass
 class ActorControlMessage(Generic[T]):
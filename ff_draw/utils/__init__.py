@@ -1,2 +1,2 @@
-from .evt_queue import EvtQueue
+from .evt_queue import EvtQueue, BatchEvtQueue, LatencyHistogram
 from .watcher import work_watcher
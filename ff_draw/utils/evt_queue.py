@@ -1,6 +1,8 @@
+import bisect
 import logging
 import queue
 import threading
+import typing
 
 import time
 
@@ -50,3 +52,116 @@ class EvtQueue:
     def put(self, *args):
         self.start()
         self.msg_queue.put(args)
+
+
+class LatencyHistogram:
+    bounds = (.0001, .0005, .001, .005, .01, .05, .1, .5, 1)
+    labels = ('<100us', '<500us', '<1ms', '<5ms', '<10ms', '<50ms', '<100ms', '<500ms', '<1s', '>=1s')
+
+    def __init__(self):
+        self.buckets = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.
+        self.max = 0.
+
+    def add(self, t: float):
+        self.buckets[bisect.bisect_right(self.bounds, t)] += 1
+        self.count += 1
+        self.total += t
+        if t > self.max: self.max = t
+
+    @property
+    def avg(self):
+        return self.total / self.count if self.count else 0.
+
+
+class BatchEvtQueue:
+    def __init__(self, cb, timeout_cb=None, cbexc_cb=None, get_key=None, batch_size=256, timeout=.1, timeout_interval=.5):
+        self.cb = cb
+        self.timeout_cb = timeout_cb
+        self.cbexc_cb = cbexc_cb
+        self.get_key = get_key
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.timeout_interval = timeout_interval
+        self.msg_queue = queue.SimpleQueue()
+        self.current_args = None
+        self.current_start = 0.
+        self.latency: dict[typing.Any, LatencyHistogram] = {}
+        self.batch_count = 0
+        self.msg_count = 0
+        self.max_batch = 0
+        self.msg_loop_thread = threading.Thread(target=self.msg_loop, daemon=True)
+        self.msg_loop_watcher_thread = threading.Thread(target=self.msg_loop_watcher, daemon=True)
+        self.started = False
+
+    def msg_loop_watcher(self):
+        # only compare the start time of the running callback, the msg loop never waits for the watcher
+        warned_start = 0.
+        next_warn = 0.
+        while True:
+            time.sleep(self.timeout / 2)
+            if not (start := self.current_start): continue
+            args = self.current_args
+            if start != self.current_start: continue
+            now = time.perf_counter()
+            if now - start < self.timeout: continue
+            if start != warned_start:
+                warned_start = start
+                next_warn = now
+            if now >= next_warn:
+                next_warn = now + self.timeout_interval
+                if self.timeout_cb:
+                    self.timeout_cb(args, now - start, self)
+
+    def msg_loop(self):
+        get = self.msg_queue.get
+        get_nowait = self.msg_queue.get_nowait
+        perf_counter = time.perf_counter
+        while True:
+            batch = [get()]
+            try:
+                while len(batch) < self.batch_size:
+                    batch.append(get_nowait())
+            except queue.Empty:
+                pass
+            self.batch_count += 1
+            self.msg_count += len(batch)
+            if len(batch) > self.max_batch: self.max_batch = len(batch)
+            for args in batch:
+                self.current_args = args
+                self.current_start = start = perf_counter()
+                try:
+                    self.cb(*args)
+                except Exception as e:
+                    if self.cbexc_cb:
+                        self.cbexc_cb(e, args)
+                    else:
+                        logging.error(f'exception in cb, with {args=}', exc_info=e)
+                used = perf_counter() - start
+                self.current_start = 0.
+                if self.get_key:
+                    try:
+                        key = self.get_key(*args)
+                    except Exception:
+                        continue
+                    if (hist := self.latency.get(key)) is None:
+                        self.latency[key] = hist = LatencyHistogram()
+                    hist.add(used)
+            self.current_args = None
+
+    def clear_stat(self):
+        self.latency = {}
+        self.batch_count = 0
+        self.msg_count = 0
+        self.max_batch = 0
+
+    def start(self):
+        if not self.started:
+            self.started = True
+            self.msg_loop_thread.start()
+            self.msg_loop_watcher_thread.start()
+
+    def put(self, *args):
+        self.start()
+        self.msg_queue.put(args)
@@ -10,10 +10,8 @@ class Terrain:
 
     @classmethod
     def get(cls, sq_pack: 'SqPack', terrain_id) -> 'Terrain':
-        if (c := getattr(sq_pack, '__cached_terrain', None)) is None:
-            setattr(sq_pack, '__cached_terrain', c := {})
-        if terrain_id not in c: c[terrain_id] = cls(sq_pack, terrain_id)
-        return c[terrain_id]
+        # the files it opens are cached on their own, so it is not counted in the cache size
+        return sq_pack.pack.cache.get_or_load((cls, terrain_id), lambda: (cls(sq_pack, terrain_id), 0))
 
     __lv_scene = None
 
@@ -102,19 +102,17 @@ class LayerGroup(ctypes.Structure):
 
     @classmethod
     def get(cls, sq_pack: 'SqPack', path) -> 'LayerGroup|None':
-        if (c := getattr(sq_pack, '__cached_layer_group', None)) is None:
-            setattr(sq_pack, '__cached_layer_group', c := {})
-        if path not in c:
-            try:
-                buf = memoryview(sq_pack.pack.get_file(path).data_buffer)
-            except FileNotFoundError:
-                _logger.warning(f'file not found {path}')
-                c[path] = res = None
-            else:
-                c[path] = res = cls.from_buffer(find_binary_by_chunk_id(buf, b'LGP1', b'LGB1'))
-                res.path = path
-            return res
-        return c[path]
+        try:
+            return sq_pack.pack.get_parsed(path, cls, lambda: cls.load(sq_pack, path))
+        except FileNotFoundError:
+            _logger.warning(f'file not found {path}')
+            return None
+
+    @classmethod
+    def load(cls, sq_pack: 'SqPack', path) -> 'LayerGroup':
+        res = cls.from_buffer(find_binary_by_chunk_id(memoryview(sq_pack.pack.get_file(path).data_buffer), b'LGP1', b'LGB1'))
+        res.path = path
+        return res
 
     @functools.cached_property
     def layers(self):
@@ -59,19 +59,17 @@ class Scene(ctypes.Structure):
 
     @classmethod
     def get(cls, sq_pack: 'SqPack', path, file_id: bytes) -> 'Scene|None':
-        k = '__cached_scene_' + file_id.decode()
-        if (c := getattr(sq_pack, k, None)) is None: setattr(sq_pack, k, c := {})
-        if path not in c:
-            try:
-                buf = memoryview(sq_pack.pack.get_file(path).data_buffer)
-            except FileNotFoundError:
-                _logger.warning(f'file not found {path}')
-                c[path] = res = None
-            else:
-                c[path] = res = cls.from_buffer(find_binary_by_chunk_id(buf, b'SCN1', file_id))
-                res.path = path
-            return res
-        return c[path]
+        try:
+            return sq_pack.pack.get_parsed(path, (cls, file_id), lambda: cls.load(sq_pack, path, file_id))
+        except FileNotFoundError:
+            _logger.warning(f'file not found {path}')
+            return None
+
+    @classmethod
+    def load(cls, sq_pack: 'SqPack', path, file_id: bytes) -> 'Scene':
+        res = cls.from_buffer(find_binary_by_chunk_id(memoryview(sq_pack.pack.get_file(path).data_buffer), b'SCN1', file_id))
+        res.path = path
+        return res
 
     _layer_groups: 'fctypes.c_int32' = eval('0X0')
     layer_group_count: 'fctypes.c_int32' = eval('0X4')
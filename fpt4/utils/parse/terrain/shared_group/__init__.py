@@ -16,13 +16,13 @@ class SharedGroup(ctypes.Structure):
 
     @classmethod
     def get(cls, sq_pack: 'SqPack', path) -> 'SharedGroup':
-        if (c := getattr(sq_pack, '__cached_shared_group', None)) is None:
-            setattr(sq_pack, '__cached_shared_group', c := {})
-        if path not in c:
-            c[path] = res = cls.from_buffer(find_binary_by_chunk_id(
-                memoryview(sq_pack.pack.get_file(path).data_buffer),
-                b'SCN1', b'SGB1'
-            ))
-            res.path = path
-            return res
-        return c[path]
+        return sq_pack.pack.get_parsed(path, cls, lambda: cls.load(sq_pack, path))
+
+    @classmethod
+    def load(cls, sq_pack: 'SqPack', path) -> 'SharedGroup':
+        res = cls.from_buffer(find_binary_by_chunk_id(
+            memoryview(sq_pack.pack.get_file(path).data_buffer),
+            b'SCN1', b'SGB1'
+        ))
+        res.path = path
+        return res
@@ -1,7 +1,10 @@
 import dataclasses
+import functools
+import os
 import struct
 import typing
 from .mesh import Mesh
+from .bvh import MeshBVH
 
 if typing.TYPE_CHECKING:
     from fpt4.utils.sqpack import SqPack
@@ -36,13 +39,12 @@ class TerrainData:
 
 class TerrainMesh:
     @classmethod
-    def get(cls, sq_pack: 'SqPack', path) -> 'TerrainMesh':
-        if (c := getattr(sq_pack, '__cached_terrain_mesh', None)) is None:
-            setattr(sq_pack, '__cached_terrain_mesh', c := {})
-        if path not in c: c[path] = cls(sq_pack, path)
-        return c[path]
+    def get(cls, sq_pack: 'SqPack', path: str | bytes) -> 'TerrainMesh':
+        path = os.fsencode(path)
+        return sq_pack.pack.get_parsed(path + b'/list.pcb', cls, lambda: cls(sq_pack, path))
 
-    def __init__(self, sq_pack: 'SqPack', terrain_path: bytes):
+    def __init__(self, sq_pack: 'SqPack', terrain_path: str | bytes):
+        terrain_path = os.fsencode(terrain_path)
         self.sq_pack = sq_pack
         self.index_view = memoryview(self.sq_pack.pack.get_file(terrain_path + b'/list.pcb').data_buffer)
         self.index_header = TerrainHeader(*TerrainHeader.struct_.unpack_from(self.index_view))
@@ -54,3 +56,8 @@ class TerrainMesh:
         ]
         for m in self.state_table:
             m.mesh = Mesh.get(self.sq_pack, b'%s/tr%04d.pcb' % (terrain_path, m.mesh_id))
+
+    @functools.cached_property
+    def bvh(self) -> MeshBVH:
+        # packed triangles of every mesh for batched ray cast and height queries
+        return MeshBVH.from_meshes(m.mesh for m in self.state_table)
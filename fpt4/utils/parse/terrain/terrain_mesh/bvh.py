@@ -0,0 +1,173 @@
+import typing
+
+import numpy as np
+
+if typing.TYPE_CHECKING:
+    from .mesh import Mesh
+
+EPSILON = 1e-7
+RAY_CHUNK = 4096  # rays traversed together, bounds the size of the (ray, node) pair arrays
+
+
+def _spread_bits(v: np.ndarray):
+    # 10 bit integers to every third bit of 30, for the morton code
+    v = v.astype(np.uint32) & 0x3FF
+    v = (v | v << 16) & 0x030000FF
+    v = (v | v << 8) & 0x0300F00F
+    v = (v | v << 4) & 0x030C30C3
+    v = (v | v << 2) & 0x09249249
+    return v
+
+
+def _points(p, size=3) -> np.ndarray:
+    return np.asarray(p, np.float64).reshape(-1, size)
+
+
+def _slab(box_min, box_max, origins, inv_dirs, max_t):
+    with np.errstate(invalid='ignore'):
+        t0 = (box_min - origins) * inv_dirs
+        t1 = (box_max - origins) * inv_dirs
+    # nan when the origin is on a slab plane of a parallel ray, fmin/fmax keep the other bound then
+    near = np.fmax.reduce(np.fmin(t0, t1), axis=1)
+    far = np.fmin.reduce(np.fmax(t0, t1), axis=1)
+    return (near <= far) & (far >= 0) & (near <= max_t)
+
+
+class MeshBVH:
+    """
+    triangles of collision meshes packed into numpy arrays, with an aabb tree over groups of leaf_size triangles in morton order
+
+    levels[0] are the leaves, node i of a level has children 2i and 2i+1 on the level below, the last level is the root
+    """
+
+    def __init__(self, vertices: np.ndarray, triangles: np.ndarray, attrs: np.ndarray = None, leaf_size=8):
+        self.vertices = np.ascontiguousarray(vertices, np.float32).reshape(-1, 3)
+        triangles = np.asarray(triangles, np.int32).reshape(-1, 3)
+        attrs = np.zeros(len(triangles), np.uint64) if attrs is None else np.asarray(attrs, np.uint64)
+        self.leaf_size = leaf_size
+        if len(triangles):
+            centers = self.vertices[triangles].mean(axis=1)
+            low, high = centers.min(axis=0), centers.max(axis=0)
+            # same scale on every axis, or flat terrain would be ordered by height first
+            q = ((centers - low) / max((high - low).max(), EPSILON) * 1023).astype(np.uint32)
+            order = np.argsort(_spread_bits(q[:, 0]) | _spread_bits(q[:, 1]) << 1 | _spread_bits(q[:, 2]) << 2, kind='stable')
+            triangles, attrs = triangles[order], attrs[order]
+        self.triangles = triangles
+        self.attrs = attrs
+        self.corners = self.vertices[triangles].astype(np.float64)  # (n, 3 vertex, xyz)
+
+        self.levels: list[tuple[np.ndarray, np.ndarray]] = []
+        if len(triangles):
+            starts = np.arange(0, len(triangles), leaf_size)
+            box_min = np.minimum.reduceat(self.corners.min(axis=1), starts, axis=0)
+            box_max = np.maximum.reduceat(self.corners.max(axis=1), starts, axis=0)
+            self.levels.append((box_min, box_max))
+            while len(box_min) > 1:
+                pairs = np.arange(0, len(box_min), 2)
+                box_min = np.minimum.reduceat(box_min, pairs, axis=0)
+                box_max = np.maximum.reduceat(box_max, pairs, axis=0)
+                self.levels.append((box_min, box_max))
+
+    @classmethod
+    def from_meshes(cls, meshes: 'typing.Iterable[Mesh]', leaf_size=8):
+        vertices, triangles, attrs = [], [], []
+        base = 0
+        for mesh in meshes:
+            vertices.append(mesh.vertices)
+            triangles.append(mesh.triangles + base)
+            attrs.append(mesh.polygons['attr'])
+            base += len(mesh.vertices)
+        return cls(
+            np.concatenate(vertices) if vertices else np.empty((0, 3), np.float32),
+            np.concatenate(triangles) if triangles else np.empty((0, 3), np.int32),
+            np.concatenate(attrs) if attrs else np.empty(0, np.uint64),
+            leaf_size,
+        )
+
+    @property
+    def bounds(self) -> tuple[np.ndarray, np.ndarray] | None:
+        if not self.levels: return None
+        box_min, box_max = self.levels[-1]
+        return box_min[0], box_max[0]
+
+    def _leaf_pairs(self, origins, inv_dirs, max_t):
+        rays = np.arange(len(origins))
+        nodes = np.zeros(len(origins), np.int64)
+        for depth in range(len(self.levels) - 1, -1, -1):
+            box_min, box_max = self.levels[depth]
+            hit = _slab(box_min[nodes], box_max[nodes], origins[rays], inv_dirs[rays], max_t[rays])
+            rays, nodes = rays[hit], nodes[hit]
+            if depth:
+                rays = np.repeat(rays, 2)
+                nodes = (nodes[:, None] * 2 + (0, 1)).reshape(-1)
+                keep = nodes < len(self.levels[depth - 1][0])
+                rays, nodes = rays[keep], nodes[keep]
+        return rays, nodes
+
+    def _cast(self, origins, directions, max_t):
+        res_t = np.full(len(origins), np.inf)
+        res_tri = np.full(len(origins), -1, np.int64)
+        if not self.levels: return res_t, res_tri
+        with np.errstate(divide='ignore'):
+            inv_dirs = 1 / directions
+        rays, leaves = self._leaf_pairs(origins, inv_dirs, max_t)
+        rays = np.repeat(rays, self.leaf_size)
+        tris = (leaves[:, None] * self.leaf_size + np.arange(self.leaf_size)).reshape(-1)
+        keep = tris < len(self.triangles)
+        rays, tris = rays[keep], tris[keep]
+
+        # moller-trumbore on every (ray, triangle) pair, both faces count as hit
+        v0, v1, v2 = self.corners[tris, 0], self.corners[tris, 1], self.corners[tris, 2]
+        d = directions[rays]
+        e1, e2 = v1 - v0, v2 - v0
+        p = np.cross(d, e2)
+        det = np.einsum('ij,ij->i', e1, p)
+        valid = np.abs(det) > EPSILON
+        inv_det = np.divide(1, det, out=np.zeros_like(det), where=valid)
+        s = origins[rays] - v0
+        u = np.einsum('ij,ij->i', s, p) * inv_det
+        q = np.cross(s, e1)
+        v = np.einsum('ij,ij->i', d, q) * inv_det
+        t = np.einsum('ij,ij->i', e2, q) * inv_det
+        valid &= (u >= 0) & (v >= 0) & (u + v <= 1) & (t >= 0) & (t <= max_t[rays])
+        rays, tris, t = rays[valid], tris[valid], t[valid]
+
+        np.minimum.at(res_t, rays, t)
+        nearest = t == res_t[rays]
+        res_tri[rays[nearest]] = tris[nearest]
+        return res_t, res_tri
+
+    def ray_cast(self, origins, directions, max_distance=np.inf) -> tuple[np.ndarray, np.ndarray]:
+        """
+        distance to the nearest triangle hit by each ray (inf for no hit) and the index of the triangle (-1 for no hit)
+        """
+        origins = _points(origins)
+        directions = _points(directions)
+        directions = directions / np.linalg.norm(directions, axis=1, keepdims=True)
+        max_t = np.broadcast_to(np.asarray(max_distance, np.float64), len(origins))
+        distances = np.empty(len(origins))
+        triangles = np.empty(len(origins), np.int64)
+        for i in range(0, len(origins), RAY_CHUNK):
+            s = slice(i, i + RAY_CHUNK)
+            distances[s], triangles[s] = self._cast(origins[s], directions[s], max_t[s])
+        return distances, triangles
+
+    def segment_hit(self, starts, ends) -> np.ndarray:
+        """
+        whether any triangle is between start and end, line of sight is the negation
+        """
+        starts = _points(starts)
+        directions = _points(ends) - starts
+        return np.isfinite(self.ray_cast(starts, directions, np.linalg.norm(directions, axis=1))[0])
+
+    def height_at(self, xz, from_y=None) -> np.ndarray:
+        """
+        y of the highest triangle under each (x, z), or under (x, from_y, z) when from_y is given, nan for no ground
+        """
+        xz = _points(xz, 2)
+        if (bounds := self.bounds) is None: return np.full(len(xz), np.nan)
+        top = bounds[1][1] + 1 if from_y is None else np.broadcast_to(np.asarray(from_y, np.float64), len(xz))
+        origins = np.empty((len(xz), 3))
+        origins[:, 0], origins[:, 1], origins[:, 2] = xz[:, 0], top, xz[:, 1]
+        distances, _ = self.ray_cast(origins, np.broadcast_to((0., -1., 0.), origins.shape), origins[:, 1] - bounds[0][1] + 1)
+        return np.where(np.isfinite(distances), origins[:, 1] - distances, np.nan)
@@ -1,6 +1,10 @@
+import functools
 import typing
 import struct
-from .node import NodeV1, NodeV0
+
+import numpy as np
+
+from .node import NodeV1, NodeV0, read_node_tree
 
 if typing.TYPE_CHECKING:
     from fpt4.utils.sqpack import SqPack
@@ -15,34 +19,38 @@ class PcbHeader(typing.NamedTuple):
 
 
 class Mesh:
-    nodes: list[NodeV1]
+    node_table: np.ndarray  # node.NODE_DTYPE
+    vertices: np.ndarray  # (n, 3) float32 of every node
+    polygons: np.ndarray  # POLYGON_DTYPE of every node, vertex indexes are local to the node
+    triangles: np.ndarray  # (n, 3) int32 indexes into vertices
 
     @classmethod
     def get(cls, sq_pack: 'SqPack', path) -> 'Mesh':
-        if (c := getattr(sq_pack, '__cached_pcb_mesh', None)) is None:
-            setattr(sq_pack, '__cached_pcb_mesh', c := {})
-        if path not in c:
-            c[path] = cls(sq_pack, path)
-        return c[path]
+        return sq_pack.pack.get_parsed(path, cls, lambda: cls(sq_pack, path))
 
     def __init__(self, sq_pack: 'SqPack', mesh_path: bytes):
         self.path = mesh_path
         self.sq_pack = sq_pack
-        view = memoryview(sq_pack.pack.get_file(mesh_path).data_buffer)
-        self.header = PcbHeader._make(PcbHeader.struct_.unpack_from(view))
-        self.nodes = []
+        self._load(sq_pack.pack.get_file(mesh_path).data_buffer)
+
+    def _load(self, buffer):
+        self.buffer = buffer
+        self.header = PcbHeader._make(PcbHeader.struct_.unpack_from(buffer))
         version = self.header.version
         if version == 1 or version == 4:
-            self.__add_node(NodeV1(view[PcbHeader.struct_.size:]))
+            self.node_type = NodeV1
         elif version == 0:
-            self.__add_node(NodeV0(view[PcbHeader.struct_.size:]))
+            self.node_type = NodeV0
         else:
             raise NotImplementedError(f'unknown version {version}')
-
-    def __add_node(self, _node: NodeV1 | NodeV0):
-        if _node.vertex or _node.polygons:
-            self.nodes.append(_node)
-        if _node.child0:
-            self.__add_node(_node.child0)
-        if _node.child1:
-            self.__add_node(_node.child1)
+        self.node_table, self.vertices, self.polygons = read_node_tree(buffer, PcbHeader.struct_.size, self.node_type.header_type)
+        base = np.repeat(self.node_table['vertex_start'], self.node_table['polygon_num'])
+        self.triangles = np.stack([self.polygons['p0'], self.polygons['p1'], self.polygons['p2']], axis=1).astype(np.int32) + base[:, None]
+
+    @functools.cached_property
+    def nodes(self) -> list[NodeV1 | NodeV0]:
+        # nodes with vertices or polygons, decoded again on first use for code working on single nodes
+        return [
+            self.node_type(self.buffer, int(n['offset']), False)
+            for n in self.node_table if n['vertex_stop'] > n['vertex_start'] or n['polygon_num']
+        ]
@@ -1,9 +1,18 @@
 import typing
 import struct
-from glm import vec3
-from ...utils import vec3_from_buffer
+
+import numpy as np
 
 CompVertex3Struct = struct.Struct(b'3H')
+# polygons are packed in network order like Polygon.struct_
+POLYGON_DTYPE = np.dtype([('p0', 'u1'), ('p1', 'u1'), ('p2', 'u1'), ('pad_', 'u1'), ('attr', '>u8')])
+# the node tree flattened in depth first order, children are node indexes and -1 for no child,
+# vertex and polygon ranges index the arrays of every node, vertices of a node are its float vertices then the compressed ones
+NODE_DTYPE = np.dtype([
+    ('offset', '<i8'), ('child0', '<i4'), ('child1', '<i4'), ('aabb_min', '<f4', 3), ('aabb_max', '<f4', 3),
+    ('float_vertex_num', '<i8'), ('vertex_num', '<i8'), ('polygon_num', '<i8'),
+    ('vertex_start', '<i8'), ('vertex_stop', '<i8'), ('polygon_start', '<i8'), ('polygon_stop', '<i8'),
+])
 
 
 class Polygon(typing.NamedTuple):
@@ -31,30 +40,6 @@ class HeaderV0(typing.NamedTuple):
     struct_ = struct.Struct(b'4i6f2i')
 
 
-class NodeV0:
-    def __init__(self, view):
-        self.header = HeaderV0._make(HeaderV0.struct_.unpack_from(view))
-        print(self.header)
-        if self.header.child0 > 0 and self.header.child1 > 0:
-            self.child0 = NodeV0(view[self.header.child0:])
-            self.child1 = NodeV0(view[self.header.child1:])
-        else:
-            self.child0 = None
-            self.child1 = None
-        comp_vertex_offset = HeaderV0.struct_.size
-        polygon_offset = comp_vertex_offset + CompVertex3Struct.size * self.header.vertex_num
-
-        self.polygons = [Polygon._make(t) for t in Polygon.struct_.iter_unpack(view[polygon_offset:polygon_offset + Polygon.struct_.size * self.header.polygon_num])]
-
-        min_x = self.header.aabb_min_x
-        min_y = self.header.aabb_min_y
-        min_z = self.header.aabb_min_z
-        scale_x = (self.header.aabb_max_x - min_x) / 65535
-        scale_y = (self.header.aabb_max_y - min_y) / 65535
-        scale_z = (self.header.aabb_max_z - min_z) / 65535
-        self.vertex = [vec3(x * scale_x + min_x, y * scale_y + min_y, z * scale_z + min_z) for x, y, z in CompVertex3Struct.iter_unpack(view[comp_vertex_offset:polygon_offset])]
-
-
 class HeaderV1(typing.NamedTuple):
     magic: int
     version: int
@@ -73,22 +58,92 @@ class HeaderV1(typing.NamedTuple):
     struct_ = struct.Struct(b'4i6f4H')
 
 
-class NodeV1:
-    def __init__(self, view):
-        self.header = HeaderV1._make(HeaderV1.struct_.unpack_from(view))
-        self.child0 = NodeV1(view[self.header.child0:]) if self.header.child0 > 0 else None
-        self.child1 = NodeV1(view[self.header.child1:]) if self.header.child1 > 0 else None
-        float_vertex_offset = HeaderV1.struct_.size
-        comp_vertex_offset = float_vertex_offset + 12 * self.header.float_vertex_num
-        polygon_offset = comp_vertex_offset + CompVertex3Struct.size * self.header.vertex_num
-        self.vertex = [vec3_from_buffer(view, float_vertex_offset + i * 12) for i in range(self.header.float_vertex_num)]
-        self.polygons = [Polygon._make(t) for t in Polygon.struct_.iter_unpack(view[polygon_offset:polygon_offset + Polygon.struct_.size * self.header.polygon_num])]
-
-        min_x = self.header.aabb_min_x
-        min_y = self.header.aabb_min_y
-        min_z = self.header.aabb_min_z
-        scale_x = (self.header.aabb_max_x - min_x) / 65535
-        scale_y = (self.header.aabb_max_y - min_y) / 65535
-        scale_z = (self.header.aabb_max_z - min_z) / 65535
-        for x, y, z in CompVertex3Struct.iter_unpack(view[comp_vertex_offset:polygon_offset]):
-            self.vertex.append(vec3(x * scale_x + min_x, y * scale_y + min_y, z * scale_z + min_z))
+def read_node(buffer, offset: int, header_type: type[HeaderV0] | type[HeaderV1]):
+    """
+    header, vertices as (n, 3) float32 and polygons as POLYGON_DTYPE of the node at offset
+    """
+    header = header_type._make(header_type.struct_.unpack_from(buffer, offset))
+    float_vertex_num = getattr(header, 'float_vertex_num', 0)
+    float_vertex_offset = offset + header_type.struct_.size
+    comp_vertex_offset = float_vertex_offset + 12 * float_vertex_num
+    polygon_offset = comp_vertex_offset + CompVertex3Struct.size * header.vertex_num
+
+    comp_vertex = np.frombuffer(buffer, '<u2', header.vertex_num * 3, comp_vertex_offset).reshape(-1, 3)
+    aabb_min = np.array(header[4:7])
+    scale = (np.array(header[7:10]) - aabb_min) / 65535
+    vertex = np.empty((float_vertex_num + header.vertex_num, 3), np.float32)
+    vertex[:float_vertex_num] = np.frombuffer(buffer, '<f4', float_vertex_num * 3, float_vertex_offset).reshape(-1, 3)
+    vertex[float_vertex_num:] = comp_vertex * scale + aabb_min
+    polygons = np.frombuffer(buffer, POLYGON_DTYPE, header.polygon_num, polygon_offset)
+    return header, vertex, polygons
+
+
+def child_offsets(header: HeaderV0 | HeaderV1) -> tuple[int, int]:
+    # relative to the node, 0 for no child, v0 nodes only have children in pairs
+    if isinstance(header, HeaderV0) and not (header.child0 > 0 and header.child1 > 0): return 0, 0
+    return max(header.child0, 0), max(header.child1, 0)
+
+
+def _gather(buf: np.ndarray, starts: np.ndarray, counts: np.ndarray, item_size: int) -> np.ndarray:
+    # bytes of counts[i] records of item_size at starts[i] for every i, one row per record
+    first = np.cumsum(counts) - counts
+    record_starts = np.repeat(starts - first * item_size, counts) + np.arange(counts.sum()) * item_size
+    return buf[record_starts[:, None] + np.arange(item_size)]
+
+
+def read_node_tree(buffer, offset: int, header_type: type[HeaderV0] | type[HeaderV1]):
+    """
+    every node from offset down as a NODE_DTYPE table, with the vertices and polygons of all nodes
+    """
+    header_struct = header_type.struct_
+    nodes = []
+    stack = [(offset, -1, 0)]  # offset, parent index, child slot
+    while stack:
+        offset, parent, slot = stack.pop()
+        header = header_type._make(header_struct.unpack_from(buffer, offset))
+        if parent >= 0: nodes[parent][1 + slot] = len(nodes)
+        nodes.append([offset, -1, -1, header[4:7], header[7:10], getattr(header, 'float_vertex_num', 0), header.vertex_num, header.polygon_num, 0, 0, 0, 0])
+        child0, child1 = child_offsets(header)
+        if child1: stack.append((offset + child1, len(nodes) - 1, 1))
+        if child0: stack.append((offset + child0, len(nodes) - 1, 0))
+
+    table = np.array([tuple(n) for n in nodes], NODE_DTYPE)
+    float_num, comp_num = table['float_vertex_num'], table['vertex_num']
+    table['vertex_stop'] = np.cumsum(float_num + comp_num)
+    table['vertex_start'] = table['vertex_stop'] - float_num - comp_num
+    table['polygon_stop'] = np.cumsum(table['polygon_num'])
+    table['polygon_start'] = table['polygon_stop'] - table['polygon_num']
+
+    buf = np.frombuffer(buffer, np.uint8)
+    float_starts = table['offset'] + header_struct.size
+    comp_starts = float_starts + 12 * float_num
+    polygon_starts = comp_starts + CompVertex3Struct.size * comp_num
+    aabb_min = table['aabb_min'].astype(np.float64)
+    scale = (table['aabb_max'] - aabb_min) / 65535
+
+    vertices = np.empty((table['vertex_stop'][-1], 3), np.float32)
+    local = np.arange(len(vertices)) - np.repeat(table['vertex_start'], float_num + comp_num)
+    is_float = local < np.repeat(float_num, float_num + comp_num)
+    vertices[is_float] = _gather(buf, float_starts, float_num, 12).view('<f4')
+    comp_vertex = _gather(buf, comp_starts, comp_num, CompVertex3Struct.size).view('<u2')
+    vertices[~is_float] = comp_vertex * np.repeat(scale, comp_num, axis=0) + np.repeat(aabb_min, comp_num, axis=0)
+    polygons = _gather(buf, polygon_starts, table['polygon_num'], POLYGON_DTYPE.itemsize).view(POLYGON_DTYPE).reshape(-1)
+    return table, vertices, polygons
+
+
+class Node:
+    header_type: type[HeaderV0] | type[HeaderV1]
+
+    def __init__(self, view, offset=0, read_children=True):
+        self.header, self.vertex, self.polygons = read_node(view, offset, self.header_type)
+        child0, child1 = child_offsets(self.header) if read_children else (0, 0)
+        self.child0 = type(self)(view, offset + child0) if child0 else None
+        self.child1 = type(self)(view, offset + child1) if child1 else None
+
+
+class NodeV0(Node):
+    header_type = HeaderV0
+
+
+class NodeV1(Node):
+    header_type = HeaderV1
@@ -12,16 +12,18 @@ _cached_sqpack = {}
 
 
 class SqPack:
-    def __init__(self, game_path: str | Path, default_language: Language = Language.en):
+    def __init__(self, game_path: str | Path, default_language: Language = Language.en, index_cache_directory: str | Path | None = None):
         _cached_sqpack[game_path, default_language] = self
         self.game_path = game_path if isinstance(game_path, Path) else Path(game_path)
-        self.pack = PackManager(self.game_path / 'sqpack')
-        self.exd = ExdManager(self.pack, default_language=default_language)
+        ver_file = self.game_path / 'ffxivgame.ver'
+        self.game_version = ver_file.read_text().strip() if ver_file.exists() else None
+        self.pack = PackManager(self.game_path / 'sqpack', index_cache_directory)
+        self.exd = ExdManager(self.pack, default_language=default_language, game_version=self.game_version)
         if not _pure_exd:
             self.sheets = Sheets(self)
 
     @classmethod
-    def get(cls, game_path: str | Path = None, default_language: Language = Language.en) -> 'SqPack':
+    def get(cls, game_path: str | Path = None, default_language: Language = Language.en, index_cache_directory: str | Path | None = None) -> 'SqPack':
         if game_path is None: return next(iter(_cached_sqpack.values()))
         game_path = (Path(game_path) if isinstance(game_path, str) else game_path).absolute()
-        return _cached_sqpack.get((game_path, default_language)) or SqPack(game_path, default_language)
+        return _cached_sqpack.get((game_path, default_language)) or SqPack(game_path, default_language, index_cache_directory)
@@ -1,4 +1,5 @@
 from os import environ
+from pathlib import Path
 from typing import TYPE_CHECKING, Set, Dict, Type, TypeVar
 from enum import Enum
 from logging import getLogger
@@ -21,8 +22,9 @@ class ExdManager:
     exd_pack: 'Pack | None' = None
     logger = getLogger('SqPack/ExdManager')
 
-    def __init__(self, pack: 'PackManager', default_language: Language = Language.en, res_path = b"exd/root.exl"):
+    def __init__(self, pack: 'PackManager', default_language: Language = Language.en, res_path = b"exd/root.exl", game_version: str | None = None):
         self.default_language = default_language
+        self.game_version = game_version
         self.sheets = {}
         self.pack = pack
         self.logger.debug('init exd with language %s', self.default_language.name)
@@ -50,6 +52,11 @@ class ExdManager:
         self.available_sheets = available_sheets
         self.sheet_identifiers = sheet_identifiers
 
+    def get_index_cache_path(self, name: str) -> Path | None:
+        # sheet indexes are saved next to the pack index cache, one directory per game version
+        if self.game_version is None or self.pack.index_cache_directory is None: return None
+        return self.pack.index_cache_directory / 'exd' / self.game_version / f'{name}.npz'
+
     def get_sheet_raw(self, name_or_id: str | int, lazy=True, row_type=None) -> Sheet:
         sheet_name = name_or_id if isinstance(name_or_id, str) else self.sheet_identifiers[name_or_id]
         if sheet_name in self.sheets: return self.sheets[sheet_name]
@@ -0,0 +1,149 @@
+import struct
+import typing
+
+import numpy as np
+
+from fpt4.utils.se_string import SeString
+
+if typing.TYPE_CHECKING:
+    from .sheet import BlockSheet, LangSheet
+
+# exd stores big endian values, fixed size column types to numpy types
+COLUMN_DTYPES = {
+    0x0001: np.dtype('u1'),  # bool, compared to 0
+    0x0002: np.dtype('i1'),
+    0x0003: np.dtype('u1'),
+    0x0004: np.dtype('>i2'),
+    0x0005: np.dtype('>u2'),
+    0x0006: np.dtype('>i4'),
+    0x0007: np.dtype('>u4'),
+    0x0009: np.dtype('>f4'),
+    0x000B: np.dtype('>i8'),
+    **{0x19 + i: np.dtype('u1') for i in range(0, 8)},  # bit_field
+}
+STRING_OFFSET_DTYPE = np.dtype('>i4')
+
+
+def row_positions(block_sheet: 'BlockSheet'):
+    """
+    keys and data offsets of every row in a block, sub rows are flattened with their sub key,
+    with more than one sub key level the sub keys are rows of (n, subkey_count - 1)
+    """
+    if (res := getattr(block_sheet, '_row_positions', None)) is not None: return res
+    subkey_count = block_sheet.sheet.header.header.subkey_count
+    keys = np.fromiter(block_sheet.row_offset_map.keys(), np.int64, len(block_sheet.row_offset_map))
+    offsets = np.fromiter(block_sheet.row_offset_map.values(), np.int64, len(block_sheet.row_offset_map))
+    buf = np.frombuffer(block_sheet.buffer, np.uint8)
+    if subkey_count <= 1:
+        res = keys, None, offsets + 6
+    elif subkey_count == 2:
+        # row header is size(>l) and count(>h), then count of (sub key(>h), data)
+        counts = _gather(buf, offsets + 4, np.dtype('>i2')).astype(np.int64)
+        step = block_sheet.sheet.header.header.binary_data_length + 2
+        starts = np.repeat(offsets + 6, counts)
+        group_start = np.repeat(np.cumsum(counts) - counts, counts)
+        sub_offsets = starts + (np.arange(counts.sum()) - group_start) * step
+        res = np.repeat(keys, counts), _gather(buf, sub_offsets, np.dtype('>i2')).astype(np.int64), sub_offsets + 2
+    else:
+        res = _nested_row_positions(block_sheet, keys.tolist(), offsets.tolist(), subkey_count)
+    block_sheet._row_positions = res
+    return res
+
+
+def _nested_row_positions(block_sheet: 'BlockSheet', keys: list[int], offsets: list[int], subkey_count: int):
+    # sub rows holding sub rows are walked row by row the same way as SubDataRow
+    buffer = block_sheet.buffer
+    step = block_sheet.sheet.header.header.binary_data_length + 2
+    res_keys, res_sub_keys, res_offsets = [], [], []
+
+    def walk(key, sub_key, offset):
+        count, = struct.unpack_from('>h', buffer, offset + 4)
+        o = offset + 6
+        for _ in range(count):
+            _key, = struct.unpack_from('>h', buffer, o)
+            if len(sub_key) + 2 == subkey_count:
+                res_keys.append(key)
+                res_sub_keys.append(sub_key + (_key,))
+                res_offsets.append(o + 2)
+                o += step
+            else:
+                walk(key, sub_key + (_key,), o + 2)
+                o += struct.unpack_from('>l', buffer, o + 2)[0]
+
+    for key, offset in zip(keys, offsets):
+        walk(key, (), offset)
+    return (
+        np.array(res_keys, np.int64),
+        np.array(res_sub_keys, np.int64).reshape(-1, subkey_count - 1),
+        np.array(res_offsets, np.int64),
+    )
+
+
+def _gather(buf: np.ndarray, offsets: np.ndarray, dtype: np.dtype):
+    return buf[offsets[:, None] + np.arange(dtype.itemsize)].view(dtype).reshape(-1)
+
+
+def read_fixed(buf: np.ndarray, offsets: np.ndarray, col_type: int):
+    if (dtype := COLUMN_DTYPES.get(col_type)) is None:
+        raise TypeError(f'column type {col_type:#x} is not fixed size')
+    values = _gather(buf, offsets, dtype)
+    if col_type == 0x0001: return values != 0
+    if col_type >= 0x19: return (values >> (col_type - 0x19) & 1) != 0
+    return values.astype(dtype.newbyteorder('='))
+
+
+class StringColumn:
+    """
+    offsets of a string column into the block buffers, strings are decoded on access
+    """
+
+    def __init__(self, lang_sheet: 'LangSheet', buffers: list, blocks: np.ndarray, offsets: np.ndarray):
+        self.lang_sheet = lang_sheet
+        self.buffers = buffers
+        self.blocks = blocks
+        self.offsets = offsets  # -1 for no string
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def raw(self, i: int) -> bytes | None:
+        if (start := int(self.offsets[i])) < 0: return None
+        buffer = self.buffers[self.blocks[i]]
+        return bytes(buffer[start:buffer.find(b'\0', start)])
+
+    def __getitem__(self, i: int) -> SeString | None:
+        if not (buf := self.raw(i)): return None
+        if buf.startswith(b'_rsv_'):
+            # same as reader.bytes_reader, reserved strings are given at runtime
+            buf = self.lang_sheet.sheet.mgr.rsv_string.get(buf.decode('utf-8', errors='ignore'), buf)
+        return SeString.from_buffer(buf)
+
+    def __iter__(self):
+        for i in range(len(self.offsets)): yield self[i]
+
+
+def read_columns(lang_sheet: 'LangSheet', col_ids: typing.Iterable[int]):
+    """
+    read columns of every row in every block, returns keys, sub keys (or None), block index per row and the column values
+    """
+    header = lang_sheet.sheet.header
+    lang_sheet.check_is_all_block_initialized()
+    block_sheets = [lang_sheet.range_to_block_sheet_map[r] for r in header.blocks if r in lang_sheet.range_to_block_sheet_map]
+    sub_key_shape = (header.header.subkey_count - 1,) if header.header.subkey_count > 2 else ()
+    positions = [row_positions(b) for b in block_sheets] or [(np.empty(0, np.int64), np.empty((0, *sub_key_shape), np.int64), np.empty(0, np.int64))]
+    buffers = [np.frombuffer(b.buffer, np.uint8) for b in block_sheets] or [np.empty(0, np.uint8)]
+    data_offsets = [o for _, _, o in positions]
+    blocks = np.concatenate([np.full(len(k), i, np.uint16) for i, (k, _, _) in enumerate(positions)])
+    values = []
+    for col_id in col_ids:
+        col = header.columns[col_id]
+        if col.type == 0:
+            # string column stores an offset from the end of the fixed data
+            offsets = np.concatenate([_gather(buf, o + col.offset, STRING_OFFSET_DTYPE).astype(np.int64) for buf, o in zip(buffers, data_offsets)])
+            ends = np.concatenate(data_offsets) + header.header.binary_data_length
+            values.append(StringColumn(lang_sheet, [b.buffer for b in block_sheets], blocks, np.where(offsets >= 0, ends + offsets, -1)))
+        else:
+            values.append(np.concatenate([read_fixed(buf, o + col.offset, col.type) for buf, o in zip(buffers, data_offsets)]))
+    keys = np.concatenate([k for k, _, _ in positions])
+    sub_keys = np.concatenate([sk for _, sk, _ in positions]) if header.header.subkey_count > 1 else None
+    return keys, sub_keys, blocks, values
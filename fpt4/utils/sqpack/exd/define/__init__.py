@@ -0,0 +1,52 @@
+"""
+row types of exd sheets, split by the first letter of the sheet name and only imported when a sheet of the module is used
+"""
+import importlib
+import typing
+
+from ._index import sheet_modules
+
+if typing.TYPE_CHECKING:
+    from ._a import *
+    from ._b import *
+    from ._c import *
+    from ._d import *
+    from ._e import *
+    from ._f import *
+    from ._g import *
+    from ._h import *
+    from ._i import *
+    from ._j import *
+    from ._k import *
+    from ._l import *
+    from ._m import *
+    from ._n import *
+    from ._o import *
+    from ._p import *
+    from ._q import *
+    from ._r import *
+    from ._s import *
+    from ._t import *
+    from ._u import *
+    from ._v import *
+    from ._w import *
+    from ._x import *
+    from ._y import *
+    from ._z import *
+
+
+def load_module(module_name: str):
+    module = importlib.import_module(f'{__name__}.{module_name}')
+    # later definitions of a sheet win, like they did in a single module
+    globals().update({k: getattr(module, k) for k, m in sheet_modules.items() if m == module_name})
+    return module
+
+
+def __getattr__(name: str):
+    if (module_name := sheet_modules.get(name)) is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    return getattr(load_module(module_name), name)
+
+
+def __dir__():
+    return [*globals(), *sheet_modules]
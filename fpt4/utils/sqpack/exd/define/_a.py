@@ -0,0 +1,930 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class AOZArrangement(DataRow):
+    _sign = b'AOZArrangement|eJzLywMAAUwA3Q=='
+    sheet_name = 'AOZArrangement'
+    briefing_b_npc: 'AOZContentBriefingBNpc' = RowForeign(0, 'AOZContentBriefingBNpc')
+    briefing_pos: int_t = RowData(1)
+
+
+class AOZBoss(DataRow):
+    _sign = b'AOZBoss|eJzLywMAAUwA3Q=='
+    sheet_name = 'AOZBoss'
+    _display = 'briefing_b_npc'
+    briefing_b_npc: 'AOZContentBriefingBNpc' = RowForeign(0, 'AOZContentBriefingBNpc')
+    briefing_pos: int_t = RowData(1)
+
+
+class AOZContent(DataRow):
+    _sign = b'AOZContent|eJzLy8MAAFG3CCs='
+    sheet_name = 'AOZContent'
+    clear_time: List[int_t] = ListData(ir((0, 2, 1)), RowData)
+    type: List[int_t] = ListData(ir((2, 3, 4)), RowData)
+    data: 'List[AOZArrangement|AOZBoss]' = ListData(ir((3, 3, 4)), DynamicForeign, ComplexSheetKey('type', (1, 'AOZArrangement'), (2, 'AOZBoss')))
+    map: List[int_t] = ListData(ir((4, 3, 4)), RowData)
+    briefing_object: List[int_t] = ListData(ir((5, 3, 4)), RowData)
+    content_entry_key: 'ContentEntry' = RowForeign(14, 'ContentEntry')
+    ui_index: int_t = RowData(15)
+    reward_gil: int_t = RowData(16)
+    reward_allied_seal: int_t = RowData(17)
+    reward_tomestone_a: int_t = RowData(18)
+
+
+class AOZContent(DataRow):
+    _sign = b'AOZContent|eJzLy0MFADqABuE='
+    sheet_name = 'AOZContent'
+    clear_time: List[int_t] = ListData(ir((0, 2, 1)), RowData)
+    type: List[int_t] = ListData(ir((2, 3, 3)), RowData)
+    data: List[int_t] = ListData(ir((3, 3, 3)), RowData)
+    map: List[int_t] = ListData(ir((4, 3, 3)), RowData)
+    content_entry_key: 'ContentEntry' = RowForeign(11, 'ContentEntry')
+    ui_index: int_t = RowData(12)
+    reward_gil: int_t = RowData(13)
+    reward_allied_seal: int_t = RowData(14)
+    reward_tomestone_a: int_t = RowData(15)
+
+
+class AOZContentBriefingBNpc(DataRow):
+    _sign = b'AOZContentBriefingBNpc|eJzLy8tLy0OANDgAAIlXCmc='
+    sheet_name = 'AOZContentBriefingBNpc'
+    _display = 'name'
+    name: 'BNpcName' = RowForeign(0, 'BNpcName')
+    icon: 'Icon' = IconRow(1)
+    icon_detail: 'Icon' = IconRow(2)
+    mask_param: bool_t = RowData(3)
+    hp_type: int_t = RowData(4)
+    elem_def: List[int_t] = ListData(ir((5, 10, 1)), RowData)
+    status_def_0: bool_t = RowData(15)
+    status_def_1: bool_t = RowData(16)
+    status_def_2: bool_t = RowData(17)
+    status_def_3: bool_t = RowData(18)
+    status_def_4: bool_t = RowData(19)
+    status_def_5: bool_t = RowData(20)
+    status_def_6: bool_t = RowData(21)
+    status_def_7: bool_t = RowData(22)
+    status_def_8: bool_t = RowData(23)
+    status_def_9: bool_t = RowData(24)
+
+
+class AOZContentBriefingObject(DataRow):
+    _sign = b'AOZContentBriefingObject|eJzLywMAAUwA3Q=='
+    sheet_name = 'AOZContentBriefingObject'
+    icon: 'Icon' = IconRow(0)
+    pos: int_t = RowData(1)
+
+
+class AOZReport(DataRow):
+    _sign = b'AOZReport|eJzLy8sDAAKXAUs='
+    sheet_name = 'AOZReport'
+    content_finder_condition_id: int_t = RowData(0)
+    reward: 'AOZReportReward' = RowForeign(1, 'AOZReportReward')
+    save_index: int_t = RowData(2)
+
+
+class AOZReportReward(DataRow):
+    _sign = b'AOZReportReward|eJzLywMBAAkMApU='
+    sheet_name = 'AOZReportReward'
+    first_gil: int_t = RowData(0)
+    first_allied_seal: int_t = RowData(1)
+    first_tomestone_a: int_t = RowData(2)
+    normal_gil: int_t = RowData(3)
+    normal_allied_seal: int_t = RowData(4)
+    normal_tomestone_a: int_t = RowData(5)
+
+
+class AOZScore(DataRow):
+    _sign = b'AOZScore|eJxLyysuBgAEPwG7'
+    sheet_name = 'AOZScore'
+    _display = 'text_name'
+    show_in_list: bool_t = RowData(0)
+    point: int_t = RowData(1)
+    text_name: str_t = RowData(2)
+    text_help: str_t = RowData(3)
+
+
+class AOZWeeklyReward(DataRow):
+    _sign = b'AOZWeeklyReward|eJzLy8sDAAKXAUs='
+    sheet_name = 'AOZWeeklyReward'
+    gil: int_t = RowData(0)
+    allied_seal: int_t = RowData(1)
+    tomestone_a: int_t = RowData(2)
+
+
+class Achievement(DataRow):
+    _sign = b'Achievement|eJzLKy7Oww4Al+ELNw=='
+    sheet_name = 'Achievement'
+    _display = 'text_name'
+    category: 'AchievementCategory' = RowForeign(0, 'AchievementCategory')
+    text_name: str_t = RowData(1)
+    text_help: str_t = RowData(2)
+    target: 'AchievementTarget' = RowForeign(3, 'AchievementTarget')
+    recommend_level: int_t = RowData(4)
+    point: int_t = RowData(5)
+    title: 'Title' = RowForeign(6, 'Title')
+    item: 'Item' = RowForeign(7, 'Item')
+    item_bit: int_t = RowData(8)
+    new_item_bit: int_t = RowData(9)
+    reward_genre: int_t = RowData(10)
+    icon: 'Icon' = IconRow(11)
+    detail: int_t = RowData(12)
+    condition_type: int_t = RowData(13)
+    condition_arg: 'List[Achievement|ClassJob|Quest|ClassJob|Map|Quest|GrandCompany|InstanceContent|BeastTribe|GrandCompany|AetherCurrentCompFlgSet|Quest]' = ListData(ir((14, 9, 1)), DynamicForeign, ComplexSheetKey('condition_type', (2, 'Achievement'), (3, 'ClassJob'), (6, 'Quest'), (7, 'ClassJob'), (8, 'Map'), (9, 'Quest'), (11, 'GrandCompany'), (14, 'InstanceContent'), (15, 'BeastTribe'), (18, 'GrandCompany'), (20, 'AetherCurrentCompFlgSet'), (24, 'Quest')))
+    priority: int_t = RowData(23)
+    activity_feed_image: int_t = RowData(24)
+    show_complete: 'AchievementHideCondition' = RowForeign(25, 'AchievementHideCondition')
+
+
+class AchievementCategory(DataRow):
+    _sign = b'AchievementCategory|eJwrzktLywMABmgCHA=='
+    sheet_name = 'AchievementCategory'
+    _display = 'text'
+    text: str_t = RowData(0)
+    kind: 'AchievementKind' = RowForeign(1, 'AchievementKind')
+    valid: bool_t = RowData(2)
+    show_complete: bool_t = RowData(3)
+    sort: int_t = RowData(4)
+
+
+class AchievementHideCondition(DataRow):
+    _sign = b'AchievementHideCondition|eJxLS0sDAAJnATM='
+    sheet_name = 'AchievementHideCondition'
+    hide_in_complete: bool_t = RowData(0)
+    hide_name: bool_t = RowData(1)
+    hide_help: bool_t = RowData(2)
+
+
+class AchievementKind(DataRow):
+    _sign = b'AchievementKind|eJwrzgMAAVYA4g=='
+    sheet_name = 'AchievementKind'
+    _display = 'text'
+    text: str_t = RowData(0)
+    sort: int_t = RowData(1)
+
+
+class AchievementTarget(DataRow):
+    _sign = b'AchievementTarget|eJzLywMAAUwA3Q=='
+    sheet_name = 'AchievementTarget'
+    _display = 'class_job_category'
+    target_category: int_t = RowData(0)
+    class_job_category: int_t = RowData(1)
+
+
+class Action(DataRow):
+    _sign = b'Action|eJwrTstDgLS8NBgAssACeXASoSotD0VdGgDXoRxW'
+    sheet_name = 'Action'
+    _display = 'text'
+    text: str_t = RowData(0)
+    help_dummy: bool_t = RowData(1)
+    icon: 'Icon' = IconRow(2)
+    category: 'ActionCategory' = RowForeign(3, 'ActionCategory')
+    sub_category: int_t = RowData(4)
+    cast_timeline: 'ActionCastTimeline' = RowForeign(5, 'ActionCastTimeline')
+    cast_vfx: 'ActionCastVFX' = RowForeign(6, 'ActionCastVFX')
+    timeline: 'ActionTimeline' = RowForeign(7, 'ActionTimeline')
+    hit_timeline: 'ActionTimeline' = RowForeign(8, 'ActionTimeline')
+    archer_timeline: int_t = RowData(9)
+    learn: 'ClassJob' = RowForeign(10, 'ClassJob')
+    action_timeline_move: int_t = RowData(11)
+    level: int_t = RowData(12)
+    is_additional: bool_t = RowData(13)
+    select_range: int_t = RowData(14)
+    select_myself: bool_t = RowData(15)
+    select_party: bool_t = RowData(16)
+    select_alliance: bool_t = RowData(17)
+    select_enemy: bool_t = RowData(18)
+    select_others: bool_t = RowData(19)
+    select_e_npc: bool_t = RowData(20)
+    select_ground: bool_t = RowData(21)
+    select_my_pet: bool_t = RowData(22)
+    select_party_pet: bool_t = RowData(23)
+    select_corpse: int_t = RowData(24)
+    lay: bool_t = RowData(25)
+    check_dir: bool_t = RowData(26)
+    effect_type: int_t = RowData(27)
+    effect_range: int_t = RowData(28)
+    effect_width: int_t = RowData(29)
+    effect_enemy: bool_t = RowData(30)
+    cost_type: int_t = RowData(31)
+    cost_value: int_t = RowData(32)
+    cond: int_t = RowData(33)
+    cond_arg: 'Status|Status|Status' = DynamicForeign(34, ComplexSheetKey('cond', (32, 'Status'), (35, 'Status'), (46, 'Status')))
+    combo_parent: 'Action' = RowForeign(35, 'Action')
+    combo_continue: bool_t = RowData(36)
+    cast_time: int_t = RowData(37)
+    cast_disp_time_add: int_t = RowData(38)
+    recast_time: int_t = RowData(39)
+    recast_group: int_t = RowData(40)
+    recast_group_sub: int_t = RowData(41)
+    charge_num: int_t = RowData(42)
+    attack_type: 'AttackType' = RowForeign(43, 'AttackType')
+    element: int_t = RowData(44)
+    proc_status: 'ActionProcStatus' = RowForeign(45, 'ActionProcStatus')
+    hate_type: int_t = RowData(46)
+    reset_status: 'Status' = RowForeign(47, 'Status')
+    reward: int_t = RowData(48)
+    use_class_job: 'ClassJobCategory' = RowForeign(49, 'ClassJobCategory')
+    init: int_t = RowData(50)
+    silence: bool_t = RowData(51)
+    invalid_move: bool_t = RowData(52)
+    omen: 'Omen' = RowForeign(53, 'Omen')
+    debug_hit_omen: int_t = RowData(54)
+    pvp_only: bool_t = RowData(55)
+    is_avoid: bool_t = RowData(56)
+    log_cast: bool_t = RowData(57)
+    log_cast_myself: bool_t = RowData(58)
+    log_miss: bool_t = RowData(59)
+    log_exec: bool_t = RowData(60)
+    force_vfx: bool_t = RowData(61)
+    hide_cast_bar: bool_t = RowData(62)
+    is_target_line: bool_t = RowData(63)
+    normalize_action_group: int_t = RowData(64)
+    valid_mount: bool_t = RowData(65)
+    valid_swimming_or_diving_or_flying: bool_t = RowData(66)
+    use_direction: bool_t = RowData(67)
+
+
+class ActionCastTimeline(DataRow):
+    _sign = b'ActionCastTimeline|eJzLywMAAUwA3Q=='
+    sheet_name = 'ActionCastTimeline'
+    _display = 'timeline'
+    timeline: 'ActionTimeline' = RowForeign(0, 'ActionTimeline')
+    weapon_vfx: 'VFX' = RowForeign(1, 'VFX')
+
+
+class ActionCastVFX(DataRow):
+    _sign = b'ActionCastVFX|eJzLAwAAbwBv'
+    sheet_name = 'ActionCastVFX'
+    _display = 'vfx'
+    vfx: 'VFX' = RowForeign(0, 'VFX')
+
+
+class ActionCategory(DataRow):
+    _sign = b'ActionCategory|eJwrBgAAdAB0'
+    sheet_name = 'ActionCategory'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class ActionComboRoute(DataRow):
+    _sign = b'ActionComboRoute|eJwrzoOCNAAX1gRK'
+    sheet_name = 'ActionComboRoute'
+    _display = 'text'
+    text: str_t = RowData(0)
+    route_index: int_t = RowData(1)
+    action: List[int_t] = ListData(ir((2, 7, 1)), RowData)
+    use_text_command: bool_t = RowData(9)
+
+
+class ActionComboRouteTransient(DataRow):
+    _sign = b'ActionComboRouteTransient|eJwrBgAAdAB0'
+    sheet_name = 'ActionComboRouteTransient'
+    text: str_t = RowData(0)
+
+
+class ActionCostType(DataRow):
+    _sign = b'ActionCostType|eJxLAwAAZwBn'
+    sheet_name = 'ActionCostType'
+    is_ui_disp: bool_t = RowData(0)
+
+
+class ActionIndirection(DataRow):
+    _sign = b'ActionIndirection|eJzLy8sDAAKXAUs='
+    sheet_name = 'ActionIndirection'
+    _display = 'action'
+    action: 'Action' = RowForeign(0, 'Action')
+    class_job: 'ClassJob' = RowForeign(1, 'ClassJob')
+    replace_action: 'Action' = RowForeign(2, 'Action')
+
+
+class ActionInit(DataRow):
+    _sign = b'ActionInit|eJzLAwAAbwBv'
+    sheet_name = 'ActionInit'
+    drawn_sword: int_t = RowData(0)
+
+
+class ActionParam(DataRow):
+    _sign = b'ActionParam|eJzLywMAAUwA3Q=='
+    sheet_name = 'ActionParam'
+    _display = 'param'
+    param: int_t = RowData(0)
+    pvp_param: int_t = RowData(1)
+
+
+class ActionProcStatus(DataRow):
+    _sign = b'ActionProcStatus|eJzLAwAAbwBv'
+    sheet_name = 'ActionProcStatus'
+    _display = 'status'
+    status: 'Status' = RowForeign(0, 'Status')
+
+
+class ActionTimeline(DataRow):
+    _sign = b'ActionTimeline|eJzLy0vLy8srzgOBtLw0EAIKAABrVAlC'
+    sheet_name = 'ActionTimeline'
+    _display = 'filename'
+    type: int_t = RowData(0)
+    priority: int_t = RowData(1)
+    is_loop: bool_t = RowData(2)
+    stance: int_t = RowData(3)
+    slot: int_t = RowData(4)
+    look_at_mode: int_t = RowData(5)
+    filename: str_t = RowData(6)
+    action_timeline_eid_mode: int_t = RowData(7)
+    weapon_timeline: 'WeaponTimeline' = RowForeign(8, 'WeaponTimeline')
+    load_type: int_t = RowData(9)
+    start_attach: int_t = RowData(10)
+    mount: int_t = RowData(11)
+    ornament: bool_t = RowData(12)
+    replace_group: int_t = RowData(13)
+    is_motion_canceled_by_moving: bool_t = RowData(14)
+    kill_upper: bool_t = RowData(15)
+    cancel_emote: int_t = RowData(16)
+    resident: bool_t = RowData(17)
+    resident_pap: bool_t = RowData(18)
+    pause: bool_t = RowData(19)
+    random_start_frame: int_t = RowData(20)
+    style_change: int_t = RowData(21)
+
+
+class ActionTimeline(DataRow):
+    _sign = b'ActionTimeline|eJzLy0vLy8srzgOBtLw0EErLAwBiEgjU'
+    sheet_name = 'ActionTimeline'
+    _display = 'filename'
+    type: int_t = RowData(0)
+    priority: int_t = RowData(1)
+    is_loop: bool_t = RowData(2)
+    stance: int_t = RowData(3)
+    slot: int_t = RowData(4)
+    look_at_mode: int_t = RowData(5)
+    filename: str_t = RowData(6)
+    action_timeline_eid_mode: int_t = RowData(7)
+    weapon_timeline: 'WeaponTimeline' = RowForeign(8, 'WeaponTimeline')
+    load_type: int_t = RowData(9)
+    start_attach: int_t = RowData(10)
+    mount: int_t = RowData(11)
+    ornament: bool_t = RowData(12)
+    replace_group: int_t = RowData(13)
+    is_motion_canceled_by_moving: bool_t = RowData(14)
+    kill_upper: bool_t = RowData(15)
+    cancel_emote: int_t = RowData(16)
+    resident: bool_t = RowData(17)
+    resident_pap: bool_t = RowData(18)
+    pause: bool_t = RowData(19)
+    random_start_frame: int_t = RowData(20)
+
+
+class ActionTimelineMove(DataRow):
+    _sign = b'ActionTimelineMove|eJzLywOCNAAJBAKN'
+    sheet_name = 'ActionTimelineMove'
+    translate_type: int_t = RowData(0)
+    translate_param: int_t = RowData(1)
+    collision: int_t = RowData(2)
+    rotate_type: int_t = RowData(3)
+    rotate_param: int_t = RowData(4)
+    stick_camera: bool_t = RowData(5)
+
+
+class ActionTimelineReplace(DataRow):
+    _sign = b'ActionTimelineReplace|eJzLywMAAUwA3Q=='
+    sheet_name = 'ActionTimelineReplace'
+    swimming: 'ActionTimeline' = RowForeign(0, 'ActionTimeline')
+    diving: 'ActionTimeline' = RowForeign(1, 'ActionTimeline')
+
+
+class ActionTransient(DataRow):
+    _sign = b'ActionTransient|eJwrBgAAdAB0'
+    sheet_name = 'ActionTransient'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class ActivityFeedButtons(DataRow):
+    _sign = b'ActivityFeedButtons|eJzLKwYCAAapAjs='
+    sheet_name = 'ActivityFeedButtons'
+    field_0: int_t = RowData(0)
+    banner_url: str_t = RowData(1)
+    description: str_t = RowData(2)
+    language: str_t = RowData(3)
+    picture_url: str_t = RowData(4)
+
+
+class ActivityFeedCaptions(DataRow):
+    _sign = b'ActivityFeedCaptions|eJwrLi4uBgAEggHN'
+    sheet_name = 'ActivityFeedCaptions'
+    ja: str_t = RowData(0)
+    en: str_t = RowData(1)
+    de: str_t = RowData(2)
+    fr: str_t = RowData(3)
+
+
+class ActivityFeedGroupCaptions(DataRow):
+    _sign = b'ActivityFeedGroupCaptions|eJwrLi4uBgAEggHN'
+    sheet_name = 'ActivityFeedGroupCaptions'
+    ja: str_t = RowData(0)
+    en: str_t = RowData(1)
+    de: str_t = RowData(2)
+    fr: str_t = RowData(3)
+
+
+class ActivityFeedImages(DataRow):
+    _sign = b'ActivityFeedImages|eJwrLgYCAAbCAkA='
+    sheet_name = 'ActivityFeedImages'
+    expansion_image: str_t = RowData(0)
+    activity_feed_ja: str_t = RowData(1)
+    activity_feed_en: str_t = RowData(2)
+    activity_feed_de: str_t = RowData(3)
+    activity_feed_fr: str_t = RowData(4)
+
+
+class Addon(DataRow):
+    _sign = b'Addon|eJwrBgAAdAB0'
+    sheet_name = 'Addon'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class AddonHudSize(DataRow):
+    _sign = b'AddonHudSize|eJzLy8vLAwAEUAG5'
+    sheet_name = 'AddonHudSize'
+    x: int_t = RowData(0)
+    y: int_t = RowData(1)
+    w: int_t = RowData(2)
+    h: int_t = RowData(3)
+
+
+class AddonLayout(DataRow):
+    _sign = b'AddonLayout|eJzLy8vLAwAEUAG5'
+    sheet_name = 'AddonLayout'
+    align: int_t = RowData(0)
+    x: float_t = RowData(1)
+    y: float_t = RowData(2)
+    scale: int_t = RowData(3)
+
+
+class AddonParam(DataRow):
+    _sign = b'AddonParam|eJwrTgMAAU4A2g=='
+    sheet_name = 'AddonParam'
+    text_0: str_t = RowData(0)
+    flag_1: bool_t = RowData(1)
+
+
+class AddonTalkParam(DataRow):
+    _sign = b'AddonTalkParam|eJzLywMBAAkMApU='
+    sheet_name = 'AddonTalkParam'
+    num_0: int_t = RowData(0)
+    num_1: int_t = RowData(1)
+    num_2: int_t = RowData(2)
+    num_3: int_t = RowData(3)
+    num_4: int_t = RowData(4)
+    num_5: int_t = RowData(5)
+
+
+class AddonTransient(DataRow):
+    _sign = b'AddonTransient|eJwrBgAAdAB0'
+    sheet_name = 'AddonTransient'
+    text: str_t = RowData(0)
+
+
+class AdvancedVibration(DataRow):
+    _sign = b'AdvancedVibration|eJwrzisGQgAJSAKk'
+    sheet_name = 'AdvancedVibration'
+    vib_file: str_t = RowData(0)
+    vib_file_index: int_t = RowData(1)
+    snd_file1: str_t = RowData(2)
+    snd_file1_index: int_t = RowData(3)
+    snd_file2: str_t = RowData(4)
+    snd_file2_index: int_t = RowData(5)
+
+
+class Adventure(DataRow):
+    _sign = b'Adventure|eJzLy4OC4uLivDQALWAGDA=='
+    sheet_name = 'Adventure'
+    _display = 'text_title_text'
+    layout_id: 'Level' = RowForeign(0, 'Level')
+    exp_param: int_t = RowData(1)
+    clear_min_lv: int_t = RowData(2)
+    clear_emote_cond: 'Emote' = RowForeign(3, 'Emote')
+    clear_start_time_cond: int_t = RowData(4)
+    clear_end_time_cond: int_t = RowData(5)
+    area_name: 'PlaceName' = RowForeign(6, 'PlaceName')
+    spot_icon: 'Icon' = IconRow(7)
+    landscape_picture: 'Icon' = IconRow(8)
+    text_title_text: str_t = RowData(9)
+    text_hint_text: str_t = RowData(10)
+    text_flavor_text: str_t = RowData(11)
+    region_picture: 'Icon' = IconRow(12)
+    is_show_region: bool_t = RowData(13)
+
+
+class AdventureExPhase(DataRow):
+    _sign = b'AdventureExPhase|eJzLywMCAAZ3Aic='
+    sheet_name = 'AdventureExPhase'
+    open_quest: 'Quest' = RowForeign(0, 'Quest')
+    adventure_start: 'Adventure' = RowForeign(1, 'Adventure')
+    adventure_end: 'Adventure' = RowForeign(2, 'Adventure')
+    ex_disk_version: 'ExVersion' = RowForeign(3, 'ExVersion')
+    complete_screen_image: int_t = RowData(4)
+
+
+class AetherCurrent(DataRow):
+    _sign = b'AetherCurrent|eJzLAwAAbwBv'
+    sheet_name = 'AetherCurrent'
+    _display = 'quest'
+    quest: 'Quest' = RowForeign(0, 'Quest')
+
+
+class AetherCurrentCompFlgSet(DataRow):
+    _sign = b'AetherCurrentCompFlgSet|eJzLy0MFADqABuE='
+    sheet_name = 'AetherCurrentCompFlgSet'
+    territory: 'TerritoryType' = RowForeign(0, 'TerritoryType')
+    aeter_current: List[int_t] = ListData(ir((1, 15, 1)), RowData)
+
+
+class AetherialWheel(DataRow):
+    _sign = b'AetherialWheel|eJzLy8vLAwAEUAG5'
+    sheet_name = 'AetherialWheel'
+    wheel_item_id: 'Item' = RowForeign(0, 'Item')
+    wheel_energy_item_id: 'Item' = RowForeign(1, 'Item')
+    grade: int_t = RowData(2)
+    sublime_hour: int_t = RowData(3)
+
+
+class Aetheryte(DataRow):
+    _sign = b'Aetheryte|eJwrzivOQwJpQG4amAUAjFcKvg=='
+    sheet_name = 'Aetheryte'
+    _display = 'telepo_name'
+    text_sgl: str_t = RowData(0)
+    text_sgg: int_t = RowData(1)
+    text_plr: str_t = RowData(2)
+    text_plg: int_t = RowData(3)
+    text_vow: int_t = RowData(4)
+    text_cnt: int_t = RowData(5)
+    text_gen: int_t = RowData(6)
+    text_def_: int_t = RowData(7)
+    telepo_name: 'PlaceName' = RowForeign(8, 'PlaceName')
+    transfer_name: 'PlaceName' = RowForeign(9, 'PlaceName')
+    territory_type: 'TerritoryType' = RowForeign(10, 'TerritoryType')
+    pop_range: List[int_t] = ListData(ir((11, 4, 1)), RowData)
+    telepo: bool_t = RowData(15)
+    telepo_package_category: int_t = RowData(16)
+    script: str_t = RowData(17)
+    town: int_t = RowData(18)
+    is_bonus: bool_t = RowData(19)
+    unlock_quest: 'Quest' = RowForeign(20, 'Quest')
+    map: 'Map' = RowForeign(21, 'Map')
+    cost_pos_x: int_t = RowData(22)
+    cost_pos_y: int_t = RowData(23)
+    sort_key: int_t = RowData(24)
+
+
+class Aetheryte(DataRow):
+    _sign = b'Aetheryte|eJwrzivOQwJpxXlpYAYAgZYKUA=='
+    sheet_name = 'Aetheryte'
+    _display = 'telepo_name'
+    text_sgl: str_t = RowData(0)
+    text_sgg: int_t = RowData(1)
+    text_plr: str_t = RowData(2)
+    text_plg: int_t = RowData(3)
+    text_vow: int_t = RowData(4)
+    text_cnt: int_t = RowData(5)
+    text_gen: int_t = RowData(6)
+    text_def_: int_t = RowData(7)
+    telepo_name: 'PlaceName' = RowForeign(8, 'PlaceName')
+    transfer_name: 'PlaceName' = RowForeign(9, 'PlaceName')
+    territory_type: 'TerritoryType' = RowForeign(10, 'TerritoryType')
+    pop_range: List[int_t] = ListData(ir((11, 4, 1)), RowData)
+    telepo: bool_t = RowData(15)
+    script: str_t = RowData(16)
+    town: int_t = RowData(17)
+    is_bonus: bool_t = RowData(18)
+    unlock_quest: 'Quest' = RowForeign(19, 'Quest')
+    map: 'Map' = RowForeign(20, 'Map')
+    cost_pos_x: int_t = RowData(21)
+    cost_pos_y: int_t = RowData(22)
+    sort_key: int_t = RowData(23)
+
+
+class AetheryteSystemDefine(DataRow):
+    _sign = b'AetheryteSystemDefine|eJwrzgMAAVYA4g=='
+    sheet_name = 'AetheryteSystemDefine'
+    _display = 'define_name'
+    define_name: str_t = RowData(0)
+    define_value: int_t = RowData(1)
+
+
+class AetheryteTransient(DataRow):
+    _sign = b'AetheryteTransient|eJxLAwAAZwBn'
+    sheet_name = 'AetheryteTransient'
+    is_outside: bool_t = RowData(0)
+
+
+class AirshipExplorationLevel(DataRow):
+    _sign = b'AirshipExplorationLevel|eJzLywMAAUwA3Q=='
+    sheet_name = 'AirshipExplorationLevel'
+    cost_limit: int_t = RowData(0)
+    lv_up_exp: int_t = RowData(1)
+
+
+class AirshipExplorationLog(DataRow):
+    _sign = b'AirshipExplorationLog|eJwrBgAAdAB0'
+    sheet_name = 'AirshipExplorationLog'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class AirshipExplorationParamType(DataRow):
+    _sign = b'AirshipExplorationParamType|eJwrBgAAdAB0'
+    sheet_name = 'AirshipExplorationParamType'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class AirshipExplorationPart(DataRow):
+    _sign = b'AirshipExplorationPart|eJzLy4MBABesBE0='
+    sheet_name = 'AirshipExplorationPart'
+    category: int_t = RowData(0)
+    airship_level: int_t = RowData(1)
+    cost: int_t = RowData(2)
+    exploration: int_t = RowData(3)
+    carry: int_t = RowData(4)
+    cruise: int_t = RowData(5)
+    fuel: int_t = RowData(6)
+    luck: int_t = RowData(7)
+    pattern_id: int_t = RowData(8)
+    repair_item_num: int_t = RowData(9)
+
+
+class AirshipExplorationPoint(DataRow):
+    _sign = b'AirshipExplorationPoint|eJwrLk7LQwAALVMGBw=='
+    sheet_name = 'AirshipExplorationPoint'
+    _display = 'text_name'
+    text_name: str_t = RowData(0)
+    text_abbreviation: str_t = RowData(1)
+    for_content: bool_t = RowData(2)
+    x: int_t = RowData(3)
+    y: int_t = RowData(4)
+    level: int_t = RowData(5)
+    energy: int_t = RowData(6)
+    time: int_t = RowData(7)
+    fuel_consumption: int_t = RowData(8)
+    condition_category: List[int_t] = ListData(ir((9, 2, 2)), RowData)
+    condition_param: List[int_t] = ListData(ir((10, 2, 2)), RowData)
+    reward_exp: int_t = RowData(13)
+
+
+class AirshipSkyIsland(DataRow):
+    _sign = b'AirshipSkyIsland|eJzLywMBAAkMApU='
+    sheet_name = 'AirshipSkyIsland'
+    level: int_t = RowData(0)
+    point: int_t = RowData(1)
+    condition_category: List[int_t] = ListData(ir((2, 2, 2)), RowData)
+    condition_param: List[int_t] = ListData(ir((3, 2, 2)), RowData)
+
+
+class AkatsukiNote(DataRow):
+    _sign = b'AkatsukiNote|eJzLy4MCABNfA98='
+    sheet_name = 'AkatsukiNote'
+    sort: int_t = RowData(0)
+    check_id: int_t = RowData(1)
+    item_text_id: int_t = RowData(2)
+    disclosure_value0: int_t = RowData(3)
+    disclosure_value1: int_t = RowData(4)
+    detail_title_text_id: int_t = RowData(5)
+    detail_image: int_t = RowData(6)
+    job_text_id: int_t = RowData(7)
+    detail_main_text_id: int_t = RowData(8)
+
+
+class AkatsukiNoteString(DataRow):
+    _sign = b'AkatsukiNoteString|eJwrBgAAdAB0'
+    sheet_name = 'AkatsukiNoteString'
+    text: str_t = RowData(0)
+
+
+class AnimaWeapon5(DataRow):
+    _sign = b'AnimaWeapon5|eJzLy4MAAA+AA3E='
+    sheet_name = 'AnimaWeapon5'
+    base_item: 'Item' = RowForeign(0, 'Item')
+    icon: int_t = RowData(1)
+    strengthening_max: int_t = RowData(2)
+    param: List[int_t] = ListData(ir((3, 5, 1)), RowData)
+
+
+class AnimaWeapon5Param(DataRow):
+    _sign = b'AnimaWeapon5Param|eJzLKwYAAVEA4g=='
+    sheet_name = 'AnimaWeapon5Param'
+    _display = 'base_param'
+    base_param: 'BaseParam' = RowForeign(0, 'BaseParam')
+    ui_name: str_t = RowData(1)
+
+
+class AnimaWeapon5PatternGroup(DataRow):
+    _sign = b'AnimaWeapon5PatternGroup|eJwrBgAAdAB0'
+    sheet_name = 'AnimaWeapon5PatternGroup'
+    _display = 'name'
+    name: str_t = RowData(0)
+
+
+class AnimaWeapon5SpiritTalk(DataRow):
+    _sign = b'AnimaWeapon5SpiritTalk|eJzLAwAAbwBv'
+    sheet_name = 'AnimaWeapon5SpiritTalk'
+    _display = 'param'
+    param: 'AnimaWeapon5SpiritTalkParam' = RowForeign(0, 'AnimaWeapon5SpiritTalkParam')
+
+
+class AnimaWeapon5SpiritTalkParam(DataRow):
+    _sign = b'AnimaWeapon5SpiritTalkParam|eJwrLgYAAVsA5w=='
+    sheet_name = 'AnimaWeapon5SpiritTalkParam'
+    _display = 'text_male'
+    text_male: str_t = RowData(0)
+    text_female: str_t = RowData(1)
+
+
+class AnimaWeapon5SpiritTalkType(DataRow):
+    _sign = b'AnimaWeapon5SpiritTalkType|eJzLAwAAbwBv'
+    sheet_name = 'AnimaWeapon5SpiritTalkType'
+    rate: int_t = RowData(0)
+
+
+class AnimaWeapon5TradeItem(DataRow):
+    _sign = b'AnimaWeapon5TradeItem|eJzLy8vLS8KBAKmAC6k='
+    sheet_name = 'AnimaWeapon5TradeItem'
+    pattern_group: int_t = RowData(0)
+    output_item: 'Item' = RowForeign(1, 'Item')
+    output_num: int_t = RowData(2)
+    input_item: List[int_t] = ListData(ir((3, 8, 3)), RowData)
+    is_input_hq: List[bool_t] = ListData(ir((4, 8, 3)), RowData)
+    input_num: List[int_t] = ListData(ir((5, 8, 3)), RowData)
+    ui_sort_key: 'AnimaWeapon5PatternGroup' = RowForeign(27, 'AnimaWeapon5PatternGroup')
+
+
+class AnimaWeaponFUITalk(DataRow):
+    _sign = b'AnimaWeaponFUITalk|eJzLAwAAbwBv'
+    sheet_name = 'AnimaWeaponFUITalk'
+    _display = 'param'
+    param: 'AnimaWeaponFUITalkParam' = RowForeign(0, 'AnimaWeaponFUITalkParam')
+
+
+class AnimaWeaponFUITalkParam(DataRow):
+    _sign = b'AnimaWeaponFUITalkParam|eJwrLgYAAVsA5w=='
+    sheet_name = 'AnimaWeaponFUITalkParam'
+    _display = 'text_male'
+    text_male: str_t = RowData(0)
+    text_female: str_t = RowData(1)
+
+
+class AnimaWeaponIcon(DataRow):
+    _sign = b'AnimaWeaponIcon|eJzLywMCAAZ3Aic='
+    sheet_name = 'AnimaWeaponIcon'
+    icon4: 'Icon' = IconRow(0)
+    icon5: 'Icon' = IconRow(1)
+    icon6: 'Icon' = IconRow(2)
+    icon7: 'Icon' = IconRow(3)
+    icon8: 'Icon' = IconRow(4)
+
+
+class AnimaWeaponItem(DataRow):
+    _sign = b'AnimaWeaponItem|eJzLy0MGAC0sBgU='
+    sheet_name = 'AnimaWeaponItem'
+    item: List[int_t] = ListData(ir((0, 14, 1)), RowData)
+
+
+class AnimationLOD(DataRow):
+    _sign = b'AnimationLOD|eJzLy8tLggIAGrcEWw=='
+    sheet_name = 'AnimationLOD'
+    camera_distance: float_t = RowData(0)
+    sample_interval: float_t = RowData(1)
+    bone_lod: int_t = RowData(2)
+    animation_enable: List[bool_t] = ListData(ir((3, 8, 1)), RowData)
+
+
+class AozAction(DataRow):
+    _sign = b'AozAction|eJzLywMAAUwA3Q=='
+    sheet_name = 'AozAction'
+    _display = 'learning_action'
+    learning_action: 'Action' = RowForeign(0, 'Action')
+    rarity: int_t = RowData(1)
+
+
+class AozActionTransient(DataRow):
+    _sign = b'AozActionTransient|eJzLyysuzgOCNCQAAFiPCEM='
+    sheet_name = 'AozActionTransient'
+    ui_priority: int_t = RowData(0)
+    large_icon: 'Icon' = IconRow(1)
+    text_effect: str_t = RowData(2)
+    text_description: str_t = RowData(3)
+    learning_source_type: int_t = RowData(4)
+    place_name: 'PlaceName|ContentFinderCondition' = DynamicForeign(5, ComplexSheetKey('learning_source_type', (1, 'PlaceName'), (4, 'ContentFinderCondition')))
+    target_job_quest: 'Quest' = RowForeign(6, 'Quest')
+    prev_job_quest: 'Quest' = RowForeign(7, 'Quest')
+    filter_flag__target_enemy: bool_t = RowData(8)
+    filter_flag__target_friend: bool_t = RowData(9)
+    filter_flag__status_slow: bool_t = RowData(10)
+    filter_flag__status_stone: bool_t = RowData(11)
+    filter_flag__status_palsy: bool_t = RowData(12)
+    filter_flag__status_silence: bool_t = RowData(13)
+    filter_flag__status_blind: bool_t = RowData(14)
+    filter_flag__status_stun: bool_t = RowData(15)
+    filter_flag__status_sleep: bool_t = RowData(16)
+    filter_flag__status_bind: bool_t = RowData(17)
+    filter_flag__status_heavy: bool_t = RowData(18)
+    filter_flag__status_death: bool_t = RowData(19)
+
+
+class AquariumFish(DataRow):
+    _sign = b'AquariumFish|eJzLy8vLAwAEUAG5'
+    sheet_name = 'AquariumFish'
+    _display = 'item'
+    water: 'AquariumWater' = RowForeign(0, 'AquariumWater')
+    size: int_t = RowData(1)
+    item: 'Item' = RowForeign(2, 'Item')
+    kind: int_t = RowData(3)
+
+
+class AquariumWater(DataRow):
+    _sign = b'AquariumWater|eJzLKwYAAVEA4g=='
+    sheet_name = 'AquariumWater'
+    _display = 'text'
+    kind: int_t = RowData(0)
+    text: str_t = RowData(1)
+
+
+class ArchiveItem(DataRow):
+    _sign = b'ArchiveItem|eJzLy0sDAAKPAUM='
+    sheet_name = 'ArchiveItem'
+    item: int_t = RowData(0)
+    item_num: int_t = RowData(1)
+    hq: bool_t = RowData(2)
+
+
+class ArrayEventHandler(DataRow):
+    _sign = b'ArrayEventHandler|eJzLy0MFADqABuE='
+    sheet_name = 'ArrayEventHandler'
+    event_handler: List[int_t] = ListData(ir((0, 16, 1)), RowData)
+
+
+class AttackType(DataRow):
+    _sign = b'AttackType|eJwrBgAAdAB0'
+    sheet_name = 'AttackType'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class Attract(DataRow):
+    _sign = b'Attract|eJzLy8tLywMABmcCHw=='
+    sheet_name = 'Attract'
+    distance: int_t = RowData(0)
+    speed: int_t = RowData(1)
+    offset: int_t = RowData(2)
+    radius: bool_t = RowData(3)
+    direction: int_t = RowData(4)
+
+
+class Attributive(DataRow):
+    _sign = b'Attributive|eJwrLiYSAACC/xJs'
+    sheet_name = 'Attributive'
+    text_0: str_t = RowData(0)
+    text_1: str_t = RowData(1)
+    text_2: str_t = RowData(2)
+    text_3: str_t = RowData(3)
+    text_4: str_t = RowData(4)
+    text_5: str_t = RowData(5)
+    text_6: str_t = RowData(6)
+    text_7: str_t = RowData(7)
+    text_8: str_t = RowData(8)
+    text_9: str_t = RowData(9)
+    text_10: str_t = RowData(10)
+    text_11: str_t = RowData(11)
+    text_12: str_t = RowData(12)
+    text_13: str_t = RowData(13)
+    text_14: str_t = RowData(14)
+    text_15: str_t = RowData(15)
+    text_16: str_t = RowData(16)
+    text_17: str_t = RowData(17)
+    text_18: str_t = RowData(18)
+    text_19: str_t = RowData(19)
+    text_20: str_t = RowData(20)
+    text_21: str_t = RowData(21)
+    text_22: str_t = RowData(22)
+    text_23: str_t = RowData(23)
+    text_24: str_t = RowData(24)
+    text_25: str_t = RowData(25)
+    text_26: str_t = RowData(26)
+    text_27: str_t = RowData(27)
+    text_28: str_t = RowData(28)
+    text_29: str_t = RowData(29)
+    text_30: str_t = RowData(30)
+    text_31: str_t = RowData(31)
+    text_32: str_t = RowData(32)
+    text_33: str_t = RowData(33)
+    text_34: str_t = RowData(34)
+    text_35: str_t = RowData(35)
+    text_36: str_t = RowData(36)
+    text_37: str_t = RowData(37)
+    text_38: str_t = RowData(38)
+    text_39: str_t = RowData(39)
+    text_40: str_t = RowData(40)
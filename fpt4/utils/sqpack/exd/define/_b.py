@@ -0,0 +1,635 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class BGM(DataRow):
+    _sign = b'BGM|eJwrzktLS8vLAwAL0gLw'
+    sheet_name = 'BGM'
+    _display = 'path'
+    path: str_t = RowData(0)
+    priority: int_t = RowData(1)
+    pass_end: bool_t = RowData(2)
+    disable_restart: bool_t = RowData(3)
+    disable_restart_time_out: bool_t = RowData(4)
+    disable_restart_reset_time: float_t = RowData(5)
+    special_mode: int_t = RowData(6)
+
+
+class BGMFade(DataRow):
+    _sign = b'BGMFade|eJzLy8sDAAKXAUs='
+    sheet_name = 'BGMFade'
+    scene_out: int_t = RowData(0)
+    scene_in: int_t = RowData(1)
+    fade_type: 'BGMFadeType' = RowForeign(2, 'BGMFadeType')
+
+
+class BGMFadeType(DataRow):
+    _sign = b'BGMFadeType|eJzLy8vLAwAEUAG5'
+    sheet_name = 'BGMFadeType'
+    fade_out_time: float_t = RowData(0)
+    fade_in_time: float_t = RowData(1)
+    fade_in_start_time: float_t = RowData(2)
+    resume_fade_in_time: float_t = RowData(3)
+
+
+class BGMScene(DataRow):
+    _sign = b'BGMScene|eJxLSwMCAAX/Af8='
+    sheet_name = 'BGMScene'
+    ignore_battle: bool_t = RowData(0)
+    force_auto_reset: bool_t = RowData(1)
+    enable_pass_end: bool_t = RowData(2)
+    resume: bool_t = RowData(3)
+    enable_disable_restart: bool_t = RowData(4)
+
+
+class BGMSituation(DataRow):
+    _sign = b'BGMSituation|eJzLywMCAAZ3Aic='
+    sheet_name = 'BGMSituation'
+    daytime_id: 'BGM' = RowForeign(0, 'BGM')
+    night_id: 'BGM' = RowForeign(1, 'BGM')
+    battle_id: 'BGM' = RowForeign(2, 'BGM')
+    daybreak_id: 'BGM' = RowForeign(3, 'BGM')
+    twilight_id: 'BGM' = RowForeign(4, 'BGM')
+
+
+class BGMSwitch(DataRow):
+    _sign = b'BGMSwitch|eJzLy8vLAwAEUAG5'
+    sheet_name = 'BGMSwitch'
+    type: 'BGMSystemDefine' = RowForeign(0, 'BGMSystemDefine')
+    param0: 'Quest' = RowForeign(1, 'Quest')
+    param1: int_t = RowData(2)
+    bgm: int_t = RowData(3)
+
+
+class BGMSystemDefine(DataRow):
+    _sign = b'BGMSystemDefine|eJzLAwAAbwBv'
+    sheet_name = 'BGMSystemDefine'
+    _display = 'value_float'
+    value_float: float_t = RowData(0)
+
+
+class BKJEObj(DataRow):
+    _sign = b'BKJEObj|eJzLy8vLAwAEUAG5'
+    sheet_name = 'BKJEObj'
+    base_id: int_t = RowData(0)
+    strategy_type: int_t = RowData(1)
+    layout_id: int_t = RowData(2)
+    work_index: int_t = RowData(3)
+
+
+class BKJLivestock(DataRow):
+    _sign = b'BKJLivestock|eJzLAwAAbwBv'
+    sheet_name = 'BKJLivestock'
+    b_npc_base_id: int_t = RowData(0)
+
+
+class BKJPouch(DataRow):
+    _sign = b'BKJPouch|eJzLywMAAUwA3Q=='
+    sheet_name = 'BKJPouch'
+    catalog_id: int_t = RowData(0)
+    category: int_t = RowData(1)
+
+
+class BKJSeed(DataRow):
+    _sign = b'BKJSeed|eJzLAwAAbwBv'
+    sheet_name = 'BKJSeed'
+    shared_group: int_t = RowData(0)
+
+
+class BKJShipment(DataRow):
+    _sign = b'BKJShipment|eJzLywMAAUwA3Q=='
+    sheet_name = 'BKJShipment'
+    num_0: int_t = RowData(0)
+    num_1: int_t = RowData(1)
+
+
+class BKJSpecialtyGoods(DataRow):
+    _sign = b'BKJSpecialtyGoods|eJzLAwAAbwBv'
+    sheet_name = 'BKJSpecialtyGoods'
+    shared_group_id: int_t = RowData(0)
+
+
+class BNpcAnnounceIcon(DataRow):
+    _sign = b'BNpcAnnounceIcon|eJzLAwAAbwBv'
+    sheet_name = 'BNpcAnnounceIcon'
+    _display = 'icon'
+    icon: 'Icon' = IconRow(0)
+
+
+class BNpcBase(DataRow):
+    _sign = b'BNpcBase|eJzLy4OBNDABBEAKAGu8CU0='
+    sheet_name = 'BNpcBase'
+    normal_ai: 'Behavior' = RowForeign(0, 'Behavior')
+    battalion: 'Battalion' = RowForeign(1, 'Battalion')
+    link_race: 'LinkRace' = RowForeign(2, 'LinkRace')
+    rank: int_t = RowData(3)
+    scale: float_t = RowData(4)
+    model: 'ModelChara' = RowForeign(5, 'ModelChara')
+    customize: 'BNpcCustomize' = RowForeign(6, 'BNpcCustomize')
+    equipment: 'NpcEquip' = RowForeign(7, 'NpcEquip')
+    se_pack: int_t = RowData(8)
+    special: int_t = RowData(9)
+    combo_position_ignored: bool_t = RowData(10)
+    event_handler: 'ArrayEventHandler' = RowForeign(11, 'ArrayEventHandler')
+    move_ai: int_t = RowData(12)
+    parts: 'BNpcParts' = RowForeign(13, 'BNpcParts')
+    pop_vfx: int_t = RowData(14)
+    is_display_level: bool_t = RowData(15)
+    is_target_line: bool_t = RowData(16)
+    target_ring: bool_t = RowData(17)
+    disp_force: bool_t = RowData(18)
+    announce_icon: int_t = RowData(19)
+    element: int_t = RowData(20)
+    bot_knowledge: int_t = RowData(21)
+
+
+class BNpcBasePopVfx(DataRow):
+    _sign = b'BNpcBasePopVfx|eJzLAwAAbwBv'
+    sheet_name = 'BNpcBasePopVfx'
+    vfx: int_t = RowData(0)
+
+
+class BNpcCustomize(DataRow):
+    _sign = b'BNpcCustomize|eJzLy8MFAJbsCy0='
+    sheet_name = 'BNpcCustomize'
+    customize: 'List[Tribe]' = ListData(ir((0, 26, 1)), RowForeign, 'Tribe')
+
+
+class BNpcName(DataRow):
+    _sign = b'BNpcName|eJwrzivOAwEAD8YDew=='
+    sheet_name = 'BNpcName'
+    _display = 'text_sgl'
+    text_sgl: str_t = RowData(0)
+    text_sgg: int_t = RowData(1)
+    text_plr: str_t = RowData(2)
+    text_plg: int_t = RowData(3)
+    text_vow: int_t = RowData(4)
+    text_cnt: int_t = RowData(5)
+    text_gen: int_t = RowData(6)
+    text_def_: int_t = RowData(7)
+
+
+class BNpcParts(DataRow):
+    _sign = b'BNpcParts|eJzLy0sCgjwIIIsJAI8ZGz0='
+    sheet_name = 'BNpcParts'
+    parts: 'List[BNpcBase]' = ListData(ir((0, 6, 11)), RowForeign, 'BNpcBase')
+    model_attribute: List[int_t] = ListData(ir((1, 6, 11)), RowData)
+    att_default: List[bool_t] = ListData(ir((2, 6, 11)), RowData)
+    timeline: List[bool_t] = ListData(ir((3, 6, 11)), RowData)
+    play_break_timeline: List[bool_t] = ListData(ir((4, 6, 11)), RowData)
+    offset_y_chara: List[bool_t] = ListData(ir((5, 6, 11)), RowData)
+    offset_x: List[float_t] = ListData(ir((6, 6, 11)), RowData)
+    offset_y: List[float_t] = ListData(ir((7, 6, 11)), RowData)
+    offset_z: List[float_t] = ListData(ir((8, 6, 11)), RowData)
+    dir_offset: List[int_t] = ListData(ir((9, 6, 11)), RowData)
+    radius: List[float_t] = ListData(ir((10, 6, 11)), RowData)
+
+
+class BNpcState(DataRow):
+    _sign = b'BNpcState|eJzLywOBJDDMy0sDADKbBkc='
+    sheet_name = 'BNpcState'
+    slot: int_t = RowData(0)
+    over_ray: List[int_t] = ListData(ir((1, 2, 1)), RowData)
+    model_state: int_t = RowData(3)
+    idle: int_t = RowData(4)
+    model_attribute: List[int_t] = ListData(ir((5, 3, 2)), RowData)
+    attribute_flag: List[bool_t] = ListData(ir((6, 3, 2)), RowData)
+    scale: float_t = RowData(11)
+    model_scale: int_t = RowData(12)
+    loop_timeline: int_t = RowData(13)
+    loop_timeline_clear: bool_t = RowData(14)
+
+
+class BacklightColor(DataRow):
+    _sign = b'BacklightColor|eJzLAwAAbwBv'
+    sheet_name = 'BacklightColor'
+    _display = 'color'
+    color: int_t = RowData(0)
+
+
+class Ballista(DataRow):
+    _sign = b'Ballista|eJzLy4MDABxnBLs='
+    sheet_name = 'Ballista'
+    b_npc: 'BNpcBase' = RowForeign(0, 'BNpcBase')
+    near: int_t = RowData(1)
+    far: int_t = RowData(2)
+    angle: int_t = RowData(3)
+    bullet: List[int_t] = ListData(ir((4, 3, 1)), RowData)
+    action: 'List[Action]' = ListData(ir((7, 3, 1)), RowForeign, 'Action')
+    timeline: 'Action' = RowForeign(10, 'Action')
+
+
+class Balloon(DataRow):
+    _sign = b'Balloon|eJxLKwYAAUEA2g=='
+    sheet_name = 'Balloon'
+    _display = 'text'
+    slowly: bool_t = RowData(0)
+    text: str_t = RowData(1)
+
+
+class BannerBg(DataRow):
+    _sign = b'BannerBg|eJzLy8vLKwYABnwCLA=='
+    sheet_name = 'BannerBg'
+    _display = 'text'
+    icon: 'Icon' = IconRow(0)
+    list_icon: 'Icon' = IconRow(1)
+    banner_condition: 'BannerCondition' = RowForeign(2, 'BannerCondition')
+    sort_id: int_t = RowData(3)
+    text: str_t = RowData(4)
+
+
+class BannerCondition(DataRow):
+    _sign = b'BannerCondition|eJzLy0MGaQAzlwZr'
+    sheet_name = 'BannerCondition'
+    condition_type: int_t = RowData(0)
+    condition_data: List[int_t] = ListData(ir((1, 6, 1)), RowData)
+    obtain_type: int_t = RowData(7)
+    obtain_arg: 'List[Item|Item]' = ListData(ir((8, 3, 1)), DynamicForeign, ComplexSheetKey('obtain_type', (4, 'Item'), (21, 'Item')))
+    obtain_unlock_type: int_t = RowData(11)
+    obtain_unlock_data: 'Quest|ContentFinderCondition|ContentFinderCondition' = DynamicForeign(12, ComplexSheetKey('obtain_unlock_type', (1, 'Quest'), (3, 'ContentFinderCondition'), (4, 'ContentFinderCondition')))
+    obtain_hint_type: 'BannerObtainHintType' = RowForeign(13, 'BannerObtainHintType')
+    hide_if_not_obtain: bool_t = RowData(14)
+
+
+class BannerDecoration(DataRow):
+    _sign = b'BannerDecoration|eJzLy8vLKwYABnwCLA=='
+    sheet_name = 'BannerDecoration'
+    _display = 'text'
+    icon: 'Icon' = IconRow(0)
+    list_icon: 'Icon' = IconRow(1)
+    banner_condition: 'BannerCondition' = RowForeign(2, 'BannerCondition')
+    sort_id: int_t = RowData(3)
+    text: str_t = RowData(4)
+
+
+class BannerDesignPreset(DataRow):
+    _sign = b'BannerDesignPreset|eJzLy8vLKwYABnwCLA=='
+    sheet_name = 'BannerDesignPreset'
+    _display = 'text'
+    bg: 'BannerBg' = RowForeign(0, 'BannerBg')
+    frame: 'BannerFrame' = RowForeign(1, 'BannerFrame')
+    decoration: 'BannerDecoration' = RowForeign(2, 'BannerDecoration')
+    sort_id: int_t = RowData(3)
+    text: str_t = RowData(4)
+
+
+class BannerFacial(DataRow):
+    _sign = b'BannerFacial|eJzLy8sDAAKXAUs='
+    sheet_name = 'BannerFacial'
+    emote: 'Emote' = RowForeign(0, 'Emote')
+    banner_condition: 'BannerCondition' = RowForeign(1, 'BannerCondition')
+    sort_id: int_t = RowData(2)
+
+
+class BannerFrame(DataRow):
+    _sign = b'BannerFrame|eJzLy8vLKwYABnwCLA=='
+    sheet_name = 'BannerFrame'
+    _display = 'text'
+    icon: 'Icon' = IconRow(0)
+    list_icon: 'Icon' = IconRow(1)
+    banner_condition: 'BannerCondition' = RowForeign(2, 'BannerCondition')
+    sort_id: int_t = RowData(3)
+    text: str_t = RowData(4)
+
+
+class BannerObtainHintType(DataRow):
+    _sign = b'BannerObtainHintType|eJwrBgAAdAB0'
+    sheet_name = 'BannerObtainHintType'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class BannerPreset(DataRow):
+    _sign = b'BannerPreset|eJzLy8MFAJbsCy0='
+    sheet_name = 'BannerPreset'
+    cam_pos_x: float_t = RowData(0)
+    cam_pos_y: float_t = RowData(1)
+    cam_pos_z: float_t = RowData(2)
+    cam_look_at_x: float_t = RowData(3)
+    cam_look_at_y: float_t = RowData(4)
+    cam_look_at_z: float_t = RowData(5)
+    cam_roll: int_t = RowData(6)
+    cam_zoom: int_t = RowData(7)
+    timeline: int_t = RowData(8)
+    timeline_frame: float_t = RowData(9)
+    facial: int_t = RowData(10)
+    face_yaw: float_t = RowData(11)
+    face_pitch: float_t = RowData(12)
+    eye_yaw: float_t = RowData(13)
+    eye_pitch: float_t = RowData(14)
+    design: int_t = RowData(15)
+    light1__color_r: int_t = RowData(16)
+    light1__color_g: int_t = RowData(17)
+    light1__color_b: int_t = RowData(18)
+    light1__scale: int_t = RowData(19)
+    light1__dir_h: int_t = RowData(20)
+    light1__dir_v: int_t = RowData(21)
+    light2__color_r: int_t = RowData(22)
+    light2__color_g: int_t = RowData(23)
+    light2__color_b: int_t = RowData(24)
+    light2__scale: int_t = RowData(25)
+
+
+class BannerTimeline(DataRow):
+    _sign = b'BannerTimeline|eJzLywODYgAPhQN2'
+    sheet_name = 'BannerTimeline'
+    timeline_type: int_t = RowData(0)
+    timeline_data: 'Action|Emote|ActionTimeline' = DynamicForeign(1, ComplexSheetKey('timeline_type', (2, 'Action'), (11, 'Emote'), (20, 'ActionTimeline')))
+    class_job: 'ClassJobCategory' = RowForeign(2, 'ClassJobCategory')
+    filter_type: int_t = RowData(3)
+    banner_condition: 'BannerCondition' = RowForeign(4, 'BannerCondition')
+    sort_id: int_t = RowData(5)
+    list_icon: 'Icon' = IconRow(6)
+    text: str_t = RowData(7)
+
+
+class BaseParam(DataRow):
+    _sign = b'BaseParam|eJzLKy7OIwKkAQBiCBEz'
+    sheet_name = 'BaseParam'
+    _display = 'text_name'
+    packet_index: int_t = RowData(0)
+    text_name: str_t = RowData(1)
+    text_help: str_t = RowData(2)
+    sort_id: int_t = RowData(3)
+    item_param_rate: List[int_t] = ListData(ir((4, 22, 1)), RowData)
+    role_rate: List[int_t] = ListData(ir((26, 13, 1)), RowData)
+    inv_sign: bool_t = RowData(39)
+
+
+class Battalion(DataRow):
+    _sign = b'Battalion|eJxLSkIBAC3/Bb8='
+    sheet_name = 'Battalion'
+    table: List[bool_t] = ListData(ir((0, 15, 1)), RowData)
+
+
+class BattleLeve(DataRow):
+    _sign = b'BattleLeve|eJzLyxuSAABEk06j'
+    sheet_name = 'BattleLeve'
+    route_point_time_route_point_time: List[int_t] = ListData(ir((0, 8, 1)), RowData)
+    entry_base_id: List[int_t] = ListData(ir((8, 8, 1)), RowData)
+    entry_level: List[int_t] = ListData(ir((16, 8, 1)), RowData)
+    entry_name_id: List[int_t] = ListData(ir((24, 8, 1)), RowData)
+    entry_drop_event_item_id: List[int_t] = ListData(ir((32, 8, 1)), RowData)
+    entry_drop_event_item_max: List[int_t] = ListData(ir((40, 8, 1)), RowData)
+    entry_drop_event_item_rate: List[int_t] = ListData(ir((48, 8, 1)), RowData)
+    entry_param: List[List[int_t]] = ListData(ir(((56, 6, 8), 8, 1)), ListData, RowData)
+    entry_num_of_appearance: List[List[int_t]] = ListData(ir(((104, 8, 8), 8, 1)), ListData, RowData)
+    todo_todo_sequence: List[int_t] = ListData(ir((168, 8, 1)), RowData)
+    rule: 'BattleLeveRule' = RowForeign(176, 'BattleLeveRule')
+    variation: int_t = RowData(177)
+    objective: 'List[LeveString]' = ListData(ir((178, 3, 1)), RowForeign, 'LeveString')
+    help: List[int_t] = ListData(ir((181, 2, 1)), RowData)
+
+
+class BattleLeveRule(DataRow):
+    _sign = b'BattleLeveRule|eJwrBgAAdAB0'
+    sheet_name = 'BattleLeveRule'
+    _display = 'script'
+    script: str_t = RowData(0)
+
+
+class BeastRankBonus(DataRow):
+    _sign = b'BeastRankBonus|eJzLy0MDAEHPB08='
+    sheet_name = 'BeastRankBonus'
+    exp_rate: List[int_t] = ListData(ir((0, 8, 1)), RowData)
+    item: 'Item' = RowForeign(8, 'Item')
+    item_num_multiple: List[int_t] = ListData(ir((9, 8, 1)), RowData)
+
+
+class BeastReputationRank(DataRow):
+    _sign = b'BeastReputationRank|eJzLKy7OAwAEaQHD'
+    sheet_name = 'BeastReputationRank'
+    _display = 'text_text'
+    max_reputation_value: int_t = RowData(0)
+    text_text: str_t = RowData(1)
+    text_text_ex1: str_t = RowData(2)
+    color: 'UIColor' = RowForeign(3, 'UIColor')
+
+
+class BeastTribe(DataRow):
+    _sign = b'BeastTribe|eJxLy4OBYiAE0wBRdAgy'
+    sheet_name = 'BeastTribe'
+    _display = 'text_sgl'
+    fix_exp: bool_t = RowData(0)
+    fix_exp_base_level_limit: int_t = RowData(1)
+    rank_bonus: 'BeastRankBonus' = RowForeign(2, 'BeastRankBonus')
+    reputation_icon: 'Icon' = IconRow(3)
+    reward_icon: 'Icon' = IconRow(4)
+    last_rank: int_t = RowData(5)
+    category: 'ExVersion' = RowForeign(6, 'ExVersion')
+    extra_quest: int_t = RowData(7)
+    currency: 'Item' = RowForeign(8, 'Item')
+    sort_id: int_t = RowData(9)
+    text_sgl: str_t = RowData(10)
+    text_sgg: int_t = RowData(11)
+    text_plr: str_t = RowData(12)
+    text_plg: int_t = RowData(13)
+    text_vow: int_t = RowData(14)
+    text_cnt: int_t = RowData(15)
+    text_gen: int_t = RowData(16)
+    text_def_: int_t = RowData(17)
+    text_reputation_value: str_t = RowData(18)
+
+
+class BeastTribe(DataRow):
+    _sign = b'BeastTribe|eJxLy4OCYiAE0wBJUQfE'
+    sheet_name = 'BeastTribe'
+    _display = 'text_sgl'
+    fix_exp: bool_t = RowData(0)
+    fix_exp_base_level_limit: int_t = RowData(1)
+    rank_bonus: 'BeastRankBonus' = RowForeign(2, 'BeastRankBonus')
+    reputation_icon: 'Icon' = IconRow(3)
+    reward_icon: 'Icon' = IconRow(4)
+    last_rank: int_t = RowData(5)
+    category: 'ExVersion' = RowForeign(6, 'ExVersion')
+    currency: 'Item' = RowForeign(7, 'Item')
+    sort_id: int_t = RowData(8)
+    text_sgl: str_t = RowData(9)
+    text_sgg: int_t = RowData(10)
+    text_plr: str_t = RowData(11)
+    text_plg: int_t = RowData(12)
+    text_vow: int_t = RowData(13)
+    text_cnt: int_t = RowData(14)
+    text_gen: int_t = RowData(15)
+    text_def_: int_t = RowData(16)
+    text_reputation_value: str_t = RowData(17)
+
+
+class Behavior(DataRow):
+    _sign = b'Behavior|eJzLy0MDAEHPB08='
+    sheet_name = 'Behavior'
+    pack: int_t = RowData(0)
+    caster: int_t = RowData(1)
+    target: int_t = RowData(2)
+    action: int_t = RowData(3)
+    action_arg: int_t = RowData(4)
+    action_arg2: int_t = RowData(5)
+    action_arg3: int_t = RowData(6)
+    move_method: int_t = RowData(7)
+    balloon: 'Balloon' = RowForeign(8, 'Balloon')
+    cond0__target: int_t = RowData(9)
+    cond0__type: int_t = RowData(10)
+    cont0__type_arg0: int_t = RowData(11)
+    cont0__type_arg1: int_t = RowData(12)
+    cond1__target: int_t = RowData(13)
+    cond1__type: int_t = RowData(14)
+    cont1__type_arg0: int_t = RowData(15)
+    cont1__type_arg1: int_t = RowData(16)
+
+
+class BehaviorMove(DataRow):
+    _sign = b'BehaviorMove|eJxLy8tLAwAEKAGp'
+    sheet_name = 'BehaviorMove'
+    running: bool_t = RowData(0)
+    fade_type: int_t = RowData(1)
+    speed: float_t = RowData(2)
+    warp_at_start: bool_t = RowData(3)
+
+
+class BehaviorPath(DataRow):
+    _sign = b'BehaviorPath|eJxLSwOCPAAIbAJt'
+    sheet_name = 'BehaviorPath'
+    is_walking: bool_t = RowData(0)
+    is_fade_in: bool_t = RowData(1)
+    is_fade_out: bool_t = RowData(2)
+    is_turn_transition: bool_t = RowData(3)
+    is_warp_to_begin: bool_t = RowData(4)
+    speed: float_t = RowData(5)
+
+
+class BenchmarkCutSceneTable(DataRow):
+    _sign = b'BenchmarkCutSceneTable|eJwrzgOCtDwADCIDAA=='
+    sheet_name = 'BenchmarkCutSceneTable'
+    text_0: str_t = RowData(0)
+    num_1: int_t = RowData(1)
+    float_2: float_t = RowData(2)
+    float_3: float_t = RowData(3)
+    num_4: int_t = RowData(4)
+    flag_5: bool_t = RowData(5)
+    num_6: int_t = RowData(6)
+
+
+class BenchmarkOverrideEquipment(DataRow):
+    _sign = b'BenchmarkOverrideEquipment|eJzLy8MHAMfsDOU='
+    sheet_name = 'BenchmarkOverrideEquipment'
+    field_0: int_t = RowData(0)
+    field_1: int_t = RowData(1)
+    field_2: int_t = RowData(2)
+    field_3: int_t = RowData(3)
+    model_main_hand: int_t = RowData(4)
+    dye_main_hand: 'Stain' = RowForeign(5, 'Stain')
+    model_off_hand: int_t = RowData(6)
+    dye_off_hand: 'Stain' = RowForeign(7, 'Stain')
+    field_8: int_t = RowData(8)
+    field_9: int_t = RowData(9)
+    model_head: int_t = RowData(10)
+    dye_head: 'Stain' = RowForeign(11, 'Stain')
+    model_body: int_t = RowData(12)
+    dye_body: 'Stain' = RowForeign(13, 'Stain')
+    model_hands: int_t = RowData(14)
+    dye_hands: 'Stain' = RowForeign(15, 'Stain')
+    model_legs: int_t = RowData(16)
+    dye_legs: 'Stain' = RowForeign(17, 'Stain')
+    model_feet: int_t = RowData(18)
+    dye_feet: 'Stain' = RowForeign(19, 'Stain')
+    model_ears: int_t = RowData(20)
+    dye_ears: 'Stain' = RowForeign(21, 'Stain')
+    model_neck: int_t = RowData(22)
+    dye_neck: 'Stain' = RowForeign(23, 'Stain')
+    model_wrists: int_t = RowData(24)
+    dye_wrists: 'Stain' = RowForeign(25, 'Stain')
+    model_left_ring: int_t = RowData(26)
+    dye_left_ring: 'Stain' = RowForeign(27, 'Stain')
+    model_right_ring: int_t = RowData(28)
+    dye_right_ring: 'Stain' = RowForeign(29, 'Stain')
+
+
+class BgcArmyAction(DataRow):
+    _sign = b'BgcArmyAction|eJzLK87LSwMABoMCJA=='
+    sheet_name = 'BgcArmyAction'
+    action: int_t = RowData(0)
+    text: str_t = RowData(1)
+    icon: int_t = RowData(2)
+    ui_priority: int_t = RowData(3)
+    indirection: bool_t = RowData(4)
+
+
+class BgcArmyActionTransient(DataRow):
+    _sign = b'BgcArmyActionTransient|eJwrBgAAdAB0'
+    sheet_name = 'BgcArmyActionTransient'
+    text: str_t = RowData(0)
+
+
+class Booster(DataRow):
+    _sign = b'Booster|eJzLy8vLAwAEUAG5'
+    sheet_name = 'Booster'
+    kind: int_t = RowData(0)
+    catalog_id: int_t = RowData(1)
+    check_level: int_t = RowData(2)
+    event_picture: int_t = RowData(3)
+
+
+class Buddy(DataRow):
+    _sign = b'Buddy|eJzLy8vLKwYCAA+yA4U='
+    sheet_name = 'Buddy'
+    base: int_t = RowData(0)
+    base_equip: 'List[Quest]' = ListData(ir((1, 3, 1)), RowForeign, 'Quest')
+    action_se: List[str_t] = ListData(ir((4, 4, 1)), RowData)
+
+
+class BuddyAction(DataRow):
+    _sign = b'BuddyAction|eJwrLs4DAgAJQwKf'
+    sheet_name = 'BuddyAction'
+    _display = 'text_name'
+    text_name: str_t = RowData(0)
+    text_help: str_t = RowData(1)
+    icon: 'Icon' = IconRow(2)
+    status_icon: 'Icon' = IconRow(3)
+    reward: int_t = RowData(4)
+    ui_priority: int_t = RowData(5)
+
+
+class BuddyEquip(DataRow):
+    _sign = b'BuddyEquip|eJwrzivOAwEICQQAQpwHXg=='
+    sheet_name = 'BuddyEquip'
+    _display = 'text_ui_name'
+    text_sgl: str_t = RowData(0)
+    text_sgg: int_t = RowData(1)
+    text_plr: str_t = RowData(2)
+    text_plg: int_t = RowData(3)
+    text_vow: int_t = RowData(4)
+    text_cnt: int_t = RowData(5)
+    text_gen: int_t = RowData(6)
+    text_def_: int_t = RowData(7)
+    text_ui_name: str_t = RowData(8)
+    model: List[int_t] = ListData(ir((9, 3, 1)), RowData)
+    grand_company: 'GrandCompany' = RowForeign(12, 'GrandCompany')
+    icon: List[Icon] = ListData(ir((13, 3, 1)), IconRow)
+    ui_priority: int_t = RowData(16)
+
+
+class BuddyItem(DataRow):
+    _sign = b'BuddyItem|eJzLS0tLywMABi8CDw=='
+    sheet_name = 'BuddyItem'
+    item: 'Item' = RowForeign(0, 'Item')
+    use_training: bool_t = RowData(1)
+    use_field: bool_t = RowData(2)
+    use_snack: bool_t = RowData(3)
+    status: int_t = RowData(4)
+
+
+class BuddyRank(DataRow):
+    _sign = b'BuddyRank|eJzLAwAAbwBv'
+    sheet_name = 'BuddyRank'
+    rank_up_exp: int_t = RowData(0)
+
+
+class BuddySkill(DataRow):
+    _sign = b'BuddySkill|eJzLS8vLywMABlcCHw=='
+    sheet_name = 'BuddySkill'
+    point: int_t = RowData(0)
+    is_active: bool_t = RowData(1)
+    line: List[int_t] = ListData(ir((2, 3, 1)), RowData)
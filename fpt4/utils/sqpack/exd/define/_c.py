@@ -0,0 +1,1689 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class CSBonusContent(DataRow):
+    _sign = b'CSBonusContent|eJzLy0MGAC0sBgU='
+    sheet_name = 'CSBonusContent'
+    type: int_t = RowData(0)
+    identifier: List[int_t] = ListData(ir((1, 2, 1)), RowData)
+    count_up_threshold: int_t = RowData(3)
+    reward_thresholds: List[int_t] = ListData(ir((4, 5, 1)), RowData)
+    reward_stacks: List[int_t] = ListData(ir((9, 5, 1)), RowData)
+
+
+class CSBonusContentIdentifier(DataRow):
+    _sign = b'CSBonusContentIdentifier|eJzLy0vLAwEAD1ADaQ=='
+    sheet_name = 'CSBonusContentIdentifier'
+    type: int_t = RowData(0)
+    target: int_t = RowData(1)
+    is_quest_select_by_gc: bool_t = RowData(2)
+    quest: List[int_t] = ListData(ir((3, 3, 1)), RowData)
+    reward: int_t = RowData(6)
+    level_or_fate: int_t = RowData(7)
+
+
+class CSBonusContentType(DataRow):
+    _sign = b'CSBonusContentType|eJzLywOBtDQwBQAmvwWH'
+    sheet_name = 'CSBonusContentType'
+    content_type: int_t = RowData(0)
+    addon_list_name: int_t = RowData(1)
+    addon_title_name: int_t = RowData(2)
+    addon_description: int_t = RowData(3)
+    addon_reward_explain: int_t = RowData(4)
+    icon_content_image: int_t = RowData(5)
+    is_grouping: bool_t = RowData(6)
+    is_quest_select_by_gc: bool_t = RowData(7)
+    quest: List[int_t] = ListData(ir((8, 3, 1)), RowData)
+    reward: int_t = RowData(11)
+    content_finder_condition: int_t = RowData(12)
+
+
+class CSBonusMission(DataRow):
+    _sign = b'CSBonusMission|eJzLywMAAUwA3Q=='
+    sheet_name = 'CSBonusMission'
+    content: List[int_t] = ListData(ir((0, 2, 1)), RowData)
+
+
+class CSBonusMissionType(DataRow):
+    _sign = b'CSBonusMissionType|eJzLAwAAbwBv'
+    sheet_name = 'CSBonusMissionType'
+    help_index: int_t = RowData(0)
+
+
+class CSBonusSeason(DataRow):
+    _sign = b'CSBonusSeason|eJxLy8tLSsqDAgAl2wV3'
+    sheet_name = 'CSBonusSeason'
+    can_open_shop: bool_t = RowData(0)
+    target_season: List[int_t] = ListData(ir((1, 2, 1)), RowData)
+    can_add_reward_ui: List[bool_t] = ListData(ir((3, 2, 1)), RowData)
+    reward_item_catalog_id: int_t = RowData(5)
+    mission: List[int_t] = ListData(ir((6, 4, 1)), RowData)
+    cs_bonus_text_data_main_title: int_t = RowData(10)
+    cs_bonus_text_data_sub_title: int_t = RowData(11)
+    web_url: int_t = RowData(12)
+
+
+class CSBonusTextData(DataRow):
+    _sign = b'CSBonusTextData|eJwrBgAAdAB0'
+    sheet_name = 'CSBonusTextData'
+    text: str_t = RowData(0)
+
+
+class Cabinet(DataRow):
+    _sign = b'Cabinet|eJzLy8sDAAKXAUs='
+    sheet_name = 'Cabinet'
+    _display = 'item'
+    item: 'Item' = RowForeign(0, 'Item')
+    priority: int_t = RowData(1)
+    category: 'CabinetCategory' = RowForeign(2, 'CabinetCategory')
+
+
+class CabinetCategory(DataRow):
+    _sign = b'CabinetCategory|eJzLy8vLAwAEUAG5'
+    sheet_name = 'CabinetCategory'
+    _display = 'text'
+    ui_sort: int_t = RowData(0)
+    ui_group: int_t = RowData(1)
+    icon: 'Icon' = IconRow(2)
+    text: 'Addon' = RowForeign(3, 'Addon')
+
+
+class CabinetCategory(DataRow):
+    _sign = b'CabinetCategory|eJzLy8sDAAKXAUs='
+    sheet_name = 'CabinetCategory'
+    _display = 'text'
+    ui_sort: int_t = RowData(0)
+    icon: 'Icon' = IconRow(1)
+    text: 'Addon' = RowForeign(2, 'Addon')
+
+
+class Calendar(DataRow):
+    _sign = b'Calendar|eJzLy6MMAAB+LRuB'
+    sheet_name = 'Calendar'
+    days_month: List[int_t] = ListData(ir((0, 32, 1)), RowData)
+    days_day: List[int_t] = ListData(ir((32, 32, 1)), RowData)
+
+
+class Carry(DataRow):
+    _sign = b'Carry|eJzLy8vLAwAEUAG5'
+    sheet_name = 'Carry'
+    model: int_t = RowData(0)
+    timeline: int_t = RowData(1)
+    ex_hot_bar: int_t = RowData(2)
+    motion: int_t = RowData(3)
+
+
+class Channeling(DataRow):
+    _sign = b'Channeling|eJwrzktLSwMABmACFA=='
+    sheet_name = 'Channeling'
+    file: str_t = RowData(0)
+    limit_dist: int_t = RowData(1)
+    control_chara_only: bool_t = RowData(2)
+    vfx_high_priority: bool_t = RowData(3)
+    clear_dead: bool_t = RowData(4)
+
+
+class CharaCardBase(DataRow):
+    _sign = b'CharaCardBase|eJzLy0tKygOCYgASyAPM'
+    sheet_name = 'CharaCardBase'
+    _display = 'text'
+    icon: 'Icon' = IconRow(0)
+    text_color: int_t = RowData(1)
+    layout: List[bool_t] = ListData(ir((2, 2, 1)), RowData)
+    design_type: int_t = RowData(4)
+    obtain_condition: 'BannerCondition' = RowForeign(5, 'BannerCondition')
+    category: int_t = RowData(6)
+    sort_id: int_t = RowData(7)
+    text: str_t = RowData(8)
+
+
+class CharaCardBase(DataRow):
+    _sign = b'CharaCardBase|eJzLy0tKysvLKwYADwEDXg=='
+    sheet_name = 'CharaCardBase'
+    _display = 'text'
+    icon: 'Icon' = IconRow(0)
+    text_color: int_t = RowData(1)
+    layout: List[bool_t] = ListData(ir((2, 2, 1)), RowData)
+    design_type: int_t = RowData(4)
+    obtain_condition: 'BannerCondition' = RowForeign(5, 'BannerCondition')
+    sort_id: int_t = RowData(6)
+    text: str_t = RowData(7)
+
+
+class CharaCardDecoration(DataRow):
+    _sign = b'CharaCardDecoration|eJzLywODYgAPhQN2'
+    sheet_name = 'CharaCardDecoration'
+    _display = 'text'
+    type: int_t = RowData(0)
+    sub_type: int_t = RowData(1)
+    icon: 'Icon' = IconRow(2)
+    design_type: int_t = RowData(3)
+    obtain_condition: 'BannerCondition' = RowForeign(4, 'BannerCondition')
+    category: int_t = RowData(5)
+    sort_id: int_t = RowData(6)
+    text: str_t = RowData(7)
+
+
+class CharaCardDecoration(DataRow):
+    _sign = b'CharaCardDecoration|eJzLywOBYgAMFAMI'
+    sheet_name = 'CharaCardDecoration'
+    _display = 'text'
+    type: int_t = RowData(0)
+    sub_type: int_t = RowData(1)
+    icon: 'Icon' = IconRow(2)
+    design_type: int_t = RowData(3)
+    obtain_condition: 'BannerCondition' = RowForeign(4, 'BannerCondition')
+    sort_id: int_t = RowData(5)
+    text: str_t = RowData(6)
+
+
+class CharaCardDesignCategory(DataRow):
+    _sign = b'CharaCardDesignCategory|eJzLKwYAAVEA4g=='
+    sheet_name = 'CharaCardDesignCategory'
+    sort_id: int_t = RowData(0)
+    text: str_t = RowData(1)
+
+
+class CharaCardDesignPreset(DataRow):
+    _sign = b'CharaCardDesignPreset|eJzLy4OCYgAXsQRS'
+    sheet_name = 'CharaCardDesignPreset'
+    _display = 'text'
+    base: 'CharaCardBase' = RowForeign(0, 'CharaCardBase')
+    header: 'CharaCardHeader' = RowForeign(1, 'CharaCardHeader')
+    footer: 'CharaCardHeader' = RowForeign(2, 'CharaCardHeader')
+    decoration: 'List[CharaCardDecoration]' = ListData(ir((3, 5, 1)), RowForeign, 'CharaCardDecoration')
+    sort_id: int_t = RowData(8)
+    text: str_t = RowData(9)
+
+
+class CharaCardDesignType(DataRow):
+    _sign = b'CharaCardDesignType|eJxLSkpKgwAAFYgD8Q=='
+    sheet_name = 'CharaCardDesignType'
+    type: List[bool_t] = ListData(ir((0, 3, 1)), RowData)
+    header: bool_t = RowData(3)
+    footer: bool_t = RowData(4)
+    bg: bool_t = RowData(5)
+    base_pattern: bool_t = RowData(6)
+    banner_frame: bool_t = RowData(7)
+    frame: bool_t = RowData(8)
+    sticker: bool_t = RowData(9)
+
+
+class CharaCardHeader(DataRow):
+    _sign = b'CharaCardHeader|eJzLy4OCYgAXsQRS'
+    sheet_name = 'CharaCardHeader'
+    _display = 'text'
+    header_icon: 'Icon' = IconRow(0)
+    footer_icon: 'Icon' = IconRow(1)
+    header_text_color: int_t = RowData(2)
+    footer_text_color: int_t = RowData(3)
+    move_collision_type: int_t = RowData(4)
+    design_type: int_t = RowData(5)
+    obtain_condition: 'BannerCondition' = RowForeign(6, 'BannerCondition')
+    category: int_t = RowData(7)
+    sort_id: int_t = RowData(8)
+    text: str_t = RowData(9)
+
+
+class CharaCardHeader(DataRow):
+    _sign = b'CharaCardHeader|eJzLy4OAYgATZAPk'
+    sheet_name = 'CharaCardHeader'
+    _display = 'text'
+    header_icon: 'Icon' = IconRow(0)
+    footer_icon: 'Icon' = IconRow(1)
+    header_text_color: int_t = RowData(2)
+    footer_text_color: int_t = RowData(3)
+    move_collision_type: int_t = RowData(4)
+    design_type: int_t = RowData(5)
+    obtain_condition: 'BannerCondition' = RowForeign(6, 'BannerCondition')
+    sort_id: int_t = RowData(7)
+    text: str_t = RowData(8)
+
+
+class CharaCardPlayStyle(DataRow):
+    _sign = b'CharaCardPlayStyle|eJzLyysGAAKcAVA='
+    sheet_name = 'CharaCardPlayStyle'
+    _display = 'text'
+    icon: 'Icon' = IconRow(0)
+    sort_id: int_t = RowData(1)
+    text: str_t = RowData(2)
+
+
+class CharaMakeClassEquip(DataRow):
+    _sign = b'CharaMakeClassEquip|eJzLy4MAAA+AA3E='
+    sheet_name = 'CharaMakeClassEquip'
+    helmet: int_t = RowData(0)
+    top: int_t = RowData(1)
+    glove: int_t = RowData(2)
+    down: int_t = RowData(3)
+    shoes: int_t = RowData(4)
+    weapon: int_t = RowData(5)
+    sub_weapon: int_t = RowData(6)
+    class_: 'ClassJob' = RowForeign(7, 'ClassJob')
+
+
+class CharaMakeCustomize(DataRow):
+    _sign = b'CharaMakeCustomize|eJzLy8tLy8vLAwAL7wL7'
+    sheet_name = 'CharaMakeCustomize'
+    _display = 'icon'
+    graphic: int_t = RowData(0)
+    icon: 'Icon' = IconRow(1)
+    need_reward: int_t = RowData(2)
+    hide: bool_t = RowData(3)
+    lobby: 'Lobby' = RowForeign(4, 'Lobby')
+    item: 'Item' = RowForeign(5, 'Item')
+    face: int_t = RowData(6)
+
+
+class CharaMakeName(DataRow):
+    _sign = b'CharaMakeName|eJwrLiYJAAD69hUe'
+    sheet_name = 'CharaMakeName'
+    text_hu_m__m: str_t = RowData(0)
+    text_hu_m__f: str_t = RowData(1)
+    text_hu_m__l: str_t = RowData(2)
+    text_hu_h__m: str_t = RowData(3)
+    text_hu_h__f: str_t = RowData(4)
+    text_hu_h__l: str_t = RowData(5)
+    text_el__m: str_t = RowData(6)
+    text_el__f: str_t = RowData(7)
+    text_el_f__l: str_t = RowData(8)
+    text_el_s__l: str_t = RowData(9)
+    text_mq_s__m: str_t = RowData(10)
+    text_mq_s__f: str_t = RowData(11)
+    text_mq_s__ml: str_t = RowData(12)
+    text_mq_s__fl: str_t = RowData(13)
+    text_mq_m__m: str_t = RowData(14)
+    text_mq_m__f: str_t = RowData(15)
+    text_mq_m__l: str_t = RowData(16)
+    text_la_p__mf: str_t = RowData(17)
+    text_la_p__ml: str_t = RowData(18)
+    text_la_p__mr: str_t = RowData(19)
+    text_la_d__mn: str_t = RowData(20)
+    text_la_d__mr: str_t = RowData(21)
+    text_la_d__fn: str_t = RowData(22)
+    text_la_d__fr: str_t = RowData(23)
+    text_ro_z__mf: str_t = RowData(24)
+    text_ro_z__ml: str_t = RowData(25)
+    text_ro_z__ff: str_t = RowData(26)
+    text_ro_z__fl: str_t = RowData(27)
+    text_ro_r__f: str_t = RowData(28)
+    text_ro_r__ml: str_t = RowData(29)
+    text_ro_r__fl: str_t = RowData(30)
+    text_au_r__mf: str_t = RowData(31)
+    text_au_r__ff: str_t = RowData(32)
+    text_au_r__l: str_t = RowData(33)
+    text_au_x__mf: str_t = RowData(34)
+    text_au_x__ff: str_t = RowData(35)
+    text_au_x__l: str_t = RowData(36)
+    text_hr_h__f: str_t = RowData(37)
+    text_hr_h__l: str_t = RowData(38)
+    text_hr_t__f: str_t = RowData(39)
+    text_hr_t__l: str_t = RowData(40)
+    text_vi__mf: str_t = RowData(41)
+    text_vi_r__ml: str_t = RowData(42)
+    text_vi_v__ml: str_t = RowData(43)
+    text_vi__f: str_t = RowData(44)
+    text_vi_r__l: str_t = RowData(45)
+    text_vi_v__l: str_t = RowData(46)
+
+
+class CharaMakeType(DataRow):
+    _sign = b'CharaMakeType|eJztwSEBAAAAw6DG6y9vHwIoAAAA3gDWjKd8'
+    sheet_name = 'CharaMakeType'
+    race: 'Race' = RowForeign(0, 'Race')
+    tribe: 'Tribe' = RowForeign(1, 'Tribe')
+    gender: int_t = RowData(2)
+    looks_menu: List[int_t] = ListData(ir((3, 28, 1)), RowData)
+    looks_init_val: List[int_t] = ListData(ir((31, 28, 1)), RowData)
+    looks_sub_menu_type: List[int_t] = ListData(ir((59, 28, 1)), RowData)
+    looks_sub_menu_num: List[int_t] = ListData(ir((87, 28, 1)), RowData)
+    looks_look_at: List[int_t] = ListData(ir((115, 28, 1)), RowData)
+    looks_sub_menu_mask: List[int_t] = ListData(ir((143, 28, 1)), RowData)
+    looks_customize: List[int_t] = ListData(ir((171, 28, 1)), RowData)
+    looks_sub_menu_param: List[List[int_t]] = ListData(ir(((199, 100, 28), 28, 1)), ListData, RowData)
+    looks_sub_menu_graphic: List[List[int_t]] = ListData(ir(((2999, 10, 28), 28, 1)), ListData, RowData)
+    voice: List[int_t] = ListData(ir((3279, 12, 1)), RowData)
+    face_option_option: List[List[int_t]] = ListData(ir(((3291, 7, 8), 8, 1)), ListData, RowData)
+    equip_helmet: List[int_t] = ListData(ir((3347, 3, 1)), RowData)
+    equip_top: List[int_t] = ListData(ir((3350, 3, 1)), RowData)
+    equip_glove: List[int_t] = ListData(ir((3353, 3, 1)), RowData)
+    equip_down: List[int_t] = ListData(ir((3356, 3, 1)), RowData)
+    equip_shoes: List[int_t] = ListData(ir((3359, 3, 1)), RowData)
+    equip_weapon: List[int_t] = ListData(ir((3362, 3, 1)), RowData)
+    equip_sub_weapon: List[int_t] = ListData(ir((3365, 3, 1)), RowData)
+
+
+class ChocoboRace(DataRow):
+    _sign = b'ChocoboRace|eJzLywMAAUwA3Q=='
+    sheet_name = 'ChocoboRace'
+    rank: 'ChocoboRaceRank' = RowForeign(0, 'ChocoboRaceRank')
+    territory: 'ChocoboRaceTerritory' = RowForeign(1, 'ChocoboRaceTerritory')
+
+
+class ChocoboRaceAbility(DataRow):
+    _sign = b'ChocoboRaceAbility|eJwrLs7LywMABqQCMQ=='
+    sheet_name = 'ChocoboRaceAbility'
+    _display = 'text_name'
+    text_name: str_t = RowData(0)
+    text_help: str_t = RowData(1)
+    icon: 'Icon' = IconRow(2)
+    type: 'ChocoboRaceAbilityType' = RowForeign(3, 'ChocoboRaceAbilityType')
+    arg: int_t = RowData(4)
+
+
+class ChocoboRaceAbilityType(DataRow):
+    _sign = b'ChocoboRaceAbilityType|eJxLAwAAZwBn'
+    sheet_name = 'ChocoboRaceAbilityType'
+    _display = 'active'
+    active: bool_t = RowData(0)
+
+
+class ChocoboRaceCalculateParam(DataRow):
+    _sign = b'ChocoboRaceCalculateParam|eJzLAwAAbwBv'
+    sheet_name = 'ChocoboRaceCalculateParam'
+    param: int_t = RowData(0)
+
+
+class ChocoboRaceChallenge(DataRow):
+    _sign = b'ChocoboRaceChallenge|eJwrzsvLAwAEZAG+'
+    sheet_name = 'ChocoboRaceChallenge'
+    text: str_t = RowData(0)
+    race_id: int_t = RowData(1)
+    reward_flag: int_t = RowData(2)
+    min_rating: int_t = RowData(3)
+
+
+class ChocoboRaceItem(DataRow):
+    _sign = b'ChocoboRaceItem|eJwrLs4DAAKwAVU='
+    sheet_name = 'ChocoboRaceItem'
+    _display = 'text_name'
+    text_name: str_t = RowData(0)
+    text_help: str_t = RowData(1)
+    icon: 'Icon' = IconRow(2)
+
+
+class ChocoboRaceRank(DataRow):
+    _sign = b'ChocoboRaceRank|eJzLywMCAAZ3Aic='
+    sheet_name = 'ChocoboRaceRank'
+    _display = 'text'
+    rank_min: int_t = RowData(0)
+    rank_max: int_t = RowData(1)
+    text: 'GoldSaucerTextData' = RowForeign(2, 'GoldSaucerTextData')
+    entry_fee: int_t = RowData(3)
+    icon: 'Icon' = IconRow(4)
+
+
+class ChocoboRaceRanking(DataRow):
+    _sign = b'ChocoboRaceRanking|eJzLAwAAbwBv'
+    sheet_name = 'ChocoboRaceRanking'
+    goal_bgm: int_t = RowData(0)
+
+
+class ChocoboRaceStatus(DataRow):
+    _sign = b'ChocoboRaceStatus|eJzLywMAAUwA3Q=='
+    sheet_name = 'ChocoboRaceStatus'
+    _display = 'status'
+    status: 'Status' = RowForeign(0, 'Status')
+    loop_effect: int_t = RowData(1)
+
+
+class ChocoboRaceTerritory(DataRow):
+    _sign = b'ChocoboRaceTerritory|eJzLywMAAUwA3Q=='
+    sheet_name = 'ChocoboRaceTerritory'
+    _display = 'text'
+    text: 'GoldSaucerTextData' = RowForeign(0, 'GoldSaucerTextData')
+    icon: 'Icon' = IconRow(1)
+
+
+class ChocoboRaceTutorial(DataRow):
+    _sign = b'ChocoboRaceTutorial|eJzLy4MBABesBE0='
+    sheet_name = 'ChocoboRaceTutorial'
+    keyboard_npc_yell: List[int_t] = ListData(ir((0, 4, 1)), RowData)
+    pad_npc_yell: List[int_t] = ListData(ir((4, 4, 1)), RowData)
+    todo_message: int_t = RowData(8)
+    todo_item: int_t = RowData(9)
+
+
+class ChocoboRaceWeather(DataRow):
+    _sign = b'ChocoboRaceWeather|eJzLywMAAUwA3Q=='
+    sheet_name = 'ChocoboRaceWeather'
+    weather: 'Weather' = RowForeign(0, 'Weather')
+    type: 'Weather' = RowForeign(1, 'Weather')
+
+
+class ChocoboTaxi(DataRow):
+    _sign = b'ChocoboTaxi|eJzLy8vLSwMABm8CHw=='
+    sheet_name = 'ChocoboTaxi'
+    _display = 'terminus'
+    terminus: 'ChocoboTaxiStand' = RowForeign(0, 'ChocoboTaxiStand')
+    time_required: int_t = RowData(1)
+    fare: int_t = RowData(2)
+    speed: int_t = RowData(3)
+    for_contents: bool_t = RowData(4)
+
+
+class ChocoboTaxiStand(DataRow):
+    _sign = b'ChocoboTaxiStand|eJzLy4OAYgATZAPk'
+    sheet_name = 'ChocoboTaxiStand'
+    _display = 'text'
+    taxi: List[int_t] = ListData(ir((0, 8, 1)), RowData)
+    text: str_t = RowData(8)
+
+
+class CircleActivity(DataRow):
+    _sign = b'CircleActivity|eJwrzssDAAKmAVA='
+    sheet_name = 'CircleActivity'
+    _display = 'text'
+    text: str_t = RowData(0)
+    icon: 'Icon' = IconRow(1)
+    sort: int_t = RowData(2)
+
+
+class ClassJob(DataRow):
+    _sign = b'ClassJob|eJwrLi7OwwEwJdLSAOfsFDc='
+    sheet_name = 'ClassJob'
+    _display = 'text_name'
+    text_name: str_t = RowData(0)
+    text_abbreviation: str_t = RowData(1)
+    text_name_female: str_t = RowData(2)
+    kind: 'ClassJobCategory' = RowForeign(3, 'ClassJobCategory')
+    work_index: int_t = RowData(4)
+    battle_class_index: int_t = RowData(5)
+    battle_class_with_job_index: int_t = RowData(6)
+    job_index: int_t = RowData(7)
+    non_combat_class_index: int_t = RowData(8)
+    hp: int_t = RowData(9)
+    mp: int_t = RowData(10)
+    str: int_t = RowData(11)
+    vit: int_t = RowData(12)
+    dex: int_t = RowData(13)
+    int: int_t = RowData(14)
+    mnd: int_t = RowData(15)
+    pie: int_t = RowData(16)
+    element: List[int_t] = ListData(ir((17, 6, 1)), RowData)
+    pvp_base_param_value: int_t = RowData(23)
+    pvp_action_sort: int_t = RowData(24)
+    pvp_initial_select_action_trait: int_t = RowData(25)
+    main_class: 'ClassJob' = RowForeign(26, 'ClassJob')
+    en_text: str_t = RowData(27)
+    init_weapon: 'List[Item]' = ListData(ir((28, 2, 1)), RowForeign, 'Item')
+    role: int_t = RowData(30)
+    town: 'Town' = RowForeign(31, 'Town')
+    monster_note: 'MonsterNote' = RowForeign(32, 'MonsterNote')
+    party_buff: int_t = RowData(33)
+    limit_break_action: 'List[Action]' = ListData(ir((34, 3, 1)), RowForeign, 'Action')
+    ui_priority: int_t = RowData(37)
+    job_stone: 'Item' = RowForeign(38, 'Item')
+    job_acquire_quest: 'Quest' = RowForeign(39, 'Quest')
+    relic_quest: 'Quest' = RowForeign(40, 'Quest')
+    artifact_quest: 'Quest' = RowForeign(41, 'Quest')
+    initial_level: int_t = RowData(42)
+    recommend_equip_type: int_t = RowData(43)
+    content_finder_matching_group: int_t = RowData(44)
+    sp_job: bool_t = RowData(45)
+    content_class_job_tutorial_flag: bool_t = RowData(46)
+
+
+class ClassJobActionSort(DataRow):
+    _sign = b'ClassJobActionSort|eJzLy8tLAwAESAGx'
+    sheet_name = 'ClassJobActionSort'
+    action: int_t = RowData(0)
+    base_action: int_t = RowData(1)
+    combo_id: int_t = RowData(2)
+    kata_combo: bool_t = RowData(3)
+
+
+class ClassJobCategory(DataRow):
+    _sign = b'ClassJobCategory|eJwrTiIeAAB+IxDq'
+    sheet_name = 'ClassJobCategory'
+    _display = 'text'
+    text: str_t = RowData(0)
+    class_job: List[bool_t] = ListData(ir((1, 43, 1)), RowData)
+
+
+class ClassJobCategory(DataRow):
+    _sign = b'ClassJobCategory|eJwrTiIWAABcsRAm'
+    sheet_name = 'ClassJobCategory'
+    _display = 'text'
+    text: str_t = RowData(0)
+    class_job: List[bool_t] = ListData(ir((1, 41, 1)), RowData)
+
+
+class ClassJobResident(DataRow):
+    _sign = b'ClassJobResident|eJzLAwAAbwBv'
+    sheet_name = 'ClassJobResident'
+    action: int_t = RowData(0)
+
+
+class CollectablesShop(DataRow):
+    _sign = b'CollectablesShop|eJwrzkMGAC1yBgo='
+    sheet_name = 'CollectablesShop'
+    _display = 'text'
+    text: str_t = RowData(0)
+    disclosure_reward_or_quest: 'Quest' = RowForeign(1, 'Quest')
+    type: int_t = RowData(2)
+    item: List[int_t] = ListData(ir((3, 11, 1)), RowData)
+
+
+class CollectablesShopItem(DataRow):
+    _sign = b'CollectablesShopItem|eJzLy4MCABNfA98='
+    sheet_name = 'CollectablesShopItem'
+    _display = 'masterpiece_item'
+    masterpiece_item: 'Item' = RowForeign(0, 'Item')
+    item_group: 'CollectablesShopItemGroup' = RowForeign(1, 'CollectablesShopItemGroup')
+    class_job_level: int_t = RowData(2)
+    disclosure_quest: int_t = RowData(3)
+    masterpiece_level: int_t = RowData(4)
+    star_num: int_t = RowData(5)
+    refine_step: int_t = RowData(6)
+    refine_table: 'CollectablesShopRefine' = RowForeign(7, 'CollectablesShopRefine')
+    reward_table: 'CollectablesShopRewardScrip' = RowForeign(8, 'CollectablesShopRewardScrip')
+
+
+class CollectablesShopItem(DataRow):
+    _sign = b'CollectablesShopItem|eJzLy4MAAA+AA3E='
+    sheet_name = 'CollectablesShopItem'
+    _display = 'masterpiece_item'
+    masterpiece_item: 'Item' = RowForeign(0, 'Item')
+    item_group: 'CollectablesShopItemGroup' = RowForeign(1, 'CollectablesShopItemGroup')
+    class_job_level: int_t = RowData(2)
+    masterpiece_level: int_t = RowData(3)
+    star_num: int_t = RowData(4)
+    refine_step: int_t = RowData(5)
+    refine_table: 'CollectablesShopRefine' = RowForeign(6, 'CollectablesShopRefine')
+    reward_table: 'CollectablesShopRewardScrip' = RowForeign(7, 'CollectablesShopRewardScrip')
+
+
+class CollectablesShopItemGroup(DataRow):
+    _sign = b'CollectablesShopItemGroup|eJwrBgAAdAB0'
+    sheet_name = 'CollectablesShopItemGroup'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class CollectablesShopRefine(DataRow):
+    _sign = b'CollectablesShopRefine|eJzLy8sDAAKXAUs='
+    sheet_name = 'CollectablesShopRefine'
+    refine: List[int_t] = ListData(ir((0, 3, 1)), RowData)
+
+
+class CollectablesShopRewardItem(DataRow):
+    _sign = b'CollectablesShopRewardItem|eJzLS8sDAhABABdEBD0='
+    sheet_name = 'CollectablesShopRewardItem'
+    _display = 'item_a'
+    item_a: 'Item' = RowForeign(0, 'Item')
+    is_hq_a: bool_t = RowData(1)
+    item_stack_a: List[int_t] = ListData(ir((2, 3, 1)), RowData)
+    item_b: int_t = RowData(5)
+    is_hq_b: bool_t = RowData(6)
+    item_stack_b: List[int_t] = ListData(ir((7, 3, 1)), RowData)
+
+
+class CollectablesShopRewardScrip(DataRow):
+    _sign = b'CollectablesShopRewardScrip|eJzLywMDAAwPAwM='
+    sheet_name = 'CollectablesShopRewardScrip'
+    _display = 'currency'
+    currency: int_t = RowData(0)
+    currency_stack: List[int_t] = ListData(ir((1, 3, 1)), RowData)
+    exp_rate: List[int_t] = ListData(ir((4, 3, 1)), RowData)
+
+
+class CollisionIdPallet(DataRow):
+    _sign = b'CollisionIdPallet|eJzLy8sDAAKXAUs='
+    sheet_name = 'CollisionIdPallet'
+    foot_vfx_run: int_t = RowData(0)
+    foot_vfx_walk: int_t = RowData(1)
+    shock_wave: int_t = RowData(2)
+
+
+class ColorFilter(DataRow):
+    _sign = b'ColorFilter|eJwrzsvLS8tDAAA6cAbe'
+    sheet_name = 'ColorFilter'
+    text: str_t = RowData(0)
+    ui_sort_id: int_t = RowData(1)
+    hue: float_t = RowData(2)
+    saturation: float_t = RowData(3)
+    photoshop_method: bool_t = RowData(4)
+    brightness: float_t = RowData(5)
+    contrast: float_t = RowData(6)
+    monochrome: float_t = RowData(7)
+    sepia: float_t = RowData(8)
+    intensity: float_t = RowData(9)
+    red: float_t = RowData(10)
+    green: float_t = RowData(11)
+    blue: float_t = RowData(12)
+    negative: float_t = RowData(13)
+    level_black: float_t = RowData(14)
+    level_white: float_t = RowData(15)
+
+
+class Colosseum(DataRow):
+    _sign = b'Colosseum|eJzLSwMAAUQA1Q=='
+    sheet_name = 'Colosseum'
+    ex_rule: int_t = RowData(0)
+    class_change: bool_t = RowData(1)
+
+
+class ColosseumMatchRank(DataRow):
+    _sign = b'ColosseumMatchRank|eJwrBgAAdAB0'
+    sheet_name = 'ColosseumMatchRank'
+    text: str_t = RowData(0)
+
+
+class Companion(DataRow):
+    _sign = b'Companion|eJwrzivOQwVpIAAkgSy4GAA8FRAf'
+    sheet_name = 'Companion'
+    _display = 'text_sgl'
+    text_sgl: str_t = RowData(0)
+    text_sgg: int_t = RowData(1)
+    text_plr: str_t = RowData(2)
+    text_plg: int_t = RowData(3)
+    text_vow: int_t = RowData(4)
+    text_cnt: int_t = RowData(5)
+    text_gen: int_t = RowData(6)
+    text_def_: int_t = RowData(7)
+    model: 'ModelChara' = RowForeign(8, 'ModelChara')
+    scale: int_t = RowData(9)
+    inactive_idle: List[int_t] = ListData(ir((10, 2, 1)), RowData)
+    inactive_battle: int_t = RowData(12)
+    inactive_wandering: int_t = RowData(13)
+    move_type: 'CompanionMove' = RowForeign(14, 'CompanionMove')
+    special: int_t = RowData(15)
+    wandering_wait: int_t = RowData(16)
+    chat_group: int_t = RowData(17)
+    creature: bool_t = RowData(18)
+    doll: bool_t = RowData(19)
+    stroke: bool_t = RowData(20)
+    poke: bool_t = RowData(21)
+    look_at: bool_t = RowData(22)
+    enemy: int_t = RowData(23)
+    battle: bool_t = RowData(24)
+    roulette: bool_t = RowData(25)
+    icon: 'Icon' = IconRow(26)
+    priority: int_t = RowData(27)
+    valid: bool_t = RowData(28)
+    scale_lo_vm: int_t = RowData(29)
+    cost: int_t = RowData(30)
+    hp: int_t = RowData(31)
+    special_skill: int_t = RowData(32)
+    skill_angle: int_t = RowData(33)
+    sp: int_t = RowData(34)
+    skill_motion: int_t = RowData(35)
+    skill_vfx: int_t = RowData(36)
+    race: 'MinionRace' = RowForeign(37, 'MinionRace')
+
+
+class CompanionMove(DataRow):
+    _sign = b'CompanionMove|eJwrBgAAdAB0'
+    sheet_name = 'CompanionMove'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class CompanionTransient(DataRow):
+    _sign = b'CompanionTransient|eJwrLgaCvLy8NBDIAwAtuAX2'
+    sheet_name = 'CompanionTransient'
+    text_help: str_t = RowData(0)
+    text_expository: str_t = RowData(1)
+    text_cry: str_t = RowData(2)
+    text_skill_name: str_t = RowData(3)
+    text_skill_help: str_t = RowData(4)
+    attack: int_t = RowData(5)
+    defense: int_t = RowData(6)
+    speed: int_t = RowData(7)
+    area_attack: bool_t = RowData(8)
+    gate: bool_t = RowData(9)
+    search: bool_t = RowData(10)
+    shield: bool_t = RowData(11)
+    stone: bool_t = RowData(12)
+    skill_type: 'MinionSkillType' = RowForeign(13, 'MinionSkillType')
+
+
+class CompanyAction(DataRow):
+    _sign = b'CompanyAction|eJwrLs4DgjQADEgDBQ=='
+    sheet_name = 'CompanyAction'
+    _display = 'text_name'
+    text_name: str_t = RowData(0)
+    text_help: str_t = RowData(1)
+    icon: 'Icon' = IconRow(2)
+    need_rank: 'FCRank' = RowForeign(3, 'FCRank')
+    price: int_t = RowData(4)
+    ui_priority: int_t = RowData(5)
+    buyable: bool_t = RowData(6)
+
+
+class CompanyCraftDraft(DataRow):
+    _sign = b'CompanyCraftDraft|eJwrzoMCABOMA+Q='
+    sheet_name = 'CompanyCraftDraft'
+    _display = 'text'
+    text: str_t = RowData(0)
+    category: 'CompanyCraftDraftCategory' = RowForeign(1, 'CompanyCraftDraftCategory')
+    material_item: List[int_t] = ListData(ir((2, 3, 2)), RowData)
+    material_item_num: List[int_t] = ListData(ir((3, 3, 2)), RowData)
+    sort_id: int_t = RowData(8)
+
+
+class CompanyCraftDraftCategory(DataRow):
+    _sign = b'CompanyCraftDraftCategory|eJwrzoMDAByeBMA='
+    sheet_name = 'CompanyCraftDraftCategory'
+    _display = 'text'
+    text: str_t = RowData(0)
+    types: List[int_t] = ListData(ir((1, 10, 1)), RowData)
+
+
+class CompanyCraftManufactoryState(DataRow):
+    _sign = b'CompanyCraftManufactoryState|eJwrBgAAdAB0'
+    sheet_name = 'CompanyCraftManufactoryState'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class CompanyCraftPart(DataRow):
+    _sign = b'CompanyCraftPart|eJzLywMBAAkMApU='
+    sheet_name = 'CompanyCraftPart'
+    pattern_id: int_t = RowData(0)
+    type: 'CompanyCraftType' = RowForeign(1, 'CompanyCraftType')
+    processes: List[int_t] = ListData(ir((2, 4, 1)), RowData)
+
+
+class CompanyCraftProcess(DataRow):
+    _sign = b'CompanyCraftProcess|eJzLyyMMAB5fD3k='
+    sheet_name = 'CompanyCraftProcess'
+    supply_item: List[int_t] = ListData(ir((0, 12, 3)), RowData)
+    supply_unit: List[int_t] = ListData(ir((1, 12, 3)), RowData)
+    number_of_supply: List[int_t] = ListData(ir((2, 12, 3)), RowData)
+
+
+class CompanyCraftSequence(DataRow):
+    _sign = b'CompanyCraftSequence|eJzLy0MGAC0sBgU='
+    sheet_name = 'CompanyCraftSequence'
+    _display = 'item'
+    item: 'Item' = RowForeign(0, 'Item')
+    category: int_t = RowData(1)
+    draft_category: 'CompanyCraftDraftCategory' = RowForeign(2, 'CompanyCraftDraftCategory')
+    type: 'CompanyCraftType' = RowForeign(3, 'CompanyCraftType')
+    draft: 'CompanyCraftDraft' = RowForeign(4, 'CompanyCraftDraft')
+    parts: List[int_t] = ListData(ir((5, 8, 1)), RowData)
+    sort_id: int_t = RowData(13)
+
+
+class CompanyCraftSupplyItem(DataRow):
+    _sign = b'CompanyCraftSupplyItem|eJzLAwAAbwBv'
+    sheet_name = 'CompanyCraftSupplyItem'
+    _display = 'item'
+    item: 'Item' = RowForeign(0, 'Item')
+
+
+class CompanyCraftType(DataRow):
+    _sign = b'CompanyCraftType|eJwrBgAAdAB0'
+    sheet_name = 'CompanyCraftType'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class CompanyLeve(DataRow):
+    _sign = b'CompanyLeve|eJzLyxtqAAC/kkx9'
+    sheet_name = 'CompanyLeve'
+    route_point_time_route_point_time: List[int_t] = ListData(ir((0, 8, 1)), RowData)
+    entry_base_id: List[int_t] = ListData(ir((8, 8, 1)), RowData)
+    entry_level: List[int_t] = ListData(ir((16, 8, 1)), RowData)
+    entry_name_id: List[int_t] = ListData(ir((24, 8, 1)), RowData)
+    entry_drop_event_item_id: List[int_t] = ListData(ir((32, 8, 1)), RowData)
+    entry_drop_event_item_max: List[int_t] = ListData(ir((40, 8, 1)), RowData)
+    entry_drop_event_item_rate: List[int_t] = ListData(ir((48, 8, 1)), RowData)
+    entry_param: List[List[int_t]] = ListData(ir(((56, 6, 8), 8, 1)), ListData, RowData)
+    entry_num_of_appearance: List[List[int_t]] = ListData(ir(((104, 8, 8), 8, 1)), ListData, RowData)
+    todo_todo_sequence: List[int_t] = ListData(ir((168, 8, 1)), RowData)
+    rule: 'CompanyLeveRule' = RowForeign(176, 'CompanyLeveRule')
+    variation: int_t = RowData(177)
+
+
+class CompanyLeveRule(DataRow):
+    _sign = b'CompanyLeveRule|eJwrzssDAAKmAVA='
+    sheet_name = 'CompanyLeveRule'
+    _display = 'script'
+    script: str_t = RowData(0)
+    objective: 'LeveString' = RowForeign(1, 'LeveString')
+    help: 'LeveString' = RowForeign(2, 'LeveString')
+
+
+class CompleteJournal(DataRow):
+    _sign = b'CompleteJournal|eJzLywOC4jwcAADIaQzq'
+    sheet_name = 'CompleteJournal'
+    _display = 'text'
+    id: int_t = RowData(0)
+    level: int_t = RowData(1)
+    level_offset: int_t = RowData(2)
+    icon: 'Icon' = IconRow(3)
+    separate: int_t = RowData(4)
+    text: str_t = RowData(5)
+    cut_scene: List[int_t] = ListData(ir((6, 24, 1)), RowData)
+
+
+class CompleteJournalCategory(DataRow):
+    _sign = b'CompleteJournalCategory|eJzLy8sDAAKXAUs='
+    sheet_name = 'CompleteJournalCategory'
+    begin: 'CompleteJournal' = RowForeign(0, 'CompleteJournal')
+    end: 'CompleteJournal' = RowForeign(1, 'CompleteJournal')
+    separate_type: int_t = RowData(2)
+
+
+class Completion(DataRow):
+    _sign = b'Completion|eJzLyysuLgYABpUCNg=='
+    sheet_name = 'Completion'
+    _display = 'text'
+    group: int_t = RowData(0)
+    key: int_t = RowData(1)
+    lookup_table: str_t = RowData(2)
+    text: str_t = RowData(3)
+    group_title: str_t = RowData(4)
+
+
+class Condition(DataRow):
+    _sign = b'Condition|eJxLy8vLAwAEMAGx'
+    sheet_name = 'Condition'
+    sync: bool_t = RowData(0)
+    permission: int_t = RowData(1)
+    error_log: 'LogMessage' = RowForeign(2, 'LogMessage')
+    priority: int_t = RowData(3)
+
+
+class ConfigKey(DataRow):
+    _sign = b'ConfigKey|eJwrzstLy8vLKwYAD4UDcw=='
+    sheet_name = 'ConfigKey'
+    label: str_t = RowData(0)
+    param: int_t = RowData(1)
+    platform: int_t = RowData(2)
+    required: bool_t = RowData(3)
+    category: int_t = RowData(4)
+    sort: int_t = RowData(5)
+    backlight_group: int_t = RowData(6)
+    text: str_t = RowData(7)
+
+
+class ContentAttributeRect(DataRow):
+    _sign = b'ContentAttributeRect|eJzLyxtYAADcwzcB'
+    sheet_name = 'ContentAttributeRect'
+    param_type: List[int_t] = ListData(ir((0, 32, 1)), RowData)
+    param_param: List[int_t] = ListData(ir((32, 32, 1)), RowData)
+    param_layout_id: List[int_t] = ListData(ir((64, 32, 1)), RowData)
+    param_kind: List[int_t] = ListData(ir((96, 32, 1)), RowData)
+
+
+class ContentCloseCycle(DataRow):
+    _sign = b'ContentCloseCycle|eJzLy8tLggMAJJMFHw=='
+    sheet_name = 'ContentCloseCycle'
+    base_time: int_t = RowData(0)
+    check_time: int_t = RowData(1)
+    open_flag_num: int_t = RowData(2)
+    open_flag: List[bool_t] = ListData(ir((3, 10, 1)), RowData)
+
+
+class ContentDirectorManagedSG(DataRow):
+    _sign = b'ContentDirectorManagedSG|eJzLAwAAbwBv'
+    sheet_name = 'ContentDirectorManagedSG'
+    layout_id: int_t = RowData(0)
+
+
+class ContentEffectiveTime(DataRow):
+    _sign = b'ContentEffectiveTime|eJxLAwAAZwBn'
+    sheet_name = 'ContentEffectiveTime'
+    flag_0: bool_t = RowData(0)
+
+
+class ContentEntry(DataRow):
+    _sign = b'ContentEntry|eJwrBgAAdAB0'
+    sheet_name = 'ContentEntry'
+    text: str_t = RowData(0)
+
+
+class ContentEventItem(DataRow):
+    _sign = b'ContentEventItem|eJzLAwAAbwBv'
+    sheet_name = 'ContentEventItem'
+    event_item: int_t = RowData(0)
+
+
+class ContentExAction(DataRow):
+    _sign = b'ContentExAction|eJzLy8vLAwAEUAG5'
+    sheet_name = 'ContentExAction'
+    action_id: 'List[Action]' = ListData(ir((0, 2, 1)), RowForeign, 'Action')
+    cost_count_max: List[int_t] = ListData(ir((2, 2, 1)), RowData)
+
+
+class ContentFinderCondition(DataRow):
+    _sign = b'ContentFinderCondition|eJwrzsvLS8tDBWlQkAcngKC4GC6dl0QsAAAwrCXg'
+    sheet_name = 'ContentFinderCondition'
+    _display = 'text_name'
+    content_name: str_t = RowData(0)
+    territory_type: 'TerritoryType' = RowForeign(1, 'TerritoryType')
+    director_type: int_t = RowData(2)
+    content_id: 'InstanceContent|PartyContent|PublicContent|GoldSaucerContent|QuestBattle' = DynamicForeign(3, ComplexSheetKey('director_type', (1, 'InstanceContent'), (2, 'PartyContent'), (3, 'PublicContent'), (4, 'GoldSaucerContent'), (5, 'QuestBattle')))
+    is_pvp: bool_t = RowData(4)
+    ex_version: int_t = RowData(5)
+    effective_time: int_t = RowData(6)
+    close_cycle: int_t = RowData(7)
+    accept_class_job_category: 'ClassJobCategory' = RowForeign(8, 'ClassJobCategory')
+    member_type: 'ContentMemberType' = RowForeign(9, 'ContentMemberType')
+    finder_party_condition: int_t = RowData(10)
+    entry_party_member_num: int_t = RowData(11)
+    open_type: int_t = RowData(12)
+    open_param0: 'Quest' = RowForeign(13, 'Quest')
+    ui_open_type: int_t = RowData(14)
+    ui_open_param: int_t = RowData(15)
+    level: int_t = RowData(16)
+    level_max: int_t = RowData(17)
+    item_level: int_t = RowData(18)
+    item_level_max: int_t = RowData(19)
+    force_sync: bool_t = RowData(20)
+    small_party: bool_t = RowData(21)
+    lift_restriction: bool_t = RowData(22)
+    halfway: bool_t = RowData(23)
+    enable_item_limit: bool_t = RowData(24)
+    tourism: bool_t = RowData(25)
+    rate_match: bool_t = RowData(26)
+    rate_change: bool_t = RowData(27)
+    loot_mode: int_t = RowData(28)
+    accept_client_request: bool_t = RowData(29)
+    entry_finder_ui: bool_t = RowData(30)
+    entry_raid_finder_ui: bool_t = RowData(31)
+    enable_finder_ui: bool_t = RowData(32)
+    raid_finder_param_id: int_t = RowData(33)
+    raid_finder_job_matching: bool_t = RowData(34)
+    enable_party_member_entry: bool_t = RowData(35)
+    enable_replay: bool_t = RowData(36)
+    sorting_language: bool_t = RowData(37)
+    only_home_world: bool_t = RowData(38)
+    exclusive: bool_t = RowData(39)
+    hide_notification: bool_t = RowData(40)
+    text_name: str_t = RowData(41)
+    text_short_name: str_t = RowData(42)
+    ui_type: 'ContentType' = RowForeign(43, 'ContentType')
+    ui_category: int_t = RowData(44)
+    contact_list: 'ContentFinderConditionTransient|ContentFinderConditionTransient' = DynamicForeign(45, ComplexSheetKey('ui_category', (6, 'ContentFinderConditionTransient'), (7, 'ContentFinderConditionTransient')))
+    sort_key: int_t = RowData(46)
+    image: 'Icon' = IconRow(47)
+    inlay: 'Icon' = IconRow(48)
+    treasure_obtained_flag: int_t = RowData(49)
+    dummy_expand_table: int_t = RowData(50)
+    is_dkt: bool_t = RowData(51)
+    penalty_type: int_t = RowData(52)
+    random: List[bool_t] = ListData(ir((53, 41, 1)), RowData)
+
+
+class ContentFinderConditionTransient(DataRow):
+    _sign = b'ContentFinderConditionTransient|eJwrBgAAdAB0'
+    sheet_name = 'ContentFinderConditionTransient'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class ContentFinderParamTable(DataRow):
+    _sign = b'ContentFinderParamTable|eJzLy8sDAAKXAUs='
+    sheet_name = 'ContentFinderParamTable'
+    param: List[int_t] = ListData(ir((0, 2, 1)), RowData)
+    cond: int_t = RowData(2)
+
+
+class ContentGauge(DataRow):
+    _sign = b'ContentGauge|eJzLK85LK86DAAAhpwUr'
+    sheet_name = 'ContentGauge'
+    style: int_t = RowData(0)
+    text: str_t = RowData(1)
+    color_default: 'ContentGaugeColor' = RowForeign(2, 'ContentGaugeColor')
+    type: bool_t = RowData(3)
+    se: str_t = RowData(4)
+    param: List[int_t] = ListData(ir((5, 2, 3)), RowData)
+    op: List[int_t] = ListData(ir((6, 2, 3)), RowData)
+    color: List[int_t] = ListData(ir((7, 2, 3)), RowData)
+    time_limit: int_t = RowData(11)
+
+
+class ContentGaugeColor(DataRow):
+    _sign = b'ContentGaugeColor|eJzLy8sDAAKXAUs='
+    sheet_name = 'ContentGaugeColor'
+    gauge_color: int_t = RowData(0)
+    text_color: List[int_t] = ListData(ir((1, 2, 1)), RowData)
+
+
+class ContentMemberType(DataRow):
+    _sign = b'ContentMemberType|eJxLy0tLy4ODNBAAAE+fB+s='
+    sheet_name = 'ContentMemberType'
+    alliance: bool_t = RowData(0)
+    alliance_type: int_t = RowData(1)
+    alliance_entry: bool_t = RowData(2)
+    alliance_entry_only: bool_t = RowData(3)
+    alliance_need_party_count: int_t = RowData(4)
+    alliance_need_member_count: int_t = RowData(5)
+    player_max: int_t = RowData(6)
+    party_member_count: int_t = RowData(7)
+    party_count: int_t = RowData(8)
+    party_count_start: int_t = RowData(9)
+    tank_count: int_t = RowData(10)
+    healer_count: int_t = RowData(11)
+    melee_count: int_t = RowData(12)
+    ranged_count: int_t = RowData(13)
+    differentiate_dps: bool_t = RowData(14)
+    free_role: bool_t = RowData(15)
+    instance_player_limit: bool_t = RowData(16)
+    pvp_team_entry: bool_t = RowData(17)
+    check_sp_job: bool_t = RowData(18)
+
+
+class ContentNpc(DataRow):
+    _sign = b'ContentNpc|eJxLAwAAZwBn'
+    sheet_name = 'ContentNpc'
+    announce_only: bool_t = RowData(0)
+
+
+class ContentNpcTalk(DataRow):
+    _sign = b'ContentNpcTalk|eJzLy4MCABNfA98='
+    sheet_name = 'ContentNpcTalk'
+    type: int_t = RowData(0)
+    talk: List[int_t] = ListData(ir((1, 8, 1)), RowData)
+
+
+class ContentRandomSelect(DataRow):
+    _sign = b'ContentRandomSelect|eJzLAwAAbwBv'
+    sheet_name = 'ContentRandomSelect'
+    _display = 'content_finder_condition'
+    content_finder_condition: 'ContentFinderCondition' = RowForeign(0, 'ContentFinderCondition')
+
+
+class ContentRewardCondition(DataRow):
+    _sign = b'ContentRewardCondition|eJzLAwAAbwBv'
+    sheet_name = 'ContentRewardCondition'
+    condition_type: int_t = RowData(0)
+
+
+class ContentRoulette(DataRow):
+    _sign = b'ContentRoulette|eJwrLgaCvLy0tLy0PEwAFksDAhATSAIAz38Thg=='
+    sheet_name = 'ContentRoulette'
+    _display = 'text_name'
+    text_name: str_t = RowData(0)
+    text_short_name: str_t = RowData(1)
+    text_uniq_name: str_t = RowData(2)
+    text_description: str_t = RowData(3)
+    text_contents: str_t = RowData(4)
+    ex_version: int_t = RowData(5)
+    effective_time: int_t = RowData(6)
+    hide_notification: bool_t = RowData(7)
+    enable_finder: bool_t = RowData(8)
+    open_rule: 'ContentRouletteOpenRule' = RowForeign(9, 'ContentRouletteOpenRule')
+    pvp: bool_t = RowData(10)
+    level: int_t = RowData(11)
+    level_max: int_t = RowData(12)
+    item_level: int_t = RowData(13)
+    item_level_max: int_t = RowData(14)
+    param_table: int_t = RowData(15)
+    image: 'Icon' = IconRow(16)
+    role_bonus: 'ContentRouletteRoleBonus' = RowForeign(17, 'ContentRouletteRoleBonus')
+    clear_reward_a: int_t = RowData(18)
+    clear_reward_b: int_t = RowData(19)
+    clear_reward_c: int_t = RowData(20)
+    clear_reward_pvp_exp: int_t = RowData(21)
+    clear_reward_wolf_mark: int_t = RowData(22)
+    clear_reward_pvp_series_exp: int_t = RowData(23)
+    sortkey: int_t = RowData(24)
+    accept_class_job_category: int_t = RowData(25)
+    member_type: 'ContentMemberType' = RowForeign(26, 'ContentMemberType')
+    finder_party_condition: int_t = RowData(27)
+    entry_party_member_num: int_t = RowData(28)
+    reward: int_t = RowData(29)
+    accept_client_request: bool_t = RowData(30)
+    ui_type: int_t = RowData(31)
+    ui_category: int_t = RowData(32)
+    timelimit: int_t = RowData(33)
+    timelimit_max: int_t = RowData(34)
+    enable_using_item: bool_t = RowData(35)
+    halfway: bool_t = RowData(36)
+    rate_match: bool_t = RowData(37)
+    rate_change: bool_t = RowData(38)
+    loot_mode: int_t = RowData(39)
+    instance_content_reward: 'InstanceContent' = RowForeign(40, 'InstanceContent')
+    net_cafe: bool_t = RowData(41)
+    random_select: int_t = RowData(42)
+    only_home_world: bool_t = RowData(43)
+    is_dkt: bool_t = RowData(44)
+    penalty_type: int_t = RowData(45)
+
+
+class ContentRoulette(DataRow):
+    _sign = b'ContentRoulette|eJwrLgaCvLy0tLy0PAwAFkoDAhATSAIAu7kTGA=='
+    sheet_name = 'ContentRoulette'
+    _display = 'text_name'
+    text_name: str_t = RowData(0)
+    text_short_name: str_t = RowData(1)
+    text_uniq_name: str_t = RowData(2)
+    text_description: str_t = RowData(3)
+    text_contents: str_t = RowData(4)
+    ex_version: int_t = RowData(5)
+    effective_time: int_t = RowData(6)
+    hide_notification: bool_t = RowData(7)
+    enable_finder: bool_t = RowData(8)
+    open_rule: 'ContentRouletteOpenRule' = RowForeign(9, 'ContentRouletteOpenRule')
+    pvp: bool_t = RowData(10)
+    level: int_t = RowData(11)
+    level_max: int_t = RowData(12)
+    item_level: int_t = RowData(13)
+    item_level_max: int_t = RowData(14)
+    image: 'Icon' = IconRow(15)
+    role_bonus: 'ContentRouletteRoleBonus' = RowForeign(16, 'ContentRouletteRoleBonus')
+    clear_reward_a: int_t = RowData(17)
+    clear_reward_b: int_t = RowData(18)
+    clear_reward_c: int_t = RowData(19)
+    clear_reward_pvp_exp: int_t = RowData(20)
+    clear_reward_wolf_mark: int_t = RowData(21)
+    clear_reward_pvp_series_exp: int_t = RowData(22)
+    sortkey: int_t = RowData(23)
+    accept_class_job_category: int_t = RowData(24)
+    member_type: 'ContentMemberType' = RowForeign(25, 'ContentMemberType')
+    finder_party_condition: int_t = RowData(26)
+    entry_party_member_num: int_t = RowData(27)
+    reward: int_t = RowData(28)
+    accept_client_request: bool_t = RowData(29)
+    ui_type: int_t = RowData(30)
+    ui_category: int_t = RowData(31)
+    timelimit: int_t = RowData(32)
+    timelimit_max: int_t = RowData(33)
+    enable_using_item: bool_t = RowData(34)
+    halfway: bool_t = RowData(35)
+    rate_match: bool_t = RowData(36)
+    rate_change: bool_t = RowData(37)
+    loot_mode: int_t = RowData(38)
+    instance_content_reward: 'InstanceContent' = RowForeign(39, 'InstanceContent')
+    net_cafe: bool_t = RowData(40)
+    random_select: int_t = RowData(41)
+    only_home_world: bool_t = RowData(42)
+    is_dkt: bool_t = RowData(43)
+    penalty_type: int_t = RowData(44)
+
+
+class ContentRoulette(DataRow):
+    _sign = b'ContentRoulette|eJwrLgaCvLy0tLy0PHQAFkkDAhATSAIAqGESqg=='
+    sheet_name = 'ContentRoulette'
+    _display = 'text_name'
+    text_name: str_t = RowData(0)
+    text_short_name: str_t = RowData(1)
+    text_uniq_name: str_t = RowData(2)
+    text_description: str_t = RowData(3)
+    text_contents: str_t = RowData(4)
+    ex_version: int_t = RowData(5)
+    effective_time: int_t = RowData(6)
+    hide_notification: bool_t = RowData(7)
+    enable_finder: bool_t = RowData(8)
+    open_rule: 'ContentRouletteOpenRule' = RowForeign(9, 'ContentRouletteOpenRule')
+    pvp: bool_t = RowData(10)
+    level: int_t = RowData(11)
+    level_max: int_t = RowData(12)
+    item_level: int_t = RowData(13)
+    item_level_max: int_t = RowData(14)
+    image: 'Icon' = IconRow(15)
+    role_bonus: 'ContentRouletteRoleBonus' = RowForeign(16, 'ContentRouletteRoleBonus')
+    clear_reward_a: int_t = RowData(17)
+    clear_reward_b: int_t = RowData(18)
+    clear_reward_c: int_t = RowData(19)
+    clear_reward_pvp_exp: int_t = RowData(20)
+    clear_reward_wolf_mark: int_t = RowData(21)
+    sortkey: int_t = RowData(22)
+    accept_class_job_category: int_t = RowData(23)
+    member_type: 'ContentMemberType' = RowForeign(24, 'ContentMemberType')
+    finder_party_condition: int_t = RowData(25)
+    entry_party_member_num: int_t = RowData(26)
+    reward: int_t = RowData(27)
+    accept_client_request: bool_t = RowData(28)
+    ui_type: int_t = RowData(29)
+    ui_category: int_t = RowData(30)
+    timelimit: int_t = RowData(31)
+    timelimit_max: int_t = RowData(32)
+    enable_using_item: bool_t = RowData(33)
+    halfway: bool_t = RowData(34)
+    rate_match: bool_t = RowData(35)
+    rate_change: bool_t = RowData(36)
+    loot_mode: int_t = RowData(37)
+    instance_content_reward: 'InstanceContent' = RowForeign(38, 'InstanceContent')
+    net_cafe: bool_t = RowData(39)
+    random_select: int_t = RowData(40)
+    only_home_world: bool_t = RowData(41)
+    is_dkt: bool_t = RowData(42)
+    penalty_type: int_t = RowData(43)
+
+
+class ContentRouletteOpenRule(DataRow):
+    _sign = b'ContentRouletteOpenRule|eJxLywMAATwA1Q=='
+    sheet_name = 'ContentRouletteOpenRule'
+    need_clear_all: bool_t = RowData(0)
+    required_open_num: int_t = RowData(1)
+
+
+class ContentRouletteRoleBonus(DataRow):
+    _sign = b'ContentRouletteRoleBonus|eJzLy0MAACGQBSk='
+    sheet_name = 'ContentRouletteRoleBonus'
+    exp_rate: int_t = RowData(0)
+    gil_rate: int_t = RowData(1)
+    seals_rate: int_t = RowData(2)
+    tomestone_a: int_t = RowData(3)
+    tomestone_b: int_t = RowData(4)
+    tomestone_c: int_t = RowData(5)
+    item: 'List[Item]' = ListData(ir((6, 2, 3)), RowForeign, 'Item')
+    item_count: List[int_t] = ListData(ir((7, 2, 3)), RowData)
+    item_condition: List[int_t] = ListData(ir((8, 2, 3)), RowData)
+
+
+class ContentTalk(DataRow):
+    _sign = b'ContentTalk|eJzLKwYAAVEA4g=='
+    sheet_name = 'ContentTalk'
+    _display = 'text'
+    param: 'ContentTalkParam' = RowForeign(0, 'ContentTalkParam')
+    text: str_t = RowData(1)
+
+
+class ContentTalkParam(DataRow):
+    _sign = b'ContentTalkParam|eJxLywMBAAjcAo0='
+    sheet_name = 'ContentTalkParam'
+    look_at: bool_t = RowData(0)
+    turn: int_t = RowData(1)
+    gesture: 'ActionTimeline' = RowForeign(2, 'ActionTimeline')
+    lip_sync: int_t = RowData(3)
+    facial: int_t = RowData(4)
+    shape: int_t = RowData(5)
+
+
+class ContentTodo(DataRow):
+    _sign = b'ContentTodo|eJzLy8vLSwMABm8CHw=='
+    sheet_name = 'ContentTodo'
+    type: int_t = RowData(0)
+    text: int_t = RowData(1)
+    param: int_t = RowData(2)
+    progress: int_t = RowData(3)
+    hide_flag: bool_t = RowData(4)
+
+
+class ContentTourismConstruct(DataRow):
+    _sign = b'ContentTourismConstruct|eJzLy0MGAC0sBgU='
+    sheet_name = 'ContentTourismConstruct'
+    type: int_t = RowData(0)
+    param: List[int_t] = ListData(ir((1, 13, 1)), RowData)
+
+
+class ContentType(DataRow):
+    _sign = b'ContentType|eJwrzgMBAAkqApo='
+    sheet_name = 'ContentType'
+    _display = 'text'
+    text: str_t = RowData(0)
+    icon_large: 'Icon' = IconRow(1)
+    icon_small: 'Icon' = IconRow(2)
+    in_content_detail: int_t = RowData(3)
+    priority: int_t = RowData(4)
+    journal_separate: int_t = RowData(5)
+
+
+class ContentUICategory(DataRow):
+    _sign = b'ContentUICategory|eJwrBgAAdAB0'
+    sheet_name = 'ContentUICategory'
+    text: str_t = RowData(0)
+
+
+class ContentsNote(DataRow):
+    _sign = b'ContentsNote|eJzLy4OD4uI8AC1FBg8='
+    sheet_name = 'ContentsNote'
+    category: 'ContentsNoteCategory' = RowForeign(0, 'ContentsNoteCategory')
+    icon: 'Icon' = IconRow(1)
+    ui_priority: int_t = RowData(2)
+    cond_arg: int_t = RowData(3)
+    reward: List[int_t] = ListData(ir((4, 2, 2)), RowData)
+    reward_arg: List[int_t] = ListData(ir((5, 2, 2)), RowData)
+    open_level: int_t = RowData(8)
+    open_how_to: 'HowTo' = RowForeign(9, 'HowTo')
+    open_reward: int_t = RowData(10)
+    text_name: str_t = RowData(11)
+    text_help: str_t = RowData(12)
+    exp_limit: int_t = RowData(13)
+
+
+class ContentsNoteCategory(DataRow):
+    _sign = b'ContentsNoteCategory|eJzLKwYAAVEA4g=='
+    sheet_name = 'ContentsNoteCategory'
+    ui_priority: int_t = RowData(0)
+    text: str_t = RowData(1)
+
+
+class ContentsNoteLevel(DataRow):
+    _sign = b'ContentsNoteLevel|eJzLAwAAbwBv'
+    sheet_name = 'ContentsNoteLevel'
+    num_0: int_t = RowData(0)
+
+
+class ContentsNoteRewardEurekaEXP(DataRow):
+    _sign = b'ContentsNoteRewardEurekaEXP|eJzLAwAAbwBv'
+    sheet_name = 'ContentsNoteRewardEurekaEXP'
+    base_exp: int_t = RowData(0)
+
+
+class ContentsTutorial(DataRow):
+    _sign = b'ContentsTutorial|eJzLy4OA4mIAF7sEVw=='
+    sheet_name = 'ContentsTutorial'
+    _display = 'title_title'
+    page: List[int_t] = ListData(ir((0, 8, 1)), RowData)
+    title_title: str_t = RowData(8)
+    title_sub_title: str_t = RowData(9)
+
+
+class ContentsTutorial(DataRow):
+    _sign = b'ContentsTutorial|eJwrLs6DAgAYCwRX'
+    sheet_name = 'ContentsTutorial'
+    _display = 'title_title'
+    title_title: str_t = RowData(0)
+    title_sub_title: str_t = RowData(1)
+    page: List[int_t] = ListData(ir((2, 8, 1)), RowData)
+
+
+class ContentsTutorialPage(DataRow):
+    _sign = b'ContentsTutorialPage|eJzLKwYAAVEA4g=='
+    sheet_name = 'ContentsTutorialPage'
+    icon: 'Icon' = IconRow(0)
+    text: str_t = RowData(1)
+
+
+class CraftAction(DataRow):
+    _sign = b'CraftAction|eJwrLs6DgLQ8OAAAWrsImw=='
+    sheet_name = 'CraftAction'
+    _display = 'text_name'
+    text_name: str_t = RowData(0)
+    text_help: str_t = RowData(1)
+    timeline: 'ActionTimeline' = RowForeign(2, 'ActionTimeline')
+    sub_timeline: 'ActionTimeline' = RowForeign(3, 'ActionTimeline')
+    icon: 'Icon' = IconRow(4)
+    class_job: 'ClassJob' = RowForeign(5, 'ClassJob')
+    use_class_job: 'ClassJobCategory' = RowForeign(6, 'ClassJobCategory')
+    lv: int_t = RowData(7)
+    reward: 'Quest' = RowForeign(8, 'Quest')
+    meister: bool_t = RowData(9)
+    cond_non_status: int_t = RowData(10)
+    cost_cp: int_t = RowData(11)
+    action: 'List[CraftAction]' = ListData(ir((12, 8, 1)), RowForeign, 'CraftAction')
+
+
+class CraftLeve(DataRow):
+    _sign = b'CraftLeve|eJzLy4MDABxnBLs='
+    sheet_name = 'CraftLeve'
+    _display = 'leve'
+    leve: 'Leve' = RowForeign(0, 'Leve')
+    talk: 'CraftLeveTalk' = RowForeign(1, 'CraftLeveTalk')
+    additional_times: int_t = RowData(2)
+    item: List[int_t] = ListData(ir((3, 4, 2)), RowData)
+    item_num: List[int_t] = ListData(ir((4, 4, 2)), RowData)
+
+
+class CraftLeveTalk(DataRow):
+    _sign = b'CraftLeveTalk|eJxLSwOBPLygGAwAfTwR+w=='
+    sheet_name = 'CraftLeveTalk'
+    param_look_at: List[bool_t] = ListData(ir((0, 6, 1)), RowData)
+    param_turn: List[int_t] = ListData(ir((6, 6, 1)), RowData)
+    param_gesture: List[int_t] = ListData(ir((12, 6, 1)), RowData)
+    param_lip_sync: List[int_t] = ListData(ir((18, 6, 1)), RowData)
+    param_facial: List[int_t] = ListData(ir((24, 6, 1)), RowData)
+    param_shape: List[int_t] = ListData(ir((30, 6, 1)), RowData)
+    text: List[str_t] = ListData(ir((36, 6, 1)), RowData)
+
+
+class CraftLevelDifference(DataRow):
+    _sign = b'CraftLevelDifference|eJzLAwAAbwBv'
+    sheet_name = 'CraftLevelDifference'
+    level_difference: int_t = RowData(0)
+
+
+class CraftType(DataRow):
+    _sign = b'CraftType|eJzLyysGAAKcAVA='
+    sheet_name = 'CraftType'
+    _display = 'text'
+    main_physical: int_t = RowData(0)
+    sub_physical: int_t = RowData(1)
+    text: str_t = RowData(2)
+
+
+class Credit(DataRow):
+    _sign = b'Credit|eJzLy4MDABxnBLs='
+    sheet_name = 'Credit'
+    type: int_t = RowData(0)
+    cast: 'List[CreditCast]' = ListData(ir((1, 10, 1)), RowForeign, 'CreditCast')
+
+
+class CreditBackImage(DataRow):
+    _sign = b'CreditBackImage|eJzLy0tLS8vLAwALrwLr'
+    sheet_name = 'CreditBackImage'
+    start: int_t = RowData(0)
+    end: int_t = RowData(1)
+    transparent: bool_t = RowData(2)
+    scale_on: bool_t = RowData(3)
+    lang_layer: bool_t = RowData(4)
+    image: 'Icon' = IconRow(5)
+    effect: int_t = RowData(6)
+
+
+class CreditCast(DataRow):
+    _sign = b'CreditCast|eJwrBgAAdAB0'
+    sheet_name = 'CreditCast'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class CreditDataSet(DataRow):
+    _sign = b'CreditDataSet|eJzLy8vLSwMABm8CHw=='
+    sheet_name = 'CreditDataSet'
+    credit_list: int_t = RowData(0)
+    credit_list_ch: int_t = RowData(1)
+    credit_list_ko: int_t = RowData(2)
+    back_image: int_t = RowData(3)
+    is_not_skip: bool_t = RowData(4)
+
+
+class CreditFont(DataRow):
+    _sign = b'CreditFont|eJzLy4MCABNfA98='
+    sheet_name = 'CreditFont'
+    font: int_t = RowData(0)
+    size: int_t = RowData(1)
+    color_r: int_t = RowData(2)
+    color_g: int_t = RowData(3)
+    color_b: int_t = RowData(4)
+    edge_r: int_t = RowData(5)
+    edge_g: int_t = RowData(6)
+    edge_b: int_t = RowData(7)
+    kerning: int_t = RowData(8)
+
+
+class CreditList(DataRow):
+    _sign = b'CreditList|eJzLywMBAAkMApU='
+    sheet_name = 'CreditList'
+    space: int_t = RowData(0)
+    icon: 'Icon' = IconRow(1)
+    font: 'CreditFont' = RowForeign(2, 'CreditFont')
+    x: int_t = RowData(3)
+    align: int_t = RowData(4)
+    text: 'CreditListText' = RowForeign(5, 'CreditListText')
+
+
+class CreditListText(DataRow):
+    _sign = b'CreditListText|eJwrBgAAdAB0'
+    sheet_name = 'CreditListText'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class CreditVersion(DataRow):
+    _sign = b'CreditVersion|eJzLAwAAbwBv'
+    sheet_name = 'CreditVersion'
+    play_credit: int_t = RowData(0)
+
+
+class CurrencyScripConvert(DataRow):
+    _sign = b'CurrencyScripConvert|eJxLy8vLAwAEMAGx'
+    sheet_name = 'CurrencyScripConvert'
+    visible: bool_t = RowData(0)
+    from_currency: int_t = RowData(1)
+    to_currency: int_t = RowData(2)
+    rate: int_t = RowData(3)
+
+
+class CustomTalk(DataRow):
+    _sign = b'CustomTalk|eJzLyyvGD/LwgrTi4jQYAHEBcXUiQA=='
+    sheet_name = 'CustomTalk'
+    _display = 'script'
+    announce_icon: 'Icon' = IconRow(0)
+    map_icon: 'Icon' = IconRow(1)
+    script: str_t = RowData(2)
+    define_name: List[str_t] = ListData(ir((3, 30, 1)), RowData)
+    define_value: List[int_t] = ListData(ir((33, 30, 1)), RowData)
+    client_event: bool_t = RowData(63)
+    text_name: str_t = RowData(64)
+    text_tooltip: str_t = RowData(65)
+    accept_callback: bool_t = RowData(66)
+    condition_callback: bool_t = RowData(67)
+    permission_callback: bool_t = RowData(68)
+    targeting_possible_callback: bool_t = RowData(69)
+    announce_callback: bool_t = RowData(70)
+    listen_emote: bool_t = RowData(71)
+    listen_enter_territory: bool_t = RowData(72)
+    listen_housing: bool_t = RowData(73)
+    listen_ui: bool_t = RowData(74)
+    nest_handler: int_t = RowData(75)
+    event_situation_icon: int_t = RowData(76)
+    dynamic_icon: int_t = RowData(77)
+    accept_world_travelling: bool_t = RowData(78)
+
+
+class CustomTalkDefineClient(DataRow):
+    _sign = b'CustomTalkDefineClient|eJwrzgMAAVYA4g=='
+    sheet_name = 'CustomTalkDefineClient'
+    name: str_t = RowData(0)
+    value: int_t = RowData(1)
+
+
+class CustomTalkNestHandlers(DataRow):
+    _sign = b'CustomTalkNestHandlers|eJzLAwAAbwBv'
+    sheet_name = 'CustomTalkNestHandlers'
+    nest_handler: int_t = RowData(0)
+
+
+class CustomTalkResident(DataRow):
+    _sign = b'CustomTalkResident|eJzLAwAAbwBv'
+    sheet_name = 'CustomTalkResident'
+    client_derived_class: int_t = RowData(0)
+
+
+class CutActionTimeline(DataRow):
+    _sign = b'CutActionTimeline|eJwrzgMCAAaQAiw='
+    sheet_name = 'CutActionTimeline'
+    filename: str_t = RowData(0)
+    load_type: int_t = RowData(1)
+    motion_type: int_t = RowData(2)
+    start_attach: int_t = RowData(3)
+    weapon_timeline: int_t = RowData(4)
+
+
+class CutSceneIncompQuest(DataRow):
+    _sign = b'CutSceneIncompQuest|eJzLAwAAbwBv'
+    sheet_name = 'CutSceneIncompQuest'
+    _display = 'incomp_quest'
+    incomp_quest: 'Quest' = RowForeign(0, 'Quest')
+
+
+class CutScreenImage(DataRow):
+    _sign = b'CutScreenImage|eJzLy8sDAAKXAUs='
+    sheet_name = 'CutScreenImage'
+    type: int_t = RowData(0)
+    icon: int_t = RowData(1)
+    jingle: int_t = RowData(2)
+
+
+class Cutscene(DataRow):
+    _sign = b'Cutscene|eJwrzstLywOBNAAXngRC'
+    sheet_name = 'Cutscene'
+    _display = 'path'
+    path: str_t = RowData(0)
+    class_job: int_t = RowData(1)
+    cutscene_type: int_t = RowData(2)
+    sp_select: bool_t = RowData(3)
+    branch_condition_quest: List[int_t] = ListData(ir((4, 4, 1)), RowData)
+    incomp_quest: int_t = RowData(8)
+    seamless_play: bool_t = RowData(9)
+
+
+class Cutscene(DataRow):
+    _sign = b'Cutscene|eJwrzstLywMBABNcA9w='
+    sheet_name = 'Cutscene'
+    _display = 'path'
+    path: str_t = RowData(0)
+    class_job: int_t = RowData(1)
+    cutscene_type: int_t = RowData(2)
+    sp_select: bool_t = RowData(3)
+    branch_condition_quest: List[int_t] = ListData(ir((4, 4, 1)), RowData)
+    incomp_quest: int_t = RowData(8)
+
+
+class CutsceneActorSize(DataRow):
+    _sign = b'CutsceneActorSize|eJzLywMBAAkMApU='
+    sheet_name = 'CutsceneActorSize'
+    race: int_t = RowData(0)
+    tribe: int_t = RowData(1)
+    customize_sex: int_t = RowData(2)
+    pc_size: int_t = RowData(3)
+    pc_size_extra: int_t = RowData(4)
+    pc_size_sb: int_t = RowData(5)
+
+
+class CutsceneEventMotion(DataRow):
+    _sign = b'CutsceneEventMotion|eJzLy0MGAC0sBgU='
+    sheet_name = 'CutsceneEventMotion'
+    model_chara_type: int_t = RowData(0)
+    skeleton_id: int_t = RowData(1)
+    walk__loop__speed: float_t = RowData(2)
+    run__loop__speed: float_t = RowData(3)
+    slowwalk__loop__speed: float_t = RowData(4)
+    slowrun__loop__speed: float_t = RowData(5)
+    battlewalk__loop__speed: float_t = RowData(6)
+    battlerun__loop__speed: float_t = RowData(7)
+    dash__loop__speed: float_t = RowData(8)
+    dash__loop2__speed: float_t = RowData(9)
+    turn__cw90__frame: float_t = RowData(10)
+    turn__ccw90__frame: float_t = RowData(11)
+    turn__cw180__frame: float_t = RowData(12)
+    turn__ccw180__frame: float_t = RowData(13)
+
+
+class CutsceneMotion(DataRow):
+    _sign = b'CutsceneMotion|eJzLy4MDABxnBLs='
+    sheet_name = 'CutsceneMotion'
+    walk__loop__speed: float_t = RowData(0)
+    run__loop__speed: float_t = RowData(1)
+    slowwalk__loop__speed: float_t = RowData(2)
+    slowrun__loop__speed: float_t = RowData(3)
+    battlewalk__loop__speed: float_t = RowData(4)
+    battlerun__loop__speed: float_t = RowData(5)
+    dash__loop__speed: float_t = RowData(6)
+    turn__cw90__frame: int_t = RowData(7)
+    turn__ccw90__frame: int_t = RowData(8)
+    turn__cw180__frame: int_t = RowData(9)
+    turn__ccw180__frame: int_t = RowData(10)
+
+
+class CutsceneName(DataRow):
+    _sign = b'CutsceneName|eJwrBgAAdAB0'
+    sheet_name = 'CutsceneName'
+    text: str_t = RowData(0)
+
+
+class CutsceneWorkIndex(DataRow):
+    _sign = b'CutsceneWorkIndex|eJzLAwAAbwBv'
+    sheet_name = 'CutsceneWorkIndex'
+    work_index: int_t = RowData(0)
+
+
+class CycleTime(DataRow):
+    _sign = b'CycleTime|eJzLywMAAUwA3Q=='
+    sheet_name = 'CycleTime'
+    first_cycle_offset: int_t = RowData(0)
+    cycle: int_t = RowData(1)
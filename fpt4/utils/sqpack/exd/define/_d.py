@@ -0,0 +1,435 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class DailySupplyItem(DataRow):
+    _sign = b'DailySupplyItem|eJzLy8MOAIEAClE='
+    sheet_name = 'DailySupplyItem'
+    item: List[int_t] = ListData(ir((0, 8, 3)), RowData)
+    count: List[int_t] = ListData(ir((1, 8, 3)), RowData)
+    level: List[int_t] = ListData(ir((2, 8, 3)), RowData)
+
+
+class DawnContent(DataRow):
+    _sign = b'DawnContent|eJzLS0tLy0MBAEgMB6U='
+    sheet_name = 'DawnContent'
+    _display = 'content'
+    content: 'ContentFinderCondition' = RowForeign(0, 'ContentFinderCondition')
+    under_construction: bool_t = RowData(1)
+    grow_supported: bool_t = RowData(2)
+    member_select: bool_t = RowData(3)
+    exp: List[int_t] = ListData(ir((4, 2, 1)), RowData)
+    enter_quest: int_t = RowData(6)
+    enter_quest_sequence: int_t = RowData(7)
+    announce_entrance_e_obj: List[int_t] = ListData(ir((8, 2, 1)), RowData)
+    announce_e_npc: List[int_t] = ListData(ir((10, 8, 1)), RowData)
+
+
+class DawnContentParticipable(DataRow):
+    _sign = b'DawnContentParticipable|eJzLAwAAbwBv'
+    sheet_name = 'DawnContentParticipable'
+    quest_member: int_t = RowData(0)
+
+
+class DawnGrowMember(DataRow):
+    _sign = b'DawnGrowMember|eJzLywMDAAwPAwM='
+    sheet_name = 'DawnGrowMember'
+    icon: List[int_t] = ListData(ir((0, 3, 1)), RowData)
+    icon_pt: List[int_t] = ListData(ir((3, 3, 1)), RowData)
+    ui_param: 'DawnMemberUIParam' = RowForeign(6, 'DawnMemberUIParam')
+
+
+class DawnMember(DataRow):
+    _sign = b'DawnMember|eJzLywMAAUwA3Q=='
+    sheet_name = 'DawnMember'
+    class_job: int_t = RowData(0)
+    fake_class_job: int_t = RowData(1)
+
+
+class DawnMemberUIParam(DataRow):
+    _sign = b'DawnMemberUIParam|eJwrLs4rBgAEeAHI'
+    sheet_name = 'DawnMemberUIParam'
+    _display = 'class_job_en_name'
+    class_job_en_name: str_t = RowData(0)
+    lang_param_name: str_t = RowData(1)
+    lang_param_voice: int_t = RowData(2)
+    lang_param_class_job_name: str_t = RowData(3)
+
+
+class DawnQuestMember(DataRow):
+    _sign = b'DawnQuestMember|eJzLywMBAAkMApU='
+    sheet_name = 'DawnQuestMember'
+    _display = 'e_npc_id'
+    base: int_t = RowData(0)
+    exclusive_group: int_t = RowData(1)
+    e_npc_id: 'ENpcResident' = RowForeign(2, 'ENpcResident')
+    icon: 'Icon' = IconRow(3)
+    icon_pt: 'Icon' = IconRow(4)
+    ui_param: 'DawnMemberUIParam' = RowForeign(5, 'DawnMemberUIParam')
+
+
+class DeepDungeon(DataRow):
+    _sign = b'DeepDungeon|eJzLy8MKivPSAJbzCyo='
+    sheet_name = 'DeepDungeon'
+    _display = 'text'
+    weapon: 'DeepDungeonEquipment' = RowForeign(0, 'DeepDungeonEquipment')
+    armor: 'DeepDungeonEquipment' = RowForeign(1, 'DeepDungeonEquipment')
+    item: List[int_t] = ListData(ir((2, 16, 1)), RowData)
+    magic_stone_type: int_t = RowData(18)
+    magic_stone: List[int_t] = ListData(ir((19, 4, 1)), RowData)
+    text: str_t = RowData(23)
+    open_condition: 'ContentFinderCondition' = RowForeign(24, 'ContentFinderCondition')
+    up_flag: bool_t = RowData(25)
+
+
+class DeepDungeonBan(DataRow):
+    _sign = b'DeepDungeonBan|eJzLy8sDAAKXAUs='
+    sheet_name = 'DeepDungeonBan'
+    _display = 'effect_ui'
+    screen_image: 'ScreenImage' = RowForeign(0, 'ScreenImage')
+    log_message: 'LogMessage' = RowForeign(1, 'LogMessage')
+    effect_ui: 'DeepDungeonFloorEffectUI' = RowForeign(2, 'DeepDungeonFloorEffectUI')
+
+
+class DeepDungeonDanger(DataRow):
+    _sign = b'DeepDungeonDanger|eJzLy8sDAAKXAUs='
+    sheet_name = 'DeepDungeonDanger'
+    screen_image: 'ScreenImage' = RowForeign(0, 'ScreenImage')
+    log_message: 'LogMessage' = RowForeign(1, 'LogMessage')
+    effect_ui: 'DeepDungeonFloorEffectUI' = RowForeign(2, 'DeepDungeonFloorEffectUI')
+
+
+class DeepDungeonDemiclone(DataRow):
+    _sign = b'DeepDungeonDemiclone|eJzLK84rzgOB4mIAHNAEzw=='
+    sheet_name = 'DeepDungeonDemiclone'
+    icon: int_t = RowData(0)
+    text_sgl: str_t = RowData(1)
+    text_sgg: int_t = RowData(2)
+    text_plr: str_t = RowData(3)
+    text_plg: int_t = RowData(4)
+    text_vow: int_t = RowData(5)
+    text_cnt: int_t = RowData(6)
+    text_gen: int_t = RowData(7)
+    text_def_: int_t = RowData(8)
+    text_name: str_t = RowData(9)
+    text_help: str_t = RowData(10)
+
+
+class DeepDungeonEquipment(DataRow):
+    _sign = b'DeepDungeonEquipment|eJzLK84rzgOB4mIAHNAEzw=='
+    sheet_name = 'DeepDungeonEquipment'
+    _display = 'text_name'
+    icon: 'Icon' = IconRow(0)
+    text_sgl: str_t = RowData(1)
+    text_sgg: int_t = RowData(2)
+    text_plr: str_t = RowData(3)
+    text_plg: int_t = RowData(4)
+    text_vow: int_t = RowData(5)
+    text_cnt: int_t = RowData(6)
+    text_gen: int_t = RowData(7)
+    text_def_: int_t = RowData(8)
+    text_name: str_t = RowData(9)
+    text_help: str_t = RowData(10)
+
+
+class DeepDungeonFloorEffectUI(DataRow):
+    _sign = b'DeepDungeonFloorEffectUI|eJzLKy4GAAKmAVU='
+    sheet_name = 'DeepDungeonFloorEffectUI'
+    _display = 'text_name'
+    icon: 'Icon' = IconRow(0)
+    text_name: str_t = RowData(1)
+    text_help: str_t = RowData(2)
+
+
+class DeepDungeonGrowData(DataRow):
+    _sign = b'DeepDungeonGrowData|eJzLAwAAbwBv'
+    sheet_name = 'DeepDungeonGrowData'
+    limit_equip_level: int_t = RowData(0)
+
+
+class DeepDungeonItem(DataRow):
+    _sign = b'DeepDungeonItem|eJzLK84rzgOB4uI8ACINBT0='
+    sheet_name = 'DeepDungeonItem'
+    _display = 'text_name'
+    icon: 'Icon' = IconRow(0)
+    text_sgl: str_t = RowData(1)
+    text_sgg: int_t = RowData(2)
+    text_plr: str_t = RowData(3)
+    text_plg: int_t = RowData(4)
+    text_vow: int_t = RowData(5)
+    text_cnt: int_t = RowData(6)
+    text_gen: int_t = RowData(7)
+    text_def_: int_t = RowData(8)
+    text_name: str_t = RowData(9)
+    text_help: str_t = RowData(10)
+    action: 'Action' = RowForeign(11, 'Action')
+
+
+class DeepDungeonLayer(DataRow):
+    _sign = b'DeepDungeonLayer|eJzLywMDAAwPAwM='
+    sheet_name = 'DeepDungeonLayer'
+    deep_dungeon_id: 'DeepDungeon' = RowForeign(0, 'DeepDungeon')
+    progress: int_t = RowData(1)
+    map: 'List[DeepDungeonMap5X]' = ListData(ir((2, 2, 1)), RowForeign, 'DeepDungeonMap5X')
+    large_room: 'DeepDungeonMap5X' = RowForeign(4, 'DeepDungeonMap5X')
+    weapon: int_t = RowData(5)
+    armor: int_t = RowData(6)
+
+
+class DeepDungeonMagicStone(DataRow):
+    _sign = b'DeepDungeonMagicStone|eJzLK84rzgOB4mIAHNAEzw=='
+    sheet_name = 'DeepDungeonMagicStone'
+    _display = 'text_name'
+    icon: 'Icon' = IconRow(0)
+    text_sgl: str_t = RowData(1)
+    text_sgg: int_t = RowData(2)
+    text_plr: str_t = RowData(3)
+    text_plg: int_t = RowData(4)
+    text_vow: int_t = RowData(5)
+    text_cnt: int_t = RowData(6)
+    text_gen: int_t = RowData(7)
+    text_def_: int_t = RowData(8)
+    text_name: str_t = RowData(9)
+    text_help: str_t = RowData(10)
+
+
+class DeepDungeonMap5X(DataRow):
+    _sign = b'DeepDungeonMap5X|eJzLywMCAAZ3Aic='
+    sheet_name = 'DeepDungeonMap5X'
+    room: List[int_t] = ListData(ir((0, 5, 1)), RowData)
+
+
+class DeepDungeonRoom(DataRow):
+    _sign = b'DeepDungeonRoom|eJzLywMCAAZ3Aic='
+    sheet_name = 'DeepDungeonRoom'
+    shield_id: int_t = RowData(0)
+    link: List[int_t] = ListData(ir((1, 4, 1)), RowData)
+
+
+class DeepDungeonStatus(DataRow):
+    _sign = b'DeepDungeonStatus|eJzLy8sDAAKXAUs='
+    sheet_name = 'DeepDungeonStatus'
+    screen_image: 'ScreenImage' = RowForeign(0, 'ScreenImage')
+    log_message: 'LogMessage' = RowForeign(1, 'LogMessage')
+    effect_ui: 'DeepDungeonFloorEffectUI' = RowForeign(2, 'DeepDungeonFloorEffectUI')
+
+
+class DefaultTalk(DataRow):
+    _sign = b'DefaultTalk|eJzLy0MDaWlpxcXFAHZVCdo='
+    sheet_name = 'DefaultTalk'
+    layout_id: int_t = RowData(0)
+    camera_mode: int_t = RowData(1)
+    param_turn: List[int_t] = ListData(ir((2, 3, 1)), RowData)
+    param_gesture: List[int_t] = ListData(ir((5, 3, 1)), RowData)
+    param_lip_sync: List[int_t] = ListData(ir((8, 3, 1)), RowData)
+    param_facial: List[int_t] = ListData(ir((11, 3, 1)), RowData)
+    param_shape: List[int_t] = ListData(ir((14, 3, 1)), RowData)
+    param_is_auto_shake: List[bool_t] = ListData(ir((17, 3, 1)), RowData)
+    text: List[str_t] = ListData(ir((20, 3, 1)), RowData)
+
+
+class DefaultTalkLipSyncType(DataRow):
+    _sign = b'DefaultTalkLipSyncType|eJzLAwAAbwBv'
+    sheet_name = 'DefaultTalkLipSyncType'
+    _display = 'action_time_line'
+    action_time_line: 'ActionTimeline' = RowForeign(0, 'ActionTimeline')
+
+
+class DeliveryQuest(DataRow):
+    _sign = b'DeliveryQuest|eJzLAwAAbwBv'
+    sheet_name = 'DeliveryQuest'
+    _display = 'quest'
+    quest: 'Quest' = RowForeign(0, 'Quest')
+
+
+class Description(DataRow):
+    _sign = b'Description|eJzLyysuLk7LAwAMOwMK'
+    sheet_name = 'Description'
+    _display = 'text_name'
+    type: int_t = RowData(0)
+    disclosure_reward_or_quest: 'Quest' = RowForeign(1, 'Quest')
+    text_name: str_t = RowData(2)
+    text_ui_name: str_t = RowData(3)
+    text_ui_sub_name: str_t = RowData(4)
+    system: bool_t = RowData(5)
+    section: 'DescriptionSection' = RowForeign(6, 'DescriptionSection')
+
+
+class DescriptionPage(DataRow):
+    _sign = b'DescriptionPage|eJzLy8MFAJbsCy0='
+    sheet_name = 'DescriptionPage'
+    disclosure_type: int_t = RowData(0)
+    disclosure_value0: 'Quest' = RowForeign(1, 'Quest')
+    disclosure_value1: int_t = RowData(2)
+    name_id: int_t = RowData(3)
+    image: List[int_t] = ListData(ir((4, 11, 2)), RowData)
+    text: List[int_t] = ListData(ir((5, 10, 2)), RowData)
+    read_flag: int_t = RowData(25)
+
+
+class DescriptionSection(DataRow):
+    _sign = b'DescriptionSection|eJzLywMAAUwA3Q=='
+    sheet_name = 'DescriptionSection'
+    _display = 'name_id'
+    name_id: 'DescriptionString' = RowForeign(0, 'DescriptionString')
+    page_id: 'DescriptionPage' = RowForeign(1, 'DescriptionPage')
+
+
+class DescriptionStandAlone(DataRow):
+    _sign = b'DescriptionStandAlone|eJzLAwAAbwBv'
+    sheet_name = 'DescriptionStandAlone'
+    type: int_t = RowData(0)
+
+
+class DescriptionStandAloneTransient(DataRow):
+    _sign = b'DescriptionStandAloneTransient|eJzLKy4GAAKmAVU='
+    sheet_name = 'DescriptionStandAloneTransient'
+    section: int_t = RowData(0)
+    text_ui_name: str_t = RowData(1)
+    text_ui_sub_name: str_t = RowData(2)
+
+
+class DescriptionString(DataRow):
+    _sign = b'DescriptionString|eJwrBgAAdAB0'
+    sheet_name = 'DescriptionString'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class DirectorSystemDefine(DataRow):
+    _sign = b'DirectorSystemDefine|eJwrzgMAAVYA4g=='
+    sheet_name = 'DirectorSystemDefine'
+    define_name: str_t = RowData(0)
+    define_value: int_t = RowData(1)
+
+
+class DirectorType(DataRow):
+    _sign = b'DirectorType|eJxLS8tLyysGAAihAoI='
+    sheet_name = 'DirectorType'
+    solo: bool_t = RowData(0)
+    attacked_content_only: bool_t = RowData(1)
+    come_back_failed_message: int_t = RowData(2)
+    home_point_override: bool_t = RowData(3)
+    map_range_icon: int_t = RowData(4)
+    debug_name: str_t = RowData(5)
+
+
+class DisposalShop(DataRow):
+    _sign = b'DisposalShop|eJwrzkMDaQBJ3ge6'
+    sheet_name = 'DisposalShop'
+    _display = 'text'
+    text: str_t = RowData(0)
+    filter_filter_type: List[int_t] = ListData(ir((1, 8, 1)), RowData)
+    filter_param: List[int_t] = ListData(ir((9, 8, 1)), RowData)
+    system: bool_t = RowData(17)
+
+
+class DisposalShopFilterType(DataRow):
+    _sign = b'DisposalShopFilterType|eJwrBgAAdAB0'
+    sheet_name = 'DisposalShopFilterType'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class DisposalShopItem(DataRow):
+    _sign = b'DisposalShopItem|eJzLS8tLy8sDAAjMAoU='
+    sheet_name = 'DisposalShopItem'
+    _display = 'disposal_item_id'
+    disposal_item_id: 'Item' = RowForeign(0, 'Item')
+    disposal_item_is_hq: bool_t = RowData(1)
+    exchange_item_id: 'Item' = RowForeign(2, 'Item')
+    exchange_item_is_hq: bool_t = RowData(3)
+    exchange_item_num: int_t = RowData(4)
+    sort: int_t = RowData(5)
+
+
+class DomaStoryProgress(DataRow):
+    _sign = b'DomaStoryProgress|eJzLAwAAbwBv'
+    sheet_name = 'DomaStoryProgress'
+    next: int_t = RowData(0)
+
+
+class DpsChallenge(DataRow):
+    _sign = b'DpsChallenge|eJzLS8sDguJiAA9XA3M='
+    sheet_name = 'DpsChallenge'
+    _display = 'text_name'
+    class_job_level: int_t = RowData(0)
+    is_level_sync: bool_t = RowData(1)
+    sync_item_level: int_t = RowData(2)
+    location: 'PlaceName' = RowForeign(3, 'PlaceName')
+    header: 'Icon' = IconRow(4)
+    sort: int_t = RowData(5)
+    text_name: str_t = RowData(6)
+    text_description: str_t = RowData(7)
+
+
+class DpsChallengeOfficer(DataRow):
+    _sign = b'DpsChallengeOfficer|eJzLy8MFAJbsCy0='
+    sheet_name = 'DpsChallengeOfficer'
+    quest: 'Quest' = RowForeign(0, 'Quest')
+    challenge_list_challenge: List[int_t] = ListData(ir((1, 25, 1)), RowData)
+
+
+class DpsChallengeTransient(DataRow):
+    _sign = b'DpsChallengeTransient|eJzLAwAAbwBv'
+    sheet_name = 'DpsChallengeTransient'
+    instance_content: 'InstanceContent' = RowForeign(0, 'InstanceContent')
+
+
+class DynamicEvent(DataRow):
+    _sign = b'DynamicEvent|eJzLy4OB4mIgAQAzzAZ9'
+    sheet_name = 'DynamicEvent'
+    _display = 'text_title'
+    type: 'DynamicEventType' = RowForeign(0, 'DynamicEventType')
+    enemy_type: 'DynamicEventEnemyType' = RowForeign(1, 'DynamicEventEnemyType')
+    member_count: int_t = RowData(2)
+    time: int_t = RowData(3)
+    area_shared: int_t = RowData(4)
+    warning_range: int_t = RowData(5)
+    quest_id: 'Quest' = RowForeign(6, 'Quest')
+    quest_sequence: int_t = RowData(7)
+    single_battle: 'DynamicEventSingleBattle' = RowForeign(8, 'DynamicEventSingleBattle')
+    generate_log: 'LogMessage' = RowForeign(9, 'LogMessage')
+    text_title: str_t = RowData(10)
+    text_description: str_t = RowData(11)
+    marker_x: int_t = RowData(12)
+    marker_y: int_t = RowData(13)
+    marker_z: int_t = RowData(14)
+
+
+class DynamicEventEnemyType(DataRow):
+    _sign = b'DynamicEventEnemyType|eJwrBgAAdAB0'
+    sheet_name = 'DynamicEventEnemyType'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class DynamicEventManager(DataRow):
+    _sign = b'DynamicEventManager|eJzLAwAAbwBv'
+    sheet_name = 'DynamicEventManager'
+    dynamic_event_set: int_t = RowData(0)
+
+
+class DynamicEventSet(DataRow):
+    _sign = b'DynamicEventSet|eJzLAwAAbwBv'
+    sheet_name = 'DynamicEventSet'
+    id: int_t = RowData(0)
+
+
+class DynamicEventSingleBattle(DataRow):
+    _sign = b'DynamicEventSingleBattle|eJzLyysGAAKcAVA='
+    sheet_name = 'DynamicEventSingleBattle'
+    name: 'BNpcName' = RowForeign(0, 'BNpcName')
+    icon: 'Icon' = IconRow(1)
+    text: str_t = RowData(2)
+
+
+class DynamicEventType(DataRow):
+    _sign = b'DynamicEventType|eJzLywMCAAZ3Aic='
+    sheet_name = 'DynamicEventType'
+    icon: 'Icon' = IconRow(0)
+    map_icon: 'Icon' = IconRow(1)
+    screen_image: List[int_t] = ListData(ir((2, 3, 1)), RowData)
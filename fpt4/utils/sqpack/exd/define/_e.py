@@ -0,0 +1,495 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class ENpcBase(DataRow):
+    _sign = b'ENpcBase|eJzLS8ujBsBqClAQAKRgKLs='
+    sheet_name = 'ENpcBase'
+    idle_timeline: int_t = RowData(0)
+    not_rewrite_height: bool_t = RowData(1)
+    event_handler_event_handler: List[int_t] = ListData(ir((2, 32, 1)), RowData)
+    scale: float_t = RowData(34)
+    model: 'ModelChara' = RowForeign(35, 'ModelChara')
+    customize: 'List[Tribe]' = ListData(ir((36, 26, 1)), RowForeign, 'Tribe')
+    voice: int_t = RowData(62)
+    equip_preset: 'NpcEquip' = RowForeign(63, 'NpcEquip')
+    behavior: 'Behavior' = RowForeign(64, 'Behavior')
+    weapon: int_t = RowData(65)
+    weapon_stain: 'Stain' = RowForeign(66, 'Stain')
+    sub_weapon: int_t = RowData(67)
+    sub_weapon_stain: 'Stain' = RowForeign(68, 'Stain')
+    equip: List[int_t] = ListData([69, 72, 74, 76, 78, 80, 82, 84, 86, 88], RowData)
+    stain: 'List[Stain]' = ListData([70, 73, 75, 77, 79, 81, 83, 85, 87, 89], RowForeign, 'Stain')
+    visor: bool_t = RowData(71)
+    invisibility: int_t = RowData(90)
+    default_balloon: 'Balloon' = RowForeign(91, 'Balloon')
+    ignore_group_pose: bool_t = RowData(92)
+    dress_up: int_t = RowData(93)
+    bot_knowledge: int_t = RowData(94)
+
+
+class ENpcDressUp(DataRow):
+    _sign = b'ENpcDressUp|eJzLywMAAUwA3Q=='
+    sheet_name = 'ENpcDressUp'
+    dress_up_type: int_t = RowData(0)
+    dress: 'ENpcDressUpDress' = RowForeign(1, 'ENpcDressUpDress')
+
+
+class ENpcDressUpDress(DataRow):
+    _sign = b'ENpcDressUpDress|eJzLSwOBPPIAACPkGg8='
+    sheet_name = 'ENpcDressUpDress'
+    threshold: int_t = RowData(0)
+    change_invisibility: bool_t = RowData(1)
+    change_customize: bool_t = RowData(2)
+    change_equip_model: bool_t = RowData(3)
+    change_chara_model: bool_t = RowData(4)
+    reset_lively_hide: bool_t = RowData(5)
+    invisibility: int_t = RowData(6)
+    name: 'ENpcResident' = RowForeign(7, 'ENpcResident')
+    model: int_t = RowData(8)
+    idle_timeline: 'Behavior' = RowForeign(9, 'Behavior')
+    behavior: int_t = RowData(10)
+    customize: List[int_t] = ListData(ir((11, 26, 1)), RowData)
+    weapon_model: int_t = RowData(37)
+    weapon_stain: 'Stain' = RowForeign(38, 'Stain')
+    sub_weapon_model: int_t = RowData(39)
+    sub_weapon_stain: 'Stain' = RowForeign(40, 'Stain')
+    equip: List[int_t] = ListData(ir((41, 10, 2)), RowData)
+    stain: 'List[Stain]' = ListData(ir((42, 10, 2)), RowForeign, 'Stain')
+
+
+class ENpcResident(DataRow):
+    _sign = b'ENpcResident|eJwrzivOA4HivDQAHNIEwg=='
+    sheet_name = 'ENpcResident'
+    _display = 'text_sgl'
+    text_sgl: str_t = RowData(0)
+    text_sgg: int_t = RowData(1)
+    text_plr: str_t = RowData(2)
+    text_plg: int_t = RowData(3)
+    text_vow: int_t = RowData(4)
+    text_cnt: int_t = RowData(5)
+    text_gen: int_t = RowData(6)
+    text_def_: int_t = RowData(7)
+    text_title: str_t = RowData(8)
+    pop_type: int_t = RowData(9)
+    important: bool_t = RowData(10)
+
+
+class EObj(DataRow):
+    _sign = b'EObj|eJxLSoKAPCBIS0vLA8I0AFNACAk='
+    sheet_name = 'EObj'
+    system_flag: List[bool_t] = ListData(ir((0, 8, 1)), RowData)
+    pop_type: int_t = RowData(8)
+    event_handler: int_t = RowData(9)
+    invisibility: int_t = RowData(10)
+    shared_group: 'ExportedSG' = RowForeign(11, 'ExportedSG')
+    target: bool_t = RowData(12)
+    director_control: bool_t = RowData(13)
+    eye_collision: bool_t = RowData(14)
+    event_high_addition: int_t = RowData(15)
+    idle_camera_ignore: bool_t = RowData(16)
+    bot_knowledge: int_t = RowData(17)
+    quest_manual_shared_group_control: bool_t = RowData(18)
+    newborn_shared_group_control: bool_t = RowData(19)
+
+
+class EObjName(DataRow):
+    _sign = b'EObjName|eJwrzivOAwEAD8YDew=='
+    sheet_name = 'EObjName'
+    _display = 'singular'
+    singular: str_t = RowData(0)
+    adjective: int_t = RowData(1)
+    plural: str_t = RowData(2)
+    possessive_pronoun: int_t = RowData(3)
+    starts_with_vowel: int_t = RowData(4)
+    field_5: int_t = RowData(5)
+    pronoun: int_t = RowData(6)
+    article: int_t = RowData(7)
+
+
+class EmjAddon(DataRow):
+    _sign = b'EmjAddon|eJwrBgAAdAB0'
+    sheet_name = 'EmjAddon'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class EmjCharaViewCamera(DataRow):
+    _sign = b'EmjCharaViewCamera|eJzLywMBAAkMApU='
+    sheet_name = 'EmjCharaViewCamera'
+    x: float_t = RowData(0)
+    y: float_t = RowData(1)
+    scale: float_t = RowData(2)
+    my_x: float_t = RowData(3)
+    my_y: float_t = RowData(4)
+    my_scale: float_t = RowData(5)
+
+
+class EmjDani(DataRow):
+    _sign = b'EmjDani|eJzLy8tLy4MCACFIBSE='
+    sheet_name = 'EmjDani'
+    icon: 'Icon' = IconRow(0)
+    initial_dani_point: int_t = RowData(1)
+    required_dani_point: int_t = RowData(2)
+    has_demotion: bool_t = RowData(3)
+    rank_point_normal1: int_t = RowData(4)
+    rank_point_normal2: int_t = RowData(5)
+    rank_point_normal3: int_t = RowData(6)
+    rank_point_normal4: int_t = RowData(7)
+    rank_point_hard1: int_t = RowData(8)
+    rank_point_hard2: int_t = RowData(9)
+    rank_point_hard3: int_t = RowData(10)
+    rank_point_hard4: int_t = RowData(11)
+
+
+class Emote(DataRow):
+    _sign = b'Emote|eJwrzoOAtLQ0MAGiwAAAiSwKhA=='
+    sheet_name = 'Emote'
+    _display = 'text'
+    text: str_t = RowData(0)
+    timeline_id: int_t = RowData(1)
+    timeline_id__begin: int_t = RowData(2)
+    timeline_id__ground_sitting: int_t = RowData(3)
+    timeline_id__chair_sitting: int_t = RowData(4)
+    timeline_id__mounting: int_t = RowData(5)
+    timeline_id__lying: int_t = RowData(6)
+    timeline_id__adjust: int_t = RowData(7)
+    enable_on_mount: bool_t = RowData(8)
+    enable_on_swimming: bool_t = RowData(9)
+    enable_on_diving: bool_t = RowData(10)
+    category: 'EmoteCategory' = RowForeign(11, 'EmoteCategory')
+    mode: 'EmoteMode' = RowForeign(12, 'EmoteMode')
+    is_end_emote_mode: bool_t = RowData(13)
+    is_rotate: bool_t = RowData(14)
+    is_available_when_fishing: bool_t = RowData(15)
+    is_drawn_sword: bool_t = RowData(16)
+    is_drawn_sword_off: bool_t = RowData(17)
+    ui__priority: int_t = RowData(18)
+    text_command: 'TextCommand' = RowForeign(19, 'TextCommand')
+    icon: 'Icon' = IconRow(20)
+    log: 'LogMessage' = RowForeign(21, 'LogMessage')
+    log_self: 'LogMessage' = RowForeign(22, 'LogMessage')
+    reward: int_t = RowData(23)
+    version: int_t = RowData(24)
+
+
+class EmoteCategory(DataRow):
+    _sign = b'EmoteCategory|eJwrBgAAdAB0'
+    sheet_name = 'EmoteCategory'
+    _display = 'name'
+    name: str_t = RowData(0)
+
+
+class EmoteMode(DataRow):
+    _sign = b'EmoteMode|eJzLy0sDgrw0AA7oA0k='
+    sheet_name = 'EmoteMode'
+    start_emote: 'Emote' = RowForeign(0, 'Emote')
+    end_emote: 'Emote' = RowForeign(1, 'Emote')
+    end_on_emote: bool_t = RowData(2)
+    end_on_rotate: bool_t = RowData(3)
+    camera: bool_t = RowData(4)
+    move: bool_t = RowData(5)
+    condition_mode: int_t = RowData(6)
+    group_pose_repeat: bool_t = RowData(7)
+
+
+class EmoteTransient(DataRow):
+    _sign = b'EmoteTransient|eJwrBgAAdAB0'
+    sheet_name = 'EmoteTransient'
+    text: str_t = RowData(0)
+
+
+class EquipRaceCategory(DataRow):
+    _sign = b'EquipRaceCategory|eJxLSoKAtDQAFSQD3Q=='
+    sheet_name = 'EquipRaceCategory'
+    condition_race: List[bool_t] = ListData(ir((0, 8, 1)), RowData)
+    condition_male: bool_t = RowData(8)
+    condition_female: bool_t = RowData(9)
+
+
+class EquipSlotCategory(DataRow):
+    _sign = b'EquipSlotCategory|eJzLy0MGAC0sBgU='
+    sheet_name = 'EquipSlotCategory'
+    permit: List[int_t] = ListData(ir((0, 14, 1)), RowData)
+
+
+class Error(DataRow):
+    _sign = b'Error|eJwrBgAAdAB0'
+    sheet_name = 'Error'
+    text_0: str_t = RowData(0)
+
+
+class Eureka(DataRow):
+    _sign = b'Eureka|eJzLy8vLSwMABm8CHw=='
+    sheet_name = 'Eureka'
+    level_max: int_t = RowData(0)
+    aether_item: int_t = RowData(1)
+    grow_buff: int_t = RowData(2)
+    strengthen_buff: int_t = RowData(3)
+    magicite_item: bool_t = RowData(4)
+
+
+class EurekaAetherItem(DataRow):
+    _sign = b'EurekaAetherItem|eJwrzivOA4FiABO0A+4='
+    sheet_name = 'EurekaAetherItem'
+    _display = 'singular'
+    singular: str_t = RowData(0)
+    adjective: int_t = RowData(1)
+    plural: str_t = RowData(2)
+    possessive_pronoun: int_t = RowData(3)
+    starts_with_vowel: int_t = RowData(4)
+    field_5: int_t = RowData(5)
+    pronoun: int_t = RowData(6)
+    article: int_t = RowData(7)
+    name: str_t = RowData(8)
+
+
+class EurekaAethernet(DataRow):
+    _sign = b'EurekaAethernet|eJzLAwAAbwBv'
+    sheet_name = 'EurekaAethernet'
+    _display = 'location'
+    location: 'PlaceName' = RowForeign(0, 'PlaceName')
+
+
+class EurekaDungeonPortal(DataRow):
+    _sign = b'EurekaDungeonPortal|eJzLAwAAbwBv'
+    sheet_name = 'EurekaDungeonPortal'
+    pop_range: 'Level' = RowForeign(0, 'Level')
+
+
+class EurekaGrowData(DataRow):
+    _sign = b'EurekaGrowData|eJzLAwAAbwBv'
+    sheet_name = 'EurekaGrowData'
+    element_val_pc: int_t = RowData(0)
+
+
+class EurekaLogosMixerProbability(DataRow):
+    _sign = b'EurekaLogosMixerProbability|eJzLAwAAbwBv'
+    sheet_name = 'EurekaLogosMixerProbability'
+    probability: int_t = RowData(0)
+
+
+class EurekaMagiaAction(DataRow):
+    _sign = b'EurekaMagiaAction|eJzLywMAAUwA3Q=='
+    sheet_name = 'EurekaMagiaAction'
+    action: 'Action' = RowForeign(0, 'Action')
+    count: int_t = RowData(1)
+
+
+class EurekaMagiciteItem(DataRow):
+    _sign = b'EurekaMagiciteItem|eJzLy8sDAAKXAUs='
+    sheet_name = 'EurekaMagiciteItem'
+    type: 'EurekaMagiciteItemType' = RowForeign(0, 'EurekaMagiciteItemType')
+    class_job: 'ClassJobCategory' = RowForeign(1, 'ClassJobCategory')
+    item: 'Item' = RowForeign(2, 'Item')
+
+
+class EurekaMagiciteItemType(DataRow):
+    _sign = b'EurekaMagiciteItemType|eJwrBgAAdAB0'
+    sheet_name = 'EurekaMagiciteItemType'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class EurekaSphereElementAdjust(DataRow):
+    _sign = b'EurekaSphereElementAdjust|eJzLAwAAbwBv'
+    sheet_name = 'EurekaSphereElementAdjust'
+    _display = 'element_adjust'
+    element_adjust: int_t = RowData(0)
+
+
+class EurekaStoryProgress(DataRow):
+    _sign = b'EurekaStoryProgress|eJzLAwAAbwBv'
+    sheet_name = 'EurekaStoryProgress'
+    next: int_t = RowData(0)
+
+
+class EventAction(DataRow):
+    _sign = b'EventAction|eJwrzgMBAAkqApo='
+    sheet_name = 'EventAction'
+    _display = 'text'
+    text: str_t = RowData(0)
+    icon: 'Icon' = IconRow(1)
+    time: int_t = RowData(2)
+    action_timeline__start: int_t = RowData(3)
+    action_timeline__loop: int_t = RowData(4)
+    action_timeline__end: int_t = RowData(5)
+
+
+class EventCustomIconType(DataRow):
+    _sign = b'EventCustomIconType|eJzLyyMZAAA6FRXr'
+    sheet_name = 'EventCustomIconType'
+    detail_announce: List[int_t] = ListData(ir((0, 10, 1)), RowData)
+    detail_announce_lock: List[int_t] = ListData(ir((10, 10, 1)), RowData)
+    detail_map: List[int_t] = ListData(ir((20, 10, 1)), RowData)
+    detail_map_lock: List[int_t] = ListData(ir((30, 10, 1)), RowData)
+    detail_todo: List[int_t] = ListData(ir((40, 10, 1)), RowData)
+    num: int_t = RowData(50)
+
+
+class EventIconPriority(DataRow):
+    _sign = b'EventIconPriority|eJzLy8MDALsHDHc='
+    sheet_name = 'EventIconPriority'
+    icon: List[int_t] = ListData(ir((0, 29, 1)), RowData)
+
+
+class EventIconPriority(DataRow):
+    _sign = b'EventIconPriority|eJzLy8MAAFG3CCs='
+    sheet_name = 'EventIconPriority'
+    icon: List[int_t] = ListData(ir((0, 19, 1)), RowData)
+
+
+class EventIconPriorityPair(DataRow):
+    _sign = b'EventIconPriorityPair|eJzLAwAAbwBv'
+    sheet_name = 'EventIconPriorityPair'
+    map_icon: 'Icon' = IconRow(0)
+
+
+class EventIconType(DataRow):
+    _sign = b'EventIconType|eJzLywMCAAZ3Aic='
+    sheet_name = 'EventIconType'
+    announce: 'Icon' = IconRow(0)
+    map: 'Icon' = IconRow(1)
+    announce_lock: 'Icon' = IconRow(2)
+    map_lock: 'Icon' = IconRow(3)
+    num: int_t = RowData(4)
+
+
+class EventItem(DataRow):
+    _sign = b'EventItem|eJwrzivOA4E0CAUEAEoTB8Q='
+    sheet_name = 'EventItem'
+    _display = 'text_sgl'
+    text_sgl: str_t = RowData(0)
+    text_sgg: int_t = RowData(1)
+    text_plr: str_t = RowData(2)
+    text_plg: int_t = RowData(3)
+    text_vow: int_t = RowData(4)
+    text_cnt: int_t = RowData(5)
+    text_gen: int_t = RowData(6)
+    text_def_: int_t = RowData(7)
+    text_help_dummy: bool_t = RowData(8)
+    text_ui_name: str_t = RowData(9)
+    icon: 'Icon' = IconRow(10)
+    action: 'Action' = RowForeign(11, 'Action')
+    stack_max: int_t = RowData(12)
+    category: int_t = RowData(13)
+    event_handler: 'Quest' = RowForeign(14, 'Quest')
+    cast_time: int_t = RowData(15)
+    cast_timeline: 'EventItemCastTimeline' = RowForeign(16, 'EventItemCastTimeline')
+    timeline: int_t = RowData(17)
+
+
+class EventItemCastTimeline(DataRow):
+    _sign = b'EventItemCastTimeline|eJzLAwAAbwBv'
+    sheet_name = 'EventItemCastTimeline'
+    _display = 'timeline'
+    timeline: 'ActionTimeline' = RowForeign(0, 'ActionTimeline')
+
+
+class EventItemCategory(DataRow):
+    _sign = b'EventItemCategory|eJwrzssDAAKmAVA='
+    sheet_name = 'EventItemCategory'
+    text: str_t = RowData(0)
+    get_log_message: int_t = RowData(1)
+    discard_log_message: int_t = RowData(2)
+
+
+class EventItemHelp(DataRow):
+    _sign = b'EventItemHelp|eJwrTgMAAU4A2g=='
+    sheet_name = 'EventItemHelp'
+    _display = 'text'
+    text: str_t = RowData(0)
+    system_flag: bool_t = RowData(1)
+
+
+class EventItemTimeline(DataRow):
+    _sign = b'EventItemTimeline|eJzLAwAAbwBv'
+    sheet_name = 'EventItemTimeline'
+    _display = 'timeline'
+    timeline: 'ActionTimeline' = RowForeign(0, 'ActionTimeline')
+
+
+class EventPathMove(DataRow):
+    _sign = b'EventPathMove|eJzLy0vLg4DiYgAhTwUr'
+    sheet_name = 'EventPathMove'
+    quest: int_t = RowData(0)
+    mount: int_t = RowData(1)
+    is_fly: bool_t = RowData(2)
+    motion_type: int_t = RowData(3)
+    speed: int_t = RowData(4)
+    path: List[int_t] = ListData(ir((5, 2, 1)), RowData)
+    path_fade: int_t = RowData(7)
+    invisible: List[int_t] = ListData(ir((8, 2, 1)), RowData)
+    text_announce: str_t = RowData(10)
+    text_selection_title: str_t = RowData(11)
+
+
+class EventSituationIconTooltip(DataRow):
+    _sign = b'EventSituationIconTooltip|eJwrTgMAAU4A2g=='
+    sheet_name = 'EventSituationIconTooltip'
+    text: str_t = RowData(0)
+    system: bool_t = RowData(1)
+
+
+class EventSystemDefine(DataRow):
+    _sign = b'EventSystemDefine|eJwrzgMAAVYA4g=='
+    sheet_name = 'EventSystemDefine'
+    _display = 'define_name'
+    define_name: str_t = RowData(0)
+    define_value: int_t = RowData(1)
+
+
+class EventVfx(DataRow):
+    _sign = b'EventVfx|eJwrzivOy8sDAAk+Ap8='
+    sheet_name = 'EventVfx'
+    text: str_t = RowData(0)
+    directory: int_t = RowData(1)
+    file_name: str_t = RowData(2)
+    ui_sort_id: int_t = RowData(3)
+    ui_attribute: int_t = RowData(4)
+    attribute: int_t = RowData(5)
+
+
+class ExHotbarCrossbarIndexType(DataRow):
+    _sign = b'ExHotbarCrossbarIndexType|eJzLy0MFADqABuE='
+    sheet_name = 'ExHotbarCrossbarIndexType'
+    index: List[int_t] = ListData(ir((0, 16, 1)), RowData)
+
+
+class ExVersion(DataRow):
+    _sign = b'ExVersion|eJwrzssDAAKmAVA='
+    sheet_name = 'ExVersion'
+    _display = 'text'
+    text: str_t = RowData(0)
+    quest_accept_screen_image: 'ScreenImage' = RowForeign(1, 'ScreenImage')
+    quest_complete_screen_image: 'ScreenImage' = RowForeign(2, 'ScreenImage')
+
+
+class ExportedGatheringPoint(DataRow):
+    _sign = b'ExportedGatheringPoint|eJzLywMCAAZ3Aic='
+    sheet_name = 'ExportedGatheringPoint'
+    center_x: float_t = RowData(0)
+    center_z: float_t = RowData(1)
+    gathering_type: 'GatheringType' = RowForeign(2, 'GatheringType')
+    gathering_point_type: int_t = RowData(3)
+    radius: int_t = RowData(4)
+
+
+class ExportedSG(DataRow):
+    _sign = b'ExportedSG|eJwrBgAAdAB0'
+    sheet_name = 'ExportedSG'
+    _display = 'sg_file_path'
+    sg_file_path: str_t = RowData(0)
+
+
+class ExtraCommand(DataRow):
+    _sign = b'ExtraCommand|eJwrLs7LAwAEcwHD'
+    sheet_name = 'ExtraCommand'
+    _display = 'text_name'
+    text_name: str_t = RowData(0)
+    text_help: str_t = RowData(1)
+    icon: 'Icon' = IconRow(2)
+    sort_id: int_t = RowData(3)
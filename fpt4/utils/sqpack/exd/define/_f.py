@@ -0,0 +1,530 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class FCActivity(DataRow):
+    _sign = b'FCActivity|eJwrzgMBAAkqApo='
+    sheet_name = 'FCActivity'
+    _display = 'text'
+    text: str_t = RowData(0)
+    self_kind: int_t = RowData(1)
+    target_kind: int_t = RowData(2)
+    num_param: int_t = RowData(3)
+    category: 'FCActivityCategory' = RowForeign(4, 'FCActivityCategory')
+    icon_type: int_t = RowData(5)
+
+
+class FCActivityCategory(DataRow):
+    _sign = b'FCActivityCategory|eJzLKwYAAVEA4g=='
+    sheet_name = 'FCActivityCategory'
+    _display = 'text'
+    priority: int_t = RowData(0)
+    text: str_t = RowData(1)
+
+
+class FCAuthority(DataRow):
+    _sign = b'FCAuthority|eJwrzssDAAKmAVA='
+    sheet_name = 'FCAuthority'
+    _display = 'text'
+    text: str_t = RowData(0)
+    category: 'FCAuthorityCategory' = RowForeign(1, 'FCAuthorityCategory')
+    sort: int_t = RowData(2)
+
+
+class FCAuthorityCategory(DataRow):
+    _sign = b'FCAuthorityCategory|eJwrBgAAdAB0'
+    sheet_name = 'FCAuthorityCategory'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class FCChestName(DataRow):
+    _sign = b'FCChestName|eJwrzgMAAVYA4g=='
+    sheet_name = 'FCChestName'
+    _display = 'name'
+    name: str_t = RowData(0)
+    field_1: int_t = RowData(1)
+
+
+class FCCrestSymbol(DataRow):
+    _sign = b'FCCrestSymbol|eJzLy8sDAAKXAUs='
+    sheet_name = 'FCCrestSymbol'
+    color_num: int_t = RowData(0)
+    fc_right: int_t = RowData(1)
+    sort_id: int_t = RowData(2)
+
+
+class FCDefine(DataRow):
+    _sign = b'FCDefine|eJzLAwAAbwBv'
+    sheet_name = 'FCDefine'
+    value: int_t = RowData(0)
+
+
+class FCHierarchy(DataRow):
+    _sign = b'FCHierarchy|eJwrBgAAdAB0'
+    sheet_name = 'FCHierarchy'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class FCProfile(DataRow):
+    _sign = b'FCProfile|eJzLKwYAAVEA4g=='
+    sheet_name = 'FCProfile'
+    _display = 'text'
+    priority: int_t = RowData(0)
+    text: str_t = RowData(1)
+
+
+class FCRank(DataRow):
+    _sign = b'FCRank|eJzLy4MAAA+AA3E='
+    sheet_name = 'FCRank'
+    next_point: int_t = RowData(0)
+    current_point: int_t = RowData(1)
+    rights: List[int_t] = ListData(ir((2, 3, 1)), RowData)
+    fc_action_active_num: int_t = RowData(5)
+    fc_action_stock_num: int_t = RowData(6)
+    fc_chest_box_num: int_t = RowData(7)
+
+
+class FCReputation(DataRow):
+    _sign = b'FCReputation|eJzLy8vLKwYABnwCLA=='
+    sheet_name = 'FCReputation'
+    _display = 'name'
+    next_point: int_t = RowData(0)
+    current_point: int_t = RowData(1)
+    discount_rate: int_t = RowData(2)
+    color: 'UIColor' = RowForeign(3, 'UIColor')
+    name: str_t = RowData(4)
+
+
+class FCRights(DataRow):
+    _sign = b'FCRights|eJwrLs7LAwAEcwHD'
+    sheet_name = 'FCRights'
+    _display = 'rights_name_text'
+    rights_name_text: str_t = RowData(0)
+    rights_name_help: str_t = RowData(1)
+    icon: 'Icon' = IconRow(2)
+    sort_id: 'FCRank' = RowForeign(3, 'FCRank')
+
+
+class FGSAddon(DataRow):
+    _sign = b'FGSAddon|eJwrBgAAdAB0'
+    sheet_name = 'FGSAddon'
+    text: str_t = RowData(0)
+
+
+class FGSStageUI(DataRow):
+    _sign = b'FGSStageUI|eJzLy4MAAA+AA3E='
+    sheet_name = 'FGSStageUI'
+    hud_goal: int_t = RowData(0)
+    description: int_t = RowData(1)
+    description_banner: int_t = RowData(2)
+    icon: int_t = RowData(3)
+    thumbnail: int_t = RowData(4)
+    title: int_t = RowData(5)
+    title_banner: int_t = RowData(6)
+    rule: int_t = RowData(7)
+
+
+class FashionCheckThemeCategory(DataRow):
+    _sign = b'FashionCheckThemeCategory|eJwrBgAAdAB0'
+    sheet_name = 'FashionCheckThemeCategory'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class FashionCheckWeeklyTheme(DataRow):
+    _sign = b'FashionCheckWeeklyTheme|eJwrBgAAdAB0'
+    sheet_name = 'FashionCheckWeeklyTheme'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class Fate(DataRow):
+    _sign = b'Fate|eJwrLgaBPCwgLQ2E07BJAQBpaBa9'
+    sheet_name = 'Fate'
+    _display = 'text_title_text'
+    text_title_text: str_t = RowData(0)
+    text_description_text: str_t = RowData(1)
+    text_description_text2: str_t = RowData(2)
+    text_todo_name1: str_t = RowData(3)
+    text_todo_name2: str_t = RowData(4)
+    text_todo_name3: str_t = RowData(5)
+    mode: int_t = RowData(6)
+    rule: int_t = RowData(7)
+    rule_ex: 'FateRuleEx' = RowForeign(8, 'FateRuleEx')
+    event_range: int_t = RowData(9)
+    level: int_t = RowData(10)
+    sync_lv: int_t = RowData(11)
+    trade_item_id: 'EventItem' = RowForeign(12, 'EventItem')
+    todo_value_type: List[int_t] = ListData(ir((13, 3, 1)), RowData)
+    icon: 'Icon' = IconRow(16)
+    icon_small: 'Icon' = IconRow(17)
+    icon_small2: 'Icon' = IconRow(18)
+    bgm: 'BGM' = RowForeign(19, 'BGM')
+    guard_npc_layout_id: int_t = RowData(20)
+    accept_screen_image: 'ScreenImage' = RowForeign(21, 'ScreenImage')
+    complete_screen_image: 'ScreenImage' = RowForeign(22, 'ScreenImage')
+    failed_screen_image: 'ScreenImage' = RowForeign(23, 'ScreenImage')
+    map_visibility_type: int_t = RowData(24)
+    map_visibility_value: 'Quest' = RowForeign(25, 'Quest')
+    is_quest: bool_t = RowData(26)
+    is_priority_draw: bool_t = RowData(27)
+    action_status: 'Status' = RowForeign(28, 'Status')
+    join_status: int_t = RowData(29)
+    is_collection_infinite: bool_t = RowData(30)
+    success_bgm_continue: bool_t = RowData(31)
+    failure_bgm_continue: bool_t = RowData(32)
+    resident: int_t = RowData(33)
+    class_job_category: int_t = RowData(34)
+    event_permission: int_t = RowData(35)
+    text_param: 'List[ArrayEventHandler]' = ListData(ir((36, 2, 1)), RowForeign, 'ArrayEventHandler')
+    quest: 'EventItem' = RowForeign(38, 'EventItem')
+    local_progress: 'List[EventItem]' = ListData(ir((39, 6, 1)), RowForeign, 'EventItem')
+    map_marker_icon_id: List[int_t] = ListData(ir((45, 8, 1)), RowData)
+
+
+class FateEvent(DataRow):
+    _sign = b'FateEvent|eJzLyyMOpEEBjF8MBQB5wRtp'
+    sheet_name = 'FateEvent'
+    param_turn: List[int_t] = ListData(ir((0, 8, 1)), RowData)
+    param_gesture: List[int_t] = ListData(ir((8, 8, 1)), RowData)
+    param_lip_sync: List[int_t] = ListData(ir((16, 8, 1)), RowData)
+    param_facial: List[int_t] = ListData(ir((24, 8, 1)), RowData)
+    param_shape: List[int_t] = ListData(ir((32, 8, 1)), RowData)
+    param_is_auto_shake: List[bool_t] = ListData(ir((40, 8, 1)), RowData)
+    param_widget_type: List[int_t] = ListData(ir((48, 8, 1)), RowData)
+    text: List[str_t] = ListData(ir((56, 8, 1)), RowData)
+
+
+class FateMode(DataRow):
+    _sign = b'FateMode|eJzLywMCAAZ3Aic='
+    sheet_name = 'FateMode'
+    nearby_message: int_t = RowData(0)
+    starter_announce_icon: 'Icon' = IconRow(1)
+    starter_map_icon: 'Icon' = IconRow(2)
+    trader_announce_icon: 'Icon' = IconRow(3)
+    trader_map_icon: 'Icon' = IconRow(4)
+
+
+class FateProgressUI(DataRow):
+    _sign = b'FateProgressUI|eJzLywMBAAkMApU='
+    sheet_name = 'FateProgressUI'
+    territory: 'TerritoryType' = RowForeign(0, 'TerritoryType')
+    achievement: 'Achievement' = RowForeign(1, 'Achievement')
+    rank: List[int_t] = ListData(ir((2, 2, 1)), RowData)
+    ui_location: int_t = RowData(4)
+    ui_sort: int_t = RowData(5)
+
+
+class FateRuleEx(DataRow):
+    _sign = b'FateRuleEx|eJzLAwAAbwBv'
+    sheet_name = 'FateRuleEx'
+    type: int_t = RowData(0)
+
+
+class FateShop(DataRow):
+    _sign = b'FateShop|eJzLy4MBABesBE0='
+    sheet_name = 'FateShop'
+    shop: List[int_t] = ListData(ir((0, 2, 1)), RowData)
+    talk: List[int_t] = ListData(ir((2, 8, 1)), RowData)
+
+
+class FateTokenType(DataRow):
+    _sign = b'FateTokenType|eJzLAwAAbwBv'
+    sheet_name = 'FateTokenType'
+    _display = 'item_id'
+    item_id: 'Item' = RowForeign(0, 'Item')
+
+
+class FccShop(DataRow):
+    _sign = b'FccShop|eJwrzsMLANXaDVg='
+    sheet_name = 'FccShop'
+    _display = 'text'
+    text: str_t = RowData(0)
+    items_item: List[int_t] = ListData(ir((1, 10, 1)), RowData)
+    items_fcc_price: List[int_t] = ListData(ir((11, 10, 1)), RowData)
+    items_need_rank: List[int_t] = ListData(ir((21, 10, 1)), RowData)
+
+
+class Festival(DataRow):
+    _sign = b'Festival|eJwrzgMAAVYA4g=='
+    sheet_name = 'Festival'
+    _display = 'name'
+    name: str_t = RowData(0)
+    weather: int_t = RowData(1)
+
+
+class FieldMarker(DataRow):
+    _sign = b'FieldMarker|eJzLy8srBgAEVQG+'
+    sheet_name = 'FieldMarker'
+    _display = 'text'
+    vfx: 'VFX' = RowForeign(0, 'VFX')
+    icon: 'Icon' = IconRow(1)
+    map_marker_icon: 'Icon' = IconRow(2)
+    text: str_t = RowData(3)
+
+
+class FishParameter(DataRow):
+    _sign = b'FishParameter|eJwrzsvLS0vLA5NpeQAskgXi'
+    sheet_name = 'FishParameter'
+    _display = 'item_id'
+    text: str_t = RowData(0)
+    item_id: int_t = RowData(1)
+    level: 'GatheringItemLevelConvertTable' = RowForeign(2, 'GatheringItemLevelConvertTable')
+    level_star: int_t = RowData(3)
+    is_mask_condition: bool_t = RowData(4)
+    is_special_condition: bool_t = RowData(5)
+    record_type: 'FishingRecordType' = RowForeign(6, 'FishingRecordType')
+    territory: 'TerritoryType' = RowForeign(7, 'TerritoryType')
+    typical_fishing_spot: int_t = RowData(8)
+    folklore: 'GatheringSubCategory' = RowForeign(9, 'GatheringSubCategory')
+    is_fish_print: bool_t = RowData(10)
+    is_catch_time: bool_t = RowData(11)
+    is_weather_condition: bool_t = RowData(12)
+    guardian_achievement_count: int_t = RowData(13)
+
+
+class FishParameter(DataRow):
+    _sign = b'FishParameter|eJwrzgOCNDAGABxeBLA='
+    sheet_name = 'FishParameter'
+    _display = 'item_id'
+    text: str_t = RowData(0)
+    item_id: int_t = RowData(1)
+    level: 'GatheringItemLevelConvertTable' = RowForeign(2, 'GatheringItemLevelConvertTable')
+    level_star: int_t = RowData(3)
+    sort_id: int_t = RowData(4)
+    is_mask_condition: bool_t = RowData(5)
+    record_type: 'FishingRecordType' = RowForeign(6, 'FishingRecordType')
+    typical_fishing_spot: 'FishingSpot' = RowForeign(7, 'FishingSpot')
+    folklore: 'GatheringSubCategory' = RowForeign(8, 'GatheringSubCategory')
+    is_fish_print: bool_t = RowData(9)
+    guardian_achievement_count: int_t = RowData(10)
+
+
+class FishParameter(DataRow):
+    _sign = b'FishParameter|eJwrzsvLSwNjABeeBEI='
+    sheet_name = 'FishParameter'
+    _display = 'item_id'
+    text: str_t = RowData(0)
+    item_id: int_t = RowData(1)
+    level: 'GatheringItemLevelConvertTable' = RowForeign(2, 'GatheringItemLevelConvertTable')
+    level_star: int_t = RowData(3)
+    is_mask_condition: bool_t = RowData(4)
+    record_type: 'FishingRecordType' = RowForeign(5, 'FishingRecordType')
+    typical_fishing_spot: 'FishingSpot' = RowForeign(6, 'FishingSpot')
+    folklore: 'GatheringSubCategory' = RowForeign(7, 'GatheringSubCategory')
+    is_fish_print: bool_t = RowData(8)
+    guardian_achievement_count: int_t = RowData(9)
+
+
+class FishParameterReverse(DataRow):
+    _sign = b'FishParameterReverse|eJxLAwAAZwBn'
+    sheet_name = 'FishParameterReverse'
+    masked: bool_t = RowData(0)
+
+
+class FishingBaitParameter(DataRow):
+    _sign = b'FishingBaitParameter|eJzLAwAAbwBv'
+    sheet_name = 'FishingBaitParameter'
+    item_id: int_t = RowData(0)
+
+
+class FishingNoteInfo(DataRow):
+    _sign = b'FishingNoteInfo|eJzLywMDAAwPAwM='
+    sheet_name = 'FishingNoteInfo'
+    _display = 'item_id'
+    aquarium_size: int_t = RowData(0)
+    aquarium_water: 'AquariumWater' = RowForeign(1, 'AquariumWater')
+    weather_condition: int_t = RowData(2)
+    time_condition: int_t = RowData(3)
+    special_condition: int_t = RowData(4)
+    masterpiece: int_t = RowData(5)
+    item_id: int_t = RowData(6)
+
+
+class FishingRecordType(DataRow):
+    _sign = b'FishingRecordType|eJzLywMDAAwPAwM='
+    sheet_name = 'FishingRecordType'
+    _display = 'name_id'
+    name_id: 'Addon' = RowForeign(0, 'Addon')
+    rank: List[int_t] = ListData(ir((1, 5, 1)), RowData)
+    type: int_t = RowData(6)
+
+
+class FishingRecordTypeTransient(DataRow):
+    _sign = b'FishingRecordTypeTransient|eJzLAwAAbwBv'
+    sheet_name = 'FishingRecordTypeTransient'
+    icon: 'Icon' = IconRow(0)
+
+
+class FishingSpot(DataRow):
+    _sign = b'FishingSpot|eJzLKy7OS8vDBACBQQpT'
+    sheet_name = 'FishingSpot'
+    _display = 'spot_name_id'
+    level: int_t = RowData(0)
+    text_reach_start: str_t = RowData(1)
+    text_reach_end: str_t = RowData(2)
+    category: int_t = RowData(3)
+    rare: bool_t = RowData(4)
+    territory_type: 'TerritoryType' = RowForeign(5, 'TerritoryType')
+    notebook_region: 'PlaceName' = RowForeign(6, 'PlaceName')
+    notebook_area: 'PlaceName' = RowForeign(7, 'PlaceName')
+    maker_pos_x: int_t = RowData(8)
+    maker_pos_y: int_t = RowData(9)
+    maker_type: int_t = RowData(10)
+    name_layout: int_t = RowData(11)
+    target: List[int_t] = ListData(ir((12, 10, 1)), RowData)
+    spot_name_id: 'PlaceName' = RowForeign(22, 'PlaceName')
+    sort_key: int_t = RowData(23)
+
+
+class FittingShop(DataRow):
+    _sign = b'FittingShop|eJzLy8MPAOMADcE='
+    sheet_name = 'FittingShop'
+    contents_category: List[int_t] = ListData(ir((0, 32, 1)), RowData)
+
+
+class FittingShopCategory(DataRow):
+    _sign = b'FittingShopCategory|eJzLKwYAAVEA4g=='
+    sheet_name = 'FittingShopCategory'
+    display_id: int_t = RowData(0)
+    text: str_t = RowData(1)
+
+
+class FittingShopCategoryItem(DataRow):
+    _sign = b'FittingShopCategoryItem|eJzLy8sDAAKXAUs='
+    sheet_name = 'FittingShopCategoryItem'
+    item_id: int_t = RowData(0)
+    display_id: int_t = RowData(1)
+    sort_id: int_t = RowData(2)
+
+
+class FittingShopItemSet(DataRow):
+    _sign = b'FittingShopItemSet|eJzLywOBYgAMFAMI'
+    sheet_name = 'FittingShopItemSet'
+    item_item_id: List[int_t] = ListData(ir((0, 6, 1)), RowData)
+    text: str_t = RowData(6)
+
+
+class Frontline(DataRow):
+    _sign = b'Frontline|eJzLy8MOAIEAClE='
+    sheet_name = 'Frontline'
+    win_score: int_t = RowData(0)
+    advantage_score: int_t = RowData(1)
+    start_image_text: List[int_t] = ListData(ir((2, 3, 1)), RowData)
+    win_image_text: List[int_t] = ListData(ir((5, 3, 1)), RowData)
+    lose_image_text: List[int_t] = ListData(ir((8, 3, 1)), RowData)
+    draw_image_text: int_t = RowData(11)
+    bgm: List[int_t] = ListData(ir((12, 3, 1)), RowData)
+    game_bgm: List[int_t] = ListData(ir((15, 3, 1)), RowData)
+    game_advantage_bgm: List[int_t] = ListData(ir((18, 3, 1)), RowData)
+    landing_point: List[int_t] = ListData(ir((21, 3, 1)), RowData)
+
+
+class Frontline(DataRow):
+    _sign = b'Frontline|eJzLy8MKAHavCeM='
+    sheet_name = 'Frontline'
+    advantage_score: int_t = RowData(0)
+    start_image_text: List[int_t] = ListData(ir((1, 3, 1)), RowData)
+    win_image_text: List[int_t] = ListData(ir((4, 3, 1)), RowData)
+    lose_image_text: List[int_t] = ListData(ir((7, 3, 1)), RowData)
+    draw_image_text: int_t = RowData(10)
+    bgm: List[int_t] = ListData(ir((11, 3, 1)), RowData)
+    game_bgm: List[int_t] = ListData(ir((14, 3, 1)), RowData)
+    game_advantage_bgm: List[int_t] = ListData(ir((17, 3, 1)), RowData)
+    landing_point: List[int_t] = ListData(ir((20, 3, 1)), RowData)
+
+
+class Frontline01(DataRow):
+    _sign = b'Frontline01|eJzLyxseAAC/b1Xx'
+    sheet_name = 'Frontline01'
+    base_params_base_event_range_id: List[int_t] = ListData(ir((0, 8, 1)), RowData)
+    base_params_base_name: List[int_t] = ListData(ir((8, 8, 1)), RowData)
+    base_params_base_map_marker: List[int_t] = ListData(ir((16, 8, 1)), RowData)
+    shared_group_sg_layout_id: List[int_t] = ListData(ir((24, 48, 1)), RowData)
+    shared_group_sg_idle_index: List[int_t] = ListData(ir((72, 48, 1)), RowData)
+    shared_group_sg_change_index: List[int_t] = ListData(ir((120, 48, 1)), RowData)
+    shared_group_visibilities_sg_visibilities_layout_id: List[int_t] = ListData(ir((168, 16, 1)), RowData)
+    shared_group_visibilities_sg_visibilities_timeline: List[int_t] = ListData(ir((184, 16, 1)), RowData)
+
+
+class Frontline02(DataRow):
+    _sign = b'Frontline02|eJzLy8MHAMfsDOU='
+    sheet_name = 'Frontline02'
+    num_0: int_t = RowData(0)
+    num_1: int_t = RowData(1)
+    num_2: int_t = RowData(2)
+    num_3: int_t = RowData(3)
+    num_4: int_t = RowData(4)
+    num_5: int_t = RowData(5)
+    num_6: int_t = RowData(6)
+    num_7: int_t = RowData(7)
+    num_8: int_t = RowData(8)
+    num_9: int_t = RowData(9)
+    num_10: int_t = RowData(10)
+    num_11: int_t = RowData(11)
+    num_12: int_t = RowData(12)
+    num_13: int_t = RowData(13)
+    num_14: int_t = RowData(14)
+    num_15: int_t = RowData(15)
+    num_16: int_t = RowData(16)
+    num_17: int_t = RowData(17)
+    num_18: int_t = RowData(18)
+    num_19: int_t = RowData(19)
+    num_20: int_t = RowData(20)
+    num_21: int_t = RowData(21)
+    num_22: int_t = RowData(22)
+    num_23: int_t = RowData(23)
+    num_24: int_t = RowData(24)
+    num_25: int_t = RowData(25)
+    num_26: int_t = RowData(26)
+    num_27: int_t = RowData(27)
+    num_28: int_t = RowData(28)
+    num_29: int_t = RowData(29)
+
+
+class Frontline03(DataRow):
+    _sign = b'Frontline03|eJzLy8MCAGNXCQc='
+    sheet_name = 'Frontline03'
+    access_point_ranks_point: List[int_t] = ListData(ir((0, 3, 1)), RowData)
+    access_point_ranks_interval_time: List[int_t] = ListData(ir((3, 3, 1)), RowData)
+    access_point_ranks_limit_point: List[int_t] = ListData(ir((6, 3, 1)), RowData)
+    access_point_ranks_icon: List[List[int_t]] = ListData(ir(((9, 4, 3), 3, 1)), ListData, RowData)
+
+
+class Frontline04(DataRow):
+    _sign = b'Frontline04|eJzLyxsFKAAAy3F1Tw=='
+    sheet_name = 'Frontline04'
+    node_base_event_range_id: 'List[Level]' = ListData(ir((0, 3, 1)), RowForeign, 'Level')
+    node_base_name: List[int_t] = ListData(ir((3, 3, 1)), RowData)
+    node_base_map_marker: List[int_t] = ListData(ir((6, 3, 1)), RowData)
+    shared_group_sg_layout_id: List[int_t] = ListData(ir((9, 48, 1)), RowData)
+    shared_group_sg_idle_index: List[int_t] = ListData(ir((57, 48, 1)), RowData)
+    shared_group_sg_change_index: List[int_t] = ListData(ir((105, 48, 1)), RowData)
+    break_object_type: List[int_t] = ListData(ir((153, 24, 1)), RowData)
+    break_object_layout_id: List[int_t] = ListData(ir((177, 24, 1)), RowData)
+    break_object_collision: List[int_t] = ListData(ir((201, 24, 1)), RowData)
+    break_object_bnpc: List[int_t] = ListData(ir((225, 24, 1)), RowData)
+    break_object_name_id: List[int_t] = ListData(ir((249, 24, 1)), RowData)
+
+
+class FurnitureCatalogCategory(DataRow):
+    _sign = b'FurnitureCatalogCategory|eJwrzssDAAKmAVA='
+    sheet_name = 'FurnitureCatalogCategory'
+    _display = 'text'
+    text: str_t = RowData(0)
+    housing_item_type: int_t = RowData(1)
+    sort: int_t = RowData(2)
+
+
+class FurnitureCatalogItemList(DataRow):
+    _sign = b'FurnitureCatalogItemList|eJzLy8sDAAKXAUs='
+    sheet_name = 'FurnitureCatalogItemList'
+    _display = 'item'
+    category: 'FurnitureCatalogCategory' = RowForeign(0, 'FurnitureCatalogCategory')
+    item: 'Item' = RowForeign(1, 'Item')
+    version: int_t = RowData(2)
@@ -0,0 +1,1011 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class GCRankGridaniaFemaleText(DataRow):
+    _sign = b'GCRankGridaniaFemaleText|eJwrzivOA4HiYgAYFQRh'
+    sheet_name = 'GCRankGridaniaFemaleText'
+    _display = 'singular'
+    singular: str_t = RowData(0)
+    adjective: int_t = RowData(1)
+    plural: str_t = RowData(2)
+    possessive_pronoun: int_t = RowData(3)
+    starts_with_vowel: int_t = RowData(4)
+    field_5: int_t = RowData(5)
+    pronoun: int_t = RowData(6)
+    article: int_t = RowData(7)
+    name_rank: str_t = RowData(8)
+    field_9: str_t = RowData(9)
+
+
+class GCRankGridaniaMaleText(DataRow):
+    _sign = b'GCRankGridaniaMaleText|eJwrzivOA4HiYgAYFQRh'
+    sheet_name = 'GCRankGridaniaMaleText'
+    _display = 'singular'
+    singular: str_t = RowData(0)
+    adjective: int_t = RowData(1)
+    plural: str_t = RowData(2)
+    possessive_pronoun: int_t = RowData(3)
+    starts_with_vowel: int_t = RowData(4)
+    field_5: int_t = RowData(5)
+    pronoun: int_t = RowData(6)
+    article: int_t = RowData(7)
+    name_rank: str_t = RowData(8)
+    field_9: str_t = RowData(9)
+
+
+class GCRankLimsaFemaleText(DataRow):
+    _sign = b'GCRankLimsaFemaleText|eJwrzivOA4HiYgAYFQRh'
+    sheet_name = 'GCRankLimsaFemaleText'
+    _display = 'singular'
+    singular: str_t = RowData(0)
+    adjective: int_t = RowData(1)
+    plural: str_t = RowData(2)
+    possessive_pronoun: int_t = RowData(3)
+    starts_with_vowel: int_t = RowData(4)
+    field_5: int_t = RowData(5)
+    pronoun: int_t = RowData(6)
+    article: int_t = RowData(7)
+    name_rank: str_t = RowData(8)
+    field_9: str_t = RowData(9)
+
+
+class GCRankLimsaMaleText(DataRow):
+    _sign = b'GCRankLimsaMaleText|eJwrzivOA4HiYgAYFQRh'
+    sheet_name = 'GCRankLimsaMaleText'
+    _display = 'singular'
+    singular: str_t = RowData(0)
+    adjective: int_t = RowData(1)
+    plural: str_t = RowData(2)
+    possessive_pronoun: int_t = RowData(3)
+    starts_with_vowel: int_t = RowData(4)
+    field_5: int_t = RowData(5)
+    pronoun: int_t = RowData(6)
+    article: int_t = RowData(7)
+    name_rank: str_t = RowData(8)
+    field_9: str_t = RowData(9)
+
+
+class GCRankUldahFemaleText(DataRow):
+    _sign = b'GCRankUldahFemaleText|eJwrzivOA4HiYgAYFQRh'
+    sheet_name = 'GCRankUldahFemaleText'
+    _display = 'singular'
+    singular: str_t = RowData(0)
+    adjective: int_t = RowData(1)
+    plural: str_t = RowData(2)
+    possessive_pronoun: int_t = RowData(3)
+    starts_with_vowel: int_t = RowData(4)
+    field_5: int_t = RowData(5)
+    pronoun: int_t = RowData(6)
+    article: int_t = RowData(7)
+    name_rank: str_t = RowData(8)
+    field_9: str_t = RowData(9)
+
+
+class GCRankUldahMaleText(DataRow):
+    _sign = b'GCRankUldahMaleText|eJwrzivOA4HiYgAYFQRh'
+    sheet_name = 'GCRankUldahMaleText'
+    _display = 'singular'
+    singular: str_t = RowData(0)
+    adjective: int_t = RowData(1)
+    plural: str_t = RowData(2)
+    possessive_pronoun: int_t = RowData(3)
+    starts_with_vowel: int_t = RowData(4)
+    field_5: int_t = RowData(5)
+    pronoun: int_t = RowData(6)
+    article: int_t = RowData(7)
+    name_rank: str_t = RowData(8)
+    field_9: str_t = RowData(9)
+
+
+class GCScripShopCategory(DataRow):
+    _sign = b'GCScripShopCategory|eJzLy8sDAAKXAUs='
+    sheet_name = 'GCScripShopCategory'
+    grand_company: 'GrandCompany' = RowForeign(0, 'GrandCompany')
+    rank_category: int_t = RowData(1)
+    gc_shop_item_category: int_t = RowData(2)
+
+
+class GCScripShopItem(DataRow):
+    _sign = b'GCScripShopItem|eJzLy8vLAwAEUAG5'
+    sheet_name = 'GCScripShopItem'
+    _display = 'item_id'
+    item_id: 'Item' = RowForeign(0, 'Item')
+    valid_rank: 'GrandCompanyRank' = RowForeign(1, 'GrandCompanyRank')
+    scrip: int_t = RowData(2)
+    sort: int_t = RowData(3)
+
+
+class GCShop(DataRow):
+    _sign = b'GCShop|eJzLAwAAbwBv'
+    sheet_name = 'GCShop'
+    grand_company: 'GrandCompany' = RowForeign(0, 'GrandCompany')
+
+
+class GCShopItemCategory(DataRow):
+    _sign = b'GCShopItemCategory|eJwrBgAAdAB0'
+    sheet_name = 'GCShopItemCategory'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class GCSupplyDefine(DataRow):
+    _sign = b'GCSupplyDefine|eJzLAwAAbwBv'
+    sheet_name = 'GCSupplyDefine'
+    value: int_t = RowData(0)
+
+
+class GCSupplyDuty(DataRow):
+    _sign = b'GCSupplyDuty|eJzLy6MUAAC2eRxd'
+    sheet_name = 'GCSupplyDuty'
+    wood_worker_item_wdk: List[int_t] = ListData(ir((0, 3, 2)), RowData)
+    wood_worker_stack_wdk: List[int_t] = ListData(ir((1, 3, 2)), RowData)
+    culinarian_item_cul: List[int_t] = ListData(ir((6, 3, 2)), RowData)
+    culinarian_stack_cul: List[int_t] = ListData(ir((7, 3, 2)), RowData)
+    alchemist_item_alc: List[int_t] = ListData(ir((12, 3, 2)), RowData)
+    alchemist_stack_alc: List[int_t] = ListData(ir((13, 3, 2)), RowData)
+    armourer_item_arm: List[int_t] = ListData(ir((18, 3, 2)), RowData)
+    armourer_stack_arm: List[int_t] = ListData(ir((19, 3, 2)), RowData)
+    tanner_item_tan: List[int_t] = ListData(ir((24, 3, 2)), RowData)
+    tanner_stack_tan: List[int_t] = ListData(ir((25, 3, 2)), RowData)
+    gold_smith_item_gld: List[int_t] = ListData(ir((30, 3, 2)), RowData)
+    gold_smith_stack_gld: List[int_t] = ListData(ir((31, 3, 2)), RowData)
+    weaver_item_wvr: List[int_t] = ListData(ir((36, 3, 2)), RowData)
+    weaver_stack_wvr: List[int_t] = ListData(ir((37, 3, 2)), RowData)
+    black_smith_item_bsm: List[int_t] = ListData(ir((42, 3, 2)), RowData)
+    black_smith_stack_bsm: List[int_t] = ListData(ir((43, 3, 2)), RowData)
+    miner_item_min: List[int_t] = ListData(ir((48, 3, 2)), RowData)
+    miner_stack_min: List[int_t] = ListData(ir((49, 3, 2)), RowData)
+    harvester_item_hrv: List[int_t] = ListData(ir((54, 3, 2)), RowData)
+    harvester_stack_hrv: List[int_t] = ListData(ir((55, 3, 2)), RowData)
+    fisherman_item_fsh: List[int_t] = ListData(ir((60, 3, 2)), RowData)
+    fisherman_stack_fsh: List[int_t] = ListData(ir((61, 3, 2)), RowData)
+
+
+class GCSupplyDutyReward(DataRow):
+    _sign = b'GCSupplyDutyReward|eJzLywMCAAZ3Aic='
+    sheet_name = 'GCSupplyDutyReward'
+    exp_of_munition: int_t = RowData(0)
+    exp_of_supplies: int_t = RowData(1)
+    seals_of_booty: int_t = RowData(2)
+    seals_of_munition: int_t = RowData(3)
+    seals_of_supplies: int_t = RowData(4)
+
+
+class GFATE(DataRow):
+    _sign = b'GFATE|eJzLyyMKpJEIAEjJI+M='
+    sheet_name = 'GFATE'
+    type: int_t = RowData(0)
+    position_type: int_t = RowData(1)
+    bgm: int_t = RowData(2)
+    screen_image_text: List[int_t] = ListData(ir((3, 3, 1)), RowData)
+    resident: int_t = RowData(6)
+    announce_icons_layout_id: List[int_t] = ListData(ir((7, 16, 1)), RowData)
+    announce_icons_icon: List[int_t] = ListData(ir((23, 16, 1)), RowData)
+    announce_icons_is_pre_join: List[bool_t] = ListData(ir((39, 16, 1)), RowData)
+    announce_icons_is_joined: List[bool_t] = ListData(ir((55, 16, 1)), RowData)
+    announce_icons_is_finish: List[bool_t] = ListData(ir((71, 16, 1)), RowData)
+
+
+class GFateClimbing(DataRow):
+    _sign = b'GFateClimbing|eJzLKwYAAVEA4g=='
+    sheet_name = 'GFateClimbing'
+    goal_action_timeline: int_t = RowData(0)
+    text: str_t = RowData(1)
+
+
+class GFateClimbing2(DataRow):
+    _sign = b'GFateClimbing2|eJzLAwAAbwBv'
+    sheet_name = 'GFateClimbing2'
+    content_entry: 'ContentEntry' = RowForeign(0, 'ContentEntry')
+
+
+class GFateClimbing2Content(DataRow):
+    _sign = b'GFateClimbing2Content|eJzLAwAAbwBv'
+    sheet_name = 'GFateClimbing2Content'
+    start_message: 'PublicContentTextData' = RowForeign(0, 'PublicContentTextData')
+
+
+class GFateClimbing2TotemType(DataRow):
+    _sign = b'GFateClimbing2TotemType|eJzLAwAAbwBv'
+    sheet_name = 'GFateClimbing2TotemType'
+    todo_text: 'PublicContentTextData' = RowForeign(0, 'PublicContentTextData')
+
+
+class GFateDance(DataRow):
+    _sign = b'GFateDance|eJzLywMAAUwA3Q=='
+    sheet_name = 'GFateDance'
+    num_of_motion: int_t = RowData(0)
+    num_of_dance: int_t = RowData(1)
+
+
+class GFateHiddenObject(DataRow):
+    _sign = b'GFateHiddenObject|eJzLAwAAbwBv'
+    sheet_name = 'GFateHiddenObject'
+    transformation: int_t = RowData(0)
+
+
+class GFateRideShooting(DataRow):
+    _sign = b'GFateRideShooting|eJzLAwAAbwBv'
+    sheet_name = 'GFateRideShooting'
+    content_entry: 'ContentEntry' = RowForeign(0, 'ContentEntry')
+
+
+class GFateRoulette(DataRow):
+    _sign = b'GFateRoulette|eJzLAwAAbwBv'
+    sheet_name = 'GFateRoulette'
+    lottery_number: int_t = RowData(0)
+
+
+class GFateStelth(DataRow):
+    _sign = b'GFateStelth|eJzLKwYAAVEA4g=='
+    sheet_name = 'GFateStelth'
+    num_of_items: int_t = RowData(0)
+    text: str_t = RowData(1)
+
+
+class GFateType(DataRow):
+    _sign = b'GFateType|eJzLAwAAbwBv'
+    sheet_name = 'GFateType'
+    gold_saucer_text_data: int_t = RowData(0)
+
+
+class GameRewardObtainType(DataRow):
+    _sign = b'GameRewardObtainType|eJzLywMAAUwA3Q=='
+    sheet_name = 'GameRewardObtainType'
+    icon: int_t = RowData(0)
+    obtain_format: int_t = RowData(1)
+
+
+class GardeningSeed(DataRow):
+    _sign = b'GardeningSeed|eJzLy8tLS8sDAAjkAoU='
+    sheet_name = 'GardeningSeed'
+    _display = 'crop'
+    crop: 'Item' = RowForeign(0, 'Item')
+    model_id: int_t = RowData(1)
+    harvest_icon: 'Icon' = IconRow(2)
+    se: bool_t = RowData(3)
+    plant_pot_exclusive: bool_t = RowData(4)
+    flower: int_t = RowData(5)
+
+
+class GathererCrafterTool(DataRow):
+    _sign = b'GathererCrafterTool|eJzLywMAAUwA3Q=='
+    sheet_name = 'GathererCrafterTool'
+    effect_type: int_t = RowData(0)
+    effect_value: int_t = RowData(1)
+
+
+class GathererReductionReward(DataRow):
+    _sign = b'GathererReductionReward|eJzLSwMAAUQA1Q=='
+    sheet_name = 'GathererReductionReward'
+    refine: int_t = RowData(0)
+    is_lowest_item_rate: bool_t = RowData(1)
+
+
+class GatheringCondition(DataRow):
+    _sign = b'GatheringCondition|eJwrBgAAdAB0'
+    sheet_name = 'GatheringCondition'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class GatheringExp(DataRow):
+    _sign = b'GatheringExp|eJzLAwAAbwBv'
+    sheet_name = 'GatheringExp'
+    exp: int_t = RowData(0)
+
+
+class GatheringItem(DataRow):
+    _sign = b'GatheringItem|eJzLy0vLA6E8ABMHA88='
+    sheet_name = 'GatheringItem'
+    _display = 'item_id'
+    item_id: int_t = RowData(0)
+    level: 'GatheringItemLevelConvertTable' = RowForeign(1, 'GatheringItemLevelConvertTable')
+    is_notebook: bool_t = RowData(2)
+    need_insight: 'Quest' = RowForeign(3, 'Quest')
+    need_complete_quest: int_t = RowData(4)
+    is_hidden_for_notebook: bool_t = RowData(5)
+    mutated_gathering_item: int_t = RowData(6)
+    collectables_refine_type: int_t = RowData(7)
+    collectables_refine: int_t = RowData(8)
+
+
+class GatheringItemLevelConvertTable(DataRow):
+    _sign = b'GatheringItemLevelConvertTable|eJzLywMAAUwA3Q=='
+    sheet_name = 'GatheringItemLevelConvertTable'
+    ui_level: int_t = RowData(0)
+    difficulty: int_t = RowData(1)
+
+
+class GatheringItemPoint(DataRow):
+    _sign = b'GatheringItemPoint|eJzLAwAAbwBv'
+    sheet_name = 'GatheringItemPoint'
+    _display = 'gathering_point_id'
+    gathering_point_id: 'GatheringPoint' = RowForeign(0, 'GatheringPoint')
+
+
+class GatheringLeve(DataRow):
+    _sign = b'GatheringLeve|eJzLy0MHaQBRrwgj'
+    sheet_name = 'GatheringLeve'
+    route: List[int_t] = ListData(ir((0, 4, 1)), RowData)
+    item: 'List[EventItem]' = ListData(ir((4, 4, 2)), RowForeign, 'EventItem')
+    item_num: List[int_t] = ListData(ir((5, 4, 2)), RowData)
+    num: int_t = RowData(12)
+    rule: 'GatheringLeveRule' = RowForeign(13, 'GatheringLeveRule')
+    variation: int_t = RowData(14)
+    objective: List[int_t] = ListData(ir((15, 2, 1)), RowData)
+    b_npc_entry: 'GatheringLeveBNpcEntry' = RowForeign(17, 'GatheringLeveBNpcEntry')
+    use_sub_arm: bool_t = RowData(18)
+
+
+class GatheringLeveBNpcEntry(DataRow):
+    _sign = b'GatheringLeveBNpcEntry|eJzLy0MAACGQBSk='
+    sheet_name = 'GatheringLeveBNpcEntry'
+    num_0: int_t = RowData(0)
+    num_1: int_t = RowData(1)
+    num_2: int_t = RowData(2)
+    num_3: int_t = RowData(3)
+    num_4: int_t = RowData(4)
+    num_5: int_t = RowData(5)
+    num_6: int_t = RowData(6)
+    num_7: int_t = RowData(7)
+    num_8: int_t = RowData(8)
+    num_9: int_t = RowData(9)
+    num_10: int_t = RowData(10)
+    num_11: int_t = RowData(11)
+
+
+class GatheringLeveRoute(DataRow):
+    _sign = b'GatheringLeveRoute|eJzLy8MOAIEAClE='
+    sheet_name = 'GatheringLeveRoute'
+    point: List[int_t] = ListData(ir((0, 12, 2)), RowData)
+    b_npc_pop_range: List[int_t] = ListData(ir((1, 12, 2)), RowData)
+
+
+class GatheringLeveRule(DataRow):
+    _sign = b'GatheringLeveRule|eJwrBgAAdAB0'
+    sheet_name = 'GatheringLeveRule'
+    _display = 'script'
+    script: str_t = RowData(0)
+
+
+class GatheringNotebookItem(DataRow):
+    _sign = b'GatheringNotebookItem|eJzLAwAAbwBv'
+    sheet_name = 'GatheringNotebookItem'
+    gathering_item_id: int_t = RowData(0)
+
+
+class GatheringNotebookList(DataRow):
+    _sign = b'GatheringNotebookList|eJzLy6MDAACmLytn'
+    sheet_name = 'GatheringNotebookList'
+    item_num: int_t = RowData(0)
+    item_id: List[int_t] = ListData(ir((1, 100, 1)), RowData)
+
+
+class GatheringPoint(DataRow):
+    _sign = b'GatheringPoint|eJzLy4MCABNfA98='
+    sheet_name = 'GatheringPoint'
+    type: int_t = RowData(0)
+    kind: int_t = RowData(1)
+    base_id: 'GatheringPointBase' = RowForeign(2, 'GatheringPointBase')
+    count: int_t = RowData(3)
+    bonus: List[int_t] = ListData(ir((4, 2, 1)), RowData)
+    area_id: 'TerritoryType' = RowForeign(6, 'TerritoryType')
+    place_name_id: 'PlaceName' = RowForeign(7, 'PlaceName')
+    sub_category: 'GatheringSubCategory' = RowForeign(8, 'GatheringSubCategory')
+
+
+class GatheringPointBase(DataRow):
+    _sign = b'GatheringPointBase|eJzLy4MBABesBE0='
+    sheet_name = 'GatheringPointBase'
+    type: 'GatheringType' = RowForeign(0, 'GatheringType')
+    lv: int_t = RowData(1)
+    gathering_item_id: List[int_t] = ListData(ir((2, 8, 1)), RowData)
+
+
+class GatheringPointBonus(DataRow):
+    _sign = b'GatheringPointBonus|eJzLywOBtDwAD3ADaQ=='
+    sheet_name = 'GatheringPointBonus'
+    bonus_cond: 'GatheringCondition' = RowForeign(0, 'GatheringCondition')
+    bonus_cond_val: int_t = RowData(1)
+    bonus_cond_val_max: int_t = RowData(2)
+    bonus_type: 'GatheringPointBonusType' = RowForeign(3, 'GatheringPointBonusType')
+    bonus_point: int_t = RowData(4)
+    bonus_point_max: int_t = RowData(5)
+    reverse_condition: bool_t = RowData(6)
+    need_complete_quest: int_t = RowData(7)
+
+
+class GatheringPointBonusType(DataRow):
+    _sign = b'GatheringPointBonusType|eJwrBgAAdAB0'
+    sheet_name = 'GatheringPointBonusType'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class GatheringPointName(DataRow):
+    _sign = b'GatheringPointName|eJwrzivOAwEAD8YDew=='
+    sheet_name = 'GatheringPointName'
+    _display = 'text_sgl'
+    text_sgl: str_t = RowData(0)
+    text_sgg: int_t = RowData(1)
+    text_plr: str_t = RowData(2)
+    text_plg: int_t = RowData(3)
+    text_vow: int_t = RowData(4)
+    text_cnt: int_t = RowData(5)
+    text_gen: int_t = RowData(6)
+    text_def_: int_t = RowData(7)
+
+
+class GatheringPointTransient(DataRow):
+    _sign = b'GatheringPointTransient|eJzLy8sDAAKXAUs='
+    sheet_name = 'GatheringPointTransient'
+    ephemeral_start_time: int_t = RowData(0)
+    ephemeral_end_time: int_t = RowData(1)
+    rare_pop_time_table_id: 'GatheringRarePopTimeTable' = RowForeign(2, 'GatheringRarePopTimeTable')
+
+
+class GatheringRarePopTimeTable(DataRow):
+    _sign = b'GatheringRarePopTimeTable|eJzLywMBAAkMApU='
+    sheet_name = 'GatheringRarePopTimeTable'
+    start_time: List[int_t] = ListData(ir((0, 3, 2)), RowData)
+    pop_life: List[int_t] = ListData(ir((1, 3, 2)), RowData)
+
+
+class GatheringSubCategory(DataRow):
+    _sign = b'GatheringSubCategory|eJzLywOC4jwADBkDCA=='
+    sheet_name = 'GatheringSubCategory'
+    _display = 'text'
+    type: 'GatheringType' = RowForeign(0, 'GatheringType')
+    class_: 'ClassJob' = RowForeign(1, 'ClassJob')
+    work_index: 'Quest' = RowForeign(2, 'Quest')
+    division: int_t = RowData(3)
+    item: 'Item' = RowForeign(4, 'Item')
+    text: str_t = RowData(5)
+    appearance_rule: int_t = RowData(6)
+
+
+class GatheringType(DataRow):
+    _sign = b'GatheringType|eJwrzssDAAKmAVA='
+    sheet_name = 'GatheringType'
+    _display = 'text'
+    text: str_t = RowData(0)
+    map_icon: 'Icon' = IconRow(1)
+    rare_map_icon: 'Icon' = IconRow(2)
+
+
+class GcArmyCandidateCategory(DataRow):
+    _sign = b'GcArmyCandidateCategory|eJwrBgAAdAB0'
+    sheet_name = 'GcArmyCandidateCategory'
+    text: str_t = RowData(0)
+
+
+class GcArmyCapture(DataRow):
+    _sign = b'GcArmyCapture|eJzLy4MAAA+AA3E='
+    sheet_name = 'GcArmyCapture'
+    content: int_t = RowData(0)
+    level: int_t = RowData(1)
+    level_max: int_t = RowData(2)
+    item_level: int_t = RowData(3)
+    item_level_max: int_t = RowData(4)
+    open_condition_capture: int_t = RowData(5)
+    company_seal: int_t = RowData(6)
+    member_exp: int_t = RowData(7)
+
+
+class GcArmyCaptureTactics(DataRow):
+    _sign = b'GcArmyCaptureTactics|eJzLywMBAAkMApU='
+    sheet_name = 'GcArmyCaptureTactics'
+    _display = 'buff_status'
+    buff_status: 'Status' = RowForeign(0, 'Status')
+    buff_status_effect_hp: int_t = RowData(1)
+    buff_status_effect_attack: int_t = RowData(2)
+    buff_status_effec_defense: int_t = RowData(3)
+    name_id: 'Addon' = RowForeign(4, 'Addon')
+    icon_id: 'Icon' = IconRow(5)
+
+
+class GcArmyEquipPreset(DataRow):
+    _sign = b'GcArmyEquipPreset|eJzLywMDAAwPAwM='
+    sheet_name = 'GcArmyEquipPreset'
+    main_weapon: 'Item' = RowForeign(0, 'Item')
+    sub_weapon: 'Item' = RowForeign(1, 'Item')
+    equip: 'List[Item]' = ListData(ir((2, 5, 1)), RowForeign, 'Item')
+
+
+class GcArmyExpedition(DataRow):
+    _sign = b'GcArmyExpedition|eJzLy4OA4uI8sgAAgFgbiw=='
+    sheet_name = 'GcArmyExpedition'
+    _display = 'name'
+    need_progress: int_t = RowData(0)
+    disable_progress: int_t = RowData(1)
+    min_member_level: int_t = RowData(2)
+    company_seal: int_t = RowData(3)
+    exp: int_t = RowData(4)
+    success_rate: int_t = RowData(5)
+    sort_id: int_t = RowData(6)
+    type: 'GcArmyExpeditionType' = RowForeign(7, 'GcArmyExpeditionType')
+    name: str_t = RowData(8)
+    detail: str_t = RowData(9)
+    variation_reward_item: List[int_t] = ListData(ir((10, 6, 1)), RowData)
+    variation_reward_item_num: List[int_t] = ListData(ir((16, 6, 1)), RowData)
+    variation_team_physical: List[int_t] = ListData(ir((22, 6, 1)), RowData)
+    variation_team_physical_bonus: List[int_t] = ListData(ir((28, 6, 1)), RowData)
+    variation_team_mental: List[int_t] = ListData(ir((34, 6, 1)), RowData)
+    variation_team_mental_bonus: List[int_t] = ListData(ir((40, 6, 1)), RowData)
+    variation_team_tactical: List[int_t] = ListData(ir((46, 6, 1)), RowData)
+    variation_team_tactical_bonus: List[int_t] = ListData(ir((52, 6, 1)), RowData)
+    variation_bonus_complete_bonus: List[int_t] = ListData(ir((58, 6, 1)), RowData)
+
+
+class GcArmyExpeditionMemberBonus(DataRow):
+    _sign = b'GcArmyExpeditionMemberBonus|eJzLywMAAUwA3Q=='
+    sheet_name = 'GcArmyExpeditionMemberBonus'
+    race: 'Race' = RowForeign(0, 'Race')
+    class_job: 'ClassJob' = RowForeign(1, 'ClassJob')
+
+
+class GcArmyExpeditionTrait(DataRow):
+    _sign = b'GcArmyExpeditionTrait|eJzLy4OBYgAcbATA'
+    sheet_name = 'GcArmyExpeditionTrait'
+    rarity_effect: List[int_t] = ListData(ir((0, 5, 2)), RowData)
+    rarity_rate: List[int_t] = ListData(ir((1, 5, 2)), RowData)
+    text: str_t = RowData(10)
+
+
+class GcArmyExpeditionTraitCond(DataRow):
+    _sign = b'GcArmyExpeditionTraitCond|eJwrBgAAdAB0'
+    sheet_name = 'GcArmyExpeditionTraitCond'
+    text: str_t = RowData(0)
+
+
+class GcArmyExpeditionType(DataRow):
+    _sign = b'GcArmyExpeditionType|eJwrBgAAdAB0'
+    sheet_name = 'GcArmyExpeditionType'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class GcArmyMember(DataRow):
+    _sign = b'GcArmyMember|eJzLywMAAUwA3Q=='
+    sheet_name = 'GcArmyMember'
+    special_equip: int_t = RowData(0)
+    home: int_t = RowData(1)
+
+
+class GcArmyMemberGrow(DataRow):
+    _sign = b'GcArmyMemberGrow|eJzLyxuJAAACSWm1'
+    sheet_name = 'GcArmyMemberGrow'
+    class_job: 'ClassJob' = RowForeign(0, 'ClassJob')
+    class_change_item: 'Item' = RowForeign(1, 'Item')
+    param_equip_preset: List[int_t] = ListData(ir((2, 61, 1)), RowData)
+    param_physical: List[int_t] = ListData(ir((63, 61, 1)), RowData)
+    param_mental: List[int_t] = ListData(ir((124, 61, 1)), RowData)
+    param_tactical: List[int_t] = ListData(ir((185, 61, 1)), RowData)
+
+
+class GcArmyMemberGrowExp(DataRow):
+    _sign = b'GcArmyMemberGrowExp|eJzLAwAAbwBv'
+    sheet_name = 'GcArmyMemberGrowExp'
+    next_exp: int_t = RowData(0)
+
+
+class GcArmyProgress(DataRow):
+    _sign = b'GcArmyProgress|eJzLy8sDAAKXAUs='
+    sheet_name = 'GcArmyProgress'
+    progress: int_t = RowData(0)
+    army_rank: int_t = RowData(1)
+    team_power_sum_max: int_t = RowData(2)
+
+
+class GcArmyTraining(DataRow):
+    _sign = b'GcArmyTraining|eJzLy8vLKy4GAAkbAp8='
+    sheet_name = 'GcArmyTraining'
+    _display = 'text'
+    team_physical_up: int_t = RowData(0)
+    team_mental_up: int_t = RowData(1)
+    team_tactical_up: int_t = RowData(2)
+    exp: int_t = RowData(3)
+    text: str_t = RowData(4)
+    effect_text: str_t = RowData(5)
+
+
+class GeneralAction(DataRow):
+    _sign = b'GeneralAction|eJwrLs4DgzQAE6wD4Q=='
+    sheet_name = 'GeneralAction'
+    _display = 'text_name'
+    text_name: str_t = RowData(0)
+    text_help: str_t = RowData(1)
+    type: int_t = RowData(2)
+    action: 'Action' = RowForeign(3, 'Action')
+    reward: int_t = RowData(4)
+    recast: int_t = RowData(5)
+    ui_priority: int_t = RowData(6)
+    icon: 'Icon' = IconRow(7)
+    ui_control: bool_t = RowData(8)
+
+
+class GilShop(DataRow):
+    _sign = b'GilShop|eJwrzgOCtLw8AA+QA24='
+    sheet_name = 'GilShop'
+    _display = 'text'
+    text: str_t = RowData(0)
+    map_icon: 'Icon' = IconRow(1)
+    disclosure_reward_or_quest: 'Quest' = RowForeign(2, 'Quest')
+    qualified_talk: 'DefaultTalk' = RowForeign(3, 'DefaultTalk')
+    unqualified_talk: 'DefaultTalk' = RowForeign(4, 'DefaultTalk')
+    system: bool_t = RowData(5)
+    festival: int_t = RowData(6)
+    festival_phase: int_t = RowData(7)
+
+
+class GilShop(DataRow):
+    _sign = b'GilShop|eJwrzgOCtDwADCIDAA=='
+    sheet_name = 'GilShop'
+    _display = 'text'
+    text: str_t = RowData(0)
+    map_icon: 'Icon' = IconRow(1)
+    disclosure_reward_or_quest: 'Quest' = RowForeign(2, 'Quest')
+    qualified_talk: 'DefaultTalk' = RowForeign(3, 'DefaultTalk')
+    unqualified_talk: 'DefaultTalk' = RowForeign(4, 'DefaultTalk')
+    system: bool_t = RowData(5)
+    festival: int_t = RowData(6)
+
+
+class GilShopInfo(DataRow):
+    _sign = b'GilShopInfo|eJzLAwAAbwBv'
+    sheet_name = 'GilShopInfo'
+    handlig: int_t = RowData(0)
+
+
+class GilShopItem(DataRow):
+    _sign = b'GilShopItem|eJzLS8uDAAATHwPX'
+    sheet_name = 'GilShopItem'
+    _display = 'item_id'
+    item_id: 'Item' = RowForeign(0, 'Item')
+    is_hq: bool_t = RowData(1)
+    stain_id: int_t = RowData(2)
+    quest: List[int_t] = ListData(ir((3, 2, 1)), RowData)
+    achievement: 'Achievement' = RowForeign(5, 'Achievement')
+    mask_type: int_t = RowData(6)
+    sort: int_t = RowData(7)
+    added_version: int_t = RowData(8)
+
+
+class GimmickAccessor(DataRow):
+    _sign = b'GimmickAccessor|eJzLywODtLQ0ABd8BDU='
+    sheet_name = 'GimmickAccessor'
+    type: int_t = RowData(0)
+    param: List[int_t] = ListData(ir((1, 6, 1)), RowData)
+    carry: bool_t = RowData(7)
+    transformation: bool_t = RowData(8)
+    client_visibility: bool_t = RowData(9)
+
+
+class GimmickBill(DataRow):
+    _sign = b'GimmickBill|eJwrBgAAdAB0'
+    sheet_name = 'GimmickBill'
+    text: str_t = RowData(0)
+
+
+class GimmickJump(DataRow):
+    _sign = b'GimmickJump|eJzLy8vLS0vLywMAD0gDYQ=='
+    sheet_name = 'GimmickJump'
+    fall_damage: int_t = RowData(0)
+    height: int_t = RowData(1)
+    loop_motion: 'ActionTimeline' = RowForeign(2, 'ActionTimeline')
+    end_motion: 'ActionTimeline' = RowForeign(3, 'ActionTimeline')
+    start_client: bool_t = RowData(4)
+    over_write: bool_t = RowData(5)
+    max_move_speed: int_t = RowData(6)
+    move_accel: int_t = RowData(7)
+
+
+class GimmickJump(DataRow):
+    _sign = b'GimmickJump|eJzLy8vLS0sDAAj0AoU='
+    sheet_name = 'GimmickJump'
+    fall_damage: int_t = RowData(0)
+    height: int_t = RowData(1)
+    loop_motion: 'ActionTimeline' = RowForeign(2, 'ActionTimeline')
+    end_motion: 'ActionTimeline' = RowForeign(3, 'ActionTimeline')
+    start_client: bool_t = RowData(4)
+    over_write: bool_t = RowData(5)
+
+
+class GimmickRect(DataRow):
+    _sign = b'GimmickRect|eJzLy4MDABxnBLs='
+    sheet_name = 'GimmickRect'
+    layout_id: int_t = RowData(0)
+    trigger_in: int_t = RowData(1)
+    in_param: List[int_t] = ListData(ir((2, 4, 1)), RowData)
+    trigger_out: int_t = RowData(6)
+    out_param: List[int_t] = ListData(ir((7, 4, 1)), RowData)
+
+
+class GimmickTalk(DataRow):
+    _sign = b'GimmickTalk|eJzLSysGAAKMAUg='
+    sheet_name = 'GimmickTalk'
+    type: int_t = RowData(0)
+    talker: bool_t = RowData(1)
+    text: str_t = RowData(2)
+
+
+class GimmickYesNo(DataRow):
+    _sign = b'GimmickYesNo|eJwrLi4GAAK1AVo='
+    sheet_name = 'GimmickYesNo'
+    text_text1: str_t = RowData(0)
+    text_text2: str_t = RowData(1)
+    text_text3: str_t = RowData(2)
+
+
+class GoldSaucerArcadeMachine(DataRow):
+    _sign = b'GoldSaucerArcadeMachine|eJzLyyMKFAMBAJboEo8='
+    sheet_name = 'GoldSaucerArcadeMachine'
+    type: int_t = RowData(0)
+    time: int_t = RowData(1)
+    action_time: int_t = RowData(2)
+    play_num: int_t = RowData(3)
+    play_fee: int_t = RowData(4)
+    ui_type: int_t = RowData(5)
+    timeup_icon: 'Icon' = IconRow(6)
+    offset_x: int_t = RowData(7)
+    offset_y: int_t = RowData(8)
+    offset_z: int_t = RowData(9)
+    idle_motion: int_t = RowData(10)
+    result_ui_wait_time: int_t = RowData(11)
+    result_ui_offset_x: int_t = RowData(12)
+    result_ui_offset_y: int_t = RowData(13)
+    result_ui_offset_z: int_t = RowData(14)
+    results_gauge: List[List[int_t]] = ListData(ir(((15, 2, 4), 4, 1)), ListData, RowData)
+    results_score: List[int_t] = ListData(ir((23, 4, 1)), RowData)
+    results_player_motion: List[int_t] = ListData(ir((27, 4, 1)), RowData)
+    results_sg_timeline: List[int_t] = ListData(ir((31, 4, 1)), RowData)
+    results_icon: List[Icon] = ListData(ir((35, 4, 1)), IconRow)
+    text_title: str_t = RowData(39)
+    text_description: str_t = RowData(40)
+    text_description2: str_t = RowData(41)
+    text_todo: str_t = RowData(42)
+
+
+class GoldSaucerContent(DataRow):
+    _sign = b'GoldSaucerContent|eJzLy8vLAwAEUAG5'
+    sheet_name = 'GoldSaucerContent'
+    director_type: int_t = RowData(0)
+    time: int_t = RowData(1)
+    territory_type: int_t = RowData(2)
+    content_finder_condition: int_t = RowData(3)
+
+
+class GoldSaucerTalk(DataRow):
+    _sign = b'GoldSaucerTalk|eJzLy0vLywNjKChGAACuWgww'
+    sheet_name = 'GoldSaucerTalk'
+    type: int_t = RowData(0)
+    shape: int_t = RowData(1)
+    next_page: bool_t = RowData(2)
+    next: int_t = RowData(3)
+    turn: int_t = RowData(4)
+    gesture: int_t = RowData(5)
+    is_default_yes: bool_t = RowData(6)
+    select_talk: List[int_t] = ListData(ir((7, 10, 1)), RowData)
+    text: List[str_t] = ListData(ir((17, 11, 1)), RowData)
+
+
+class GoldSaucerTextData(DataRow):
+    _sign = b'GoldSaucerTextData|eJwrBgAAdAB0'
+    sheet_name = 'GoldSaucerTextData'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class GrandCompany(DataRow):
+    _sign = b'GrandCompany|eJwrzivOA4HiPAAYEARc'
+    sheet_name = 'GrandCompany'
+    _display = 'text_sgl'
+    text_sgl: str_t = RowData(0)
+    text_sgg: int_t = RowData(1)
+    text_plr: str_t = RowData(2)
+    text_plg: int_t = RowData(3)
+    text_vow: int_t = RowData(4)
+    text_cnt: int_t = RowData(5)
+    text_gen: int_t = RowData(6)
+    text_def_: int_t = RowData(7)
+    text_swt: str_t = RowData(8)
+    monster_note: int_t = RowData(9)
+
+
+class GrandCompanyRank(DataRow):
+    _sign = b'GrandCompanyRank|eJzLy4MDABxnBLs='
+    sheet_name = 'GrandCompanyRank'
+    rank_category: int_t = RowData(0)
+    linear_rank: int_t = RowData(1)
+    cs_max: int_t = RowData(2)
+    next_cs: int_t = RowData(3)
+    icon_of_limsa: 'Icon' = IconRow(4)
+    icon_of_gridania: 'Icon' = IconRow(5)
+    icon_of_uldah: 'Icon' = IconRow(6)
+    rank_up_quest_of_limsa: 'Quest' = RowForeign(7, 'Quest')
+    rank_up_quest_of_gridania: 'Quest' = RowForeign(8, 'Quest')
+    rank_up_quest_of_uldah: 'Quest' = RowForeign(9, 'Quest')
+    rank_of_monster_note_condition: int_t = RowData(10)
+
+
+class GroupPoseCharaStatus(DataRow):
+    _sign = b'GroupPoseCharaStatus|eJzLAwAAbwBv'
+    sheet_name = 'GroupPoseCharaStatus'
+    status: int_t = RowData(0)
+
+
+class GroupPoseCharacterShowPreset(DataRow):
+    _sign = b'GroupPoseCharacterShowPreset|eJxLS0MGACnkBZU='
+    sheet_name = 'GroupPoseCharacterShowPreset'
+    self: bool_t = RowData(0)
+    my_minion: bool_t = RowData(1)
+    g_pose_pc: bool_t = RowData(2)
+    g_pose_buddy: bool_t = RowData(3)
+    g_pose_pet: bool_t = RowData(4)
+    g_pose_minion: bool_t = RowData(5)
+    g_pose_npc: bool_t = RowData(6)
+    other_pc: bool_t = RowData(7)
+    other_buddy: bool_t = RowData(8)
+    other_pet: bool_t = RowData(9)
+    other_minion: bool_t = RowData(10)
+    other_npc: bool_t = RowData(11)
+    enemy: bool_t = RowData(12)
+    object: bool_t = RowData(13)
+
+
+class GroupPoseFrame(DataRow):
+    _sign = b'GroupPoseFrame|eJzLyyvOA4JiAA+jA3s='
+    sheet_name = 'GroupPoseFrame'
+    _display = 'name'
+    frame_type: int_t = RowData(0)
+    image: 'Icon' = IconRow(1)
+    uld: str_t = RowData(2)
+    vfx: int_t = RowData(3)
+    fill_color: int_t = RowData(4)
+    sort_id: int_t = RowData(5)
+    festival: int_t = RowData(6)
+    name: str_t = RowData(7)
+
+
+class GroupPoseStamp(DataRow):
+    _sign = b'GroupPoseStamp|eJzLywODtLS0YgAcJASo'
+    sheet_name = 'GroupPoseStamp'
+    _display = 'name'
+    icon: 'Icon' = IconRow(0)
+    type: int_t = RowData(1)
+    category: 'GroupPoseStampCategory' = RowForeign(2, 'GroupPoseStampCategory')
+    sort_id: int_t = RowData(3)
+    condition_type: int_t = RowData(4)
+    condition_data: int_t = RowData(5)
+    festival: int_t = RowData(6)
+    is_icon_shared_all_languages: bool_t = RowData(7)
+    allow_horizontal_flip: bool_t = RowData(8)
+    allow_vertical_flip: bool_t = RowData(9)
+    name: str_t = RowData(10)
+
+
+class GroupPoseStampCategory(DataRow):
+    _sign = b'GroupPoseStampCategory|eJzLKwYAAVEA4g=='
+    sheet_name = 'GroupPoseStampCategory'
+    _display = 'name'
+    sort_id: int_t = RowData(0)
+    name: str_t = RowData(1)
+
+
+class GroupPoseStampFontColor(DataRow):
+    _sign = b'GroupPoseStampFontColor|eJzLy8srBgAEVQG+'
+    sheet_name = 'GroupPoseStampFontColor'
+    font_color: int_t = RowData(0)
+    edge_color: int_t = RowData(1)
+    sort_id: int_t = RowData(2)
+    name: str_t = RowData(3)
+
+
+class GuardianDeity(DataRow):
+    _sign = b'GuardianDeity|eJwrLs4DAAKwAVU='
+    sheet_name = 'GuardianDeity'
+    _display = 'text_name'
+    text_name: str_t = RowData(0)
+    text_help: str_t = RowData(1)
+    icon: 'Icon' = IconRow(2)
+
+
+class Guide(DataRow):
+    _sign = b'Guide|eJzLywMAAUwA3Q=='
+    sheet_name = 'Guide'
+    title: 'GuideTitle' = RowForeign(0, 'GuideTitle')
+    page: 'GuidePage' = RowForeign(1, 'GuidePage')
+
+
+class GuidePage(DataRow):
+    _sign = b'GuidePage|eJzLywMAAUwA3Q=='
+    sheet_name = 'GuidePage'
+    element_type: int_t = RowData(0)
+    element_content: 'GuidePageString|GuidePageString|GuidePageString|GuidePageString|GuidePageString' = DynamicForeign(1, ComplexSheetKey('element_type', (1, 'GuidePageString'), (2, 'GuidePageString'), (4, 'GuidePageString'), (5, 'GuidePageString'), (6, 'GuidePageString')))
+
+
+class GuidePageString(DataRow):
+    _sign = b'GuidePageString|eJwrBgAAdAB0'
+    sheet_name = 'GuidePageString'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class GuideTitle(DataRow):
+    _sign = b'GuideTitle|eJwrLgYAAVsA5w=='
+    sheet_name = 'GuideTitle'
+    _display = 'text_title'
+    text_title: str_t = RowData(0)
+    text_sub_title: str_t = RowData(1)
+
+
+class GuildOrder(DataRow):
+    _sign = b'GuildOrder|eJzLKwaCPDhISgIAQs0HSw=='
+    sheet_name = 'GuildOrder'
+    officer_base: 'ENpcResident' = RowForeign(0, 'ENpcResident')
+    text_operation_text: str_t = RowData(1)
+    text_order_text: List[str_t] = ListData(ir((2, 2, 1)), RowData)
+    text_summary_text: str_t = RowData(4)
+    reward_exp: List[int_t] = ListData(ir((5, 2, 1)), RowData)
+    reward_gil: List[int_t] = ListData(ir((7, 2, 1)), RowData)
+    reward_seal: List[int_t] = ListData(ir((9, 2, 1)), RowData)
+    reward_item: List[int_t] = ListData(ir((11, 2, 1)), RowData)
+    reward_stack: List[int_t] = ListData(ir((13, 2, 1)), RowData)
+    reward_hq: List[bool_t] = ListData(ir((15, 2, 1)), RowData)
+
+
+class GuildOrderGuide(DataRow):
+    _sign = b'GuildOrderGuide|eJzLywMBAAkMApU='
+    sheet_name = 'GuildOrderGuide'
+    talk: List[int_t] = ListData(ir((0, 6, 1)), RowData)
+
+
+class GuildOrderOfficer(DataRow):
+    _sign = b'GuildOrderOfficer|eJzLywMBAAkMApU='
+    sheet_name = 'GuildOrderOfficer'
+    talk: List[int_t] = ListData(ir((0, 6, 1)), RowData)
+
+
+class GuildleveAssignment(DataRow):
+    _sign = b'GuildleveAssignment|eJwrzgOCNBDIAwAb/gSY'
+    sheet_name = 'GuildleveAssignment'
+    text: str_t = RowData(0)
+    type: int_t = RowData(1)
+    talk: 'GuildleveAssignmentTalk' = RowForeign(2, 'GuildleveAssignmentTalk')
+    unlock_quest: int_t = RowData(3)
+    decide_quest: int_t = RowData(4)
+    have_maelstrom_leve: bool_t = RowData(5)
+    have_twin_adder_leve: bool_t = RowData(6)
+    have_immortal_leve: bool_t = RowData(7)
+    have_multi_ticket_leve: bool_t = RowData(8)
+    hide_battle_leve: bool_t = RowData(9)
+    need_grand_company_rank: int_t = RowData(10)
+
+
+class GuildleveAssignmentCategory(DataRow):
+    _sign = b'GuildleveAssignmentCategory|eJzLy4MAAA+AA3E='
+    sheet_name = 'GuildleveAssignmentCategory'
+    filter: List[int_t] = ListData(ir((0, 8, 1)), RowData)
+
+
+class GuildleveAssignmentTalk(DataRow):
+    _sign = b'GuildleveAssignmentTalk|eJxLSwOCPFygGAoAOa8QVQ=='
+    sheet_name = 'GuildleveAssignmentTalk'
+    param_look_at: List[bool_t] = ListData(ir((0, 5, 1)), RowData)
+    param_turn: List[int_t] = ListData(ir((5, 5, 1)), RowData)
+    param_gesture: List[int_t] = ListData(ir((10, 5, 1)), RowData)
+    param_lip_sync: List[int_t] = ListData(ir((15, 5, 1)), RowData)
+    param_facial: List[int_t] = ListData(ir((20, 5, 1)), RowData)
+    param_shape: List[int_t] = ListData(ir((25, 5, 1)), RowData)
+    text: List[str_t] = ListData(ir((30, 8, 1)), RowData)
+
+
+class GuildleveEvaluation(DataRow):
+    _sign = b'GuildleveEvaluation|eJwrBgAAdAB0'
+    sheet_name = 'GuildleveEvaluation'
+    text: str_t = RowData(0)
@@ -0,0 +1,466 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class HWDAnnounce(DataRow):
+    _sign = b'HWDAnnounce|eJwrzsvLAwAEZAG+'
+    sheet_name = 'HWDAnnounce'
+    text: str_t = RowData(0)
+    announcer: 'ENpcResident' = RowForeign(1, 'ENpcResident')
+    delay_time: int_t = RowData(2)
+    show_time: int_t = RowData(3)
+
+
+class HWDCrafterSupply(DataRow):
+    _sign = b'HWDCrafterSupply|eJzLyxsFlAEAT2WKXQ=='
+    sheet_name = 'HWDCrafterSupply'
+    duty_item: List[int_t] = ListData(ir((0, 23, 1)), RowData)
+    duty_lv: List[int_t] = ListData(ir((23, 23, 1)), RowData)
+    duty_max_level_for_getting_stamp: List[int_t] = ListData(ir((46, 23, 1)), RowData)
+    duty_stars: List[int_t] = ListData(ir((69, 23, 1)), RowData)
+    duty_refine: List[List[int_t]] = ListData(ir(((92, 3, 23), 23, 1)), ListData, RowData)
+    duty_reward: List[List[int_t]] = ListData(ir(((161, 3, 23), 23, 1)), ListData, RowData)
+    duty_reward_old: List[List[int_t]] = ListData(ir(((230, 3, 23), 23, 1)), ListData, RowData)
+    duty_term: List[int_t] = ListData(ir((299, 23, 1)), RowData)
+
+
+class HWDCrafterSupplyReward(DataRow):
+    _sign = b'HWDCrafterSupplyReward|eJzLy8sDAAKXAUs='
+    sheet_name = 'HWDCrafterSupplyReward'
+    currency: int_t = RowData(0)
+    exp: int_t = RowData(1)
+    ranking_point: int_t = RowData(2)
+
+
+class HWDCrafterSupplyTerm(DataRow):
+    _sign = b'HWDCrafterSupplyTerm|eJwrBgAAdAB0'
+    sheet_name = 'HWDCrafterSupplyTerm'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class HWDDevLayerControl(DataRow):
+    _sign = b'HWDDevLayerControl|eJzLywMAAUwA3Q=='
+    sheet_name = 'HWDDevLayerControl'
+    phase: int_t = RowData(0)
+    festival_phase: int_t = RowData(1)
+
+
+class HWDDevLevelUI(DataRow):
+    _sign = b'HWDDevLevelUI|eJzLywMAAUwA3Q=='
+    sheet_name = 'HWDDevLevelUI'
+    info_board_rank: int_t = RowData(0)
+    info_board_topix: int_t = RowData(1)
+
+
+class HWDDevLevelWebText(DataRow):
+    _sign = b'HWDDevLevelWebText|eJwrLgYAAVsA5w=='
+    sheet_name = 'HWDDevLevelWebText'
+    text: str_t = RowData(0)
+    info_text: str_t = RowData(1)
+
+
+class HWDDevLively(DataRow):
+    _sign = b'HWDDevLively|eJzLy8sDAAKXAUs='
+    sheet_name = 'HWDDevLively'
+    _display = 'e_npc_id'
+    e_npc_id: 'ENpcBase' = RowForeign(0, 'ENpcBase')
+    idle_timeline: int_t = RowData(1)
+    behavior_pack_id: int_t = RowData(2)
+
+
+class HWDDevProgress(DataRow):
+    _sign = b'HWDDevProgress|eJxLAwAAZwBn'
+    sheet_name = 'HWDDevProgress'
+    _display = 'can_go_next'
+    can_go_next: bool_t = RowData(0)
+
+
+class HWDGathereInspectTerm(DataRow):
+    _sign = b'HWDGathereInspectTerm|eJwrBgAAdAB0'
+    sheet_name = 'HWDGathereInspectTerm'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class HWDGathererInspection(DataRow):
+    _sign = b'HWDGathererInspection|eJzLyxsFo4AIAAAtLu2f'
+    sheet_name = 'HWDGathererInspection'
+    duty_remove_gathering_item: List[int_t] = ListData(ir((0, 79, 1)), RowData)
+    duty_remove_fishing_item: List[int_t] = ListData(ir((79, 79, 1)), RowData)
+    duty_unit: List[int_t] = ListData(ir((158, 79, 1)), RowData)
+    duty_reward_item: List[int_t] = ListData(ir((237, 79, 1)), RowData)
+    duty_reward_others: List[int_t] = ListData(ir((316, 79, 1)), RowData)
+    duty_reward_others_old: List[int_t] = ListData(ir((395, 79, 1)), RowData)
+    duty_term: List[int_t] = ListData(ir((474, 79, 1)), RowData)
+
+
+class HWDGathererInspectionReward(DataRow):
+    _sign = b'HWDGathererInspectionReward|eJzLywMAAUwA3Q=='
+    sheet_name = 'HWDGathererInspectionReward'
+    _display = 'currency'
+    currency: int_t = RowData(0)
+    ranking_point: int_t = RowData(1)
+
+
+class HWDInfoBoardArticle(DataRow):
+    _sign = b'HWDInfoBoardArticle|eJzLy8tLKwYABmwCJA=='
+    sheet_name = 'HWDInfoBoardArticle'
+    _display = 'title'
+    type: 'HWDInfoBoardArticleType' = RowForeign(0, 'HWDInfoBoardArticleType')
+    new: int_t = RowData(1)
+    number: int_t = RowData(2)
+    is_info_progress: bool_t = RowData(3)
+    title: str_t = RowData(4)
+
+
+class HWDInfoBoardArticleTransient(DataRow):
+    _sign = b'HWDInfoBoardArticleTransient|eJzLKy4GAAKmAVU='
+    sheet_name = 'HWDInfoBoardArticleTransient'
+    _display = 'title_text_body'
+    icon: 'Icon' = IconRow(0)
+    title_text_body: str_t = RowData(1)
+    title_name: str_t = RowData(2)
+
+
+class HWDInfoBoardArticleType(DataRow):
+    _sign = b'HWDInfoBoardArticleType|eJwrBgAAdAB0'
+    sheet_name = 'HWDInfoBoardArticleType'
+    _display = 'name'
+    name: str_t = RowData(0)
+
+
+class HWDInfoBoardBackNumber(DataRow):
+    _sign = b'HWDInfoBoardBackNumber|eJzLyysGAAKcAVA='
+    sheet_name = 'HWDInfoBoardBackNumber'
+    begin: int_t = RowData(0)
+    end: int_t = RowData(1)
+    title: str_t = RowData(2)
+
+
+class HWDLevelChangeDeception(DataRow):
+    _sign = b'HWDLevelChangeDeception|eJzLAwAAbwBv'
+    sheet_name = 'HWDLevelChangeDeception'
+    _display = 'screen_image'
+    screen_image: 'ScreenImage' = RowForeign(0, 'ScreenImage')
+
+
+class HWDSharedGroup(DataRow):
+    _sign = b'HWDSharedGroup|eJzLywMAAUwA3Q=='
+    sheet_name = 'HWDSharedGroup'
+    layout_id: int_t = RowData(0)
+    control: 'HWDSharedGroupControlParam' = RowForeign(1, 'HWDSharedGroupControlParam')
+
+
+class HWDSharedGroupControlParam(DataRow):
+    _sign = b'HWDSharedGroupControlParam|eJzLywMAAUwA3Q=='
+    sheet_name = 'HWDSharedGroupControlParam'
+    development_level: int_t = RowData(0)
+    timeline: int_t = RowData(1)
+
+
+class HairMakeType(DataRow):
+    _sign = b'HairMakeType|eJzLyxsFo2AUjALqAgDv0t3g'
+    sheet_name = 'HairMakeType'
+    race: 'Race' = RowForeign(0, 'Race')
+    tribe: 'Tribe' = RowForeign(1, 'Tribe')
+    gender: int_t = RowData(2)
+    looks_menu: List[int_t] = ListData(ir((3, 9, 1)), RowData)
+    looks_init_val: List[int_t] = ListData(ir((12, 9, 1)), RowData)
+    looks_sub_menu_type: List[int_t] = ListData(ir((21, 9, 1)), RowData)
+    looks_sub_menu_num: List[int_t] = ListData(ir((30, 9, 1)), RowData)
+    looks_look_at: List[int_t] = ListData(ir((39, 9, 1)), RowData)
+    looks_sub_menu_mask: List[int_t] = ListData(ir((48, 9, 1)), RowData)
+    looks_customize: List[int_t] = ListData(ir((57, 9, 1)), RowData)
+    looks_sub_menu_param: List[List[int_t]] = ListData(ir(((66, 100, 9), 9, 1)), ListData, RowData)
+    looks_sub_menu_graphic: List[List[int_t]] = ListData(ir(((966, 10, 9), 9, 1)), ListData, RowData)
+    face_option_option: List[List[int_t]] = ListData(ir(((1056, 7, 8), 8, 1)), ListData, RowData)
+
+
+class HouseRetainerPose(DataRow):
+    _sign = b'HouseRetainerPose|eJzLAwAAbwBv'
+    sheet_name = 'HouseRetainerPose'
+    _display = 'timeline'
+    timeline: 'ActionTimeline' = RowForeign(0, 'ActionTimeline')
+
+
+class HousingAethernet(DataRow):
+    _sign = b'HousingAethernet|eJzLy8vLAwAEUAG5'
+    sheet_name = 'HousingAethernet'
+    pop_range: 'Level' = RowForeign(0, 'Level')
+    territory_type: 'TerritoryType' = RowForeign(1, 'TerritoryType')
+    transfer_name: 'PlaceName' = RowForeign(2, 'PlaceName')
+    sort_key: int_t = RowData(3)
+
+
+class HousingAppeal(DataRow):
+    _sign = b'HousingAppeal|eJwrzssDAAKmAVA='
+    sheet_name = 'HousingAppeal'
+    _display = 'text'
+    text: str_t = RowData(0)
+    icon: 'Icon' = IconRow(1)
+    sort: int_t = RowData(2)
+
+
+class HousingEmploymentNpcList(DataRow):
+    _sign = b'HousingEmploymentNpcList|eJzLy8sDAAKXAUs='
+    sheet_name = 'HousingEmploymentNpcList'
+    race_choices: 'HousingEmploymentNpcRace' = RowForeign(0, 'HousingEmploymentNpcRace')
+    npc_id: List[int_t] = ListData(ir((1, 2, 1)), RowData)
+
+
+class HousingEmploymentNpcRace(DataRow):
+    _sign = b'HousingEmploymentNpcRace|eJwrBgAAdAB0'
+    sheet_name = 'HousingEmploymentNpcRace'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class HousingExterior(DataRow):
+    _sign = b'HousingExterior|eJzLy8vLKwYABnwCLA=='
+    sheet_name = 'HousingExterior'
+    id: int_t = RowData(0)
+    category: int_t = RowData(1)
+    region: 'PlaceName' = RowForeign(2, 'PlaceName')
+    size: int_t = RowData(3)
+    path: str_t = RowData(4)
+
+
+class HousingFurniture(DataRow):
+    _sign = b'HousingFurniture|eJzLy4OAtDQwAQAzHwZT'
+    sheet_name = 'HousingFurniture'
+    _display = 'item'
+    id: int_t = RowData(0)
+    category: int_t = RowData(1)
+    use_type: int_t = RowData(2)
+    param: int_t = RowData(3)
+    layout_limit: int_t = RowData(4)
+    pile_limit: int_t = RowData(5)
+    event_handler: 'CustomTalk' = RowForeign(6, 'CustomTalk')
+    item: 'Item' = RowForeign(7, 'Item')
+    disposable: bool_t = RowData(8)
+    has_crest: bool_t = RowData(9)
+    place_text: int_t = RowData(10)
+    unplace_text: int_t = RowData(11)
+    unplace_lumber_text: int_t = RowData(12)
+    is_sitting_access: bool_t = RowData(13)
+    is_anyone_access: bool_t = RowData(14)
+
+
+class HousingInterior(DataRow):
+    _sign = b'HousingInterior|eJzLy8srBgAEVQG+'
+    sheet_name = 'HousingInterior'
+    id: int_t = RowData(0)
+    category: int_t = RowData(1)
+    material: int_t = RowData(2)
+    path: str_t = RowData(3)
+
+
+class HousingLandSet(DataRow):
+    _sign = b'HousingLandSet|eJzLyxsFxAMA0SCBxQ=='
+    sheet_name = 'HousingLandSet'
+    lands_size: List[int_t] = ListData(ir((0, 60, 1)), RowData)
+    lands_land_range: List[int_t] = ListData(ir((60, 60, 1)), RowData)
+    lands_signboard_e_obj: List[int_t] = ListData(ir((120, 60, 1)), RowData)
+    lands_exit_pop_range: List[int_t] = ListData(ir((180, 60, 1)), RowData)
+    lands_init_price: List[int_t] = ListData(ir((240, 60, 1)), RowData)
+    mansion_map_range: List[int_t] = ListData(ir((300, 2, 1)), RowData)
+
+
+class HousingMapMarkerInfo(DataRow):
+    _sign = b'HousingMapMarkerInfo|eJzLywMCAAZ3Aic='
+    sheet_name = 'HousingMapMarkerInfo'
+    trans_x: float_t = RowData(0)
+    trans_y: float_t = RowData(1)
+    trans_z: float_t = RowData(2)
+    range_on_map: float_t = RowData(3)
+    map: 'Map' = RowForeign(4, 'Map')
+
+
+class HousingMateAuthority(DataRow):
+    _sign = b'HousingMateAuthority|eJwrBgAAdAB0'
+    sheet_name = 'HousingMateAuthority'
+    text: str_t = RowData(0)
+
+
+class HousingMerchantPose(DataRow):
+    _sign = b'HousingMerchantPose|eJzLKwYAAVEA4g=='
+    sheet_name = 'HousingMerchantPose'
+    _display = 'text'
+    timeline: 'ActionTimeline' = RowForeign(0, 'ActionTimeline')
+    text: str_t = RowData(1)
+
+
+class HousingPileLimit(DataRow):
+    _sign = b'HousingPileLimit|eJzLy8tLAgEADswDNQ=='
+    sheet_name = 'HousingPileLimit'
+    width: int_t = RowData(0)
+    depth: int_t = RowData(1)
+    height: int_t = RowData(2)
+    object: List[bool_t] = ListData(ir((3, 5, 1)), RowData)
+
+
+class HousingPlacement(DataRow):
+    _sign = b'HousingPlacement|eJwrBgAAdAB0'
+    sheet_name = 'HousingPlacement'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class HousingPreset(DataRow):
+    _sign = b'HousingPreset|eJwrzivOwwYAgeYKWw=='
+    sheet_name = 'HousingPreset'
+    name_sgl: str_t = RowData(0)
+    name_sgg: int_t = RowData(1)
+    name_plr: str_t = RowData(2)
+    name_plg: int_t = RowData(3)
+    name_vow: int_t = RowData(4)
+    name_cnt: int_t = RowData(5)
+    name_gen: int_t = RowData(6)
+    name_def_: int_t = RowData(7)
+    region: 'PlaceName' = RowForeign(8, 'PlaceName')
+    size: int_t = RowData(9)
+    roof: 'Item' = RowForeign(10, 'Item')
+    wall: 'Item' = RowForeign(11, 'Item')
+    window: 'Item' = RowForeign(12, 'Item')
+    door: 'Item' = RowForeign(13, 'Item')
+    interior: 'List[Item]' = ListData(ir((14, 10, 1)), RowForeign, 'Item')
+
+
+class HousingTrainingDoll(DataRow):
+    _sign = b'HousingTrainingDoll|eJzLAwAAbwBv'
+    sheet_name = 'HousingTrainingDoll'
+    b_npc_base: int_t = RowData(0)
+
+
+class HousingUnitedExterior(DataRow):
+    _sign = b'HousingUnitedExterior|eJzLy4MCABNfA98='
+    sheet_name = 'HousingUnitedExterior'
+    size: int_t = RowData(0)
+    part: List[int_t] = ListData(ir((1, 8, 1)), RowData)
+
+
+class HousingUnplacement(DataRow):
+    _sign = b'HousingUnplacement|eJwrBgAAdAB0'
+    sheet_name = 'HousingUnplacement'
+    text: str_t = RowData(0)
+
+
+class HousingYardObject(DataRow):
+    _sign = b'HousingYardObject|eJzLywODtLQ0MAkAMt8GSw=='
+    sheet_name = 'HousingYardObject'
+    _display = 'item'
+    id: int_t = RowData(0)
+    category: int_t = RowData(1)
+    use_type: int_t = RowData(2)
+    param: int_t = RowData(3)
+    layout_limit: int_t = RowData(4)
+    event_handler: 'CustomTalk' = RowForeign(5, 'CustomTalk')
+    item: 'Item' = RowForeign(6, 'Item')
+    disposable: bool_t = RowData(7)
+    is_quest_used: bool_t = RowData(8)
+    is_auto_lumber: bool_t = RowData(9)
+    place_text: int_t = RowData(10)
+    unplace_text: int_t = RowData(11)
+    unplace_lumber_text: int_t = RowData(12)
+    is_anyone_access: bool_t = RowData(13)
+    is_place_minionaire: bool_t = RowData(14)
+
+
+class HousingYardObject(DataRow):
+    _sign = b'HousingYardObject|eJzLywODtLQ0EAkALJQF5Q=='
+    sheet_name = 'HousingYardObject'
+    _display = 'item'
+    id: int_t = RowData(0)
+    category: int_t = RowData(1)
+    use_type: int_t = RowData(2)
+    param: int_t = RowData(3)
+    layout_limit: int_t = RowData(4)
+    event_handler: 'CustomTalk' = RowForeign(5, 'CustomTalk')
+    item: 'Item' = RowForeign(6, 'Item')
+    disposable: bool_t = RowData(7)
+    is_quest_used: bool_t = RowData(8)
+    is_auto_lumber: bool_t = RowData(9)
+    place_text: int_t = RowData(10)
+    unplace_text: int_t = RowData(11)
+    unplace_lumber_text: int_t = RowData(12)
+    is_anyone_access: bool_t = RowData(13)
+
+
+class HowTo(DataRow):
+    _sign = b'HowTo|eJwrTstDAgAtCgYC'
+    sheet_name = 'HowTo'
+    _display = 'text'
+    text: str_t = RowData(0)
+    announce: bool_t = RowData(1)
+    page: List[int_t] = ListData(ir((2, 5, 1)), RowData)
+    page_pad: List[int_t] = ListData(ir((7, 5, 1)), RowData)
+    category: 'HowToCategory' = RowForeign(12, 'HowToCategory')
+    sort_id: int_t = RowData(13)
+
+
+class HowToCategory(DataRow):
+    _sign = b'HowToCategory|eJwrBgAAdAB0'
+    sheet_name = 'HowToCategory'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class HowToPage(DataRow):
+    _sign = b'HowToPage|eJzLy8vLKy4uBgAMLQMS'
+    sheet_name = 'HowToPage'
+    _display = 'icon'
+    type: int_t = RowData(0)
+    icon_kind: int_t = RowData(1)
+    icon: 'Icon' = IconRow(2)
+    text_kind: int_t = RowData(3)
+    text: List[str_t] = ListData(ir((4, 3, 1)), RowData)
+
+
+class Hud(DataRow):
+    _sign = b'Hud|eJwrLi4GAAK1AVo='
+    sheet_name = 'Hud'
+    text_0: str_t = RowData(0)
+    text_1: str_t = RowData(1)
+    text_2: str_t = RowData(2)
+
+
+class HudTransient(DataRow):
+    _sign = b'HudTransient|eJzLy8vLAwAEUAG5'
+    sheet_name = 'HudTransient'
+    category: int_t = RowData(0)
+    setting_type: int_t = RowData(1)
+    size: int_t = RowData(2)
+    simple_size: int_t = RowData(3)
+
+
+class HugeCraftworksNpc(DataRow):
+    _sign = b'HugeCraftworksNpc|eJzLy0MGaWCQRzRIAgNcIsUAPaUnPA=='
+    sheet_name = 'HugeCraftworksNpc'
+    _display = 'leader'
+    leader: 'ENpcResident' = RowForeign(0, 'ENpcResident')
+    target_class_job_category: 'ClassJobCategory' = RowForeign(1, 'ClassJobCategory')
+    supply_delivery_item: List[int_t] = ListData(ir((2, 6, 1)), RowData)
+    supply_delivery_item_count: List[int_t] = ListData(ir((8, 6, 1)), RowData)
+    supply_is_hq: List[bool_t] = ListData(ir((14, 6, 1)), RowData)
+    supply_reward_currency: List[int_t] = ListData(ir((20, 6, 1)), RowData)
+    supply_reward_currency_count: List[int_t] = ListData(ir((26, 6, 1)), RowData)
+    supply_reward_currency_count_hq_rate: List[int_t] = ListData(ir((32, 6, 1)), RowData)
+    supply_reward_gil: List[int_t] = ListData(ir((38, 6, 1)), RowData)
+    supply_reward_gil_hq_rate: List[int_t] = ListData(ir((44, 6, 1)), RowData)
+    supply_reward_exp_rate: List[int_t] = ListData(ir((50, 6, 1)), RowData)
+    rank_up_reward_rank_up_reward_item: List[List[int_t]] = ListData(ir(((56, 2, 18), 6, 1)), ListData, RowData)
+    rank_up_reward_is_hq: List[List[bool_t]] = ListData(ir(((62, 2, 18), 6, 1)), ListData, RowData)
+    rank_up_reward_rank_up_reward_item_count: List[List[int_t]] = ListData(ir(((68, 2, 18), 6, 1)), ListData, RowData)
+    text: str_t = RowData(92)
+
+
+class HugeCraftworksRank(DataRow):
+    _sign = b'HugeCraftworksRank|eJzLy8sDAAKXAUs='
+    sheet_name = 'HugeCraftworksRank'
+    need_level: int_t = RowData(0)
+    reward_exp: int_t = RowData(1)
+    reward_hq_exp_rate: int_t = RowData(2)
@@ -0,0 +1,533 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class IKDContentBonus(DataRow):
+    _sign = b'IKDContentBonus|eJwrLs7LywMABqQCMQ=='
+    sheet_name = 'IKDContentBonus'
+    _display = 'text_name'
+    text_name: str_t = RowData(0)
+    text_help: str_t = RowData(1)
+    rate: int_t = RowData(2)
+    icon: 'Icon' = IconRow(3)
+    sort_key: int_t = RowData(4)
+
+
+class IKDFishParam(DataRow):
+    _sign = b'IKDFishParam|eJzLy8sDAAKXAUs='
+    sheet_name = 'IKDFishParam'
+    _display = 'fish_parameter_id'
+    fish_parameter_id: 'FishParameter' = RowForeign(0, 'FishParameter')
+    bonus: 'IKDContentBonus' = RowForeign(1, 'IKDContentBonus')
+    player_bonus: int_t = RowData(2)
+
+
+class IKDPlayerMissionCondition(DataRow):
+    _sign = b'IKDPlayerMissionCondition|eJzLKwYAAVEA4g=='
+    sheet_name = 'IKDPlayerMissionCondition'
+    fish_num: int_t = RowData(0)
+    text: str_t = RowData(1)
+
+
+class IKDRoute(DataRow):
+    _sign = b'IKDRoute|eJzLy4ODYgAhlQUu'
+    sheet_name = 'IKDRoute'
+    _display = 'text'
+    spot: List[int_t] = ListData(ir((0, 3, 2)), RowData)
+    time: List[int_t] = ListData(ir((1, 3, 2)), RowData)
+    map_icon: List[Icon] = ListData(ir((6, 2, 1)), IconRow)
+    map_condition: int_t = RowData(8)
+    content_finder_condition: 'ContentFinderCondition' = RowForeign(9, 'ContentFinderCondition')
+    route_open_quest: int_t = RowData(10)
+    text: str_t = RowData(11)
+
+
+class IKDRoute(DataRow):
+    _sign = b'IKDRoute|eJzLy4OAYgATZAPk'
+    sheet_name = 'IKDRoute'
+    _display = 'text'
+    spot: List[int_t] = ListData(ir((0, 3, 2)), RowData)
+    time: List[int_t] = ListData(ir((1, 3, 2)), RowData)
+    map_icon: 'Icon' = IconRow(6)
+    content_finder_condition: 'TerritoryType' = RowForeign(7, 'TerritoryType')
+    text: str_t = RowData(8)
+
+
+class IKDRouteTable(DataRow):
+    _sign = b'IKDRouteTable|eJzLywMAAUwA3Q=='
+    sheet_name = 'IKDRouteTable'
+    _display = 'route'
+    route: 'List[IKDRoute]' = ListData(ir((0, 2, 1)), RowForeign, 'IKDRoute')
+
+
+class IKDRouteTable(DataRow):
+    _sign = b'IKDRouteTable|eJzLAwAAbwBv'
+    sheet_name = 'IKDRouteTable'
+    _display = 'route'
+    route: 'IKDRoute' = RowForeign(0, 'IKDRoute')
+
+
+class IKDSpot(DataRow):
+    _sign = b'IKDSpot|eJzLy8sDAAKXAUs='
+    sheet_name = 'IKDSpot'
+    _display = 'fishing_spot'
+    fishing_spot: 'FishingSpot' = RowForeign(0, 'FishingSpot')
+    fever_fishing_spot: 'FishingSpot' = RowForeign(1, 'FishingSpot')
+    place_name: 'PlaceName' = RowForeign(2, 'PlaceName')
+
+
+class IKDTimeDefine(DataRow):
+    _sign = b'IKDTimeDefine|eJzLAwAAbwBv'
+    sheet_name = 'IKDTimeDefine'
+    icon: int_t = RowData(0)
+
+
+class IconLanguage(DataRow):
+    _sign = b'IconLanguage|eJxLSoIBABUYA9U='
+    sheet_name = 'IconLanguage'
+    field_0: bool_t = RowData(0)
+    field_1: bool_t = RowData(1)
+    field_2: bool_t = RowData(2)
+    field_3: bool_t = RowData(3)
+    field_4: bool_t = RowData(4)
+    field_5: bool_t = RowData(5)
+    field_6: bool_t = RowData(6)
+    field_7: bool_t = RowData(7)
+    field_8: bool_t = RowData(8)
+    field_9: bool_t = RowData(9)
+
+
+class InclusionShop(DataRow):
+    _sign = b'InclusionShop|eJzLyyvOwwsA8coONA=='
+    sheet_name = 'InclusionShop'
+    requirement: int_t = RowData(0)
+    welcom: int_t = RowData(1)
+    name: str_t = RowData(2)
+    contents_shop_category: List[int_t] = ListData(ir((3, 30, 1)), RowData)
+
+
+class InclusionShopCategory(DataRow):
+    _sign = b'InclusionShopCategory|eJwrzssDAAKmAVA='
+    sheet_name = 'InclusionShopCategory'
+    _display = 'name'
+    name: str_t = RowData(0)
+    class_job_category: 'ClassJobCategory' = RowForeign(1, 'ClassJobCategory')
+    series: 'InclusionShopSeries' = RowForeign(2, 'InclusionShopSeries')
+
+
+class InclusionShopSeries(DataRow):
+    _sign = b'InclusionShopSeries|eJzLAwAAbwBv'
+    sheet_name = 'InclusionShopSeries'
+    _display = 'shop'
+    shop: 'SpecialShop' = RowForeign(0, 'SpecialShop')
+
+
+class InclusionShopWelcom(DataRow):
+    _sign = b'InclusionShopWelcom|eJzLy8sDAAKXAUs='
+    sheet_name = 'InclusionShopWelcom'
+    design: int_t = RowData(0)
+    text_title: int_t = RowData(1)
+    text_body: int_t = RowData(2)
+
+
+class InclusionShopWelcomText(DataRow):
+    _sign = b'InclusionShopWelcomText|eJwrBgAAdAB0'
+    sheet_name = 'InclusionShopWelcomText'
+    text: str_t = RowData(0)
+
+
+class IndividualWeather(DataRow):
+    _sign = b'IndividualWeather|eJzLy8MNAK6QDAk='
+    sheet_name = 'IndividualWeather'
+    param_weather: List[int_t] = ListData(ir((0, 7, 1)), RowData)
+    param_condition_type: List[int_t] = ListData(ir((7, 7, 1)), RowData)
+    param_param: List[List[int_t]] = ListData(ir(((14, 2, 7), 7, 1)), ListData, RowData)
+
+
+class InstanceContent(DataRow):
+    _sign = b'InstanceContent|eJzLy8tLywMDKEUESEOl0/IACWsdfw=='
+    sheet_name = 'InstanceContent'
+    type: 'InstanceContentType' = RowForeign(0, 'InstanceContentType')
+    reward_type: int_t = RowData(1)
+    time: int_t = RowData(2)
+    name: bool_t = RowData(3)
+    music: 'BGM' = RowForeign(4, 'BGM')
+    clear_music: 'BGM' = RowForeign(5, 'BGM')
+    start_cutscene: 'Cutscene' = RowForeign(6, 'Cutscene')
+    entrance_rect: int_t = RowData(7)
+    content_finder_condition: int_t = RowData(8)
+    colosseum: 'Colosseum' = RowForeign(9, 'Colosseum')
+    disable_complete_text: bool_t = RowData(10)
+    boss_message: 'List[InstanceContentTextData]' = ListData(ir((11, 2, 1)), RowForeign, 'InstanceContentTextData')
+    boss_name: 'BNpcBase' = RowForeign(13, 'BNpcBase')
+    content_text_start: 'InstanceContentTextData' = RowForeign(14, 'InstanceContentTextData')
+    content_text_end: 'InstanceContentTextData' = RowForeign(15, 'InstanceContentTextData')
+    sortkey: int_t = RowData(16)
+    reward_beginner_bonus_gil: int_t = RowData(17)
+    reward_beginner_bonus_exp: int_t = RowData(18)
+    reward_beginner_bonus_a: int_t = RowData(19)
+    reward_beginner_bonus_b: int_t = RowData(20)
+    reward_clear_exp: int_t = RowData(21)
+    reward_clear_bonus_exp: int_t = RowData(22)
+    reward_clear_a: int_t = RowData(23)
+    reward_clear_b: int_t = RowData(24)
+    reward_clear_c: int_t = RowData(25)
+    reward_middle_exp: List[int_t] = ListData(ir((26, 5, 1)), RowData)
+    reward_middle_a: List[int_t] = ListData(ir((31, 5, 1)), RowData)
+    reward_middle_b: List[int_t] = ListData(ir((36, 5, 1)), RowData)
+    reward_middle_c: List[int_t] = ListData(ir((41, 5, 1)), RowData)
+    reward_total_exp: int_t = RowData(46)
+    reward_total_gil: int_t = RowData(47)
+    reward_clear_item: 'InstanceContentRewardItem' = RowForeign(48, 'InstanceContentRewardItem')
+    reward_random_bonus_rate: int_t = RowData(49)
+    reward_index: int_t = RowData(50)
+    instance_buff: 'InstanceContentBuff' = RowForeign(51, 'InstanceContentBuff')
+    force_buff: bool_t = RowData(52)
+    open_flag_index: 'InstanceContent' = RowForeign(53, 'InstanceContent')
+    raid_progress: int_t = RowData(54)
+    ui_category: int_t = RowData(55)
+    qte: int_t = RowData(56)
+    qte2: int_t = RowData(57)
+    content_gauge: int_t = RowData(58)
+    content_attribute_rect: int_t = RowData(59)
+    link_dead_kill: bool_t = RowData(60)
+    data_index: int_t = RowData(61)
+    shared_group: int_t = RowData(62)
+    todo: int_t = RowData(63)
+    faith_content_buff: int_t = RowData(64)
+    tourism_construct: int_t = RowData(65)
+    common_content_flag: int_t = RowData(66)
+    battle_shared_group_action_clip: bool_t = RowData(67)
+    event_item: int_t = RowData(68)
+
+
+class InstanceContent(DataRow):
+    _sign = b'InstanceContent|eJzLy8tLywMDKEUESEOjAOvNHRE='
+    sheet_name = 'InstanceContent'
+    type: 'InstanceContentType' = RowForeign(0, 'InstanceContentType')
+    reward_type: int_t = RowData(1)
+    time: int_t = RowData(2)
+    name: bool_t = RowData(3)
+    music: 'BGM' = RowForeign(4, 'BGM')
+    clear_music: 'BGM' = RowForeign(5, 'BGM')
+    start_cutscene: 'Cutscene' = RowForeign(6, 'Cutscene')
+    entrance_rect: int_t = RowData(7)
+    content_finder_condition: int_t = RowData(8)
+    colosseum: 'Colosseum' = RowForeign(9, 'Colosseum')
+    disable_complete_text: bool_t = RowData(10)
+    boss_message: 'List[InstanceContentTextData]' = ListData(ir((11, 2, 1)), RowForeign, 'InstanceContentTextData')
+    boss_name: 'BNpcBase' = RowForeign(13, 'BNpcBase')
+    content_text_start: 'InstanceContentTextData' = RowForeign(14, 'InstanceContentTextData')
+    content_text_end: 'InstanceContentTextData' = RowForeign(15, 'InstanceContentTextData')
+    sortkey: int_t = RowData(16)
+    reward_beginner_bonus_gil: int_t = RowData(17)
+    reward_beginner_bonus_exp: int_t = RowData(18)
+    reward_beginner_bonus_a: int_t = RowData(19)
+    reward_beginner_bonus_b: int_t = RowData(20)
+    reward_clear_exp: int_t = RowData(21)
+    reward_clear_bonus_exp: int_t = RowData(22)
+    reward_clear_a: int_t = RowData(23)
+    reward_clear_b: int_t = RowData(24)
+    reward_clear_c: int_t = RowData(25)
+    reward_middle_exp: List[int_t] = ListData(ir((26, 5, 1)), RowData)
+    reward_middle_a: List[int_t] = ListData(ir((31, 5, 1)), RowData)
+    reward_middle_b: List[int_t] = ListData(ir((36, 5, 1)), RowData)
+    reward_middle_c: List[int_t] = ListData(ir((41, 5, 1)), RowData)
+    reward_total_exp: int_t = RowData(46)
+    reward_total_gil: int_t = RowData(47)
+    reward_clear_item: 'InstanceContentRewardItem' = RowForeign(48, 'InstanceContentRewardItem')
+    reward_random_bonus_rate: int_t = RowData(49)
+    reward_index: int_t = RowData(50)
+    instance_buff: 'InstanceContentBuff' = RowForeign(51, 'InstanceContentBuff')
+    force_buff: bool_t = RowData(52)
+    open_flag_index: 'InstanceContent' = RowForeign(53, 'InstanceContent')
+    raid_progress: int_t = RowData(54)
+    ui_category: int_t = RowData(55)
+    qte: int_t = RowData(56)
+    content_gauge: int_t = RowData(57)
+    content_attribute_rect: int_t = RowData(58)
+    link_dead_kill: bool_t = RowData(59)
+    data_index: int_t = RowData(60)
+    shared_group: int_t = RowData(61)
+    todo: int_t = RowData(62)
+    faith_content_buff: int_t = RowData(63)
+    tourism_construct: int_t = RowData(64)
+    common_content_flag: int_t = RowData(65)
+    battle_shared_group_action_clip: bool_t = RowData(66)
+    event_item: int_t = RowData(67)
+
+
+class InstanceContentBuff(DataRow):
+    _sign = b'InstanceContentBuff|eJzLywMAAUwA3Q=='
+    sheet_name = 'InstanceContentBuff'
+    param_base: int_t = RowData(0)
+    param_add: int_t = RowData(1)
+
+
+class InstanceContentCSBonus(DataRow):
+    _sign = b'InstanceContentCSBonus|eJzLywMCAAZ3Aic='
+    sheet_name = 'InstanceContentCSBonus'
+    instance: 'InstanceContent' = RowForeign(0, 'InstanceContent')
+    item: 'Item' = RowForeign(1, 'Item')
+    field_2: int_t = RowData(2)
+    field_3: int_t = RowData(3)
+    field_4: int_t = RowData(4)
+
+
+class InstanceContentGuide(DataRow):
+    _sign = b'InstanceContentGuide|eJzLywMAAUwA3Q=='
+    sheet_name = 'InstanceContentGuide'
+    instance_content: 'InstanceContent' = RowForeign(0, 'InstanceContent')
+    event_range: int_t = RowData(1)
+
+
+class InstanceContentQICData(DataRow):
+    _sign = b'InstanceContentQICData|eJzLSwMAAUQA1Q=='
+    sheet_name = 'InstanceContentQICData'
+    clear_wait: int_t = RowData(0)
+    hide_remain_time_flag: bool_t = RowData(1)
+
+
+class InstanceContentRewardItem(DataRow):
+    _sign = b'InstanceContentRewardItem|eJzLywMAAUwA3Q=='
+    sheet_name = 'InstanceContentRewardItem'
+    obtained_flag: List[int_t] = ListData(ir((0, 2, 1)), RowData)
+
+
+class InstanceContentTextData(DataRow):
+    _sign = b'InstanceContentTextData|eJwrBgAAdAB0'
+    sheet_name = 'InstanceContentTextData'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class InstanceContentType(DataRow):
+    _sign = b'InstanceContentType|eJxLy0vLSwMBABJnA6c='
+    sheet_name = 'InstanceContentType'
+    save_flag: bool_t = RowData(0)
+    open_flag: int_t = RowData(1)
+    dead_flag: bool_t = RowData(2)
+    start_log: int_t = RowData(3)
+    vote_kick: bool_t = RowData(4)
+    vote_give_up: bool_t = RowData(5)
+    mip: bool_t = RowData(6)
+    content_portrait: bool_t = RowData(7)
+    disable_portrait_open: bool_t = RowData(8)
+
+
+class InstanceContentType(DataRow):
+    _sign = b'InstanceContentType|eJxLy0vLSwMCAA7AA0E='
+    sheet_name = 'InstanceContentType'
+    save_flag: bool_t = RowData(0)
+    open_flag: int_t = RowData(1)
+    dead_flag: bool_t = RowData(2)
+    start_log: int_t = RowData(3)
+    vote_kick: bool_t = RowData(4)
+    vote_give_up: bool_t = RowData(5)
+    mip: bool_t = RowData(6)
+    content_portrait: bool_t = RowData(7)
+
+
+class Item(DataRow):
+    _sign = b'Item|eJwrzivOA4FiCAUBaUAAJuH8PBIBUEcaAPwOJs8='
+    sheet_name = 'Item'
+    _display = 'text_ui_name'
+    text_sgl: str_t = RowData(0)
+    text_sgg: int_t = RowData(1)
+    text_plr: str_t = RowData(2)
+    text_plg: int_t = RowData(3)
+    text_vow: int_t = RowData(4)
+    text_cnt: int_t = RowData(5)
+    text_gen: int_t = RowData(6)
+    text_def_: int_t = RowData(7)
+    text_help: str_t = RowData(8)
+    text_ui_name: str_t = RowData(9)
+    icon: 'Icon' = IconRow(10)
+    level: 'ItemLevel' = RowForeign(11, 'ItemLevel')
+    rarity: int_t = RowData(12)
+    category: int_t = RowData(13)
+    category_arg: 'Stain|TreasureHuntRank|GardeningSeed|AetherialWheel|CompanyAction|TripleTriadCard|AirshipExplorationPart|Orchestrion|SubmarinePart' = DynamicForeign(14, ComplexSheetKey('category', (15, 'Stain'), (18, 'TreasureHuntRank'), (20, 'GardeningSeed'), (25, 'AetherialWheel'), (26, 'CompanyAction'), (27, 'TripleTriadCard'), (28, 'AirshipExplorationPart'), (32, 'Orchestrion'), (36, 'SubmarinePart')))
+    ui_category: 'ItemUICategory' = RowForeign(15, 'ItemUICategory')
+    search_category: 'ItemSearchCategory' = RowForeign(16, 'ItemSearchCategory')
+    slot: 'EquipSlotCategory' = RowForeign(17, 'EquipSlotCategory')
+    sort_category: 'ItemSortCategory' = RowForeign(18, 'ItemSortCategory')
+    sort_id: int_t = RowData(19)
+    stack_max: int_t = RowData(20)
+    only_one: bool_t = RowData(21)
+    disable_passed_others: bool_t = RowData(22)
+    disable_abandon: bool_t = RowData(23)
+    lot: bool_t = RowData(24)
+    price: int_t = RowData(25)
+    sell_price: int_t = RowData(26)
+    hq: bool_t = RowData(27)
+    stain: bool_t = RowData(28)
+    crest: bool_t = RowData(29)
+    action: 'ItemAction' = RowForeign(30, 'ItemAction')
+    cast_time: int_t = RowData(31)
+    recast_time: int_t = RowData(32)
+    repair: 'ClassJob' = RowForeign(33, 'ClassJob')
+    repair_item: 'ItemRepairResource' = RowForeign(34, 'ItemRepairResource')
+    mirage_item: 'Item' = RowForeign(35, 'Item')
+    desynthesis: int_t = RowData(36)
+    masterpiece: bool_t = RowData(37)
+    force_craft_masterpiece: bool_t = RowData(38)
+    gatherer_reduction: int_t = RowData(39)
+    equip_item_equip_level: int_t = RowData(40)
+    equip_item_equip_pvp_rank: int_t = RowData(41)
+    equip_item_cond_race: int_t = RowData(42)
+    equip_item_cond_class_job: 'ClassJobCategory' = RowForeign(43, 'ClassJobCategory')
+    equip_item_cond_grand_company: 'GrandCompany' = RowForeign(44, 'GrandCompany')
+    equip_item_series: 'ItemSeries' = RowForeign(45, 'ItemSeries')
+    equip_item_role: int_t = RowData(46)
+    equip_item_model_id: int_t = RowData(47)
+    equip_item_sub_model_id: int_t = RowData(48)
+    equip_item_class_: 'ClassJob' = RowForeign(49, 'ClassJob')
+    equip_item_attack_type: int_t = RowData(50)
+    equip_item_damage: int_t = RowData(51)
+    equip_item_magic_damage: int_t = RowData(52)
+    equip_item_attack_interval: int_t = RowData(53)
+    equip_item_attack_range: int_t = RowData(54)
+    equip_item_shield_rate: int_t = RowData(55)
+    equip_item_shield_block_rate: int_t = RowData(56)
+    equip_item_defense: int_t = RowData(57)
+    equip_item_magic_defense: int_t = RowData(58)
+    equip_item_bonus_type: List[int_t] = ListData(ir((59, 6, 2)), RowData)
+    equip_item_bonus_value: List[int_t] = ListData(ir((60, 6, 2)), RowData)
+    equip_item_special_bonus: 'ItemSpecialBonus' = RowForeign(71, 'ItemSpecialBonus')
+    equip_item_special_bonus_arg: int_t = RowData(72)
+    equip_item_special_bonus_type: List[int_t] = ListData(ir((73, 6, 2)), RowData)
+    equip_item_special_bonus_value: List[int_t] = ListData(ir((74, 6, 2)), RowData)
+    equip_item_materialize_type: int_t = RowData(85)
+    equip_item_materia_socket: int_t = RowData(86)
+    equip_item_materia_prohibition: bool_t = RowData(87)
+    equip_item_materia_effect_only_in_pvp: bool_t = RowData(88)
+    equip_item_item_level_sync_type: int_t = RowData(89)
+    equip_item_prism_convert: bool_t = RowData(90)
+
+
+class ItemAction(DataRow):
+    _sign = b'ItemAction|eJzLS0tLy8MEAHS3Ccs='
+    sheet_name = 'ItemAction'
+    cond_lv: int_t = RowData(0)
+    cond_battle: bool_t = RowData(1)
+    cond_pvp: bool_t = RowData(2)
+    cond_pvp_only: bool_t = RowData(3)
+    action: 'Action' = RowForeign(4, 'Action')
+    calcu0_arg: List[int_t] = ListData(ir((5, 3, 1)), RowData)
+    calcu1_arg: List[int_t] = ListData(ir((8, 3, 1)), RowData)
+    calcu2_arg: List[int_t] = ListData(ir((11, 3, 1)), RowData)
+    hq_calcu0_arg: List[int_t] = ListData(ir((14, 3, 1)), RowData)
+    hq_calcu1_arg: List[int_t] = ListData(ir((17, 3, 1)), RowData)
+    hq_calcu2_arg: List[int_t] = ListData(ir((20, 3, 1)), RowData)
+
+
+class ItemActionTelepo(DataRow):
+    _sign = b'ItemActionTelepo|eJzLywMAAUwA3Q=='
+    sheet_name = 'ItemActionTelepo'
+    _display = 'use_cond_arg'
+    use_cond_arg: int_t = RowData(0)
+    error_log_message: 'LogMessage' = RowForeign(1, 'LogMessage')
+
+
+class ItemBarterCheck(DataRow):
+    _sign = b'ItemBarterCheck|eJzLy8sDAAKXAUs='
+    sheet_name = 'ItemBarterCheck'
+    item_barter_check_type: 'AddonTransient' = RowForeign(0, 'AddonTransient')
+    message: int_t = RowData(1)
+    sub_message: 'Addon' = RowForeign(2, 'Addon')
+
+
+class ItemFood(DataRow):
+    _sign = b'ItemFood|eJzLy0vKAwEkEgBQKwgH'
+    sheet_name = 'ItemFood'
+    exp: int_t = RowData(0)
+    param: List[int_t] = ListData(ir((1, 3, 6)), RowData)
+    rate: List[bool_t] = ListData(ir((2, 3, 6)), RowData)
+    value: List[int_t] = ListData(ir((3, 3, 6)), RowData)
+    limit: List[int_t] = ListData(ir((4, 3, 6)), RowData)
+    value_hq: List[int_t] = ListData(ir((5, 3, 6)), RowData)
+    limit_hq: List[int_t] = ListData(ir((6, 3, 6)), RowData)
+
+
+class ItemLevel(DataRow):
+    _sign = b'ItemLevel|eJzLy6MWAACo6B/N'
+    sheet_name = 'ItemLevel'
+    base_param: List[int_t] = ListData(ir((0, 74, 1)), RowData)
+
+
+class ItemOnceHqMasterpiece(DataRow):
+    _sign = b'ItemOnceHqMasterpiece|eJxLSwMAATQAzQ=='
+    sheet_name = 'ItemOnceHqMasterpiece'
+    hq: bool_t = RowData(0)
+    masterpiece: bool_t = RowData(1)
+
+
+class ItemRepairPrice(DataRow):
+    _sign = b'ItemRepairPrice|eJzLAwAAbwBv'
+    sheet_name = 'ItemRepairPrice'
+    price: int_t = RowData(0)
+
+
+class ItemRepairResource(DataRow):
+    _sign = b'ItemRepairResource|eJzLAwAAbwBv'
+    sheet_name = 'ItemRepairResource'
+    item: 'Item' = RowForeign(0, 'Item')
+
+
+class ItemRetainerLevelUp(DataRow):
+    _sign = b'ItemRetainerLevelUp|eJzLywMAAUwA3Q=='
+    sheet_name = 'ItemRetainerLevelUp'
+    item: int_t = RowData(0)
+    level: int_t = RowData(1)
+
+
+class ItemSearchCategory(DataRow):
+    _sign = b'ItemSearchCategory|eJwrzgOCNAAJIgKS'
+    sheet_name = 'ItemSearchCategory'
+    _display = 'text'
+    text: str_t = RowData(0)
+    icon: 'Icon' = IconRow(1)
+    block: int_t = RowData(2)
+    display_order: int_t = RowData(3)
+    class_level: 'ClassJob' = RowForeign(4, 'ClassJob')
+    is_enable_acquire: bool_t = RowData(5)
+
+
+class ItemSeries(DataRow):
+    _sign = b'ItemSeries|eJwrBgAAdAB0'
+    sheet_name = 'ItemSeries'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class ItemSortCategory(DataRow):
+    _sign = b'ItemSortCategory|eJzLAwAAbwBv'
+    sheet_name = 'ItemSortCategory'
+    _display = 'sort_id'
+    sort_id: int_t = RowData(0)
+
+
+class ItemSpecialBonus(DataRow):
+    _sign = b'ItemSpecialBonus|eJwrBgAAdAB0'
+    sheet_name = 'ItemSpecialBonus'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class ItemStainCondition(DataRow):
+    _sign = b'ItemStainCondition|eJzLAwAAbwBv'
+    sheet_name = 'ItemStainCondition'
+    quest: int_t = RowData(0)
+
+
+class ItemUICategory(DataRow):
+    _sign = b'ItemUICategory|eJwrzsvLAwAEZAG+'
+    sheet_name = 'ItemUICategory'
+    _display = 'text'
+    text: str_t = RowData(0)
+    icon: 'Icon' = IconRow(1)
+    priority: int_t = RowData(2)
+    kind: int_t = RowData(3)
@@ -0,0 +1,1020 @@
+# generated with the modules of this package, sheet name to the module defining its row types
+sheet_modules = {
+    'AOZArrangement': '_a',
+    'AOZBoss': '_a',
+    'AOZContent': '_a',
+    'AOZContentBriefingBNpc': '_a',
+    'AOZContentBriefingObject': '_a',
+    'AOZReport': '_a',
+    'AOZReportReward': '_a',
+    'AOZScore': '_a',
+    'AOZWeeklyReward': '_a',
+    'Achievement': '_a',
+    'AchievementCategory': '_a',
+    'AchievementHideCondition': '_a',
+    'AchievementKind': '_a',
+    'AchievementTarget': '_a',
+    'Action': '_a',
+    'ActionCastTimeline': '_a',
+    'ActionCastVFX': '_a',
+    'ActionCategory': '_a',
+    'ActionComboRoute': '_a',
+    'ActionComboRouteTransient': '_a',
+    'ActionCostType': '_a',
+    'ActionIndirection': '_a',
+    'ActionInit': '_a',
+    'ActionParam': '_a',
+    'ActionProcStatus': '_a',
+    'ActionTimeline': '_a',
+    'ActionTimelineMove': '_a',
+    'ActionTimelineReplace': '_a',
+    'ActionTransient': '_a',
+    'ActivityFeedButtons': '_a',
+    'ActivityFeedCaptions': '_a',
+    'ActivityFeedGroupCaptions': '_a',
+    'ActivityFeedImages': '_a',
+    'Addon': '_a',
+    'AddonHudSize': '_a',
+    'AddonLayout': '_a',
+    'AddonParam': '_a',
+    'AddonTalkParam': '_a',
+    'AddonTransient': '_a',
+    'AdvancedVibration': '_a',
+    'Adventure': '_a',
+    'AdventureExPhase': '_a',
+    'AetherCurrent': '_a',
+    'AetherCurrentCompFlgSet': '_a',
+    'AetherialWheel': '_a',
+    'Aetheryte': '_a',
+    'AetheryteSystemDefine': '_a',
+    'AetheryteTransient': '_a',
+    'AirshipExplorationLevel': '_a',
+    'AirshipExplorationLog': '_a',
+    'AirshipExplorationParamType': '_a',
+    'AirshipExplorationPart': '_a',
+    'AirshipExplorationPoint': '_a',
+    'AirshipSkyIsland': '_a',
+    'AkatsukiNote': '_a',
+    'AkatsukiNoteString': '_a',
+    'AnimaWeapon5': '_a',
+    'AnimaWeapon5Param': '_a',
+    'AnimaWeapon5PatternGroup': '_a',
+    'AnimaWeapon5SpiritTalk': '_a',
+    'AnimaWeapon5SpiritTalkParam': '_a',
+    'AnimaWeapon5SpiritTalkType': '_a',
+    'AnimaWeapon5TradeItem': '_a',
+    'AnimaWeaponFUITalk': '_a',
+    'AnimaWeaponFUITalkParam': '_a',
+    'AnimaWeaponIcon': '_a',
+    'AnimaWeaponItem': '_a',
+    'AnimationLOD': '_a',
+    'AozAction': '_a',
+    'AozActionTransient': '_a',
+    'AquariumFish': '_a',
+    'AquariumWater': '_a',
+    'ArchiveItem': '_a',
+    'ArrayEventHandler': '_a',
+    'AttackType': '_a',
+    'Attract': '_a',
+    'Attributive': '_a',
+    'BGM': '_b',
+    'BGMFade': '_b',
+    'BGMFadeType': '_b',
+    'BGMScene': '_b',
+    'BGMSituation': '_b',
+    'BGMSwitch': '_b',
+    'BGMSystemDefine': '_b',
+    'BKJEObj': '_b',
+    'BKJLivestock': '_b',
+    'BKJPouch': '_b',
+    'BKJSeed': '_b',
+    'BKJShipment': '_b',
+    'BKJSpecialtyGoods': '_b',
+    'BNpcAnnounceIcon': '_b',
+    'BNpcBase': '_b',
+    'BNpcBasePopVfx': '_b',
+    'BNpcCustomize': '_b',
+    'BNpcName': '_b',
+    'BNpcParts': '_b',
+    'BNpcState': '_b',
+    'BacklightColor': '_b',
+    'Ballista': '_b',
+    'Balloon': '_b',
+    'BannerBg': '_b',
+    'BannerCondition': '_b',
+    'BannerDecoration': '_b',
+    'BannerDesignPreset': '_b',
+    'BannerFacial': '_b',
+    'BannerFrame': '_b',
+    'BannerObtainHintType': '_b',
+    'BannerPreset': '_b',
+    'BannerTimeline': '_b',
+    'BaseParam': '_b',
+    'Battalion': '_b',
+    'BattleLeve': '_b',
+    'BattleLeveRule': '_b',
+    'BeastRankBonus': '_b',
+    'BeastReputationRank': '_b',
+    'BeastTribe': '_b',
+    'Behavior': '_b',
+    'BehaviorMove': '_b',
+    'BehaviorPath': '_b',
+    'BenchmarkCutSceneTable': '_b',
+    'BenchmarkOverrideEquipment': '_b',
+    'BgcArmyAction': '_b',
+    'BgcArmyActionTransient': '_b',
+    'Booster': '_b',
+    'Buddy': '_b',
+    'BuddyAction': '_b',
+    'BuddyEquip': '_b',
+    'BuddyItem': '_b',
+    'BuddyRank': '_b',
+    'BuddySkill': '_b',
+    'CSBonusContent': '_c',
+    'CSBonusContentIdentifier': '_c',
+    'CSBonusContentType': '_c',
+    'CSBonusMission': '_c',
+    'CSBonusMissionType': '_c',
+    'CSBonusSeason': '_c',
+    'CSBonusTextData': '_c',
+    'Cabinet': '_c',
+    'CabinetCategory': '_c',
+    'Calendar': '_c',
+    'Carry': '_c',
+    'Channeling': '_c',
+    'CharaCardBase': '_c',
+    'CharaCardDecoration': '_c',
+    'CharaCardDesignCategory': '_c',
+    'CharaCardDesignPreset': '_c',
+    'CharaCardDesignType': '_c',
+    'CharaCardHeader': '_c',
+    'CharaCardPlayStyle': '_c',
+    'CharaMakeClassEquip': '_c',
+    'CharaMakeCustomize': '_c',
+    'CharaMakeName': '_c',
+    'CharaMakeType': '_c',
+    'ChocoboRace': '_c',
+    'ChocoboRaceAbility': '_c',
+    'ChocoboRaceAbilityType': '_c',
+    'ChocoboRaceCalculateParam': '_c',
+    'ChocoboRaceChallenge': '_c',
+    'ChocoboRaceItem': '_c',
+    'ChocoboRaceRank': '_c',
+    'ChocoboRaceRanking': '_c',
+    'ChocoboRaceStatus': '_c',
+    'ChocoboRaceTerritory': '_c',
+    'ChocoboRaceTutorial': '_c',
+    'ChocoboRaceWeather': '_c',
+    'ChocoboTaxi': '_c',
+    'ChocoboTaxiStand': '_c',
+    'CircleActivity': '_c',
+    'ClassJob': '_c',
+    'ClassJobActionSort': '_c',
+    'ClassJobCategory': '_c',
+    'ClassJobResident': '_c',
+    'CollectablesShop': '_c',
+    'CollectablesShopItem': '_c',
+    'CollectablesShopItemGroup': '_c',
+    'CollectablesShopRefine': '_c',
+    'CollectablesShopRewardItem': '_c',
+    'CollectablesShopRewardScrip': '_c',
+    'CollisionIdPallet': '_c',
+    'ColorFilter': '_c',
+    'Colosseum': '_c',
+    'ColosseumMatchRank': '_c',
+    'Companion': '_c',
+    'CompanionMove': '_c',
+    'CompanionTransient': '_c',
+    'CompanyAction': '_c',
+    'CompanyCraftDraft': '_c',
+    'CompanyCraftDraftCategory': '_c',
+    'CompanyCraftManufactoryState': '_c',
+    'CompanyCraftPart': '_c',
+    'CompanyCraftProcess': '_c',
+    'CompanyCraftSequence': '_c',
+    'CompanyCraftSupplyItem': '_c',
+    'CompanyCraftType': '_c',
+    'CompanyLeve': '_c',
+    'CompanyLeveRule': '_c',
+    'CompleteJournal': '_c',
+    'CompleteJournalCategory': '_c',
+    'Completion': '_c',
+    'Condition': '_c',
+    'ConfigKey': '_c',
+    'ContentAttributeRect': '_c',
+    'ContentCloseCycle': '_c',
+    'ContentDirectorManagedSG': '_c',
+    'ContentEffectiveTime': '_c',
+    'ContentEntry': '_c',
+    'ContentEventItem': '_c',
+    'ContentExAction': '_c',
+    'ContentFinderCondition': '_c',
+    'ContentFinderConditionTransient': '_c',
+    'ContentFinderParamTable': '_c',
+    'ContentGauge': '_c',
+    'ContentGaugeColor': '_c',
+    'ContentMemberType': '_c',
+    'ContentNpc': '_c',
+    'ContentNpcTalk': '_c',
+    'ContentRandomSelect': '_c',
+    'ContentRewardCondition': '_c',
+    'ContentRoulette': '_c',
+    'ContentRouletteOpenRule': '_c',
+    'ContentRouletteRoleBonus': '_c',
+    'ContentTalk': '_c',
+    'ContentTalkParam': '_c',
+    'ContentTodo': '_c',
+    'ContentTourismConstruct': '_c',
+    'ContentType': '_c',
+    'ContentUICategory': '_c',
+    'ContentsNote': '_c',
+    'ContentsNoteCategory': '_c',
+    'ContentsNoteLevel': '_c',
+    'ContentsNoteRewardEurekaEXP': '_c',
+    'ContentsTutorial': '_c',
+    'ContentsTutorialPage': '_c',
+    'CraftAction': '_c',
+    'CraftLeve': '_c',
+    'CraftLeveTalk': '_c',
+    'CraftLevelDifference': '_c',
+    'CraftType': '_c',
+    'Credit': '_c',
+    'CreditBackImage': '_c',
+    'CreditCast': '_c',
+    'CreditDataSet': '_c',
+    'CreditFont': '_c',
+    'CreditList': '_c',
+    'CreditListText': '_c',
+    'CreditVersion': '_c',
+    'CurrencyScripConvert': '_c',
+    'CustomTalk': '_c',
+    'CustomTalkDefineClient': '_c',
+    'CustomTalkNestHandlers': '_c',
+    'CustomTalkResident': '_c',
+    'CutActionTimeline': '_c',
+    'CutSceneIncompQuest': '_c',
+    'CutScreenImage': '_c',
+    'Cutscene': '_c',
+    'CutsceneActorSize': '_c',
+    'CutsceneEventMotion': '_c',
+    'CutsceneMotion': '_c',
+    'CutsceneName': '_c',
+    'CutsceneWorkIndex': '_c',
+    'CycleTime': '_c',
+    'DailySupplyItem': '_d',
+    'DawnContent': '_d',
+    'DawnContentParticipable': '_d',
+    'DawnGrowMember': '_d',
+    'DawnMember': '_d',
+    'DawnMemberUIParam': '_d',
+    'DawnQuestMember': '_d',
+    'DeepDungeon': '_d',
+    'DeepDungeonBan': '_d',
+    'DeepDungeonDanger': '_d',
+    'DeepDungeonDemiclone': '_d',
+    'DeepDungeonEquipment': '_d',
+    'DeepDungeonFloorEffectUI': '_d',
+    'DeepDungeonGrowData': '_d',
+    'DeepDungeonItem': '_d',
+    'DeepDungeonLayer': '_d',
+    'DeepDungeonMagicStone': '_d',
+    'DeepDungeonMap5X': '_d',
+    'DeepDungeonRoom': '_d',
+    'DeepDungeonStatus': '_d',
+    'DefaultTalk': '_d',
+    'DefaultTalkLipSyncType': '_d',
+    'DeliveryQuest': '_d',
+    'Description': '_d',
+    'DescriptionPage': '_d',
+    'DescriptionSection': '_d',
+    'DescriptionStandAlone': '_d',
+    'DescriptionStandAloneTransient': '_d',
+    'DescriptionString': '_d',
+    'DirectorSystemDefine': '_d',
+    'DirectorType': '_d',
+    'DisposalShop': '_d',
+    'DisposalShopFilterType': '_d',
+    'DisposalShopItem': '_d',
+    'DomaStoryProgress': '_d',
+    'DpsChallenge': '_d',
+    'DpsChallengeOfficer': '_d',
+    'DpsChallengeTransient': '_d',
+    'DynamicEvent': '_d',
+    'DynamicEventEnemyType': '_d',
+    'DynamicEventManager': '_d',
+    'DynamicEventSet': '_d',
+    'DynamicEventSingleBattle': '_d',
+    'DynamicEventType': '_d',
+    'ENpcBase': '_e',
+    'ENpcDressUp': '_e',
+    'ENpcDressUpDress': '_e',
+    'ENpcResident': '_e',
+    'EObj': '_e',
+    'EObjName': '_e',
+    'EmjAddon': '_e',
+    'EmjCharaViewCamera': '_e',
+    'EmjDani': '_e',
+    'Emote': '_e',
+    'EmoteCategory': '_e',
+    'EmoteMode': '_e',
+    'EmoteTransient': '_e',
+    'EquipRaceCategory': '_e',
+    'EquipSlotCategory': '_e',
+    'Error': '_e',
+    'Eureka': '_e',
+    'EurekaAetherItem': '_e',
+    'EurekaAethernet': '_e',
+    'EurekaDungeonPortal': '_e',
+    'EurekaGrowData': '_e',
+    'EurekaLogosMixerProbability': '_e',
+    'EurekaMagiaAction': '_e',
+    'EurekaMagiciteItem': '_e',
+    'EurekaMagiciteItemType': '_e',
+    'EurekaSphereElementAdjust': '_e',
+    'EurekaStoryProgress': '_e',
+    'EventAction': '_e',
+    'EventCustomIconType': '_e',
+    'EventIconPriority': '_e',
+    'EventIconPriorityPair': '_e',
+    'EventIconType': '_e',
+    'EventItem': '_e',
+    'EventItemCastTimeline': '_e',
+    'EventItemCategory': '_e',
+    'EventItemHelp': '_e',
+    'EventItemTimeline': '_e',
+    'EventPathMove': '_e',
+    'EventSituationIconTooltip': '_e',
+    'EventSystemDefine': '_e',
+    'EventVfx': '_e',
+    'ExHotbarCrossbarIndexType': '_e',
+    'ExVersion': '_e',
+    'ExportedGatheringPoint': '_e',
+    'ExportedSG': '_e',
+    'ExtraCommand': '_e',
+    'FCActivity': '_f',
+    'FCActivityCategory': '_f',
+    'FCAuthority': '_f',
+    'FCAuthorityCategory': '_f',
+    'FCChestName': '_f',
+    'FCCrestSymbol': '_f',
+    'FCDefine': '_f',
+    'FCHierarchy': '_f',
+    'FCProfile': '_f',
+    'FCRank': '_f',
+    'FCReputation': '_f',
+    'FCRights': '_f',
+    'FGSAddon': '_f',
+    'FGSStageUI': '_f',
+    'FashionCheckThemeCategory': '_f',
+    'FashionCheckWeeklyTheme': '_f',
+    'Fate': '_f',
+    'FateEvent': '_f',
+    'FateMode': '_f',
+    'FateProgressUI': '_f',
+    'FateRuleEx': '_f',
+    'FateShop': '_f',
+    'FateTokenType': '_f',
+    'FccShop': '_f',
+    'Festival': '_f',
+    'FieldMarker': '_f',
+    'FishParameter': '_f',
+    'FishParameterReverse': '_f',
+    'FishingBaitParameter': '_f',
+    'FishingNoteInfo': '_f',
+    'FishingRecordType': '_f',
+    'FishingRecordTypeTransient': '_f',
+    'FishingSpot': '_f',
+    'FittingShop': '_f',
+    'FittingShopCategory': '_f',
+    'FittingShopCategoryItem': '_f',
+    'FittingShopItemSet': '_f',
+    'Frontline': '_f',
+    'Frontline01': '_f',
+    'Frontline02': '_f',
+    'Frontline03': '_f',
+    'Frontline04': '_f',
+    'FurnitureCatalogCategory': '_f',
+    'FurnitureCatalogItemList': '_f',
+    'GCRankGridaniaFemaleText': '_g',
+    'GCRankGridaniaMaleText': '_g',
+    'GCRankLimsaFemaleText': '_g',
+    'GCRankLimsaMaleText': '_g',
+    'GCRankUldahFemaleText': '_g',
+    'GCRankUldahMaleText': '_g',
+    'GCScripShopCategory': '_g',
+    'GCScripShopItem': '_g',
+    'GCShop': '_g',
+    'GCShopItemCategory': '_g',
+    'GCSupplyDefine': '_g',
+    'GCSupplyDuty': '_g',
+    'GCSupplyDutyReward': '_g',
+    'GFATE': '_g',
+    'GFateClimbing': '_g',
+    'GFateClimbing2': '_g',
+    'GFateClimbing2Content': '_g',
+    'GFateClimbing2TotemType': '_g',
+    'GFateDance': '_g',
+    'GFateHiddenObject': '_g',
+    'GFateRideShooting': '_g',
+    'GFateRoulette': '_g',
+    'GFateStelth': '_g',
+    'GFateType': '_g',
+    'GameRewardObtainType': '_g',
+    'GardeningSeed': '_g',
+    'GathererCrafterTool': '_g',
+    'GathererReductionReward': '_g',
+    'GatheringCondition': '_g',
+    'GatheringExp': '_g',
+    'GatheringItem': '_g',
+    'GatheringItemLevelConvertTable': '_g',
+    'GatheringItemPoint': '_g',
+    'GatheringLeve': '_g',
+    'GatheringLeveBNpcEntry': '_g',
+    'GatheringLeveRoute': '_g',
+    'GatheringLeveRule': '_g',
+    'GatheringNotebookItem': '_g',
+    'GatheringNotebookList': '_g',
+    'GatheringPoint': '_g',
+    'GatheringPointBase': '_g',
+    'GatheringPointBonus': '_g',
+    'GatheringPointBonusType': '_g',
+    'GatheringPointName': '_g',
+    'GatheringPointTransient': '_g',
+    'GatheringRarePopTimeTable': '_g',
+    'GatheringSubCategory': '_g',
+    'GatheringType': '_g',
+    'GcArmyCandidateCategory': '_g',
+    'GcArmyCapture': '_g',
+    'GcArmyCaptureTactics': '_g',
+    'GcArmyEquipPreset': '_g',
+    'GcArmyExpedition': '_g',
+    'GcArmyExpeditionMemberBonus': '_g',
+    'GcArmyExpeditionTrait': '_g',
+    'GcArmyExpeditionTraitCond': '_g',
+    'GcArmyExpeditionType': '_g',
+    'GcArmyMember': '_g',
+    'GcArmyMemberGrow': '_g',
+    'GcArmyMemberGrowExp': '_g',
+    'GcArmyProgress': '_g',
+    'GcArmyTraining': '_g',
+    'GeneralAction': '_g',
+    'GilShop': '_g',
+    'GilShopInfo': '_g',
+    'GilShopItem': '_g',
+    'GimmickAccessor': '_g',
+    'GimmickBill': '_g',
+    'GimmickJump': '_g',
+    'GimmickRect': '_g',
+    'GimmickTalk': '_g',
+    'GimmickYesNo': '_g',
+    'GoldSaucerArcadeMachine': '_g',
+    'GoldSaucerContent': '_g',
+    'GoldSaucerTalk': '_g',
+    'GoldSaucerTextData': '_g',
+    'GrandCompany': '_g',
+    'GrandCompanyRank': '_g',
+    'GroupPoseCharaStatus': '_g',
+    'GroupPoseCharacterShowPreset': '_g',
+    'GroupPoseFrame': '_g',
+    'GroupPoseStamp': '_g',
+    'GroupPoseStampCategory': '_g',
+    'GroupPoseStampFontColor': '_g',
+    'GuardianDeity': '_g',
+    'Guide': '_g',
+    'GuidePage': '_g',
+    'GuidePageString': '_g',
+    'GuideTitle': '_g',
+    'GuildOrder': '_g',
+    'GuildOrderGuide': '_g',
+    'GuildOrderOfficer': '_g',
+    'GuildleveAssignment': '_g',
+    'GuildleveAssignmentCategory': '_g',
+    'GuildleveAssignmentTalk': '_g',
+    'GuildleveEvaluation': '_g',
+    'HWDAnnounce': '_h',
+    'HWDCrafterSupply': '_h',
+    'HWDCrafterSupplyReward': '_h',
+    'HWDCrafterSupplyTerm': '_h',
+    'HWDDevLayerControl': '_h',
+    'HWDDevLevelUI': '_h',
+    'HWDDevLevelWebText': '_h',
+    'HWDDevLively': '_h',
+    'HWDDevProgress': '_h',
+    'HWDGathereInspectTerm': '_h',
+    'HWDGathererInspection': '_h',
+    'HWDGathererInspectionReward': '_h',
+    'HWDInfoBoardArticle': '_h',
+    'HWDInfoBoardArticleTransient': '_h',
+    'HWDInfoBoardArticleType': '_h',
+    'HWDInfoBoardBackNumber': '_h',
+    'HWDLevelChangeDeception': '_h',
+    'HWDSharedGroup': '_h',
+    'HWDSharedGroupControlParam': '_h',
+    'HairMakeType': '_h',
+    'HouseRetainerPose': '_h',
+    'HousingAethernet': '_h',
+    'HousingAppeal': '_h',
+    'HousingEmploymentNpcList': '_h',
+    'HousingEmploymentNpcRace': '_h',
+    'HousingExterior': '_h',
+    'HousingFurniture': '_h',
+    'HousingInterior': '_h',
+    'HousingLandSet': '_h',
+    'HousingMapMarkerInfo': '_h',
+    'HousingMateAuthority': '_h',
+    'HousingMerchantPose': '_h',
+    'HousingPileLimit': '_h',
+    'HousingPlacement': '_h',
+    'HousingPreset': '_h',
+    'HousingTrainingDoll': '_h',
+    'HousingUnitedExterior': '_h',
+    'HousingUnplacement': '_h',
+    'HousingYardObject': '_h',
+    'HowTo': '_h',
+    'HowToCategory': '_h',
+    'HowToPage': '_h',
+    'Hud': '_h',
+    'HudTransient': '_h',
+    'HugeCraftworksNpc': '_h',
+    'HugeCraftworksRank': '_h',
+    'IKDContentBonus': '_i',
+    'IKDFishParam': '_i',
+    'IKDPlayerMissionCondition': '_i',
+    'IKDRoute': '_i',
+    'IKDRouteTable': '_i',
+    'IKDSpot': '_i',
+    'IKDTimeDefine': '_i',
+    'IconLanguage': '_i',
+    'InclusionShop': '_i',
+    'InclusionShopCategory': '_i',
+    'InclusionShopSeries': '_i',
+    'InclusionShopWelcom': '_i',
+    'InclusionShopWelcomText': '_i',
+    'IndividualWeather': '_i',
+    'InstanceContent': '_i',
+    'InstanceContentBuff': '_i',
+    'InstanceContentCSBonus': '_i',
+    'InstanceContentGuide': '_i',
+    'InstanceContentQICData': '_i',
+    'InstanceContentRewardItem': '_i',
+    'InstanceContentTextData': '_i',
+    'InstanceContentType': '_i',
+    'Item': '_i',
+    'ItemAction': '_i',
+    'ItemActionTelepo': '_i',
+    'ItemBarterCheck': '_i',
+    'ItemFood': '_i',
+    'ItemLevel': '_i',
+    'ItemOnceHqMasterpiece': '_i',
+    'ItemRepairPrice': '_i',
+    'ItemRepairResource': '_i',
+    'ItemRetainerLevelUp': '_i',
+    'ItemSearchCategory': '_i',
+    'ItemSeries': '_i',
+    'ItemSortCategory': '_i',
+    'ItemSpecialBonus': '_i',
+    'ItemStainCondition': '_i',
+    'ItemUICategory': '_i',
+    'JigsawScore': '_j',
+    'JigsawTimeBonus': '_j',
+    'Jingle': '_j',
+    'JobHudManual': '_j',
+    'JobHudManualPriority': '_j',
+    'JournalCategory': '_j',
+    'JournalGenre': '_j',
+    'JournalSection': '_j',
+    'KineDriverOffGroup': '_k',
+    'Knockback': '_k',
+    'LFGExtensionContent': '_l',
+    'LegacyQuest': '_l',
+    'Leve': '_l',
+    'LeveAssignmentType': '_l',
+    'LeveClient': '_l',
+    'LeveRewardItem': '_l',
+    'LeveRewardItemGroup': '_l',
+    'LeveString': '_l',
+    'LeveSystemDefine': '_l',
+    'LeveVfx': '_l',
+    'Level': '_l',
+    'LinkRace': '_l',
+    'LoadingImage': '_l',
+    'LoadingTips': '_l',
+    'LoadingTipsSub': '_l',
+    'Lobby': '_l',
+    'Lockon': '_l',
+    'LogFilter': '_l',
+    'LogKind': '_l',
+    'LogMessage': '_l',
+    'LootModeType': '_l',
+    'LotteryExchangeShop': '_l',
+    'MJIAnimals': '_m',
+    'MJIBuilding': '_m',
+    'MJIBuildingPlace': '_m',
+    'MJICraftworksObject': '_m',
+    'MJICraftworksObjectTheme': '_m',
+    'MJICraftworksPopularity': '_m',
+    'MJICraftworksPopularityType': '_m',
+    'MJICraftworksRankRatio': '_m',
+    'MJICraftworksSupplyDefine': '_m',
+    'MJICraftworksTension': '_m',
+    'MJICropSeed': '_m',
+    'MJIDisposalShopItem': '_m',
+    'MJIDisposalShopUICategory': '_m',
+    'MJIFarmPastureRank': '_m',
+    'MJIFunction': '_m',
+    'MJIGardenscaping': '_m',
+    'MJIGathering': '_m',
+    'MJIGatheringItem': '_m',
+    'MJIGatheringObject': '_m',
+    'MJIGatheringTool': '_m',
+    'MJIHudMode': '_m',
+    'MJIItemCategory': '_m',
+    'MJIItemPouch': '_m',
+    'MJIKeyItem': '_m',
+    'MJILandmark': '_m',
+    'MJILandmarkPlace': '_m',
+    'MJILivelyActor': '_m',
+    'MJIMinionPopAreas': '_m',
+    'MJIName': '_m',
+    'MJINekomimiRequest': '_m',
+    'MJIProgress': '_m',
+    'MJIRank': '_m',
+    'MJIRecipe': '_m',
+    'MJIRecipeMaterial': '_m',
+    'MJIStockyardManagementArea': '_m',
+    'MJIStockyardManagementTable': '_m',
+    'MJIText': '_m',
+    'MJIVillageAppearanceSG': '_m',
+    'MJIVillageAppearanceUI': '_m',
+    'MJIVillageDevelopment': '_m',
+    'MYCTemporaryItem': '_m',
+    'MYCTemporaryItemUICategory': '_m',
+    'MYCWarResultNotebook': '_m',
+    'MacroIcon': '_m',
+    'MacroIconRedirectOld': '_m',
+    'MainCommand': '_m',
+    'MainCommandCategory': '_m',
+    'MandervilleWeaponEnhance': '_m',
+    'Maneuvers': '_m',
+    'ManeuversArmor': '_m',
+    'Map': '_m',
+    'MapCondition': '_m',
+    'MapExclusive': '_m',
+    'MapMarker': '_m',
+    'MapMarkerRegion': '_m',
+    'MapReplace': '_m',
+    'MapSymbol': '_m',
+    'MapTransientPvPMap': '_m',
+    'MapType': '_m',
+    'Marker': '_m',
+    'MateAuthorityCategory': '_m',
+    'Materia': '_m',
+    'MateriaGrade': '_m',
+    'MateriaJoinRate': '_m',
+    'MateriaJoinRateGatherCraft': '_m',
+    'MateriaParam': '_m',
+    'MateriaTomestoneRate': '_m',
+    'McGuffin': '_m',
+    'McGuffinUIData': '_m',
+    'MiniGameRA': '_m',
+    'MiniGameRANotes': '_m',
+    'MiniGameTurnBreakAction': '_m',
+    'MiniGameTurnBreakConst': '_m',
+    'MiniGameTurnBreakEnemy': '_m',
+    'MiniGameTurnBreakPop': '_m',
+    'MiniGameTurnBreakPopOffset': '_m',
+    'MiniGameTurnBreakStage': '_m',
+    'MiniGameTurnBreakStatus': '_m',
+    'MinionRace': '_m',
+    'MinionRules': '_m',
+    'MinionSkillType': '_m',
+    'MinionStage': '_m',
+    'MirageStoreSetItem': '_m',
+    'MobHuntOrder': '_m',
+    'MobHuntOrderType': '_m',
+    'MobHuntReward': '_m',
+    'MobHuntRewardCap': '_m',
+    'MobHuntTarget': '_m',
+    'ModelAttribute': '_m',
+    'ModelChara': '_m',
+    'ModelScale': '_m',
+    'ModelSkeleton': '_m',
+    'ModelState': '_m',
+    'MonsterNote': '_m',
+    'MonsterNoteTarget': '_m',
+    'MotionTimeline': '_m',
+    'MotionTimelineAdvanceBlend': '_m',
+    'MotionTimelineBlendTable': '_m',
+    'Mount': '_m',
+    'MountAction': '_m',
+    'MountCustomize': '_m',
+    'MountFlyingCondition': '_m',
+    'MountSpeed': '_m',
+    'MountTransient': '_m',
+    'MoveControl': '_m',
+    'MoveTimeline': '_m',
+    'MoveVfx': '_m',
+    'MovieStaffList': '_m',
+    'MovieSubtitle': '_m',
+    'MovieSubtitle500': '_m',
+    'MovieSubtitleVoyage': '_m',
+    'MultipleHelp': '_m',
+    'MultipleHelpPage': '_m',
+    'MultipleHelpString': '_m',
+    'NotebookDivision': '_n',
+    'NotebookDivisionCategory': '_n',
+    'NotebookList': '_n',
+    'NotoriousMonster': '_n',
+    'NotoriousMonsterTerritory': '_n',
+    'NpcEquip': '_n',
+    'NpcYell': '_n',
+    'Omen': '_o',
+    'Omikuji': '_o',
+    'OmikujiGuidance': '_o',
+    'OnlineStatus': '_o',
+    'OpenContent': '_o',
+    'OpenContentCandidateName': '_o',
+    'OpenLuaUI': '_o',
+    'Opening': '_o',
+    'OpeningSystemDefine': '_o',
+    'Orchestrion': '_o',
+    'OrchestrionCategory': '_o',
+    'OrchestrionPath': '_o',
+    'OrchestrionUiparam': '_o',
+    'Ornament': '_o',
+    'OrnamentAction': '_o',
+    'OrnamentCustomize': '_o',
+    'OrnamentCustomizeGroup': '_o',
+    'OrnamentTransient': '_o',
+    'ParamGrow': '_p',
+    'PartyContent': '_p',
+    'PartyContentCutscene': '_p',
+    'PartyContentTextData': '_p',
+    'PartyContentTransient': '_p',
+    'PatchMark': '_p',
+    'Perform': '_p',
+    'PerformGroup': '_p',
+    'PerformGuideScore': '_p',
+    'PerformTransient': '_p',
+    'Permission': '_p',
+    'Pet': '_p',
+    'PetAction': '_p',
+    'PetMirage': '_p',
+    'PhysicsGroup': '_p',
+    'PhysicsOffGroup': '_p',
+    'PhysicsWind': '_p',
+    'Picture': '_p',
+    'PlaceName': '_p',
+    'PlantPotFlowerSeed': '_p',
+    'PlayerSearchLocation': '_p',
+    'PlayerSearchSubLocation': '_p',
+    'PreHandler': '_p',
+    'PreHandlerMovement': '_p',
+    'PresetCamera': '_p',
+    'PresetCameraAdjust': '_p',
+    'PreviewableItems': '_p',
+    'PublicContent': '_p',
+    'PublicContentCutscene': '_p',
+    'PublicContentTextData': '_p',
+    'PublicContentType': '_p',
+    'PvPAction': '_p',
+    'PvPActionSort': '_p',
+    'PvPBaseParamValue': '_p',
+    'PvPInitialSelectActionTrait': '_p',
+    'PvPRank': '_p',
+    'PvPRankTransient': '_p',
+    'PvPSelectTrait': '_p',
+    'PvPSelectTraitTransient': '_p',
+    'PvPSeries': '_p',
+    'PvPSeriesLevel': '_p',
+    'PvPTrait': '_p',
+    'QTE': '_q',
+    'Quest': '_q',
+    'QuestAcceptAdditionCondition': '_q',
+    'QuestBattle': '_q',
+    'QuestBattleResident': '_q',
+    'QuestBattleSystemDefine': '_q',
+    'QuestChapter': '_q',
+    'QuestClassJobReward': '_q',
+    'QuestClassJobSupply': '_q',
+    'QuestCustomTodo': '_q',
+    'QuestDefineClient': '_q',
+    'QuestDerivedClass': '_q',
+    'QuestEffect': '_q',
+    'QuestEffectDefine': '_q',
+    'QuestEffectType': '_q',
+    'QuestEquipModel': '_q',
+    'QuestEventAreaEntranceInfo': '_q',
+    'QuestHideReward': '_q',
+    'QuestLinkMarker': '_q',
+    'QuestLinkMarkerIcon': '_q',
+    'QuestLinkMarkerSet': '_q',
+    'QuestRecomplete': '_q',
+    'QuestRedo': '_q',
+    'QuestRedoChapter': '_q',
+    'QuestRedoChapterUI': '_q',
+    'QuestRedoChapterUICategory': '_q',
+    'QuestRedoChapterUITab': '_q',
+    'QuestRedoIncompChapter': '_q',
+    'QuestRepeatFlag': '_q',
+    'QuestRewardOther': '_q',
+    'QuestSelectTitle': '_q',
+    'QuestSetDefine': '_q',
+    'QuestStatusParam': '_q',
+    'QuestSystemDefine': '_q',
+    'QuickChat': '_q',
+    'QuickChatTransient': '_q',
+    'RPParameter': '_r',
+    'Race': '_r',
+    'RacingChocoboGrade': '_r',
+    'RacingChocoboItem': '_r',
+    'RacingChocoboName': '_r',
+    'RacingChocoboNameCategory': '_r',
+    'RacingChocoboNameInfo': '_r',
+    'RacingChocoboParam': '_r',
+    'RaidFinderParam': '_r',
+    'ReactionEventObject': '_r',
+    'ReactionEventObjectInfo': '_r',
+    'RecastNavimesh': '_r',
+    'Recipe': '_r',
+    'RecipeLevelTable': '_r',
+    'RecipeLookup': '_r',
+    'RecipeNotebookList': '_r',
+    'RecommendContents': '_r',
+    'Relic': '_r',
+    'Relic3': '_r',
+    'Relic3Materia': '_r',
+    'Relic3Rate': '_r',
+    'Relic3RatePattern': '_r',
+    'Relic6Magicite': '_r',
+    'RelicItem': '_r',
+    'RelicMateria': '_r',
+    'RelicNote': '_r',
+    'RelicNoteCategory': '_r',
+    'Resident': '_r',
+    'ResidentMotionType': '_r',
+    'ResistanceWeaponAdjust': '_r',
+    'RetainerFortuneRewardRange': '_r',
+    'RetainerTask': '_r',
+    'RetainerTaskLvRange': '_r',
+    'RetainerTaskNormal': '_r',
+    'RetainerTaskParameter': '_r',
+    'RetainerTaskParameterLvDiff': '_r',
+    'RetainerTaskRandom': '_r',
+    'RideShooting': '_r',
+    'RideShootingScheduler': '_r',
+    'RideShootingTarget': '_r',
+    'RideShootingTargetScheduler': '_r',
+    'RideShootingTargetType': '_r',
+    'RideShootingTextData': '_r',
+    'Role': '_r',
+    'SE': '_s',
+    'SEBattle': '_s',
+    'SatisfactionArbitration': '_s',
+    'SatisfactionBonusGuarantee': '_s',
+    'SatisfactionNpc': '_s',
+    'SatisfactionSupply': '_s',
+    'SatisfactionSupplyReward': '_s',
+    'SatisfactionSupplyRewardExp': '_s',
+    'ScenarioTree': '_s',
+    'ScenarioTreeTips': '_s',
+    'ScenarioTreeTipsClassQuest': '_s',
+    'ScenarioType': '_s',
+    'ScreenImage': '_s',
+    'SecretRecipeBook': '_s',
+    'SequentialEvent': '_s',
+    'SequentialEventMultipleRange': '_s',
+    'SharlayanCraftWorks': '_s',
+    'SharlayanCraftWorksSupply': '_s',
+    'ShellFixedFromCommand': '_s',
+    'Skirmish': '_s',
+    'SkyIsland': '_s',
+    'SkyIsland2': '_s',
+    'SkyIsland2Mission': '_s',
+    'SkyIsland2MissionDetail': '_s',
+    'SkyIsland2MissionType': '_s',
+    'SkyIsland2RangeType': '_s',
+    'SkyIslandMapMarker': '_s',
+    'SkyIslandSubject': '_s',
+    'Snipe': '_s',
+    'SnipeCollision': '_s',
+    'SnipeElementId': '_s',
+    'SnipeHitEvent': '_s',
+    'SnipePerformanceCamera': '_s',
+    'SnipeTalk': '_s',
+    'SnipeTalkName': '_s',
+    'SpearfishingComboTarget': '_s',
+    'SpearfishingEcology': '_s',
+    'SpearfishingItem': '_s',
+    'SpearfishingItemReverse': '_s',
+    'SpearfishingNotebook': '_s',
+    'SpearfishingRecordPage': '_s',
+    'SpearfishingSilhouette': '_s',
+    'SpecialShop': '_s',
+    'SpecialShopItemCategory': '_s',
+    'Spectator': '_s',
+    'Stain': '_s',
+    'StainTransient': '_s',
+    'StanceChange': '_s',
+    'Status': '_s',
+    'StatusHitEffect': '_s',
+    'StatusLoopVFX': '_s',
+    'Story': '_s',
+    'StorySystemDefine': '_s',
+    'SubmarineExploration': '_s',
+    'SubmarineExplorationLog': '_s',
+    'SubmarineMap': '_s',
+    'SubmarinePart': '_s',
+    'SubmarineRank': '_s',
+    'SubmarineSpecCategory': '_s',
+    'SwitchTalk': '_s',
+    'SwitchTalkVariation': '_s',
+    'SystemGraphicPreset': '_s',
+    'TelepoRelay': '_t',
+    'TerritoryChatRule': '_t',
+    'TerritoryIntendedUse': '_t',
+    'TerritoryType': '_t',
+    'TerritoryTypeTelepo': '_t',
+    'TerritoryTypeTransient': '_t',
+    'TextCommand': '_t',
+    'TextCommandParam': '_t',
+    'Title': '_t',
+    'TofuEditParam': '_t',
+    'TofuObject': '_t',
+    'TofuObjectCategory': '_t',
+    'TofuPreset': '_t',
+    'TofuPresetCategory': '_t',
+    'TofuPresetObject': '_t',
+    'TomestoneConvert': '_t',
+    'Tomestones': '_t',
+    'TomestonesItem': '_t',
+    'TopicSelect': '_t',
+    'Town': '_t',
+    'Trait': '_t',
+    'TraitRecast': '_t',
+    'TraitTransient': '_t',
+    'Transformation': '_t',
+    'Treasure': '_t',
+    'TreasureHuntRank': '_t',
+    'TreasureHuntTexture': '_t',
+    'TreasureModel': '_t',
+    'TreasureSpot': '_t',
+    'Tribe': '_t',
+    'TriggerEffect': '_t',
+    'TripleTriad': '_t',
+    'TripleTriadCard': '_t',
+    'TripleTriadCardObtain': '_t',
+    'TripleTriadCardRarity': '_t',
+    'TripleTriadCardResident': '_t',
+    'TripleTriadCardType': '_t',
+    'TripleTriadCompetition': '_t',
+    'TripleTriadDefine': '_t',
+    'TripleTriadResident': '_t',
+    'TripleTriadRule': '_t',
+    'TripleTriadTournament': '_t',
+    'Tutorial': '_t',
+    'TutorialDPS': '_t',
+    'TutorialHealer': '_t',
+    'TutorialTank': '_t',
+    'UDS_Event': '_u',
+    'UDS_Object': '_u',
+    'UDS_Property': '_u',
+    'UDS_Stats': '_u',
+    'UIColor': '_u',
+    'UIConst': '_u',
+    'UILevelLookup': '_u',
+    'VFX': '_v',
+    'VVDData': '_v',
+    'VVDNotebookContents': '_v',
+    'VVDNotebookSeries': '_v',
+    'VVDRouteData': '_v',
+    'VVDVariantAction': '_v',
+    'Vase': '_v',
+    'VaseFlower': '_v',
+    'Warp': '_w',
+    'WarpCondition': '_w',
+    'WarpLogic': '_w',
+    'WeaponTimeline': '_w',
+    'Weather': '_w',
+    'WeatherGroup': '_w',
+    'WeatherRate': '_w',
+    'WeatherReportReplace': '_w',
+    'WebGuidance': '_w',
+    'WebURL': '_w',
+    'WeddingBGM': '_w',
+    'WeddingFlowerColor': '_w',
+    'WeddingPlan': '_w',
+    'WeeklyBingoOrderData': '_w',
+    'WeeklyBingoRewardData': '_w',
+    'WeeklyBingoText': '_w',
+    'WeeklyLotBonus': '_w',
+    'WeeklyLotBonusThreshold': '_w',
+    'World': '_w',
+    'WorldDCGroupType': '_w',
+    'XPVPGroupActivity': '_x',
+    'YKW': '_y',
+    'YardCatalogCategory': '_y',
+    'YardCatalogItemList': '_y',
+    'ZoneSharedGroup': '_z',
+    'ZoneTimeline': '_z',
+}
@@ -0,0 +1,74 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class JigsawScore(DataRow):
+    _sign = b'JigsawScore|eJzLy8vLAwAEUAG5'
+    sheet_name = 'JigsawScore'
+    score: int_t = RowData(0)
+    combo: int_t = RowData(1)
+    bridge: int_t = RowData(2)
+    stand: int_t = RowData(3)
+
+
+class JigsawTimeBonus(DataRow):
+    _sign = b'JigsawTimeBonus|eJzLy8MGAGzMCXU='
+    sheet_name = 'JigsawTimeBonus'
+    time: List[int_t] = ListData(ir((0, 11, 1)), RowData)
+    bonus: List[int_t] = ListData(ir((11, 11, 1)), RowData)
+
+
+class Jingle(DataRow):
+    _sign = b'Jingle|eJwrBgAAdAB0'
+    sheet_name = 'Jingle'
+    _display = 'path'
+    path: str_t = RowData(0)
+
+
+class JobHudManual(DataRow):
+    _sign = b'JobHudManual|eJzLywMBAAkMApU='
+    sheet_name = 'JobHudManual'
+    _display = 'condition_value'
+    hud: int_t = RowData(0)
+    condition_type: List[int_t] = ListData(ir((1, 2, 2)), RowData)
+    condition_value: 'List[Action]' = ListData(ir((2, 2, 2)), RowForeign, 'Action')
+    guide: 'Guide' = RowForeign(5, 'Guide')
+
+
+class JobHudManualPriority(DataRow):
+    _sign = b'JobHudManualPriority|eJzLywMCAAZ3Aic='
+    sheet_name = 'JobHudManualPriority'
+    manual: List[int_t] = ListData(ir((0, 5, 1)), RowData)
+
+
+class JournalCategory(DataRow):
+    _sign = b'JournalCategory|eJwrzgMCAAaQAiw='
+    sheet_name = 'JournalCategory'
+    _display = 'text'
+    text: str_t = RowData(0)
+    separate_type: int_t = RowData(1)
+    data_type: int_t = RowData(2)
+    section: 'JournalSection' = RowForeign(3, 'JournalSection')
+    show_condition: int_t = RowData(4)
+
+
+class JournalGenre(DataRow):
+    _sign = b'JournalGenre|eJzLy0srBgAERQG2'
+    sheet_name = 'JournalGenre'
+    _display = 'text'
+    icon: 'Icon' = IconRow(0)
+    category: 'JournalCategory' = RowForeign(1, 'JournalCategory')
+    ui_map_marker_height_enable: bool_t = RowData(2)
+    text: str_t = RowData(3)
+
+
+class JournalSection(DataRow):
+    _sign = b'JournalSection|eJwrTksDAAKOAUA='
+    sheet_name = 'JournalSection'
+    _display = 'text'
+    text: str_t = RowData(0)
+    enable_journal: bool_t = RowData(1)
+    enable_replay: bool_t = RowData(2)
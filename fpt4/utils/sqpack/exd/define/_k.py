@@ -0,0 +1,27 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class KineDriverOffGroup(DataRow):
+    _sign = b'KineDriverOffGroup|eJzLywMCAAZ3Aic='
+    sheet_name = 'KineDriverOffGroup'
+    field_0: int_t = RowData(0)
+    field_1: int_t = RowData(1)
+    field_2: int_t = RowData(2)
+    field_3: int_t = RowData(3)
+    field_4: int_t = RowData(4)
+
+
+class Knockback(DataRow):
+    _sign = b'Knockback|eJzLy0vLy8tLAwAL3wLz'
+    sheet_name = 'Knockback'
+    distance: int_t = RowData(0)
+    speed: int_t = RowData(1)
+    motion: bool_t = RowData(2)
+    near_distance: int_t = RowData(3)
+    direction: int_t = RowData(4)
+    direction_arg: int_t = RowData(5)
+    cancel_move: bool_t = RowData(6)
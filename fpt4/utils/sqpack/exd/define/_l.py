@@ -0,0 +1,239 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class LFGExtensionContent(DataRow):
+    _sign = b'LFGExtensionContent|eJzLy8vLAwAEUAG5'
+    sheet_name = 'LFGExtensionContent'
+    category: int_t = RowData(0)
+    type: int_t = RowData(1)
+    value: int_t = RowData(2)
+    sort: int_t = RowData(3)
+
+
+class LFGExtensionContent(DataRow):
+    _sign = b'LFGExtensionContent|eJzLy8sDAAKXAUs='
+    sheet_name = 'LFGExtensionContent'
+    category: int_t = RowData(0)
+    content_finder_condition: int_t = RowData(1)
+    sort: int_t = RowData(2)
+
+
+class LegacyQuest(DataRow):
+    _sign = b'LegacyQuest|eJzLKy7OywMABpoCMQ=='
+    sheet_name = 'LegacyQuest'
+    legacy_quest_id: int_t = RowData(0)
+    text_name: str_t = RowData(1)
+    text_journal: str_t = RowData(2)
+    sort_key: int_t = RowData(3)
+    genre: int_t = RowData(4)
+
+
+class Leve(DataRow):
+    _sign = b'Leve|eJwrLs5DAmkoFIQFAAAKDo8='
+    sheet_name = 'Leve'
+    _display = 'text_name'
+    text_name: str_t = RowData(0)
+    text_objective: str_t = RowData(1)
+    client: 'LeveClient' = RowForeign(2, 'LeveClient')
+    guildleve_assignment_type: int_t = RowData(3)
+    assignment_type: 'LeveAssignmentType' = RowForeign(4, 'LeveAssignmentType')
+    town: 'Town' = RowForeign(5, 'Town')
+    class_level: int_t = RowData(6)
+    time_limit: int_t = RowData(7)
+    ticket_num: int_t = RowData(8)
+    evaluation: int_t = RowData(9)
+    location: 'PlaceName' = RowForeign(10, 'PlaceName')
+    finish_location: 'PlaceName' = RowForeign(11, 'PlaceName')
+    fishing_spot_data: 'FishingSpot' = RowForeign(12, 'FishingSpot')
+    spearfishing_spot_data: int_t = RowData(13)
+    special: bool_t = RowData(14)
+    class_job: 'ClassJobCategory' = RowForeign(15, 'ClassJobCategory')
+    genre: 'JournalGenre' = RowForeign(16, 'JournalGenre')
+    region: int_t = RowData(17)
+    area: 'PlaceName' = RowForeign(18, 'PlaceName')
+    plate_region_icon: 'Icon' = IconRow(19)
+    game_data: int_t = RowData(20)
+    difficulty: bool_t = RowData(21)
+    difficulty_max: int_t = RowData(22)
+    reward_exp_rate: float_t = RowData(23)
+    reward_static_exp: int_t = RowData(24)
+    reward_gil: int_t = RowData(25)
+    reward_item: 'LeveRewardItem' = RowForeign(26, 'LeveRewardItem')
+    plate_design_vfx: 'LeveVfx' = RowForeign(27, 'LeveVfx')
+    plate_frame_vfx: 'LeveVfx' = RowForeign(28, 'LeveVfx')
+    todo_listener: 'Level' = RowForeign(29, 'Level')
+    header: 'Icon' = IconRow(30)
+    cancellable: bool_t = RowData(31)
+    start_marker: 'Level' = RowForeign(32, 'Level')
+    bgm: 'BGM' = RowForeign(33, 'BGM')
+
+
+class LeveAssignmentType(DataRow):
+    _sign = b'LeveAssignmentType|eJxLyysGAAKEAUg='
+    sheet_name = 'LeveAssignmentType'
+    _display = 'text'
+    faction: bool_t = RowData(0)
+    icon: 'Icon' = IconRow(1)
+    text: str_t = RowData(2)
+
+
+class LeveClient(DataRow):
+    _sign = b'LeveClient|eJwrBgAAdAB0'
+    sheet_name = 'LeveClient'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class LeveRewardItem(DataRow):
+    _sign = b'LeveRewardItem|eJzLy0MFADqABuE='
+    sheet_name = 'LeveRewardItem'
+    item_group: List[int_t] = ListData(ir((0, 8, 2)), RowData)
+    item_group_rate: List[int_t] = ListData(ir((1, 8, 2)), RowData)
+
+
+class LeveRewardItemGroup(DataRow):
+    _sign = b'LeveRewardItemGroup|eJzLy0vKw4EAnQsLLw=='
+    sheet_name = 'LeveRewardItemGroup'
+    item: List[int_t] = ListData(ir((0, 9, 3)), RowData)
+    stack: List[int_t] = ListData(ir((1, 9, 3)), RowData)
+    hq: List[bool_t] = ListData(ir((2, 9, 3)), RowData)
+
+
+class LeveString(DataRow):
+    _sign = b'LeveString|eJwrBgAAdAB0'
+    sheet_name = 'LeveString'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class LeveSystemDefine(DataRow):
+    _sign = b'LeveSystemDefine|eJwrzgMAAVYA4g=='
+    sheet_name = 'LeveSystemDefine'
+    define_name: str_t = RowData(0)
+    define_value: int_t = RowData(1)
+
+
+class LeveVfx(DataRow):
+    _sign = b'LeveVfx|eJwrzgMAAVYA4g=='
+    sheet_name = 'LeveVfx'
+    _display = 'icon'
+    path: str_t = RowData(0)
+    icon: 'Icon' = IconRow(1)
+
+
+class Level(DataRow):
+    _sign = b'Level|eJzLy4MBABesBE0='
+    sheet_name = 'Level'
+    trans_x: float_t = RowData(0)
+    trans_y: float_t = RowData(1)
+    trans_z: float_t = RowData(2)
+    rot_y: float_t = RowData(3)
+    range_on_map: float_t = RowData(4)
+    e_asset_type: int_t = RowData(5)
+    base_id: 'ENpcBase|BNpcBase|Aetheryte|GatheringPoint|EObj' = DynamicForeign(6, ComplexSheetKey('e_asset_type', (8, 'ENpcBase'), (9, 'BNpcBase'), (12, 'Aetheryte'), (14, 'GatheringPoint'), (45, 'EObj')))
+    map: 'Map' = RowForeign(7, 'Map')
+    event_handler: int_t = RowData(8)
+    territory_type: 'TerritoryType' = RowForeign(9, 'TerritoryType')
+
+
+class LinkRace(DataRow):
+    _sign = b'LinkRace|eJxLSkpKAgAD2AGJ'
+    sheet_name = 'LinkRace'
+    link: List[bool_t] = ListData(ir((0, 4, 1)), RowData)
+
+
+class LoadingImage(DataRow):
+    _sign = b'LoadingImage|eJwrBgAAdAB0'
+    sheet_name = 'LoadingImage'
+    path: str_t = RowData(0)
+
+
+class LoadingTips(DataRow):
+    _sign = b'LoadingTips|eJzLy0sDAAKPAUM='
+    sheet_name = 'LoadingTips'
+    condition_type: int_t = RowData(0)
+    condition_arg: int_t = RowData(1)
+    lang_enable: bool_t = RowData(2)
+
+
+class LoadingTipsSub(DataRow):
+    _sign = b'LoadingTipsSub|eJwrBgAAdAB0'
+    sheet_name = 'LoadingTipsSub'
+    text: str_t = RowData(0)
+
+
+class Lobby(DataRow):
+    _sign = b'Lobby|eJzLy8srLi4GAAkqAqQ='
+    sheet_name = 'Lobby'
+    _display = 'text_text'
+    type: int_t = RowData(0)
+    param: int_t = RowData(1)
+    link: int_t = RowData(2)
+    text_text: str_t = RowData(3)
+    text_sub: str_t = RowData(4)
+    text_help: str_t = RowData(5)
+
+
+class Lockon(DataRow):
+    _sign = b'Lockon|eJwrTgMAAU4A2g=='
+    sheet_name = 'Lockon'
+    file: str_t = RowData(0)
+    control_chara_only: bool_t = RowData(1)
+
+
+class LogFilter(DataRow):
+    _sign = b'LogFilter|eJzLywOB4mIAD48Dew=='
+    sheet_name = 'LogFilter'
+    _display = 'text_name'
+    log_kind: int_t = RowData(0)
+    caster: int_t = RowData(1)
+    target: int_t = RowData(2)
+    category: int_t = RowData(3)
+    display_order: int_t = RowData(4)
+    preset: int_t = RowData(5)
+    text_name: str_t = RowData(6)
+    text_help: str_t = RowData(7)
+
+
+class LogKind(DataRow):
+    _sign = b'LogKind|eJzLK04DAAKZAUg='
+    sheet_name = 'LogKind'
+    diff__height: int_t = RowData(0)
+    text: str_t = RowData(1)
+    notice: bool_t = RowData(2)
+
+
+class LogMessage(DataRow):
+    _sign = b'LogMessage|eJzLy8tLKwYABmwCJA=='
+    sheet_name = 'LogMessage'
+    _display = 'text'
+    type: int_t = RowData(0)
+    addon: int_t = RowData(1)
+    filter: int_t = RowData(2)
+    item__drop: bool_t = RowData(3)
+    text: str_t = RowData(4)
+
+
+class LootModeType(DataRow):
+    _sign = b'LootModeType|eJxLAwAAZwBn'
+    sheet_name = 'LootModeType'
+    is_ui_select: bool_t = RowData(0)
+
+
+class LotteryExchangeShop(DataRow):
+    _sign = b'LotteryExchangeShop|eJwrzhtgUAzEaQAynDmX'
+    sheet_name = 'LotteryExchangeShop'
+    text: str_t = RowData(0)
+    items_need_item: List[int_t] = ListData(ir((1, 32, 1)), RowData)
+    items_need_stack: List[int_t] = ListData(ir((33, 32, 1)), RowData)
+    items_compare_value: List[int_t] = ListData(ir((65, 32, 1)), RowData)
+    items_sort: List[int_t] = ListData(ir((97, 32, 1)), RowData)
+    script: str_t = RowData(129)
+    not_enough_log_message: int_t = RowData(130)
+    item_full_log_message: int_t = RowData(131)
+    discrepancy_log_message: int_t = RowData(132)
+    system: bool_t = RowData(133)
@@ -0,0 +1,1400 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class MJIAnimals(DataRow):
+    _sign = b'MJIAnimals|eJzLywMDAAwPAwM='
+    sheet_name = 'MJIAnimals'
+    b_npc: 'BNpcBase' = RowForeign(0, 'BNpcBase')
+    size: int_t = RowData(1)
+    type: int_t = RowData(2)
+    genus: int_t = RowData(3)
+    main_product: int_t = RowData(4)
+    sub_product: int_t = RowData(5)
+    icon_ui: 'Icon' = IconRow(6)
+
+
+class MJIBuilding(DataRow):
+    _sign = b'MJIBuilding|eJzLy8MPAOMADcE='
+    sheet_name = 'MJIBuilding'
+    need_rank: int_t = RowData(0)
+    shared_group: 'ExportedSG' = RowForeign(1, 'ExportedSG')
+    lively: int_t = RowData(2)
+    alt_lively: int_t = RowData(3)
+    construction_shared_group: 'List[ExportedSG]' = ListData(ir((4, 4, 2)), RowForeign, 'ExportedSG')
+    construction_lively: List[int_t] = ListData(ir((5, 4, 2)), RowData)
+    construction_grow_time: List[int_t] = ListData(ir((12, 4, 1)), RowData)
+    grow_time: int_t = RowData(16)
+    shortening_grow_time: int_t = RowData(17)
+    shortening_need_rank: int_t = RowData(18)
+    material: List[int_t] = ListData(ir((19, 5, 1)), RowData)
+    material_num: List[int_t] = ListData(ir((24, 5, 1)), RowData)
+    name_id: 'MJIText' = RowForeign(29, 'MJIText')
+    help_id: int_t = RowData(30)
+    icon: 'Icon' = IconRow(31)
+
+
+class MJIBuildingPlace(DataRow):
+    _sign = b'MJIBuildingPlace|eJzLywMBAAkMApU='
+    sheet_name = 'MJIBuildingPlace'
+    place: int_t = RowData(0)
+    signboard_e_obj: 'EObjName' = RowForeign(1, 'EObjName')
+    signboard_shared_group: 'ExportedSG' = RowForeign(2, 'ExportedSG')
+    need_development: int_t = RowData(3)
+    pos_x: int_t = RowData(4)
+    pos_z: int_t = RowData(5)
+
+
+class MJICraftworksObject(DataRow):
+    _sign = b'MJICraftworksObject|eJzLy0MBADOfBnM='
+    sheet_name = 'MJICraftworksObject'
+    _display = 'craft_item_id'
+    craft_item_id: 'Item' = RowForeign(0, 'Item')
+    theme: List[int_t] = ListData(ir((1, 3, 1)), RowData)
+    material_item_id: List[int_t] = ListData(ir((4, 4, 2)), RowData)
+    material_num: List[int_t] = ListData(ir((5, 4, 2)), RowData)
+    open_rank: int_t = RowData(12)
+    required_time: int_t = RowData(13)
+    trade_value: int_t = RowData(14)
+
+
+class MJICraftworksObjectTheme(DataRow):
+    _sign = b'MJICraftworksObjectTheme|eJwrBgAAdAB0'
+    sheet_name = 'MJICraftworksObjectTheme'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class MJICraftworksPopularity(DataRow):
+    _sign = b'MJICraftworksPopularity|eJzLy6MZAAAHcCcb'
+    sheet_name = 'MJICraftworksPopularity'
+    item: List[int_t] = ListData(ir((0, 91, 1)), RowData)
+
+
+class MJICraftworksPopularity(DataRow):
+    _sign = b'MJICraftworksPopularity|eJzLy6MyAACTmiLP'
+    sheet_name = 'MJICraftworksPopularity'
+    item: List[int_t] = ListData(ir((0, 81, 1)), RowData)
+
+
+class MJICraftworksPopularity(DataRow):
+    _sign = b'MJICraftworksPopularity|eJzLy6MKAABKyx6D'
+    sheet_name = 'MJICraftworksPopularity'
+    item: List[int_t] = ListData(ir((0, 71, 1)), RowData)
+
+
+class MJICraftworksPopularityType(DataRow):
+    _sign = b'MJICraftworksPopularityType|eJzLAwAAbwBv'
+    sheet_name = 'MJICraftworksPopularityType'
+    _display = 'ratio'
+    ratio: int_t = RowData(0)
+
+
+class MJICraftworksRankRatio(DataRow):
+    _sign = b'MJICraftworksRankRatio|eJzLAwAAbwBv'
+    sheet_name = 'MJICraftworksRankRatio'
+    ratio: int_t = RowData(0)
+
+
+class MJICraftworksSupplyDefine(DataRow):
+    _sign = b'MJICraftworksSupplyDefine|eJzLywMAAUwA3Q=='
+    sheet_name = 'MJICraftworksSupplyDefine'
+    supply: int_t = RowData(0)
+    ratio: int_t = RowData(1)
+
+
+class MJICraftworksTension(DataRow):
+    _sign = b'MJICraftworksTension|eJzLAwAAbwBv'
+    sheet_name = 'MJICraftworksTension'
+    tension_max: int_t = RowData(0)
+
+
+class MJICropSeed(DataRow):
+    _sign = b'MJICropSeed|eJzLy8sDAAKXAUs='
+    sheet_name = 'MJICropSeed'
+    _display = 'crop'
+    crop: 'Item' = RowForeign(0, 'Item')
+    shared_group: 'ExportedSG' = RowForeign(1, 'ExportedSG')
+    name_e_obj: 'EObjName' = RowForeign(2, 'EObjName')
+
+
+class MJIDisposalShopItem(DataRow):
+    _sign = b'MJIDisposalShopItem|eJzLywMCAAZ3Aic='
+    sheet_name = 'MJIDisposalShopItem'
+    disposal_item: 'MJIItemPouch' = RowForeign(0, 'MJIItemPouch')
+    exchange_item: int_t = RowData(1)
+    exchange_rate: int_t = RowData(2)
+    ui_category: 'MJIDisposalShopUICategory' = RowForeign(3, 'MJIDisposalShopUICategory')
+    sort: int_t = RowData(4)
+
+
+class MJIDisposalShopUICategory(DataRow):
+    _sign = b'MJIDisposalShopUICategory|eJwrBgAAdAB0'
+    sheet_name = 'MJIDisposalShopUICategory'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class MJIFarmPastureRank(DataRow):
+    _sign = b'MJIFarmPastureRank|eJzLyyMNAAD5jxSh'
+    sheet_name = 'MJIFarmPastureRank'
+    rank_param_undeveloped_exproted_sg: List[int_t] = ListData(ir((0, 4, 1)), RowData)
+    rank_param_undeveloped_collision_exproted_g: List[int_t] = ListData(ir((4, 4, 1)), RowData)
+    rank_param_developed_exproted_sg: List[int_t] = ListData(ir((8, 4, 1)), RowData)
+    rank_param_complete_next_develop_exproted_sg: List[int_t] = ListData(ir((12, 4, 1)), RowData)
+    rank_param_lively: List[int_t] = ListData(ir((16, 4, 1)), RowData)
+    rank_param_next_develop_lively: List[int_t] = ListData(ir((20, 4, 1)), RowData)
+    rank_param_complete_next_develop_lively: List[int_t] = ListData(ir((24, 4, 1)), RowData)
+    rank_param_layout_id: List[int_t] = ListData(ir((28, 4, 1)), RowData)
+    rank_param_need_island_gil: List[int_t] = ListData(ir((32, 4, 1)), RowData)
+    rank_param_capacity: List[int_t] = ListData(ir((36, 4, 1)), RowData)
+    rank_param_name_id: List[int_t] = ListData(ir((40, 4, 1)), RowData)
+    rank_param_help_id: List[int_t] = ListData(ir((44, 4, 1)), RowData)
+
+
+class MJIFunction(DataRow):
+    _sign = b'MJIFunction|eJzLywMCAAZ3Aic='
+    sheet_name = 'MJIFunction'
+    open_condition_progress: int_t = RowData(0)
+    open_condition_rank: int_t = RowData(1)
+    open_condition_village_development: int_t = RowData(2)
+    open_condition_farm_level: int_t = RowData(3)
+    open_condition_pasture_level: int_t = RowData(4)
+
+
+class MJIGardenscaping(DataRow):
+    _sign = b'MJIGardenscaping|eJzLy4MCABNfA98='
+    sheet_name = 'MJIGardenscaping'
+    place_max_num: int_t = RowData(0)
+    open_condition_progress: int_t = RowData(1)
+    open_condition_village_development: int_t = RowData(2)
+    place_cost_item: int_t = RowData(3)
+    place_cost_item_num: int_t = RowData(4)
+    register_cost_item: 'Item' = RowForeign(5, 'Item')
+    register_cost_item_num: int_t = RowData(6)
+    stain_cost_item: int_t = RowData(7)
+    stain_cost_item_num: int_t = RowData(8)
+
+
+class MJIGathering(DataRow):
+    _sign = b'MJIGathering|eJzLAwAAbwBv'
+    sheet_name = 'MJIGathering'
+    _display = 'mji_gathering_object_info'
+    mji_gathering_object_info: 'MJIGatheringObject' = RowForeign(0, 'MJIGatheringObject')
+
+
+class MJIGatheringItem(DataRow):
+    _sign = b'MJIGatheringItem|eJzLywMDAAwPAwM='
+    sheet_name = 'MJIGatheringItem'
+    _display = 'catalog_id'
+    catalog_id: 'Item' = RowForeign(0, 'Item')
+    sort: int_t = RowData(1)
+    marker_tool: 'MJIGatheringTool' = RowForeign(2, 'MJIGatheringTool')
+    marker_x: int_t = RowData(3)
+    marker_z: int_t = RowData(4)
+    marker_radius: int_t = RowData(5)
+    marker_map_type: int_t = RowData(6)
+
+
+class MJIGatheringItem(DataRow):
+    _sign = b'MJIGatheringItem|eJzLywMBAAkMApU='
+    sheet_name = 'MJIGatheringItem'
+    _display = 'catalog_id'
+    catalog_id: 'Item' = RowForeign(0, 'Item')
+    sort: int_t = RowData(1)
+    marker_tool: int_t = RowData(2)
+    marker_x: int_t = RowData(3)
+    marker_z: int_t = RowData(4)
+    marker_radius: int_t = RowData(5)
+
+
+class MJIGatheringObject(DataRow):
+    _sign = b'MJIGatheringObject|eJzLywMCAAZ3Aic='
+    sheet_name = 'MJIGatheringObject'
+    _display = 'name_e_obj'
+    shared_group: 'ExportedSG' = RowForeign(0, 'ExportedSG')
+    map_icon: 'Icon' = IconRow(1)
+    icon_flag: int_t = RowData(2)
+    name_e_obj: 'EObjName' = RowForeign(3, 'EObjName')
+    visible_progress: int_t = RowData(4)
+
+
+class MJIGatheringObject(DataRow):
+    _sign = b'MJIGatheringObject|eJzLy8vLAwAEUAG5'
+    sheet_name = 'MJIGatheringObject'
+    _display = 'name_e_obj'
+    shared_group: 'ExportedSG' = RowForeign(0, 'ExportedSG')
+    map_icon: 'Icon' = IconRow(1)
+    icon_flag: int_t = RowData(2)
+    name_e_obj: 'EObjName' = RowForeign(3, 'EObjName')
+
+
+class MJIGatheringTool(DataRow):
+    _sign = b'MJIGatheringTool|eJzLAwAAbwBv'
+    sheet_name = 'MJIGatheringTool'
+    tool: 'MJIKeyItem' = RowForeign(0, 'MJIKeyItem')
+
+
+class MJIHudMode(DataRow):
+    _sign = b'MJIHudMode|eJwrLs7LAwAEcwHD'
+    sheet_name = 'MJIHudMode'
+    _display = 'text_name'
+    text_name: str_t = RowData(0)
+    text_header_name: str_t = RowData(1)
+    icon: 'Icon' = IconRow(2)
+    open_function: int_t = RowData(3)
+
+
+class MJIItemCategory(DataRow):
+    _sign = b'MJIItemCategory|eJwrLgYAAVsA5w=='
+    sheet_name = 'MJIItemCategory'
+    _display = 'text_name'
+    text_name: str_t = RowData(0)
+    text_name_plr: str_t = RowData(1)
+
+
+class MJIItemPouch(DataRow):
+    _sign = b'MJIItemPouch|eJzLy8vLAwAEUAG5'
+    sheet_name = 'MJIItemPouch'
+    _display = 'catalog_id'
+    catalog_id: 'Item' = RowForeign(0, 'Item')
+    category_id: 'MJIItemCategory' = RowForeign(1, 'MJIItemCategory')
+    category_detail: 'MJICropSeed' = RowForeign(2, 'MJICropSeed')
+    sort: int_t = RowData(3)
+
+
+class MJIKeyItem(DataRow):
+    _sign = b'MJIKeyItem|eJzLywMAAUwA3Q=='
+    sheet_name = 'MJIKeyItem'
+    _display = 'item'
+    item: 'Item' = RowForeign(0, 'Item')
+    sort: int_t = RowData(1)
+
+
+class MJILandmark(DataRow):
+    _sign = b'MJILandmark|eJzLyyMAAPEvDi8='
+    sheet_name = 'MJILandmark'
+    need_development: int_t = RowData(0)
+    need_rank: int_t = RowData(1)
+    reward: int_t = RowData(2)
+    shared_group: 'ExportedSG' = RowForeign(3, 'ExportedSG')
+    unfinished_signboard_shared_group: 'ExportedSG' = RowForeign(4, 'ExportedSG')
+    signboard_shared_group: 'ExportedSG' = RowForeign(5, 'ExportedSG')
+    lively: int_t = RowData(6)
+    construction_shared_group: 'List[ExportedSG]' = ListData(ir((7, 4, 2)), RowForeign, 'ExportedSG')
+    construction_lively: List[int_t] = ListData(ir((8, 4, 2)), RowData)
+    construction_grow_time: List[int_t] = ListData(ir((15, 4, 1)), RowData)
+    grow_time: int_t = RowData(19)
+    material: List[int_t] = ListData(ir((20, 5, 1)), RowData)
+    material_num: List[int_t] = ListData(ir((25, 5, 1)), RowData)
+    name_id: 'MJIText' = RowForeign(30, 'MJIText')
+    help_id: int_t = RowData(31)
+    icon: 'Icon' = IconRow(32)
+
+
+class MJILandmark(DataRow):
+    _sign = b'MJILandmark|eJzLy8MLANU/DVM='
+    sheet_name = 'MJILandmark'
+    need_development: int_t = RowData(0)
+    need_rank: int_t = RowData(1)
+    reward: int_t = RowData(2)
+    shared_group: 'ExportedSG' = RowForeign(3, 'ExportedSG')
+    lively: int_t = RowData(4)
+    construction_shared_group: 'List[ExportedSG]' = ListData(ir((5, 4, 2)), RowForeign, 'ExportedSG')
+    construction_lively: List[int_t] = ListData(ir((6, 4, 2)), RowData)
+    construction_grow_time: List[int_t] = ListData(ir((13, 4, 1)), RowData)
+    grow_time: int_t = RowData(17)
+    material: List[int_t] = ListData(ir((18, 5, 1)), RowData)
+    material_num: List[int_t] = ListData(ir((23, 5, 1)), RowData)
+    name_id: 'MJIText' = RowForeign(28, 'MJIText')
+    help_id: int_t = RowData(29)
+    icon: 'Icon' = IconRow(30)
+
+
+class MJILandmarkPlace(DataRow):
+    _sign = b'MJILandmarkPlace|eJzLywMDAAwPAwM='
+    sheet_name = 'MJILandmarkPlace'
+    place: int_t = RowData(0)
+    signboard_e_obj: 'EObjName' = RowForeign(1, 'EObjName')
+    signboard_shared_group: int_t = RowData(2)
+    ground_shared_group: 'ExportedSG' = RowForeign(3, 'ExportedSG')
+    need_development: int_t = RowData(4)
+    pos_x: int_t = RowData(5)
+    pos_z: int_t = RowData(6)
+
+
+class MJILandmarkPlace(DataRow):
+    _sign = b'MJILandmarkPlace|eJzLywMBAAkMApU='
+    sheet_name = 'MJILandmarkPlace'
+    place: int_t = RowData(0)
+    signboard_e_obj: 'EObjName' = RowForeign(1, 'EObjName')
+    signboard_shared_group: 'ExportedSG' = RowForeign(2, 'ExportedSG')
+    need_development: int_t = RowData(3)
+    pos_x: int_t = RowData(4)
+    pos_z: int_t = RowData(5)
+
+
+class MJILivelyActor(DataRow):
+    _sign = b'MJILivelyActor|eJzLywMBAAkMApU='
+    sheet_name = 'MJILivelyActor'
+    base_id: 'ENpcResident' = RowForeign(0, 'ENpcResident')
+    behavior: 'Behavior' = RowForeign(1, 'Behavior')
+    trans_x: float_t = RowData(2)
+    trans_y: float_t = RowData(3)
+    trans_z: float_t = RowData(4)
+    rot_y: float_t = RowData(5)
+
+
+class MJIMinionPopAreas(DataRow):
+    _sign = b'MJIMinionPopAreas|eJzLy8vLSwMABm8CHw=='
+    sheet_name = 'MJIMinionPopAreas'
+    requirement: int_t = RowData(0)
+    marker_pos_x: int_t = RowData(1)
+    marker_pos_z: int_t = RowData(2)
+    area_name: int_t = RowData(3)
+    is_target_place_area: bool_t = RowData(4)
+
+
+class MJIMinionPopAreas(DataRow):
+    _sign = b'MJIMinionPopAreas|eJzLy8vLAwAEUAG5'
+    sheet_name = 'MJIMinionPopAreas'
+    requirement: int_t = RowData(0)
+    marker_pos_x: int_t = RowData(1)
+    marker_pos_z: int_t = RowData(2)
+    area_name: int_t = RowData(3)
+
+
+class MJIName(DataRow):
+    _sign = b'MJIName|eJwrzivOAwEAD8YDew=='
+    sheet_name = 'MJIName'
+    text_sgl: str_t = RowData(0)
+    text_sgg: int_t = RowData(1)
+    text_plr: str_t = RowData(2)
+    text_plg: int_t = RowData(3)
+    text_vow: int_t = RowData(4)
+    text_cnt: int_t = RowData(5)
+    text_gen: int_t = RowData(6)
+    text_def_: int_t = RowData(7)
+
+
+class MJINekomimiRequest(DataRow):
+    _sign = b'MJINekomimiRequest|eJzLy8vLAwAEUAG5'
+    sheet_name = 'MJINekomimiRequest'
+    normal_shipment: int_t = RowData(0)
+    bonus_shipment: int_t = RowData(1)
+    normal_reward_num: int_t = RowData(2)
+    bonus_reward_num: int_t = RowData(3)
+
+
+class MJIProgress(DataRow):
+    _sign = b'MJIProgress|eJwrLi7OwwIAd/kJ8g=='
+    sheet_name = 'MJIProgress'
+    text_development_goal: str_t = RowData(0)
+    text_directive: str_t = RowData(1)
+    text_arrival_message: str_t = RowData(2)
+    need_item: List[int_t] = ListData(ir((3, 5, 3)), RowData)
+    need_item_num: List[int_t] = ListData(ir((4, 5, 3)), RowData)
+    gathering_item: List[int_t] = ListData(ir((5, 5, 3)), RowData)
+    hud_mode: int_t = RowData(18)
+    map_marker_pos_x: int_t = RowData(19)
+    map_marker_pos_z: int_t = RowData(20)
+    map_marker_range: int_t = RowData(21)
+    map_marker_map_type: int_t = RowData(22)
+
+
+class MJIProgress(DataRow):
+    _sign = b'MJIProgress|eJwrLi7OwwQAbgcJhA=='
+    sheet_name = 'MJIProgress'
+    text_development_goal: str_t = RowData(0)
+    text_directive: str_t = RowData(1)
+    text_arrival_message: str_t = RowData(2)
+    need_item: List[int_t] = ListData(ir((3, 5, 3)), RowData)
+    need_item_num: List[int_t] = ListData(ir((4, 5, 3)), RowData)
+    gathering_item: List[int_t] = ListData(ir((5, 5, 3)), RowData)
+    hud_mode: int_t = RowData(18)
+    map_marker_pos_x: int_t = RowData(19)
+    map_marker_pos_z: int_t = RowData(20)
+    map_marker_range: int_t = RowData(21)
+
+
+class MJIRank(DataRow):
+    _sign = b'MJIRank|eJzLywMCAAZ3Aic='
+    sheet_name = 'MJIRank'
+    exp: int_t = RowData(0)
+    function: int_t = RowData(1)
+    log_message: List[int_t] = ListData(ir((2, 3, 1)), RowData)
+
+
+class MJIRecipe(DataRow):
+    _sign = b'MJIRecipe|eJzLy0MBADOfBnM='
+    sheet_name = 'MJIRecipe'
+    _display = 'key_item'
+    first_craft_message: 'LogMessage' = RowForeign(0, 'LogMessage')
+    key_item: 'MJIKeyItem' = RowForeign(1, 'MJIKeyItem')
+    craft_item_id: 'MJIItemPouch' = RowForeign(2, 'MJIItemPouch')
+    craft_num: int_t = RowData(3)
+    material_item_id: List[int_t] = ListData(ir((4, 5, 2)), RowData)
+    material_num: List[int_t] = ListData(ir((5, 5, 2)), RowData)
+    sort_prio: int_t = RowData(14)
+
+
+class MJIRecipeMaterial(DataRow):
+    _sign = b'MJIRecipeMaterial|eJzLywMAAUwA3Q=='
+    sheet_name = 'MJIRecipeMaterial'
+    _display = 'item_pouch_id'
+    item_pouch_id: 'MJIItemPouch' = RowForeign(0, 'MJIItemPouch')
+    category_id: int_t = RowData(1)
+
+
+class MJIStockyardManagementArea(DataRow):
+    _sign = b'MJIStockyardManagementArea|eJzLy8sDAAKXAUs='
+    sheet_name = 'MJIStockyardManagementArea'
+    _display = 'name'
+    rare_item: 'MJIItemPouch' = RowForeign(0, 'MJIItemPouch')
+    lottery_table: int_t = RowData(1)
+    name: 'MJIText' = RowForeign(2, 'MJIText')
+
+
+class MJIStockyardManagementTable(DataRow):
+    _sign = b'MJIStockyardManagementTable|eJzLAwAAbwBv'
+    sheet_name = 'MJIStockyardManagementTable'
+    _display = 'lottery_item'
+    lottery_item: 'MJIItemPouch' = RowForeign(0, 'MJIItemPouch')
+
+
+class MJIText(DataRow):
+    _sign = b'MJIText|eJwrBgAAdAB0'
+    sheet_name = 'MJIText'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class MJIVillageAppearanceSG(DataRow):
+    _sign = b'MJIVillageAppearanceSG|eJzLy4MBABesBE0='
+    sheet_name = 'MJIVillageAppearanceSG'
+    shared_group_appearance_sg: List[int_t] = ListData(ir((0, 5, 1)), RowData)
+    shared_group_name_id: List[int_t] = ListData(ir((5, 5, 1)), RowData)
+
+
+class MJIVillageAppearanceSG(DataRow):
+    _sign = b'MJIVillageAppearanceSG|eJzLy4MAAA+AA3E='
+    sheet_name = 'MJIVillageAppearanceSG'
+    shared_group_appearance_sg: List[int_t] = ListData(ir((0, 4, 1)), RowData)
+    shared_group_name_id: List[int_t] = ListData(ir((4, 4, 1)), RowData)
+
+
+class MJIVillageAppearanceSG(DataRow):
+    _sign = b'MJIVillageAppearanceSG|eJzLywMBAAkMApU='
+    sheet_name = 'MJIVillageAppearanceSG'
+    shared_group_appearance_sg: List[int_t] = ListData(ir((0, 3, 1)), RowData)
+    shared_group_name_id: List[int_t] = ListData(ir((3, 3, 1)), RowData)
+
+
+class MJIVillageAppearanceUI(DataRow):
+    _sign = b'MJIVillageAppearanceUI|eJzLy8sDAAKXAUs='
+    sheet_name = 'MJIVillageAppearanceUI'
+    icon: 'Icon' = IconRow(0)
+    name_id: int_t = RowData(1)
+    define_id: int_t = RowData(2)
+
+
+class MJIVillageDevelopment(DataRow):
+    _sign = b'MJIVillageDevelopment|eJzLy0MBADOfBnM='
+    sheet_name = 'MJIVillageDevelopment'
+    e_npc: 'ENpcResident' = RowForeign(0, 'ENpcResident')
+    need_rank: int_t = RowData(1)
+    need_key_item: int_t = RowData(2)
+    ooen_road_sg: int_t = RowData(3)
+    ooen_road_lyaout_id: int_t = RowData(4)
+    open_plaza_sg: int_t = RowData(5)
+    open_plaza_layout_id: int_t = RowData(6)
+    open_slope_sg: int_t = RowData(7)
+    open_slope_layout_id: int_t = RowData(8)
+    open_collision_sg: 'Behavior' = RowForeign(9, 'Behavior')
+    open_collision_layout_id: int_t = RowData(10)
+    open_obstacle_sg: 'Behavior' = RowForeign(11, 'Behavior')
+    open_obstacle_layout_id: int_t = RowData(12)
+    craftworks_built_max: int_t = RowData(13)
+    stockyard_built_max: int_t = RowData(14)
+
+
+class MJIVillageDevelopment(DataRow):
+    _sign = b'MJIVillageDevelopment|eJzLy0MCACcnBZc='
+    sheet_name = 'MJIVillageDevelopment'
+    e_npc: 'ENpcResident' = RowForeign(0, 'ENpcResident')
+    need_rank: int_t = RowData(1)
+    need_key_item: int_t = RowData(2)
+    ooen_road_sg: int_t = RowData(3)
+    ooen_road_lyaout_id: int_t = RowData(4)
+    open_plaza_sg: int_t = RowData(5)
+    open_plaza_layout_id: int_t = RowData(6)
+    open_slope_sg: int_t = RowData(7)
+    open_slope_layout_id: int_t = RowData(8)
+    open_collision_sg: 'Behavior' = RowForeign(9, 'Behavior')
+    open_collision_layout_id: int_t = RowData(10)
+    open_obstacle_sg: 'Behavior' = RowForeign(11, 'Behavior')
+    open_obstacle_layout_id: int_t = RowData(12)
+
+
+class MYCTemporaryItem(DataRow):
+    _sign = b'MYCTemporaryItem|eJzLywMBAAkMApU='
+    sheet_name = 'MYCTemporaryItem'
+    _display = 'action'
+    ui_category: 'MYCTemporaryItemUICategory' = RowForeign(0, 'MYCTemporaryItemUICategory')
+    type: int_t = RowData(1)
+    action: 'Action' = RowForeign(2, 'Action')
+    count: int_t = RowData(3)
+    size: int_t = RowData(4)
+    sort_id: int_t = RowData(5)
+
+
+class MYCTemporaryItemUICategory(DataRow):
+    _sign = b'MYCTemporaryItemUICategory|eJwrLgYAAVsA5w=='
+    sheet_name = 'MYCTemporaryItemUICategory'
+    _display = 'name_name'
+    name_name: str_t = RowData(0)
+    name_des_name: str_t = RowData(1)
+
+
+class MYCWarResultNotebook(DataRow):
+    _sign = b'MYCWarResultNotebook|eJzLy4OA4uJiAByFBMo='
+    sheet_name = 'MYCWarResultNotebook'
+    _display = 'name_description_name'
+    sort_id: int_t = RowData(0)
+    section: int_t = RowData(1)
+    link: int_t = RowData(2)
+    unlock_quest: 'Quest' = RowForeign(3, 'Quest')
+    extra_info_quest: int_t = RowData(4)
+    thumbnail_icon: 'Icon' = IconRow(5)
+    portrait_icon: 'Icon' = IconRow(6)
+    rarity: int_t = RowData(7)
+    furigana: str_t = RowData(8)
+    name_description_name: str_t = RowData(9)
+    name_description_description: str_t = RowData(10)
+
+
+class MacroIcon(DataRow):
+    _sign = b'MacroIcon|eJzLywMAAUwA3Q=='
+    sheet_name = 'MacroIcon'
+    _display = 'icon'
+    icon: 'Icon' = IconRow(0)
+    sort_id: int_t = RowData(1)
+
+
+class MacroIcon(DataRow):
+    _sign = b'MacroIcon|eJzLAwAAbwBv'
+    sheet_name = 'MacroIcon'
+    _display = 'icon'
+    icon: 'Icon' = IconRow(0)
+
+
+class MacroIconRedirectOld(DataRow):
+    _sign = b'MacroIconRedirectOld|eJzLywMAAUwA3Q=='
+    sheet_name = 'MacroIconRedirectOld'
+    old_icon_number: 'Icon' = IconRow(0)
+    icon: 'Icon' = IconRow(1)
+
+
+class MainCommand(DataRow):
+    _sign = b'MainCommand|eJzLywOC4mIADB4DDQ=='
+    sheet_name = 'MainCommand'
+    _display = 'text_name'
+    icon: 'Icon' = IconRow(0)
+    action_menu: int_t = RowData(1)
+    category: 'MainCommandCategory' = RowForeign(2, 'MainCommandCategory')
+    sort_id: int_t = RowData(3)
+    aggregation_order: int_t = RowData(4)
+    text_name: str_t = RowData(5)
+    text_help: str_t = RowData(6)
+
+
+class MainCommandCategory(DataRow):
+    _sign = b'MainCommandCategory|eJzLKwYAAVEA4g=='
+    sheet_name = 'MainCommandCategory'
+    _display = 'text'
+    icon: int_t = RowData(0)
+    text: str_t = RowData(1)
+
+
+class MandervilleWeaponEnhance(DataRow):
+    _sign = b'MandervilleWeaponEnhance|eJzLy0MFADqABuE='
+    sheet_name = 'MandervilleWeaponEnhance'
+    type: int_t = RowData(0)
+    materia: List[int_t] = ListData(ir((1, 4, 3)), RowData)
+    primary_grade: List[int_t] = ListData(ir((2, 4, 3)), RowData)
+    secondary_grade: List[int_t] = ListData(ir((3, 4, 3)), RowData)
+    readjust_cost_item: int_t = RowData(13)
+    readjust_cost_stack: int_t = RowData(14)
+    ui_icon: int_t = RowData(15)
+
+
+class Maneuvers(DataRow):
+    _sign = b'Maneuvers|eJzLy8vLAwAEUAG5'
+    sheet_name = 'Maneuvers'
+    start_range: List[int_t] = ListData(ir((0, 2, 1)), RowData)
+    result_camera_transform: List[int_t] = ListData(ir((2, 2, 1)), RowData)
+
+
+class ManeuversArmor(DataRow):
+    _sign = b'ManeuversArmor|eJzLy8vLS8sDgeJiACFfBSs='
+    sheet_name = 'ManeuversArmor'
+    boarding_energy: int_t = RowData(0)
+    armor_name: List[int_t] = ListData(ir((1, 2, 1)), RowData)
+    boarding_limit: int_t = RowData(3)
+    final_armor: bool_t = RowData(4)
+    icon: int_t = RowData(5)
+    image: List[int_t] = ListData(ir((6, 2, 1)), RowData)
+    map_icon: List[int_t] = ListData(ir((8, 2, 1)), RowData)
+    text_name: str_t = RowData(10)
+    text_help: str_t = RowData(11)
+
+
+class Map(DataRow):
+    _sign = b'Map|eJzLywOB4jwYSEtLywMAWk4Ihg=='
+    sheet_name = 'Map'
+    _display = 'name_ui'
+    show_condition: 'MapCondition' = RowForeign(0, 'MapCondition')
+    priority_category_ui: int_t = RowData(1)
+    priority_ui: int_t = RowData(2)
+    priority_floor_ui: int_t = RowData(3)
+    map_type: int_t = RowData(4)
+    marker: int_t = RowData(5)
+    path: str_t = RowData(6)
+    scale: int_t = RowData(7)
+    offset_x: int_t = RowData(8)
+    offset_y: int_t = RowData(9)
+    category_name_ui: 'PlaceName' = RowForeign(10, 'PlaceName')
+    name_ui: 'PlaceName' = RowForeign(11, 'PlaceName')
+    floor_name_ui: 'PlaceName' = RowForeign(12, 'PlaceName')
+    discovery_index: int_t = RowData(13)
+    discovery_flag: int_t = RowData(14)
+    territory_type: 'TerritoryType' = RowForeign(15, 'TerritoryType')
+    is_uint16_discovery: bool_t = RowData(16)
+    is_event: bool_t = RowData(17)
+    is_use_exclusive: bool_t = RowData(18)
+    map_replace: int_t = RowData(19)
+
+
+class MapCondition(DataRow):
+    _sign = b'MapCondition|eJzLy8sDAAKXAUs='
+    sheet_name = 'MapCondition'
+    _display = 'quest'
+    content: int_t = RowData(0)
+    quest: 'Quest' = RowForeign(1, 'Quest')
+    quest_sequence: int_t = RowData(2)
+
+
+class MapExclusive(DataRow):
+    _sign = b'MapExclusive|eJzLywMAAUwA3Q=='
+    sheet_name = 'MapExclusive'
+    exclusive_group: int_t = RowData(0)
+    map: int_t = RowData(1)
+
+
+class MapMarker(DataRow):
+    _sign = b'MapMarker|eJzLy4MDABxnBLs='
+    sheet_name = 'MapMarker'
+    pos_x: int_t = RowData(0)
+    pos_y: int_t = RowData(1)
+    icon: 'Icon' = IconRow(2)
+    name: 'PlaceName' = RowForeign(3, 'PlaceName')
+    layout: int_t = RowData(4)
+    region: 'MapMarkerRegion' = RowForeign(5, 'MapMarkerRegion')
+    text_type: int_t = RowData(6)
+    event_type: int_t = RowData(7)
+    event_arg: 'Map|Map|Aetheryte|PlaceName' = DynamicForeign(8, ComplexSheetKey('event_type', (1, 'Map'), (2, 'Map'), (3, 'Aetheryte'), (4, 'PlaceName')))
+    event_sub_arg: int_t = RowData(9)
+    open_flag: int_t = RowData(10)
+
+
+class MapMarkerRegion(DataRow):
+    _sign = b'MapMarkerRegion|eJzLy4ODNAAhiAUh'
+    sheet_name = 'MapMarkerRegion'
+    _display = 'col1_x'
+    picture_scale: int_t = RowData(0)
+    col1_x: int_t = RowData(1)
+    col1_y: int_t = RowData(2)
+    col1_w: int_t = RowData(3)
+    col1_h: int_t = RowData(4)
+    col2_x: int_t = RowData(5)
+    col2_y: int_t = RowData(6)
+    col2_w: int_t = RowData(7)
+    col2_h: int_t = RowData(8)
+    name_x: int_t = RowData(9)
+    name_y: int_t = RowData(10)
+    link: bool_t = RowData(11)
+
+
+class MapReplace(DataRow):
+    _sign = b'MapReplace|eJzLy8vLAwAEUAG5'
+    sheet_name = 'MapReplace'
+    quest_or_reward: int_t = RowData(0)
+    quest_sequence: int_t = RowData(1)
+    replaced_map: int_t = RowData(2)
+    replaced_territory_type: int_t = RowData(3)
+
+
+class MapSymbol(DataRow):
+    _sign = b'MapSymbol|eJzLy0sDAAKPAUM='
+    sheet_name = 'MapSymbol'
+    icon: 'Icon' = IconRow(0)
+    name: 'PlaceName' = RowForeign(1, 'PlaceName')
+    display_navi: bool_t = RowData(2)
+
+
+class MapTransientPvPMap(DataRow):
+    _sign = b'MapTransientPvPMap|eJzLywMAAUwA3Q=='
+    sheet_name = 'MapTransientPvPMap'
+    pvp_map_icon: int_t = RowData(0)
+    pvp_map_scale: int_t = RowData(1)
+
+
+class MapType(DataRow):
+    _sign = b'MapType|eJzLAwAAbwBv'
+    sheet_name = 'MapType'
+    world_map: int_t = RowData(0)
+
+
+class Marker(DataRow):
+    _sign = b'Marker|eJzLyysGAAKcAVA='
+    sheet_name = 'Marker'
+    icon: 'Icon' = IconRow(0)
+    sort_id: int_t = RowData(1)
+    text: str_t = RowData(2)
+
+
+class Marker(DataRow):
+    _sign = b'Marker|eJzLKwYAAVEA4g=='
+    sheet_name = 'Marker'
+    icon: 'Icon' = IconRow(0)
+    text: str_t = RowData(1)
+
+
+class MateAuthorityCategory(DataRow):
+    _sign = b'MateAuthorityCategory|eJwrBgAAdAB0'
+    sheet_name = 'MateAuthorityCategory'
+    text_0: str_t = RowData(0)
+
+
+class Materia(DataRow):
+    _sign = b'Materia|eJzLyyMAAPEvDi8='
+    sheet_name = 'Materia'
+    item: List[int_t] = ListData(ir((0, 16, 1)), RowData)
+    param: 'BaseParam' = RowForeign(16, 'BaseParam')
+    param_value: List[int_t] = ListData(ir((17, 16, 1)), RowData)
+
+
+class Materia(DataRow):
+    _sign = b'Materia|eJzLy8MCAGNXCQc='
+    sheet_name = 'Materia'
+    item: List[int_t] = ListData(ir((0, 10, 1)), RowData)
+    param: 'BaseParam' = RowForeign(10, 'BaseParam')
+    param_value: List[int_t] = ListData(ir((11, 10, 1)), RowData)
+
+
+class MateriaGrade(DataRow):
+    _sign = b'MateriaGrade|eJzLy4MBABesBE0='
+    sheet_name = 'MateriaGrade'
+    retrive_rate: int_t = RowData(0)
+    attach_price: int_t = RowData(1)
+    attach_rate: List[int_t] = ListData(ir((2, 4, 1)), RowData)
+    attach_hq_rate: List[int_t] = ListData(ir((6, 4, 1)), RowData)
+
+
+class MateriaJoinRate(DataRow):
+    _sign = b'MateriaJoinRate|eJzLy4MAAA+AA3E='
+    sheet_name = 'MateriaJoinRate'
+    field_0: float_t = RowData(0)
+    field_1: float_t = RowData(1)
+    field_2: float_t = RowData(2)
+    field_3: float_t = RowData(3)
+    field_4: float_t = RowData(4)
+    field_5: float_t = RowData(5)
+    field_6: float_t = RowData(6)
+    field_7: float_t = RowData(7)
+
+
+class MateriaJoinRateGatherCraft(DataRow):
+    _sign = b'MateriaJoinRateGatherCraft|eJzLy4MAAA+AA3E='
+    sheet_name = 'MateriaJoinRateGatherCraft'
+    field_0: float_t = RowData(0)
+    field_1: float_t = RowData(1)
+    field_2: float_t = RowData(2)
+    field_3: float_t = RowData(3)
+    field_4: float_t = RowData(4)
+    field_5: float_t = RowData(5)
+    field_6: float_t = RowData(6)
+    field_7: float_t = RowData(7)
+
+
+class MateriaParam(DataRow):
+    _sign = b'MateriaParam|eJzLy0tLQgYANcwGPQ=='
+    sheet_name = 'MateriaParam'
+    param: int_t = RowData(0)
+    sort_id: int_t = RowData(1)
+    disp_all: bool_t = RowData(2)
+    item_role: List[bool_t] = ListData(ir((3, 13, 1)), RowData)
+
+
+class MateriaTomestoneRate(DataRow):
+    _sign = b'MateriaTomestoneRate|eJzLAwAAbwBv'
+    sheet_name = 'MateriaTomestoneRate'
+    _display = 'rate'
+    rate: int_t = RowData(0)
+
+
+class McGuffin(DataRow):
+    _sign = b'McGuffin|eJzLAwAAbwBv'
+    sheet_name = 'McGuffin'
+    ui_data: 'McGuffinUIData' = RowForeign(0, 'McGuffinUIData')
+
+
+class McGuffinUIData(DataRow):
+    _sign = b'McGuffinUIData|eJzLyysGAAKcAVA='
+    sheet_name = 'McGuffinUIData'
+    ui_sort: int_t = RowData(0)
+    icon: 'Icon' = IconRow(1)
+    name: str_t = RowData(2)
+
+
+class MiniGameRA(DataRow):
+    _sign = b'MiniGameRA|eJzLywOCtDQgSstDAABqjAlN'
+    sheet_name = 'MiniGameRA'
+    life_type: int_t = RowData(0)
+    inlay_icon: 'Icon' = IconRow(1)
+    result_icon: 'Icon' = IconRow(2)
+    bgm: 'BGM' = RowForeign(3, 'BGM')
+    bgm_change_type: int_t = RowData(4)
+    enable_life: bool_t = RowData(5)
+    enable_skip: bool_t = RowData(6)
+    max_life: int_t = RowData(7)
+    show_status: bool_t = RowData(8)
+    show_score: bool_t = RowData(9)
+    show_combo: bool_t = RowData(10)
+    great_score_rate: int_t = RowData(11)
+    result_time: int_t = RowData(12)
+    combo_bonus: int_t = RowData(13)
+    score: List[int_t] = ListData(ir((14, 4, 1)), RowData)
+    threshold: List[int_t] = ListData(ir((18, 4, 1)), RowData)
+
+
+class MiniGameRA(DataRow):
+    _sign = b'MiniGameRA|eJzLywOCtLy0tLQ8BAAAYZ8I5w=='
+    sheet_name = 'MiniGameRA'
+    life_type: int_t = RowData(0)
+    inlay_icon: 'Icon' = IconRow(1)
+    result_icon: 'Icon' = IconRow(2)
+    bgm: 'BGM' = RowForeign(3, 'BGM')
+    bgm_change_type: int_t = RowData(4)
+    enable_life: bool_t = RowData(5)
+    max_life: int_t = RowData(6)
+    show_status: bool_t = RowData(7)
+    show_score: bool_t = RowData(8)
+    show_combo: bool_t = RowData(9)
+    great_score_rate: int_t = RowData(10)
+    result_time: int_t = RowData(11)
+    combo_bonus: int_t = RowData(12)
+    score: List[int_t] = ListData(ir((13, 4, 1)), RowData)
+    threshold: List[int_t] = ListData(ir((17, 4, 1)), RowData)
+
+
+class MiniGameRANotes(DataRow):
+    _sign = b'MiniGameRANotes|eJzLywMDAAwPAwM='
+    sheet_name = 'MiniGameRANotes'
+    time: int_t = RowData(0)
+    speed: int_t = RowData(1)
+    pos_x: int_t = RowData(2)
+    pos_y: int_t = RowData(3)
+    type: int_t = RowData(4)
+    type_param: List[int_t] = ListData(ir((5, 2, 1)), RowData)
+
+
+class MiniGameTurnBreakAction(DataRow):
+    _sign = b'MiniGameTurnBreakAction|eJzLy4OA4mIAF7sEVw=='
+    sheet_name = 'MiniGameTurnBreakAction'
+    param: List[int_t] = ListData(ir((0, 2, 1)), RowData)
+    sp_cost: int_t = RowData(2)
+    recast_turn: int_t = RowData(3)
+    range_width: int_t = RowData(4)
+    range_height: int_t = RowData(5)
+    image: int_t = RowData(6)
+    score: int_t = RowData(7)
+    text_name: str_t = RowData(8)
+    text_help: str_t = RowData(9)
+
+
+class MiniGameTurnBreakConst(DataRow):
+    _sign = b'MiniGameTurnBreakConst|eJzLAwAAbwBv'
+    sheet_name = 'MiniGameTurnBreakConst'
+    value: int_t = RowData(0)
+
+
+class MiniGameTurnBreakEnemy(DataRow):
+    _sign = b'MiniGameTurnBreakEnemy|eJzLy8vLS8uDgDQoyEMFAAkODsM='
+    sheet_name = 'MiniGameTurnBreakEnemy'
+    hp: int_t = RowData(0)
+    attack: int_t = RowData(1)
+    move: int_t = RowData(2)
+    move_param: int_t = RowData(3)
+    boss: bool_t = RowData(4)
+    sp_drop: int_t = RowData(5)
+    bp_drop: int_t = RowData(6)
+    score: int_t = RowData(7)
+    image: int_t = RowData(8)
+    width: int_t = RowData(9)
+    height: int_t = RowData(10)
+    status: int_t = RowData(11)
+    gambit_bofore_move: List[bool_t] = ListData(ir((12, 4, 1)), RowData)
+    gambit_after_move: List[bool_t] = ListData(ir((16, 4, 1)), RowData)
+    gambit_action: List[int_t] = ListData(ir((20, 4, 1)), RowData)
+    gambit_cond: List[int_t] = ListData(ir((24, 4, 1)), RowData)
+    gambit_cond_param: List[int_t] = ListData(ir((28, 4, 1)), RowData)
+    pop_timeline: int_t = RowData(32)
+    idling_timeline: int_t = RowData(33)
+    dead_timeline: int_t = RowData(34)
+
+
+class MiniGameTurnBreakPop(DataRow):
+    _sign = b'MiniGameTurnBreakPop|eJzLy8vLAwAEUAG5'
+    sheet_name = 'MiniGameTurnBreakPop'
+    turn: int_t = RowData(0)
+    address: int_t = RowData(1)
+    offset: int_t = RowData(2)
+    enemy: int_t = RowData(3)
+
+
+class MiniGameTurnBreakPopOffset(DataRow):
+    _sign = b'MiniGameTurnBreakPopOffset|eJzLy4MAAA+AA3E='
+    sheet_name = 'MiniGameTurnBreakPopOffset'
+    offset: List[int_t] = ListData(ir((0, 8, 1)), RowData)
+
+
+class MiniGameTurnBreakStage(DataRow):
+    _sign = b'MiniGameTurnBreakStage|eJzLy4MBABesBE0='
+    sheet_name = 'MiniGameTurnBreakStage'
+    sp_drop_every_turn: int_t = RowData(0)
+    reward_score: int_t = RowData(1)
+    skill: List[int_t] = ListData(ir((2, 8, 1)), RowData)
+
+
+class MiniGameTurnBreakStatus(DataRow):
+    _sign = b'MiniGameTurnBreakStatus|eJzLy0vLKy4GAAj7Apc='
+    sheet_name = 'MiniGameTurnBreakStatus'
+    param: int_t = RowData(0)
+    effect_turn: int_t = RowData(1)
+    is_buff: bool_t = RowData(2)
+    image: int_t = RowData(3)
+    text_name: str_t = RowData(4)
+    text_help: str_t = RowData(5)
+
+
+class MinionRace(DataRow):
+    _sign = b'MinionRace|eJwrBgAAdAB0'
+    sheet_name = 'MinionRace'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class MinionRules(DataRow):
+    _sign = b'MinionRules|eJwrLgYAAVsA5w=='
+    sheet_name = 'MinionRules'
+    _display = 'rule'
+    rule: str_t = RowData(0)
+    description: str_t = RowData(1)
+
+
+class MinionSkillType(DataRow):
+    _sign = b'MinionSkillType|eJwrBgAAdAB0'
+    sheet_name = 'MinionSkillType'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class MinionStage(DataRow):
+    _sign = b'MinionStage|eJwrTssDAAKWAUg='
+    sheet_name = 'MinionStage'
+    text: str_t = RowData(0)
+    boss: bool_t = RowData(1)
+    bgm: int_t = RowData(2)
+
+
+class MirageStoreSetItem(DataRow):
+    _sign = b'MirageStoreSetItem|eJzLy4MDABxnBLs='
+    sheet_name = 'MirageStoreSetItem'
+    field_0: int_t = RowData(0)
+    field_1: int_t = RowData(1)
+    field_2: int_t = RowData(2)
+    field_3: int_t = RowData(3)
+    field_4: int_t = RowData(4)
+    field_5: int_t = RowData(5)
+    field_6: int_t = RowData(6)
+    field_7: int_t = RowData(7)
+    field_8: int_t = RowData(8)
+    field_9: int_t = RowData(9)
+    field_10: int_t = RowData(10)
+
+
+class MobHuntOrder(DataRow):
+    _sign = b'MobHuntOrder|eJzLywMCAAZ3Aic='
+    sheet_name = 'MobHuntOrder'
+    target: 'MobHuntTarget' = RowForeign(0, 'MobHuntTarget')
+    needed_kills: int_t = RowData(1)
+    rank: int_t = RowData(2)
+    star_rank: int_t = RowData(3)
+    reward: 'MobHuntReward' = RowForeign(4, 'MobHuntReward')
+
+
+class MobHuntOrderType(DataRow):
+    _sign = b'MobHuntOrderType|eJzLywMCAAZ3Aic='
+    sheet_name = 'MobHuntOrderType'
+    order_cycle: int_t = RowData(0)
+    quest: 'Quest' = RowForeign(1, 'Quest')
+    event_item: 'EventItem' = RowForeign(2, 'EventItem')
+    order_begin: 'MobHuntOrder' = RowForeign(3, 'MobHuntOrder')
+    order_number: int_t = RowData(4)
+
+
+class MobHuntReward(DataRow):
+    _sign = b'MobHuntReward|eJzLy8vLAwAEUAG5'
+    sheet_name = 'MobHuntReward'
+    exp: int_t = RowData(0)
+    gil: int_t = RowData(1)
+    seal_type: 'ExVersion' = RowForeign(2, 'ExVersion')
+    seal_value: int_t = RowData(3)
+
+
+class MobHuntRewardCap(DataRow):
+    _sign = b'MobHuntRewardCap|eJzLAwAAbwBv'
+    sheet_name = 'MobHuntRewardCap'
+    exp: int_t = RowData(0)
+
+
+class MobHuntTarget(DataRow):
+    _sign = b'MobHuntTarget|eJzLywMCAAZ3Aic='
+    sheet_name = 'MobHuntTarget'
+    _display = 'monster'
+    monster: 'BNpcName' = RowForeign(0, 'BNpcName')
+    fate: 'Fate' = RowForeign(1, 'Fate')
+    icon: 'Icon' = IconRow(2)
+    zone_name: 'Map' = RowForeign(3, 'Map')
+    area_name: 'PlaceName' = RowForeign(4, 'PlaceName')
+
+
+class ModelAttribute(DataRow):
+    _sign = b'ModelAttribute|eJwrBgAAdAB0'
+    sheet_name = 'ModelAttribute'
+    name: str_t = RowData(0)
+
+
+class ModelChara(DataRow):
+    _sign = b'ModelChara|eJzLywOBtDQQBoK8NBAXAGDfCMc='
+    sheet_name = 'ModelChara'
+    model_type: int_t = RowData(0)
+    skeleton_id: int_t = RowData(1)
+    pattern_id: int_t = RowData(2)
+    ime_chan_id: int_t = RowData(3)
+    se_pack: int_t = RowData(4)
+    pap_variation: int_t = RowData(5)
+    no_shadow: bool_t = RowData(6)
+    nameplate_in_offset_range: bool_t = RowData(7)
+    nameplate_camera_offset: int_t = RowData(8)
+    nameplate_y_offset: int_t = RowData(9)
+    dead_clear_action_timeline: bool_t = RowData(10)
+    force_visible: bool_t = RowData(11)
+    larger_than_radius: bool_t = RowData(12)
+    vfx_decal: bool_t = RowData(13)
+    disable_selected_edge: bool_t = RowData(14)
+    alpha: int_t = RowData(15)
+    disable_look_at: bool_t = RowData(16)
+    add_damage_weight_rate: int_t = RowData(17)
+    condition_clip_stop: int_t = RowData(18)
+    radius: float_t = RowData(19)
+    offset_y: float_t = RowData(20)
+
+
+class ModelChara(DataRow):
+    _sign = b'ModelChara|eJzLywOBtDQQBoI8ICMPAFgYCFk='
+    sheet_name = 'ModelChara'
+    model_type: int_t = RowData(0)
+    skeleton_id: int_t = RowData(1)
+    pattern_id: int_t = RowData(2)
+    ime_chan_id: int_t = RowData(3)
+    se_pack: int_t = RowData(4)
+    pap_variation: int_t = RowData(5)
+    no_shadow: bool_t = RowData(6)
+    nameplate_in_offset_range: bool_t = RowData(7)
+    nameplate_camera_offset: int_t = RowData(8)
+    nameplate_y_offset: int_t = RowData(9)
+    dead_clear_action_timeline: bool_t = RowData(10)
+    force_visible: bool_t = RowData(11)
+    larger_than_radius: bool_t = RowData(12)
+    vfx_decal: bool_t = RowData(13)
+    disable_selected_edge: bool_t = RowData(14)
+    alpha: int_t = RowData(15)
+    disable_look_at: bool_t = RowData(16)
+    add_damage_weight_rate: int_t = RowData(17)
+    radius: float_t = RowData(18)
+    offset_y: float_t = RowData(19)
+
+
+class ModelScale(DataRow):
+    _sign = b'ModelScale|eJzLAwAAbwBv'
+    sheet_name = 'ModelScale'
+    scale: float_t = RowData(0)
+
+
+class ModelSkeleton(DataRow):
+    _sign = b'ModelSkeleton|eJzLy0MBaXkAQb8HRw=='
+    sheet_name = 'ModelSkeleton'
+    radius: float_t = RowData(0)
+    vfx_scale: float_t = RowData(1)
+    foot_scale: float_t = RowData(2)
+    walk_speed: int_t = RowData(3)
+    run_speed: int_t = RowData(4)
+    walk_motion_min: int_t = RowData(5)
+    walk_motion_max: int_t = RowData(6)
+    run_motion_min: int_t = RowData(7)
+    run_motion_max: int_t = RowData(8)
+    float_height: List[int_t] = ListData(ir((9, 2, 1)), RowData)
+    float_down: float_t = RowData(11)
+    float_up: float_t = RowData(12)
+    diving_float_height: int_t = RowData(13)
+    motion_blend_type: int_t = RowData(14)
+    loop_fly_se: bool_t = RowData(15)
+    auto_attack_type: int_t = RowData(16)
+
+
+class ModelState(DataRow):
+    _sign = b'ModelState|eJzLywMAAUwA3Q=='
+    sheet_name = 'ModelState'
+    _display = 'timeline'
+    type: int_t = RowData(0)
+    timeline: 'ActionTimeline' = RowForeign(1, 'ActionTimeline')
+
+
+class MonsterNote(DataRow):
+    _sign = b'MonsterNote|eJzLy4OCYgAXsQRS'
+    sheet_name = 'MonsterNote'
+    _display = 'text'
+    target: List[int_t] = ListData(ir((0, 4, 1)), RowData)
+    needed_kills: List[int_t] = ListData(ir((4, 4, 1)), RowData)
+    reward_exp: int_t = RowData(8)
+    text: str_t = RowData(9)
+
+
+class MonsterNoteTarget(DataRow):
+    _sign = b'MonsterNoteTarget|eJzLy4MCABNfA98='
+    sheet_name = 'MonsterNoteTarget'
+    _display = 'monster'
+    monster: 'BNpcName' = RowForeign(0, 'BNpcName')
+    icon: 'Icon' = IconRow(1)
+    town: 'Town' = RowForeign(2, 'Town')
+    zone_name: List[int_t] = ListData(ir((3, 3, 2)), RowData)
+    area_name: List[int_t] = ListData(ir((4, 3, 2)), RowData)
+
+
+class MotionTimeline(DataRow):
+    _sign = b'MotionTimeline|eJwrzktLSwMABmACFA=='
+    sheet_name = 'MotionTimeline'
+    filename: str_t = RowData(0)
+    blend_group: int_t = RowData(1)
+    is_loop: bool_t = RowData(2)
+    is_blink_enable: bool_t = RowData(3)
+    is_lip_enable: bool_t = RowData(4)
+
+
+class MotionTimelineAdvanceBlend(DataRow):
+    _sign = b'MotionTimelineAdvanceBlend|eJwrLgYAAVsA5w=='
+    sheet_name = 'MotionTimelineAdvanceBlend'
+    motion_timeline_name: str_t = RowData(0)
+    next_motion_timeline_name: str_t = RowData(1)
+
+
+class MotionTimelineBlendTable(DataRow):
+    _sign = b'MotionTimelineBlendTable|eJzLywMBAAkMApU='
+    sheet_name = 'MotionTimelineBlendTable'
+    dest_blend_group: int_t = RowData(0)
+    src_blend_group: int_t = RowData(1)
+    blend_frame__pc: int_t = RowData(2)
+    blend_frame__type_a: int_t = RowData(3)
+    blend_frame__type_b: int_t = RowData(4)
+    blend_frame__type_c: int_t = RowData(5)
+
+
+class Mount(DataRow):
+    _sign = b'Mount|eJwrzivOQwXFxUCRtDQUsTQQAFEA5bYUBA=='
+    sheet_name = 'Mount'
+    _display = 'text_sgl'
+    text_sgl: str_t = RowData(0)
+    text_sgg: int_t = RowData(1)
+    text_plr: str_t = RowData(2)
+    text_plg: int_t = RowData(3)
+    text_vow: int_t = RowData(4)
+    text_cnt: int_t = RowData(5)
+    text_gen: int_t = RowData(6)
+    text_def_: int_t = RowData(7)
+    model: 'ModelChara' = RowForeign(8, 'ModelChara')
+    control: int_t = RowData(9)
+    flying_condition: 'MountFlyingCondition' = RowForeign(10, 'MountFlyingCondition')
+    fly_motion_pitch_limit: int_t = RowData(11)
+    glide_front: int_t = RowData(12)
+    glide_front_diving: int_t = RowData(13)
+    fly_effect: int_t = RowData(14)
+    glide_effect: int_t = RowData(15)
+    customize: 'MountCustomize' = RowForeign(16, 'MountCustomize')
+    bgm: 'BGM' = RowForeign(17, 'BGM')
+    call_se: str_t = RowData(18)
+    call_false_se: str_t = RowData(19)
+    exit_se: str_t = RowData(20)
+    exit_move_dist: int_t = RowData(21)
+    exit_move_speed: int_t = RowData(22)
+    hide_parts: bool_t = RowData(23)
+    is_emote: bool_t = RowData(24)
+    equip_head: int_t = RowData(25)
+    equip_body: int_t = RowData(26)
+    equip_leg: int_t = RowData(27)
+    equip_foot: int_t = RowData(28)
+    save_index: int_t = RowData(29)
+    icon: 'Icon' = IconRow(30)
+    ui_priority: int_t = RowData(31)
+    radius_rate: int_t = RowData(32)
+    base_motion_speed__run: int_t = RowData(33)
+    base_motion_speed__walk: int_t = RowData(34)
+    diving_motion_speed: int_t = RowData(35)
+    link_num: int_t = RowData(36)
+    action: 'MountAction' = RowForeign(37, 'MountAction')
+    is_float: bool_t = RowData(38)
+    ex_hotbar_enable_config: bool_t = RowData(39)
+    is_display_ep: bool_t = RowData(40)
+    is_auto_gt: bool_t = RowData(41)
+    not_move_can_turn: bool_t = RowData(42)
+    strife_angle: int_t = RowData(43)
+    strife_angle_flying_or_diving: int_t = RowData(44)
+    disable_dismount_button: bool_t = RowData(45)
+    hide_head_equip: bool_t = RowData(46)
+
+
+class MountAction(DataRow):
+    _sign = b'MountAction|eJzLywMBAAkMApU='
+    sheet_name = 'MountAction'
+    action: List[int_t] = ListData(ir((0, 6, 1)), RowData)
+
+
+class MountCustomize(DataRow):
+    _sign = b'MountCustomize|eJxLyyMCAAAtHg/f'
+    sheet_name = 'MountCustomize'
+    height_scale: bool_t = RowData(0)
+    scale: List[int_t] = ListData(ir((1, 18, 1)), RowData)
+    camera_scale_y: List[int_t] = ListData(ir((19, 18, 1)), RowData)
+
+
+class MountFlyingCondition(DataRow):
+    _sign = b'MountFlyingCondition|eJzLAwAAbwBv'
+    sheet_name = 'MountFlyingCondition'
+    _display = 'quest'
+    quest: 'Quest' = RowForeign(0, 'Quest')
+
+
+class MountSpeed(DataRow):
+    _sign = b'MountSpeed|eJzLy8sDAAKXAUs='
+    sheet_name = 'MountSpeed'
+    _display = 'condition'
+    condition: 'List[Quest]' = ListData(ir((0, 2, 1)), RowForeign, 'Quest')
+    sort_key: int_t = RowData(2)
+
+
+class MountTransient(DataRow):
+    _sign = b'MountTransient|eJwrLi4GAAK1AVo='
+    sheet_name = 'MountTransient'
+    text_help: str_t = RowData(0)
+    text_expository: str_t = RowData(1)
+    text_cry: str_t = RowData(2)
+
+
+class MoveControl(DataRow):
+    _sign = b'MoveControl|eJzLy4MBABesBE0='
+    sheet_name = 'MoveControl'
+    accel: List[float_t] = ListData(ir((0, 2, 1)), RowData)
+    speed: List[float_t] = ListData(ir((2, 2, 1)), RowData)
+    speed_lr: List[float_t] = ListData(ir((4, 2, 1)), RowData)
+    speed_back: float_t = RowData(6)
+    rotate_accel: List[int_t] = ListData(ir((7, 2, 1)), RowData)
+    battle_speed: int_t = RowData(9)
+
+
+class MoveTimeline(DataRow):
+    _sign = b'MoveTimeline|eJzLy4MBABesBE0='
+    sheet_name = 'MoveTimeline'
+    _display = 'idle'
+    idle: 'ActionTimeline' = RowForeign(0, 'ActionTimeline')
+    move_front: 'ActionTimeline' = RowForeign(1, 'ActionTimeline')
+    move_back: 'ActionTimeline' = RowForeign(2, 'ActionTimeline')
+    move_left: 'ActionTimeline' = RowForeign(3, 'ActionTimeline')
+    move_right: 'ActionTimeline' = RowForeign(4, 'ActionTimeline')
+    move_up: 'ActionTimeline' = RowForeign(5, 'ActionTimeline')
+    move_down: 'ActionTimeline' = RowForeign(6, 'ActionTimeline')
+    turn_left: 'ActionTimeline' = RowForeign(7, 'ActionTimeline')
+    turn_right: 'ActionTimeline' = RowForeign(8, 'ActionTimeline')
+    idle_to_move_front: 'ActionTimeline' = RowForeign(9, 'ActionTimeline')
+
+
+class MoveVfx(DataRow):
+    _sign = b'MoveVfx|eJzLywMAAUwA3Q=='
+    sheet_name = 'MoveVfx'
+    _display = 'flying'
+    flying: 'VFX' = RowForeign(0, 'VFX')
+    diving: 'VFX' = RowForeign(1, 'VFX')
+
+
+class MovieStaffList(DataRow):
+    _sign = b'MovieStaffList|eJzLy8vLAwAEUAG5'
+    sheet_name = 'MovieStaffList'
+    icon: 'Icon' = IconRow(0)
+    fade_in: float_t = RowData(1)
+    fade_out: float_t = RowData(2)
+    fade_type: int_t = RowData(3)
+
+
+class MovieSubtitle(DataRow):
+    _sign = b'MovieSubtitle|eJzLywMAAUwA3Q=='
+    sheet_name = 'MovieSubtitle'
+    time_start_time: float_t = RowData(0)
+    time_end_time: float_t = RowData(1)
+
+
+class MovieSubtitle500(DataRow):
+    _sign = b'MovieSubtitle500|eJzLywMAAUwA3Q=='
+    sheet_name = 'MovieSubtitle500'
+    start_time: float_t = RowData(0)
+    end_time: float_t = RowData(1)
+
+
+class MovieSubtitleVoyage(DataRow):
+    _sign = b'MovieSubtitleVoyage|eJzLywMAAUwA3Q=='
+    sheet_name = 'MovieSubtitleVoyage'
+    start_time: float_t = RowData(0)
+    end_time: float_t = RowData(1)
+
+
+class MultipleHelp(DataRow):
+    _sign = b'MultipleHelp|eJzLKy4GAAKmAVU='
+    sheet_name = 'MultipleHelp'
+    page: int_t = RowData(0)
+    text_title: str_t = RowData(1)
+    text_subtitle: str_t = RowData(2)
+
+
+class MultipleHelpPage(DataRow):
+    _sign = b'MultipleHelpPage|eJzLAwAAbwBv'
+    sheet_name = 'MultipleHelpPage'
+    text: int_t = RowData(0)
+
+
+class MultipleHelpString(DataRow):
+    _sign = b'MultipleHelpString|eJwrLgYAAVsA5w=='
+    sheet_name = 'MultipleHelpString'
+    text_title: str_t = RowData(0)
+    text_body: str_t = RowData(1)
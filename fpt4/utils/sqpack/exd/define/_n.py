@@ -0,0 +1,78 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class NotebookDivision(DataRow):
+    _sign = b'NotebookDivision|eJwrzgOBtCQoAAAx8gYQ'
+    sheet_name = 'NotebookDivision'
+    _display = 'text'
+    text: str_t = RowData(0)
+    notebook_division_category: 'NotebookDivisionCategory' = RowForeign(1, 'NotebookDivisionCategory')
+    craft_opening_level: int_t = RowData(2)
+    gathering_opening_level: int_t = RowData(3)
+    need_complete_quest: 'Quest' = RowForeign(4, 'Quest')
+    special_recipe_sort_in_category: int_t = RowData(5)
+    is_special_recipe: bool_t = RowData(6)
+    can_use_craft: List[bool_t] = ListData(ir((7, 8, 1)), RowData)
+
+
+class NotebookDivisionCategory(DataRow):
+    _sign = b'NotebookDivisionCategory|eJwrzgMAAVYA4g=='
+    sheet_name = 'NotebookDivisionCategory'
+    _display = 'text'
+    text: str_t = RowData(0)
+    sort: int_t = RowData(1)
+
+
+class NotebookList(DataRow):
+    _sign = b'NotebookList|eJzLywMAAUwA3Q=='
+    sheet_name = 'NotebookList'
+    num_0: int_t = RowData(0)
+    num_1: int_t = RowData(1)
+
+
+class NotoriousMonster(DataRow):
+    _sign = b'NotoriousMonster|eJzLy8vLAwAEUAG5'
+    sheet_name = 'NotoriousMonster'
+    base_id: 'BNpcBase' = RowForeign(0, 'BNpcBase')
+    rank: int_t = RowData(1)
+    name_id: 'BNpcName' = RowForeign(2, 'BNpcName')
+    resident: int_t = RowData(3)
+
+
+class NotoriousMonsterTerritory(DataRow):
+    _sign = b'NotoriousMonsterTerritory|eJzLy4MBABesBE0='
+    sheet_name = 'NotoriousMonsterTerritory'
+    nm_labels_nm_label: List[int_t] = ListData(ir((0, 10, 1)), RowData)
+
+
+class NpcEquip(DataRow):
+    _sign = b'NpcEquip|eJzLywOBtDwMAACLJwq3'
+    sheet_name = 'NpcEquip'
+    weapon_model: int_t = RowData(0)
+    weapon_stain: 'Stain' = RowForeign(1, 'Stain')
+    sub_weapon_model: int_t = RowData(2)
+    sub_weapon_stain: 'Stain' = RowForeign(3, 'Stain')
+    equip: List[int_t] = ListData([4, 7, 9, 11, 13, 15, 17, 19, 21, 23], RowData)
+    stain: 'List[Stain]' = ListData([5, 8, 10, 12, 14, 16, 18, 20, 22, 24], RowForeign, 'Stain')
+    visor: bool_t = RowData(6)
+
+
+class NpcYell(DataRow):
+    _sign = b'NpcYell|eJzLS0tLy8sD4WIAG0wEmA=='
+    sheet_name = 'NpcYell'
+    _display = 'npc_text'
+    name_id: int_t = RowData(0)
+    is_no_name: bool_t = RowData(1)
+    is_name_addon_text: bool_t = RowData(2)
+    event_target_say: bool_t = RowData(3)
+    output_type: int_t = RowData(4)
+    balloon_time: float_t = RowData(5)
+    is_balloon_timely_disable: bool_t = RowData(6)
+    is_balloon_immediately: bool_t = RowData(7)
+    battle_talk_time: int_t = RowData(8)
+    element_id: int_t = RowData(9)
+    npc_text: str_t = RowData(10)
@@ -0,0 +1,208 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class Omen(DataRow):
+    _sign = b'Omen|eJwrLs5LS8sDAAkbAo8='
+    sheet_name = 'Omen'
+    _display = 'path'
+    path: str_t = RowData(0)
+    path_ally: str_t = RowData(1)
+    type: int_t = RowData(2)
+    restrict_y_scale: bool_t = RowData(3)
+    large_scale: bool_t = RowData(4)
+    max_y_scale: int_t = RowData(5)
+
+
+class Omikuji(DataRow):
+    _sign = b'Omikuji|eJzLywOC4mIADB4DDQ=='
+    sheet_name = 'Omikuji'
+    guidance1: int_t = RowData(0)
+    guidance2: int_t = RowData(1)
+    guidance3: int_t = RowData(2)
+    guidance4: int_t = RowData(3)
+    guidance5: int_t = RowData(4)
+    text_title: str_t = RowData(5)
+    text_subtitle: str_t = RowData(6)
+
+
+class OmikujiGuidance(DataRow):
+    _sign = b'OmikujiGuidance|eJxLKy4GAAKOAU0='
+    sheet_name = 'OmikujiGuidance'
+    lottery: bool_t = RowData(0)
+    text_text_header: str_t = RowData(1)
+    text_text_main: str_t = RowData(2)
+
+
+class OnlineStatus(DataRow):
+    _sign = b'OnlineStatus|eJxLS0vLy8srBgALhALw'
+    sheet_name = 'OnlineStatus'
+    _display = 'text'
+    high_prio: bool_t = RowData(0)
+    list: bool_t = RowData(1)
+    hide_content: bool_t = RowData(2)
+    list_order: int_t = RowData(3)
+    icon: 'Icon' = IconRow(4)
+    addon: int_t = RowData(5)
+    text: str_t = RowData(6)
+
+
+class OnlineStatus(DataRow):
+    _sign = b'OnlineStatus|eJxLS8srzgMABjkCHA=='
+    sheet_name = 'OnlineStatus'
+    _display = 'text'
+    list: bool_t = RowData(0)
+    hide_content: bool_t = RowData(1)
+    list_order: int_t = RowData(2)
+    text: str_t = RowData(3)
+    icon: 'Icon' = IconRow(4)
+
+
+class OpenContent(DataRow):
+    _sign = b'OpenContent|eJzLy8MPAOMADcE='
+    sheet_name = 'OpenContent'
+    field_0: int_t = RowData(0)
+    field_1: int_t = RowData(1)
+    field_2: int_t = RowData(2)
+    field_3: int_t = RowData(3)
+    field_4: int_t = RowData(4)
+    field_5: int_t = RowData(5)
+    field_6: int_t = RowData(6)
+    field_7: int_t = RowData(7)
+    field_8: int_t = RowData(8)
+    field_9: int_t = RowData(9)
+    field_10: int_t = RowData(10)
+    field_11: int_t = RowData(11)
+    field_12: int_t = RowData(12)
+    field_13: int_t = RowData(13)
+    field_14: int_t = RowData(14)
+    field_15: int_t = RowData(15)
+    field_16: int_t = RowData(16)
+    field_17: int_t = RowData(17)
+    field_18: int_t = RowData(18)
+    field_19: int_t = RowData(19)
+    field_20: int_t = RowData(20)
+    field_21: int_t = RowData(21)
+    field_22: int_t = RowData(22)
+    field_23: int_t = RowData(23)
+    field_24: int_t = RowData(24)
+    field_25: int_t = RowData(25)
+    field_26: int_t = RowData(26)
+    field_27: int_t = RowData(27)
+    field_28: int_t = RowData(28)
+    field_29: int_t = RowData(29)
+    field_30: int_t = RowData(30)
+    field_31: int_t = RowData(31)
+
+
+class OpenContentCandidateName(DataRow):
+    _sign = b'OpenContentCandidateName|eJwrBgAAdAB0'
+    sheet_name = 'OpenContentCandidateName'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class OpenLuaUI(DataRow):
+    _sign = b'OpenLuaUI|eJwrBgAAdAB0'
+    sheet_name = 'OpenLuaUI'
+    lua_define: str_t = RowData(0)
+
+
+class Opening(DataRow):
+    _sign = b'Opening|eJwrzismEuQRCQDntSQK'
+    sheet_name = 'Opening'
+    _display = 'script'
+    script: str_t = RowData(0)
+    quest: 'Quest' = RowForeign(1, 'Quest')
+    define_name: List[str_t] = ListData(ir((2, 40, 1)), RowData)
+    define_value: List[int_t] = ListData(ir((42, 40, 1)), RowData)
+
+
+class OpeningSystemDefine(DataRow):
+    _sign = b'OpeningSystemDefine|eJwrzgMAAVYA4g=='
+    sheet_name = 'OpeningSystemDefine'
+    define_name: str_t = RowData(0)
+    define_value: int_t = RowData(1)
+
+
+class Orchestrion(DataRow):
+    _sign = b'Orchestrion|eJwrLgYAAVsA5w=='
+    sheet_name = 'Orchestrion'
+    title_text: str_t = RowData(0)
+    title_hint_text: str_t = RowData(1)
+
+
+class OrchestrionCategory(DataRow):
+    _sign = b'OrchestrionCategory|eJwrzsvLSwMABogCJA=='
+    sheet_name = 'OrchestrionCategory'
+    _display = 'text'
+    text: str_t = RowData(0)
+    variable: int_t = RowData(1)
+    icon: 'Icon' = IconRow(2)
+    sort: int_t = RowData(3)
+    is_list_wide: bool_t = RowData(4)
+
+
+class OrchestrionPath(DataRow):
+    _sign = b'OrchestrionPath|eJwrBgAAdAB0'
+    sheet_name = 'OrchestrionPath'
+    path: str_t = RowData(0)
+
+
+class OrchestrionUiparam(DataRow):
+    _sign = b'OrchestrionUiparam|eJzLywMAAUwA3Q=='
+    sheet_name = 'OrchestrionUiparam'
+    category: 'OrchestrionCategory' = RowForeign(0, 'OrchestrionCategory')
+    track_no: int_t = RowData(1)
+
+
+class Ornament(DataRow):
+    _sign = b'Ornament|eJzLy4OAYiAEAQA6xgbr'
+    sheet_name = 'Ornament'
+    _display = 'text_sgl'
+    model: int_t = RowData(0)
+    customize_group: int_t = RowData(1)
+    special: int_t = RowData(2)
+    pose_emote_stance: int_t = RowData(3)
+    action: int_t = RowData(4)
+    save_index: int_t = RowData(5)
+    icon: 'Icon' = IconRow(6)
+    ui_priority: int_t = RowData(7)
+    text_sgl: str_t = RowData(8)
+    text_sgg: int_t = RowData(9)
+    text_plr: str_t = RowData(10)
+    text_plg: int_t = RowData(11)
+    text_vow: int_t = RowData(12)
+    text_cnt: int_t = RowData(13)
+    text_gen: int_t = RowData(14)
+    text_def_: int_t = RowData(15)
+
+
+class OrnamentAction(DataRow):
+    _sign = b'OrnamentAction|eJzLywMBAAkMApU='
+    sheet_name = 'OrnamentAction'
+    action: List[int_t] = ListData(ir((0, 6, 1)), RowData)
+
+
+class OrnamentCustomize(DataRow):
+    _sign = b'OrnamentCustomize|eJzLywMDAAwPAwM='
+    sheet_name = 'OrnamentCustomize'
+    scale: int_t = RowData(0)
+    translation: List[int_t] = ListData(ir((1, 3, 1)), RowData)
+    rotation: List[int_t] = ListData(ir((4, 3, 1)), RowData)
+
+
+class OrnamentCustomizeGroup(DataRow):
+    _sign = b'OrnamentCustomizeGroup|eJzLy8MAAFG3CCs='
+    sheet_name = 'OrnamentCustomizeGroup'
+    attach_e_id: int_t = RowData(0)
+    customize: List[int_t] = ListData(ir((1, 18, 1)), RowData)
+
+
+class OrnamentTransient(DataRow):
+    _sign = b'OrnamentTransient|eJwrBgAAdAB0'
+    sheet_name = 'OrnamentTransient'
+    text: str_t = RowData(0)
@@ -0,0 +1,434 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class ParamGrow(DataRow):
+    _sign = b'ParamGrow|eJzLy0MBADOfBnM='
+    sheet_name = 'ParamGrow'
+    next_exp: int_t = RowData(0)
+    apply_action: int_t = RowData(1)
+    apply_action_battle: int_t = RowData(2)
+    base_exp: int_t = RowData(3)
+    mp: int_t = RowData(4)
+    param_base: int_t = RowData(5)
+    param_base_rating: int_t = RowData(6)
+    event_exp_rate: int_t = RowData(7)
+    repair_exp: int_t = RowData(8)
+    monster_note_exp: int_t = RowData(9)
+    monster_note_seals: int_t = RowData(10)
+    sync_item_level: int_t = RowData(11)
+    proper_dungeon: int_t = RowData(12)
+    proper_guild_order: int_t = RowData(13)
+    refine_item_level: int_t = RowData(14)
+
+
+class PartyContent(DataRow):
+    _sign = b'PartyContent|eJzLy0vLIwQAHU8PcQ=='
+    sheet_name = 'PartyContent'
+    _display = 'content_finder_condition'
+    type: int_t = RowData(0)
+    time: int_t = RowData(1)
+    name: bool_t = RowData(2)
+    text_start: 'PartyContentTextData' = RowForeign(3, 'PartyContentTextData')
+    text_end: 'PartyContentTextData' = RowForeign(4, 'PartyContentTextData')
+    entrance_shield: List[int_t] = ListData(ir((5, 9, 1)), RowData)
+    entrance_exit: List[int_t] = ListData(ir((14, 9, 1)), RowData)
+    entrance_exit_obj: List[int_t] = ListData(ir((23, 9, 1)), RowData)
+    data_index: int_t = RowData(32)
+    content_finder_condition: 'ContentFinderCondition' = RowForeign(33, 'ContentFinderCondition')
+    image: 'Icon' = IconRow(34)
+    sortkey: int_t = RowData(35)
+
+
+class PartyContentCutscene(DataRow):
+    _sign = b'PartyContentCutscene|eJzLywMAAUwA3Q=='
+    sheet_name = 'PartyContentCutscene'
+    cutscene_id: 'List[Cutscene]' = ListData(ir((0, 2, 1)), RowForeign, 'Cutscene')
+
+
+class PartyContentTextData(DataRow):
+    _sign = b'PartyContentTextData|eJwrBgAAdAB0'
+    sheet_name = 'PartyContentTextData'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class PartyContentTransient(DataRow):
+    _sign = b'PartyContentTransient|eJwrBgAAdAB0'
+    sheet_name = 'PartyContentTransient'
+    text_0: str_t = RowData(0)
+
+
+class PatchMark(DataRow):
+    _sign = b'PatchMark|eJzLy4MAAA+AA3E='
+    sheet_name = 'PatchMark'
+    category: int_t = RowData(0)
+    sub_category_type: int_t = RowData(1)
+    sub_category: int_t = RowData(2)
+    conditon: int_t = RowData(3)
+    condition_value: int_t = RowData(4)
+    mark_id: int_t = RowData(5)
+    group_no: int_t = RowData(6)
+    version: int_t = RowData(7)
+
+
+class Perform(DataRow):
+    _sign = b'Perform|eJwrTsuDgGIgBgAnHAWZ'
+    sheet_name = 'Perform'
+    _display = 'sound'
+    sound: str_t = RowData(0)
+    loop_flag: bool_t = RowData(1)
+    model: int_t = RowData(2)
+    start_timeline: 'ActionTimeline' = RowForeign(3, 'ActionTimeline')
+    end_timeline: 'ActionTimeline' = RowForeign(4, 'ActionTimeline')
+    idle_timeline: 'ActionTimeline' = RowForeign(5, 'ActionTimeline')
+    timeline_timeline: 'List[ActionTimeline]' = ListData(ir((6, 2, 1)), RowForeign, 'ActionTimeline')
+    reward: 'ActionTimeline' = RowForeign(8, 'ActionTimeline')
+    text: str_t = RowData(9)
+    icon: int_t = RowData(10)
+    ui_priority: 'PerformTransient' = RowForeign(11, 'PerformTransient')
+    group_id: int_t = RowData(12)
+
+
+class PerformGroup(DataRow):
+    _sign = b'PerformGroup|eJzLywMCAAZ3Aic='
+    sheet_name = 'PerformGroup'
+    perform: List[int_t] = ListData(ir((0, 5, 1)), RowData)
+
+
+class PerformGuideScore(DataRow):
+    _sign = b'PerformGuideScore|eJwrzisGAAKrAVU='
+    sheet_name = 'PerformGuideScore'
+    path: str_t = RowData(0)
+    sort_priority: int_t = RowData(1)
+    text: str_t = RowData(2)
+
+
+class PerformTransient(DataRow):
+    _sign = b'PerformTransient|eJwrBgAAdAB0'
+    sheet_name = 'PerformTransient'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class Permission(DataRow):
+    _sign = b'Permission|eJxLSqIPAAArCCfR'
+    sheet_name = 'Permission'
+    flag: List[bool_t] = ListData(ir((0, 104, 1)), RowData)
+
+
+class Pet(DataRow):
+    _sign = b'Pet|eJwrzgOBtLS0PDgAAFD2CBg='
+    sheet_name = 'Pet'
+    _display = 'text'
+    text: str_t = RowData(0)
+    use_action: List[int_t] = ListData(ir((1, 5, 1)), RowData)
+    is_turret: bool_t = RowData(6)
+    is_use_pet_action: bool_t = RowData(7)
+    is_disp_ex_hotbar: bool_t = RowData(8)
+    config_scale: List[int_t] = ListData(ir((9, 3, 1)), RowData)
+    mirage_slot: int_t = RowData(12)
+    mirage: List[int_t] = ListData(ir((13, 6, 1)), RowData)
+
+
+class PetAction(DataRow):
+    _sign = b'PetAction|eJwrLs7Ly0tLSwMAD5sDYw=='
+    sheet_name = 'PetAction'
+    _display = 'text_name'
+    text_name: str_t = RowData(0)
+    text_help: str_t = RowData(1)
+    icon: 'Icon' = IconRow(2)
+    action: 'Action' = RowForeign(3, 'Action')
+    pet: 'Pet' = RowForeign(4, 'Pet')
+    disable_order: bool_t = RowData(5)
+    show_on_ui: bool_t = RowData(6)
+    aa_log: bool_t = RowData(7)
+
+
+class PetMirage(DataRow):
+    _sign = b'PetMirage|eJzLyyvOowAAAGPdGxg='
+    sheet_name = 'PetMirage'
+    _display = 'text'
+    scale: float_t = RowData(0)
+    model_chara_id: int_t = RowData(1)
+    text: str_t = RowData(2)
+    replace_timeline_target_action: List[int_t] = ListData(ir((3, 15, 1)), RowData)
+    replace_timeline_cast_timeline: List[int_t] = ListData(ir((18, 15, 1)), RowData)
+    replace_timeline_timeline: List[int_t] = ListData(ir((33, 15, 1)), RowData)
+    replace_timeline_hit_timeline: List[int_t] = ListData(ir((48, 15, 1)), RowData)
+
+
+class PhysicsGroup(DataRow):
+    _sign = b'PhysicsGroup|eJzLy0OANAgJAFF3CBs='
+    sheet_name = 'PhysicsGroup'
+    simulation_time: List[float_t] = ListData(ir((0, 6, 1)), RowData)
+    ps3_simulation_time: List[float_t] = ListData(ir((6, 6, 1)), RowData)
+    reset_by_look_at: bool_t = RowData(12)
+    root_following_game: float_t = RowData(13)
+    root_following_cut_scene: float_t = RowData(14)
+    config_switch: List[int_t] = ListData(ir((15, 3, 1)), RowData)
+    force_attract_by_physics_off: bool_t = RowData(18)
+
+
+class PhysicsOffGroup(DataRow):
+    _sign = b'PhysicsOffGroup|eJzLywMAAUwA3Q=='
+    sheet_name = 'PhysicsOffGroup'
+    group0: int_t = RowData(0)
+    group1: int_t = RowData(1)
+
+
+class PhysicsWind(DataRow):
+    _sign = b'PhysicsWind|eJzLywMBAAkMApU='
+    sheet_name = 'PhysicsWind'
+    threshold: float_t = RowData(0)
+    amplitude: float_t = RowData(1)
+    amplitude_frequency: float_t = RowData(2)
+    power_min: float_t = RowData(3)
+    power_max: float_t = RowData(4)
+    power_frequency: float_t = RowData(5)
+
+
+class Picture(DataRow):
+    _sign = b'Picture|eJzLywMAAUwA3Q=='
+    sheet_name = 'Picture'
+    icon: 'Icon' = IconRow(0)
+    category: int_t = RowData(1)
+
+
+class PlaceName(DataRow):
+    _sign = b'PlaceName|eJwrzivOAwEQCQAiEgU4'
+    sheet_name = 'PlaceName'
+    _display = 'text_sgl'
+    text_sgl: str_t = RowData(0)
+    text_sgg: int_t = RowData(1)
+    text_plr: str_t = RowData(2)
+    text_plg: int_t = RowData(3)
+    text_vow: int_t = RowData(4)
+    text_cnt: int_t = RowData(5)
+    text_gen: int_t = RowData(6)
+    text_def_: int_t = RowData(7)
+    text_swt: str_t = RowData(8)
+    location_title: int_t = RowData(9)
+    priority: int_t = RowData(10)
+    show_condition: int_t = RowData(11)
+
+
+class PlantPotFlowerSeed(DataRow):
+    _sign = b'PlantPotFlowerSeed|eJzLy4MCABNfA98='
+    sheet_name = 'PlantPotFlowerSeed'
+    harvest_icons: List[int_t] = ListData(ir((0, 9, 1)), RowData)
+
+
+class PlayerSearchLocation(DataRow):
+    _sign = b'PlayerSearchLocation|eJzLKwYAAVEA4g=='
+    sheet_name = 'PlayerSearchLocation'
+    sort_id: int_t = RowData(0)
+    name: str_t = RowData(1)
+
+
+class PlayerSearchSubLocation(DataRow):
+    _sign = b'PlayerSearchSubLocation|eJzLy8srLi4GAAkqAqQ='
+    sheet_name = 'PlayerSearchSubLocation'
+    sort_id: int_t = RowData(0)
+    place_name_id: int_t = RowData(1)
+    location_name: int_t = RowData(2)
+    sub_location_name_name: str_t = RowData(3)
+    sub_location_name_global_command: str_t = RowData(4)
+    sub_location_name_local_command: str_t = RowData(5)
+
+
+class PreHandler(DataRow):
+    _sign = b'PreHandler|eJwrzoMAAA+oA3Y='
+    sheet_name = 'PreHandler'
+    _display = 'event_handler'
+    text: str_t = RowData(0)
+    announce_icon: 'Icon' = IconRow(1)
+    event_handler: int_t = RowData(2)
+    disclosure_reward_or_quest: 'Quest' = RowForeign(3, 'Quest')
+    qualified_talk: 'DefaultTalk' = RowForeign(4, 'DefaultTalk')
+    unqualified_talk: 'DefaultTalk' = RowForeign(5, 'DefaultTalk')
+    movement: int_t = RowData(6)
+    event_situation_icon: int_t = RowData(7)
+
+
+class PreHandlerMovement(DataRow):
+    _sign = b'PreHandlerMovement|eJzLywMAAUwA3Q=='
+    sheet_name = 'PreHandlerMovement'
+    turn_type: int_t = RowData(0)
+    action_timeline: int_t = RowData(1)
+
+
+class PresetCamera(DataRow):
+    _sign = b'PresetCamera|eJzLy0MHAEmMB70='
+    sheet_name = 'PresetCamera'
+    eid: int_t = RowData(0)
+    pos_x: float_t = RowData(1)
+    pos_y: float_t = RowData(2)
+    pos_z: float_t = RowData(3)
+    elezene: float_t = RowData(4)
+    lalafell: float_t = RowData(5)
+    migote: float_t = RowData(6)
+    roegadyn: float_t = RowData(7)
+    aura: float_t = RowData(8)
+    hrothgar: float_t = RowData(9)
+    viera: float_t = RowData(10)
+    hyuran__f: float_t = RowData(11)
+    elezene__f: float_t = RowData(12)
+    lalafell__f: float_t = RowData(13)
+    migote__f: float_t = RowData(14)
+    roegadyn__f: float_t = RowData(15)
+    aura__f: float_t = RowData(16)
+    viera__f: float_t = RowData(17)
+
+
+class PresetCameraAdjust(DataRow):
+    _sign = b'PresetCameraAdjust|eJzLy0MBADOfBnM='
+    sheet_name = 'PresetCameraAdjust'
+    hyuran__m: float_t = RowData(0)
+    hyuran__f: float_t = RowData(1)
+    elezene__m: float_t = RowData(2)
+    elezene__f: float_t = RowData(3)
+    lalafell__m: float_t = RowData(4)
+    lalafell__f: float_t = RowData(5)
+    migote__m: float_t = RowData(6)
+    migote__f: float_t = RowData(7)
+    roegadyn__m: float_t = RowData(8)
+    roegadyn__f: float_t = RowData(9)
+    aura__m: float_t = RowData(10)
+    aura__f: float_t = RowData(11)
+    hrothgar__m: float_t = RowData(12)
+    viera__m: float_t = RowData(13)
+    viera__f: float_t = RowData(14)
+
+
+class PreviewableItems(DataRow):
+    _sign = b'PreviewableItems|eJzLAwAAbwBv'
+    sheet_name = 'PreviewableItems'
+    picture: int_t = RowData(0)
+
+
+class PublicContent(DataRow):
+    _sign = b'PublicContent|eJzLy8srzkMGAEIVB1Q='
+    sheet_name = 'PublicContent'
+    _display = 'text'
+    type: int_t = RowData(0)
+    time: int_t = RowData(1)
+    todo_icon: 'Icon' = IconRow(2)
+    text: str_t = RowData(3)
+    content_text_start: 'PublicContentTextData' = RowForeign(4, 'PublicContentTextData')
+    content_text_end: 'PublicContentTextData' = RowForeign(5, 'PublicContentTextData')
+    enter_cutscene: 'PublicContentCutscene' = RowForeign(6, 'PublicContentCutscene')
+    exit_rect: int_t = RowData(7)
+    return_pos: int_t = RowData(8)
+    content_finder_condition: 'ContentFinderCondition' = RowForeign(9, 'ContentFinderCondition')
+    data_index: 'Eureka|GFateClimbing2Content' = DynamicForeign(10, ComplexSheetKey('type', (3, 'Eureka'), (5, 'GFateClimbing2Content')))
+    content_attribute_rect: int_t = RowData(11)
+    shared_group: int_t = RowData(12)
+    content_open_flag: int_t = RowData(13)
+    common_content_flag: int_t = RowData(14)
+    clear_music: int_t = RowData(15)
+    clear_cutscene: 'PublicContentCutscene' = RowForeign(16, 'PublicContentCutscene')
+
+
+class PublicContentCutscene(DataRow):
+    _sign = b'PublicContentCutscene|eJzLywMAAUwA3Q=='
+    sheet_name = 'PublicContentCutscene'
+    cutscene_id: 'List[Cutscene]' = ListData(ir((0, 2, 1)), RowForeign, 'Cutscene')
+
+
+class PublicContentTextData(DataRow):
+    _sign = b'PublicContentTextData|eJwrBgAAdAB0'
+    sheet_name = 'PublicContentTextData'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class PublicContentType(DataRow):
+    _sign = b'PublicContentType|eJzLAwAAbwBv'
+    sheet_name = 'PublicContentType'
+    open_flag: int_t = RowData(0)
+
+
+class PvPAction(DataRow):
+    _sign = b'PvPAction|eJzLywOCpKSkPAAS8wO7'
+    sheet_name = 'PvPAction'
+    _display = 'action'
+    action: 'Action' = RowForeign(0, 'Action')
+    skill_point: int_t = RowData(1)
+    trait: List[int_t] = ListData(ir((2, 3, 1)), RowData)
+    grand_company: List[bool_t] = ListData(ir((5, 3, 1)), RowData)
+    rank: int_t = RowData(8)
+
+
+class PvPActionSort(DataRow):
+    _sign = b'PvPActionSort|eJzLy0tLywMABk8CFw=='
+    sheet_name = 'PvPActionSort'
+    id_type: int_t = RowData(0)
+    id: 'Action|ActionComboRoute' = DynamicForeign(1, ComplexSheetKey('id_type', (1, 'Action'), (2, 'ActionComboRoute')))
+    is_init_hotbar: bool_t = RowData(2)
+    is_hotbar: bool_t = RowData(3)
+    q_chat_icon: int_t = RowData(4)
+
+
+class PvPBaseParamValue(DataRow):
+    _sign = b'PvPBaseParamValue|eJzLy8sDAAKXAUs='
+    sheet_name = 'PvPBaseParamValue'
+    value: List[int_t] = ListData(ir((0, 3, 1)), RowData)
+
+
+class PvPInitialSelectActionTrait(DataRow):
+    _sign = b'PvPInitialSelectActionTrait|eJzLywMCAAZ3Aic='
+    sheet_name = 'PvPInitialSelectActionTrait'
+    action: List[int_t] = ListData(ir((0, 2, 1)), RowData)
+    trait: List[int_t] = ListData(ir((2, 3, 1)), RowData)
+
+
+class PvPRank(DataRow):
+    _sign = b'PvPRank|eJzLAwAAbwBv'
+    sheet_name = 'PvPRank'
+    point: int_t = RowData(0)
+
+
+class PvPRankTransient(DataRow):
+    _sign = b'PvPRankTransient|eJwrLgYBAAl1ArM='
+    sheet_name = 'PvPRankTransient'
+    text_pvp_title_male: List[str_t] = ListData(ir((0, 3, 1)), RowData)
+    text_pvp_title_female: List[str_t] = ListData(ir((3, 3, 1)), RowData)
+
+
+class PvPSelectTrait(DataRow):
+    _sign = b'PvPSelectTrait|eJwrzssDAAKmAVA='
+    sheet_name = 'PvPSelectTrait'
+    text: str_t = RowData(0)
+    icon: 'Icon' = IconRow(1)
+    param: int_t = RowData(2)
+
+
+class PvPSelectTraitTransient(DataRow):
+    _sign = b'PvPSelectTraitTransient|eJwrBgAAdAB0'
+    sheet_name = 'PvPSelectTraitTransient'
+    text: str_t = RowData(0)
+
+
+class PvPSeries(DataRow):
+    _sign = b'PvPSeries|eJzLyxvkAADlakUv'
+    sheet_name = 'PvPSeries'
+    max_reward_level: int_t = RowData(0)
+    series_reward_item: List[List[int_t]] = ListData(ir(((1, 2, 32), 32, 1)), ListData, RowData)
+    series_reward_item_num: List[List[int_t]] = ListData(ir(((65, 2, 32), 32, 1)), ListData, RowData)
+    series_reward_achievement: List[int_t] = ListData(ir((129, 32, 1)), RowData)
+
+
+class PvPSeriesLevel(DataRow):
+    _sign = b'PvPSeriesLevel|eJzLAwAAbwBv'
+    sheet_name = 'PvPSeriesLevel'
+    next_exp: int_t = RowData(0)
+
+
+class PvPTrait(DataRow):
+    _sign = b'PvPTrait|eJzLy8sDAAKXAUs='
+    sheet_name = 'PvPTrait'
+    trait: 'List[Trait]' = ListData(ir((0, 3, 1)), RowForeign, 'Trait')
@@ -0,0 +1,570 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class QTE(DataRow):
+    _sign = b'QTE|eJzLywOB4uLiNCAoLgYAM5YGbA=='
+    sheet_name = 'QTE'
+    type: int_t = RowData(0)
+    limit_time: int_t = RowData(1)
+    param: List[int_t] = ListData(ir((2, 3, 1)), RowData)
+    start_se: int_t = RowData(5)
+    ready_se: str_t = RowData(6)
+    success_se: str_t = RowData(7)
+    failure_se: str_t = RowData(8)
+    server: bool_t = RowData(9)
+    invincible: bool_t = RowData(10)
+    camera: bool_t = RowData(11)
+    start_screen_image: bool_t = RowData(12)
+    text_action: str_t = RowData(13)
+    text_flavor: str_t = RowData(14)
+
+
+class Quest(DataRow):
+    _sign = b'Quest|eJwrLs4jDNJgJBAVkwyIsGAUjAIkkDYKRjQY6PQ3FEASBGAXx6EHHLJpaQATKn8z'
+    sheet_name = 'Quest'
+    _display = 'text'
+    text: str_t = RowData(0)
+    script: str_t = RowData(1)
+    need_ex_version: 'ExVersion' = RowForeign(2, 'ExVersion')
+    class_job: 'ClassJobCategory' = RowForeign(3, 'ClassJobCategory')
+    class_level: int_t = RowData(4)
+    quest_level_offset: int_t = RowData(5)
+    class_job2: 'ClassJobCategory' = RowForeign(6, 'ClassJobCategory')
+    class_level2: int_t = RowData(7)
+    prev_quest_operator: int_t = RowData(8)
+    prev_quest: List[int_t] = ListData([9, 11, 12], RowData)
+    prev_quest_sequence: int_t = RowData(10)
+    exclude_quest_operator: int_t = RowData(13)
+    exclude_quest: List[int_t] = ListData(ir((14, 2, 1)), RowData)
+    acquired_reward: int_t = RowData(16)
+    start_town: int_t = RowData(17)
+    first_class_operator: int_t = RowData(18)
+    first_class: 'ClassJob' = RowForeign(19, 'ClassJob')
+    grand_company: 'GrandCompany' = RowForeign(20, 'GrandCompany')
+    grand_company_rank: 'GrandCompanyRank' = RowForeign(21, 'GrandCompanyRank')
+    instance_content_operator: int_t = RowData(22)
+    instance_content: List[int_t] = ListData(ir((23, 3, 1)), RowData)
+    festival: 'Festival' = RowForeign(26, 'Festival')
+    festival_phase_begin: int_t = RowData(27)
+    festival_phase_end: int_t = RowData(28)
+    time_begin: int_t = RowData(29)
+    time_end: int_t = RowData(30)
+    beast_tribe: 'BeastTribe' = RowForeign(31, 'BeastTribe')
+    beast_reputation_rank: 'BeastReputationRank' = RowForeign(32, 'BeastReputationRank')
+    beast_reputation_value: int_t = RowData(33)
+    satisfaction_npc: 'SatisfactionNpc' = RowForeign(34, 'SatisfactionNpc')
+    satisfaction_rank: int_t = RowData(35)
+    mount: 'Mount' = RowForeign(36, 'Mount')
+    house: bool_t = RowData(37)
+    delivery_level: 'DeliveryQuest' = RowForeign(38, 'DeliveryQuest')
+    client: int_t = RowData(39)
+    client_layout: 'Level' = RowForeign(40, 'Level')
+    client_behavior: 'Behavior' = RowForeign(41, 'Behavior')
+    finish: int_t = RowData(42)
+    repeatable: bool_t = RowData(43)
+    repeat_cycle: int_t = RowData(44)
+    repeat_flag: 'QuestRepeatFlag' = RowForeign(45, 'QuestRepeatFlag')
+    introduction: bool_t = RowData(46)
+    progress_condition: int_t = RowData(47)
+    class_job_supply: 'QuestClassJobSupply' = RowForeign(48, 'QuestClassJobSupply')
+    define_name: List[str_t] = ListData(ir((49, 50, 1)), RowData)
+    define_value: List[int_t] = ListData(ir((99, 50, 1)), RowData)
+    event_listener_sequence: List[int_t] = ListData(ir((149, 64, 1)), RowData)
+    event_listener_todo: List[int_t] = ListData(ir((213, 64, 1)), RowData)
+    event_listener_listener: List[int_t] = ListData(ir((277, 64, 1)), RowData)
+    event_listener_event: List[int_t] = ListData(ir((341, 64, 1)), RowData)
+    event_listener_condition_type: List[int_t] = ListData(ir((405, 64, 1)), RowData)
+    event_listener_condition_value: List[int_t] = ListData(ir((469, 64, 1)), RowData)
+    event_listener_condition_operator: List[int_t] = ListData(ir((533, 64, 1)), RowData)
+    event_listener_behavior: List[int_t] = ListData(ir((597, 64, 1)), RowData)
+    event_listener_accept_callback: List[bool_t] = ListData(ir((661, 64, 1)), RowData)
+    event_listener_announce_callback: List[bool_t] = ListData(ir((725, 64, 1)), RowData)
+    event_listener_qualified_callback: List[bool_t] = ListData(ir((789, 64, 1)), RowData)
+    event_listener_targeting_possible_callback: List[bool_t] = ListData(ir((853, 64, 1)), RowData)
+    event_listener_item_callback: List[bool_t] = ListData(ir((917, 64, 1)), RowData)
+    event_listener_movable_flag: List[bool_t] = ListData(ir((981, 64, 1)), RowData)
+    event_listener_condition_callback: List[bool_t] = ListData(ir((1045, 64, 1)), RowData)
+    event_listener_visible_callback: List[bool_t] = ListData(ir((1109, 64, 1)), RowData)
+    quest_todo_todo_sequence: List[int_t] = ListData(ir((1173, 24, 1)), RowData)
+    quest_todo_countable_num: List[int_t] = ListData(ir((1197, 24, 1)), RowData)
+    quest_todo_marker: List[List[int_t]] = ListData(ir(((1221, 8, 24), 24, 1)), ListData, RowData)
+    quest_todo_todo_show_index: List[int_t] = ListData(ir((1413, 24, 1)), RowData)
+    exp_base_level_limit: int_t = RowData(1437)
+    exp_class: 'ClassJob' = RowForeign(1438, 'ClassJob')
+    hide_reward: 'QuestRewardOther' = RowForeign(1439, 'QuestRewardOther')
+    reward_exp_bonus: int_t = RowData(1440)
+    reward_gil: int_t = RowData(1441)
+    reward_company_point_type: 'Item' = RowForeign(1442, 'Item')
+    reward_company_point_num: int_t = RowData(1443)
+    reward_crystal_type: List[int_t] = ListData(ir((1444, 3, 1)), RowData)
+    reward_crystal_num: List[int_t] = ListData(ir((1447, 3, 1)), RowData)
+    reward_item_array_type: int_t = RowData(1450)
+    reward_item: List[int_t] = ListData(ir((1451, 7, 1)), RowData)
+    reward_item_num: List[int_t] = ListData(ir((1458, 7, 1)), RowData)
+    reward_item_hq: List[bool_t] = ListData(ir((1465, 7, 1)), RowData)
+    reward_item_stain_id: List[int_t] = ListData(ir((1472, 7, 1)), RowData)
+    reward_optional_item: List[int_t] = ListData(ir((1479, 5, 1)), RowData)
+    reward_optional_item_num: List[int_t] = ListData(ir((1484, 5, 1)), RowData)
+    reward_optional_item_hq: List[bool_t] = ListData(ir((1489, 5, 1)), RowData)
+    reward_optional_item_stain_id: List[int_t] = ListData(ir((1494, 5, 1)), RowData)
+    reward_emote: 'Emote' = RowForeign(1499, 'Emote')
+    reward_action: 'Action' = RowForeign(1500, 'Action')
+    reward_general_action: List[int_t] = ListData(ir((1501, 2, 1)), RowData)
+    reward_trait: int_t = RowData(1503)
+    reward_other: 'QuestRewardOther' = RowForeign(1504, 'QuestRewardOther')
+    reward_system: List[int_t] = ListData(ir((1505, 2, 1)), RowData)
+    reward_instance_content: 'InstanceContent' = RowForeign(1507, 'InstanceContent')
+    reward_allagan_tomestone_condition: int_t = RowData(1508)
+    reward_allagan_tomestone_type: int_t = RowData(1509)
+    reward_allagan_tomestone_num: int_t = RowData(1510)
+    reward_beast_reputation_value_num: int_t = RowData(1511)
+    area: 'PlaceName' = RowForeign(1512, 'PlaceName')
+    genre: 'JournalGenre' = RowForeign(1513, 'JournalGenre')
+    journal_type: int_t = RowData(1514)
+    header: 'Icon' = IconRow(1515)
+    inlay: 'Icon' = IconRow(1516)
+    cancellable: bool_t = RowData(1517)
+    hide_offer_icon: bool_t = RowData(1518)
+    icon_type: 'EventIconType' = RowForeign(1519, 'EventIconType')
+    quality: int_t = RowData(1520)
+    sort: int_t = RowData(1521)
+    zombie: bool_t = RowData(1522)
+    hide_title: bool_t = RowData(1523)
+
+
+class Quest(DataRow):
+    _sign = b'Quest|eJwrLs4jDNJgJBAVkwyIsGAUjAIkkDYKRjQY6PQ3FEASBGAXx6EHHLJpAJPofs0='
+    sheet_name = 'Quest'
+    _display = 'text'
+    text: str_t = RowData(0)
+    script: str_t = RowData(1)
+    need_ex_version: 'ExVersion' = RowForeign(2, 'ExVersion')
+    class_job: 'ClassJobCategory' = RowForeign(3, 'ClassJobCategory')
+    class_level: int_t = RowData(4)
+    quest_level_offset: int_t = RowData(5)
+    class_job2: 'ClassJobCategory' = RowForeign(6, 'ClassJobCategory')
+    class_level2: int_t = RowData(7)
+    prev_quest_operator: int_t = RowData(8)
+    prev_quest: 'List[Quest]' = ListData([9, 11, 12], RowForeign, 'Quest')
+    prev_quest_sequence: int_t = RowData(10)
+    exclude_quest_operator: int_t = RowData(13)
+    exclude_quest: List[int_t] = ListData(ir((14, 2, 1)), RowData)
+    acquired_reward: int_t = RowData(16)
+    start_town: int_t = RowData(17)
+    first_class_operator: int_t = RowData(18)
+    first_class: 'ClassJob' = RowForeign(19, 'ClassJob')
+    grand_company: 'GrandCompany' = RowForeign(20, 'GrandCompany')
+    grand_company_rank: 'GrandCompanyRank' = RowForeign(21, 'GrandCompanyRank')
+    instance_content_operator: int_t = RowData(22)
+    instance_content: List[int_t] = ListData(ir((23, 3, 1)), RowData)
+    festival: 'Festival' = RowForeign(26, 'Festival')
+    festival_phase_begin: int_t = RowData(27)
+    festival_phase_end: int_t = RowData(28)
+    time_begin: int_t = RowData(29)
+    time_end: int_t = RowData(30)
+    beast_tribe: 'BeastTribe' = RowForeign(31, 'BeastTribe')
+    beast_reputation_rank: 'BeastReputationRank' = RowForeign(32, 'BeastReputationRank')
+    beast_reputation_value: int_t = RowData(33)
+    satisfaction_npc: 'SatisfactionNpc' = RowForeign(34, 'SatisfactionNpc')
+    satisfaction_rank: int_t = RowData(35)
+    mount: 'Mount' = RowForeign(36, 'Mount')
+    house: bool_t = RowData(37)
+    delivery_level: 'DeliveryQuest' = RowForeign(38, 'DeliveryQuest')
+    client: int_t = RowData(39)
+    client_layout: 'Level' = RowForeign(40, 'Level')
+    client_behavior: 'Behavior' = RowForeign(41, 'Behavior')
+    finish: int_t = RowData(42)
+    repeatable: bool_t = RowData(43)
+    repeat_cycle: int_t = RowData(44)
+    repeat_flag: 'QuestRepeatFlag' = RowForeign(45, 'QuestRepeatFlag')
+    introduction: bool_t = RowData(46)
+    progress_condition: int_t = RowData(47)
+    class_job_supply: 'QuestClassJobSupply' = RowForeign(48, 'QuestClassJobSupply')
+    define_name: List[str_t] = ListData(ir((49, 50, 1)), RowData)
+    define_value: List[int_t] = ListData(ir((99, 50, 1)), RowData)
+    event_listener_sequence: List[int_t] = ListData(ir((149, 64, 1)), RowData)
+    event_listener_todo: List[int_t] = ListData(ir((213, 64, 1)), RowData)
+    event_listener_listener: List[int_t] = ListData(ir((277, 64, 1)), RowData)
+    event_listener_event: List[int_t] = ListData(ir((341, 64, 1)), RowData)
+    event_listener_condition_type: List[int_t] = ListData(ir((405, 64, 1)), RowData)
+    event_listener_condition_value: List[int_t] = ListData(ir((469, 64, 1)), RowData)
+    event_listener_condition_operator: List[int_t] = ListData(ir((533, 64, 1)), RowData)
+    event_listener_behavior: List[int_t] = ListData(ir((597, 64, 1)), RowData)
+    event_listener_accept_callback: List[bool_t] = ListData(ir((661, 64, 1)), RowData)
+    event_listener_announce_callback: List[bool_t] = ListData(ir((725, 64, 1)), RowData)
+    event_listener_qualified_callback: List[bool_t] = ListData(ir((789, 64, 1)), RowData)
+    event_listener_targeting_possible_callback: List[bool_t] = ListData(ir((853, 64, 1)), RowData)
+    event_listener_item_callback: List[bool_t] = ListData(ir((917, 64, 1)), RowData)
+    event_listener_movable_flag: List[bool_t] = ListData(ir((981, 64, 1)), RowData)
+    event_listener_condition_callback: List[bool_t] = ListData(ir((1045, 64, 1)), RowData)
+    event_listener_visible_callback: List[bool_t] = ListData(ir((1109, 64, 1)), RowData)
+    quest_todo_todo_sequence: List[int_t] = ListData(ir((1173, 24, 1)), RowData)
+    quest_todo_countable_num: List[int_t] = ListData(ir((1197, 24, 1)), RowData)
+    quest_todo_marker: List[List[int_t]] = ListData(ir(((1221, 8, 24), 24, 1)), ListData, RowData)
+    quest_todo_todo_show_index: List[int_t] = ListData(ir((1413, 24, 1)), RowData)
+    exp_base_level_limit: int_t = RowData(1437)
+    exp_class: 'ClassJob' = RowForeign(1438, 'ClassJob')
+    hide_reward: 'QuestRewardOther' = RowForeign(1439, 'QuestRewardOther')
+    reward_exp_bonus: int_t = RowData(1440)
+    reward_gil: int_t = RowData(1441)
+    reward_company_point_type: 'Item' = RowForeign(1442, 'Item')
+    reward_company_point_num: int_t = RowData(1443)
+    reward_crystal_type: List[int_t] = ListData(ir((1444, 3, 1)), RowData)
+    reward_crystal_num: List[int_t] = ListData(ir((1447, 3, 1)), RowData)
+    reward_item_array_type: int_t = RowData(1450)
+    reward_item: List[int_t] = ListData(ir((1451, 7, 1)), RowData)
+    reward_item_num: List[int_t] = ListData(ir((1458, 7, 1)), RowData)
+    reward_item_hq: List[bool_t] = ListData(ir((1465, 7, 1)), RowData)
+    reward_item_stain_id: List[int_t] = ListData(ir((1472, 7, 1)), RowData)
+    reward_optional_item: List[int_t] = ListData(ir((1479, 5, 1)), RowData)
+    reward_optional_item_num: List[int_t] = ListData(ir((1484, 5, 1)), RowData)
+    reward_optional_item_hq: List[bool_t] = ListData(ir((1489, 5, 1)), RowData)
+    reward_optional_item_stain_id: List[int_t] = ListData(ir((1494, 5, 1)), RowData)
+    reward_emote: 'Emote' = RowForeign(1499, 'Emote')
+    reward_action: 'Action' = RowForeign(1500, 'Action')
+    reward_general_action: List[int_t] = ListData(ir((1501, 2, 1)), RowData)
+    reward_trait: int_t = RowData(1503)
+    reward_other: 'QuestRewardOther' = RowForeign(1504, 'QuestRewardOther')
+    reward_system: List[int_t] = ListData(ir((1505, 2, 1)), RowData)
+    reward_instance_content: 'InstanceContent' = RowForeign(1507, 'InstanceContent')
+    reward_allagan_tomestone_condition: int_t = RowData(1508)
+    reward_allagan_tomestone_type: int_t = RowData(1509)
+    reward_allagan_tomestone_num: int_t = RowData(1510)
+    reward_beast_reputation_value_num: int_t = RowData(1511)
+    area: 'PlaceName' = RowForeign(1512, 'PlaceName')
+    genre: 'JournalGenre' = RowForeign(1513, 'JournalGenre')
+    journal_type: int_t = RowData(1514)
+    header: 'Icon' = IconRow(1515)
+    inlay: 'Icon' = IconRow(1516)
+    cancellable: bool_t = RowData(1517)
+    hide_offer_icon: bool_t = RowData(1518)
+    icon_type: 'EventIconType' = RowForeign(1519, 'EventIconType')
+    quality: int_t = RowData(1520)
+    sort: int_t = RowData(1521)
+    zombie: bool_t = RowData(1522)
+
+
+class QuestAcceptAdditionCondition(DataRow):
+    _sign = b'QuestAcceptAdditionCondition|eJzLy8tLAwAESAGx'
+    sheet_name = 'QuestAcceptAdditionCondition'
+    addition_condition: 'List[Quest]' = ListData(ir((0, 3, 1)), RowForeign, 'Quest')
+    is_qualification_prev_quest: bool_t = RowData(3)
+
+
+class QuestBattle(DataRow):
+    _sign = b'QuestBattle|eJzLy8vLKx4mIG+YAADwZ7GB'
+    sheet_name = 'QuestBattle'
+    quest: int_t = RowData(0)
+    sub_no: int_t = RowData(1)
+    limit_time: int_t = RowData(2)
+    sync_level: int_t = RowData(3)
+    define_define_name: List[str_t] = ListData(ir((4, 200, 1)), RowData)
+    define_define_value: List[int_t] = ListData(ir((204, 200, 1)), RowData)
+
+
+class QuestBattleResident(DataRow):
+    _sign = b'QuestBattleResident|eJzLAwAAbwBv'
+    sheet_name = 'QuestBattleResident'
+    content_finder_condition: int_t = RowData(0)
+
+
+class QuestBattleSystemDefine(DataRow):
+    _sign = b'QuestBattleSystemDefine|eJwrzgMAAVYA4g=='
+    sheet_name = 'QuestBattleSystemDefine'
+    define_name: str_t = RowData(0)
+    define_value: int_t = RowData(1)
+
+
+class QuestChapter(DataRow):
+    _sign = b'QuestChapter|eJzLywMAAUwA3Q=='
+    sheet_name = 'QuestChapter'
+    _display = 'quest'
+    quest: 'Quest' = RowForeign(0, 'Quest')
+    chapter: 'QuestRedoChapter' = RowForeign(1, 'QuestRedoChapter')
+
+
+class QuestClassJobReward(DataRow):
+    _sign = b'QuestClassJobReward|eJzLy0MDSVAAAIoPCl8='
+    sheet_name = 'QuestClassJobReward'
+    class_job_category: 'ClassJobCategory' = RowForeign(0, 'ClassJobCategory')
+    item: List[int_t] = ListData(ir((1, 4, 1)), RowData)
+    item_num: List[int_t] = ListData(ir((5, 4, 1)), RowData)
+    remove_item: List[int_t] = ListData(ir((9, 4, 1)), RowData)
+    remove_item_num: List[int_t] = ListData(ir((13, 4, 1)), RowData)
+    remove_item_need_equip: List[bool_t] = ListData(ir((17, 4, 1)), RowData)
+    remove_item_need_accept: List[bool_t] = ListData(ir((21, 4, 1)), RowData)
+
+
+class QuestClassJobSupply(DataRow):
+    _sign = b'QuestClassJobSupply|eJzLywOCtLw8AA9oA2k='
+    sheet_name = 'QuestClassJobSupply'
+    class_job_category: 'ClassJobCategory' = RowForeign(0, 'ClassJobCategory')
+    sequence: int_t = RowData(1)
+    supply_target: 'ENpcResident' = RowForeign(2, 'ENpcResident')
+    supply_item: 'Item' = RowForeign(3, 'Item')
+    supply_item_num: int_t = RowData(4)
+    is_hq: bool_t = RowData(5)
+    additional_map_marker: int_t = RowData(6)
+    additional_link_marker: int_t = RowData(7)
+
+
+class QuestClassJobSupply(DataRow):
+    _sign = b'QuestClassJobSupply|eJzLywOCNAAJBAKN'
+    sheet_name = 'QuestClassJobSupply'
+    class_job_category: 'ClassJobCategory' = RowForeign(0, 'ClassJobCategory')
+    sequence: int_t = RowData(1)
+    supply_target: 'ENpcResident' = RowForeign(2, 'ENpcResident')
+    supply_item: 'Item' = RowForeign(3, 'Item')
+    supply_item_num: int_t = RowData(4)
+    is_hq: bool_t = RowData(5)
+
+
+class QuestCustomTodo(DataRow):
+    _sign = b'QuestCustomTodo|eJzLywMAAUwA3Q=='
+    sheet_name = 'QuestCustomTodo'
+    work_index: int_t = RowData(0)
+    value_max: int_t = RowData(1)
+
+
+class QuestDefineClient(DataRow):
+    _sign = b'QuestDefineClient|eJwrzgMAAVYA4g=='
+    sheet_name = 'QuestDefineClient'
+    name: str_t = RowData(0)
+    value: int_t = RowData(1)
+
+
+class QuestDerivedClass(DataRow):
+    _sign = b'QuestDerivedClass|eJzLAwAAbwBv'
+    sheet_name = 'QuestDerivedClass'
+    _display = 'client_derived_class'
+    client_derived_class: 'ClassJob' = RowForeign(0, 'ClassJob')
+
+
+class QuestEffect(DataRow):
+    _sign = b'QuestEffect|eJzLy4MBABesBE0='
+    sheet_name = 'QuestEffect'
+    details_effect_type: List[int_t] = ListData(ir((0, 4, 1)), RowData)
+    details_effect_id: List[int_t] = ListData(ir((4, 4, 1)), RowData)
+    warning_range_log: int_t = RowData(8)
+    out_of_range_log: int_t = RowData(9)
+
+
+class QuestEffectDefine(DataRow):
+    _sign = b'QuestEffectDefine|eJzLAwAAbwBv'
+    sheet_name = 'QuestEffectDefine'
+    _display = 'quest_effect'
+    quest_effect: 'QuestEffect' = RowForeign(0, 'QuestEffect')
+
+
+class QuestEffectType(DataRow):
+    _sign = b'QuestEffectType|eJzLAwAAbwBv'
+    sheet_name = 'QuestEffectType'
+    num_0: int_t = RowData(0)
+
+
+class QuestEquipModel(DataRow):
+    _sign = b'QuestEquipModel|eJzLywMAAUwA3Q=='
+    sheet_name = 'QuestEquipModel'
+    slot: int_t = RowData(0)
+    model_id: int_t = RowData(1)
+
+
+class QuestEventAreaEntranceInfo(DataRow):
+    _sign = b'QuestEventAreaEntranceInfo|eJzLy8sDAAKXAUs='
+    sheet_name = 'QuestEventAreaEntranceInfo'
+    quest: 'Quest' = RowForeign(0, 'Quest')
+    sequence: int_t = RowData(1)
+    pop_range: 'Level' = RowForeign(2, 'Level')
+
+
+class QuestHideReward(DataRow):
+    _sign = b'QuestHideReward|eJxLAwAAZwBn'
+    sheet_name = 'QuestHideReward'
+    dummy: bool_t = RowData(0)
+
+
+class QuestLinkMarker(DataRow):
+    _sign = b'QuestLinkMarker|eJzLy8vLSwMABm8CHw=='
+    sheet_name = 'QuestLinkMarker'
+    map: 'Map' = RowForeign(0, 'Map')
+    target_layout: 'Level' = RowForeign(1, 'Level')
+    link_map: 'Map' = RowForeign(2, 'Map')
+    link_key: int_t = RowData(3)
+    is_public: bool_t = RowData(4)
+
+
+class QuestLinkMarker(DataRow):
+    _sign = b'QuestLinkMarker|eJzLy8tLAwAESAGx'
+    sheet_name = 'QuestLinkMarker'
+    map: int_t = RowData(0)
+    target_layout: int_t = RowData(1)
+    link_map: int_t = RowData(2)
+    is_public: bool_t = RowData(3)
+
+
+class QuestLinkMarkerIcon(DataRow):
+    _sign = b'QuestLinkMarkerIcon|eJzLAwAAbwBv'
+    sheet_name = 'QuestLinkMarkerIcon'
+    link_icon: 'Icon' = IconRow(0)
+
+
+class QuestLinkMarkerSet(DataRow):
+    _sign = b'QuestLinkMarkerSet|eJzLywOCtDQAC/cC8w=='
+    sheet_name = 'QuestLinkMarkerSet'
+    link_marker: int_t = RowData(0)
+    quest: int_t = RowData(1)
+    sequence_begin: int_t = RowData(2)
+    sequence_end: int_t = RowData(3)
+    todo: int_t = RowData(4)
+    is_offer: bool_t = RowData(5)
+    disable_lock: bool_t = RowData(6)
+
+
+class QuestLinkMarkerSet(DataRow):
+    _sign = b'QuestLinkMarkerSet|eJzLy8vLS0sDAAj0AoU='
+    sheet_name = 'QuestLinkMarkerSet'
+    link_marker: int_t = RowData(0)
+    quest: int_t = RowData(1)
+    sequence_begin: int_t = RowData(2)
+    sequence_end: int_t = RowData(3)
+    is_offer: bool_t = RowData(4)
+    disable_lock: bool_t = RowData(5)
+
+
+class QuestLinkMarkerSet(DataRow):
+    _sign = b'QuestLinkMarkerSet|eJzLywMCAAZ3Aic='
+    sheet_name = 'QuestLinkMarkerSet'
+    link_marker: int_t = RowData(0)
+    quest: int_t = RowData(1)
+    sequence_begin: int_t = RowData(2)
+    sequence_end: int_t = RowData(3)
+    offer_target_layout: int_t = RowData(4)
+
+
+class QuestRecomplete(DataRow):
+    _sign = b'QuestRecomplete|eJzLAwAAbwBv'
+    sheet_name = 'QuestRecomplete'
+    work_index: int_t = RowData(0)
+
+
+class QuestRedo(DataRow):
+    _sign = b'QuestRedo|eJzLy6McAADwfR05'
+    sheet_name = 'QuestRedo'
+    quest_condition: 'List[Quest]' = ListData(ir((0, 2, 1)), RowForeign, 'Quest')
+    next_redo: int_t = RowData(2)
+    chapter: 'QuestRedoChapter' = RowForeign(3, 'QuestRedoChapter')
+    redo_detail_quest: List[int_t] = ListData(ir((4, 32, 1)), RowData)
+    redo_detail_route: List[int_t] = ListData(ir((36, 32, 1)), RowData)
+
+
+class QuestRedoChapter(DataRow):
+    _sign = b'QuestRedoChapter|eJzLy8sDAAKXAUs='
+    sheet_name = 'QuestRedoChapter'
+    category: int_t = RowData(0)
+    order_in_category: int_t = RowData(1)
+    incomp_chapter: int_t = RowData(2)
+
+
+class QuestRedoChapterUI(DataRow):
+    _sign = b'QuestRedoChapterUI|eJzLy4OA4uJiAByFBMo='
+    sheet_name = 'QuestRedoChapterUI'
+    _display = 'disclosure_reward_or_quest'
+    disclosure_reward_or_quest: 'Quest' = RowForeign(0, 'Quest')
+    disclosure_reward_or_quest2: int_t = RowData(1)
+    tab_category: 'QuestRedoChapterUITab' = RowForeign(2, 'QuestRedoChapterUITab')
+    group_category: 'QuestRedoChapterUICategory' = RowForeign(3, 'QuestRedoChapterUICategory')
+    priority: int_t = RowData(4)
+    icon_small: 'Icon' = IconRow(5)
+    icon_large: 'Icon' = IconRow(6)
+    icon_large_bg: 'Icon' = IconRow(7)
+    text_title: str_t = RowData(8)
+    text_title_short: str_t = RowData(9)
+    text_detail: str_t = RowData(10)
+
+
+class QuestRedoChapterUICategory(DataRow):
+    _sign = b'QuestRedoChapterUICategory|eJzLKwYAAVEA4g=='
+    sheet_name = 'QuestRedoChapterUICategory'
+    _display = 'text'
+    priority: int_t = RowData(0)
+    text: str_t = RowData(1)
+
+
+class QuestRedoChapterUITab(DataRow):
+    _sign = b'QuestRedoChapterUITab|eJzLy8srBgAEVQG+'
+    sheet_name = 'QuestRedoChapterUITab'
+    _display = 'text'
+    prio: int_t = RowData(0)
+    icon: 'Icon' = IconRow(1)
+    icon_selected: 'Icon' = IconRow(2)
+    text: str_t = RowData(3)
+
+
+class QuestRedoIncompChapter(DataRow):
+    _sign = b'QuestRedoIncompChapter|eJzLAwAAbwBv'
+    sheet_name = 'QuestRedoIncompChapter'
+    _display = 'incomp_chapter'
+    incomp_chapter: 'QuestRedoChapter' = RowForeign(0, 'QuestRedoChapter')
+
+
+class QuestRepeatFlag(DataRow):
+    _sign = b'QuestRepeatFlag|eJzLAwAAbwBv'
+    sheet_name = 'QuestRepeatFlag'
+    _display = 'quest'
+    quest: int_t = RowData(0)
+
+
+class QuestRewardOther(DataRow):
+    _sign = b'QuestRewardOther|eJzLKwYAAVEA4g=='
+    sheet_name = 'QuestRewardOther'
+    _display = 'name'
+    icon: 'Icon' = IconRow(0)
+    name: str_t = RowData(1)
+
+
+class QuestSelectTitle(DataRow):
+    _sign = b'QuestSelectTitle|eJzLAwAAbwBv'
+    sheet_name = 'QuestSelectTitle'
+    addon_text: int_t = RowData(0)
+
+
+class QuestSetDefine(DataRow):
+    _sign = b'QuestSetDefine|eJzLAwAAbwBv'
+    sheet_name = 'QuestSetDefine'
+    value: int_t = RowData(0)
+
+
+class QuestStatusParam(DataRow):
+    _sign = b'QuestStatusParam|eJzLy8sDAAKXAUs='
+    sheet_name = 'QuestStatusParam'
+    status: int_t = RowData(0)
+    system_type: int_t = RowData(1)
+    system_arg: int_t = RowData(2)
+
+
+class QuestSystemDefine(DataRow):
+    _sign = b'QuestSystemDefine|eJwrzgMAAVYA4g=='
+    sheet_name = 'QuestSystemDefine'
+    define_name: str_t = RowData(0)
+    define_value: int_t = RowData(1)
+
+
+class QuickChat(DataRow):
+    _sign = b'QuickChat|eJwrzgMCAAaQAiw='
+    sheet_name = 'QuickChat'
+    text: str_t = RowData(0)
+    icon: 'Icon' = IconRow(1)
+    addon: 'Addon' = RowForeign(2, 'Addon')
+    sort_id: 'QuickChatTransient' = RowForeign(3, 'QuickChatTransient')
+    valid_index: int_t = RowData(4)
+
+
+class QuickChatTransient(DataRow):
+    _sign = b'QuickChatTransient|eJwrBgAAdAB0'
+    sheet_name = 'QuickChatTransient'
+    _display = 'text'
+    text: str_t = RowData(0)
@@ -0,0 +1,453 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class RPParameter(DataRow):
+    _sign = b'RPParameter|eJzLy8sDAAKXAUs='
+    sheet_name = 'RPParameter'
+    _display = 'name_id'
+    name_id: 'BNpcName' = RowForeign(0, 'BNpcName')
+    class_job: 'ClassJob' = RowForeign(1, 'ClassJob')
+    sex: int_t = RowData(2)
+
+
+class Race(DataRow):
+    _sign = b'Race|eJwrLs6DAwAiAwUz'
+    sheet_name = 'Race'
+    _display = 'text_name_female'
+    text_name: str_t = RowData(0)
+    text_name_female: str_t = RowData(1)
+    body: 'List[Item]' = ListData(ir((2, 2, 4)), RowForeign, 'Item')
+    hand: 'List[Item]' = ListData(ir((3, 2, 4)), RowForeign, 'Item')
+    leg: 'List[Item]' = ListData(ir((4, 2, 4)), RowForeign, 'Item')
+    foot: 'List[Item]' = ListData(ir((5, 2, 4)), RowForeign, 'Item')
+    size: int_t = RowData(10)
+    need_ex_version: 'ExVersion' = RowForeign(11, 'ExVersion')
+
+
+class RacingChocoboGrade(DataRow):
+    _sign = b'RacingChocoboGrade|eJzLAwAAbwBv'
+    sheet_name = 'RacingChocoboGrade'
+    cross_gil: int_t = RowData(0)
+
+
+class RacingChocoboItem(DataRow):
+    _sign = b'RacingChocoboItem|eJzLy8vLAwAEUAG5'
+    sheet_name = 'RacingChocoboItem'
+    _display = 'item'
+    item: 'Item' = RowForeign(0, 'Item')
+    type: int_t = RowData(1)
+    arg: List[int_t] = ListData(ir((2, 2, 1)), RowData)
+
+
+class RacingChocoboName(DataRow):
+    _sign = b'RacingChocoboName|eJwrBgAAdAB0'
+    sheet_name = 'RacingChocoboName'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class RacingChocoboNameCategory(DataRow):
+    _sign = b'RacingChocoboNameCategory|eJzLKwYAAVEA4g=='
+    sheet_name = 'RacingChocoboNameCategory'
+    _display = 'text'
+    sort_id: int_t = RowData(0)
+    text: str_t = RowData(1)
+
+
+class RacingChocoboNameInfo(DataRow):
+    _sign = b'RacingChocoboNameInfo|eJzLSwKCvLw8AA54A0E='
+    sheet_name = 'RacingChocoboNameInfo'
+    category: 'RacingChocoboNameCategory' = RowForeign(0, 'RacingChocoboNameCategory')
+    filter: List[bool_t] = ListData(ir((1, 4, 1)), RowData)
+    sort_id: List[int_t] = ListData(ir((5, 3, 1)), RowData)
+
+
+class RacingChocoboParam(DataRow):
+    _sign = b'RacingChocoboParam|eJwrBgAAdAB0'
+    sheet_name = 'RacingChocoboParam'
+    _display = 'name'
+    name: str_t = RowData(0)
+
+
+class RaidFinderParam(DataRow):
+    _sign = b'RaidFinderParam|eJxLAwAAZwBn'
+    sheet_name = 'RaidFinderParam'
+    healer_matching_group_check: bool_t = RowData(0)
+
+
+class ReactionEventObject(DataRow):
+    _sign = b'ReactionEventObject|eJzLywMAAUwA3Q=='
+    sheet_name = 'ReactionEventObject'
+    object_info: int_t = RowData(0)
+    layout_id: int_t = RowData(1)
+
+
+class ReactionEventObjectInfo(DataRow):
+    _sign = b'ReactionEventObjectInfo|eJzLAwAAbwBv'
+    sheet_name = 'ReactionEventObjectInfo'
+    base_id: int_t = RowData(0)
+
+
+class RecastNavimesh(DataRow):
+    _sign = b'RecastNavimesh|eJwrzoOANDBCByChNAANzQ7w'
+    sheet_name = 'RecastNavimesh'
+    field_0: str_t = RowData(0)
+    tile_size: float_t = RowData(1)
+    cell_size: float_t = RowData(2)
+    cell_height: float_t = RowData(3)
+    agent_height: float_t = RowData(4)
+    agent_radius: float_t = RowData(5)
+    agent_max_climb: float_t = RowData(6)
+    agent_max_slope: float_t = RowData(7)
+    field_8: bool_t = RowData(8)
+    region_min_size: float_t = RowData(9)
+    region_merged_size: float_t = RowData(10)
+    field_11: bool_t = RowData(11)
+    max_edge_length: float_t = RowData(12)
+    max_edge_error: float_t = RowData(13)
+    verts_per_poly: float_t = RowData(14)
+    detail_mesh_sample_distance: float_t = RowData(15)
+    detail_mesh_max_sample_error: float_t = RowData(16)
+    field_17: float_t = RowData(17)
+    field_18: float_t = RowData(18)
+    field_19: float_t = RowData(19)
+    field_20: float_t = RowData(20)
+    field_21: float_t = RowData(21)
+    field_22: float_t = RowData(22)
+    field_23: float_t = RowData(23)
+    field_24: float_t = RowData(24)
+    field_25: float_t = RowData(25)
+    field_26: float_t = RowData(26)
+    field_27: float_t = RowData(27)
+    field_28: float_t = RowData(28)
+    field_29: float_t = RowData(29)
+    field_30: bool_t = RowData(30)
+    field_31: float_t = RowData(31)
+    field_32: float_t = RowData(32)
+    field_33: float_t = RowData(33)
+    field_34: bool_t = RowData(34)
+
+
+class Recipe(DataRow):
+    _sign = b'Recipe|eJzLy8MF0pDZaWkgAsgCAPe/FHE='
+    sheet_name = 'Recipe'
+    _display = 'craft_item_id'
+    number: int_t = RowData(0)
+    craft_type: 'CraftType' = RowForeign(1, 'CraftType')
+    level: 'RecipeLevelTable' = RowForeign(2, 'RecipeLevelTable')
+    craft_item_id: 'Item' = RowForeign(3, 'Item')
+    craft_num: int_t = RowData(4)
+    material_item_id: List[int_t] = ListData(ir((5, 8, 2)), RowData)
+    material_num: List[int_t] = ListData(ir((6, 8, 2)), RowData)
+    crystal_type: List[int_t] = ListData(ir((21, 2, 2)), RowData)
+    crystal_num: List[int_t] = ListData(ir((22, 2, 2)), RowData)
+    category: 'RecipeNotebookList' = RowForeign(25, 'RecipeNotebookList')
+    sub: bool_t = RowData(26)
+    initial_quality_limit_rate: int_t = RowData(27)
+    work_rate: int_t = RowData(28)
+    quality_rate: int_t = RowData(29)
+    material_point_rate: int_t = RowData(30)
+    min_quality_for_nq: int_t = RowData(31)
+    need_craftmanship: int_t = RowData(32)
+    need_control: int_t = RowData(33)
+    need_auto_craftmanship: int_t = RowData(34)
+    need_auto_control: int_t = RowData(35)
+    need_secret_recipe_book: 'SecretRecipeBook' = RowForeign(36, 'SecretRecipeBook')
+    need_complete_quest: 'Quest' = RowForeign(37, 'Quest')
+    can_auto_craft: bool_t = RowData(38)
+    can_hq: bool_t = RowData(39)
+    can_add_exp: bool_t = RowData(40)
+    need_status: 'Status' = RowForeign(41, 'Status')
+    need_equip_item: 'Item' = RowForeign(42, 'Item')
+    meister: bool_t = RowData(43)
+    high_difficulty: bool_t = RowData(44)
+    collectables_refine_type: int_t = RowData(45)
+    collectables_refine: int_t = RowData(46)
+    added_version: int_t = RowData(47)
+
+
+class RecipeLevelTable(DataRow):
+    _sign = b'RecipeLevelTable|eJzLy0MAACGQBSk='
+    sheet_name = 'RecipeLevelTable'
+    ui_level: int_t = RowData(0)
+    difficulty: int_t = RowData(1)
+    productivity: int_t = RowData(2)
+    technique: int_t = RowData(3)
+    work_max: int_t = RowData(4)
+    quality_max: int_t = RowData(5)
+    progress_difficulty_rate: int_t = RowData(6)
+    quality_difficulty_rate: int_t = RowData(7)
+    below_level_progress_rate: int_t = RowData(8)
+    below_level_quality_rate: int_t = RowData(9)
+    material_point: int_t = RowData(10)
+    recipe_material_state_pattern: int_t = RowData(11)
+
+
+class RecipeLookup(DataRow):
+    _sign = b'RecipeLookup|eJzLy4MAAA+AA3E='
+    sheet_name = 'RecipeLookup'
+    craft: 'List[Recipe]' = ListData(ir((0, 8, 1)), RowForeign, 'Recipe')
+
+
+class RecipeNotebookList(DataRow):
+    _sign = b'RecipeNotebookList|eJzLyxvkAADlakUv'
+    sheet_name = 'RecipeNotebookList'
+    recipe_num: int_t = RowData(0)
+    recipe_id: List[int_t] = ListData(ir((1, 160, 1)), RowData)
+
+
+class RecommendContents(DataRow):
+    _sign = b'RecommendContents|eJzLy8vLAwAEUAG5'
+    sheet_name = 'RecommendContents'
+    _display = 'layout_id'
+    layout_id: 'Level' = RowForeign(0, 'Level')
+    class_job: 'ClassJob' = RowForeign(1, 'ClassJob')
+    lv_min: int_t = RowData(2)
+    lv_max: int_t = RowData(3)
+
+
+class Relic(DataRow):
+    _sign = b'Relic|eJzLy0MFADqABuE='
+    sheet_name = 'Relic'
+    _display = 'exchange_item'
+    item: 'Item' = RowForeign(0, 'Item')
+    exchange_item: 'Item' = RowForeign(1, 'Item')
+    icon: 'Icon' = IconRow(2)
+    materia: 'List[Materia]' = ListData([3, 7, 11, 14], RowForeign, 'Materia')
+    main_note: 'List[RelicNote]' = ListData(ir((4, 3, 1)), RowForeign, 'RelicNote')
+    sub_note: 'List[RelicNote]' = ListData(ir((8, 3, 1)), RowForeign, 'RelicNote')
+    selection_a_note: 'List[RelicNote]' = ListData(ir((12, 2, 1)), RowForeign, 'RelicNote')
+    selection_b_note: 'RelicNote' = RowForeign(15, 'RelicNote')
+
+
+class Relic3(DataRow):
+    _sign = b'Relic3|eJzLywMBAAkMApU='
+    sheet_name = 'Relic3'
+    _display = 'exchange_item'
+    base_item: 'Item' = RowForeign(0, 'Item')
+    synthetic_item: 'Item' = RowForeign(1, 'Item')
+    strengthening_max: int_t = RowData(2)
+    exchange_item: 'Item' = RowForeign(3, 'Item')
+    icon: 'Icon' = IconRow(4)
+    type: int_t = RowData(5)
+
+
+class Relic3Materia(DataRow):
+    _sign = b'Relic3Materia|eJzLy4MCABNfA98='
+    sheet_name = 'Relic3Materia'
+    materia: int_t = RowData(0)
+    materia_type: List[int_t] = ListData(ir((1, 5, 1)), RowData)
+    rate_pattern: List[int_t] = ListData(ir((6, 3, 1)), RowData)
+
+
+class Relic3Rate(DataRow):
+    _sign = b'Relic3Rate|eJzLy4MCABNfA98='
+    sheet_name = 'Relic3Rate'
+    pattern: List[int_t] = ListData(ir((0, 9, 1)), RowData)
+
+
+class Relic3RatePattern(DataRow):
+    _sign = b'Relic3RatePattern|eJzLy8sDAAKXAUs='
+    sheet_name = 'Relic3RatePattern'
+    rank_up_num: List[int_t] = ListData(ir((0, 3, 1)), RowData)
+
+
+class Relic6Magicite(DataRow):
+    _sign = b'Relic6Magicite|eJwrLs7LAwAEcwHD'
+    sheet_name = 'Relic6Magicite'
+    text_0: str_t = RowData(0)
+    text_1: str_t = RowData(1)
+    num_2: int_t = RowData(2)
+    num_3: int_t = RowData(3)
+
+
+class RelicItem(DataRow):
+    _sign = b'RelicItem|eJzLy0MDAEHPB08='
+    sheet_name = 'RelicItem'
+    type: int_t = RowData(0)
+    items_catalog_id: 'List[Item]' = ListData(ir((1, 16, 1)), RowForeign, 'Item')
+
+
+class RelicMateria(DataRow):
+    _sign = b'RelicMateria|eJzLAwAAbwBv'
+    sheet_name = 'RelicMateria'
+    grade_max: int_t = RowData(0)
+
+
+class RelicNote(DataRow):
+    _sign = b'RelicNote|eJzLyyMEAP/MDp0='
+    sheet_name = 'RelicNote'
+    event_item: 'EventItem' = RowForeign(0, 'EventItem')
+    target: List[int_t] = ListData(ir((1, 10, 2)), RowData)
+    needed_kills: List[int_t] = ListData(ir((2, 10, 2)), RowData)
+    boss: List[int_t] = ListData(ir((21, 4, 1)), RowData)
+    fate: List[int_t] = ListData(ir((25, 3, 2)), RowData)
+    fate_territory_type: List[int_t] = ListData(ir((26, 3, 2)), RowData)
+    guild_leve: List[int_t] = ListData(ir((31, 3, 1)), RowData)
+
+
+class RelicNoteCategory(DataRow):
+    _sign = b'RelicNoteCategory|eJzLKwYAAVEA4g=='
+    sheet_name = 'RelicNoteCategory'
+    _display = 'text'
+    ui_priority: int_t = RowData(0)
+    text: str_t = RowData(1)
+
+
+class Resident(DataRow):
+    _sign = b'Resident|eJzLywMCAAZ3Aic='
+    sheet_name = 'Resident'
+    type: int_t = RowData(0)
+    value: int_t = RowData(1)
+    model: 'NpcYell' = RowForeign(2, 'NpcYell')
+    customize: int_t = RowData(3)
+    resident_motion_type: 'ResidentMotionType' = RowForeign(4, 'ResidentMotionType')
+
+
+class ResidentMotionType(DataRow):
+    _sign = b'ResidentMotionType|eJwrLoYAABA0A5k='
+    sheet_name = 'ResidentMotionType'
+    motion: List[str_t] = ListData(ir((0, 8, 1)), RowData)
+
+
+class ResistanceWeaponAdjust(DataRow):
+    _sign = b'ResistanceWeaponAdjust|eJzLy4MAAA+AA3E='
+    sheet_name = 'ResistanceWeaponAdjust'
+    param_total: int_t = RowData(0)
+    sub_param_max: int_t = RowData(1)
+    sub_param: List[int_t] = ListData(ir((2, 4, 1)), RowData)
+    inlay_icon: 'Icon' = IconRow(6)
+    ui_progress: int_t = RowData(7)
+
+
+class RetainerFortuneRewardRange(DataRow):
+    _sign = b'RetainerFortuneRewardRange|eJzLAwAAbwBv'
+    sheet_name = 'RetainerFortuneRewardRange'
+    next_exp_multiple: int_t = RowData(0)
+
+
+class RetainerTask(DataRow):
+    _sign = b'RetainerTask|eJxLy0MGACy8Bf0='
+    sheet_name = 'RetainerTask'
+    is_random: bool_t = RowData(0)
+    category: 'ClassJobCategory' = RowForeign(1, 'ClassJobCategory')
+    level: int_t = RowData(2)
+    sort_key: int_t = RowData(3)
+    number_hq_req_param: 'RetainerTaskParameter' = RowForeign(4, 'RetainerTaskParameter')
+    tip_cost: int_t = RowData(5)
+    time: int_t = RowData(6)
+    exp: int_t = RowData(7)
+    cond_item_lv: int_t = RowData(8)
+    cond_param_a: int_t = RowData(9)
+    cond_param_b: int_t = RowData(10)
+    param_a: int_t = RowData(11)
+    param_b: int_t = RowData(12)
+    task_num: int_t = RowData(13)
+
+
+class RetainerTaskLvRange(DataRow):
+    _sign = b'RetainerTaskLvRange|eJzLywMAAUwA3Q=='
+    sheet_name = 'RetainerTaskLvRange'
+    min_lv: int_t = RowData(0)
+    max_lv: int_t = RowData(1)
+
+
+class RetainerTaskNormal(DataRow):
+    _sign = b'RetainerTaskNormal|eJzLy4MAAA+AA3E='
+    sheet_name = 'RetainerTaskNormal'
+    _display = 'item'
+    item: 'Item' = RowForeign(0, 'Item')
+    stack: List[int_t] = ListData(ir((1, 5, 1)), RowData)
+    gathering_item: 'GatheringItem' = RowForeign(6, 'GatheringItem')
+    fish_parameter_or_spearfishing_item: int_t = RowData(7)
+
+
+class RetainerTaskParameter(DataRow):
+    _sign = b'RetainerTaskParameter|eJzLy0MAACGQBSk='
+    sheet_name = 'RetainerTaskParameter'
+    battle_stack: List[int_t] = ListData(ir((0, 4, 1)), RowData)
+    gathering_stack: List[int_t] = ListData(ir((4, 4, 1)), RowData)
+    fishing_stack: List[int_t] = ListData(ir((8, 4, 1)), RowData)
+
+
+class RetainerTaskParameterLvDiff(DataRow):
+    _sign = b'RetainerTaskParameterLvDiff|eJzLywMAAUwA3Q=='
+    sheet_name = 'RetainerTaskParameterLvDiff'
+    time_correction_normal: int_t = RowData(0)
+    time_correction_random: int_t = RowData(1)
+
+
+class RetainerTaskRandom(DataRow):
+    _sign = b'RetainerTaskRandom|eJwrzgMAAVYA4g=='
+    sheet_name = 'RetainerTaskRandom'
+    _display = 'text'
+    text: str_t = RowData(0)
+    sort_id: int_t = RowData(1)
+
+
+class RideShooting(DataRow):
+    _sign = b'RideShooting|eJzLyxsIAADJ8TK1'
+    sheet_name = 'RideShooting'
+    scheduler: 'GFateRideShooting' = RowForeign(0, 'GFateRideShooting')
+    player_offset_y: int_t = RowData(1)
+    shoot_offset_y: int_t = RowData(2)
+    shot_vfx: int_t = RowData(3)
+    shot_speed: int_t = RowData(4)
+    shoot_guide_text: 'RideShootingTextData' = RowForeign(5, 'RideShootingTextData')
+    lively_layout: List[int_t] = ListData(ir((6, 8, 1)), RowData)
+    lively_pop_range: List[int_t] = ListData(ir((14, 8, 1)), RowData)
+    lively_actor: List[List[int_t]] = ListData(ir(((22, 6, 16), 8, 1)), ListData, RowData)
+    lively_actor_pop_rate: List[List[int_t]] = ListData(ir(((30, 6, 16), 8, 1)), ListData, RowData)
+
+
+class RideShootingScheduler(DataRow):
+    _sign = b'RideShootingScheduler|eJzLywMCAAZ3Aic='
+    sheet_name = 'RideShootingScheduler'
+    event: int_t = RowData(0)
+    param: List[int_t] = ListData(ir((1, 4, 1)), RowData)
+
+
+class RideShootingTarget(DataRow):
+    _sign = b'RideShootingTarget|eJzLywMBAAkMApU='
+    sheet_name = 'RideShootingTarget'
+    type: int_t = RowData(0)
+    move_type: int_t = RowData(1)
+    move_param: List[int_t] = ListData(ir((2, 3, 1)), RowData)
+    life_time: int_t = RowData(5)
+
+
+class RideShootingTargetScheduler(DataRow):
+    _sign = b'RideShootingTargetScheduler|eJzLy4MAAA+AA3E='
+    sheet_name = 'RideShootingTargetScheduler'
+    event: int_t = RowData(0)
+    param: List[int_t] = ListData(ir((1, 2, 1)), RowData)
+    target_group: int_t = RowData(3)
+    target: List[int_t] = ListData(ir((4, 4, 1)), RowData)
+
+
+class RideShootingTargetType(DataRow):
+    _sign = b'RideShootingTargetType|eJzLywMBAAkMApU='
+    sheet_name = 'RideShootingTargetType'
+    e_obj: 'EObj' = RowForeign(0, 'EObj')
+    score: int_t = RowData(1)
+    collision_offset_x: int_t = RowData(2)
+    collision_offset_y: int_t = RowData(3)
+    collision_offset_z: int_t = RowData(4)
+    collision_radius: int_t = RowData(5)
+
+
+class RideShootingTextData(DataRow):
+    _sign = b'RideShootingTextData|eJwrBgAAdAB0'
+    sheet_name = 'RideShootingTextData'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class Role(DataRow):
+    _sign = b'Role|eJzLAwAAbwBv'
+    sheet_name = 'Role'
+    type: int_t = RowData(0)
@@ -0,0 +1,883 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class SE(DataRow):
+    _sign = b'SE|eJwrBgAAdAB0'
+    sheet_name = 'SE'
+    path: str_t = RowData(0)
+
+
+class SEBattle(DataRow):
+    _sign = b'SEBattle|eJwrBgAAdAB0'
+    sheet_name = 'SEBattle'
+    path: str_t = RowData(0)
+
+
+class SatisfactionArbitration(DataRow):
+    _sign = b'SatisfactionArbitration|eJzLy8vLAwAEUAG5'
+    sheet_name = 'SatisfactionArbitration'
+    _display = 'story_quest'
+    rank_condition: int_t = RowData(0)
+    rank_operator: 'SatisfactionNpc' = RowForeign(1, 'SatisfactionNpc')
+    story_quest: 'Quest' = RowForeign(2, 'Quest')
+    story_quest_condition: int_t = RowData(3)
+
+
+class SatisfactionBonusGuarantee(DataRow):
+    _sign = b'SatisfactionBonusGuarantee|eJzLywMBAAkMApU='
+    sheet_name = 'SatisfactionBonusGuarantee'
+    crafter_bonus: List[int_t] = ListData(ir((0, 2, 1)), RowData)
+    miner_harvester_bonus: List[int_t] = ListData(ir((2, 2, 1)), RowData)
+    fisherman_bonus: List[int_t] = ListData(ir((4, 2, 1)), RowData)
+
+
+class SatisfactionNpc(DataRow):
+    _sign = b'SatisfactionNpc|eJzLy8MNksCAVBEEAAAKRSax'
+    sheet_name = 'SatisfactionNpc'
+    _display = 'enpc_id'
+    enpc_id: 'ENpcResident' = RowForeign(0, 'ENpcResident')
+    accept_quest: 'Quest' = RowForeign(1, 'Quest')
+    supply_limit_level: int_t = RowData(2)
+    weekly_supply_count_max: int_t = RowData(3)
+    satisfaction_rank_supply_list: List[int_t] = ListData(ir((4, 6, 1)), RowData)
+    satisfaction_rank_rankup_point: List[int_t] = ListData(ir((10, 6, 1)), RowData)
+    satisfaction_rank_reward_item: List[List[int_t]] = ListData(ir(((16, 3, 18), 6, 1)), ListData, RowData)
+    satisfaction_rank_reward_num: List[List[int_t]] = ListData(ir(((22, 3, 18), 6, 1)), ListData, RowData)
+    satisfaction_rank_reward_hq: List[List[bool_t]] = ListData(ir(((28, 3, 18), 6, 1)), ListData, RowData)
+    satisfaction_npc_ui_detail_face: List[int_t] = ListData(ir((70, 6, 1)), RowData)
+    satisfaction_npc_ui_detail_signature: List[int_t] = ListData(ir((76, 6, 1)), RowData)
+    satisfaction_npc_ui_detail_quest: List[int_t] = ListData(ir((82, 6, 1)), RowData)
+    face_icon: 'Icon' = IconRow(88)
+    dress_up_work_index: int_t = RowData(89)
+    arbitration_gather_crafter: int_t = RowData(90)
+    arbitration_battle: int_t = RowData(91)
+
+
+class SatisfactionSupply(DataRow):
+    _sign = b'SatisfactionSupply|eJzLywODtLw8ABeUBEU='
+    sheet_name = 'SatisfactionSupply'
+    _display = 'need_item'
+    slot: int_t = RowData(0)
+    rate: int_t = RowData(1)
+    need_item: 'Item' = RowForeign(2, 'Item')
+    refine_threshold: List[int_t] = ListData(ir((3, 3, 1)), RowData)
+    supply_reward: 'SatisfactionSupplyReward' = RowForeign(6, 'SatisfactionSupplyReward')
+    is_bonus: bool_t = RowData(7)
+    fishing_spot_data: int_t = RowData(8)
+    spearfishing_spot_data: int_t = RowData(9)
+
+
+class SatisfactionSupplyReward(DataRow):
+    _sign = b'SatisfactionSupplyReward|eJzLy0MFADqABuE='
+    sheet_name = 'SatisfactionSupplyReward'
+    reward_bonus_rate: int_t = RowData(0)
+    reward_currency_a: int_t = RowData(1)
+    reward_num_a: List[int_t] = ListData(ir((2, 3, 1)), RowData)
+    reward_currency_b: int_t = RowData(5)
+    reward_num_b: List[int_t] = ListData(ir((6, 3, 1)), RowData)
+    reward_limit_level_b: int_t = RowData(9)
+    reward_point: List[int_t] = ListData(ir((10, 3, 1)), RowData)
+    reward_gil: List[int_t] = ListData(ir((13, 3, 1)), RowData)
+
+
+class SatisfactionSupplyRewardExp(DataRow):
+    _sign = b'SatisfactionSupplyRewardExp|eJzLy8sDAAKXAUs='
+    sheet_name = 'SatisfactionSupplyRewardExp'
+    reward_exp_rate: List[int_t] = ListData(ir((0, 3, 1)), RowData)
+
+
+class ScenarioTree(DataRow):
+    _sign = b'ScenarioTree|eJzLy8vLK87LAwAMHgMI'
+    sheet_name = 'ScenarioTree'
+    _display = 'uds__object_id'
+    scenario_type: 'ScenarioType' = RowForeign(0, 'ScenarioType')
+    scenario_number: int_t = RowData(1)
+    scenario_name: 'Addon' = RowForeign(2, 'Addon')
+    uds__activity: 'QuestChapter' = RowForeign(3, 'QuestChapter')
+    uds__object_id: str_t = RowData(4)
+    uds__display_order: int_t = RowData(5)
+    uds__scenario_number: int_t = RowData(6)
+
+
+class ScenarioTreeTips(DataRow):
+    _sign = b'ScenarioTreeTips|eJzLy8vLAwAEUAG5'
+    sheet_name = 'ScenarioTreeTips'
+    next: int_t = RowData(0)
+    target_quest: int_t = RowData(1)
+    level: int_t = RowData(2)
+    prev_quest: 'ScenarioTree' = RowForeign(3, 'ScenarioTree')
+
+
+class ScenarioTreeTipsClassQuest(DataRow):
+    _sign = b'ScenarioTreeTipsClassQuest|eJzLy8vLS0sDAAj0AoU='
+    sheet_name = 'ScenarioTreeTipsClassQuest'
+    _display = 'quest'
+    quest: 'Quest' = RowForeign(0, 'Quest')
+    level: int_t = RowData(1)
+    need_ex_version: 'ExVersion' = RowForeign(2, 'ExVersion')
+    prev_quest: 'Quest' = RowForeign(3, 'Quest')
+    first_class: bool_t = RowData(4)
+    not_first_class: bool_t = RowData(5)
+
+
+class ScenarioType(DataRow):
+    _sign = b'ScenarioType|eJwrzgMAAVYA4g=='
+    sheet_name = 'ScenarioType'
+    _display = 'text'
+    text: str_t = RowData(0)
+    digit: int_t = RowData(1)
+
+
+class ScreenImage(DataRow):
+    _sign = b'ScreenImage|eJzLy8tLAwAESAGx'
+    sheet_name = 'ScreenImage'
+    image: 'Icon' = IconRow(0)
+    jingle: 'Jingle' = RowForeign(1, 'Jingle')
+    type: int_t = RowData(2)
+    lang: bool_t = RowData(3)
+
+
+class SecretRecipeBook(DataRow):
+    _sign = b'SecretRecipeBook|eJzLKwYAAVEA4g=='
+    sheet_name = 'SecretRecipeBook'
+    _display = 'sub_division_name'
+    item: 'Item' = RowForeign(0, 'Item')
+    sub_division_name: str_t = RowData(1)
+
+
+class SequentialEvent(DataRow):
+    _sign = b'SequentialEvent|eJzLyxsFlAEAT2WKXQ=='
+    sheet_name = 'SequentialEvent'
+    valid_range: int_t = RowData(0)
+    out_of_range_log_message_id: int_t = RowData(1)
+    event_list_command: List[int_t] = ListData(ir((2, 64, 1)), RowData)
+    event_list_param0: List[int_t] = ListData(ir((66, 64, 1)), RowData)
+    event_list_param1: List[int_t] = ListData(ir((130, 64, 1)), RowData)
+    event_list_param2: List[int_t] = ListData(ir((194, 64, 1)), RowData)
+    event_list_param3: List[int_t] = ListData(ir((258, 64, 1)), RowData)
+
+
+class SequentialEventMultipleRange(DataRow):
+    _sign = b'SequentialEventMultipleRange|eJzLSwMAAUQA1Q=='
+    sheet_name = 'SequentialEventMultipleRange'
+    layout_id: int_t = RowData(0)
+    is_hint: bool_t = RowData(1)
+
+
+class SharlayanCraftWorks(DataRow):
+    _sign = b'SharlayanCraftWorks|eJzLyysGAAKcAVA='
+    sheet_name = 'SharlayanCraftWorks'
+    reception_npc: int_t = RowData(0)
+    faculty: int_t = RowData(1)
+    text: str_t = RowData(2)
+
+
+class SharlayanCraftWorksSupply(DataRow):
+    _sign = b'SharlayanCraftWorksSupply|eJzLyyMeAACpnxLp'
+    sheet_name = 'SharlayanCraftWorksSupply'
+    supply_required_level: List[int_t] = ListData(ir((0, 4, 1)), RowData)
+    supply_supply_catalog_id: List[int_t] = ListData(ir((4, 4, 1)), RowData)
+    supply_supply_item_refine_min: List[int_t] = ListData(ir((8, 4, 1)), RowData)
+    supply_supply_item_refine_threshold: List[int_t] = ListData(ir((12, 4, 1)), RowData)
+    supply_reward_exp: List[int_t] = ListData(ir((16, 4, 1)), RowData)
+    supply_high_refine_reward_exp_rate: List[int_t] = ListData(ir((20, 4, 1)), RowData)
+    supply_reward_gil: List[int_t] = ListData(ir((24, 4, 1)), RowData)
+    supply_high_refine_reward_gil_rate: List[int_t] = ListData(ir((28, 4, 1)), RowData)
+    supply_reward_currency_rotation: List[int_t] = ListData(ir((32, 4, 1)), RowData)
+    supply_reward_currency: List[int_t] = ListData(ir((36, 4, 1)), RowData)
+    supply_high_refine_reward_currency_rate: List[int_t] = ListData(ir((40, 4, 1)), RowData)
+
+
+class ShellFixedFromCommand(DataRow):
+    _sign = b'ShellFixedFromCommand|eJxLS8vLSwPiYhDIgwEAa4gJbg=='
+    sheet_name = 'ShellFixedFromCommand'
+    is_local_command: bool_t = RowData(0)
+    is_gm_command: bool_t = RowData(1)
+    gm_command_id: int_t = RowData(2)
+    need_gm_rank: int_t = RowData(3)
+    is_packet_command: bool_t = RowData(4)
+    is_debug_packet_command: bool_t = RowData(5)
+    packet_command_id: int_t = RowData(6)
+    identifier_count: int_t = RowData(7)
+    identifier: List[str_t] = ListData(ir((8, 5, 1)), RowData)
+    argument_count: int_t = RowData(13)
+    argument_type: List[int_t] = ListData(ir((14, 8, 1)), RowData)
+
+
+class Skirmish(DataRow):
+    _sign = b'Skirmish|eJzLAwAAbwBv'
+    sheet_name = 'Skirmish'
+    dynamic_event: int_t = RowData(0)
+
+
+class SkyIsland(DataRow):
+    _sign = b'SkyIsland|eJzLAwAAbwBv'
+    sheet_name = 'SkyIsland'
+    num_0: int_t = RowData(0)
+
+
+class SkyIsland2(DataRow):
+    _sign = b'SkyIsland2|eJzLywMAAUwA3Q=='
+    sheet_name = 'SkyIsland2'
+    type: int_t = RowData(0)
+    airship: int_t = RowData(1)
+
+
+class SkyIsland2Mission(DataRow):
+    _sign = b'SkyIsland2Mission|eJzLy8MCikEAAJc3C0Y='
+    sheet_name = 'SkyIsland2Mission'
+    _display = 'item_1'
+    item_1: 'EventItem' = RowForeign(0, 'EventItem')
+    item_2: 'EventItem' = RowForeign(1, 'EventItem')
+    place_name: 'PlaceName' = RowForeign(2, 'PlaceName')
+    field_3: int_t = RowData(3)
+    objective_1: 'SkyIsland2MissionDetail' = RowForeign(4, 'SkyIsland2MissionDetail')
+    pop_range: List[int_t] = ListData(ir((5, 3, 5)), RowData)
+    required_amount_1: int_t = RowData(6)
+    field_7: int_t = RowData(7)
+    field_8: int_t = RowData(8)
+    objective2: 'SkyIsland2MissionDetail' = RowForeign(9, 'SkyIsland2MissionDetail')
+    required_amount_2: int_t = RowData(11)
+    field_12: int_t = RowData(12)
+    field_13: int_t = RowData(13)
+    objective3: 'SkyIsland2MissionDetail' = RowForeign(14, 'SkyIsland2MissionDetail')
+    field_16: int_t = RowData(16)
+    field_17: int_t = RowData(17)
+    field_18: int_t = RowData(18)
+    field_19: int_t = RowData(19)
+    image: 'Icon' = IconRow(20)
+    field_21: str_t = RowData(21)
+    field_22: str_t = RowData(22)
+    field_23: str_t = RowData(23)
+    field_24: str_t = RowData(24)
+    field_25: str_t = RowData(25)
+
+
+class SkyIsland2MissionDetail(DataRow):
+    _sign = b'SkyIsland2MissionDetail|eJzLywODYiAAAByZBM8='
+    sheet_name = 'SkyIsland2MissionDetail'
+    _display = 'objective'
+    type: 'SkyIsland2MissionType' = RowForeign(0, 'SkyIsland2MissionType')
+    field_1: int_t = RowData(1)
+    range: 'SkyIsland2RangeType' = RowForeign(2, 'SkyIsland2RangeType')
+    field_3: int_t = RowData(3)
+    e_obj: 'EObjName' = RowForeign(4, 'EObjName')
+    field_5: int_t = RowData(5)
+    field_6: int_t = RowData(6)
+    objective: str_t = RowData(7)
+    field_8: str_t = RowData(8)
+    field_9: str_t = RowData(9)
+    field_10: str_t = RowData(10)
+
+
+class SkyIsland2MissionType(DataRow):
+    _sign = b'SkyIsland2MissionType|eJxLAwAAZwBn'
+    sheet_name = 'SkyIsland2MissionType'
+    _display = 'free_exploration'
+    free_exploration: bool_t = RowData(0)
+
+
+class SkyIsland2RangeType(DataRow):
+    _sign = b'SkyIsland2RangeType|eJzLAwAAbwBv'
+    sheet_name = 'SkyIsland2RangeType'
+    _display = 'range_size'
+    range_size: int_t = RowData(0)
+
+
+class SkyIslandMapMarker(DataRow):
+    _sign = b'SkyIslandMapMarker|eJzLy0MDAEHPB08='
+    sheet_name = 'SkyIslandMapMarker'
+    num_0: int_t = RowData(0)
+    num_1: int_t = RowData(1)
+    num_2: int_t = RowData(2)
+    num_3: int_t = RowData(3)
+    num_4: int_t = RowData(4)
+    num_5: int_t = RowData(5)
+    num_6: int_t = RowData(6)
+    num_7: int_t = RowData(7)
+    num_8: int_t = RowData(8)
+    num_9: int_t = RowData(9)
+    num_10: int_t = RowData(10)
+    num_11: int_t = RowData(11)
+    num_12: int_t = RowData(12)
+    num_13: int_t = RowData(13)
+    num_14: int_t = RowData(14)
+    num_15: int_t = RowData(15)
+    num_16: int_t = RowData(16)
+
+
+class SkyIslandSubject(DataRow):
+    _sign = b'SkyIslandSubject|eJzLy0MHAEmMB70='
+    sheet_name = 'SkyIslandSubject'
+    num_0: int_t = RowData(0)
+    num_1: int_t = RowData(1)
+    num_2: int_t = RowData(2)
+    num_3: int_t = RowData(3)
+    num_4: int_t = RowData(4)
+    num_5: int_t = RowData(5)
+    num_6: int_t = RowData(6)
+    num_7: int_t = RowData(7)
+    num_8: int_t = RowData(8)
+    num_9: int_t = RowData(9)
+    num_10: int_t = RowData(10)
+    num_11: int_t = RowData(11)
+    num_12: int_t = RowData(12)
+    num_13: int_t = RowData(13)
+    num_14: int_t = RowData(14)
+    num_15: int_t = RowData(15)
+    num_16: int_t = RowData(16)
+    num_17: int_t = RowData(17)
+
+
+class Snipe(DataRow):
+    _sign = b'Snipe|eJzLy0vLg4JiIEDwqAGKkUBeHgC27i47'
+    sheet_name = 'Snipe'
+    position: int_t = RowData(0)
+    time_limit: int_t = RowData(1)
+    time_limit_game_over: bool_t = RowData(2)
+    bg_collision: int_t = RowData(3)
+    camera_up: int_t = RowData(4)
+    camera_down: int_t = RowData(5)
+    camera_left: int_t = RowData(6)
+    camera_right: int_t = RowData(7)
+    camera_zoom: int_t = RowData(8)
+    action_hit_time: int_t = RowData(9)
+    action_lock_time: int_t = RowData(10)
+    action_vfx: str_t = RowData(11)
+    hit_vfx: str_t = RowData(12)
+    miss_vfx: str_t = RowData(13)
+    invincible_vfx: str_t = RowData(14)
+    not_hit_talk: int_t = RowData(15)
+    last_hit_camera: bool_t = RowData(16)
+    actor_layout: List[int_t] = ListData(ir((17, 8, 1)), RowData)
+    actor_hit_event: List[int_t] = ListData(ir((25, 8, 1)), RowData)
+    actor_behavior_miss_camera: List[int_t] = ListData(ir((33, 8, 1)), RowData)
+    actor_event_object_reaction: List[int_t] = ListData(ir((41, 8, 1)), RowData)
+    actor_camera_distance_min: List[int_t] = ListData(ir((49, 8, 1)), RowData)
+    actor_camera_distance_max: List[int_t] = ListData(ir((57, 8, 1)), RowData)
+    actor_todo: List[int_t] = ListData(ir((65, 8, 1)), RowData)
+    lively_layout: List[int_t] = ListData(ir((73, 8, 1)), RowData)
+    start_camera: List[int_t] = ListData(ir((81, 4, 1)), RowData)
+    start_camera_target: List[int_t] = ListData(ir((85, 4, 1)), RowData)
+    start_camera_target_param: List[int_t] = ListData(ir((89, 4, 1)), RowData)
+    text_title: str_t = RowData(93)
+    text_description: str_t = RowData(94)
+    text_failure_condition: str_t = RowData(95)
+    text_todo: List[str_t] = ListData(ir((96, 8, 1)), RowData)
+    text_action: str_t = RowData(104)
+    skin_zoom_min_scale: int_t = RowData(105)
+    skin_zoom_max_scale: int_t = RowData(106)
+
+
+class SnipeCollision(DataRow):
+    _sign = b'SnipeCollision|eJzLywMCAAZ3Aic='
+    sheet_name = 'SnipeCollision'
+    eid: int_t = RowData(0)
+    type: int_t = RowData(1)
+    x: int_t = RowData(2)
+    y: int_t = RowData(3)
+    z: int_t = RowData(4)
+
+
+class SnipeElementId(DataRow):
+    _sign = b'SnipeElementId|eJzLAwAAbwBv'
+    sheet_name = 'SnipeElementId'
+    element_id: int_t = RowData(0)
+
+
+class SnipeHitEvent(DataRow):
+    _sign = b'SnipeHitEvent|eJzLywMCAAZ3Aic='
+    sheet_name = 'SnipeHitEvent'
+    type: int_t = RowData(0)
+    collision: int_t = RowData(1)
+    camera: int_t = RowData(2)
+    talk: int_t = RowData(3)
+    talk_condition: int_t = RowData(4)
+
+
+class SnipePerformanceCamera(DataRow):
+    _sign = b'SnipePerformanceCamera|eJzLy4MBABesBE0='
+    sheet_name = 'SnipePerformanceCamera'
+    eid: int_t = RowData(0)
+    offset_up_down: int_t = RowData(1)
+    offset_left_right: int_t = RowData(2)
+    yaw: int_t = RowData(3)
+    pitch: int_t = RowData(4)
+    distance: int_t = RowData(5)
+    target_yaw: int_t = RowData(6)
+    target_pitch: int_t = RowData(7)
+    target_distance: int_t = RowData(8)
+    time: int_t = RowData(9)
+
+
+class SnipeTalk(DataRow):
+    _sign = b'SnipeTalk|eJzLy8srLi4GAAkqAqQ='
+    sheet_name = 'SnipeTalk'
+    log_kind: int_t = RowData(0)
+    shape: int_t = RowData(1)
+    talker: 'SnipeTalkName' = RowForeign(2, 'SnipeTalkName')
+    text: List[str_t] = ListData(ir((3, 3, 1)), RowData)
+
+
+class SnipeTalkName(DataRow):
+    _sign = b'SnipeTalkName|eJwrBgAAdAB0'
+    sheet_name = 'SnipeTalkName'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class SpearfishingComboTarget(DataRow):
+    _sign = b'SpearfishingComboTarget|eJwrLgYAAVsA5w=='
+    sheet_name = 'SpearfishingComboTarget'
+    field_0: str_t = RowData(0)
+    field_1: str_t = RowData(1)
+
+
+class SpearfishingEcology(DataRow):
+    _sign = b'SpearfishingEcology|eJwrLi4uBgAEggHN'
+    sheet_name = 'SpearfishingEcology'
+    text_0: str_t = RowData(0)
+    text_1: str_t = RowData(1)
+    text_2: str_t = RowData(2)
+    text_3: str_t = RowData(3)
+
+
+class SpearfishingItem(DataRow):
+    _sign = b'SpearfishingItem|eJwrzstLS8vLA5FpACEUBQY='
+    sheet_name = 'SpearfishingItem'
+    _display = 'item_id'
+    text: str_t = RowData(0)
+    item_id: 'Item' = RowForeign(1, 'Item')
+    level: 'GatheringItemLevelConvertTable' = RowForeign(2, 'GatheringItemLevelConvertTable')
+    is_mask_condition: bool_t = RowData(3)
+    is_special_condition: bool_t = RowData(4)
+    record_type: 'FishingRecordType' = RowForeign(5, 'FishingRecordType')
+    territory: 'TerritoryType' = RowForeign(6, 'TerritoryType')
+    typical_spearfishing_spot: int_t = RowData(7)
+    folklore: int_t = RowData(8)
+    is_fish_print: bool_t = RowData(9)
+    is_catch_time: bool_t = RowData(10)
+    is_weather_condition: bool_t = RowData(11)
+
+
+class SpearfishingItem(DataRow):
+    _sign = b'SpearfishingItem|eJwrzsvLSwNhABNcA9Q='
+    sheet_name = 'SpearfishingItem'
+    _display = 'item_id'
+    text: str_t = RowData(0)
+    item_id: 'Item' = RowForeign(1, 'Item')
+    level: 'GatheringItemLevelConvertTable' = RowForeign(2, 'GatheringItemLevelConvertTable')
+    sort_id: int_t = RowData(3)
+    is_mask_condition: bool_t = RowData(4)
+    record_type: 'FishingRecordType' = RowForeign(5, 'FishingRecordType')
+    typical_spearfishing_spot: 'TerritoryType' = RowForeign(6, 'TerritoryType')
+    folklore: int_t = RowData(7)
+    is_fish_print: bool_t = RowData(8)
+
+
+class SpearfishingItem(DataRow):
+    _sign = b'SpearfishingItem|eJwrzstLywNiAA94A2Y='
+    sheet_name = 'SpearfishingItem'
+    _display = 'item_id'
+    text: str_t = RowData(0)
+    item_id: 'Item' = RowForeign(1, 'Item')
+    level: 'GatheringItemLevelConvertTable' = RowForeign(2, 'GatheringItemLevelConvertTable')
+    is_mask_condition: bool_t = RowData(3)
+    record_type: 'FishingRecordType' = RowForeign(4, 'FishingRecordType')
+    typical_spearfishing_spot: 'TerritoryType' = RowForeign(5, 'TerritoryType')
+    folklore: int_t = RowData(6)
+    is_fish_print: bool_t = RowData(7)
+
+
+class SpearfishingItemReverse(DataRow):
+    _sign = b'SpearfishingItemReverse|eJxLAwAAZwBn'
+    sheet_name = 'SpearfishingItemReverse'
+    masked: bool_t = RowData(0)
+
+
+class SpearfishingNotebook(DataRow):
+    _sign = b'SpearfishingNotebook|eJzLS8uDAwAhOAUh'
+    sheet_name = 'SpearfishingNotebook'
+    _display = 'spot_name_id'
+    level: int_t = RowData(0)
+    rare: bool_t = RowData(1)
+    territory_type: 'TerritoryType' = RowForeign(2, 'TerritoryType')
+    maker_pos_x: int_t = RowData(3)
+    maker_pos_y: int_t = RowData(4)
+    maker_type: int_t = RowData(5)
+    name_layout: int_t = RowData(6)
+    spot_name_id: 'PlaceName' = RowForeign(7, 'PlaceName')
+    sort_key: int_t = RowData(8)
+    base_id: 'List[GatheringPointBase]' = ListData(ir((9, 3, 1)), RowForeign, 'GatheringPointBase')
+
+
+class SpearfishingRecordPage(DataRow):
+    _sign = b'SpearfishingRecordPage|eJzLywMDAAwPAwM='
+    sheet_name = 'SpearfishingRecordPage'
+    record_type: List[int_t] = ListData(ir((0, 3, 1)), RowData)
+    area_name: 'PlaceName' = RowForeign(3, 'PlaceName')
+    area_icon: 'Icon' = IconRow(4)
+    open_level: int_t = RowData(5)
+    sort_order: int_t = RowData(6)
+
+
+class SpearfishingSilhouette(DataRow):
+    _sign = b'SpearfishingSilhouette|eJzLAwAAbwBv'
+    sheet_name = 'SpearfishingSilhouette'
+    shadow_width: int_t = RowData(0)
+
+
+class SpecialShop(DataRow):
+    _sign = b'SpecialShop|eJwrzhuCIIkCMNBuJweMNP+OglEwCkbBKKAxSANhADlva80='
+    sheet_name = 'SpecialShop'
+    _display = 'text'
+    text: str_t = RowData(0)
+    item_item_id: List[List[int_t]] = ListData(ir(((1, 2, 240), 60, 1)), ListData, RowData)
+    item_set_num: List[List[int_t]] = ListData(ir(((61, 2, 240), 60, 1)), ListData, RowData)
+    item_category: List[List[int_t]] = ListData(ir(((121, 2, 240), 60, 1)), ListData, RowData)
+    item_is_item_hq: List[List[bool_t]] = ListData(ir(((181, 2, 240), 60, 1)), ListData, RowData)
+    item_currency: List[List[int_t]] = ListData(ir(((481, 3, 240), 60, 1)), ListData, RowData)
+    item_num_of_currency: List[List[int_t]] = ListData(ir(((541, 3, 240), 60, 1)), ListData, RowData)
+    item_currency_type: List[List[int_t]] = ListData(ir(((601, 3, 240), 60, 1)), ListData, RowData)
+    item_currency_masterpiece: List[List[int_t]] = ListData(ir(((661, 3, 240), 60, 1)), ListData, RowData)
+    item_quest: List[List[int_t]] = ListData(ir(((1201, 2, 60), 60, 1)), ListData, RowData)
+    item_quest_sequence: List[List[int_t]] = ListData(ir(((1321, 2, 60), 60, 1)), ListData, RowData)
+    item_quest_display_type: List[int_t] = ListData(ir((1441, 60, 1)), RowData)
+    item_quest_log_message: List[int_t] = ListData(ir((1501, 60, 1)), RowData)
+    item_instance_content: List[int_t] = ListData(ir((1561, 60, 1)), RowData)
+    item_instance_content_display_type: List[int_t] = ListData(ir((1621, 60, 1)), RowData)
+    item_instance_content_log_message: List[int_t] = ListData(ir((1681, 60, 1)), RowData)
+    item_achievement: List[int_t] = ListData(ir((1741, 60, 1)), RowData)
+    item_achievement_display_type: List[int_t] = ListData(ir((1801, 60, 1)), RowData)
+    item_achievement_log_message: List[int_t] = ListData(ir((1861, 60, 1)), RowData)
+    item_sort: List[int_t] = ListData(ir((1921, 60, 1)), RowData)
+    item_added_version: List[int_t] = ListData(ir((1981, 60, 1)), RowData)
+    shop_type_pattern: int_t = RowData(2041)
+    disclosure_reward_or_quest: 'Quest' = RowForeign(2042, 'Quest')
+    qualified_talk: 'DefaultTalk' = RowForeign(2043, 'DefaultTalk')
+    unqualified_talk: 'DefaultTalk' = RowForeign(2044, 'DefaultTalk')
+    item_obtain_event: int_t = RowData(2045)
+    system: bool_t = RowData(2046)
+    festival: int_t = RowData(2047)
+    festival_phase: int_t = RowData(2048)
+    content: int_t = RowData(2049)
+    content_completed: bool_t = RowData(2050)
+
+
+class SpecialShop(DataRow):
+    _sign = b'SpecialShop|eJwrzhuCIIkCMNBuJweMNP+OglEwCoY4SAMiADn/ttg='
+    sheet_name = 'SpecialShop'
+    _display = 'text'
+    text: str_t = RowData(0)
+    item_item_id: List[List[int_t]] = ListData(ir(((1, 2, 240), 60, 1)), ListData, RowData)
+    item_set_num: List[List[int_t]] = ListData(ir(((61, 2, 240), 60, 1)), ListData, RowData)
+    item_category: List[List[int_t]] = ListData(ir(((121, 2, 240), 60, 1)), ListData, RowData)
+    item_is_item_hq: List[List[bool_t]] = ListData(ir(((181, 2, 240), 60, 1)), ListData, RowData)
+    item_currency: List[List[int_t]] = ListData(ir(((481, 3, 240), 60, 1)), ListData, RowData)
+    item_num_of_currency: List[List[int_t]] = ListData(ir(((541, 3, 240), 60, 1)), ListData, RowData)
+    item_currency_type: List[List[int_t]] = ListData(ir(((601, 3, 240), 60, 1)), ListData, RowData)
+    item_currency_masterpiece: List[List[int_t]] = ListData(ir(((661, 3, 240), 60, 1)), ListData, RowData)
+    item_quest: List[List[int_t]] = ListData(ir(((1201, 2, 60), 60, 1)), ListData, RowData)
+    item_quest_sequence: List[List[int_t]] = ListData(ir(((1321, 2, 60), 60, 1)), ListData, RowData)
+    item_achievement: List[int_t] = ListData(ir((1441, 60, 1)), RowData)
+    item_sort: List[int_t] = ListData(ir((1501, 60, 1)), RowData)
+    item_added_version: List[int_t] = ListData(ir((1561, 60, 1)), RowData)
+    shop_type_pattern: int_t = RowData(1621)
+    disclosure_reward_or_quest: 'Quest' = RowForeign(1622, 'Quest')
+    qualified_talk: 'DefaultTalk' = RowForeign(1623, 'DefaultTalk')
+    unqualified_talk: 'DefaultTalk' = RowForeign(1624, 'DefaultTalk')
+    item_obtain_event: int_t = RowData(1625)
+    system: bool_t = RowData(1626)
+    festival: int_t = RowData(1627)
+    content: int_t = RowData(1628)
+    content_completed: bool_t = RowData(1629)
+
+
+class SpecialShopItemCategory(DataRow):
+    _sign = b'SpecialShopItemCategory|eJwrBgAAdAB0'
+    sheet_name = 'SpecialShopItemCategory'
+    _display = 'name'
+    name: str_t = RowData(0)
+
+
+class Spectator(DataRow):
+    _sign = b'Spectator|eJzLyyMSAAByLhGf'
+    sheet_name = 'Spectator'
+    camera_x: List[float_t] = ListData(ir((0, 8, 1)), RowData)
+    camera_y: List[float_t] = ListData(ir((8, 8, 1)), RowData)
+    camera_z: List[float_t] = ListData(ir((16, 8, 1)), RowData)
+    camera_rotation_x: List[float_t] = ListData(ir((24, 8, 1)), RowData)
+    camera_rotation_y: List[float_t] = ListData(ir((32, 8, 1)), RowData)
+    party_list_layout: int_t = RowData(40)
+
+
+class Stain(DataRow):
+    _sign = b'Stain|eJzLy8srLk5LAwAMGgL9'
+    sheet_name = 'Stain'
+    _display = 'text_color_name'
+    color: int_t = RowData(0)
+    category: int_t = RowData(1)
+    sort_id: int_t = RowData(2)
+    text_name: str_t = RowData(3)
+    text_color_name: str_t = RowData(4)
+    metal: bool_t = RowData(5)
+    furniture: bool_t = RowData(6)
+
+
+class Stain(DataRow):
+    _sign = b'Stain|eJzLy8srTksDAAkDAoo='
+    sheet_name = 'Stain'
+    _display = 'text'
+    color: int_t = RowData(0)
+    category: int_t = RowData(1)
+    sort_id: int_t = RowData(2)
+    text: str_t = RowData(3)
+    metal: bool_t = RowData(4)
+    furniture: bool_t = RowData(5)
+
+
+class StainTransient(DataRow):
+    _sign = b'StainTransient|eJzLywMAAUwA3Q=='
+    sheet_name = 'StainTransient'
+    _display = 'item'
+    item: 'List[Item]' = ListData(ir((0, 2, 1)), RowForeign, 'Item')
+
+
+class StanceChange(DataRow):
+    _sign = b'StanceChange|eJzLywMCAAZ3Aic='
+    sheet_name = 'StanceChange'
+    transformation_id: int_t = RowData(0)
+    timeline: int_t = RowData(1)
+    timeline2: int_t = RowData(2)
+    sync_timeline: int_t = RowData(3)
+    update_model_radius_delay: float_t = RowData(4)
+
+
+class Status(DataRow):
+    _sign = b'Status|eJwrLs6DgDQYADGBGAyBNADrXA3B'
+    sheet_name = 'Status'
+    _display = 'text_name'
+    text_name: str_t = RowData(0)
+    text_help: str_t = RowData(1)
+    icon: 'Icon' = IconRow(2)
+    group_id: int_t = RowData(3)
+    stack: int_t = RowData(4)
+    class_job: 'ClassJobCategory' = RowForeign(5, 'ClassJobCategory')
+    category: int_t = RowData(6)
+    hit_effect: 'StatusHitEffect' = RowForeign(7, 'StatusHitEffect')
+    loop_vfx: 'StatusLoopVFX' = RowForeign(8, 'StatusLoopVFX')
+    not_move: bool_t = RowData(9)
+    not_move_can_turn: bool_t = RowData(10)
+    not_action: bool_t = RowData(11)
+    not_control: bool_t = RowData(12)
+    shape_shift: bool_t = RowData(13)
+    not_look_at: bool_t = RowData(14)
+    clear_esuna: bool_t = RowData(15)
+    forever: bool_t = RowData(16)
+    hide_timer: bool_t = RowData(17)
+    party_list_priority: int_t = RowData(18)
+    hud_category: int_t = RowData(19)
+    disp_off: bool_t = RowData(20)
+    multiple: bool_t = RowData(21)
+    value: int_t = RowData(22)
+    system_param_effect: int_t = RowData(23)
+    inconvenience_clear: bool_t = RowData(24)
+    log: int_t = RowData(25)
+    fc_action: bool_t = RowData(26)
+    attack_type: int_t = RowData(27)
+    semi_transparent: bool_t = RowData(28)
+    target_type: int_t = RowData(29)
+    flag: int_t = RowData(30)
+    flag2: int_t = RowData(31)
+    group_pose: bool_t = RowData(32)
+
+
+class StatusHitEffect(DataRow):
+    _sign = b'StatusHitEffect|eJzLAwAAbwBv'
+    sheet_name = 'StatusHitEffect'
+    _display = 'hit_effect'
+    hit_effect: 'VFX' = RowForeign(0, 'VFX')
+
+
+class StatusLoopVFX(DataRow):
+    _sign = b'StatusLoopVFX|eJzLy4OAtLQ0ABw3BKM='
+    sheet_name = 'StatusLoopVFX'
+    _display = 'vfx'
+    vfx: 'VFX' = RowForeign(0, 'VFX')
+    stack2: int_t = RowData(1)
+    vfx2: 'VFX' = RowForeign(2, 'VFX')
+    stack3: int_t = RowData(3)
+    vfx3: 'VFX' = RowForeign(4, 'VFX')
+    vfx__e: int_t = RowData(5)
+    slot: int_t = RowData(6)
+    priority: int_t = RowData(7)
+    control_chara_only: bool_t = RowData(8)
+    vfx_high_priority: bool_t = RowData(9)
+    hide_transformation: bool_t = RowData(10)
+
+
+class StatusLoopVFX(DataRow):
+    _sign = b'StatusLoopVFX|eJzLywODtLQ0ABd8BDU='
+    sheet_name = 'StatusLoopVFX'
+    _display = 'vfx'
+    vfx: 'VFX' = RowForeign(0, 'VFX')
+    stack2: int_t = RowData(1)
+    vfx2: 'VFX' = RowForeign(2, 'VFX')
+    stack3: int_t = RowData(3)
+    vfx3: 'VFX' = RowForeign(4, 'VFX')
+    slot: int_t = RowData(5)
+    priority: int_t = RowData(6)
+    control_chara_only: bool_t = RowData(7)
+    vfx_high_priority: bool_t = RowData(8)
+    hide_transformation: bool_t = RowData(9)
+
+
+class Story(DataRow):
+    _sign = b'Story|eJwrLiYS5I2CUTAKRsEoGAWjAA0AAM9+IX0='
+    sheet_name = 'Story'
+    script: str_t = RowData(0)
+    define_name: List[str_t] = ListData(ir((1, 40, 1)), RowData)
+    define_value: List[int_t] = ListData(ir((41, 40, 1)), RowData)
+    sequence_sequence: List[int_t] = ListData(ir((81, 110, 1)), RowData)
+    sequence_completed_quest_operator: List[int_t] = ListData(ir((191, 110, 1)), RowData)
+    sequence_completed_quest: List[List[int_t]] = ListData(ir(((301, 3, 110), 110, 1)), ListData, RowData)
+    sequence_accepted_quest_operator: List[int_t] = ListData(ir((631, 110, 1)), RowData)
+    sequence_accepted_quest: List[List[int_t]] = ListData(ir(((741, 3, 220), 110, 1)), ListData, RowData)
+    sequence_accepted_quest_sequence: List[List[int_t]] = ListData(ir(((851, 3, 220), 110, 1)), ListData, RowData)
+    sequence_layer_set: List[List[int_t]] = ListData(ir(((1401, 2, 110), 110, 1)), ListData, RowData)
+    visible_listener_sequence_begin: List[int_t] = ListData(ir((1621, 80, 1)), RowData)
+    visible_listener_sequence_end: List[int_t] = ListData(ir((1701, 80, 1)), RowData)
+    visible_listener_listener: List[int_t] = ListData(ir((1781, 80, 1)), RowData)
+    layer_set_territory_type: 'List[TerritoryType]' = ListData(ir((1861, 2, 1)), RowForeign, 'TerritoryType')
+
+
+class StorySystemDefine(DataRow):
+    _sign = b'StorySystemDefine|eJwrzgMAAVYA4g=='
+    sheet_name = 'StorySystemDefine'
+    define_name: str_t = RowData(0)
+    define_value: int_t = RowData(1)
+
+
+class SubmarineExploration(DataRow):
+    _sign = b'SubmarineExploration|eJwrLs4DgrQ8MAAAJ2wFmQ=='
+    sheet_name = 'SubmarineExploration'
+    _display = 'name_name'
+    name_name: str_t = RowData(0)
+    name_abbreviation: str_t = RowData(1)
+    x: int_t = RowData(2)
+    y: int_t = RowData(3)
+    z: int_t = RowData(4)
+    submarine_map: 'SubmarineMap' = RowForeign(5, 'SubmarineMap')
+    is_start_point: bool_t = RowData(6)
+    difficulty: int_t = RowData(7)
+    rank: int_t = RowData(8)
+    energy_item_num: int_t = RowData(9)
+    time: int_t = RowData(10)
+    survey_distance: int_t = RowData(11)
+    reward_exp: int_t = RowData(12)
+
+
+class SubmarineExplorationLog(DataRow):
+    _sign = b'SubmarineExplorationLog|eJwrBgAAdAB0'
+    sheet_name = 'SubmarineExplorationLog'
+    text: str_t = RowData(0)
+
+
+class SubmarineMap(DataRow):
+    _sign = b'SubmarineMap|eJwrzgMAAVYA4g=='
+    sheet_name = 'SubmarineMap'
+    _display = 'name'
+    name: str_t = RowData(0)
+    icon: 'Icon' = IconRow(1)
+
+
+class SubmarinePart(DataRow):
+    _sign = b'SubmarinePart|eJzLy4MBABesBE0='
+    sheet_name = 'SubmarinePart'
+    _display = 'category'
+    category: int_t = RowData(0)
+    need_rank: int_t = RowData(1)
+    cost: int_t = RowData(2)
+    exploration: int_t = RowData(3)
+    collection: int_t = RowData(4)
+    cruise_speed: int_t = RowData(5)
+    cruise_distance: int_t = RowData(6)
+    luck: int_t = RowData(7)
+    pattern_id: int_t = RowData(8)
+    repair_item_num: int_t = RowData(9)
+
+
+class SubmarineRank(DataRow):
+    _sign = b'SubmarineRank|eJzLywMDAAwPAwM='
+    sheet_name = 'SubmarineRank'
+    cost_limit: int_t = RowData(0)
+    rank_up_exp: int_t = RowData(1)
+    rank_bonus_exploration: int_t = RowData(2)
+    rank_bonus_collection: int_t = RowData(3)
+    rank_bonus_cruise_speed: int_t = RowData(4)
+    rank_bonus_cruise_distance: int_t = RowData(5)
+    rank_bonus_luck: int_t = RowData(6)
+
+
+class SubmarineSpecCategory(DataRow):
+    _sign = b'SubmarineSpecCategory|eJwrBgAAdAB0'
+    sheet_name = 'SubmarineSpecCategory'
+    text: str_t = RowData(0)
+
+
+class SwitchTalk(DataRow):
+    _sign = b'SwitchTalk|eJzLSwMAAUQA1Q=='
+    sheet_name = 'SwitchTalk'
+    layout_id: int_t = RowData(0)
+    system: bool_t = RowData(1)
+
+
+class SwitchTalkVariation(DataRow):
+    _sign = b'SwitchTalkVariation|eJzLy8vLAwAEUAG5'
+    sheet_name = 'SwitchTalkVariation'
+    case_condition: int_t = RowData(0)
+    case_condition_accepted: 'Quest' = RowForeign(1, 'Quest')
+    case_condition_accepted_sequence: int_t = RowData(2)
+    talk: 'DefaultTalk' = RowForeign(3, 'DefaultTalk')
+
+
+class SystemGraphicPreset(DataRow):
+    _sign = b'SystemGraphicPreset|eJzLyyMAAPEvDi8='
+    sheet_name = 'SystemGraphicPreset'
+    hdr_quality: int_t = RowData(0)
+    water_wet: int_t = RowData(1)
+    occlusion_culling: int_t = RowData(2)
+    lod_enable: int_t = RowData(3)
+    lod_stream: int_t = RowData(4)
+    reflection: int_t = RowData(5)
+    anti_alias: int_t = RowData(6)
+    translucent_quality: int_t = RowData(7)
+    grass_quality: int_t = RowData(8)
+    parallax_occlusion: int_t = RowData(9)
+    tessellation: int_t = RowData(10)
+    glare_representation: int_t = RowData(11)
+    map_res: int_t = RowData(12)
+    shadow_self: int_t = RowData(13)
+    shadow_party: int_t = RowData(14)
+    shadow_other: int_t = RowData(15)
+    shadow_enemy: int_t = RowData(16)
+    shadow_lod: int_t = RowData(17)
+    shadow_tex_size: int_t = RowData(18)
+    shadow_cascade: int_t = RowData(19)
+    soft_shadow: int_t = RowData(20)
+    texture_filter: int_t = RowData(21)
+    texture_anisotropic: int_t = RowData(22)
+    physics_self: int_t = RowData(23)
+    physics_party: int_t = RowData(24)
+    physics_other: int_t = RowData(25)
+    physics_enemy: int_t = RowData(26)
+    vignetting: int_t = RowData(27)
+    radial_blur: int_t = RowData(28)
+    ssao: int_t = RowData(29)
+    glare: int_t = RowData(30)
+    distortion_water: int_t = RowData(31)
+    dof: int_t = RowData(32)
@@ -0,0 +1,586 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class TelepoRelay(DataRow):
+    _sign = b'TelepoRelay|eJzLy8MCAGNXCQc='
+    sheet_name = 'TelepoRelay'
+    relay_point_relay_territory_source: List[int_t] = ListData(ir((0, 7, 1)), RowData)
+    relay_point_relay_territory_destination: List[int_t] = ListData(ir((7, 7, 1)), RowData)
+    relay_point_cost: List[int_t] = ListData(ir((14, 7, 1)), RowData)
+
+
+class TelepoRelay(DataRow):
+    _sign = b'TelepoRelay|eJzLy0MHAEmMB70='
+    sheet_name = 'TelepoRelay'
+    relay_point_relay_territory_source: List[int_t] = ListData(ir((0, 6, 1)), RowData)
+    relay_point_relay_territory_destination: List[int_t] = ListData(ir((6, 6, 1)), RowData)
+    relay_point_cost: List[int_t] = ListData(ir((12, 6, 1)), RowData)
+
+
+class TerritoryChatRule(DataRow):
+    _sign = b'TerritoryChatRule|eJxLy4MAAA9AA2k='
+    sheet_name = 'TerritoryChatRule'
+    area_chat_only_same_force: bool_t = RowData(0)
+    enable_range_chat: int_t = RowData(1)
+    enable_zone_chat: int_t = RowData(2)
+    enable_contents_tell_chat: int_t = RowData(3)
+    enable_tell_chat: int_t = RowData(4)
+    enable_party_chat: int_t = RowData(5)
+    enable_world_chat: int_t = RowData(6)
+    enable_pvp_team_chat: int_t = RowData(7)
+
+
+class TerritoryIntendedUse(DataRow):
+    _sign = b'TerritoryIntendedUse|eJxLS8MAeXkoPDBKSwMAWQYQdw=='
+    sheet_name = 'TerritoryIntendedUse'
+    craft: bool_t = RowData(0)
+    gathering: bool_t = RowData(1)
+    repair: bool_t = RowData(2)
+    class_job_change: bool_t = RowData(3)
+    battle_class_only: bool_t = RowData(4)
+    sp_job_change: bool_t = RowData(5)
+    enable_buddy: bool_t = RowData(6)
+    enable_pet: bool_t = RowData(7)
+    enable_mount_link: bool_t = RowData(8)
+    immediately_logout: bool_t = RowData(9)
+    enable_teleport: bool_t = RowData(10)
+    enable_return: bool_t = RowData(11)
+    enable_companion: bool_t = RowData(12)
+    enable_ornament: bool_t = RowData(13)
+    enable_home_point: bool_t = RowData(14)
+    enable_recommend: bool_t = RowData(15)
+    enable_discovery_notification: bool_t = RowData(16)
+    enable_invalid_discovery: bool_t = RowData(17)
+    alone: bool_t = RowData(18)
+    area_horizon_range: int_t = RowData(19)
+    buzz_type: int_t = RowData(20)
+    se_limit: bool_t = RowData(21)
+    enable_action: bool_t = RowData(22)
+    enable_using_item: bool_t = RowData(23)
+    recast_penalty: bool_t = RowData(24)
+    enable_table_game: bool_t = RowData(25)
+    disable_table_game_range: bool_t = RowData(26)
+    enable_triple_triad_competition: bool_t = RowData(27)
+    enable_triple_triad_matching: bool_t = RowData(28)
+    enable_idle_camera_raycast: bool_t = RowData(29)
+    enable_group_pose_env_stop: bool_t = RowData(30)
+    enable_orchestrion: bool_t = RowData(31)
+    enable_quick_chat: bool_t = RowData(32)
+    chat_rule: int_t = RowData(33)
+    enable_organization_party: bool_t = RowData(34)
+    enable_perform: bool_t = RowData(35)
+    ensemble: int_t = RowData(36)
+    enable_mirage_plate: bool_t = RowData(37)
+    kick_afk: bool_t = RowData(38)
+    field_marker_preset: bool_t = RowData(39)
+    field_marker_in_battle: bool_t = RowData(40)
+
+
+class TerritoryType(DataRow):
+    _sign = b'TerritoryType|eJwrLs6DgTQQBAIkATAJEU3LAwCRfxIV'
+    sheet_name = 'TerritoryType'
+    _display = 'name'
+    name: str_t = RowData(0)
+    lvb: str_t = RowData(1)
+    battalion_mode: int_t = RowData(2)
+    region: 'PlaceName' = RowForeign(3, 'PlaceName')
+    sub_region: 'PlaceName' = RowForeign(4, 'PlaceName')
+    area: 'PlaceName' = RowForeign(5, 'PlaceName')
+    map: 'Map' = RowForeign(6, 'Map')
+    loading_image: 'LoadingImage' = RowForeign(7, 'LoadingImage')
+    exclusive_type: int_t = RowData(8)
+    intended_use: 'TerritoryIntendedUse' = RowForeign(9, 'TerritoryIntendedUse')
+    content_finder_condition: 'ContentFinderCondition' = RowForeign(10, 'ContentFinderCondition')
+    log_range_limit_off: bool_t = RowData(11)
+    weather: int_t = RowData(12)
+    festival_weather: bool_t = RowData(13)
+    breath: int_t = RowData(14)
+    pc_search: bool_t = RowData(15)
+    stealth: bool_t = RowData(16)
+    mount: bool_t = RowData(17)
+    mount_in_battle: bool_t = RowData(18)
+    bgm: int_t = RowData(19)
+    region_icon: 'Icon' = IconRow(20)
+    area_icon: 'Icon' = IconRow(21)
+    event_handler: 'ArrayEventHandler' = RowForeign(22, 'ArrayEventHandler')
+    quest_battle: 'QuestBattle' = RowForeign(23, 'QuestBattle')
+    aetheryte: 'Aetheryte' = RowForeign(24, 'Aetheryte')
+    client_fixed_time: int_t = RowData(25)
+    resident: int_t = RowData(26)
+    achievement_index: int_t = RowData(27)
+    is_pvp_action: bool_t = RowData(28)
+    need_ex_version: 'ExVersion' = RowForeign(29, 'ExVersion')
+    time_line_control: int_t = RowData(30)
+    shared_group_control: int_t = RowData(31)
+    aether_current_comp_flg_set: int_t = RowData(32)
+    mount_speed: 'MountSpeed' = RowForeign(33, 'MountSpeed')
+    diving_raycast_long: bool_t = RowData(34)
+    enable_packet_disguise: bool_t = RowData(35)
+    individual_weather: int_t = RowData(36)
+    e_npc_y_limit: bool_t = RowData(37)
+    private_priority_actor: bool_t = RowData(38)
+    party_npc_filter_enemy: bool_t = RowData(39)
+    battle_with_height_differrence: bool_t = RowData(40)
+    enable_vfx_priority: bool_t = RowData(41)
+    notorious_monster_territory: int_t = RowData(42)
+
+
+class TerritoryTypeTelepo(DataRow):
+    _sign = b'TerritoryTypeTelepo|eJzLy8vLAwAEUAG5'
+    sheet_name = 'TerritoryTypeTelepo'
+    pos_x: int_t = RowData(0)
+    pos_y: int_t = RowData(1)
+    cost_patch_ratio: int_t = RowData(2)
+    world_type: int_t = RowData(3)
+
+
+class TerritoryTypeTransient(DataRow):
+    _sign = b'TerritoryTypeTransient|eJzLAwAAbwBv'
+    sheet_name = 'TerritoryTypeTransient'
+    _display = 'position_base_y'
+    position_base_y: int_t = RowData(0)
+
+
+class TextCommand(DataRow):
+    _sign = b'TextCommand|eJzLywOCYhDIywMAIg0FQg=='
+    sheet_name = 'TextCommand'
+    _display = 'command'
+    field_0: int_t = RowData(0)
+    field_1: int_t = RowData(1)
+    field_2: int_t = RowData(2)
+    field_3: int_t = RowData(3)
+    field_4: int_t = RowData(4)
+    command: str_t = RowData(5)
+    short_command: str_t = RowData(6)
+    description: str_t = RowData(7)
+    alias: str_t = RowData(8)
+    short_alias: str_t = RowData(9)
+    param: 'TextCommandParam' = RowForeign(10, 'TextCommandParam')
+    field_11: int_t = RowData(11)
+
+
+class TextCommandParam(DataRow):
+    _sign = b'TextCommandParam|eJwrBgAAdAB0'
+    sheet_name = 'TextCommandParam'
+    _display = 'param'
+    param: str_t = RowData(0)
+
+
+class Title(DataRow):
+    _sign = b'Title|eJwrLk7LAwAEYwG7'
+    sheet_name = 'Title'
+    _display = 'text_female'
+    text_male: str_t = RowData(0)
+    text_female: str_t = RowData(1)
+    text_front: bool_t = RowData(2)
+    sort_id: int_t = RowData(3)
+
+
+class TofuEditParam(DataRow):
+    _sign = b'TofuEditParam|eJwrBgAAdAB0'
+    sheet_name = 'TofuEditParam'
+    name: str_t = RowData(0)
+
+
+class TofuObject(DataRow):
+    _sign = b'TofuObject|eJzLywODYjCZlpYGADp9Bs4='
+    sheet_name = 'TofuObject'
+    cateogry: int_t = RowData(0)
+    sort: int_t = RowData(1)
+    icon: int_t = RowData(2)
+    width: int_t = RowData(3)
+    height: int_t = RowData(4)
+    min_scale: int_t = RowData(5)
+    max_scale: int_t = RowData(6)
+    name: str_t = RowData(7)
+    edit_param: List[int_t] = ListData(ir((8, 5, 1)), RowData)
+    is_flip_h: bool_t = RowData(13)
+    is_flip_v: bool_t = RowData(14)
+    is_color: bool_t = RowData(15)
+
+
+class TofuObject(DataRow):
+    _sign = b'TofuObject|eJzLywODYjCZlgYAM68GaA=='
+    sheet_name = 'TofuObject'
+    cateogry: int_t = RowData(0)
+    sort: int_t = RowData(1)
+    icon: int_t = RowData(2)
+    width: int_t = RowData(3)
+    height: int_t = RowData(4)
+    min_scale: int_t = RowData(5)
+    max_scale: int_t = RowData(6)
+    name: str_t = RowData(7)
+    edit_param: List[int_t] = ListData(ir((8, 5, 1)), RowData)
+    is_flip_h: bool_t = RowData(13)
+    is_flip_v: bool_t = RowData(14)
+
+
+class TofuObjectCategory(DataRow):
+    _sign = b'TofuObjectCategory|eJxLy8srBgAENQG2'
+    sheet_name = 'TofuObjectCategory'
+    is_use: bool_t = RowData(0)
+    sort: int_t = RowData(1)
+    icon_state: int_t = RowData(2)
+    name: str_t = RowData(3)
+
+
+class TofuPreset(DataRow):
+    _sign = b'TofuPreset|eJzLK85Ly4MDAC0VBgI='
+    sheet_name = 'TofuPreset'
+    sort: int_t = RowData(0)
+    name: str_t = RowData(1)
+    category: int_t = RowData(2)
+    is_use: bool_t = RowData(3)
+    object: List[int_t] = ListData(ir((4, 10, 1)), RowData)
+
+
+class TofuPresetCategory(DataRow):
+    _sign = b'TofuPresetCategory|eJwrTksDAAKOAUA='
+    sheet_name = 'TofuPresetCategory'
+    name: str_t = RowData(0)
+    is_use: bool_t = RowData(1)
+    ui_select: bool_t = RowData(2)
+
+
+class TofuPresetObject(DataRow):
+    _sign = b'TofuPresetObject|eJzLywOCtDQAC/cC8w=='
+    sheet_name = 'TofuPresetObject'
+    object: int_t = RowData(0)
+    pos_x: int_t = RowData(1)
+    pos_y: int_t = RowData(2)
+    scale: int_t = RowData(3)
+    rot: int_t = RowData(4)
+    is_flip_h: bool_t = RowData(5)
+    is_flip_v: bool_t = RowData(6)
+
+
+class TomestoneConvert(DataRow):
+    _sign = b'TomestoneConvert|eJxLy8vLKwYABlQCJA=='
+    sheet_name = 'TomestoneConvert'
+    visible: bool_t = RowData(0)
+    from_tomestone: int_t = RowData(1)
+    to_tomestone: int_t = RowData(2)
+    exchange_rate: int_t = RowData(3)
+    text: str_t = RowData(4)
+
+
+class Tomestones(DataRow):
+    _sign = b'Tomestones|eJzLAwAAbwBv'
+    sheet_name = 'Tomestones'
+    weekly_cap: int_t = RowData(0)
+
+
+class TomestonesItem(DataRow):
+    _sign = b'TomestonesItem|eJzLy8sDAAKXAUs='
+    sheet_name = 'TomestonesItem'
+    _display = 'catalog_id'
+    catalog_id: 'Item' = RowForeign(0, 'Item')
+    slot: int_t = RowData(1)
+    type: 'Tomestones' = RowForeign(2, 'Tomestones')
+
+
+class TopicSelect(DataRow):
+    _sign = b'TopicSelect|eJwrTstDAgAtCgYC'
+    sheet_name = 'TopicSelect'
+    _display = 'text'
+    text: str_t = RowData(0)
+    menu_title: bool_t = RowData(1)
+    accept_cond: int_t = RowData(2)
+    accept_arg: int_t = RowData(3)
+    event_handler: List[int_t] = ListData(ir((4, 10, 1)), RowData)
+
+
+class Town(DataRow):
+    _sign = b'Town|eJwrzgMAAVYA4g=='
+    sheet_name = 'Town'
+    _display = 'name'
+    name: str_t = RowData(0)
+    icon: 'Icon' = IconRow(1)
+
+
+class Trait(DataRow):
+    _sign = b'Trait|eJwrzoMAAA+oA3Y='
+    sheet_name = 'Trait'
+    _display = 'text'
+    text: str_t = RowData(0)
+    icon: 'Icon' = IconRow(1)
+    class_job: 'ClassJob' = RowForeign(2, 'ClassJob')
+    level: int_t = RowData(3)
+    reward: 'Quest' = RowForeign(4, 'Quest')
+    param_value: int_t = RowData(5)
+    use_class: 'ClassJobCategory' = RowForeign(6, 'ClassJobCategory')
+    normalize_trait_group: int_t = RowData(7)
+
+
+class TraitRecast(DataRow):
+    _sign = b'TraitRecast|eJzLy8sDAAKXAUs='
+    sheet_name = 'TraitRecast'
+    _display = 'trait'
+    trait: 'Trait' = RowForeign(0, 'Trait')
+    action: 'Action' = RowForeign(1, 'Action')
+    recast_time: int_t = RowData(2)
+
+
+class TraitTransient(DataRow):
+    _sign = b'TraitTransient|eJwrBgAAdAB0'
+    sheet_name = 'TraitTransient'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class Transformation(DataRow):
+    _sign = b'Transformation|eJzLywOCJBSYl5aWlwYigSAPAtLSAFNTEI0='
+    sheet_name = 'Transformation'
+    type: int_t = RowData(0)
+    model_chara: 'ModelChara' = RowForeign(1, 'ModelChara')
+    name_id: 'BNpcName' = RowForeign(2, 'BNpcName')
+    customize: 'BNpcCustomize' = RowForeign(3, 'BNpcCustomize')
+    equip: 'NpcEquip' = RowForeign(4, 'NpcEquip')
+    combo: List[bool_t] = ListData(ir((5, 7, 2)), RowData)
+    action: 'List[RPParameter]' = ListData(ir((6, 7, 2)), RowForeign, 'RPParameter')
+    action_right_align: 'Action' = RowForeign(19, 'Action')
+    is_disp_ex_hotbar: bool_t = RowData(20)
+    ex_hotbar_enable_config: bool_t = RowData(21)
+    ex_hotbar_crossbar_index_type: int_t = RowData(22)
+    ex_hotbar_play_se: bool_t = RowData(23)
+    height_float: float_t = RowData(24)
+    scale: float_t = RowData(25)
+    pc_radius_scale: bool_t = RowData(26)
+    emote: bool_t = RowData(27)
+    cast_cancel: bool_t = RowData(28)
+    drawn_sword_begin: bool_t = RowData(29)
+    disable_auto_diactivate: bool_t = RowData(30)
+    vfx_begin: 'VFX' = RowForeign(31, 'VFX')
+    vfx_end: 'VFX' = RowForeign(32, 'VFX')
+    auto_attack_id: 'Action' = RowForeign(33, 'Action')
+    combo_position_ignored: int_t = RowData(34)
+    move_speed_rate: int_t = RowData(35)
+    se_pack: 'Action' = RowForeign(36, 'Action')
+    rp_parameter: int_t = RowData(37)
+    enter_water: bool_t = RowData(38)
+    dive: bool_t = RowData(39)
+
+
+class Treasure(DataRow):
+    _sign = b'Treasure|eJwrzivOA4O0NAAcswS1'
+    sheet_name = 'Treasure'
+    text_sgl: str_t = RowData(0)
+    text_sgg: int_t = RowData(1)
+    text_plr: str_t = RowData(2)
+    text_plg: int_t = RowData(3)
+    text_vow: int_t = RowData(4)
+    text_cnt: int_t = RowData(5)
+    text_gen: int_t = RowData(6)
+    text_def_: int_t = RowData(7)
+    shared_group: 'ExportedSG' = RowForeign(8, 'ExportedSG')
+    is_ground: bool_t = RowData(9)
+    is_overlap_open: bool_t = RowData(10)
+
+
+class TreasureHuntRank(DataRow):
+    _sign = b'TreasureHuntRank|eJzLy4OANAATVwPX'
+    sheet_name = 'TreasureHuntRank'
+    mode: int_t = RowData(0)
+    icon: 'Icon' = IconRow(1)
+    map_item: 'Item' = RowForeign(2, 'Item')
+    event_map_item: 'EventItem' = RowForeign(3, 'EventItem')
+    reopen_potal_event_map_item: 'EventItem' = RowForeign(4, 'EventItem')
+    recommend_member: int_t = RowData(5)
+    texture: int_t = RowData(6)
+    map_scale: int_t = RowData(7)
+    net_cafe_ko: bool_t = RowData(8)
+
+
+class TreasureHuntTexture(DataRow):
+    _sign = b'TreasureHuntTexture|eJwrBgAAdAB0'
+    sheet_name = 'TreasureHuntTexture'
+    texture_name: str_t = RowData(0)
+
+
+class TreasureModel(DataRow):
+    _sign = b'TreasureModel|eJwrBgAAdAB0'
+    sheet_name = 'TreasureModel'
+    _display = 'file'
+    file: str_t = RowData(0)
+
+
+class TreasureSpot(DataRow):
+    _sign = b'TreasureSpot|eJzLy8sDAAKXAUs='
+    sheet_name = 'TreasureSpot'
+    _display = 'location'
+    location: 'Level' = RowForeign(0, 'Level')
+    map_offset_x: float_t = RowData(1)
+    map_offset_y: float_t = RowData(2)
+
+
+class Tribe(DataRow):
+    _sign = b'Tribe|eJwrLs6DAgAYCwRX'
+    sheet_name = 'Tribe'
+    _display = 'text_name_female'
+    text_name: str_t = RowData(0)
+    text_name_female: str_t = RowData(1)
+    hp: int_t = RowData(2)
+    mp: int_t = RowData(3)
+    str: int_t = RowData(4)
+    vit: int_t = RowData(5)
+    dex: int_t = RowData(6)
+    int: int_t = RowData(7)
+    mnd: int_t = RowData(8)
+    pie: int_t = RowData(9)
+
+
+class TriggerEffect(DataRow):
+    _sign = b'TriggerEffect|eJzLy4MAAA+AA3E='
+    sheet_name = 'TriggerEffect'
+    left_type: int_t = RowData(0)
+    left_param1: int_t = RowData(1)
+    left_param2: int_t = RowData(2)
+    left_param3: int_t = RowData(3)
+    right_type: int_t = RowData(4)
+    right_param1: int_t = RowData(5)
+    right_param2: int_t = RowData(6)
+    right_param3: int_t = RowData(7)
+
+
+class TripleTriad(DataRow):
+    _sign = b'TripleTriad|eJzLy0OAtDx0DgDHNAzV'
+    sheet_name = 'TripleTriad'
+    regular_card: List[int_t] = ListData(ir((0, 5, 1)), RowData)
+    sub_card: List[int_t] = ListData(ir((5, 5, 1)), RowData)
+    npc_rule: List[int_t] = ListData(ir((10, 2, 1)), RowData)
+    disable_trend_rule: bool_t = RowData(12)
+    play_coin: int_t = RowData(13)
+    quest_operator: int_t = RowData(14)
+    quest: List[int_t] = ListData(ir((15, 3, 1)), RowData)
+    time_begin: int_t = RowData(18)
+    time_end: int_t = RowData(19)
+    qualified_talk: 'DefaultTalk' = RowForeign(20, 'DefaultTalk')
+    unqualified_talk: 'DefaultTalk' = RowForeign(21, 'DefaultTalk')
+    npc_win_talk: 'DefaultTalk' = RowForeign(22, 'DefaultTalk')
+    npc_lose_talk: 'DefaultTalk' = RowForeign(23, 'DefaultTalk')
+    draw_talk: 'DefaultTalk' = RowForeign(24, 'DefaultTalk')
+    disable_timeline: bool_t = RowData(25)
+    reward: List[int_t] = ListData(ir((26, 4, 1)), RowData)
+
+
+class TripleTriadCard(DataRow):
+    _sign = b'TripleTriadCard|eJwrzivOA4FiABO0A+4='
+    sheet_name = 'TripleTriadCard'
+    _display = 'text_sgl'
+    text_sgl: str_t = RowData(0)
+    text_sgg: int_t = RowData(1)
+    text_plr: str_t = RowData(2)
+    text_plg: int_t = RowData(3)
+    text_vow: int_t = RowData(4)
+    text_cnt: int_t = RowData(5)
+    text_gen: int_t = RowData(6)
+    text_def_: int_t = RowData(7)
+    text_flavor: str_t = RowData(8)
+
+
+class TripleTriadCardObtain(DataRow):
+    _sign = b'TripleTriadCardObtain|eJzLywMAAUwA3Q=='
+    sheet_name = 'TripleTriadCardObtain'
+    icon: int_t = RowData(0)
+    obtain_format: int_t = RowData(1)
+
+
+class TripleTriadCardRarity(DataRow):
+    _sign = b'TripleTriadCardRarity|eJzLAwAAbwBv'
+    sheet_name = 'TripleTriadCardRarity'
+    deck_level: int_t = RowData(0)
+
+
+class TripleTriadCardResident(DataRow):
+    _sign = b'TripleTriadCardResident|eJzLy4ODNBABADpYBtk='
+    sheet_name = 'TripleTriadCardResident'
+    work_index: int_t = RowData(0)
+    strength: List[int_t] = ListData(ir((1, 4, 1)), RowData)
+    rarity: 'TripleTriadCardRarity' = RowForeign(5, 'TripleTriadCardRarity')
+    type: 'TripleTriadCardType' = RowForeign(6, 'TripleTriadCardType')
+    sell_price: int_t = RowData(7)
+    sort: int_t = RowData(8)
+    no: int_t = RowData(9)
+    category: int_t = RowData(10)
+    pick_up: bool_t = RowData(11)
+    obtain_type: int_t = RowData(12)
+    obtain_arg: 'List[TerritoryType|TerritoryType|Level|Level]' = ListData(ir((13, 2, 1)), DynamicForeign, ComplexSheetKey('obtain_type', (4, 'TerritoryType'), (5, 'TerritoryType'), (6, 'Level'), (10, 'Level')))
+    obtain_unlock: 'Quest' = RowForeign(15, 'Quest')
+
+
+class TripleTriadCardType(DataRow):
+    _sign = b'TripleTriadCardType|eJwrBgAAdAB0'
+    sheet_name = 'TripleTriadCardType'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class TripleTriadCompetition(DataRow):
+    _sign = b'TripleTriadCompetition|eJwrBgAAdAB0'
+    sheet_name = 'TripleTriadCompetition'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class TripleTriadDefine(DataRow):
+    _sign = b'TripleTriadDefine|eJzLAwAAbwBv'
+    sheet_name = 'TripleTriadDefine'
+    value: int_t = RowData(0)
+
+
+class TripleTriadResident(DataRow):
+    _sign = b'TripleTriadResident|eJzLAwAAbwBv'
+    sheet_name = 'TripleTriadResident'
+    work_index: int_t = RowData(0)
+
+
+class TripleTriadRule(DataRow):
+    _sign = b'TripleTriadRule|eJwrLs7LS8vLAwAMOAMF'
+    sheet_name = 'TripleTriadRule'
+    _display = 'text_name'
+    text_name: str_t = RowData(0)
+    text_help: str_t = RowData(1)
+    exclude_rule: List[int_t] = ListData(ir((2, 2, 1)), RowData)
+    exclude_tournament: bool_t = RowData(4)
+    sort: int_t = RowData(5)
+    timeline_time: int_t = RowData(6)
+
+
+class TripleTriadTournament(DataRow):
+    _sign = b'TripleTriadTournament|eJzLy8vLAwAEUAG5'
+    sheet_name = 'TripleTriadTournament'
+    rule: List[int_t] = ListData(ir((0, 4, 1)), RowData)
+
+
+class Tutorial(DataRow):
+    _sign = b'Tutorial|eJzLy4MBABesBE0='
+    sheet_name = 'Tutorial'
+    _display = 'todo'
+    role: int_t = RowData(0)
+    flag: List[int_t] = ListData(ir((1, 3, 1)), RowData)
+    reward_exp: int_t = RowData(4)
+    reward_gil: int_t = RowData(5)
+    reward_item: 'List[Item]' = ListData(ir((6, 3, 1)), RowForeign, 'Item')
+    todo: 'InstanceContentTextData' = RowForeign(9, 'InstanceContentTextData')
+
+
+class TutorialDPS(DataRow):
+    _sign = b'TutorialDPS|eJzLAwAAbwBv'
+    sheet_name = 'TutorialDPS'
+    tutorial_id: 'Tutorial' = RowForeign(0, 'Tutorial')
+
+
+class TutorialHealer(DataRow):
+    _sign = b'TutorialHealer|eJzLAwAAbwBv'
+    sheet_name = 'TutorialHealer'
+    tutorial_id: 'Tutorial' = RowForeign(0, 'Tutorial')
+
+
+class TutorialTank(DataRow):
+    _sign = b'TutorialTank|eJzLAwAAbwBv'
+    sheet_name = 'TutorialTank'
+    tutorial_id: 'Tutorial' = RowForeign(0, 'Tutorial')
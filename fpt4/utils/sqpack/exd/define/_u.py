@@ -0,0 +1,88 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class UDS_Event(DataRow):
+    _sign = b'UDS_Event|eJwrLs4jAAABKg6n'
+    sheet_name = 'UDS_Event'
+    _display = 'text'
+    text: str_t = RowData(0)
+    type: str_t = RowData(1)
+    field_2: int_t = RowData(2)
+    field_3: int_t = RowData(3)
+    field_4: int_t = RowData(4)
+    field_5: int_t = RowData(5)
+    field_6: int_t = RowData(6)
+    field_7: int_t = RowData(7)
+    field_8: int_t = RowData(8)
+    field_9: int_t = RowData(9)
+    field_10: int_t = RowData(10)
+    field_11: int_t = RowData(11)
+    field_12: int_t = RowData(12)
+    field_13: int_t = RowData(13)
+    field_14: int_t = RowData(14)
+    field_15: int_t = RowData(15)
+    field_16: int_t = RowData(16)
+    field_17: int_t = RowData(17)
+    field_18: int_t = RowData(18)
+    field_19: int_t = RowData(19)
+    field_20: int_t = RowData(20)
+    field_21: int_t = RowData(21)
+    field_22: int_t = RowData(22)
+    field_23: int_t = RowData(23)
+    field_24: int_t = RowData(24)
+    field_25: int_t = RowData(25)
+    field_26: int_t = RowData(26)
+    field_27: int_t = RowData(27)
+    field_28: int_t = RowData(28)
+    field_29: int_t = RowData(29)
+    field_30: int_t = RowData(30)
+    field_31: int_t = RowData(31)
+    field_32: int_t = RowData(32)
+    field_33: int_t = RowData(33)
+
+
+class UDS_Object(DataRow):
+    _sign = b'UDS_Object|eJwrBgAAdAB0'
+    sheet_name = 'UDS_Object'
+    object_id: str_t = RowData(0)
+
+
+class UDS_Property(DataRow):
+    _sign = b'UDS_Property|eJwrLgYAAVsA5w=='
+    sheet_name = 'UDS_Property'
+    _display = 'text'
+    text: str_t = RowData(0)
+    type: str_t = RowData(1)
+
+
+class UDS_Stats(DataRow):
+    _sign = b'UDS_Stats|eJwrLgYAAVsA5w=='
+    sheet_name = 'UDS_Stats'
+    text_0: str_t = RowData(0)
+    text_1: str_t = RowData(1)
+
+
+class UIColor(DataRow):
+    _sign = b'UIColor|eJzLy8vLAwAEUAG5'
+    sheet_name = 'UIColor'
+    _display = 'ui_foreground'
+    ui_foreground: int_t = RowData(0)
+    ui_glow: int_t = RowData(1)
+    field_2: int_t = RowData(2)
+    field_3: int_t = RowData(3)
+
+
+class UIConst(DataRow):
+    _sign = b'UIConst|eJzLAwAAbwBv'
+    sheet_name = 'UIConst'
+    value: int_t = RowData(0)
+
+
+class UILevelLookup(DataRow):
+    _sign = b'UILevelLookup|eJzLAwAAbwBv'
+    sheet_name = 'UILevelLookup'
+    level: int_t = RowData(0)
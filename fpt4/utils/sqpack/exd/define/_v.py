@@ -0,0 +1,70 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class VFX(DataRow):
+    _sign = b'VFX|eJwrBgAAdAB0'
+    sheet_name = 'VFX'
+    _display = 'path'
+    path: str_t = RowData(0)
+
+
+class VVDData(DataRow):
+    _sign = b'VVDData|eJzLywMBAAkMApU='
+    sheet_name = 'VVDData'
+    content_id: int_t = RowData(0)
+    type: int_t = RowData(1)
+    finder_condition: int_t = RowData(2)
+    token: int_t = RowData(3)
+    ex_action: int_t = RowData(4)
+    archive_quest: int_t = RowData(5)
+
+
+class VVDNotebookContents(DataRow):
+    _sign = b'VVDNotebookContents|eJzLyysuBgAEXwHD'
+    sheet_name = 'VVDNotebookContents'
+    _display = 'text_title'
+    thumbnail: 'Icon' = IconRow(0)
+    image: 'Icon' = IconRow(1)
+    text_title: str_t = RowData(2)
+    text_text: str_t = RowData(3)
+
+
+class VVDNotebookSeries(DataRow):
+    _sign = b'VVDNotebookSeries|eJwrzkMCACdoBZw='
+    sheet_name = 'VVDNotebookSeries'
+    _display = 'title'
+    title: str_t = RowData(0)
+    data_contents: List[int_t] = ListData(ir((1, 12, 1)), RowData)
+
+
+class VVDRouteData(DataRow):
+    _sign = b'VVDRouteData|eJzLAwAAbwBv'
+    sheet_name = 'VVDRouteData'
+    save_flag_index: int_t = RowData(0)
+
+
+class VVDVariantAction(DataRow):
+    _sign = b'VVDVariantAction|eJzLAwAAbwBv'
+    sheet_name = 'VVDVariantAction'
+    _display = 'action'
+    action: 'Action' = RowForeign(0, 'Action')
+
+
+class Vase(DataRow):
+    _sign = b'Vase|eJzLywMAAUwA3Q=='
+    sheet_name = 'Vase'
+    vase_flower_start_index: int_t = RowData(0)
+    vase_flower_end_index: int_t = RowData(1)
+
+
+class VaseFlower(DataRow):
+    _sign = b'VaseFlower|eJzLy8vLAwAEUAG5'
+    sheet_name = 'VaseFlower'
+    kind: int_t = RowData(0)
+    step: int_t = RowData(1)
+    step2: int_t = RowData(2)
+    item: 'Item' = RowForeign(3, 'Item')
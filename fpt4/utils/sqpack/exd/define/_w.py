@@ -0,0 +1,217 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class Warp(DataRow):
+    _sign = b'Warp|eJzLy4OCtOJiACGHBSs='
+    sheet_name = 'Warp'
+    pop_range: 'Level' = RowForeign(0, 'Level')
+    pop_range_territory_type: 'TerritoryType' = RowForeign(1, 'TerritoryType')
+    qualified_pre_talk: 'DefaultTalk' = RowForeign(2, 'DefaultTalk')
+    unqualified_pre_talk: 'DefaultTalk' = RowForeign(3, 'DefaultTalk')
+    unqualified_gil_pre_talk: 'DefaultTalk' = RowForeign(4, 'DefaultTalk')
+    warp_condition: 'WarpCondition' = RowForeign(5, 'WarpCondition')
+    logic: 'WarpLogic' = RowForeign(6, 'WarpLogic')
+    pre_cut_scene: 'Cutscene' = RowForeign(7, 'Cutscene')
+    post_cut_scene: 'Cutscene' = RowForeign(8, 'Cutscene')
+    skip_cut_scene_config: bool_t = RowData(9)
+    text_name: str_t = RowData(10)
+    text_question: str_t = RowData(11)
+
+
+class WarpCondition(DataRow):
+    _sign = b'WarpCondition|eJzLy4MAAA+AA3E='
+    sheet_name = 'WarpCondition'
+    gil: int_t = RowData(0)
+    completed_quest_operator: int_t = RowData(1)
+    completed_quest: 'List[Quest]' = ListData(ir((2, 3, 1)), RowForeign, 'Quest')
+    not_accepted_quest: 'Quest' = RowForeign(5, 'Quest')
+    reward: int_t = RowData(6)
+    class_level: int_t = RowData(7)
+
+
+class WarpLogic(DataRow):
+    _sign = b'WarpLogic|eJzLK04rhoM8OAByAJpkC2s='
+    sheet_name = 'WarpLogic'
+    _display = 'script'
+    map_icon: int_t = RowData(0)
+    script: str_t = RowData(1)
+    accept_callback: bool_t = RowData(2)
+    define_name: List[str_t] = ListData(ir((3, 10, 1)), RowData)
+    define_value: List[int_t] = ListData(ir((13, 10, 1)), RowData)
+    text_name: str_t = RowData(23)
+    text_yes: str_t = RowData(24)
+    text_no: str_t = RowData(25)
+
+
+class WeaponTimeline(DataRow):
+    _sign = b'WeaponTimeline|eJwrzksDAAKeAUg='
+    sheet_name = 'WeaponTimeline'
+    file: str_t = RowData(0)
+    next_weapon_timeline: int_t = RowData(1)
+    not_overwritten_by_sword_on: bool_t = RowData(2)
+
+
+class Weather(DataRow):
+    _sign = b'Weather|eJzLKwYDAAx4AyE='
+    sheet_name = 'Weather'
+    _display = 'text_name'
+    icon: 'Icon' = IconRow(0)
+    text_name: str_t = RowData(1)
+    text_name_adjective: str_t = RowData(2)
+    text_weather_first: str_t = RowData(3)
+    text_weather_second: str_t = RowData(4)
+    text_weather_third: str_t = RowData(5)
+    text_weather_fourth: str_t = RowData(6)
+
+
+class WeatherGroup(DataRow):
+    _sign = b'WeatherGroup|eJzLywMAAUwA3Q=='
+    sheet_name = 'WeatherGroup'
+    field_0: int_t = RowData(0)
+    weather_rate: 'WeatherRate' = RowForeign(1, 'WeatherRate')
+
+
+class WeatherRate(DataRow):
+    _sign = b'WeatherRate|eJzLy0MFADqABuE='
+    sheet_name = 'WeatherRate'
+    weather: List[int_t] = ListData(ir((0, 8, 2)), RowData)
+    rate: List[int_t] = ListData(ir((1, 8, 2)), RowData)
+
+
+class WeatherReportReplace(DataRow):
+    _sign = b'WeatherReportReplace|eJzLywMAAUwA3Q=='
+    sheet_name = 'WeatherReportReplace'
+    src: 'PlaceName' = RowForeign(0, 'PlaceName')
+    dst: 'PlaceName' = RowForeign(1, 'PlaceName')
+
+
+class WebGuidance(DataRow):
+    _sign = b'WebGuidance|eJzLyysuLgYABpUCNg=='
+    sheet_name = 'WebGuidance'
+    _display = 'text_title'
+    banner: 'Icon' = IconRow(0)
+    url: 'WebURL' = RowForeign(1, 'WebURL')
+    text_title: str_t = RowData(2)
+    text_sub_title: str_t = RowData(3)
+    text_description: str_t = RowData(4)
+
+
+class WebURL(DataRow):
+    _sign = b'WebURL|eJwrBgAAdAB0'
+    sheet_name = 'WebURL'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class WeddingBGM(DataRow):
+    _sign = b'WeddingBGM|eJzLKwYAAVEA4g=='
+    sheet_name = 'WeddingBGM'
+    _display = 'bgm'
+    bgm: 'BGM' = RowForeign(0, 'BGM')
+    text: str_t = RowData(1)
+
+
+class WeddingFlowerColor(DataRow):
+    _sign = b'WeddingFlowerColor|eJzLy8sDAAKXAUs='
+    sheet_name = 'WeddingFlowerColor'
+    param: List[int_t] = ListData(ir((0, 3, 1)), RowData)
+
+
+class WeddingPlan(DataRow):
+    _sign = b'WeddingPlan|eJzLy8MEAFpQCJk='
+    sheet_name = 'WeddingPlan'
+    base_color_end: int_t = RowData(0)
+    base_color_default: int_t = RowData(1)
+    flower_color_end: int_t = RowData(2)
+    flower_color_default: int_t = RowData(3)
+    atmosphere_type_end: int_t = RowData(4)
+    atmosphere_type_default: int_t = RowData(5)
+    cloth_color_end: int_t = RowData(6)
+    cloth_color_default: int_t = RowData(7)
+    style_end: int_t = RowData(8)
+    style_default: int_t = RowData(9)
+    enter_type_end: int_t = RowData(10)
+    enter_type_default: int_t = RowData(11)
+    exit_type_end: int_t = RowData(12)
+    exit_type_default: int_t = RowData(13)
+    bgm_start: List[int_t] = ListData(ir((14, 2, 1)), RowData)
+    bgm_end: List[int_t] = ListData(ir((16, 2, 1)), RowData)
+    bgm_default: List[int_t] = ListData(ir((18, 2, 1)), RowData)
+
+
+class WeeklyBingoOrderData(DataRow):
+    _sign = b'WeeklyBingoOrderData|eJzLywMBAAkMApU='
+    sheet_name = 'WeeklyBingoOrderData'
+    type: int_t = RowData(0)
+    value: 'InstanceContent' = DynamicForeign(1, ComplexSheetKey('type', (0, 'InstanceContent')))
+    bonus: int_t = RowData(2)
+    text: 'WeeklyBingoText' = RowForeign(3, 'WeeklyBingoText')
+    icon: 'Icon' = IconRow(4)
+    tool_tip_type: int_t = RowData(5)
+
+
+class WeeklyBingoRewardData(DataRow):
+    _sign = b'WeeklyBingoRewardData|eJzLy0vLA4IkMAYAJm8Fdw=='
+    sheet_name = 'WeeklyBingoRewardData'
+    type: int_t = RowData(0)
+    value: int_t = RowData(1)
+    hq: bool_t = RowData(2)
+    num: int_t = RowData(3)
+    sub: int_t = RowData(4)
+    sub__types: List[int_t] = ListData(ir((5, 2, 4)), RowData)
+    sub__values: List[int_t] = ListData(ir((6, 2, 4)), RowData)
+    sub__h_qs: List[bool_t] = ListData(ir((7, 2, 4)), RowData)
+    sub__nums: List[int_t] = ListData(ir((8, 2, 4)), RowData)
+
+
+class WeeklyBingoText(DataRow):
+    _sign = b'WeeklyBingoText|eJwrBgAAdAB0'
+    sheet_name = 'WeeklyBingoText'
+    _display = 'text'
+    text: str_t = RowData(0)
+
+
+class WeeklyLotBonus(DataRow):
+    _sign = b'WeeklyLotBonus|eJzLy6MtAADRaSlB'
+    sheet_name = 'WeeklyLotBonus'
+    params_target: List[int_t] = ListData(ir((0, 32, 1)), RowData)
+    params_param: List[int_t] = ListData(ir((32, 32, 1)), RowData)
+    params_rate: List[int_t] = ListData(ir((64, 32, 1)), RowData)
+
+
+class WeeklyLotBonusThreshold(DataRow):
+    _sign = b'WeeklyLotBonusThreshold|eJzLywMDAAwPAwM='
+    sheet_name = 'WeeklyLotBonusThreshold'
+    number: List[int_t] = ListData(ir((0, 7, 1)), RowData)
+
+
+class World(DataRow):
+    _sign = b'World|eJwrLs7Ly0sDAAk7Apc='
+    sheet_name = 'World'
+    name: str_t = RowData(0)
+    display_name: str_t = RowData(1)
+    management_group: int_t = RowData(2)
+    user_type: int_t = RowData(3)
+    dc_group: 'WorldDCGroupType' = RowForeign(4, 'WorldDCGroupType')
+    public: bool_t = RowData(5)
+
+
+class WorldDCGroupType(DataRow):
+    _sign = b'WorldDCGroupType|eJwrzksDAAKeAUg='
+    sheet_name = 'WorldDCGroupType'
+    _display = 'name'
+    name: str_t = RowData(0)
+    region_group: int_t = RowData(1)
+    is_cloud: bool_t = RowData(2)
+
+
+class WorldDCGroupType(DataRow):
+    _sign = b'WorldDCGroupType|eJwrzgMAAVYA4g=='
+    sheet_name = 'WorldDCGroupType'
+    _display = 'name'
+    name: str_t = RowData(0)
+    region_group: int_t = RowData(1)
@@ -0,0 +1,14 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class XPVPGroupActivity(DataRow):
+    _sign = b'XPVPGroupActivity|eJwrzsvLAwAEZAG+'
+    sheet_name = 'XPVPGroupActivity'
+    text: str_t = RowData(0)
+    self_param_kind: int_t = RowData(1)
+    target_param_kind: int_t = RowData(2)
+    param_num: int_t = RowData(3)
@@ -0,0 +1,32 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class YKW(DataRow):
+    _sign = b'YKW|eJzLy4OAYgATZAPk'
+    sheet_name = 'YKW'
+    minion: int_t = RowData(0)
+    legend_medal: 'Item' = RowForeign(1, 'Item')
+    area: List[int_t] = ListData(ir((2, 6, 1)), RowData)
+    text: str_t = RowData(8)
+
+
+class YardCatalogCategory(DataRow):
+    _sign = b'YardCatalogCategory|eJwrzssDAAKmAVA='
+    sheet_name = 'YardCatalogCategory'
+    _display = 'category'
+    category: str_t = RowData(0)
+    field_1: int_t = RowData(1)
+    field_2: int_t = RowData(2)
+
+
+class YardCatalogItemList(DataRow):
+    _sign = b'YardCatalogItemList|eJzLy8sDAAKXAUs='
+    sheet_name = 'YardCatalogItemList'
+    _display = 'item'
+    category: 'YardCatalogCategory' = RowForeign(0, 'YardCatalogCategory')
+    item: 'Item' = RowForeign(1, 'Item')
+    patch: int_t = RowData(2)
@@ -0,0 +1,24 @@
+from typing import List
+from nylib.utils import iter_repeat_add as ir
+from fpt4.utils.sqpack.exd.data_row import RowData, RowForeign, ListData, Icon, IconRow, DynamicForeign, ComplexSheetKey
+from fpt4.utils.sqpack.exd.row import DataRow
+str_t, bool_t, float_t, int_t=str, bool, float, int
+
+
+class ZoneSharedGroup(DataRow):
+    _sign = b'ZoneSharedGroup|eJzLy8vLS8KFAbbDDCM='
+    sheet_name = 'ZoneSharedGroup'
+    layout_id: int_t = RowData(0)
+    condition: List[int_t] = ListData(ir((1, 7, 4)), RowData)
+    param_a: 'List[Quest]' = ListData(ir((2, 7, 4)), RowForeign, 'Quest')
+    param_b: List[int_t] = ListData(ir((3, 7, 4)), RowData)
+    anim_flag: List[bool_t] = ListData(ir((4, 7, 4)), RowData)
+
+
+class ZoneTimeline(DataRow):
+    _sign = b'ZoneTimeline|eJzLy8vLAwAEUAG5'
+    sheet_name = 'ZoneTimeline'
+    layout_id: int_t = RowData(0)
+    timeline_index: int_t = RowData(1)
+    start_time: int_t = RowData(2)
+    end_time: int_t = RowData(3)
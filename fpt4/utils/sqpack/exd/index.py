@@ -0,0 +1,125 @@
+import logging
+import os
+import typing
+from pathlib import Path
+from typing import Generic, TypeVar, Hashable
+
+import numpy as np
+
+from .column import read_columns, StringColumn
+
+if typing.TYPE_CHECKING:
+    from .sheet import LangSheet
+
+_T = TypeVar("_T")
+logger = logging.getLogger('SqPack/ExdIndex')
+cache_version = 1
+
+
+class SheetIndex(Generic[_T]):
+    """
+    row keys of a sheet grouped by the value of a column, strings are indexed by their text and empty strings are skipped
+    """
+
+    def __init__(self, lang_sheet: 'LangSheet', col_id: int, index: dict[Hashable, list], rsv: dict[str, typing.Any]):
+        self.lang_sheet = lang_sheet
+        self.col_id = col_id
+        self.index = index
+        self.rsv = rsv  # reserved strings used by the values and what they were resolved to
+
+    @property
+    def is_valid(self):
+        if not self.rsv: return True
+        rsv_string = self.lang_sheet.sheet.mgr.rsv_string
+        return all(rsv_string.get(k) == v for k, v in self.rsv.items())
+
+    def _row(self, key):
+        if isinstance(key, tuple): return self.lang_sheet.get_row(key[0])[key[1]]
+        return self.lang_sheet.get_row(key)
+
+    def keys_of(self, value) -> list:
+        return self.index.get(value, [])
+
+    def get(self, value) -> list[_T]:
+        return [self._row(k) for k in self.index.get(value, ())]
+
+    def first(self, value, default=None) -> _T:
+        return self._row(keys[0]) if (keys := self.index.get(value)) else default
+
+    def __getitem__(self, value) -> list[_T]:
+        return [self._row(k) for k in self.index[value]]
+
+    def __contains__(self, value):
+        return value in self.index
+
+    def __iter__(self):
+        return iter(self.index)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __repr__(self):
+        return f'SheetIndex({self.lang_sheet.sheet.name}#{self.col_id}, {len(self.index)} values)'
+
+
+def _group(keys: np.ndarray, values: np.ndarray) -> dict[Hashable, list]:
+    res = {}
+    keys = [tuple(k) for k in keys.tolist()] if keys.ndim == 2 else keys.tolist()
+    for k, v in zip(keys, values.tolist()):
+        if (l := res.get(v)) is None:
+            res[v] = [k]
+        else:
+            l.append(k)
+    return res
+
+
+def _read(lang_sheet: 'LangSheet', col_id: int):
+    keys, sub_keys, _, (values,) = read_columns(lang_sheet, (col_id,))
+    if sub_keys is not None: keys = np.column_stack((keys, sub_keys))
+    rsv = {}
+    if isinstance(values, StringColumn):
+        rsv_string = lang_sheet.sheet.mgr.rsv_string
+        texts = []
+        for i in range(len(values)):
+            if (raw := values.raw(i)) and raw.startswith(b'_rsv_'):
+                k = raw.decode('utf-8', errors='ignore')
+                rsv[k] = rsv_string.get(k)
+            texts.append('' if (s := values[i]) is None else str(s))
+        values = np.array(texts, dtype=str)
+        keys = keys[mask := values != '']
+        values = values[mask]
+    return keys, values, rsv
+
+
+def _load_cache(cache_path: Path):
+    try:
+        with np.load(cache_path, allow_pickle=False) as data:
+            if data['version'] != cache_version: return None
+            return data['keys'], data['values']
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+def _save_cache(cache_path: Path, keys: np.ndarray, values: np.ndarray):
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, version=cache_version, keys=keys, values=values)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f'fail to save sheet index {cache_path}: {e}')
+
+
+def build_index(lang_sheet: 'LangSheet', col_id: int, cache_path: Path | None = None) -> SheetIndex:
+    """
+    index a column with one columnar read, indexes of columns without reserved strings are saved to and loaded from cache_path
+    """
+    if cache_path is not None and (cached := _load_cache(cache_path)) is not None:
+        keys, values = cached
+        rsv = {}
+    else:
+        keys, values, rsv = _read(lang_sheet, col_id)
+        # reserved strings are only known at runtime, so those indexes are never persisted
+        if cache_path is not None and not rsv: _save_cache(cache_path, keys, values)
+    return SheetIndex(lang_sheet, col_id, _group(keys, values), rsv)
@@ -5,9 +5,13 @@ import zlib
 from threading import Lock
 from typing import TYPE_CHECKING, Dict, TypeVar, Generic, Callable
 from collections import namedtuple
+import numpy as np
+
 from .exh import ExhFile
 from .row import make_row, DataRow
 from .data_row import RowData, RowForeign, IconRow, DynamicForeign, ListData
+from .column import read_columns, StringColumn
+from .index import SheetIndex, build_index
 
 if TYPE_CHECKING:
     from . import ExdManager, Language
@@ -134,6 +138,25 @@ class LangSheet(Generic[_T]):
                 if condition(row):
                     yield row
 
+    def column(self, col_id: int) -> 'np.ndarray | StringColumn':
+        return read_columns(self, (col_id,))[3][0]
+
+    def row_keys(self):
+        keys, sub_keys, _, _ = read_columns(self, ())
+        return keys if sub_keys is None else (keys, sub_keys)
+
+    def to_records(self, col_ids: typing.Sequence[int], names: typing.Sequence[str]) -> np.ndarray:
+        keys, sub_keys, blocks, values = read_columns(self, col_ids)
+        fields = [('key', keys)]
+        if sub_keys is not None: fields.append(('sub_key', sub_keys))
+        if any(isinstance(v, StringColumn) for v in values): fields.append(('block', blocks))
+        for name, v in zip(names, values):
+            # string columns are stored as offsets into the block buffer of the row, -1 for no string
+            fields.append((name, v.offsets if isinstance(v, StringColumn) else v))
+        res = np.empty(len(keys), [(name, v.dtype, v.shape[1:]) for name, v in fields])
+        for name, v in fields: res[name] = v
+        return res
+
 
 class Sheet(Generic[_T]):
     _sheets: 'Dict[Language,LangSheet[_T]]' = {}
@@ -151,6 +174,7 @@ class Sheet(Generic[_T]):
         elif hasattr(row_type, '_sign') and (sheet_sign := self.get_sign()) != getattr(row_type, '_sign', sheet_sign):
             assert (row_type := DataRow._map.get(sheet_sign)), f"no sign match for sheet {self.name}"
         self._sheets = {}
+        self._indexes = {}
         self.lazy = lazy
         self.lang_sheet_create_lock = Lock()
         self.row_type = row_type
@@ -209,10 +233,49 @@ class Sheet(Generic[_T]):
     def __iter__(self):
         return self.iter_rows()
 
-    def get_row_offset(self, col_name):
-        col_type = getattr(self.row_type, col_name, None)
+    def get_col_id(self, name_or_id: str | int) -> int:
+        if isinstance(name_or_id, int): return name_or_id
+        col_type = getattr(self.row_type, name_or_id, None)
         if isinstance(col_type, (RowData, RowForeign, IconRow, DynamicForeign)):
-            cid = col_type.col_id
-        else:
-            raise TypeError(f'col type {type(col_type)} of col name {col_name} is not support')
-        return self.header.columns[cid].offset
+            return col_type.col_id
+        raise TypeError(f'col type {type(col_type)} of col name {name_or_id} is not support')
+
+    def get_col_names(self) -> Dict[int, str]:
+        res = {}
+        for cls in reversed(self.row_type.__mro__):
+            for k, v in cls.__dict__.items():
+                if isinstance(v, (RowData, RowForeign, IconRow, DynamicForeign)): res[v.col_id] = k
+        return res
+
+    def get_row_offset(self, col_name):
+        return self.header.columns[self.get_col_id(col_name)].offset
+
+    def column(self, name_or_id: str | int, user_lang: 'Language' = None) -> 'np.ndarray | StringColumn':
+        """
+        values of a column for every row, in the order of row_keys, string columns decode on access
+        """
+        return self.get_lang_sheet(user_lang).column(self.get_col_id(name_or_id))
+
+    def row_keys(self, user_lang: 'Language' = None):
+        return self.get_lang_sheet(user_lang).row_keys()
+
+    def to_records(self, columns: typing.Iterable[str | int] = None, user_lang: 'Language' = None) -> np.ndarray:
+        """
+        structured array of key (sub_key), block and the given columns, all columns by default
+        """
+        col_names = self.get_col_names()
+        columns = range(len(self.header.columns)) if columns is None else list(columns)
+        col_ids = [self.get_col_id(c) for c in columns]
+        names = [c if isinstance(c, str) else col_names.get(c, f'col_{c}') for c in columns]
+        return self.get_lang_sheet(user_lang).to_records(col_ids, names)
+
+    def index_by(self, name_or_id: str | int, user_lang: 'Language' = None) -> SheetIndex[_T]:
+        """
+        rows grouped by the value of a column, built once and rebuilt when a reserved string it used is changed
+        """
+        col_id = self.get_col_id(name_or_id)
+        lang = self.get_lang(user_lang)
+        if (index := self._indexes.get((col_id, lang))) is None or not index.is_valid:
+            cache_path = self.mgr.get_index_cache_path(f'{self.name}_{lang.name}_{col_id}')
+            self._indexes[col_id, lang] = index = build_index(self.get_lang_sheet(lang), col_id, cache_path)
+        return index
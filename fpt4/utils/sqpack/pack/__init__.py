@@ -1,9 +1,11 @@
 import io
+import mmap
 import threading
 from pathlib import Path
 from logging import getLogger
 from threading import Lock, get_ident
-from typing import Dict, Tuple, IO
+from typing import Dict, Tuple, IO, Callable, Any, Hashable
+from .cache import FileCache
 from .indexfile import Index, FileInfo
 from .file import file_from_stream, TextureFile
 
@@ -86,11 +88,45 @@ class PackIdentifier:
         )
 
 
+class MmapStream(io.RawIOBase):
+    """
+    positioned reader over a shared memory map, read returns zero-copy memoryview slices
+    """
+
+    def __init__(self, view: memoryview):
+        self.view = view
+        self.pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.pos
+
+    def seek(self, offset, whence=0):
+        if whence == 0:
+            self.pos = offset
+        elif whence == 1:
+            self.pos += offset
+        else:
+            self.pos = len(self.view) + offset
+        return self.pos
+
+    def read(self, size=-1):
+        start = self.pos
+        end = len(self.view) if size is None or size < 0 else min(start + size, len(self.view))
+        self.pos = max(end, start)
+        return self.view[start:end]
+
+
 class PackManager(object):
     packs: 'Dict[PackIdentifier,Pack]'
     logger = getLogger(f'SqPack/PackCollection')
 
-    def __init__(self, data_directory: str | bytes | Path):
+    def __init__(self, data_directory: str | bytes | Path, index_cache_directory: str | Path | None = None, use_mmap: bool = True, cache_size: int = 512 << 20):
         if isinstance(data_directory, str):
             data_directory = Path(data_directory)
         if isinstance(data_directory, Path):
@@ -99,6 +135,9 @@ class PackManager(object):
         else:
             raise TypeError("data_directory")
         self.data_directory = data_directory
+        self.index_cache_directory = Path(index_cache_directory) if index_cache_directory else None
+        self.use_mmap = use_mmap
+        self.cache = FileCache(cache_size)
         self.packs = {}
 
     def get_pack(self, id_or_path: str | bytes | PackIdentifier) -> 'Pack|None':
@@ -117,6 +156,21 @@ class PackManager(object):
     def get_file(self, path_or_key: str | bytes | Tuple[int, int]):
         return self.get_pack(path_or_key).get_file(path_or_key)
 
+    def file_cache_key(self, path: str | bytes):
+        pack = self.get_pack(path)
+        return pack.file_cache_key(pack.get_file_info(path))
+
+    def get_parsed(self, path: str | bytes, kind: Hashable, loader: Callable[[], Any], size: int | None = None):
+        """
+        cache an object parsed from a file, sized by the decoded file unless size is given
+        """
+
+        def load():
+            value = loader()
+            return value, self.get_file(path).header.file_size if size is None else size
+
+        return self.cache.get_or_load((*self.file_cache_key(path), kind), load)
+
 
 class Pack:
     """
@@ -134,6 +188,17 @@ class Pack:
         self._keep_in_memory = value
         if not value: self._buffers.clear()
 
+    @property
+    def use_mmap(self):
+        return self._use_mmap
+
+    @use_mmap.setter
+    def use_mmap(self, value):
+        if value == self.use_mmap: return
+        self._use_mmap = value
+        self._data_streams = threading.local()
+        if not value: self._views.clear()
+
     def __init__(self, data_directory: str | bytes | Path, _id: PackIdentifier, mgr: PackManager = None):
         if not isinstance(data_directory, Path):
             data_directory = Path(data_directory)
@@ -147,12 +212,29 @@ class Pack:
         self._data_streams_lock = Lock()
         self._keep_in_memory = False
         self._buffers: Dict[int, bytes] = {}
+        self._use_mmap = mgr.use_mmap if mgr else False
+        self._views: Dict[int, memoryview] = {}
+        cache_directory = mgr.index_cache_directory if mgr else None
         index_path = self.id.index_file_path(self.data_directory)
-        self.index = Index(self, index_path) if index_path.exists() and index_path.is_file() else None
+        self.index = Index(self, index_path, cache_directory) if index_path.exists() and index_path.is_file() else None
         index_path2 = self.id.index2_file_path(self.data_directory)
-        self.index2 = Index(self, index_path2) if index_path2.exists() and index_path2.is_file() else None
+        self.index2 = Index(self, index_path2, cache_directory) if index_path2.exists() and index_path2.is_file() else None
+
+    def get_data_view(self, dat_file=0) -> memoryview:
+        if (view := self._views.get(dat_file)) is None:
+            with self._data_streams_lock:
+                if (view := self._views.get(dat_file)) is None:
+                    full_path = self.id.dat_file_path(self.data_directory, dat_file)
+                    self.logger.debug('loading Mode: Mmap Id: %s FullPath: %s', self.id, full_path)
+                    with full_path.open(mode='rb') as f:
+                        # the map keeps its own handle, pages are loaded by the os on access
+                        self._views[dat_file] = view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        return view
 
     def get_data_stream(self, dat_file=0) -> IO:
+        if self.use_mmap:
+            # streams over the shared map are cheap, a fresh one per call keeps threads from sharing positions
+            return MmapStream(self.get_data_view(dat_file))
         key = str(dat_file)
         if not hasattr(self._data_streams, key):
             full_path = self.id.dat_file_path(self.data_directory, dat_file)
@@ -170,12 +252,18 @@ class Pack:
         _id = self.id
         return f"Pack({_id.type_str}, {_id.expansion_str}, {_id.number})"
 
-    def get_file(self, path_or_key: str | bytes | int):
+    def get_file_info(self, path_or_key: str | bytes | int) -> FileInfo:
         file_index = None
         if self.index: file_index = self.index.get_file(path_or_key)
         if file_index is None and self.index2: file_index = self.index2.get_file(path_or_key)
         if file_index is None: raise FileNotFoundError(f'{path_or_key} is not found')
-        return self.get_file_by_info(file_index)
+        return file_index
+
+    def get_file(self, path_or_key: str | bytes | int):
+        return self.get_file_by_info(self.get_file_info(path_or_key))
+
+    def file_cache_key(self, file_info: FileInfo):
+        return self.id, file_info.dir.hash << 32 | file_info.hash
 
     def get_file_by_info(self, file_info: FileInfo):
         stream = self.get_data_stream(file_info.info.data_file_id)
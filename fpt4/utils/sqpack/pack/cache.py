@@ -0,0 +1,81 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+_missing = object()
+
+
+class FileCache:
+    """
+    least recently used cache of decoded files and parsed objects, bounded by the total size of the entries
+    """
+
+    def __init__(self, max_size: int = 512 << 20):
+        self._max_size = max_size
+        self.entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self.lock = threading.Lock()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_size(self):
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int):
+        with self.lock:
+            self._max_size = value
+            self._evict()
+
+    def _evict(self):
+        while self.size > self._max_size and self.entries:
+            _, (_, size) = self.entries.popitem(last=False)
+            self.size -= size
+            self.evictions += 1
+
+    def get(self, key: Hashable, default=None):
+        with self.lock:
+            if (entry := self.entries.get(key, _missing)) is _missing:
+                self.misses += 1
+                return default
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value, size: int):
+        with self.lock:
+            if (old := self.entries.pop(key, None)) is not None:
+                self.size -= old[1]
+            if size > self._max_size: return value
+            self.entries[key] = value, size
+            self.size += size
+            self._evict()
+        return value
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], tuple[Any, int]]):
+        # the loader runs without the lock, two threads missing the same key may both load it
+        if (value := self.get(key, _missing)) is not _missing: return value
+        value, size = loader()
+        return self.put(key, value, size)
+
+    def pop(self, key: Hashable):
+        with self.lock:
+            if (entry := self.entries.pop(key, None)) is not None:
+                self.size -= entry[1]
+                return entry[0]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def clear_stat(self):
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __repr__(self):
+        return f'FileCache({len(self.entries)} entries, {self.size / 2 ** 20:.1f}/{self._max_size / 2 ** 20:.1f}MB, hit={self.hits} miss={self.misses} evict={self.evictions})'
@@ -1,9 +1,8 @@
-import io
 import struct
 from ctypes import Structure
 
 from nylib.struct import fctypes, set_fields_from_annotations
-from .utils import FileCommonHeader, read_data_block, File
+from .utils import FileCommonHeader, read_block, join_blocks, File
 
 
 @set_fields_from_annotations
@@ -33,12 +32,12 @@ class CompressedFile(File):
 
     def get_data_buffer(self, stream):
         data_pos = stream.tell()
-        with io.BytesIO() as data_stream:
-            for i in range(self.header.number_of_compressed_data_block_info):
-                offset, compressed_size, uncompressed_size = struct.unpack_from(
-                    f'<IHH', self.header_buffer,
-                    COMPRESSED_DATA_BLOCK_INFO_OFFSET + i * COMPRESSED_DATA_BLOCK_INFO_SIZE
-                )  # CompressedDataBlockInfo
-                stream.seek(data_pos + offset)
-                read_data_block(stream, data_stream)
-            return bytearray(data_stream.getvalue())
+        blocks = []
+        for i in range(self.header.number_of_compressed_data_block_info):
+            offset, compressed_size, uncompressed_size = struct.unpack_from(
+                f'<IHH', self.header_buffer,
+                COMPRESSED_DATA_BLOCK_INFO_OFFSET + i * COMPRESSED_DATA_BLOCK_INFO_SIZE
+            )  # CompressedDataBlockInfo
+            stream.seek(data_pos + offset)
+            blocks.append(read_block(stream))
+        return join_blocks(blocks)
@@ -1,9 +1,7 @@
-import io
 import struct
-from ctypes import Structure
 
 from nylib.struct import fctypes, set_fields_from_annotations
-from .utils import FileCommonHeader, read_data_block, File
+from .utils import FileCommonHeader, read_block, join_blocks, File
 
 
 @set_fields_from_annotations
@@ -44,9 +42,55 @@ class FileModel(FileCommonHeader):
     compressed_block_size: 'fctypes.c_uint16*1' = eval('0XD0')
 
 
+COMPRESSED_BLOCK_SIZE_OFFSET = 0xD0  # FileModel.compressed_block_size
+# version, stack size, runtime size, vertex declaration num, material num, vertex offset[3], index offset[3],
+# vertex buffer size[3], index buffer size[3], lod num, enable index buffer streaming, enable edge geometry, padding
+MODEL_HEADER = struct.Struct('<3I2H12I4B')
+
+
 class ModelFile(File):
     header: FileModel
 
     def __init__(self, info, header_data: bytes):
         super().__init__(info, header_data)
         self.header = FileModel.from_buffer(self.header_buffer)
+
+    def get_data_buffer(self, stream):
+        # rebuild the .mdl layout: header, stack, runtime, then vertex/edge/index buffers of every lod
+        h = self.header
+        data_pos = stream.tell()
+        sections = [(h.stack_memory_offset, h.stack_data_block_index, h.stack_data_block_num), (h.runtime_memory_offset, h.runtime_data_block_index, h.runtime_data_block_num)]
+        for i in range(3):
+            sections.append((h.vertex_buffer_offset[i], h.vertex_buffer_data_block_index[i], h.vertex_buffer_data_block_num[i]))
+            sections.append((h.edge_geometry_vertex_buffer_offset[i], h.edge_geometry_vertex_buffer_data_block_index[i], h.edge_geometry_vertex_buffer_data_block_num[i]))
+            sections.append((h.index_buffer_offset[i], h.index_buffer_data_block_index[i], h.index_buffer_data_block_num[i]))
+        block_count = max((index + num for _, index, num in sections), default=0)
+        block_sizes = struct.unpack_from(f'<{block_count}H', self.header_buffer, COMPRESSED_BLOCK_SIZE_OFFSET)
+        blocks = []
+        section_sizes = []
+        for offset, index, num in sections:
+            pos = data_pos + offset
+            size = 0
+            for block_size in block_sizes[index:index + num]:
+                stream.seek(pos)
+                blocks.append(block := read_block(stream))
+                size += block[1]
+                pos += block_size
+            section_sizes.append(size)
+        res = join_blocks(blocks, MODEL_HEADER.size)
+        vertex_offsets, index_offsets, vertex_sizes, index_sizes = [], [], [], []
+        pos = MODEL_HEADER.size + section_sizes[0] + section_sizes[1]
+        for i in range(3):
+            vertex_size, edge_size, index_size = section_sizes[2 + i * 3:5 + i * 3]
+            vertex_offsets.append(pos if vertex_size else 0)
+            vertex_sizes.append(vertex_size)
+            pos += vertex_size + edge_size
+            index_offsets.append(pos if index_size else 0)
+            index_sizes.append(index_size)
+            pos += index_size
+        MODEL_HEADER.pack_into(
+            res, 0, h.version, section_sizes[0], section_sizes[1], h.vertex_declaration_num, h.material_num,
+            *vertex_offsets, *index_offsets, *vertex_sizes, *index_sizes,
+            h.lod_num, h.enable_index_buffer_streaming & 0xFF, h.enable_edge_geometry & 0xFF, 0,
+        )
+        return res
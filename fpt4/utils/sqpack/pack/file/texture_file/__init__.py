@@ -1,10 +1,9 @@
-import io
 import struct
 import ctypes
 
-from ..utils import read_data_block, File
+from ..utils import read_block, join_blocks, File
 from .utils import FileTexture, TextureHeader, LodBlock
-from .processors import process
+from .processors import process, decode
 
 HEADER_SIZE = ctypes.sizeof(FileTexture)
 TEXTURE_HEADER_SIZE = ctypes.sizeof(TextureHeader)
@@ -22,16 +21,49 @@ class TextureFile(File):
     def get_data_buffer(self, stream):
         stream.seek(TEXTURE_HEADER_SIZE, 1)
         pos = stream.tell()
-        with io.BytesIO() as data_stream:
-            for _len, in struct.iter_unpack(
-                    '<H', self.header_buffer[HEADER_SIZE + ctypes.sizeof(self.lod_blocks):]
-            ):
-                if not _len: break
-                stream.seek(pos)
-                read_data_block(stream, data_stream)
-                pos += _len
-            return bytearray(data_stream.getvalue())
-
-    def get_image(self):
+        blocks = []
+        for _len, in struct.iter_unpack(
+                '<H', self.header_buffer[HEADER_SIZE + ctypes.sizeof(self.lod_blocks):]
+        ):
+            if not _len: break
+            stream.seek(pos)
+            blocks.append(read_block(stream))
+            pos += _len
+        return join_blocks(blocks)
+
+    def _load_lod_buffer(self, lod: int):
+        lod_block = self.lod_blocks[lod]
+        block_sizes = struct.unpack_from(
+            f'<{lod_block.block_offset + lod_block.block_num}H', self.header_buffer, HEADER_SIZE + ctypes.sizeof(self.lod_blocks)
+        )[lod_block.block_offset:]
+        stream = self.data_stream
+        pos = stream.tell() + lod_block.comp_offset
+        blocks = []
+        for size in block_sizes:
+            stream.seek(pos)
+            blocks.append(read_block(stream))
+            pos += size
+        buffer = join_blocks(blocks)
+        return buffer, len(buffer)
+
+    def get_lod_buffer(self, lod: int = 0) -> bytearray:
+        """
+        decode only the blocks of one lod, lod 0 starts with the full size mip
+        """
+        pack = self.info.dir.index.pack
+        if pack.mgr is None: return self._load_lod_buffer(lod)[0]
+        return pack.mgr.cache.get_or_load((*pack.file_cache_key(self.info), 'lod', lod), lambda: self._load_lod_buffer(lod))
+
+    def get_lod_source(self, lod: int = 0):
+        """
+        buffer and size of a lod, lod block i holds mip i, all lods from the full size mip when there is no such block
+        """
         th = self.texture_header
-        return process(th.format.value, self.data_buffer, th.width, th.height)
+        if not 0 <= lod < self.header.output_lod_num: return self.data_buffer, th.width, th.height
+        return self.get_lod_buffer(lod), max(th.width >> lod, 1), max(th.height >> lod, 1)
+
+    def get_image(self, lod: int = 0):
+        return process(self.texture_header.format.value, *self.get_lod_source(lod))
+
+    def get_array(self, lod: int = 0):
+        return decode(self.texture_header.format.value, *self.get_lod_source(lod))
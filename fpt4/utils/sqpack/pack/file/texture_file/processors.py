@@ -2,6 +2,8 @@ import io
 import struct
 import typing
 
+import numpy as np
+
 from .utils import TextureFormat
 
 if typing.TYPE_CHECKING:
@@ -16,64 +18,65 @@ def get_pil_img():
     return Image
 
 
+def _pixels(src: bytes, dtype: str, width: int, height: int):
+    # src may hold the lower mips after the first one
+    return np.frombuffer(src, dtype, count=width * height).reshape(height, width)
+
+
+def decode_R5G5B5A1_UNorm(src: bytes, width: int, height: int) -> np.ndarray:
+    v = _pixels(src, '<u2', width, height)
+    res = np.empty((height, width, 4), np.uint8)
+    for i, shift in enumerate((10, 5, 0)):
+        c = (v >> shift) & 0x1F
+        res[..., i] = (c << 3) | (c >> 2)
+    res[..., 3] = (v >> 15) * 0xFF
+    return res
+
+
+def decode_R4G4B4A4_UNorm(src: bytes, width: int, height: int) -> np.ndarray:
+    v = _pixels(src, '<u2', width, height)
+    res = np.empty((height, width, 4), np.uint8)
+    for i, shift in enumerate((8, 4, 0, 12)):
+        res[..., i] = ((v >> shift) & 0x0F) << 4
+    return res
+
+
+def decode_R8G8B8A8_UNorm(src: bytes, width: int, height: int) -> np.ndarray:
+    # stored as bgra
+    return _pixels(src, '<u4', width, height).view(np.uint8).reshape(height, width, 4)[..., [2, 1, 0, 3]]
+
+
+def decode_L8_UNorm(src: bytes, width: int, height: int) -> np.ndarray:
+    v = _pixels(src, 'u1', width, height).astype(np.uint16)
+    res = np.empty((height, width, 3), np.uint8)
+    r = v & 0xE0
+    g = v & 0x1C
+    b = v & 0x03
+    res[..., 0] = (r | (r << 3) | (r << 6)) & 0xFF
+    res[..., 1] = (g | (g << 3) | (g << 6)) & 0xFF
+    res[..., 2] = (b | (b << 2) | (b << 4) | (b << 6)) & 0xFF
+    return res
+
+
+def _to_image(arr: np.ndarray):
+    mode = 'RGBA' if arr.shape[2] == 4 else 'RGB'
+    return get_pil_img().frombuffer(mode, (arr.shape[1], arr.shape[0]), np.ascontiguousarray(arr), 'raw', mode, 0, 1)
+
+
 def process_R5G5B5A1_UNorm(src: bytes, width: int, height: int):
-    pil_img = get_pil_img()
-    with io.BytesIO() as dst:
-        for v, in struct.iter_unpack('H', src):
-            a = v & 0x8000
-            r = v & 0x7C00
-            g = v & 0x03E0
-            b = v & 0x001F
-            rgb = ((r << 9) | (g << 6) | (b << 3))
-            argb_value = (a * 0x1FE00 | rgb | ((rgb >> 5) & 0x070707))
-            dst.write(bytes((
-                (argb_value >> 16) & 0xFF,
-                (argb_value >> 8) & 0xFF,
-                (argb_value) & 0xFF,
-                (argb_value >> 24) & 0xFF,
-            )))
-        return pil_img.frombytes('RGBA', (width, height), dst.getvalue())
+    return _to_image(decode_R5G5B5A1_UNorm(src, width, height))
 
 
 def process_R4G4B4A4_UNorm(src: bytes, width: int, height: int):
-    pil_img = get_pil_img()
-    with io.BytesIO() as dst:
-        for v, in struct.iter_unpack('H', src):
-            dst.write(bytes((
-                ((v >> 8) & 0x0F) << 4,
-                ((v >> 4) & 0x0F) << 4,
-                ((v) & 0x0F) << 4,
-                ((v >> 12) & 0x0F) << 4,
-            )))
-        return pil_img.frombytes('RGBA', (width, height), dst.getvalue())
+    return _to_image(decode_R4G4B4A4_UNorm(src, width, height))
 
 
 def process_R8G8B8A8_UNorm(src: bytes, width: int, height: int):
-    pil_img = get_pil_img()
-    with io.BytesIO() as dst:
-        for v, in struct.iter_unpack('L', src):
-            dst.write(bytes((
-                (v >> 16) & 0xFF,
-                (v >> 8) & 0xFF,
-                (v) & 0xFF,
-                (v >> 24) & 0xFF,
-            )))
-        return pil_img.frombytes('RGBA', (width, height), dst.getvalue())
+    return _to_image(decode_R8G8B8A8_UNorm(src, width, height))
 
 
 def process_L8_UNorm(src: bytes, width: int, height: int):
-    pil_img = get_pil_img()
-    with io.BytesIO() as dst:
-        for v, in struct.iter_unpack('L', src):
-            r = v & 0xE0
-            g = v & 0x1C
-            b = v & 0x03
-            dst.write(bytes((
-                (r | (r << 3) | (r << 6)) & 0xFF,
-                (g | (g << 3) | (g << 6)) & 0xFF,
-                (b | (b << 2) | (b << 4) | (b << 6)) & 0xFF,
-            )))
-        return pil_img.frombytes('RGB', (width, height), dst.getvalue())
+    return _to_image(decode_L8_UNorm(src, width, height))
 
 
 def process_DXT1(src: bytes, width: int, height: int):
@@ -113,6 +116,25 @@ format_processors: 'typing.Dict[int,typing.Callable[[bytes,int,int],Image.Image]
 }
 
 
+format_decoders: 'typing.Dict[int,typing.Callable[[bytes,int,int],np.ndarray]]' = {
+    TextureFormat.R5G5B5A1_UNorm: decode_R5G5B5A1_UNorm,
+    TextureFormat.R4G4B4A4_UNorm: decode_R4G4B4A4_UNorm,
+    TextureFormat.R8G8B8A8_UNorm: decode_R8G8B8A8_UNorm,
+    TextureFormat.A8_UNorm: decode_R8G8B8A8_UNorm,
+    TextureFormat.R32_FLOAT: decode_R8G8B8A8_UNorm,
+    TextureFormat.L8_UNorm: decode_L8_UNorm,
+}
+
+
+def decode(fmt: int, src: bytes, width: int, height: int) -> np.ndarray:
+    """
+    decode an uncompressed format to a (height, width, channels) uint8 array without pillow
+    """
+    if f := format_decoders.get(fmt):
+        return f(src, width, height)
+    raise NotImplementedError(f'0x{fmt:04X} doesnt implement decoder')
+
+
 def process(fmt: int, src: bytes, width: int, height: int) -> 'Image.Image':
     if f := format_processors.get(fmt):
         return f(src, width, height)
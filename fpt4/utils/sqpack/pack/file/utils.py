@@ -1,7 +1,9 @@
-import io
+import os
 import struct
-from logging import getLogger
+import threading
 import zlib
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
 from typing import IO, TypeVar, TYPE_CHECKING, Any
 from ctypes import Structure
 from nylib.struct import fctypes, set_fields_from_annotations
@@ -28,18 +30,64 @@ class FileCommonHeader(Structure):
     used_number_of_block: 'fctypes.c_uint32' = eval('0X10')
 
 
-def read_data_block(src: IO, dst: IO):
+def read_block(src: IO) -> tuple[bytes | memoryview, int, bool]:
+    """
+    read a block at the current position, returns the raw payload, its uncompressed size and whether it is deflated
+    """
     size, version, compressed_size, uncompressed_size = BLOCK_INFO.unpack(src.read(BLOCK_INFO_SIZE))  # CompressionBlockInfo16
     assert size == BLOCK_INFO_SIZE
-    is_compressed = compressed_size < COMPRESSION_THRESHOLD
-    block_size = uncompressed_size if is_compressed else compressed_size
-    if is_compressed and ((block_size + BLOCK_INFO_SIZE) % BLOCK_PADDING) != 0:
-        block_size += BLOCK_PADDING - ((block_size + BLOCK_INFO_SIZE) % BLOCK_PADDING)
-    buffer = src.read(block_size)
-    if is_compressed:
-        assert uncompressed_size == dst.write(zlib.decompress(buffer, -15)), RuntimeError("Inflated block does not match indicated size")
+    if compressed_size < COMPRESSION_THRESHOLD:
+        return src.read(compressed_size), uncompressed_size, True
+    return src.read(uncompressed_size), uncompressed_size, False
+
+
+def inflate_block(data: bytes | memoryview, uncompressed_size: int) -> bytes:
+    res = zlib.decompress(data, -15)
+    if len(res) != uncompressed_size: raise RuntimeError("Inflated block does not match indicated size")
+    return res
+
+
+block_workers = min(8, os.cpu_count() or 1)  # 0 or 1 to decompress in the calling thread only
+parallel_min_blocks = 4
+_block_pool: ThreadPoolExecutor | None = None
+_block_pool_lock = threading.Lock()
+
+
+def get_block_pool():
+    global _block_pool
+    if _block_pool is None:
+        with _block_pool_lock:
+            if _block_pool is None:
+                _block_pool = ThreadPoolExecutor(block_workers, thread_name_prefix='sqpack_block')
+    return _block_pool
+
+
+def join_blocks(blocks: list[tuple[bytes | memoryview, int, bool]], prefix_size=0) -> bytearray:
+    """
+    decompress blocks read by read_block into one preallocated buffer, after prefix_size reserved bytes
+    """
+    offsets = []
+    total = prefix_size
+    for _, uncompressed_size, _ in blocks:
+        offsets.append(total)
+        total += uncompressed_size
+    res = bytearray(total)
+    view = memoryview(res)
+
+    def work(start, stop):
+        for i in range(start, stop):
+            data, uncompressed_size, is_compressed = blocks[i]
+            offset = offsets[i]
+            # zlib releases the gil while inflating, blocks land on their own slices so no lock is needed
+            view[offset:offset + uncompressed_size] = inflate_block(data, uncompressed_size) if is_compressed else data
+
+    if block_workers > 1 and len(blocks) >= parallel_min_blocks:
+        # one contiguous run of blocks per worker, a future per 16k block costs about as much as inflating it
+        step = -(-len(blocks) // block_workers)
+        for f in [get_block_pool().submit(work, i, min(i + step, len(blocks))) for i in range(0, len(blocks), step)]: f.result()
     else:
-        dst.write(buffer)
+        work(0, len(blocks))
+    return res
 
 
 class File:
@@ -58,11 +106,18 @@ class File:
     def get_data_buffer(self, stream: IO) -> bytearray:
         return bytearray(stream.read(self.data_size))
 
+    def _load_data_buffer(self):
+        self.logger.debug('reading %s...', self.info.full_path)
+        buffer = self.get_data_buffer(self.data_stream)
+        return buffer, len(buffer)
+
     @property
     def data_buffer(self) -> bytearray:
+        pack = self.info.dir.index.pack
+        if pack.mgr is not None:
+            return pack.mgr.cache.get_or_load(pack.file_cache_key(self.info), self._load_data_buffer)
         if self._data_buffer is None:
-            self.logger.debug('reading %s...', self.info.full_path)
-            self._data_buffer = self.get_data_buffer(self.data_stream)
+            self._data_buffer, _ = self._load_data_buffer()
         return self._data_buffer
 
     @property
@@ -1,6 +1,10 @@
+import os
 import zlib
+from logging import getLogger
 from pathlib import Path
-from typing import TYPE_CHECKING, IO, Dict, Tuple, Type
+
+import numpy as np
+from typing import TYPE_CHECKING, IO, Dict, Tuple
 from .structure import VersionInfo, IndexFileInfo, DirectoryIndexInfo
 from .structure import SynonymTableElem_Hash32, SynonymTableElem_Hash64
 from .structure import HashTableElem_Hash32, HashTableElem_Hash64
@@ -8,6 +12,13 @@ from .structure import HashTableElem_Hash32, HashTableElem_Hash64
 if TYPE_CHECKING:
     from . import Pack
 
+logger = getLogger('SqPack/Index')
+
+# numpy views of the hash tables, same layout as the structures
+HASH32_DTYPE = np.dtype([('hash', '<u4'), ('packed', '<u4')])
+HASH64_DTYPE = np.dtype([('hash', '<u8'), ('packed', '<u4'), ('reserved', '<u4')])
+DIR_DTYPE = np.dtype([('dir_hash', '<u4'), ('offset', '<u4'), ('size', '<u4'), ('reserved', '<u4')])
+
 
 def compute_hash_32(s: str | bytes):
     if isinstance(s, str): s = s.encode('utf-8')
@@ -50,13 +61,14 @@ class FileInfo:
 
 
 class Directory:
-    files: Dict[int, FileInfo] = {}
-
-    def __init__(self, index: 'Index', info: DirectoryIndexInfo):
+    def __init__(self, index: 'Index', info: DirectoryIndexInfo, start=0, stop=0):
         self.index = index
         self.info = info
         self.hash = info.dir_hash
         self._path = b'dir_hash_%d' % self.hash
+        self.start = start
+        self.stop = stop
+        self._files: Dict[int, FileInfo] = {}
 
     @property
     def path(self):
@@ -68,18 +80,29 @@ class Directory:
             path = path.encode('utf-8')
         if path != self._path:
             self._path = path
-            for file in self.files.values():
+            for file in self._files.values():
                 file.full_path = b'%s/%s' % (path, file.name)
 
-    def build_files(self, stream: IO, index_data_type: Type[HashTableElem_Hash64 | HashTableElem_Hash32], start_pos=0):
-        if not self.info.size: return
-        stream.seek(start_pos + self.info.offset)
-        el_size = index_data_type._size_
-        self.files = {}
-        for _ in range(self.info.size // el_size):
-            file = FileInfo(self, index_data_type.from_buffer_copy(stream.read(el_size)))
-            self.files[file.hash] = file
-        return self
+    @property
+    def files(self) -> Dict[int, FileInfo]:
+        if len(self._files) != self.stop - self.start:
+            for row in range(self.start, self.stop):
+                self._file_at(row)
+        return self._files
+
+    def _file_at(self, row: int) -> FileInfo:
+        file_hash = int(self.index.file_hashes[row])
+        if (file := self._files.get(file_hash)) is None:
+            self._files[file_hash] = file = FileInfo(self, self.index.index_data_type.from_buffer_copy(self.index.file_table[row].tobytes()))
+        return file
+
+    def find_file(self, file_hash: int) -> FileInfo | None:
+        if (file := self._files.get(file_hash)) is not None: return file
+        hashes = self.index.file_hashes
+        # rows are stable sorted by hash inside a directory, take the last one like the old dict build did
+        row = self.start + int(np.searchsorted(hashes[self.start:self.stop], file_hash, 'right')) - 1
+        if row < self.start or hashes[row] != file_hash: return None
+        return self._file_at(row)
 
     def __hash__(self):
         return self.hash
@@ -94,9 +117,8 @@ class Directory:
 
     def get_file(self, name_or_hash: str | int) -> FileInfo | None:
         if isinstance(name_or_hash, int):
-            return self.files.get(name_or_hash)
-        file_hash = compute_hash_32(name_or_hash)
-        file = self.files.get(file_hash)
+            return self.find_file(name_or_hash)
+        file = self.find_file(compute_hash_32(name_or_hash))
         if file is None: return
         file.name = name_or_hash
         return file
@@ -107,18 +129,27 @@ class Index:
     Class representing the data inside a *.index file.
     """
     synonyms: Dict[int, SynonymTableElem_Hash32 | SynonymTableElem_Hash64] = {}
-    dirs: Dict[int, Directory] = {}
-    files: Dict[int, FileInfo] = {}
+    cache_version = 1
 
-    def __init__(self, pack: 'Pack', path_or_stream: IO | str | Path):
+    def __init__(self, pack: 'Pack', path_or_stream: IO | str | Path, cache_directory: Path | None = None):
         self.pack = pack
+        self._dirs: Dict[int, Directory] = {}
+        self._files: Dict[int, FileInfo] | None = None
+        self._path_hash_order = None
         if isinstance(path_or_stream, (str, Path)):
+            path_or_stream = Path(path_or_stream)
+            cache_path = self.cache_path(path_or_stream, cache_directory) if cache_directory else None
             with open(path_or_stream, 'rb') as stream:
-                self._load(stream)
+                self._load(stream, cache_path, os.fstat(stream.fileno()))
         else:
             self._load(path_or_stream)
 
-    def _load(self, stream: IO):
+    @staticmethod
+    def cache_path(path: Path, cache_directory: Path):
+        path = path.absolute()
+        return cache_directory / f'{path.parent.name}_{path.name}_{zlib.crc32(str(path).encode("utf-8")):08x}.npz'
+
+    def _load(self, stream: IO, cache_path: Path | None = None, stat: os.stat_result | None = None):
         start_pos = stream.tell()
         self.version_info = VersionInfo.from_buffer_copy(stream.read(VersionInfo._size_))
         assert self.version_info.magic_str == b'SqPack', Exception('version_info magic_str not pair')
@@ -126,6 +157,7 @@ class Index:
         self.index_file_info = IndexFileInfo.from_buffer_copy(stream.read(IndexFileInfo._size_))
         self.is_index1 = self.index_file_info.index_type != 2
         self.get_hash_hoge = get_hash_hoge = (lambda x: x.hash_hoge64) if self.is_index1 else (lambda x: x.hash_hoge32)
+        self.index_data_type = HashTableElem_Hash64 if self.is_index1 else HashTableElem_Hash32
 
         if self.index_file_info.synonym_data_size:
             self.synonyms = {}
@@ -136,33 +168,124 @@ class Index:
                 synonym = synonym_type.from_buffer_copy(stream.read(el_size))
                 self.synonyms[get_hash_hoge(synonym)] = synonym
 
+        stat_key = np.array([self.cache_version, stat.st_mtime_ns, stat.st_size], np.int64) if stat is not None else None
+        if not (cache_path and self._load_cache(cache_path, stat_key)):
+            self._load_tables(stream, start_pos)
+            if cache_path: self._save_cache(cache_path, stat_key)
+
+    def _load_tables(self, stream: IO, start_pos: int):
+        dir_table = np.empty(0, DIR_DTYPE)
         if self.index_file_info.dir_index_data_size:
-            self.dirs = {}
-            el_size = DirectoryIndexInfo._size_
             stream.seek(start_pos + self.index_file_info.dir_index_data_offset)
-            for _ in range(self.index_file_info.dir_index_data_size // el_size):
-                _dir = Directory(self, DirectoryIndexInfo.from_buffer_copy(stream.read(el_size)))
-                self.dirs[_dir.hash] = _dir
+            dir_table = np.frombuffer(stream.read(self.index_file_info.dir_index_data_size // DIR_DTYPE.itemsize * DIR_DTYPE.itemsize), DIR_DTYPE)
+        data_dtype = HASH64_DTYPE if self.is_index1 else HASH32_DTYPE
+        counts = (dir_table['size'] // data_dtype.itemsize).astype(np.int64)
+        if counts.sum():
+            used = counts > 0
+            # read the hash table once, then gather the rows of every directory in directory order
+            base = int(dir_table['offset'][used].min())
+            end = int((dir_table['offset'][used] + counts[used] * data_dtype.itemsize).max())
+            stream.seek(start_pos + base)
+            raw = np.frombuffer(stream.read(end - base), data_dtype)
+            starts = (dir_table['offset'].astype(np.int64) - base) // data_dtype.itemsize
+            bounds = np.concatenate(((0,), np.cumsum(counts)))
+            rows = np.arange(bounds[-1]) + np.repeat(starts - bounds[:-1], counts)
+            file_table = raw[rows]
+            file_hashes = (file_table['hash'] & 0xFFFFFFFF).astype(np.uint32)
+            order = np.lexsort((file_hashes, np.repeat(np.arange(len(dir_table)), counts)))
+            self.file_table = file_table[order]
+            self.file_hashes = file_hashes[order]
+        else:
+            bounds = np.zeros(len(dir_table) + 1, np.int64)
+            self.file_table = np.empty(0, data_dtype)
+            self.file_hashes = np.empty(0, np.uint32)
+        self._set_dir_table(dir_table, bounds)
 
-        if self.dirs:
-            self.files = {}
-            index_data_type = HashTableElem_Hash64 if self.is_index1 else HashTableElem_Hash32
-            for _dir in self.dirs.values():
-                for file in _dir.build_files(stream, index_data_type, start_pos).files.values():
-                    self.files[file.key] = file
+    def _set_dir_table(self, dir_table, bounds):
+        order = np.argsort(dir_table['dir_hash'], kind='stable')
+        self.dir_table = dir_table[order]
+        self.dir_hashes = np.ascontiguousarray(self.dir_table['dir_hash'])
+        self.dir_bounds = np.stack((bounds[:-1][order], bounds[1:][order]), axis=1)
+
+    def _load_cache(self, cache_path: Path, stat_key) -> bool:
+        try:
+            with np.load(cache_path, allow_pickle=False) as data:
+                if not np.array_equal(data['stat'], stat_key): return False
+                dir_table = data['dir_table']
+                file_table = data['file_table']
+                if dir_table.dtype != DIR_DTYPE or file_table.dtype != (HASH64_DTYPE if self.is_index1 else HASH32_DTYPE):
+                    return False
+                self.dir_table = dir_table
+                self.dir_hashes = data['dir_hashes']
+                self.dir_bounds = data['dir_bounds']
+                self.file_table = file_table
+                self.file_hashes = data['file_hashes']
+        except (OSError, KeyError, ValueError):
+            return False
+        return True
+
+    def _save_cache(self, cache_path: Path, stat_key):
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_path, 'wb') as f:
+                np.savez(
+                    f, stat=stat_key, dir_table=self.dir_table, dir_hashes=self.dir_hashes,
+                    dir_bounds=self.dir_bounds, file_table=self.file_table, file_hashes=self.file_hashes,
+                )
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.warning(f'fail to save index cache {cache_path}: {e}')
+
+    @property
+    def dirs(self) -> Dict[int, Directory]:
+        if len(self._dirs) != len(self.dir_hashes):
+            for i in range(len(self.dir_hashes)):
+                self._dir_at(i)
+        return self._dirs
+
+    @property
+    def files(self) -> Dict[int, FileInfo]:
+        if self._files is None:
+            self._files = {file.key: file for _dir in self.dirs.values() for file in _dir.files.values()}
+        return self._files
+
+    def _dir_at(self, i: int) -> Directory:
+        dir_hash = int(self.dir_hashes[i])
+        if (_dir := self._dirs.get(dir_hash)) is None:
+            start, stop = self.dir_bounds[i]
+            self._dirs[dir_hash] = _dir = Directory(self, DirectoryIndexInfo.from_buffer_copy(self.dir_table[i].tobytes()), int(start), int(stop))
+        return _dir
+
+    def find_directory(self, dir_hash: int) -> Directory | None:
+        if (_dir := self._dirs.get(dir_hash)) is not None: return _dir
+        i = int(np.searchsorted(self.dir_hashes, dir_hash))
+        if i >= len(self.dir_hashes) or self.dir_hashes[i] != dir_hash: return None
+        return self._dir_at(i)
+
+    def find_file_by_path_hash(self, path_hash: int) -> FileInfo | None:
+        # index2 rows hold the hash of the full path, they are searched across directories through one sorted view
+        if self._path_hash_order is None:
+            order = np.argsort(self.file_hashes, kind='stable')
+            self._path_hash_order = order, self.file_hashes[order]
+        order, hashes = self._path_hash_order
+        if path_hash >> 32: return None
+        i = int(np.searchsorted(hashes, np.uint32(path_hash), 'right')) - 1  # a python int would convert the whole array
+        if i < 0 or hashes[i] != path_hash: return None
+        row = int(order[i])
+        i, = np.flatnonzero((self.dir_bounds[:, 0] <= row) & (row < self.dir_bounds[:, 1]))
+        return self._dir_at(int(i))._file_at(row)
 
     def file_exists(self, path: str | bytes) -> bool:
-        if isinstance(path, str): path = path.encode('utf-8')
-        dir_path, base_name = path.rsplit(b'/', 1)
-        return compute_hash_32(dir_path) << 32 + compute_hash_32(base_name) in self.files
+        return self.get_file_fast(path) is not None
 
     def get_directory(self, name_or_hash: str | bytes | int) -> Directory | None:
         if isinstance(name_or_hash, str):
             name_or_hash = name_or_hash.encode('utf-8')
         if isinstance(name_or_hash, int):
-            return self.dirs.get(name_or_hash)
+            return self.find_directory(name_or_hash)
         dir_hash = compute_hash_32(name_or_hash)
-        _dir = self.dirs.get(dir_hash)
+        _dir = self.find_directory(dir_hash)
         if _dir is None: return
         _dir.path = name_or_hash
         return _dir
@@ -180,8 +303,11 @@ class Index:
 
     def get_file_fast(self, path_or_key: str | bytes | int) -> FileInfo | None:
         if isinstance(path_or_key, str):
-            path = path_or_key.encode('utf-8')
+            path_or_key = path_or_key.encode('utf-8')
+        if not self.is_index1:
+            return self.find_file_by_path_hash(compute_hash_32(path_or_key) if isinstance(path_or_key, bytes) else path_or_key)
         if isinstance(path_or_key, bytes):
             dir_path, base_name = path_or_key.rsplit(b'/', 1)
-            return self.files.get(compute_hash_32(dir_path) << 32 + compute_hash_32(base_name))
-        return self.files.get(path_or_key)
+            path_or_key = compute_hash_32(dir_path) << 32 | compute_hash_32(base_name)
+        _dir = self.find_directory(path_or_key >> 32)
+        return _dir.find_file(path_or_key & 0xFFFFFFFF) if _dir is not None else None
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 from functools import cached_property
 from .exd.row import SubDataRow
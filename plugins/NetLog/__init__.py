@@ -14,7 +14,8 @@ actor_controls = ZoneServer.ActorControl, ZoneServer.ActorControlSelf, ZoneServe
 class NetLog(FFDrawPlugin):
     def __init__(self, main):
         super().__init__(main)
-        self.nls = [(datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'), net_log_imgui.NetLogger(self.main.sq_pack, self.get_actor))]
+        self.memory_cap_mb = self.data.setdefault('memory_cap_mb', 256)  # per log, older messages spill to a temp file
+        self.nls = [(datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'), self.new_logger())]
         self.display_nl = 0
         self.actor_cache = {}
 
@@ -30,6 +31,7 @@ class NetLog(FFDrawPlugin):
         self.main.sniffer.on_chat_server_message.unhook_any(self.on_chat_server_message)
         self.main.sniffer.on_chat_client_message.unhook_any(self.on_chat_client_message)
         self.main.sniffer.on_actor_control.unhook_any(self.on_actor_control_message)
+        for _, nl in self.nls: nl.close()
 
     def on_zone_server_message(self, msg: message.NetworkMessage):
         if msg.proto_no in actor_controls: return  # process in on_actor_control_message
@@ -40,7 +42,7 @@ class NetLog(FFDrawPlugin):
         if msg.proto_no == ZoneServer.PingRes:
             return  # don't record pings
         key = msg.proto_no if isinstance(msg.proto_no, int) else msg.proto_no.name
-        self.nl.append_data(net_log_imgui.ZoneServerIpc(self.nl, msg.raw_message.bundle_header.timestamp_ms, msg.header.source_id, key, msg.message))
+        self.nl.append(net_log_imgui.ZoneServerIpc, msg.raw_message.bundle_header.timestamp_ms, msg.header.source_id, key, msg.message)
 
     def on_zone_client_message(self, msg: message.NetworkMessage):
         if msg.proto_no == ZoneClient.UpdatePositionHandler or msg.proto_no == ZoneClient.UpdatePositionInstance:
@@ -51,28 +53,33 @@ class NetLog(FFDrawPlugin):
         if msg.proto_no == ZoneClient.PingReq:
             return  # don't record pings
         key = msg.proto_no if isinstance(msg.proto_no, int) else msg.proto_no.name
-        self.nl.append_data(net_log_imgui.ZoneClientIpc(self.nl, msg.raw_message.bundle_header.timestamp_ms, msg.header.source_id, key, msg.message))
+        self.nl.append(net_log_imgui.ZoneClientIpc, msg.raw_message.bundle_header.timestamp_ms, msg.header.source_id, key, msg.message)
 
     def on_chat_server_message(self, msg: message.NetworkMessage):
         key = msg.proto_no if isinstance(msg.proto_no, int) else msg.proto_no.name
-        self.nl.append_data(net_log_imgui.ChatServerIpc(self.nl, msg.raw_message.bundle_header.timestamp_ms, msg.header.source_id, key, msg.message))
+        self.nl.append(net_log_imgui.ChatServerIpc, msg.raw_message.bundle_header.timestamp_ms, msg.header.source_id, key, msg.message)
 
     def on_chat_client_message(self, msg: message.NetworkMessage):
         key = msg.proto_no if isinstance(msg.proto_no, int) else msg.proto_no.name
-        self.nl.append_data(net_log_imgui.ChatClientIpc(self.nl, msg.raw_message.bundle_header.timestamp_ms, msg.header.source_id, key, msg.message))
+        self.nl.append(net_log_imgui.ChatClientIpc, msg.raw_message.bundle_header.timestamp_ms, msg.header.source_id, key, msg.message)
 
     def on_actor_control_message(self, msg: message.ActorControlMessage):
         try:
             key = ActorControlId(msg.id).name
         except ValueError:
             key = msg.id
-        self.nl.append_data(net_log_imgui.ActorControlIpc(
-            self.nl, msg.raw_msg.raw_message.bundle_header.timestamp_ms,
+        self.nl.append(
+            net_log_imgui.ActorControlIpc, msg.raw_msg.raw_message.bundle_header.timestamp_ms,
             msg.source_id, key, msg.param or msg.args, target_id=msg.target_id,
-        ))
+        )
+
+    def new_logger(self):
+        spill_dir = self.storage.path / 'spill'
+        spill_dir.mkdir(parents=True, exist_ok=True)
+        return net_log_imgui.NetLogger(self.main.sq_pack, self.get_actor, self.memory_cap_mb << 20, spill_dir)
 
     def reset(self):
-        self.nls.append((datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'), net_log_imgui.NetLogger(self.main.sq_pack, self.get_actor)))
+        self.nls.append((datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'), self.new_logger()))
         self.display_nl = len(self.nls) - 1
         self.actor_cache.clear()
 
@@ -117,6 +124,7 @@ class NetLog(FFDrawPlugin):
                             self.display_nl = i
             if imgui.button('Clear', -1):
                 self.reset()
+                for _, nl in self.nls[:-1]: nl.close()
                 self.nls = [self.nls[-1]]
                 self.display_nl = 0
         imgui.next_column()
@@ -0,0 +1,179 @@
+import dataclasses
+import logging
+import os
+import threading
+import time
+import typing
+from concurrent.futures import ProcessPoolExecutor
+
+from ff_draw.sniffer.message_dump import DumpReader
+from . import net_log_imgui
+
+if typing.TYPE_CHECKING:
+    from fpt4.utils.sqpack import SqPack
+    from ff_draw.sniffer.message_structs import zone_server
+
+logger = logging.getLogger('NetLog/DumpLoader')
+spawn_protos = 'NpcSpawn', 'NpcSpawn2', 'ObjectSpawn', 'PlayerSpawn', 'RsvString'
+scope_types = net_log_imgui.ChatServerIpc, net_log_imgui.ChatClientIpc, net_log_imgui.ZoneServerIpc, net_log_imgui.ZoneClientIpc
+
+
+def _actor_control(timestamp_ms, ac_id, source_id, target_id, *args):
+    from ff_draw.sniffer.enums import ActorControlId
+    from ff_draw.sniffer.message_structs import actor_control
+    try:
+        ac_id = ActorControlId(ac_id)
+    except ValueError:
+        return net_log_imgui.ActorControlIpc, timestamp_ms, source_id, ac_id, args, target_id
+    if t := actor_control.type_map.get(ac_id):
+        if not hasattr(t, '__field_count'):
+            setattr(t, '__field_count', cnt := len(dataclasses.fields(t)))
+        else:
+            cnt = getattr(t, '__field_count')
+        return net_log_imgui.ActorControlIpc, timestamp_ms, source_id, ac_id.name, t(*args[:cnt]), target_id
+    return net_log_imgui.ActorControlIpc, timestamp_ms, source_id, ac_id.name, args, target_id
+
+
+def iter_messages(records):
+    """
+    messages as the arguments of NetLogger.append from the parsed records of a dump
+    """
+    for is_zone, is_up, proto_no, source_id, timestamp_ms, data in records:
+        match proto_no:
+            case 'ActorControl':
+                data: 'zone_server.ActorControl'
+                yield _actor_control(timestamp_ms, data.id, source_id, 0, data.arg0, data.arg1, data.arg2, data.arg3)
+            case 'ActorControlSelf':
+                data: 'zone_server.ActorControlSelf'
+                yield _actor_control(timestamp_ms, data.id, source_id, 0, data.arg0, data.arg1, data.arg2, data.arg3, data.arg4, data.arg5)
+            case 'ActorControlTarget':
+                data: 'zone_server.ActorControlTarget'
+                yield _actor_control(timestamp_ms, data.id, source_id, data.target_id, data.arg0, data.arg1, data.arg2, data.arg3)
+            case _:
+                yield scope_types[int(is_zone) << 1 | int(is_up)], timestamp_ms, source_id, proto_no, data, 0
+
+
+def collect_spawns(reader: DumpReader, pno_dir, sq_pack: 'SqPack', actors: net_log_imgui.ActorDefs):
+    """
+    actor names and reserved strings of the whole dump, only spawn records are decoded, returns the reserved strings
+    """
+    rsv_strings = {}
+    for _, _, proto_no, source_id, _, data in reader.parse(pno_dir, spawn_protos):
+        match proto_no:
+            case 'NpcSpawn' | 'NpcSpawn2':
+                data: 'zone_server.NpcSpawn | zone_server.NpcSpawn2'
+                actors.update(source_id, data.create_common.npc_id, net_log_imgui.fmt_name(sq_pack, data.create_common.name_id) or data.create_common.name)
+            case 'ObjectSpawn':
+                data: 'zone_server.ObjectSpawn'
+                actors.update(source_id, data.base_id, sq_pack.sheets.e_obj_name_sheet[data.base_id][0])
+            case 'PlayerSpawn':
+                data: 'zone_server.PlayerSpawn'
+                actors.update(source_id, 0, data.create_common.name)
+            case 'RsvString':
+                rsv_strings[data.key] = data.value
+                sq_pack.exd.rsv_string[data.key] = data.value
+    return rsv_strings
+
+
+_worker_state = None
+
+
+def _init_worker(game_path, actors: net_log_imgui.ActorDefs, rsv_strings: dict):
+    global _worker_state
+    sq_pack = None
+    if game_path is not None:
+        from fpt4.utils.sqpack import SqPack
+        sq_pack = SqPack.get(game_path)
+        sq_pack.exd.rsv_string.update(rsv_strings)
+    _worker_state = sq_pack, actors
+
+
+def _load_range(dump_path, pno_dir, start: int, end: int):
+    # runs in a pool process, messages come back with their data_str so the viewer does not format them again
+    sq_pack, actors = _worker_state
+    res = []
+    with DumpReader(dump_path) as reader:
+        for msg_type, timestamp_ms, source_id, key, data, target_id in iter_messages(reader.parse(pno_dir, start=start, end=end)):
+            data_str = msg_type.format_data(key, source_id, target_id, data, sq_pack, actors.get)
+            res.append((msg_type, timestamp_ms, source_id, key, data, target_id, data_str))
+    return res
+
+
+class DumpLoader:
+    """
+    load a message dump into a NetLogger, actors are collected in a first pass so the records are independent,
+    then ranges of records are decoded and formatted in a process pool and appended in order as they finish
+    """
+
+    def __init__(
+            self, nl: net_log_imgui.NetLogger, actors: net_log_imgui.ActorDefs, sq_pack: 'SqPack | None',
+            game_path, pno_dir, dump_path, workers: int = None, chunk_records=32768,
+    ):
+        self.nl = nl
+        self.actors = actors
+        self.sq_pack = sq_pack
+        self.game_path = game_path
+        self.pno_dir = pno_dir
+        self.dump_path = dump_path
+        if workers is None: workers = cpu_count if (cpu_count := os.cpu_count() or 1) > 1 else 0  # a pool on one cpu only adds pickling
+        self.workers = workers  # 0 to load on the calling thread
+        self.chunk_records = chunk_records
+        self.total = 0
+        self.loaded = 0
+        self.start_time = 0.
+        self.end_time = 0.
+        self.error: Exception | None = None
+
+    @property
+    def rate(self):
+        """
+        records per second
+        """
+        if not self.start_time: return 0.
+        return self.loaded / max((self.end_time or time.perf_counter()) - self.start_time, 1e-6)
+
+    @property
+    def is_done(self):
+        return self.end_time > 0
+
+    def _ranges(self, reader: DumpReader):
+        start = count = 0
+        for segment in reader.segments:
+            if not count: start = segment.offset
+            count += segment.count
+            if count >= self.chunk_records:
+                yield start, segment.end
+                count = 0
+        if count: yield start, reader.segments[-1].end
+
+    def run(self):
+        self.start_time = time.perf_counter()
+        try:
+            self._load()
+        except Exception as e:
+            self.error = e
+            logger.error(f'fail to load {self.dump_path} after {self.loaded} records', exc_info=e)
+        finally:
+            self.end_time = time.perf_counter()
+        if self.error is None:
+            logger.info(f'loaded {self.loaded} records in {self.end_time - self.start_time:.1f}s, {self.rate:.0f} records/s')
+
+    def _load(self):
+        with DumpReader(self.dump_path) as reader:
+            self.total = reader.record_count
+            rsv_strings = collect_spawns(reader, self.pno_dir, self.sq_pack, self.actors)
+            if self.workers:
+                ranges = list(self._ranges(reader))
+                with ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=(self.game_path, self.actors, rsv_strings)) as executor:
+                    futures = [executor.submit(_load_range, self.dump_path, self.pno_dir, s, e) for s, e in ranges]
+                    for future in futures:
+                        messages = future.result()
+                        self.nl.extend(messages)
+                        self.loaded += len(messages)
+            else:
+                for msg in iter_messages(reader.parse(self.pno_dir)):
+                    self.nl.append(*msg)
+                    self.loaded += 1
+
+    def start(self):
+        threading.Thread(target=self.run, name='NetLogDumpLoader', daemon=True).start()
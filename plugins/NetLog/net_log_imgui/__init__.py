@@ -1,39 +1,82 @@
+import array
 import csv
 import datetime
+import functools
 import io
 import re
+import threading
+import time
+import typing
+from collections import OrderedDict
 
 import glfw
 import glm
 import imgui
+import numpy as np
 import nylib.utils.imgui.ctx as imguictx
 from .utils import *
 from .format import *
+from .store import MessageStore, CODEC_BYTES
+from .search import SearchIndex, filter_parts
 
 
 class _IMessage:
-    data_str = '<bytes>'
-    is_select = False
+    kind = -1  # index in message_types
     proto = -1  # 0: chat server, 1: chat client, 2: zone server, 3: zone client
+    key_fmt = '{}'
+    formatter: DataFormatter = None
 
-    def __init__(self, main: 'NetLogger', timestamp_ms: int, source_id: int, key: str | int, data):
+    def __init__(self, main: 'NetLogger', row: int, data=None):
+        store = main.store
         self.main = main
-        self.timestamp_ms = timestamp_ms
-        self.source_id = source_id
-        self.key = str(key)
-        self.data = data
-        self.timestamp_str = datetime.datetime.fromtimestamp(self.timestamp_ms / 1000).strftime('%Y-%m-%d %H:%M:%S:%f')[:-3]
-        self.data_serialized = data if isinstance(data, (bytes, bytearray)) else serialize_data(data)
-        self.source_str = str(self.main.actor_getter(self.source_id))
-        self.byte_size = None
+        self.row = row
+        self.timestamp_ms = int(store.rows['ts'][row])
+        self.source_id = int(store.rows['source'][row])
+        self.target_id = int(store.rows['target'][row])
+        self.proto_key = store.key(row)
+        self.key = self.key_fmt.format(self.proto_key)
+        self.data = store.data(row) if data is None else data
+
+    @property
+    def is_select(self):
+        return self.main.selected[self.row]
+
+    @functools.cached_property
+    def timestamp_str(self):
+        return datetime.datetime.fromtimestamp(self.timestamp_ms / 1000).strftime('%Y-%m-%d %H:%M:%S:%f')[:-3]
+
+    @functools.cached_property
+    def data_serialized(self):
+        return self.data if isinstance(self.data, (bytes, bytearray)) else serialize_data(self.data)
+
+    @functools.cached_property
+    def source_str(self):
+        return str(self.main.actor_getter(self.source_id))
+
+    @classmethod
+    def _fmt(cls, key: str, source_id: int, target_id: int, data, sq_pack, actor_getter):
+        return cls.formatter.fmt(key, source_id, data, sq_pack, actor_getter)
+
+    @classmethod
+    def format_data(cls, key: str | int, source_id: int, target_id: int, data, sq_pack, actor_getter) -> str:
+        """
+        data_str of a message without a logger, so dump loading can format in other processes
+        """
+        if isinstance(data, (bytes, bytearray)): return f'<bytes:{len(data)}>'
+        try:
+            return cls._fmt(str(key), source_id, target_id, data, sq_pack, actor_getter)
+        except KeyError:
+            return fmt_simple(serialize_data(data))
+
+    @functools.cached_property
+    def data_str(self):
+        return self.format_data(self.proto_key, self.source_id, self.target_id, self.data, self.main.sq_pack, self.main.actor_getter)
 
     def match(self, key):
-        self.is_select = (not key or any(key in s for s in self.str_to_match(True)))
-        return self.is_select
+        return not key or any(key in s for s in self.str_to_match(True))
 
     def re_match(self, key: re.Pattern):
-        self.is_select = (not key or any(key.search(s) for s in self.str_to_match(False)))
-        return self.is_select
+        return not key or any(key.search(s) for s in self.str_to_match(False))
 
     def _str_to_match(self, lower=False):
         yield self.timestamp_str
@@ -48,79 +91,50 @@ class _IMessage:
         return f'{self.timestamp_str}/{self.source_str}/{self.key}/{self.data_str}'
 
 
+class ChatServerIpc(_IMessage):
+    kind = 0
+    proto = 0
+    key_fmt = 'ChatServer[{}]'
+    formatter = chat_server_fmt
+
+
+class ChatClientIpc(_IMessage):
+    kind = 1
+    proto = 1
+    key_fmt = 'ChatClient[{}]'
+    formatter = chat_client_fmt
+
+
 class ZoneServerIpc(_IMessage):
+    kind = 2
     proto = 2
-
-    def __init__(self, *args):
-        super().__init__(*args)
-        if isinstance(self.data, (bytes, bytearray)):
-            self.data_str = f'<bytes:{len(self.data)}>'
-        else:
-            try:
-                self.data_str = zone_server_fmt.fmt(self.key, self.source_id, self.data, self.main.sq_pack, self.main.actor_getter)
-            except KeyError:
-                self.data_str = fmt_simple(self.data_serialized)
-        self.key = f'ZoneServer[{self.key}]'
+    key_fmt = 'ZoneServer[{}]'
+    formatter = zone_server_fmt
 
 
 class ZoneClientIpc(_IMessage):
+    kind = 3
     proto = 3
-
-    def __init__(self, *args):
-        super().__init__(*args)
-        if isinstance(self.data, (bytes, bytearray)):
-            self.data_str = f'<bytes:{len(self.data)}>'
-        else:
-            try:
-                self.data_str = zone_client_fmt.fmt(self.key, self.source_id, self.data, self.main.sq_pack, self.main.actor_getter)
-            except KeyError:
-                self.data_str = fmt_simple(self.data_serialized)
-        self.key = f'ZoneClient[{self.key}]'
+    key_fmt = 'ZoneClient[{}]'
+    formatter = zone_client_fmt
 
 
 class ActorControlIpc(_IMessage):
+    kind = 4
     proto = 2
+    key_fmt = 'ActorControl[{}]'
+    formatter = actor_control_fmt
 
-    def __init__(self, *args, target_id: int = 0):
-        super().__init__(*args)
-        if isinstance(self.data, tuple):
-            self.data_str = fmt_simple(self.data_serialized)
-        else:
-            try:
-                self.data_str = actor_control_fmt.fmt(self.key, self.source_id, self.data, self.main.sq_pack, self.main.actor_getter, target_id)
-            except KeyError:
-                self.data_str = fmt_simple(self.data_serialized)
-        self.key = f'ActorControl[{self.key}]'
-
+    @classmethod
+    def _fmt(cls, key: str, source_id: int, target_id: int, data, sq_pack, actor_getter):
+        if isinstance(data, tuple): return fmt_simple(serialize_data(data))
+        return cls.formatter.fmt(key, source_id, data, sq_pack, actor_getter, target_id)
 
-class ChatServerIpc(_IMessage):
-    proto = 0
 
-    def __init__(self, *args):
-        super().__init__(*args)
-        if isinstance(self.data, (bytes, bytearray)):
-            self.data_str = f'<bytes:{len(self.data)}>'
-        else:
-            try:
-                self.data_str = chat_server_fmt.fmt(self.key, self.source_id, self.data, self.main.sq_pack, self.main.actor_getter)
-            except KeyError:
-                self.data_str = fmt_simple(self.data_serialized)
-        self.key = f'ChatServer[{self.key}]'
-
-
-class ChatClientIpc(_IMessage):
-    proto = 1
-
-    def __init__(self, *args):
-        super().__init__(*args)
-        if isinstance(self.data, (bytes, bytearray)):
-            self.data_str = f'<bytes:{len(self.data)}>'
-        else:
-            try:
-                self.data_str = chat_client_fmt.fmt(self.key, self.source_id, self.data, self.main.sq_pack, self.main.actor_getter)
-            except KeyError:
-                self.data_str = fmt_simple(self.data_serialized)
-        self.key = f'ChatClient[{self.key}]'
+message_types = ChatServerIpc, ChatClientIpc, ZoneServerIpc, ZoneClientIpc, ActorControlIpc
+MESSAGE_CACHE = 2048  # formatted messages kept for rendering
+SEARCH_CHUNK = 4096  # rows the worker matches between checks of the filter
+INDEX_CHUNK = 256  # rows the worker formats and indexes before it lets the render thread take the GIL
 
 
 text_selected = imguictx.CtxGroup(
@@ -191,20 +205,26 @@ def imgui_window_max_line():
 
 
 class NetLogger:
-    display_data: list
-    data: list
+    display_data: array.array  # rows of the store
 
-    def __init__(self, sq_pack, actor_getter):
+    def __init__(self, sq_pack, actor_getter, max_memory: int = 256 << 20, spill_dir=None):
         self.sq_pack = sq_pack
         self.actor_getter = actor_getter
 
-        self.data = []
-        self.display_data = []
+        self.store = MessageStore(max_memory, spill_dir)
+        self.index = SearchIndex(self.store)
+        self.selected = bytearray()  # filter result of every row
+        self.display_data = array.array('q')
+        self._messages = OrderedDict()
         self.filter = ''
         self.filter_reverse = False
         self.filter_use_regex = False
         self._filter = ''
         self._filter_use_regex = False
+        self._matcher = None
+        self._generation = 0  # changes with the filter, results of an older search are dropped
+        self._checked = 0  # rows before are final for the filter, later rows are still to be indexed and matched
+        self._filter_lock = threading.RLock()
         self._only_show_filtered = False
         self._only_show_defined = True
         self._lock_bottom = True
@@ -219,35 +239,118 @@ class NetLogger:
         self.table_widths = [0, 0, 0, 0]
         self.render_frame_cnt = 0
 
-    def _is_display_data(self, data):
-        return (not self._only_show_filtered or (data.is_select != self.filter_reverse)) and not (self._only_show_defined and isinstance(data.data, (bytes, bytearray)))
+        self._search_left = 0  # candidates still to be verified, -1 until they are looked up
+        self._closed = False
+        self._wake = threading.Event()
+        self._worker = threading.Thread(target=self._run_worker, name='NetLogSearch', daemon=True)
+        self._worker.start()
+
+    def _new_message(self, row: int, data=None) -> _IMessage:
+        return message_types[self.store.rows['kind'][row]](self, row, data)
+
+    def message(self, row: int) -> _IMessage:
+        if (msg := self._messages.get(row)) is not None:
+            self._messages.move_to_end(row)
+            return msg
+        msg = self._messages[row] = self._new_message(row)
+        if len(self._messages) > MESSAGE_CACHE: self._messages.popitem(False)
+        return msg
+
+    @property
+    def _is_display_pending(self):
+        # rows shown by the filter result are added by the worker once matched
+        return self._only_show_filtered and self._matcher is not None
+
+    def _is_display_data(self, row: int):
+        return (not self._only_show_filtered or (self.selected[row] != self.filter_reverse)) and not (self._only_show_defined and self.store.rows['codec'][row] == CODEC_BYTES)
 
     def _update_display_data(self, display_change=True):
-        if display_change:
-            self.display_idx = 0
-            self.select_idx = -1
-        self.display_data = [d for d in self.data if self._is_display_data(d)]
+        with self._filter_lock:
+            if display_change:
+                self.display_idx = 0
+                self.select_idx = -1
+            count = min(len(self.store), len(self.selected))
+            if self._is_display_pending: count = min(count, self._checked)
+            mask = np.ones(count, bool)
+            if self._only_show_filtered: mask &= np.frombuffer(self.selected[:count], bool) != self.filter_reverse
+            if self._only_show_defined: mask &= self.store.column('codec')[:count] != CODEC_BYTES
+            self.display_data = array.array('q', np.flatnonzero(mask).astype(np.int64).tobytes())
 
     def apply_filter(self):
+        """
+        matching runs in the worker, candidates from the index are verified in chunks and shown as they are found
+        """
         if self.filter == self._filter and self.filter_use_regex == self._filter_use_regex: return
         self._filter = self.filter
         self._filter_use_regex = self.filter_use_regex
 
-        if self.filter_use_regex:
-            if self._filter:
-                try:
-                    regex = re.compile(self._filter)
-                except re.error:
-                    self._update_display_data(False)
-                    return
-            else:
-                regex = None
-            for d in self.data: d.re_match(regex)
+        if self.filter_use_regex and self._filter:
+            try:
+                matcher = re.compile(self._filter)
+            except re.error:
+                self._update_display_data(False)
+                return
         else:
-            lower = self._filter.lower()
-            for d in self.data: d.match(lower)
-
-        self._update_display_data(False)
+            matcher = self._filter.lower() or None
+
+        with self._filter_lock:
+            self._matcher = matcher
+            self._generation += 1
+            self._checked = 0
+            self._search_left = -1 if matcher else 0
+            self.selected[:] = (b'\0' if matcher else b'\1') * len(self.selected)
+            self._update_display_data(False)
+        self._wake.set()
+
+    def _select(self, generation: int, hits: list[int], checked: int = None):
+        with self._filter_lock:
+            if generation != self._generation: return
+            for row in hits: self.selected[row] = 1
+            if checked is None:
+                if self._is_display_pending: self._update_display_data(False)
+            else:
+                if self._is_display_pending:
+                    self.display_data.extend(row for row in range(self._checked, checked) if self._is_display_data(row))
+                self._checked = checked
+
+    def _source_text(self, source_id: int):
+        return str(self.actor_getter(source_id))
+
+    def _run_worker(self):
+        generation, matcher, pending, exact = -1, None, None, False
+        while not self._closed:
+            if generation != self._generation:
+                with self._filter_lock:
+                    generation, matcher = self._generation, self._matcher
+                    self._checked = self.index.indexed
+                    if self._is_display_pending: self._update_display_data(False)
+                pending = None
+                if matcher is not None:
+                    parts = filter_parts(matcher)
+                    # a substring of a single word is in every text having it in one of its tokens, so the candidates are the result
+                    exact = parts == [matcher]
+                    pending = self.index.candidates(parts, self._source_text)
+                    self._search_left = len(pending)
+            if pending is not None and len(pending):
+                chunk, pending = pending[:SEARCH_CHUNK], pending[SEARCH_CHUNK:]
+                hits = chunk.tolist() if exact else self.index.match(chunk, matcher, self._source_text)
+                self._search_left = len(pending)
+                self._select(generation, hits)
+            elif matcher is not None and (start := self.index.indexed) < (count := len(self.selected)):  # rows are complete once selected has them
+                # rows are formatted and indexed once a filter needs them, data_str given on append is already the text
+                for row, data_str in self.store.iter_texts(np.arange(start, stop := min(start + INDEX_CHUNK, count))):
+                    if data_str is None:
+                        msg = self._new_message(row)
+                        key, data_str = msg.key, msg.data_str
+                        self.store.set_text(row, data_str)
+                    else:
+                        key = message_types[self.store.rows['kind'][row]].key_fmt.format(self.store.key(row))
+                    self.index.add(row, key, data_str)
+                self._select(generation, self.index.match(np.arange(start, stop), matcher, self._source_text), stop)
+                time.sleep(0)  # formatting holds the GIL, give it to the render thread between chunks
+            else:
+                self._wake.wait()
+                self._wake.clear()
 
     @property
     def only_show_filtered(self):
@@ -267,27 +370,48 @@ class NetLogger:
         self._only_show_defined = value
         self._update_display_data()
 
-    def append_data(self, data: _IMessage):
-        self.data.append(data)
-
-        if self.filter_use_regex:
-            if self._filter:
-                try:
-                    regex = re.compile(self._filter)
-                except re.error:
-                    self._update_display_data(False)
-                    return
-            else:
-                regex = None
-            data.re_match(regex)
-        else:
-            data.match(self._filter.lower())
+    def append(self, msg_type: type[_IMessage], timestamp_ms: int, source_id: int, key: str | int, data, target_id: int = 0, data_str: str = None):
+        """
+        store a message, it is formatted when rendered, and formatted for the index by the worker unless data_str is given
+        """
+        row = self.store.append(msg_type.kind, timestamp_ms, source_id, key, data, target_id)
+        if data_str is not None: self.store.set_text(row, data_str)
+        with self._filter_lock:
+            self.selected.append(self._matcher is None)
+            if not self._is_display_pending and self._is_display_data(row):
+                self.display_data.append(row)
+        self._wake.set()
+        if self._lock_bottom:
+            self.go_bottom()
 
-        if self._is_display_data(data):
-            self.display_data.append(data)
+    def extend(self, messages: typing.Iterable[tuple]):
+        """
+        append many (msg_type, timestamp_ms, source_id, key, data, target_id, data_str) from one thread, the worker is woken once
+        """
+        rows = []
+        for msg_type, timestamp_ms, source_id, key, data, target_id, data_str in messages:
+            row = self.store.append(msg_type.kind, timestamp_ms, source_id, key, data, target_id)
+            if data_str is not None: self.store.set_text(row, data_str)
+            rows.append(row)
+        with self._filter_lock:
+            self.selected.extend(bytes([self._matcher is None]) * len(rows))
+            if not self._is_display_pending:
+                self.display_data.extend(row for row in rows if self._is_display_data(row))
+        self._wake.set()
         if self._lock_bottom:
             self.go_bottom()
 
+    @property
+    def is_filtering(self):
+        return self._matcher is not None and (self._search_left != 0 or self._checked < len(self.store))
+
+    def close(self):
+        self._closed = True
+        self._wake.set()
+        self._worker.join()
+        self._messages.clear()
+        self.store.close()
+
     @property
     def display_percent(self):
         return min(self.display_idx / self.max_idx, 1) if self.max_idx else 0
@@ -310,11 +434,12 @@ class NetLogger:
 
     def render_datas(self):
         start_x, start_y = imgui.get_cursor_screen_pos()
-        display_len = len(self.display_data)
+        display_data = self.display_data  # the worker replaces it while filtering
+        display_len = len(display_data)
         if (sw := sum(self.table_widths) + 300) < imgui.get_window_width(): sw = 0
         with imguictx.Child('##outter_datas', 0, 0, False, imgui.WINDOW_HORIZONTAL_SCROLLING_BAR), imguictx.Child('##inner_datas', sw, 0, False):
             max_line_ = max_line = imgui_window_max_line()
-            self.max_idx = max(len(self.display_data) - max_line - 1, 0)
+            self.max_idx = max(display_len - max_line - 1, 0)
 
             io = imgui.get_io()
             wheel_delta = int(io.mouse_wheel)
@@ -347,7 +472,7 @@ class NetLogger:
             imgui.separator()
             table_widths = [0, 0, 0, 0]
             while idx < display_len and max_line > 0:
-                data: _IMessage = self.display_data[idx]
+                data = self.message(display_data[idx])
                 style = text_selected if self._filter and (data.is_select != self.filter_reverse) else text_unselected
                 changed, var = imgui.checkbox(f'##select[{idx}]', self.select_idx == idx)
                 if changed: self.select_idx = idx if var else -1
@@ -434,13 +559,15 @@ class NetLogger:
             changed, self.filter = imgui.input_text('##filter_text', self.filter, 256)
         if changed:
             self.apply_filter()
+        if self.is_filtering:
+            imgui.text('searching...')
         if self.filter:
             btn_width = imgui.get_window_width() / 2 - imgui.get_style().window_padding.x
             if imgui.button('<-', btn_width, 0):
-                self.display_idx = next((i for i in range(self.display_idx - 1, -1, -1) if self.display_data[i].is_select), self.display_idx)
+                self.display_idx = next((i for i in range(self.display_idx - 1, -1, -1) if self.selected[self.display_data[i]]), self.display_idx)
             imgui.same_line()
             if imgui.button('->', btn_width, 0):
-                self.display_idx = next((i for i in range(self.display_idx + 1, len(self.display_data)) if self.display_data[i].is_select), self.display_idx)
+                self.display_idx = next((i for i in range(self.display_idx + 1, len(self.display_data)) if self.selected[self.display_data[i]]), self.display_idx)
 
         imgui.text('as text: ')
         imgui.same_line()
@@ -453,17 +580,18 @@ class NetLogger:
 
     def dump_text(self, sep='\t'):
         writer = csv.writer(buf := io.StringIO(), delimiter=sep)
-        for row in self.display_data:
-            writer.writerow([row.timestamp_str, row.source_str, row.key, row.data_str])
+        for row, data in self.store.iter_data(self.display_data):
+            msg = message_types[self.store.rows['kind'][row]](self, row, data)
+            writer.writerow([msg.timestamp_str, msg.source_str, msg.key, msg.data_str])
         return buf.getvalue()
 
     def render_detail(self):
         if imgui.button('copy', -1):
             import pprint
-            s = pprint.pformat(self.display_data[self.select_idx].data_serialized, sort_dicts=False, )
+            s = pprint.pformat(self.message(self.display_data[self.select_idx]).data_serialized, sort_dicts=False, )
             glfw.set_clipboard_string(None, s)
         if self.select_idx < len(self.display_data):
-            imgui_render_data(self.display_data[self.select_idx].data_serialized)
+            imgui_render_data(self.message(self.display_data[self.select_idx]).data_serialized)
 
     def render_text(self):
         imgui.input_text_multiline('##text', self._shown_text, -1, -1, imgui.INPUT_TEXT_READ_ONLY)
@@ -0,0 +1,118 @@
+import datetime
+import re
+import re._constants as sre_constants
+import re._parser as sre_parse
+import sys
+import typing
+from array import array
+
+import numpy as np
+
+from .store import MessageStore
+from .utils import datetime_str
+
+TOKEN_RE = re.compile(r'\w+')
+REGEX_PART_MIN = 3  # shorter literals of a pattern are in too many tokens to narrow the rows, a pattern without longer ones scans
+POSTING_SIZE = 96  # memory of a new token and its posting array, counted toward the store memory
+
+
+def filter_parts(matcher: str | re.Pattern) -> list[str]:
+    """
+    lower case word runs every text matched by the filter contains, a substring filter is already lower case,
+    only the runs of a pattern long enough to narrow the rows are given
+    """
+    if not isinstance(matcher, re.Pattern): return TOKEN_RE.findall(matcher)
+    try:
+        parsed = sre_parse.parse(matcher.pattern, matcher.flags)
+    except Exception:
+        return []
+    # only literals of the top level sequence are required, anything else ends a run
+    runs, run = [], []
+    for op, av in parsed:
+        if op is sre_constants.LITERAL:
+            run.append(chr(av))
+        elif run:
+            runs.append(''.join(run))
+            run = []
+    if run: runs.append(''.join(run))
+    return [part for r in runs for part in TOKEN_RE.findall(r.lower()) if len(part) >= REGEX_PART_MIN]
+
+
+class SearchIndex:
+    """
+    inverted index from the word tokens of formatted data to rows, rows are added in order by the worker of NetLogger,
+    keys, sources and timestamps are matched through the store columns instead,
+    the formatted data is kept as the text of the row in the store, so candidates are verified without formatting them again,
+    the postings count toward the memory of the store
+    """
+
+    def __init__(self, store: MessageStore):
+        self.store = store
+        self.indexed = 0
+        self.postings: dict[str, array] = {}
+        self.key_texts: dict[int, str] = {}  # kind << 32 | key id to the key shown
+        self.sources: set[int] = set()
+        self.seconds: dict[int, str] = {}
+
+    def add(self, row: int, key: str, data_str: str):
+        tokens = set(TOKEN_RE.findall(data_str.lower()))
+        size = len(tokens) * 4
+        for token in tokens:
+            if (rows := self.postings.get(token)) is None:
+                rows = self.postings[token] = array('I')
+                size += sys.getsizeof(token) + POSTING_SIZE
+            rows.append(row)
+        self.store.add_memory(size)
+        store_row = self.store.rows[row]
+        if (code := int(store_row['kind']) << 32 | int(store_row['key'])) not in self.key_texts:
+            self.key_texts[code] = key
+        self.sources.add(int(store_row['source']))
+        if (second := int(store_row['ts']) // 1000) not in self.seconds:
+            self.seconds[second] = datetime.datetime.fromtimestamp(second).strftime(datetime_str)
+        self.indexed = row + 1
+
+    def _part_mask(self, part: str, stop: int, source_text: typing.Callable[[int], str]):
+        mask = np.zeros(stop, bool)
+        if rows := [np.frombuffer(p, np.uint32) for token, p in self.postings.items() if part in token]:
+            mask[np.concatenate(rows)] = True
+        del rows  # views keep the posting arrays from growing
+        if codes := [code for code, text in self.key_texts.items() if part in text.lower()]:
+            mask |= np.isin(self.store.column('kind')[:stop].astype(np.int64) << 32 | self.store.column('key')[:stop], codes)
+        # actor names can change, so sources are matched by their current text
+        if sources := [s for s in self.sources if part in source_text(s).lower()]:
+            mask |= np.isin(self.store.column('source')[:stop], sources)
+        if part.isdigit():
+            ts = self.store.column('ts')[:stop]
+            if seconds := [s for s, text in self.seconds.items() if part in text]:
+                mask |= np.isin(ts // 1000, seconds)
+            if ms := [m for m in range(1000) if part in f'{m:03d}']:
+                mask |= np.isin(ts % 1000, ms)
+        return mask
+
+    def candidates(self, parts: list[str], source_text: typing.Callable[[int], str]) -> np.ndarray:
+        """
+        indexed rows with every part in their text, a superset of the rows matched that is still to be verified,
+        every indexed row without parts
+        """
+        stop = self.indexed
+        mask = np.ones(stop, bool)
+        for part in set(parts):
+            mask &= self._part_mask(part, stop, source_text)
+        return np.flatnonzero(mask)
+
+    def match(self, rows: np.ndarray, matcher: str | re.Pattern, source_text: typing.Callable[[int], str]) -> list[int]:
+        """
+        indexed rows matched by a lower case substring or a pattern, on the same text as _IMessage.str_to_match
+        """
+        store_rows = self.store.rows[rows]
+        sources = store_rows['source'].tolist()
+        source_texts = {s: source_text(s) for s in set(sources)}
+        hits = []
+        for (row, data_str), ts, code, source in zip(
+                self.store.iter_texts(rows), store_rows['ts'].tolist(),
+                (store_rows['kind'].astype(np.int64) << 32 | store_rows['key']).tolist(), sources,
+        ):
+            text = f'{self.seconds[ts // 1000]}:{ts % 1000:03d}\t{source_texts[source]}\t{self.key_texts[code]}\t{data_str}'
+            if matcher.search(text) if isinstance(matcher, re.Pattern) else matcher in text.lower():
+                hits.append(row)
+        return hits
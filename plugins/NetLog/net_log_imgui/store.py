@@ -0,0 +1,191 @@
+import ctypes
+import pickle
+import sys
+import tempfile
+import threading
+import typing
+from collections import OrderedDict
+
+import numpy as np
+
+# how a message is kept: raw bytes, bytes of a ctypes struct with its type, a pickle, or the object itself when it can't be pickled
+CODEC_BYTES, CODEC_CTYPES, CODEC_PICKLE, CODEC_OBJECT = range(4)
+ROW_DTYPE = np.dtype([
+    ('ts', '<i8'), ('kind', 'u1'), ('codec', 'u1'), ('key', '<i4'), ('type', '<i4'),
+    ('source', '<u4'), ('target', '<u4'), ('segment', '<i4'), ('offset', '<u4'), ('size', '<u4'),
+    ('text_segment', '<i4'), ('text_offset', '<u4'), ('text_size', '<u4'),  # formatted data, text_segment is -1 until set
+])
+SEGMENT_SIZE = 1 << 20  # bytes of message data per segment, segments are spilled as a whole
+READ_CACHE = 4  # spilled segments read back as a whole that are kept for the next reads
+
+
+class MessageStore:
+    """
+    messages in columns, the data of every message is packed into segments of bytes,
+    oldest segments are written to a temp file once the data in memory is over max_memory, and read back on access,
+    a single row only by its bytes, a run of rows by the whole segment which is kept in a small lru,
+    the formatted text of a row is packed the same way once set,
+    the rows, the objects that can't be packed and the memory added by add_memory count toward max_memory but stay in memory
+    """
+
+    def __init__(self, max_memory: int = 256 << 20, spill_dir=None):
+        self.max_memory = max_memory
+        self.spill_dir = spill_dir
+        self.rows = np.empty(1024, ROW_DTYPE)
+        self.count = 0
+        self.keys: list[str | int] = []
+        self._key_ids: dict[str | int, int] = {}
+        self.types: list[type] = []
+        self._type_ids: dict[type, int] = {}
+        self.objects: dict[int, typing.Any] = {}
+        self.segments: list[bytearray | None] = [bytearray()]
+        self.spilled: dict[int, tuple[int, int]] = {}  # segment to offset and size in the spill file
+        self.memory_size = self.rows.nbytes
+        self.spill_size = 0
+        self._spill_file = None
+        self._spill_from = 0  # first segment not spilled yet
+        self._read_cache: OrderedDict[int, bytes] = OrderedDict()  # spilled segments read back, READ_CACHE at most
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self.count
+
+    def _intern(self, values: list, ids: dict, v):
+        if (i := ids.get(v)) is None:
+            i = ids[v] = len(values)
+            values.append(v)
+        return i
+
+    def _encode(self, data):
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return CODEC_BYTES, -1, bytes(data)
+        if isinstance(data, (ctypes.Structure, ctypes.Union, ctypes.Array)):
+            return CODEC_CTYPES, self._intern(self.types, self._type_ids, type(data)), bytes(data)
+        try:
+            return CODEC_PICKLE, -1, pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return CODEC_OBJECT, -1, b''
+
+    def append(self, kind: int, timestamp_ms: int, source_id: int, key: str | int, data, target_id: int = 0) -> int:
+        codec, type_id, raw = self._encode(data)
+        with self._lock:
+            if (i := self.count) == len(self.rows):
+                rows = np.empty(len(self.rows) * 2, ROW_DTYPE)
+                rows[:i] = self.rows[:i]
+                self.memory_size += rows.nbytes - self.rows.nbytes
+                self.rows = rows
+            if codec == CODEC_OBJECT:
+                self.objects[i] = data
+                self.memory_size += sys.getsizeof(data)  # shallow, the objects are whatever could not be pickled
+            self.rows[i] = (
+                timestamp_ms, kind, codec, self._intern(self.keys, self._key_ids, key), type_id,
+                source_id & 0xFFFFFFFF, target_id & 0xFFFFFFFF, *self._put(raw), len(raw), -1, 0, 0,
+            )
+            if self.memory_size > self.max_memory: self._spill()
+            self.count = i + 1
+        return i
+
+    def _put(self, raw: bytes):
+        segment_id = len(self.segments) - 1
+        segment = self.segments[segment_id]
+        offset = len(segment)
+        segment += raw
+        self.memory_size += len(raw)
+        if len(segment) >= SEGMENT_SIZE: self.segments.append(bytearray())
+        return segment_id, offset
+
+    def set_text(self, i: int, text: str):
+        raw = text.encode()
+        with self._lock:
+            segment_id, offset = self._put(raw)
+            row = self.rows[i]
+            row['text_segment'], row['text_offset'], row['text_size'] = segment_id, offset, len(raw)
+            if self.memory_size > self.max_memory: self._spill()
+
+    def add_memory(self, size: int):
+        with self._lock:
+            self.memory_size += size
+            if self.memory_size > self.max_memory: self._spill()
+
+    def _spill(self):
+        while self.memory_size > self.max_memory and self._spill_from < len(self.segments) - 1:
+            if (f := self._spill_file) is None:
+                f = self._spill_file = tempfile.TemporaryFile(prefix='net_log_', dir=self.spill_dir)
+            segment = self.segments[self._spill_from]
+            f.seek(0, 2)
+            self.spilled[self._spill_from] = f.tell(), len(segment)
+            f.write(segment)
+            self.segments[self._spill_from] = None
+            self.memory_size -= len(segment)
+            self.spill_size += len(segment)
+            self._spill_from += 1
+
+    def _read(self, offset: int, size: int):
+        self._spill_file.seek(offset)
+        return self._spill_file.read(size)
+
+    def _segment(self, segment_id: int):
+        if (segment := self.segments[segment_id]) is not None: return segment
+        if (segment := self._read_cache.get(segment_id)) is not None:
+            self._read_cache.move_to_end(segment_id)
+            return segment
+        segment = self._read_cache[segment_id] = self._read(*self.spilled[segment_id])
+        if len(self._read_cache) > READ_CACHE: self._read_cache.popitem(False)
+        return segment
+
+    def _decode(self, i: int, row, raw):
+        codec = row['codec']
+        if codec == CODEC_OBJECT: return self.objects[i]
+        if codec == CODEC_CTYPES: return self.types[row['type']].from_buffer_copy(raw)
+        if codec == CODEC_PICKLE: return pickle.loads(raw)
+        return bytes(raw)
+
+    def column(self, name: str) -> np.ndarray:
+        return self.rows[name][:self.count]
+
+    def key(self, i: int) -> str | int:
+        return self.keys[self.rows['key'][i]]
+
+    def data(self, i: int):
+        row = self.rows[i]
+        offset, size = int(row['offset']), int(row['size'])
+        with self._lock:
+            if (segment_id := int(row['segment'])) in self.spilled and segment_id not in self._read_cache:
+                return self._decode(i, row, self._read(self.spilled[segment_id][0] + offset, size))
+            return self._decode(i, row, self._segment(segment_id)[offset:offset + size])
+
+    def iter_data(self, indexes: typing.Iterable[int] = None):
+        """
+        (index, data) of the given rows or of every row, a spilled segment is read once for all its rows in a run
+        """
+        if indexes is None: indexes = range(self.count)
+        segment_id, segment = -1, None
+        for i in indexes:
+            row = self.rows[i]
+            if row['segment'] != segment_id:
+                segment_id = row['segment']
+                with self._lock:
+                    segment = self._segment(segment_id)
+            yield i, self._decode(i, row, segment[row['offset']:row['offset'] + row['size']])
+
+    def iter_texts(self, indexes: np.ndarray):
+        """
+        (index, text) of the given rows, None for a row without a text, a spilled segment is read once for all its texts in a run
+        """
+        rows = self.rows[indexes]
+        segment_id, segment = -1, None
+        for i, text_segment, offset, size in zip(indexes.tolist(), *(rows[n].tolist() for n in ('text_segment', 'text_offset', 'text_size'))):
+            if text_segment < 0:
+                yield i, None
+                continue
+            if text_segment != segment_id:
+                segment_id = text_segment
+                with self._lock:
+                    segment = self._segment(segment_id)
+            yield i, segment[offset:offset + size].decode()
+
+    def close(self):
+        with self._lock:
+            if self._spill_file is not None:
+                self._spill_file.close()
+                self._spill_file = None
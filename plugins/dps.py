@@ -1,7 +1,9 @@
 import enum
+import threading
 import time
 
 import imgui
+import numpy as np
 
 from nylib.utils.imgui.window_mgr import Window
 
@@ -22,228 +24,254 @@ def is_valid_id(actor_id):
     return actor_id != 0 and actor_id != 0xe0000000
 
 
-class Data:
-    def __init__(self):
-        self.taken_damage = 0
-        self.cause_damage = 0
-        self.cause_damage_count = 0
-        self.cause_damage_critical = 0
-        self.cause_damage_direct = 0
-        self.taken_heal = 0
-        self.cause_heal = 0
-        self.cause_heal_count = 0
-        self.cause_heal_critical = 0
+# per actor columns of Monitor.totals
+(
+    TAKEN_DAMAGE, CAUSE_DAMAGE, CAUSE_DAMAGE_COUNT, CAUSE_DAMAGE_CRITICAL, CAUSE_DAMAGE_DIRECT,
+    TAKEN_HEAL, CAUSE_HEAL, CAUSE_HEAL_COUNT, CAUSE_HEAL_CRITICAL, DEATH_COUNT,
+) = range(COLUMN_COUNT := 10)
+EVENT_DTYPE = np.dtype([('ts', '<f8'), ('source', '<i4'), ('target', '<i4'), ('value', '<i8'), ('flag', 'u1')])
+EVENT_HEAL, EVENT_STATUS, EVENT_CRITICAL, EVENT_DIRECT = 1, 2, 4, 8
+ZERO_ROW = (0,) * COLUMN_COUNT
+ARRAY_TARGET_COUNT = 24  # target slots of an ActionEffect from which numpy arrays are cheaper than the ctypes walk
+
+
+def _flag_columns():
+    # what an event adds to its source (0) and its target (1) for every flag, times the value or once
+    value, count = (np.zeros((16, 2, COLUMN_COUNT), np.int64) for _ in range(2))
+    for flag in range(16):
+        hit = not flag & EVENT_STATUS
+        if flag & EVENT_HEAL:
+            value[flag, 0, CAUSE_HEAL] = value[flag, 1, TAKEN_HEAL] = 1
+            count[flag, 0, CAUSE_HEAL_COUNT] = hit
+            count[flag, 0, CAUSE_HEAL_CRITICAL] = hit and bool(flag & EVENT_CRITICAL)
+        else:
+            value[flag, 0, CAUSE_DAMAGE] = value[flag, 1, TAKEN_DAMAGE] = 1
+            count[flag, 0, CAUSE_DAMAGE_COUNT] = hit
+            count[flag, 0, CAUSE_DAMAGE_CRITICAL] = hit and bool(flag & EVENT_CRITICAL)
+            count[flag, 0, CAUSE_DAMAGE_DIRECT] = hit and bool(flag & EVENT_DIRECT)
+    return value, count
 
 
-class Actor:
-    def __init__(self, actor_id):
-        self.actor_id = actor_id
-        self.data = Data()
-        self.data_in_window = Data()
-        self.death_count = 0
+FLAG_VALUE, FLAG_COUNT = _flag_columns()
 
 
 class Monitor:
+    """
+    events are staged in a list, then moved into a ring buffer and folded into per actor sums by slot when read,
+    the sums in the window are the totals minus the sums of the events that fell out of it
+    """
     window_sec = 60
-    damage_event = 1
-    heal_event = 2
-    actors: dict[int, Actor]
+    update_interval = .1  # seconds between two folds on read
+    max_pending = 1024
+    actors: dict[int, int]  # actor id to slot, in the order of the slots
 
-    def __init__(self, territory_id=0):
+    def __init__(self, territory_id=0, capacity=4096):
         self.territory_id = territory_id
         self.actors = {}
-        self.events = []
+        self.totals = np.zeros((64, COLUMN_COUNT), np.int64)
+        self.expired = np.zeros((64, COLUMN_COUNT), np.int64)
+        self.pending = []
+        self.events = np.empty(capacity, EVENT_DTYPE)
+        self.head = 0  # sequence of the next event in the ring, events are at sequence % capacity
+        self.tail = 0  # first event still in the window, events before can be overwritten
         self.start_at = 0
+        self.last_event_at = 0
         self.pet_cache = {}
-
-    @property
-    def last_event_at(self):
-        if not self.events: return 0
-        return self.events[-1][0]
-
-    def get_actor(self, actor_id):
-        if not is_valid_id(actor_id): return None
-        if actor_id not in self.actors:
-            self.actors[actor_id] = Actor(actor_id)
-        return self.actors[actor_id]
+        self.pet_slots = []  # slot of the owner and slot of the pet
+        self._pet_index = 0, None, None, None
+        self._views = None  # rows of the actors read since the last update, dropped on update
+        self._version = 0  # changes with the sums
+        self._update_at = 0
+        self._lock = threading.Lock()  # events come from the sniffer and are read by the gui
+
+    def get_slot(self, actor_id):
+        if not is_valid_id(actor_id): return -1
+        if (slot := self.actors.get(actor_id)) is None:
+            if (slot := len(self.actors)) == len(self.totals):  # grown before the slot is seen by readers
+                with self._lock:
+                    self.totals = np.concatenate((self.totals, np.zeros_like(self.totals)))
+                    self.expired = np.concatenate((self.expired, np.zeros_like(self.expired)))
+            self.actors[actor_id] = slot
+        return slot
+
+    def add_pet(self, owner_id, pet_id):
+        if is_valid_id(pet_id) and is_valid_id(owner_id):
+            if pet_id not in (pets := self.pet_cache.setdefault(owner_id, set())):
+                # the owner gets the columns of its pets without events of its own
+                self.pet_slots.append((self.get_slot(owner_id), self.get_slot(pet_id)))
+                pets.add(pet_id)
 
     def on_damage(self, time_stamp, source, target, value, is_status=False, is_critical=False, is_direct=False, owner_id=0):
-        if is_valid_id(source):
-            if is_valid_id(owner_id):
-                self.pet_cache.setdefault(owner_id, set()).add(source)
-            source_actor = self.get_actor(source)
-            source_actor.data.cause_damage += value
-            source_actor.data_in_window.cause_damage += value
-            if not is_status:
-                source_actor.data.cause_damage_count += 1
-                source_actor.data_in_window.cause_damage_count += 1
-                if is_critical:
-                    source_actor.data.cause_damage_critical += 1
-                    source_actor.data_in_window.cause_damage_critical += 1
-                if is_direct:
-                    source_actor.data.cause_damage_direct += 1
-                    source_actor.data_in_window.cause_damage_direct += 1
-        if is_valid_id(target):
-            target_actor = self.get_actor(target)
-            target_actor.data.taken_damage += value
-            target_actor.data_in_window.taken_damage += value
-        self.events.append((time_stamp, self.damage_event, (source, target, value, is_status, is_critical, is_direct)))
+        if owner_id: self.add_pet(owner_id, source)
+        self.pending.append((time_stamp, self.get_slot(source), self.get_slot(target), value, is_status << 1 | is_critical << 2 | is_direct << 3))
+        self.last_event_at = time_stamp
         if not self.start_at: self.start_at = time_stamp
-        self.dequeue_events(time_stamp - self.window_sec)
+        if len(self.pending) >= self.max_pending: self.update()
 
     def on_heal(self, time_stamp, source, target, value, is_status=False, is_critical=False, owner_id=0):
-        if is_valid_id(source):
-            if is_valid_id(owner_id):
-                self.pet_cache.setdefault(owner_id, set()).add(source)
-            source_actor = self.get_actor(source)
-            source_actor.data.cause_heal += value
-            source_actor.data_in_window.cause_heal += value
-            if not is_status:
-                source_actor.data.cause_heal_count += 1
-                source_actor.data_in_window.cause_heal_count += 1
-                if is_critical:
-                    source_actor.data.cause_heal_critical += 1
-                    source_actor.data_in_window.cause_heal_critical += 1
-        if is_valid_id(target):
-            target_actor = self.get_actor(target)
-            target_actor.data.taken_heal += value
-            target_actor.data_in_window.taken_heal += value
-        self.events.append((time_stamp, self.heal_event, (source, target, value, is_status, is_critical)))
+        if owner_id: self.add_pet(owner_id, source)
+        self.pending.append((time_stamp, self.get_slot(source), self.get_slot(target), value, EVENT_HEAL | is_status << 1 | is_critical << 2))
+        self.last_event_at = time_stamp
         if not self.start_at: self.start_at = time_stamp
-        self.dequeue_events(time_stamp - self.window_sec)
+        if len(self.pending) >= self.max_pending: self.update()
+
+    def on_events(self, time_stamp, source, targets: np.ndarray, values: np.ndarray, flags: np.ndarray, owner_id=0):
+        """
+        events of a source at once like the effects of an action, flags are EVENT_* bits
+        """
+        if not len(targets): return
+        if owner_id: self.add_pet(owner_id, source)
+        source = self.get_slot(source)
+        targets = targets.tolist()
+        slots = {target: self.get_slot(target) for target in dict.fromkeys(targets)}  # a target has several effects
+        self.pending.extend([(time_stamp, source, slots[t], v, f) for t, v, f in zip(targets, values.tolist(), flags.tolist())])
+        self.last_event_at = time_stamp
+        if not self.start_at: self.start_at = time_stamp
+        if len(self.pending) >= self.max_pending: self.update()
 
     def on_death(self, actor_id):
         if is_valid_id(actor_id):
-            self.get_actor(actor_id).death_count += 1
-
-    def dequeue_events(self, before):
-        while self.events:
-            if self.events[0][0] >= before: break
-            _, event_type, event_args = self.events.pop(0)
-            if event_type == self.damage_event:
-                self.dequeue_on_damage(*event_args)
-            elif event_type == self.heal_event:
-                self.dequeue_on_heal(*event_args)
-
-    def dequeue_on_damage(self, source, target, value, is_status, is_critical, is_direct):
-        if source and source in self.actors:
-            source_actor = self.actors[source]
-            source_actor.data_in_window.cause_damage -= value
-            if not is_status:
-                source_actor.data_in_window.cause_damage_count -= 1
-                if is_critical:
-                    source_actor.data_in_window.cause_damage_critical -= 1
-                if is_direct:
-                    source_actor.data_in_window.cause_damage_direct -= 1
-        if target and target in self.actors:
-            target_actor = self.actors[target]
-            target_actor.data_in_window.taken_damage -= value
-
-    def dequeue_on_heal(self, source, target, value, is_status, is_critical):
-        if source and source in self.actors:
-            source_actor = self.actors[source]
-            source_actor.data_in_window.cause_heal -= value
-            if not is_status:
-                source_actor.data_in_window.cause_heal_count -= 1
-                if is_critical:
-                    source_actor.data_in_window.cause_heal_critical -= 1
-        if target and target in self.actors:
-            target_actor = self.actors[target]
-            target_actor.data_in_window.taken_heal -= value
+            slot = self.get_slot(actor_id)
+            with self._lock:
+                self.totals[slot, DEATH_COUNT] += 1
+                self._version += 1
+                self._views = None
+
+    @staticmethod
+    def _add_events(sums: np.ndarray, events: np.ndarray):
+        flag = events['flag']
+        slots = np.empty(len(events) * 2, np.int32)
+        slots[0::2], slots[1::2] = events['source'], events['target']
+        rows = (FLAG_VALUE[flag] * events['value'][:, None, None] + FLAG_COUNT[flag]).reshape(-1, COLUMN_COUNT)
+        np.add.at(sums, slots[valid := slots >= 0], rows[valid])
+
+    def _ring(self, start, end):
+        # events from sequence start to end, a view unless they wrap around the ring
+        capacity = len(self.events)
+        if (first := start % capacity) + end - start <= capacity:
+            return self.events[first:first + end - start]
+        return np.concatenate((self.events[first:], self.events[:end % capacity]))
+
+    def _push(self, events: np.ndarray):
+        if (size := self.head + len(events) - self.tail) > (capacity := len(self.events)):
+            while capacity < size: capacity *= 2
+            ring = np.empty(capacity, EVENT_DTYPE)
+            ring[np.arange(self.tail, self.head) % capacity] = self._ring(self.tail, self.head)
+            self.events = ring
+        if (first := self.head % capacity) + len(events) <= capacity:
+            self.events[first:first + len(events)] = events
+        else:
+            self.events[first:], self.events[:first + len(events) - capacity] = events[:capacity - first], events[capacity - first:]
+        self.head += len(events)
+
+    def update(self):
+        """
+        fold the pending events into the totals and drop the events before the window from the last event,
+        reads only fold once every update_interval
+        """
+        self._update_at = time.time() + self.update_interval
+        with self._lock:
+            self._update()
+
+    def _update(self):
+        if not (count := len(self.pending)): return
+        events = np.array(self.pending[:count], EVENT_DTYPE)
+        del self.pending[:count]  # events may be appended meanwhile
+        self._add_events(self.totals, events)
+        self._push(events)
+        self._version += 1
+        self._views = None
+        ts = self.events['ts']
+        capacity = len(self.events)
+        before = self.last_event_at - self.window_sec
+        if ts[(tail := self.tail) % capacity] >= before: return
+        end, step = tail, 16
+        while end < self.head:  # the first event kept is usually near the tail
+            keep = ts[(first := end % capacity):first + min(step, self.head - end, capacity - first)] >= before
+            if keep.any():
+                end += int(keep.argmax())
+                break
+            end += len(keep)
+            step *= 2
+        self._add_events(self.expired, self._ring(tail, end))
+        self.tail = end
+
+    def _get_pet_index(self):
+        # slots of the owners, and the slot and the owner index of every pet, rebuilt when pets are added
+        if (index := self._pet_index)[0] != len(pairs := self.pet_slots[:]):
+            owners, pets = np.array(pairs).T
+            owner_slots, owner_of = np.unique(owners, return_inverse=True)
+            self._pet_index = index = len(pairs), owner_slots, owner_of, pets
+        return index
+
+    def _update_views(self):
+        # columns of every actor and the duration they are over, of the whole fight and in the window, with or without the pets added to their owner
+        pet_count, owner_slots, owner_of, pet_slots = self._get_pet_index()  # before the actors, so every pet is in them
+        actor_ids = list(self.actors)
+        with self._lock:  # the sniffer thread folds when too many events are pending
+            sums = np.empty((2, count := len(actor_ids), COLUMN_COUNT), np.int64)
+            sums[0] = self.totals[:count]
+            np.subtract(sums[0], self.expired[:count], out=sums[1])
+            last_event_at = self.last_event_at
+            version = self._version
+        if not (duration := last_event_at - self.start_at): duration = 1
+        durations = duration, min(self.window_sec, duration)
+        views = {}
+        for in_window, rows in enumerate(sums.tolist()):
+            views[bool(in_window), False] = views[bool(in_window), True] = dict(zip(actor_ids, rows)), durations[in_window]
+        if pet_count:
+            owner_sums = sums[:, owner_slots]
+            np.add.at(owner_sums, (slice(None), owner_of), sums[:, pet_slots])
+            owner_ids = [actor_ids[slot] for slot in owner_slots.tolist()]
+            for in_window, rows in enumerate(owner_sums.tolist()):
+                views[bool(in_window), True] = {**views[bool(in_window), False][0], **dict(zip(owner_ids, rows))}, durations[in_window]
+        with self._lock:
+            if version == self._version: self._views = views  # not when the sniffer thread folded meanwhile
+        return views
+
+    def _read(self, actor_id, in_window, calc_pet):
+        if self.pending and time.time() >= self._update_at: self.update()
+        rows, duration = (self._views or self._update_views())[in_window, calc_pet]
+        return rows.get(actor_id, ZERO_ROW), duration
+
+    def actor_data(self, actor_id, in_window, calc_pet=False) -> list[int]:
+        return self._read(actor_id, in_window, calc_pet)[0]
+
+    def duration(self, in_window):
+        return self._read(0, in_window, False)[1]
 
     def actor_dps(self, actor_id, in_window, calc_pet=False):
-        if not (dur := self.last_event_at - self.start_at):
-            dur = 1
-        if in_window:
-            get_data = lambda actor: actor.data_in_window
-            dur = min(self.window_sec, dur)
-        else:
-            get_data = lambda actor: actor.data
-        total_damage = get_data(self.actors[actor_id]).cause_damage if actor_id in self.actors else 0
-        if calc_pet:
-            total_damage = sum((
-                get_data(self.actors[pet_id]).cause_damage
-                for pet_id in self.pet_cache.get(actor_id, ())
-                if pet_id in self.actors
-            ), total_damage)
-        return total_damage / dur
+        data, duration = self._read(actor_id, in_window, calc_pet)
+        return data[CAUSE_DAMAGE] / duration
 
     def actor_hps(self, actor_id, in_window, calc_pet=False):
-        if not (dur := self.last_event_at - self.start_at):
-            dur = 1
-        if in_window:
-            get_data = lambda actor: actor.data_in_window
-            dur = min(self.window_sec, dur)
-        else:
-            get_data = lambda actor: actor.data
-        total_heal = get_data(self.actors[actor_id]).cause_heal if actor_id in self.actors else 0
-        if calc_pet:
-            total_heal = sum((
-                get_data(self.actors[pet_id]).cause_heal
-                for pet_id in self.pet_cache.get(actor_id, ())
-                if pet_id in self.actors
-            ), total_heal)
-        return total_heal / dur
+        data, duration = self._read(actor_id, in_window, calc_pet)
+        return data[CAUSE_HEAL] / duration
 
     def actor_dtps(self, actor_id, in_window):
-        if actor_id not in self.actors: return 0
-        if not (dur := self.last_event_at - self.start_at): dur = 1
-        if in_window:
-            data = self.actors[actor_id].data_in_window
-            dur = min(self.window_sec, dur)
-        else:
-            data = self.actors[actor_id].data
-        return data.taken_damage / dur
+        data, duration = self._read(actor_id, in_window, False)
+        return data[TAKEN_DAMAGE] / duration
 
     def actor_htps(self, actor_id, in_window):
-        if actor_id not in self.actors: return 0
-        if not (dur := self.last_event_at - self.start_at): dur = 1
-        if in_window:
-            data = self.actors[actor_id].data_in_window
-            dur = min(self.window_sec, dur)
-        else:
-            data = self.actors[actor_id].data
-        return data.taken_heal / dur
+        data, duration = self._read(actor_id, in_window, False)
+        return data[TAKEN_HEAL] / duration
 
     def actor_critical_rate(self, actor_id, in_window, include_heal=False, calc_pet=False):
-        get_data = (lambda actor: actor.data_in_window) if in_window else (lambda actor: actor.data)
-        total = 0
-        c_total = 0
-        if actor_id in self.actors:
-            data = get_data(self.actors[actor_id])
-            total = data.cause_damage_count
-            if include_heal: total += data.cause_heal_count
-            c_total = data.cause_damage_critical
-            if include_heal: c_total += data.cause_heal_critical
-        if calc_pet:
-            for pet_id in self.pet_cache.get(actor_id, ()):
-                if pet_id not in self.actors: continue
-                data = get_data(self.actors[pet_id])
-                total += data.cause_damage_count
-                if include_heal: total += data.cause_heal_count
-                c_total += data.cause_damage_critical
-                if include_heal: c_total += data.cause_heal_critical
+        data = self._read(actor_id, in_window, calc_pet)[0]
+        total = data[CAUSE_DAMAGE_COUNT]
+        c_total = data[CAUSE_DAMAGE_CRITICAL]
+        if include_heal:
+            total += data[CAUSE_HEAL_COUNT]
+            c_total += data[CAUSE_HEAL_CRITICAL]
         return c_total / total if total else 0
 
     def actor_direct_rate(self, actor_id, in_window, calc_pet=False):
-        get_data = (lambda actor: actor.data_in_window) if in_window else (lambda actor: actor.data)
-        total = 0
-        d_total = 0
-        if actor_id in self.actors:
-            data = get_data(self.actors[actor_id])
-            total = data.cause_damage_count
-            d_total = data.cause_damage_direct
-        if calc_pet:
-            for pet_id in self.pet_cache.get(actor_id, ()):
-                if pet_id not in self.actors: continue
-                data = get_data(self.actors[pet_id])
-                total += data.cause_damage_count
-                d_total += data.cause_damage_direct
-        return d_total / total if total else 0
+        data = self._read(actor_id, in_window, calc_pet)[0]
+        total = data[CAUSE_DAMAGE_COUNT]
+        return data[CAUSE_DAMAGE_DIRECT] / total if total else 0
 
     def death_count(self, actor_id):
-        if actor_id not in self.actors: return 0
-        return self.actors[actor_id].death_count
+        return self._read(actor_id, False, False)[0][DEATH_COUNT]
 
 
 class DisplayColumn(enum.Enum):
@@ -429,7 +457,7 @@ class Dps(FFDrawPlugin):
             self._cached_owner.clear()
             self._cached_name.clear()
             self.monitor = monitor = Monitor(tid)
-        if monitor.events and time.time() - monitor.last_event_at > self.cutoff:
+        if monitor.last_event_at and time.time() - monitor.last_event_at > self.cutoff:
             if not refresh: return None
             self._cached_owner.clear()
             self._cached_name.clear()
@@ -455,7 +483,11 @@ class Dps(FFDrawPlugin):
         return _actor_id, owner_id
 
     def on_effect(self, evt: NetworkMessage[zone_server.ActionEffect]):
+        if len(evt.message.target_ids) >= ARRAY_TARGET_COUNT:
+            return self.on_effect_arrays(evt)
         source_id, owner_id = self.wrap_owner(evt.header.source_id)
+        time_stamp = time.time()
+        monitor = False  # looked up on the first effect counted
         effect: 'zone_server._ActionEffect'
         for target_id, effects in zip(evt.message.target_ids, evt.message.effects):
             if target_id == 0 or target_id == 0xe0000000: break
@@ -466,8 +498,9 @@ class Dps(FFDrawPlugin):
                     value = effect.value
                     if effect.flag & (1 << 6):
                         value += effect.arg3 * 65536
-                    self.get_evnet_monitor(True).on_damage(
-                        time_stamp=time.time(),
+                    if not monitor: monitor = self.get_evnet_monitor(True)
+                    monitor.on_damage(
+                        time_stamp=time_stamp,
                         source=source_id,
                         target=target_id,
                         value=value,
@@ -480,9 +513,10 @@ class Dps(FFDrawPlugin):
                     value = effect.value
                     if effect.flag & (1 << 6):
                         value += effect.arg3 * 65536
-                    if monitor := self.get_evnet_monitor():
+                    if monitor is False: monitor = self.get_evnet_monitor()
+                    if monitor:
                         monitor.on_heal(
-                            time_stamp=time.time(),
+                            time_stamp=time_stamp,
                             source=source_id,
                             target=target_id,
                             value=value,
@@ -491,6 +525,20 @@ class Dps(FFDrawPlugin):
                             owner_id=owner_id,
                         )
 
+    def on_effect_arrays(self, evt: NetworkMessage[zone_server.ActionEffect]):
+        effects = evt.action_effects
+        damage = effects.damage & ~effects.limit_break  # limit break damage is not calculated
+        if not (has_damage := damage.any()) and not effects.heal.any(): return
+        source_id, owner_id = self.wrap_owner(evt.header.source_id)
+        heal = effects.heal
+        if not (monitor := self.get_evnet_monitor()):
+            if not has_damage: return
+            heal = heal & np.logical_or.accumulate(damage)  # like the walk, a new fight counts heals after its first damage
+            monitor = self.get_evnet_monitor(True)
+        counted = damage | heal
+        flags = heal * EVENT_HEAL | effects.critical * EVENT_CRITICAL | effects.direct_hit * EVENT_DIRECT
+        monitor.on_events(time.time(), source_id, effects.targets[counted], effects.values[counted], flags[counted], owner_id)
+
     def on_actor_control_death(self, evt: ActorControlMessage[actor_control.Death]):
         if monitor:=self.get_evnet_monitor():
             monitor.on_death(evt.source_id)
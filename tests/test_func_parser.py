@@ -0,0 +1,46 @@
+import types
+
+from ff_draw.func_parser import FuncParser
+
+
+class Actor:
+    def __init__(self, facing):
+        self.facing = facing
+
+
+class ActorTable:
+    actors = {1: Actor(1.), 2: Actor(2.)}
+
+    def get_actor_by_id(self, actor_id):
+        return self.actors.get(actor_id)
+
+
+def make_parser():
+    return FuncParser(types.SimpleNamespace(
+        sq_pack=types.SimpleNamespace(sheets=types.SimpleNamespace(action_sheet={})),
+        config={},
+        rpc_password=None,
+        gui=types.SimpleNamespace(timer=types.SimpleNamespace(this_frame=1)),
+        mem=types.SimpleNamespace(actor_table=ActorTable()),
+    ))
+
+
+def test_actor_lookup_cache_of_separate_lambdas():
+    # both lambdas put their lookup in slot 0 of their own slots, they must not share the cached actor on one omen
+    parser = make_parser()
+    facing_1 = parser.parse_value_lambda({'key': 'actor_facing', 'id': 1}, {})
+    facing_2 = parser.parse_value_lambda({'key': 'actor_facing', 'id': 2}, {})
+    omen = types.SimpleNamespace()
+    assert facing_1(omen) == 1.
+    assert facing_2(omen) == 2.
+    assert facing_1(omen) == 1.
+
+
+def test_program_cache_evicts_least_recently_used():
+    parser = make_parser()
+    parser.program_cache_size = 2
+    parser.cache_program('a', 1)
+    parser.cache_program('b', 2)
+    assert parser.get_program('a') == 1
+    parser.cache_program('c', 3)
+    assert list(parser.program_cache) == ['a', 'c']